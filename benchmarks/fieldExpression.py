@@ -0,0 +1,72 @@
+"""Evaluating a derived field of 10 operators.
+
+Two TENSOR_3D_FULL fields of random values are combined by `sqrt(abs((f1 - f2)*(f1 - f2) +
+2*(f1 - f2)) / (1 + abs(f1))) + f1*f1 - f2/2`. The FieldExpression object evaluates the
+expression in chunks of rows in a single pass over the data, and the same expression is
+evaluated with numpy arrays, one operator at a time over the whole arrays, for comparison. The
+plan of the expression, the times, and the peaks of the memory allocated are reported::
+
+    python benchmarks/fieldExpression.py
+    python benchmarks/fieldExpression.py --values 100000000
+
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy  # noqa: E402
+
+from abaqusConstants import *  # noqa: E402,F403
+from abaqus.Odb.FieldBulkData import FieldBulkData  # noqa: E402
+from abaqus.Odb.FieldOutput import FieldOutput  # noqa: E402
+from abaqus.Odb.OdbCommands import sqrt  # noqa: E402
+
+
+def randomField(rows: int, seed: int) -> FieldOutput:
+    field = FieldOutput("S", "Stress components", TENSOR_3D_FULL)
+    block = FieldBulkData()
+    block.type = TENSOR_3D_FULL
+    block.componentLabels = field.componentLabels
+    block.data = numpy.random.default_rng(seed).standard_normal((rows, 6), numpy.float32)
+    field.bulkDataBlocks.append(block)
+    return field
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--values", type=int, default=20000000, help="number of values of each field")
+    args = parser.parse_args()
+
+    rows = args.values // 6
+    f1, f2 = randomField(rows, 1), randomField(rows, 2)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    d = f1 - f2
+    expression = sqrt(abs(d * d + 2 * d) / (1 + abs(f1))) + f1 * f1 - f2 / 2
+    fused = expression.bulkDataBlocks[0].data
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(expression.explain())
+    print("FieldExpression: {:8.3f} s {:8.1f} MB".format(elapsed, peak / 1e6))
+
+    a, b = f1.bulkDataBlocks[0].data, f2.bulkDataBlocks[0].data
+    tracemalloc.start()
+    start = time.perf_counter()
+    d = a - b
+    eager = numpy.sqrt(numpy.abs(d * d + 2 * d) / (1 + numpy.abs(a))) + a * a - b / 2
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("numpy arrays:    {:8.3f} s {:8.1f} MB".format(elapsed, peak / 1e6))
+    assert numpy.allclose(fused, eager, rtol=1e-5, atol=1e-6)
+
+
+if __name__ == "__main__":
+    main()
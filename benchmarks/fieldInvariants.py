@@ -0,0 +1,63 @@
+"""Computing the invariants of a stress field.
+
+The invariants of random TENSOR_3D_FULL bulk data blocks are computed with
+`FieldOutput.getScalarField`, which computes the principal values in closed form for a whole
+block, and the principal values are compared with `numpy.linalg.eigvalsh` on the same tensors::
+
+    python benchmarks/fieldInvariants.py
+    python benchmarks/fieldInvariants.py --values 10000000
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy  # noqa: E402
+
+from abaqusConstants import *  # noqa: E402,F403
+from abaqus.Odb.FieldBulkData import FieldBulkData  # noqa: E402
+from abaqus.Odb.FieldOutput import FieldOutput  # noqa: E402
+
+INVARIANTS = (MISES, TRESCA, PRESS, INV3, MAX_PRINCIPAL, MID_PRINCIPAL, MIN_PRINCIPAL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--values", type=int, default=1000000, help="number of values of the field")
+    parser.add_argument("--blocks", type=int, default=10, help="number of bulk data blocks")
+    args = parser.parse_args()
+
+    field = FieldOutput("S", "Stress components", TENSOR_3D_FULL, validInvariants=INVARIANTS)
+    random = numpy.random.default_rng(0)
+    for _ in range(args.blocks):
+        block = FieldBulkData()
+        block.type = TENSOR_3D_FULL
+        block.data = random.standard_normal((args.values // args.blocks, 6), dtype=numpy.float32)
+        field.bulkDataBlocks.append(block)
+
+    start = time.perf_counter()
+    for invariant in INVARIANTS:
+        field.getScalarField(invariant=invariant)
+    elapsed = time.perf_counter() - start
+    print("invariants:       {:8.3f} s {:8.1f} M values/s".format(elapsed, args.values * len(INVARIANTS) / elapsed / 1e6))
+
+    start = time.perf_counter()
+    for invariant in INVARIANTS:
+        field.getScalarField(invariant=invariant)
+    print("cached:           {:8.3f} s".format(time.perf_counter() - start))
+
+    tensors = numpy.empty((len(field.bulkDataBlocks[0].data), 3, 3))
+    rows, columns = zip((0, 0), (1, 1), (2, 2), (0, 1), (0, 2), (1, 2))
+    tensors[:, rows, columns] = tensors[:, columns, rows] = field.bulkDataBlocks[0].data
+    start = time.perf_counter()
+    numpy.linalg.eigvalsh(tensors)
+    elapsed = time.perf_counter() - start
+    print("eigvalsh:         {:8.3f} s {:8.1f} M values/s".format(elapsed, len(tensors) / elapsed / 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Appending history output data one increment at a time.
+
+A HistoryOutput object is filled by calling addData once per increment, and by calling addData
+with arrays of increments. The same pairs are stored as a tuple of tuples of Floats, the former
+representation of the data member, for comparison. The times of the HistoryOutput objects
+and the memory used by each representation are reported::
+
+    python benchmarks/historyOutput.py
+    python benchmarks/historyOutput.py --increments 10000000
+
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy  # noqa: E402
+
+from abaqusConstants import *  # noqa: E402,F403
+from abaqus.Odb.HistoryOutput import HistoryOutput  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--increments", type=int, default=1000000, help="number of increments")
+    args = parser.parse_args()
+
+    times = numpy.linspace(0.0, 1.0, args.increments)
+    values = numpy.sin(times * 100.0)
+    timeList, valueList = times.tolist(), values.tolist()
+
+    historyOutput = HistoryOutput("U1", "Spatial displacement", SCALAR)
+    start = time.perf_counter()
+    for frame, value in zip(timeList, valueList):
+        historyOutput.addData(frame, value)
+    elapsed = time.perf_counter() - start
+    size = historyOutput.data._array.nbytes
+    print("addData per increment: {:8.3f} s {:8.1f} MB".format(elapsed, size / 1e6))
+
+    historyOutput = HistoryOutput("U1", "Spatial displacement", SCALAR)
+    start = time.perf_counter()
+    for first in range(0, args.increments, 1000):
+        historyOutput.addData(times[first : first + 1000], values[first : first + 1000])
+    elapsed = time.perf_counter() - start
+    print("addData per 1000:      {:8.3f} s {:8.1f} MB".format(elapsed, historyOutput.data._array.nbytes / 1e6))
+    assert numpy.array_equal(historyOutput.values, values)
+
+    # The floats of the pairs are shared with the lists, their 24 bytes are added to the size
+    tracemalloc.start()
+    pairs = tuple(zip(timeList, valueList))
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print("tuple of tuples:       {:>10s} {:8.1f} MB".format("", (size + 24 * 2 * len(pairs)) / 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Objects of the abaqus package created while importing it.
+
+Class-level defaults must be declared with :py:func:`~abaqus.LazyDefault.LazyDefault.lazyDefault`,
+so that they are created per instance on first access and not when the class is defined. This
+script imports the whole package in a fresh interpreter, counts the objects of abaqus classes that
+are alive afterwards, and fails if a class attribute holds such an object or if the total exceeds
+the budget. The interned SymbolicConstant objects are not counted, the remaining objects are the
+default values of function arguments and the `mdb` and `session` objects::
+
+    python benchmarks/importObjects.py
+    python benchmarks/importObjects.py --verbose
+
+"""
+
+import argparse
+import collections
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+BUDGET = 200
+
+_PROBE = """
+import gc, sys
+from abaqus import *
+import caeModules, odbAccess, visualization
+from abaqus.Odb.Odb import Odb
+
+def isAbaqusObject(value):
+    module = getattr(type(value), '__module__', '') or ''
+    return (
+        type(type(value)) is type
+        and (module == 'abaqus' or module.startswith('abaqus.'))
+        and type(value).__name__ not in ('LazyDefault', 'SymbolicConstant', 'AbaqusBoolean')
+    )
+
+for value in gc.get_objects():
+    if isAbaqusObject(value):
+        print('object', type(value).__module__ + '.' + type(value).__qualname__)
+for name, module in list(sys.modules.items()):
+    if name == 'abaqus' or name.startswith('abaqus.'):
+        for cls in list(vars(module).values()):
+            if isinstance(cls, type) and cls.__module__ == name:
+                for attribute, value in vars(cls).items():
+                    if isAbaqusObject(value) or (type(value) in (list, dict) and not attribute.startswith('_')):
+                        print('attribute', name + '.' + cls.__qualname__ + '.' + attribute)
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=int, default=BUDGET, help="maximum number of objects")
+    parser.add_argument("--verbose", action="store_true", help="list the objects by class")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    output = subprocess.check_output([sys.executable, "-c", _PROBE], env=env, cwd=SRC, text=True)
+    objects = collections.Counter()
+    attributes = []
+    for line in output.splitlines():
+        kind, _, name = line.partition(" ")
+        if kind == "object":
+            objects[name] += 1
+        elif kind == "attribute":
+            attributes.append(name)
+
+    print("{} objects created while importing abaqus, budget {}".format(sum(objects.values()), args.budget))
+    if args.verbose:
+        for name, count in objects.most_common():
+            print("{:>6}  {}".format(count, name))
+    for name in attributes:
+        print("class-level default is not lazy: {}".format(name))
+    if attributes or sum(objects.values()) > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
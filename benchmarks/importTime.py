@@ -0,0 +1,89 @@
+"""Cold-start import time of the top-level modules.
+
+Every module is imported in a fresh interpreter, so that nothing is cached in `sys.modules`. The
+results can be written to a JSON file and compared with an earlier run to track regressions::
+
+    python benchmarks/importTime.py --output importTime.json
+    python benchmarks/importTime.py --baseline importTime.json
+
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+MODULES = [
+    "abaqus",
+    "abaqusConstants",
+    "odbAccess",
+    "inpParser",
+    "mesh",
+    "part",
+    "material",
+    "section",
+    "visualization",
+    "caeModules",
+    "driverUtils",
+]
+STATEMENTS = {
+    "abaqus": "import abaqus",
+    "abaqus.mdb": "from abaqus import mdb",
+}
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, sum(name == 'abaqus' or name.startswith('abaqus.') for name in sys.modules))
+"""
+
+
+def measure(statement: str, repeat: int) -> dict:
+    times, modules = [], 0
+    env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", _PROBE.format(statement=statement)], env=env, cwd=SRC, text=True
+        )
+        elapsed, modules = output.split()[-2:]
+        times.append(float(elapsed))
+    return {"ms": 1000 * statistics.median(times), "modules": int(modules)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="modules to import, default: all top-level modules")
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh interpreters per module")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with the results in this JSON file")
+    args = parser.parse_args()
+
+    statements = {name: "import " + name for name in args.modules or MODULES}
+    if not args.modules:
+        statements.update(STATEMENTS)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    print("{:<20}{:>12}{:>10}{:>12}".format("module", "time [ms]", "modules", "change"))
+    for name, statement in statements.items():
+        results[name] = result = measure(statement, args.repeat)
+        change = ""
+        if name in baseline:
+            change = "{:+.0%}".format(result["ms"] / baseline[name]["ms"] - 1)
+        print("{:<20}{:>12.1f}{:>10}{:>12}".format(name, result["ms"], result["modules"], change))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
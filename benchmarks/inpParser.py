@@ -0,0 +1,83 @@
+"""Throughput of the input file parser.
+
+A deck with a structured mesh of hexahedral elements is generated in a temporary directory, the
+nodes are in an included file. The deck is parsed with and without `usePyArray`, and the
+throughput is reported in MB/s. With `--memory`, the peak memory allocated while parsing is
+compared with the size of the parsed arrays::
+
+    python benchmarks/inpParser.py
+    python benchmarks/inpParser.py --nodes 20000000 --memory
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy  # noqa: E402
+
+from abaqus.InputFileParser.InputFileReader import InputFileReader  # noqa: E402
+
+
+def writeDeck(directory: str, nodes: int) -> str:
+    """Writes a deck with about *nodes* nodes and returns its path"""
+    size = max(int(round(nodes ** (1 / 3))), 2)
+    grid = numpy.indices((size, size, size)).reshape(3, -1).T[:, ::-1]
+    labels = numpy.arange(1, len(grid) + 1)
+    with open(os.path.join(directory, "nodes.inp"), "w") as file:
+        for start in range(0, len(grid), 1 << 20):
+            rows = zip(labels[start : start + (1 << 20)].tolist(), *(grid[start : start + (1 << 20)] * 0.5).T.tolist())
+            file.writelines("%7d,%13.6g,%13.6g,%13.6g\n" % row for row in rows)
+
+    corner = numpy.indices((size - 1, size - 1, size - 1)).reshape(3, -1).T[:, ::-1]
+    first = 1 + corner[:, 0] + size * corner[:, 1] + size * size * corner[:, 2]
+    offsets = numpy.array([0, 1, 1 + size, size, size * size, 1 + size * size, 1 + size + size * size, size + size * size])
+    path = os.path.join(directory, "Job-1.inp")
+    with open(path, "w") as file:
+        file.write("*Heading\n*Part, name=Part-1\n*Node\n*Include, input=nodes.inp\n*Element, type=C3D8R\n")
+        for start in range(0, len(first), 1 << 20):
+            block = first[start : start + (1 << 20)]
+            rows = numpy.column_stack([start + 1 + numpy.arange(len(block)), block[:, None] + offsets]).tolist()
+            file.writelines(", ".join(map(str, row)) + "\n" for row in rows)
+        file.write("*Nset, nset=All, generate\n 1, {}, 1\n".format(len(grid)))
+        file.write("*Elset, elset=Bottom\n")
+        numpy.savetxt(file, numpy.arange(1, (size - 1) ** 2 + 1).reshape(-1, size - 1), fmt="%d", delimiter=", ")
+        file.write("*End Part\n")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1000000, help="number of nodes of the deck")
+    parser.add_argument("--repeat", type=int, default=3, help="number of parses of each mode")
+    parser.add_argument("--memory", action="store_true", help="trace the memory allocated while parsing")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = writeDeck(directory, args.nodes)
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print("deck: {:.1f} MB".format(size / 1e6))
+        for usePyArray in (True, False):
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                keywords = InputFileReader(path, usePyArray=usePyArray).read()
+                times.append(time.perf_counter() - start)
+            print("usePyArray={!s:<6} {:8.2f} s {:8.1f} MB/s".format(usePyArray, min(times), size / min(times) / 1e6))
+            del keywords
+        if args.memory:
+            tracemalloc.start()
+            keywords = InputFileReader(path, usePyArray=True).read()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            result = sum(keyword.data.nbytes for keyword in keywords if isinstance(keyword.data, numpy.ndarray))
+            print("peak memory: {:.1f} MB, parsed arrays: {:.1f} MB".format(peak / 1e6, result / 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Parsing an input file again from its sidecar files.
+
+The deck of `inpParser.py` is generated in a temporary directory and parsed with `cache=True`
+three times: the first parse writes the sidecar files, the second one reads them, and the third
+one follows a change of the main file, so that only the main file is parsed again while the
+nodes are read from the sidecar file of the included file. The times are reported::
+
+    python benchmarks/inpParserCache.py
+    python benchmarks/inpParserCache.py --nodes 20000000
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from abaqus.InputFileParser.InputFileReader import InputFileReader  # noqa: E402
+from inpParser import writeDeck  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1000000, help="number of nodes of the deck")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = writeDeck(directory, args.nodes)
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print("deck: {:.1f} MB".format(size / 1e6))
+
+        start = time.perf_counter()
+        InputFileReader(path, usePyArray=True).read()
+        print("no cache:       {:8.3f} s".format(time.perf_counter() - start))
+
+        start = time.perf_counter()
+        InputFileReader(path, usePyArray=True, cache=True).read()
+        print("cold cache:     {:8.3f} s".format(time.perf_counter() - start))
+
+        start = time.perf_counter()
+        keywords = InputFileReader(path, usePyArray=True, cache=True).read()
+        print("warm cache:     {:8.3f} s".format(time.perf_counter() - start))
+        del keywords
+
+        with open(path, "a") as file:
+            file.write("*Material, name=steel\n*Elastic\n210000., 0.3\n")
+        start = time.perf_counter()
+        InputFileReader(path, usePyArray=True, cache=True).read()
+        print("main file edit: {:8.3f} s".format(time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Parsing one keyword of an input file through the keyword index.
+
+The deck of `inpParser.py` is generated in a temporary directory. The index of its keywords is
+built, and the *ELSET keyword at the end of the deck is parsed with `InputFile.keyword`, which
+only reads its byte range, and by parsing the whole deck, for comparison. The times and the
+throughput of the index are reported::
+
+    python benchmarks/inpParserIndex.py
+    python benchmarks/inpParserIndex.py --nodes 20000000
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy  # noqa: E402
+
+from abaqus.InputFileParser.InputFile import InputFile  # noqa: E402
+from inpParser import writeDeck  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1000000, help="number of nodes of the deck")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = writeDeck(directory, args.nodes)
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print("deck: {:.1f} MB".format(size / 1e6))
+
+        inputFile = InputFile(os.path.basename(path), directory)
+        start = time.perf_counter()
+        index = inputFile.index()
+        elapsed = time.perf_counter() - start
+        print("index:       {:8.3f} s {:8.1f} MB/s {} keywords".format(elapsed, size / elapsed / 1e6, len(index)))
+
+        start = time.perf_counter()
+        keyword = inputFile.keyword("Elset", usePyArray=True, elset="Bottom")
+        print("keyword:     {:8.3f} s".format(time.perf_counter() - start))
+
+        start = time.perf_counter()
+        keywords = InputFile(os.path.basename(path), directory).parse(usePyArray=True)
+        print("parse:       {:8.3f} s".format(time.perf_counter() - start))
+        assert numpy.array_equal(keyword.data, next(k for k in keywords if k.name == "Elset").data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Scaling of the input file parser with the number of worker processes.
+
+The deck of `inpParser.py` is generated in a temporary directory and parsed with
+`usePyArray=True` by 1 worker, i.e., in this process, and by 2, 4, ... worker processes up to
+the number of CPUs. The times and the speedups are reported::
+
+    python benchmarks/inpParserParallel.py
+    python benchmarks/inpParserParallel.py --nodes 50000000 --workers 1 8 16 32 64
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from abaqus.InputFileParser.InputFileReader import InputFileReader  # noqa: E402
+from inpParser import writeDeck  # noqa: E402
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=2000000, help="number of nodes of the deck")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, cpus} | {2**power for power in range(1, cpus.bit_length())}),
+        help="numbers of worker processes",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = writeDeck(directory, args.nodes)
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print("deck: {:.1f} MB, {} CPUs".format(size / 1e6, cpus))
+        reference = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            keywords = InputFileReader(path, usePyArray=True, workers=workers).read()
+            elapsed = time.perf_counter() - start
+            reference = reference or elapsed
+            print(
+                "workers={:<4d} {:8.2f} s {:8.1f} MB/s {:6.2f}x".format(workers, elapsed, size / elapsed / 1e6, reference / elapsed)
+            )
+            del keywords
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Cost of writing variants of an input file with InputFileTemplate.
+
+A deck with a structured mesh of hexahedral elements is generated in a temporary directory, the
+nodes are in an included file. Variants changing a material constant, an amplitude table and a
+pressure magnitude are written by copying the files of the deck, by `InputFileTemplate.write`,
+and by `InputFileTemplate.write` with `segments=True`. The time per variant and the disk space
+allocated by the variants, counting the linked files once, are reported::
+
+    python benchmarks/inpTemplate.py
+    python benchmarks/inpTemplate.py --nodes 5000000 --variants 200
+
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy  # noqa: E402
+
+import inpParser  # noqa: E402
+
+# The values changed in each variant
+PATHS = (
+    "*Material, name=Steel/*Elastic[0][0]",
+    "*Amplitude, name=Ramp",
+    "*Step, name=Load/*Dsload[0][2]",
+)
+
+
+def writeDeck(directory: str, nodes: int) -> str:
+    """Writes a deck with about *nodes* nodes and returns its path"""
+    size = max(int(round(nodes ** (1 / 3))), 2)
+    grid = numpy.indices((size, size, size)).reshape(3, -1).T[:, ::-1]
+    labels = numpy.arange(1, len(grid) + 1)
+    with open(os.path.join(directory, "nodes.inp"), "w") as file:
+        for start in range(0, len(grid), 1 << 20):
+            rows = zip(labels[start : start + (1 << 20)].tolist(), *(grid[start : start + (1 << 20)] * 0.5).T.tolist())
+            file.writelines("%7d,%13.6g,%13.6g,%13.6g\n" % row for row in rows)
+
+    corner = numpy.indices((size - 1, size - 1, size - 1)).reshape(3, -1).T[:, ::-1]
+    first = 1 + corner[:, 0] + size * corner[:, 1] + size * size * corner[:, 2]
+    offsets = numpy.array([0, 1, 1 + size, size, size * size, 1 + size * size, 1 + size + size * size, size + size * size])
+    path = os.path.join(directory, "Job-1.inp")
+    with open(path, "w") as file:
+        file.write("*Heading\n*Part, name=Part-1\n*Node\n*Include, input=nodes.inp\n*Element, type=C3D8R, elset=All\n")
+        for start in range(0, len(first), 1 << 20):
+            block = first[start : start + (1 << 20)]
+            rows = numpy.column_stack([start + 1 + numpy.arange(len(block)), block[:, None] + offsets]).tolist()
+            file.writelines(", ".join(map(str, row)) + "\n" for row in rows)
+        file.write("*Solid Section, elset=All, material=Steel\n,\n*Surface, name=Top, type=ELEMENT\nAll, S2\n")
+        file.write("*End Part\n*Assembly, name=Assembly\n*Instance, name=Part-1-1, part=Part-1\n*End Instance\n")
+        file.write("*End Assembly\n*Material, name=Steel\n*Density\n 7.85e-09,\n*Elastic\n 210000., 0.3\n")
+        file.write("*Amplitude, name=Ramp\n 0., 0., 1., 1.\n*Step, name=Load\n*Static\n 0.1, 1.\n")
+        file.write("*Dsload, amplitude=Ramp\n Part-1-1.Top, P, 1.\n*End Step\n")
+    return path
+
+
+def diskUsage(directory: str) -> int:
+    """Returns the disk space allocated by the files of a directory, counting each file once"""
+    files = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            status = os.lstat(os.path.join(root, name))
+            files[status.st_dev, status.st_ino] = status.st_blocks * 512
+    return sum(files.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1000000, help="number of nodes of the deck")
+    parser.add_argument("--variants", type=int, default=50, help="number of variants written by each mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = writeDeck(directory, args.nodes)
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in ("Job-1.inp", "nodes.inp"))
+        print("deck: {:.1f} MB, {} variants".format(size / 1e6, args.variants))
+
+        start = time.perf_counter()
+        template = inpParser.InputFile(os.path.basename(path), directory).template()
+        print("template:      {:8.3f} s".format(time.perf_counter() - start))
+
+        def values(number):
+            return {
+                PATHS[0]: 200000.0 + number,
+                PATHS[1]: [(0.0, 0.0, 0.5, 0.25 + number / args.variants, 1.0, 1.0)],
+                PATHS[2]: 1.0 + 0.01 * number,
+            }
+
+        for mode in ("copy", "splice", "segments"):
+            output = os.path.join(directory, mode)
+            start = time.perf_counter()
+            for number in range(args.variants):
+                fileName = os.path.join(output, "Variant-{:05d}".format(number), "Job-1.inp")
+                if mode == "copy":
+                    os.makedirs(os.path.dirname(fileName))
+                    for name in ("Job-1.inp", "nodes.inp"):
+                        shutil.copyfile(os.path.join(directory, name), os.path.join(os.path.dirname(fileName), name))
+                else:
+                    template.write(fileName, values(number), segments=mode == "segments")
+            elapsed = time.perf_counter() - start
+            usage = diskUsage(output)
+            print(
+                "{:10} {:8.4f} s/variant {:10.3f} MB/variant on disk".format(
+                    mode, elapsed / args.variants, usage / 1e6 / args.variants
+                )
+            )
+            shutil.rmtree(output)
+
+
+if __name__ == "__main__":
+    main()
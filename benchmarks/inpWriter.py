@@ -0,0 +1,93 @@
+"""Throughput of ModelJob.writeInput for an orphan mesh model.
+
+A part with a structured mesh of hexahedral elements is created from nodes and elements, with a
+set of its elements, a material, a section, an instance, a boundary condition and a load. The
+input file is written to a temporary directory by `ModelJob.writeInput`, and the throughput is
+reported in MB/s. The nodes and the elements are also written line by line with the `%`
+operator for comparison::
+
+    python benchmarks/inpWriter.py
+    python benchmarks/inpWriter.py --elements 10000000
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy  # noqa: E402
+
+from abaqusConstants import *  # noqa: E402,F403
+from abaqus import mdb  # noqa: E402
+
+
+def createModel(elements: int):
+    """Creates an orphan mesh model of about *elements* elements and returns the mesh arrays"""
+    size = max(int(round(elements ** (1 / 3))), 1) + 1
+    grid = numpy.indices((size, size, size)).reshape(3, -1).T[:, ::-1] * 0.5
+    nodeLabels = numpy.arange(1, len(grid) + 1)
+    corner = numpy.indices((size - 1, size - 1, size - 1)).reshape(3, -1).T[:, ::-1]
+    first = 1 + corner[:, 0] + size * corner[:, 1] + size * size * corner[:, 2]
+    offsets = numpy.array([0, 1, 1 + size, size, size * size, 1 + size * size, 1 + size + size * size, size + size * size])
+    connectivity = first[:, None] + offsets
+    elementLabels = numpy.arange(1, len(connectivity) + 1)
+
+    model = mdb.models["Model-1"]
+    part = model.PartFromNodesAndElements(
+        "Block", THREE_D, DEFORMABLE_BODY, (nodeLabels, grid), (("C3D8R", elementLabels, connectivity),)
+    )
+    part.SetFromElementLabels("All", elementLabels)
+    part.SetFromNodeLabels("Bottom", nodeLabels[: size * size])
+    part.SetFromNodeLabels("Top", nodeLabels[-size * size :])
+    model.Material("Steel").Elastic(table=((210000.0, 0.3),))
+    model.HomogeneousSolidSection("Solid", "Steel")
+    part.SectionAssignment(part.sets["All"], "Solid")
+    instance = model.rootAssembly.Instance("Block-1", part, dependent=ON)
+    model.StaticStep("Step-1", "Initial")
+    model.EncastreBC("Fixed", "Initial", instance.sets["Bottom"])
+    model.ConcentratedForce("Force", "Step-1", instance.sets["Top"], cf3=-1.0)
+    return nodeLabels, grid, elementLabels, connectivity
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--elements", type=int, default=1000000, help="number of elements of the mesh")
+    args = parser.parse_args()
+
+    nodeLabels, grid, elementLabels, connectivity = createModel(args.elements)
+    job = mdb.Job("Job-1", "Model-1")
+    with tempfile.TemporaryDirectory() as directory:
+        current = os.getcwd()
+        os.chdir(directory)
+        try:
+            start = time.perf_counter()
+            job.writeInput()
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize("Job-1.inp")
+            print(
+                "writeInput:     {:8.3f} s {:8.1f} MB {:8.1f} MB/s ({} elements)".format(
+                    elapsed, size / 1e6, size / 1e6 / elapsed, len(elementLabels)
+                )
+            )
+
+            start = time.perf_counter()
+            with open("lines.inp", "w") as file:
+                for block in range(0, len(nodeLabels), 1 << 20):
+                    rows = zip(nodeLabels[block : block + (1 << 20)].tolist(), *grid[block : block + (1 << 20)].T.tolist())
+                    file.writelines("%d, %.12e, %.12e, %.12e\n" % row for row in rows)
+                for block in range(0, len(elementLabels), 1 << 20):
+                    rows = numpy.column_stack((elementLabels[block : block + (1 << 20)], connectivity[block : block + (1 << 20)]))
+                    file.writelines("%d, %d, %d, %d, %d, %d, %d, %d, %d\n" % tuple(row) for row in rows.tolist())
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize("lines.inp")
+            print("line formatting: {:7.3f} s {:8.1f} MB {:8.1f} MB/s".format(elapsed, size / 1e6, size / 1e6 / elapsed))
+        finally:
+            os.chdir(current)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Writing derived field output with FieldOutput.addData and with a BulkWriter.
+
+The synthetic output database of `odbResultsStore.py` is exported to a results store file in a
+temporary directory and opened. A VECTOR field output is added to the last frame in batches of
+labels, in decreasing label order, by calling FieldOutput.addData for each batch, and then by
+adding the same batches to a BulkWriter that adds them as a single bulk data block sorted by
+label. The times, the number of bulk data blocks created, and the time to iterate over the
+values of the field are reported::
+
+    python benchmarks/odbBulkWriter.py
+    python benchmarks/odbBulkWriter.py --elements 100000 --batch 1
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy  # noqa: E402
+
+from abaqusConstants import *  # noqa: E402,F403
+from abaqus.Odb.ResultsStore import openResultsStore  # noqa: E402
+from abaqus.Odb.ResultsStoreWriter import exportOdb  # noqa: E402
+from odbResultsStore import syntheticOdb  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--elements", type=int, default=20000, help="number of elements of the mesh")
+    parser.add_argument("--batch", type=int, default=10, help="number of labels added per call")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        fileName = os.path.join(directory, "Job-1.odbstore")
+        exportOdb(syntheticOdb(args.elements, 2), fileName)
+        odb = openResultsStore(fileName)
+        frame = odb.steps["Step-1"].frames[-1]
+        instance = next(iter(odb.rootAssembly.instances.values()))
+        labels = numpy.sort([node.label for node in instance.nodes])[::-1]
+        data = numpy.random.default_rng(0).standard_normal((len(labels), 3)).astype(numpy.float32)
+        batches = range(0, len(labels), args.batch)
+
+        for method in ("addData", "bulkWriter"):
+            fieldOutput = frame.FieldOutput(name="V-" + method, description="Derived vector", type=VECTOR)
+            start = time.perf_counter()
+            if method == "addData":
+                for first in batches:
+                    fieldOutput.addData(NODAL, instance, labels[first : first + args.batch], data[first : first + args.batch])
+            else:
+                with odb.bulkWriter() as writer:
+                    for first in batches:
+                        writer.addData(fieldOutput, NODAL, instance, labels[first : first + args.batch], data[first : first + args.batch])
+            elapsed = time.perf_counter() - start
+            start = time.perf_counter()
+            count = sum(1 for value in fieldOutput.values)
+            read = time.perf_counter() - start
+            print(
+                "{:10s} {:8.3f} s {:8d} blocks, {} values read in {:.3f} s".format(
+                    method, elapsed, len(fieldOutput.bulkDataBlocks), count, read
+                )
+            )
+        odb.close()
+
+
+if __name__ == "__main__":
+    main()
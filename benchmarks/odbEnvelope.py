@@ -0,0 +1,70 @@
+"""Computing the envelope of a field output over the frames of a step.
+
+The synthetic output database of `odbResultsStore.py` is exported to a results store file in a
+temporary directory. The maximum von Mises stress over all the frames and the frame of the
+maximum are computed by `stepEnvelope`, which uses one frame at a time, and by stacking the von
+Mises stress of every frame for comparison. The times and the peaks of the memory allocated by
+Python are reported::
+
+    python benchmarks/odbEnvelope.py
+    python benchmarks/odbEnvelope.py --elements 100000 --frames 1000
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy  # noqa: E402
+
+from abaqusConstants import *  # noqa: E402,F403
+from abaqus.Odb.FieldEnvelope import stepEnvelope  # noqa: E402
+from abaqus.Odb.ResultsStore import openResultsStore  # noqa: E402
+from abaqus.Odb.ResultsStoreWriter import exportOdb  # noqa: E402
+from odbResultsStore import syntheticOdb  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--elements", type=int, default=20000, help="number of elements of the mesh")
+    parser.add_argument("--frames", type=int, default=100, help="number of frames of the step")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        fileName = os.path.join(directory, "Job-1.odbstore")
+        exportOdb(syntheticOdb(args.elements, args.frames), fileName)
+        # The frame cache keeps a single frame
+        odb = openResultsStore(fileName, cacheSize=0)
+        step = odb.steps["Step-1"]
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        envelope, index = stepEnvelope(step, "S", MISES)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("stepEnvelope:     {:8.3f} s {:8.1f} MB".format(elapsed, peak / 1e6))
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        stacked = numpy.stack(
+            [frame.fieldOutputs["S"].getScalarField(invariant=MISES).bulkDataBlocks[0].data[:, 0] for frame in step.frames]
+        )
+        maximum, argmax = stacked.max(axis=0), stacked.argmax(axis=0)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("stacked frames:   {:8.3f} s {:8.1f} MB".format(elapsed, peak / 1e6))
+        assert numpy.array_equal(envelope.bulkDataBlocks[0].data[:, 0], maximum)
+        assert numpy.array_equal(index.bulkDataBlocks[0].data[:, 0], argmax)
+        odb.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Iterating the frames of a long step of a results store.
+
+The synthetic output database of `odbResultsStore.py` is exported with many frames to a results
+store file in a temporary directory. All the frames, then the frames used last, are iterated
+with a frame cache holding a few frames, the times, the counters of the cache and the peak of the
+memory allocated by Python are reported::
+
+    python benchmarks/odbFrameCache.py
+    python benchmarks/odbFrameCache.py --elements 10000 --frames 5000 --cached 100
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from abaqus.Odb.FrameCache import fieldOutputsSize  # noqa: E402
+from abaqus.Odb.ResultsStore import frameCache, openResultsStore  # noqa: E402
+from abaqus.Odb.ResultsStoreWriter import exportOdb  # noqa: E402
+from odbResultsStore import syntheticOdb  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--elements", type=int, default=1000, help="number of elements of the mesh")
+    parser.add_argument("--frames", type=int, default=1000, help="number of frames of the step")
+    parser.add_argument("--cached", type=int, default=50, help="number of frames kept by the frame cache")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        fileName = os.path.join(directory, "Job-1.odbstore")
+        exportOdb(syntheticOdb(args.elements, args.frames), fileName)
+        odb = openResultsStore(fileName, cacheSize=0)
+        frames = odb.steps["Step-1"].frames
+        cache = frameCache(odb)
+        cache.setValues(maxBytes=fieldOutputsSize(frames[0].fieldOutputs) * args.cached)
+
+        tracemalloc.start()
+        for name, first in (("all frames", 0), ("last frames", len(frames) - args.cached)):
+            start = time.perf_counter()
+            total = 0.0
+            selection = range(max(first, 0), len(frames))
+            for index in selection:
+                frame = frames[index]
+                total += float(frame.fieldOutputs["S"].bulkDataBlocks[0].data[:, 0].sum())
+            elapsed = time.perf_counter() - start
+            print("{:12s}      {:8.3f} s {:8.1f} frames/s".format(name + ":", elapsed, len(selection) / elapsed))
+        print("cache:            {!r}".format(cache))
+        print("peak allocated:   {:8.1f} MB".format(tracemalloc.get_traced_memory()[1] / 1e6))
+        tracemalloc.stop()
+        odb.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Processing the frames of a results store in worker processes.
+
+The synthetic output database of `odbResultsStore.py` is exported to a results store file in a
+temporary directory. The maximum von Mises stress of every frame, and the von Mises stress of
+every frame as an array returned through shared memory, are computed by `odbAccess.parallelMap`
+in this process and with worker processes::
+
+    python benchmarks/odbParallelMap.py
+    python benchmarks/odbParallelMap.py --elements 1000000 --frames 256 --workers 64
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy  # noqa: E402
+
+from abaqusConstants import *  # noqa: E402,F403
+from abaqus.Odb.ResultsStore import frameCache  # noqa: E402
+from abaqus.Odb.ResultsStoreWriter import exportOdb  # noqa: E402
+from odbAccess import openOdb, parallelMap  # noqa: E402
+from odbResultsStore import syntheticOdb  # noqa: E402
+
+
+def maxMises(frame):
+    return float(frame.fieldOutputs["S"].getScalarField(invariant=MISES).bulkDataBlocks[0].data.max())
+
+
+def mises(frame):
+    return frame.fieldOutputs["S"].getScalarField(invariant=MISES).bulkDataBlocks[0].data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--elements", type=int, default=100000, help="number of elements of the mesh")
+    parser.add_argument("--frames", type=int, default=32, help="number of frames of the step")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        fileName = os.path.join(directory, "Job-1.odbstore")
+        exportOdb(syntheticOdb(args.elements, args.frames), fileName)
+        odb = openOdb(fileName)
+        for function in (maxMises, mises):
+            timings = []
+            for workers in (1, args.workers):
+                frameCache(odb).clear()
+                start = time.perf_counter()
+                results = parallelMap(odb, function, workers=workers)
+                timings.append(time.perf_counter() - start)
+            print(
+                "{:10s} {:3d} workers: {:8.3f} s, 1 worker: {:8.3f} s, speedup {:5.2f}".format(
+                    function.__name__ + ":", args.workers, timings[1], timings[0], timings[0] / timings[1]
+                )
+            )
+        assert numpy.allclose(results[-1], mises(odb.steps["Step-1"].frames[-1]))
+        odb.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Reading field output from a results store.
+
+A synthetic output database with the members of the Odb objects of Abaqus, i.e., a structured
+mesh of hexahedral elements and a stress field at the integration points of every frame, is
+exported to a results store file in a temporary directory. The file is opened with
+`odbAccess.openOdb`, and the times to open it, to sum the bulk data of every frame, and to iterate
+the FieldValue objects of one frame are reported::
+
+    python benchmarks/odbResultsStore.py
+    python benchmarks/odbResultsStore.py --elements 1000000 --frames 20
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy  # noqa: E402
+
+from abaqusConstants import *  # noqa: E402,F403
+from abaqus.Odb.ResultsStoreWriter import exportOdb  # noqa: E402
+from odbAccess import openOdb  # noqa: E402
+
+
+def syntheticOdb(elements: int, frames: int, integrationPoints: int = 8):
+    """Returns an object with the members of an Odb object of Abaqus used by the export"""
+    size = max(int(round(elements ** (1 / 3))), 1)
+    grid = numpy.indices((size + 1,) * 3).reshape(3, -1).T.astype(numpy.float32)
+    nodes = [types.SimpleNamespace(label=label, coordinates=point) for label, point in enumerate(grid.tolist(), 1)]
+    count = size**3
+    meshElements = [
+        types.SimpleNamespace(label=label, type="C3D8", connectivity=(label,) * 8, sectionCategory=None)
+        for label in range(1, count + 1)
+    ]
+    instance = types.SimpleNamespace(
+        name="PART-1-1",
+        embeddedSpace=THREE_D,
+        type=DEFORMABLE_BODY,
+        nodes=nodes,
+        elements=meshElements,
+        nodeSets={},
+        elementSets={"ALL": types.SimpleNamespace(elements=meshElements, isInternal=False)},
+    )
+    labels = numpy.repeat(numpy.arange(1, count + 1, dtype=numpy.int32), integrationPoints)
+    points = numpy.tile(numpy.arange(1, integrationPoints + 1, dtype=numpy.int32), count)
+    random = numpy.random.default_rng(0)
+
+    def frame(index):
+        block = types.SimpleNamespace(
+            position=INTEGRATION_POINT,
+            instance=instance,
+            sectionPoint=None,
+            baseElementType="C3D8",
+            componentLabels=("S11", "S22", "S33", "S12", "S13", "S23"),
+            data=random.standard_normal((len(labels), 6), dtype=numpy.float32),
+            conjugateData=None,
+            elementLabels=labels,
+            nodeLabels=None,
+            integrationPoints=points,
+            mises=None,
+            localCoordSystem=None,
+        )
+        stress = types.SimpleNamespace(
+            name="S",
+            description="Stress components",
+            type=TENSOR_3D_FULL,
+            componentLabels=block.componentLabels,
+            validInvariants=(MISES, MAX_PRINCIPAL),
+            isComplex=False,
+            dim=3,
+            dim2=3,
+            locations=[types.SimpleNamespace(position=INTEGRATION_POINT, sectionPoints=())],
+            bulkDataBlocks=[block],
+        )
+        return types.SimpleNamespace(
+            incrementNumber=index,
+            frameId=index,
+            frameValue=index / max(frames - 1, 1),
+            frequency=0.0,
+            description="Increment {}".format(index),
+            fieldOutputs={"S": stress},
+        )
+
+    step = types.SimpleNamespace(
+        name="Step-1",
+        description="",
+        domain=TIME,
+        timePeriod=1.0,
+        previousStepName="Initial",
+        procedure="*STATIC",
+        totalTime=0.0,
+        number=1,
+        nlgeom=False,
+        frames=[frame(index) for index in range(frames)],
+    )
+    return types.SimpleNamespace(
+        name="Job-1.odb",
+        analysisTitle="",
+        description="",
+        path="Job-1.odb",
+        jobData=types.SimpleNamespace(
+            name="Job-1",
+            analysisCode=ABAQUS_STANDARD,
+            precision=SINGLE_PRECISION,
+            version="",
+            creationTime="",
+            modificationTime="",
+            machineName="",
+        ),
+        sectionCategories={},
+        parts={},
+        rootAssembly=types.SimpleNamespace(
+            instances={instance.name: instance}, nodes=[], elements=[], nodeSets={}, elementSets={}
+        ),
+        steps={step.name: step},
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--elements", type=int, default=100000, help="number of elements of the mesh")
+    parser.add_argument("--frames", type=int, default=10, help="number of frames of the step")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        fileName = os.path.join(directory, "Job-1.odbstore")
+        start = time.perf_counter()
+        exportOdb(syntheticOdb(args.elements, args.frames), fileName)
+        print("export:           {:8.2f} s {:8.1f} MB".format(time.perf_counter() - start, os.path.getsize(fileName) / 1e6))
+
+        start = time.perf_counter()
+        odb = openOdb(fileName)
+        print("open:             {:8.3f} s".format(time.perf_counter() - start))
+
+        start = time.perf_counter()
+        total = 0.0
+        for frame in odb.steps["Step-1"].frames:
+            for block in frame.fieldOutputs["S"].bulkDataBlocks:
+                total += float(block.data[:, 0].sum())
+        elapsed = time.perf_counter() - start
+        print("bulk data:        {:8.3f} s {:8.1f} frames/s".format(elapsed, args.frames / elapsed))
+
+        values = odb.steps["Step-1"].frames[-1].fieldOutputs["S"].values
+        start = time.perf_counter()
+        count = sum(1 for _ in values)
+        elapsed = time.perf_counter() - start
+        print("values:           {:8.3f} s {:8.0f} values/s".format(elapsed, count / elapsed))
+        odb.close()
+
+
+if __name__ == "__main__":
+    main()
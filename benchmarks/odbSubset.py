@@ -0,0 +1,77 @@
+"""Extracting the subsets of a field output in many sets.
+
+The synthetic output database of `odbResultsStore.py` is given element sets of consecutive elements
+and exported to a results store file in a temporary directory. The subset of the stress field in
+every set is extracted for every frame with `FieldOutput.getSubset`, which gathers the rows from
+the indexes of the instance, and with a scan of the element labels of the block by `numpy.isin`
+for comparison::
+
+    python benchmarks/odbSubset.py
+    python benchmarks/odbSubset.py --sets 10000 --frames 1000
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy  # noqa: E402
+
+from abaqusConstants import *  # noqa: E402,F403
+from abaqus.Odb.ResultsStoreWriter import exportOdb  # noqa: E402
+from odbAccess import openOdb  # noqa: E402
+from odbResultsStore import syntheticOdb  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--elements", type=int, default=100000, help="number of elements of the mesh")
+    parser.add_argument("--sets", type=int, default=1000, help="number of element sets")
+    parser.add_argument("--frames", type=int, default=100, help="number of frames of the step")
+    args = parser.parse_args()
+
+    odb = syntheticOdb(args.elements, args.frames, integrationPoints=1)
+    instance = odb.rootAssembly.instances["PART-1-1"]
+    size = max(len(instance.elements) // args.sets, 1)
+    for index in range(args.sets):
+        start = index * size % len(instance.elements)
+        elements = instance.elements[start : start + size]
+        instance.elementSets["SET-{}".format(index)] = type(instance)(elements=elements, isInternal=False)
+
+    with tempfile.TemporaryDirectory() as directory:
+        fileName = os.path.join(directory, "Job-1.odbstore")
+        exportOdb(odb, fileName)
+        odb = openOdb(fileName)
+        instance = odb.rootAssembly.instances["PART-1-1"]
+        sets = [instance.elementSets["SET-{}".format(index)] for index in range(args.sets)]
+        frames = odb.steps["Step-1"].frames
+
+        start = time.perf_counter()
+        total = 0
+        for frame in frames:
+            field = frame.fieldOutputs["S"]
+            for odbSet in sets:
+                subset = field.getSubset(region=odbSet, position=INTEGRATION_POINT, elementType="C3D8")
+                total += len(subset.bulkDataBlocks[0].data)
+        elapsed = time.perf_counter() - start
+        calls = args.frames * args.sets
+        print("getSubset:        {:8.3f} s {:8.0f} subsets/s {:d} values".format(elapsed, calls / elapsed, total))
+
+        # The scan is timed on the first frame only
+        labels = [numpy.array([element.label for element in odbSet.elements]) for odbSet in sets]
+        block = frames[0].fieldOutputs["S"].bulkDataBlocks[0]
+        start = time.perf_counter()
+        for members in labels:
+            block.data[numpy.isin(block.elementLabels, members)]
+        elapsed = time.perf_counter() - start
+        print("numpy.isin scan:  {:8.3f} s {:8.0f} subsets/s".format(elapsed, args.sets / elapsed))
+        odb.close()
+
+
+if __name__ == "__main__":
+    main()
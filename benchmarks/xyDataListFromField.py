@@ -0,0 +1,70 @@
+"""Extracting one curve per integration point of an element set with xyDataListFromField.
+
+The synthetic output database of `odbResultsStore.py` is exported to a results store file in a
+temporary directory. The S11 component at every integration point of the elements of the
+instance is extracted over all the frames by `session.xyDataListFromField`, and by iterating
+over the FieldValue objects of every frame, the way a script builds the curves value by value,
+for comparison. The times are reported::
+
+    python benchmarks/xyDataListFromField.py
+    python benchmarks/xyDataListFromField.py --elements 12500 --frames 1000
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy  # noqa: E402
+
+from abaqusConstants import *  # noqa: E402,F403
+from abaqus.Odb.ResultsStoreWriter import exportOdb  # noqa: E402
+from abaqus.XY.FieldXYData import xyDataListFromField  # noqa: E402
+from odbAccess import openOdb  # noqa: E402
+from odbResultsStore import syntheticOdb  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--elements", type=int, default=2000, help="number of elements of the mesh")
+    parser.add_argument("--frames", type=int, default=200, help="number of frames of the step")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        fileName = os.path.join(directory, "Job-1.odbstore")
+        exportOdb(syntheticOdb(args.elements, args.frames), fileName)
+        odb = openOdb(fileName)
+        instanceName = next(iter(odb.rootAssembly.instances.keys()))
+
+        start = time.perf_counter()
+        xyDataList = xyDataListFromField(
+            odb,
+            INTEGRATION_POINT,
+            (("S", INTEGRATION_POINT, ((COMPONENT, "S11"),)),),
+            elementSets=(instanceName + ".ALL",),
+        )
+        elapsed = time.perf_counter() - start
+        print("xyDataListFromField: {:8.3f} s {} curves of {} frames".format(elapsed, len(xyDataList), len(xyDataList[0])))
+
+        start = time.perf_counter()
+        curves = {}
+        for step in odb.steps.values():
+            for frame in step.frames:
+                for value in frame.fieldOutputs["S"].values:
+                    curves.setdefault((value.elementLabel, value.integrationPoint), []).append(
+                        (step.totalTime + frame.frameValue, value.data[0])
+                    )
+        elapsed = time.perf_counter() - start
+        print("FieldValue loop:     {:8.3f} s {} curves".format(elapsed, len(curves)))
+        first = curves[min(curves)]
+        assert numpy.allclose(numpy.asarray(xyDataList[0].data), first)
+        odb.close()
+
+
+if __name__ == "__main__":
+    main()
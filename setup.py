@@ -21,7 +21,7 @@ setuptools.setup(
     python_requires='>=3.9',
     package_dir={'': 'src'},
     packages=setuptools.find_packages('src'),
-    install_requires=['ipyparams'],
+    install_requires=['ipyparams', 'numpy'],
     py_modules=['abaqusConstants', 'animation', 'annotationToolset', 'assembly', 'caeModules', 'caePrefsAccess',
                 'calibration', 'connectorBehavior', 'customKernel', 'deleteObjectCallback', 'displayGroupMdbToolset',
                 'displayGroupOdbToolset', 'driverUtils', 'field', 'fields', 'inpParser', 'interaction', 'material',
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from ..Datum.DatumCsys import DatumCsys
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -43,7 +44,7 @@ class AdaptiveMeshConstraint:
     category: SymbolicConstant = None
 
     # A Region object specifying the region to which the adaptive mesh constraint is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     # None or a DatumCsys object specifying the local coordinate system of the adaptive mesh
     # constraint's degrees of freedom. If *localCsys*=None, the degrees of freedom are defined
@@ -1,5 +1,6 @@
 from .ErrorIndicatorResult import ErrorIndicatorResult
 from .RuleResult import RuleResult
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class AdaptivityIteration:
@@ -27,7 +28,7 @@ class AdaptivityIteration:
     # A repository of RuleResult objects specifying the calculated results from sizing
     # functions corresponding to the RemeshingRule objects for this iteration of an adaptivity
     # process.
-    ruleResults: dict[str, RuleResult] = dict[str, RuleResult]()
+    ruleResults: dict[str, RuleResult] = lazyDefault(dict[str, RuleResult])
 
     def __init__(
         self,
@@ -1,16 +1,20 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .AdaptiveMeshConstraint import AdaptiveMeshConstraint
-from .AdaptiveMeshControl import AdaptiveMeshControl
-from .DisplacementAdaptiveMeshConstraint import DisplacementAdaptiveMeshConstraint
-from .RemeshingRule import RemeshingRule
-from .VelocityAdaptiveMeshConstraint import VelocityAdaptiveMeshConstraint
-from ..Datum.DatumCsys import DatumCsys
 from ..Model.ModelBase import ModelBase
-from ..Odb.Odb import Odb
 from ..Region.Region import Region
 
+if typing.TYPE_CHECKING:
+    from .AdaptiveMeshConstraint import AdaptiveMeshConstraint
+    from .AdaptiveMeshControl import AdaptiveMeshControl
+    from .DisplacementAdaptiveMeshConstraint import DisplacementAdaptiveMeshConstraint
+    from .RemeshingRule import RemeshingRule
+    from .VelocityAdaptiveMeshConstraint import VelocityAdaptiveMeshConstraint
+    from ..Datum.DatumCsys import DatumCsys
+    from ..Odb.Odb import Odb
+
 
 class AdaptivityModel(ModelBase):
     """Abaqus creates a Model object named `Model-1` when a session is started.
@@ -75,6 +79,7 @@ class AdaptivityModel(ModelBase):
              degrees of freedom. If *localCsys*=None, the degrees of freedom are defined  in the global coordinate
              system. The default value is None.
         """
+        from .AdaptiveMeshConstraint import AdaptiveMeshConstraint
         self.adaptiveMeshConstraints[
             name
         ] = adaptiveMeshConstraint = AdaptiveMeshConstraint(
@@ -163,6 +168,7 @@ class AdaptivityModel(ModelBase):
         -------
             An AdaptiveMeshControl object
         """
+        from .AdaptiveMeshControl import AdaptiveMeshControl
         self.adaptiveMeshControls[name] = adaptiveMeshControl = AdaptiveMeshControl(
             name,
             remapping,
@@ -257,6 +263,7 @@ class AdaptivityModel(ModelBase):
         -------
             A DisplacementAdaptiveMeshConstraint object
         """
+        from .DisplacementAdaptiveMeshConstraint import DisplacementAdaptiveMeshConstraint
         self.adaptiveMeshConstraints[
             name
         ] = adaptiveMeshConstraint = DisplacementAdaptiveMeshConstraint(
@@ -378,6 +385,7 @@ class AdaptivityModel(ModelBase):
         -------
             A RemeshingRule object
         """
+        from .RemeshingRule import RemeshingRule
         self.remeshingRules[name] = remeshingRule = RemeshingRule(
             name,
             stepName,
@@ -475,6 +483,7 @@ class AdaptivityModel(ModelBase):
         -------
             A VelocityAdaptiveMeshConstraint object
         """
+        from .VelocityAdaptiveMeshConstraint import VelocityAdaptiveMeshConstraint
         self.adaptiveMeshConstraints[
             name
         ] = adaptiveMeshConstraint = VelocityAdaptiveMeshConstraint(
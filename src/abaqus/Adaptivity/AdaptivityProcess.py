@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .AdaptivityIteration import AdaptivityIteration
 from ..Job.ModelJob import ModelJob
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class AdaptivityProcess:
@@ -33,7 +34,9 @@ class AdaptivityProcess:
 
     # A repository of AdaptivityIteration objects specifying the AdaptivityIteration objects
     # received during running the adaptivity process.
-    iterations: dict[int, AdaptivityIteration] = dict[str, AdaptivityIteration]()
+    iterations: dict[int, AdaptivityIteration] = lazyDefault(
+        dict[str, AdaptivityIteration]
+    )
 
     def __init__(
         self, name: str, job: ModelJob, maxIterations: int = 3, jobPrefix: str = ""
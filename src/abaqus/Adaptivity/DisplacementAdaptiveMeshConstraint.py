@@ -2,6 +2,7 @@ import typing
 
 from abaqusConstants import *
 from .AdaptiveMeshConstraint import AdaptiveMeshConstraint
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -42,7 +43,7 @@ class DisplacementAdaptiveMeshConstraint(AdaptiveMeshConstraint):
     category: SymbolicConstant = None
 
     # A Region object specifying the region to which the adaptive mesh constraint is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     # None or a DatumCsys object specifying the local coordinate system of the adaptive mesh
     # constraint's degrees of freedom. If *localCsys*=None, the degrees of freedom are defined
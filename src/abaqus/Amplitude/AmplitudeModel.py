@@ -1,18 +1,22 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .ActuatorAmplitude import ActuatorAmplitude
-from .DecayAmplitude import DecayAmplitude
-from .EquallySpacedAmplitude import EquallySpacedAmplitude
-from .ModulatedAmplitude import ModulatedAmplitude
-from .PeriodicAmplitude import PeriodicAmplitude
-from .PsdDefinition import PsdDefinition
-from .SmoothStepAmplitude import SmoothStepAmplitude
-from .SolutionDependentAmplitude import SolutionDependentAmplitude
-from .SpectrumAmplitude import SpectrumAmplitude
-from .TabularAmplitude import TabularAmplitude
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from .ActuatorAmplitude import ActuatorAmplitude
+    from .DecayAmplitude import DecayAmplitude
+    from .EquallySpacedAmplitude import EquallySpacedAmplitude
+    from .ModulatedAmplitude import ModulatedAmplitude
+    from .PeriodicAmplitude import PeriodicAmplitude
+    from .PsdDefinition import PsdDefinition
+    from .SmoothStepAmplitude import SmoothStepAmplitude
+    from .SolutionDependentAmplitude import SolutionDependentAmplitude
+    from .SpectrumAmplitude import SpectrumAmplitude
+    from .TabularAmplitude import TabularAmplitude
+
 
 class AmplitudeModel(ModelBase):
     """Abaqus creates a Model object named `Model-1` when a session is started.
@@ -58,6 +62,7 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .ActuatorAmplitude import ActuatorAmplitude
         self.amplitudes[name] = amplitude = ActuatorAmplitude(name, timeSpan)
         return amplitude
 
@@ -106,6 +111,7 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .DecayAmplitude import DecayAmplitude
         self.amplitudes[name] = amplitude = DecayAmplitude(
             name, initial, maximum, start, decayTime, timeSpan
         )
@@ -161,6 +167,7 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .EquallySpacedAmplitude import EquallySpacedAmplitude
         self.amplitudes[name] = amplitude = EquallySpacedAmplitude(
             name, fixedInterval, data, begin, smooth, timeSpan
         )
@@ -216,6 +223,7 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .ModulatedAmplitude import ModulatedAmplitude
         self.amplitudes[name] = amplitude = ModulatedAmplitude(
             name, initial, magnitude, start, frequency1, frequency2, timeSpan
         )
@@ -266,6 +274,7 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .PeriodicAmplitude import PeriodicAmplitude
         self.amplitudes[name] = amplitude = PeriodicAmplitude(
             name, frequency, start, a_0, data, timeSpan
         )
@@ -332,6 +341,7 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .PsdDefinition import PsdDefinition
         self.amplitudes[name] = amplitude = PsdDefinition(
             name,
             data,
@@ -378,6 +388,7 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .SmoothStepAmplitude import SmoothStepAmplitude
         self.amplitudes[name] = amplitude = SmoothStepAmplitude(name, data, timeSpan)
         return amplitude
 
@@ -426,6 +437,7 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .SolutionDependentAmplitude import SolutionDependentAmplitude
         self.amplitudes[name] = amplitude = SolutionDependentAmplitude(
             name, initial, minimum, maximum, timeSpan
         )
@@ -506,6 +518,7 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .SpectrumAmplitude import SpectrumAmplitude
         self.amplitudes[name] = amplitude = SpectrumAmplitude(
             name,
             method,
@@ -564,6 +577,7 @@ class AmplitudeModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .TabularAmplitude import TabularAmplitude
         self.amplitudes[name] = amplitude = TabularAmplitude(
             name, data, smooth, timeSpan
         )
@@ -1,18 +1,22 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .ActuatorAmplitude import ActuatorAmplitude
-from .DecayAmplitude import DecayAmplitude
-from .EquallySpacedAmplitude import EquallySpacedAmplitude
-from .ModulatedAmplitude import ModulatedAmplitude
-from .PeriodicAmplitude import PeriodicAmplitude
-from .PsdDefinition import PsdDefinition
-from .SmoothStepAmplitude import SmoothStepAmplitude
-from .SolutionDependentAmplitude import SolutionDependentAmplitude
-from .SpectrumAmplitude import SpectrumAmplitude
-from .TabularAmplitude import TabularAmplitude
 from ..Odb.OdbBase import OdbBase
 
+if typing.TYPE_CHECKING:
+    from .ActuatorAmplitude import ActuatorAmplitude
+    from .DecayAmplitude import DecayAmplitude
+    from .EquallySpacedAmplitude import EquallySpacedAmplitude
+    from .ModulatedAmplitude import ModulatedAmplitude
+    from .PeriodicAmplitude import PeriodicAmplitude
+    from .PsdDefinition import PsdDefinition
+    from .SmoothStepAmplitude import SmoothStepAmplitude
+    from .SolutionDependentAmplitude import SolutionDependentAmplitude
+    from .SpectrumAmplitude import SpectrumAmplitude
+    from .TabularAmplitude import TabularAmplitude
+
 
 class AmplitudeOdb(OdbBase):
     """The Odb object is the in-memory representation of an output database (ODB) file.
@@ -59,6 +63,7 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .ActuatorAmplitude import ActuatorAmplitude
         self.amplitudes[name] = amplitude = ActuatorAmplitude(name, timeSpan)
         return amplitude
 
@@ -107,6 +112,7 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .DecayAmplitude import DecayAmplitude
         self.amplitudes[name] = amplitude = DecayAmplitude(
             name, initial, maximum, start, decayTime, timeSpan
         )
@@ -162,6 +168,7 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .EquallySpacedAmplitude import EquallySpacedAmplitude
         self.amplitudes[name] = amplitude = EquallySpacedAmplitude(
             name, fixedInterval, data, begin, smooth, timeSpan
         )
@@ -217,6 +224,7 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .ModulatedAmplitude import ModulatedAmplitude
         self.amplitudes[name] = amplitude = ModulatedAmplitude(
             name, initial, magnitude, start, frequency1, frequency2, timeSpan
         )
@@ -267,6 +275,7 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .PeriodicAmplitude import PeriodicAmplitude
         self.amplitudes[name] = amplitude = PeriodicAmplitude(
             name, frequency, start, a_0, data, timeSpan
         )
@@ -333,6 +342,7 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .PsdDefinition import PsdDefinition
         self.amplitudes[name] = amplitude = PsdDefinition(
             name,
             data,
@@ -379,6 +389,7 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .SmoothStepAmplitude import SmoothStepAmplitude
         self.amplitudes[name] = amplitude = SmoothStepAmplitude(name, data, timeSpan)
         return amplitude
 
@@ -427,6 +438,7 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .SolutionDependentAmplitude import SolutionDependentAmplitude
         self.amplitudes[name] = amplitude = SolutionDependentAmplitude(
             name, initial, minimum, maximum, timeSpan
         )
@@ -507,6 +519,7 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .SpectrumAmplitude import SpectrumAmplitude
         self.amplitudes[name] = amplitude = SpectrumAmplitude(
             name,
             method,
@@ -565,6 +578,7 @@ class AmplitudeOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .TabularAmplitude import TabularAmplitude
         self.amplitudes[name] = amplitude = TabularAmplitude(
             name, data, smooth, timeSpan
         )
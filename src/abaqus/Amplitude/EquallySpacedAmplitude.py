@@ -3,6 +3,7 @@ import typing
 from abaqusConstants import *
 from .Amplitude import Amplitude
 from .BaselineCorrection import BaselineCorrection
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class EquallySpacedAmplitude(Amplitude):
@@ -33,7 +34,7 @@ class EquallySpacedAmplitude(Amplitude):
     """
 
     # A BaselineCorrection object.
-    baselineCorrection: BaselineCorrection = BaselineCorrection()
+    baselineCorrection: BaselineCorrection = lazyDefault(BaselineCorrection)
 
     def __init__(
         self,
@@ -1,9 +1,13 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .Movie import Movie
 from ..Session.SessionBase import SessionBase
 
+if typing.TYPE_CHECKING:
+    from .Movie import Movie
+
 
 class AnimationSession(SessionBase):
     """The following commands operate on Session objects. For more information about the
@@ -103,6 +107,7 @@ class AnimationSession(SessionBase):
             - If the contents of *fileName* are corrupt or can not be decoded:
               ValueError: Unable to decode movie file
         """
+        from .Movie import Movie
         self.movies[name] = movie = Movie(
             name,
             fileName,
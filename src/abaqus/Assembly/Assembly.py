@@ -1,3 +1,5 @@
+import typing
+
 from abaqusConstants import *
 from .ConnectorOrientation import ConnectorOrientation
 from ..Datum.DatumCsys import DatumCsys
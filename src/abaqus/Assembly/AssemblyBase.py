@@ -13,6 +13,7 @@ from ..BasicGeometry.VertexArray import VertexArray
 from ..Datum.Datum import Datum
 from ..Datum.DatumCsys import DatumCsys
 from ..EngineeringFeature.EngineeringFeature import EngineeringFeature
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Mesh.MeshElement import MeshElement
 from ..Mesh.MeshElementArray import MeshElementArray
 from ..Mesh.MeshFace import MeshFace
@@ -133,86 +134,88 @@ class AssemblyBase(Feature):
 
     # A VertexArray object specifying all the vertices existing at the assembly level. This
     # member does not provide access to the vertices at the instance level.
-    vertices: VertexArray = VertexArray([])
+    vertices: VertexArray = lazyDefault(lambda: VertexArray([]))
 
     # An EdgeArray object specifying all the edges existing at the assembly level. This member
     # does not provide access to the edges at the instance level.
-    edges: EdgeArray = EdgeArray([])
+    edges: EdgeArray = lazyDefault(lambda: EdgeArray([]))
 
     # A MeshElementArray object specifying all the elements existing at the assembly level.
     # This member does not provide access to the elements at the instance level.
-    elements: MeshElementArray = MeshElementArray([])
+    elements: MeshElementArray = lazyDefault(lambda: MeshElementArray([]))
 
     # A MeshNodeArray object specifying all the nodes existing at the assembly level. This
     # member does not provide access to the nodes at the instance level.
-    nodes: MeshNodeArray = MeshNodeArray([])
+    nodes: MeshNodeArray = lazyDefault(lambda: MeshNodeArray([]))
 
     # A repository of PartInstance objects.
-    instances: dict[str, PartInstance] = dict[str, PartInstance]()
+    instances: dict[str, PartInstance] = lazyDefault(dict[str, PartInstance])
 
     # A repository of Datum objects specifying all Datum objects in the assembly.
-    datums: list[Datum] = list[Datum]()
+    datums: list[Datum] = lazyDefault(list[Datum])
 
     # A repository of Feature objects specifying all Feature objects in the assembly.
-    features: dict[str, Feature] = dict[str, Feature]()
+    features: dict[str, Feature] = lazyDefault(dict[str, Feature])
 
     # A repository of Feature objects specifying all Feature objects in the assembly.The
     # Feature objects in the featuresById repository are the same as the Feature objects in
     # the features repository. However, the key to the objects in the featuresById repository
     # is an integer specifying the *ID*, whereas the key to the objects in the features
     # repository is a string specifying the *name*.
-    featuresById: dict[str, Feature] = dict[str, Feature]()
+    featuresById: dict[str, Feature] = lazyDefault(dict[str, Feature])
 
     # A repository of Surface objects specifying for more information, see [Region
     # commands](https://help.3ds.com/2022/english/DSSIMULIA_Established/SIMACAEKERRefMap/simaker-m-RegPyc-sb.htm?ContextScope=all).
-    surfaces: dict[str, Surface] = dict[str, Surface]()
+    surfaces: dict[str, Surface] = lazyDefault(dict[str, Surface])
 
     # A repository of Surface objects specifying for more information, see [Region
     # commands](https://help.3ds.com/2022/english/DSSIMULIA_Established/SIMACAEKERRefMap/simaker-m-RegPyc-sb.htm?ContextScope=all).
-    allSurfaces: dict[str, Surface] = dict[str, Surface]()
+    allSurfaces: dict[str, Surface] = lazyDefault(dict[str, Surface])
 
     # A repository of Surface objects specifying picked regions.
-    allInternalSurfaces: dict[str, Surface] = dict[str, Surface]()
+    allInternalSurfaces: dict[str, Surface] = lazyDefault(dict[str, Surface])
 
     # A repository of Set objects.
-    sets: dict[str, Set] = dict[str, Set]()
+    sets: dict[str, Set] = lazyDefault(dict[str, Set])
 
     # A repository of Set objects specifying for more information, see [Region
     # commands](https://help.3ds.com/2022/english/DSSIMULIA_Established/SIMACAEKERRefMap/simaker-m-RegPyc-sb.htm?ContextScope=all).
-    allSets: dict[str, Set] = dict[str, Set]()
+    allSets: dict[str, Set] = lazyDefault(dict[str, Set])
 
     # A repository of Set objects specifying picked regions.
-    allInternalSets: dict[str, Set] = dict[str, Set]()
+    allInternalSets: dict[str, Set] = lazyDefault(dict[str, Set])
 
     # A repository of Skin objects specifying the skins created on the assembly.
-    skins: dict[str, Skin] = dict[str, Skin]()
+    skins: dict[str, Skin] = lazyDefault(dict[str, Skin])
 
     # A repository of Stringer objects specifying the stringers created on the assembly.
-    stringers: dict[str, Stringer] = dict[str, Stringer]()
+    stringers: dict[str, Stringer] = lazyDefault(dict[str, Stringer])
 
     # A repository of ReferencePoint objects.
-    referencePoints: dict[str, ReferencePoint] = dict[str, ReferencePoint]()
+    referencePoints: dict[str, ReferencePoint] = lazyDefault(dict[str, ReferencePoint])
 
     # A repository of ModelInstance objects.
-    modelInstances: dict[str, ModelInstance] = dict[str, ModelInstance]()
+    modelInstances: dict[str, ModelInstance] = lazyDefault(dict[str, ModelInstance])
 
     # A PartInstance object specifying the PartInstances and A ModelInstance object specifying
     # the ModelInstances.
-    allInstances: dict[str, typing.Union[PartInstance, ModelInstance]] = dict[
-        str, typing.Union[PartInstance, ModelInstance]
-    ]()
+    allInstances: dict[str, typing.Union[PartInstance, ModelInstance]] = lazyDefault(
+        dict[str, typing.Union[PartInstance, ModelInstance]]
+    )
 
     # An EngineeringFeature object.
-    engineeringFeatures: EngineeringFeature = EngineeringFeature()
+    engineeringFeatures: EngineeringFeature = lazyDefault(EngineeringFeature)
 
     # A String specifying the name of the model to which the assembly belongs.
     modelName: str = ""
 
     # A ConnectorOrientationArray object.
-    connectorOrientations: ConnectorOrientationArray = ConnectorOrientationArray()
+    connectorOrientations: ConnectorOrientationArray = lazyDefault(
+        ConnectorOrientationArray
+    )
 
     # A SectionAssignmentArray object.
-    sectionAssignments: SectionAssignmentArray = SectionAssignmentArray()
+    sectionAssignments: SectionAssignmentArray = lazyDefault(SectionAssignmentArray)
 
     @typing.overload
     def Instance(
@@ -1,5 +1,11 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .PartInstance import PartInstance
+
+if typing.TYPE_CHECKING:
+    from .PartInstance import PartInstance
 
 # from ..Model.ModelBase import ModelBase
 
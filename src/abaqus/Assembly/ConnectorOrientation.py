@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from ..Datum.DatumCsys import DatumCsys
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Set import Set
 
 
@@ -21,11 +22,11 @@ class ConnectorOrientation:
     """
 
     region: Set
-    localCsys1: DatumCsys = DatumCsys()
+    localCsys1: DatumCsys = lazyDefault(DatumCsys)
     axis1: SymbolicConstant = (AXIS_1,)
     angle1: float = 0
     orient2sameAs1: Boolean = ON
-    localCsys2: DatumCsys = DatumCsys()
+    localCsys2: DatumCsys = lazyDefault(DatumCsys)
     axis2: SymbolicConstant = AXIS_1
     angle2: float = 0
 
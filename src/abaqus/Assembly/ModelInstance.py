@@ -3,6 +3,7 @@ from ..BasicGeometry.EdgeArray import EdgeArray
 from ..BasicGeometry.ReferencePoint import ReferencePoint
 from ..BasicGeometry.VertexArray import VertexArray
 from ..Datum.Datum import Datum
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Mesh.MeshElementArray import MeshElementArray
 from ..Mesh.MeshNodeArray import MeshNodeArray
 
@@ -56,30 +57,30 @@ class ModelInstance:
     # A repository of Set objects specifying the sets created on the assembly. For more
     # information, see [Region
     # commands](https://help.3ds.com/2022/english/DSSIMULIA_Established/SIMACAEKERRefMap/simaker-m-RegPyc-sb.htm?ContextScope=all).
-    sets: dict[str, Set] = dict[str, Set]()
+    sets: dict[str, Set] = lazyDefault(dict[str, Set])
 
     # A repository of Surface objects specifying the surfaces created on the assembly. For
     # more information, see [Region
     # commands](https://help.3ds.com/2022/english/DSSIMULIA_Established/SIMACAEKERRefMap/simaker-m-RegPyc-sb.htm?ContextScope=all).
-    surfaces: dict[str, Surface] = dict[str, Surface]()
+    surfaces: dict[str, Surface] = lazyDefault(dict[str, Surface])
 
     # A VertexArray object.
-    vertices: VertexArray = VertexArray([])
+    vertices: VertexArray = lazyDefault(lambda: VertexArray([]))
 
     # An EdgeArray object.
-    edges: EdgeArray = EdgeArray([])
+    edges: EdgeArray = lazyDefault(lambda: EdgeArray([]))
 
     # A MeshElementArray object.
-    elements: MeshElementArray = MeshElementArray([])
+    elements: MeshElementArray = lazyDefault(lambda: MeshElementArray([]))
 
     # A MeshNodeArray object.
-    nodes: MeshNodeArray = MeshNodeArray([])
+    nodes: MeshNodeArray = lazyDefault(lambda: MeshNodeArray([]))
 
     # A repository of Datum objects.
-    datums: dict[str, Datum] = dict[str, Datum]()
+    datums: dict[str, Datum] = lazyDefault(dict[str, Datum])
 
     # A repository of ReferencePoint objects.
-    referencePoints: dict[str, ReferencePoint] = dict[str, ReferencePoint]()
+    referencePoints: dict[str, ReferencePoint] = lazyDefault(dict[str, ReferencePoint])
 
     def __init__(self, name: str, model: Model, autoOffset: Boolean = OFF):
         """This method creates a ModelInstance object and puts it into the instances repository.
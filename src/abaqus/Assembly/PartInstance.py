@@ -7,6 +7,7 @@ from ..BasicGeometry.IgnoredVertexArray import IgnoredVertexArray
 from ..BasicGeometry.ReferencePoint import ReferencePoint
 from ..BasicGeometry.VertexArray import VertexArray
 from ..Datum.Datum import Datum
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Mesh.MeshEdge import MeshEdge
 from ..Mesh.MeshEdgeArray import MeshEdgeArray
 from ..Mesh.MeshElementArray import MeshElementArray
@@ -145,71 +146,71 @@ class PartInstance:
     # A repository of Set objects specifying the sets created on the part. For more
     # information, see [Region
     # commands](https://help.3ds.com/2022/english/DSSIMULIA_Established/SIMACAEKERRefMap/simaker-m-RegPyc-sb.htm?ContextScope=all).
-    sets: dict[str, Set] = dict[str, Set]()
+    sets: dict[str, Set] = lazyDefault(dict[str, Set])
 
     # A repository of Surface objects specifying the surfaces created on the part. For more
     # information, see [Region
     # commands](https://help.3ds.com/2022/english/DSSIMULIA_Established/SIMACAEKERRefMap/simaker-m-RegPyc-sb.htm?ContextScope=all).
-    surfaces: dict[str, Surface] = dict[str, Surface]()
+    surfaces: dict[str, Surface] = lazyDefault(dict[str, Surface])
 
     # A repository of Skin objects specifying the skins created on the part. For more
     # information, see [Region
     # commands](https://help.3ds.com/2022/english/DSSIMULIA_Established/SIMACAEKERRefMap/simaker-m-RegPyc-sb.htm?ContextScope=all).
-    skins: dict[str, Skin] = dict[str, Skin]()
+    skins: dict[str, Skin] = lazyDefault(dict[str, Skin])
 
     # A repository of Stringer objects specifying the stringers created on the part. For more
     # information, see [Region
     # commands](https://help.3ds.com/2022/english/DSSIMULIA_Established/SIMACAEKERRefMap/simaker-m-RegPyc-sb.htm?ContextScope=all).
-    stringers: dict[str, Stringer] = dict[str, Stringer]()
+    stringers: dict[str, Stringer] = lazyDefault(dict[str, Stringer])
 
     # A VertexArray object.
-    vertices: VertexArray = VertexArray([])
+    vertices: VertexArray = lazyDefault(lambda: VertexArray([]))
 
     # An IgnoredVertexArray object.
-    ignoredVertices: IgnoredVertexArray = IgnoredVertexArray()
+    ignoredVertices: IgnoredVertexArray = lazyDefault(IgnoredVertexArray)
 
     # An EdgeArray object.
-    edges: EdgeArray = EdgeArray([])
+    edges: EdgeArray = lazyDefault(lambda: EdgeArray([]))
 
     # An IgnoredEdgeArray object.
-    ignoredEdges: IgnoredEdgeArray = IgnoredEdgeArray()
+    ignoredEdges: IgnoredEdgeArray = lazyDefault(IgnoredEdgeArray)
 
     # A FaceArray object.
-    faces: FaceArray = FaceArray([])
+    faces: FaceArray = lazyDefault(lambda: FaceArray([]))
 
     # A CellArray object.
-    cells: CellArray = CellArray([])
+    cells: CellArray = lazyDefault(lambda: CellArray([]))
 
     # A repository of Datum objects.
-    datums: list[Datum] = list[Datum]()
+    datums: list[Datum] = lazyDefault(list[Datum])
 
     # A MeshElementArray object.
-    elements: MeshElementArray = MeshElementArray([])
+    elements: MeshElementArray = lazyDefault(lambda: MeshElementArray([]))
 
     # A MeshNodeArray object.
-    nodes: MeshNodeArray = MeshNodeArray([])
+    nodes: MeshNodeArray = lazyDefault(lambda: MeshNodeArray([]))
 
     # A repository of MeshFace objects specifying all the element faces in the part instance.
     # For a given element and a given face index within that element, the corresponding
     # MeshFace object can be retrieved from the repository by using the key calculated as (i*8
     # + j), where i and j are zero-based element and face indices, respectively.
-    elemFaces: dict[str, MeshFace] = dict[str, MeshFace]()
+    elemFaces: dict[str, MeshFace] = lazyDefault(dict[str, MeshFace])
 
     # A MeshFaceArray object.
-    elementFaces: MeshFaceArray = MeshFaceArray([])
+    elementFaces: MeshFaceArray = lazyDefault(lambda: MeshFaceArray([]))
 
     # A repository of MeshEdge objects specifying all the element edges in the part instance.
     # For a given element and a given edge index on a given face within that element, the
     # corresponding MeshEdge object can be retrieved from the repository by using the key
     # calculated as (i*32 + j*4 + k), where i, j, and k are zero-based element, face, and edge
     # indices, respectively.
-    elemEdges: dict[str, MeshEdge] = dict[str, MeshEdge]()
+    elemEdges: dict[str, MeshEdge] = lazyDefault(dict[str, MeshEdge])
 
     # A MeshEdgeArray object.
-    elementEdges: MeshEdgeArray = MeshEdgeArray([])
+    elementEdges: MeshEdgeArray = lazyDefault(lambda: MeshEdgeArray([]))
 
     # A repository of ReferencePoint objects.
-    referencePoints: dict[str, ReferencePoint] = dict[str, ReferencePoint]()
+    referencePoints: dict[str, ReferencePoint] = lazyDefault(dict[str, ReferencePoint])
 
     # A String specifying the name of the part from which the instance was created.
     partName: str = ""
@@ -245,6 +246,9 @@ class PartInstance:
         -------
             A PartInstance object.
         """
+        self.name = name
+        self.part = part
+        self.dependent = dependent
         self.vertices = part.vertices
         self.ignoredEdges = part.ignoredEdges
         self.faces = part.faces
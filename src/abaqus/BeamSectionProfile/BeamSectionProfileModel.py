@@ -1,18 +1,24 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .ArbitraryProfile import ArbitraryProfile
-from .BoxProfile import BoxProfile
-from .CircularProfile import CircularProfile
-from .GeneralizedProfile import GeneralizedProfile
-from .HexagonalProfile import HexagonalProfile
-from .IProfile import IProfile
-from .LProfile import LProfile
-from .PipeProfile import PipeProfile
-from .Profile import Profile
-from .RectangularProfile import RectangularProfile
-from .TProfile import TProfile
-from .TrapezoidalProfile import TrapezoidalProfile
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from .ArbitraryProfile import ArbitraryProfile
+    from .BoxProfile import BoxProfile
+    from .CircularProfile import CircularProfile
+    from .GeneralizedProfile import GeneralizedProfile
+    from .HexagonalProfile import HexagonalProfile
+    from .IProfile import IProfile
+    from .LProfile import LProfile
+    from .PipeProfile import PipeProfile
+    from .Profile import Profile
+    from .RectangularProfile import RectangularProfile
+    from .TProfile import TProfile
+    from .TrapezoidalProfile import TrapezoidalProfile
+
 
 class BeamSectionProfileModel(ModelBase):
     """Abaqus creates a Model object named `Model-1` when a session is started.
@@ -83,6 +89,7 @@ class BeamSectionProfileModel(ModelBase):
             RangeError.
             !img
         """
+        from .ArbitraryProfile import ArbitraryProfile
         self.profiles[name] = arbitraryProfile = ArbitraryProfile(name, table)
         return arbitraryProfile
 
@@ -142,6 +149,7 @@ class BeamSectionProfileModel(ModelBase):
             RangeError.
             !img
         """
+        from .BoxProfile import BoxProfile
         self.profiles[name] = boxProfile = BoxProfile(
             name, a, b, uniformThickness, t1, t2, t3, t4
         )
@@ -177,6 +185,7 @@ class BeamSectionProfileModel(ModelBase):
             RangeError.
             !img
         """
+        from .CircularProfile import CircularProfile
         self.profiles[name] = circularProfile = CircularProfile(name, r)
         return circularProfile
 
@@ -230,6 +239,7 @@ class BeamSectionProfileModel(ModelBase):
             RangeError.
             !img
         """
+        from .GeneralizedProfile import GeneralizedProfile
         self.profiles[name] = generalizedProfile = GeneralizedProfile(
             name, area, i11, i12, i22, j, gammaO, gammaW
         )
@@ -268,6 +278,7 @@ class BeamSectionProfileModel(ModelBase):
             RangeError.
             !img
         """
+        from .HexagonalProfile import HexagonalProfile
         self.profiles[name] = hexagonalProfile = HexagonalProfile(name, r, t)
         return hexagonalProfile
 
@@ -323,6 +334,7 @@ class BeamSectionProfileModel(ModelBase):
             RangeError.
             !img
         """
+        from .IProfile import IProfile
         self.profiles[name] = iProfile = IProfile(name, l, h, b1, b2, t1, t2, t3)
         return iProfile
 
@@ -364,6 +376,7 @@ class BeamSectionProfileModel(ModelBase):
             RangeError.
             !img
         """
+        from .LProfile import LProfile
         self.profiles[name] = lProfile = LProfile(name, a, b, t1, t2)
         return lProfile
 
@@ -399,6 +412,7 @@ class BeamSectionProfileModel(ModelBase):
             RangeError.
             !img
         """
+        from .PipeProfile import PipeProfile
         self.profiles[name] = pipeProfile = PipeProfile(name, r, t)
         return pipeProfile
 
@@ -434,6 +448,7 @@ class BeamSectionProfileModel(ModelBase):
             RangeError.
             !img
         """
+        from .RectangularProfile import RectangularProfile
         self.profiles[name] = rectangularProfile = RectangularProfile(name, a, b)
         return rectangularProfile
 
@@ -480,6 +495,7 @@ class BeamSectionProfileModel(ModelBase):
             RangeError.
             !img
         """
+        from .TProfile import TProfile
         self.profiles[name] = tProfile = TProfile(name, b, h, l, tf, tw)
         return tProfile
 
@@ -521,5 +537,6 @@ class BeamSectionProfileModel(ModelBase):
             RangeError.
             !img
         """
+        from .TrapezoidalProfile import TrapezoidalProfile
         self.profiles[name] = trapezoidalProfile = TrapezoidalProfile(name, a, b, c, d)
         return trapezoidalProfile
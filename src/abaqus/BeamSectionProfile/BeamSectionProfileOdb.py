@@ -1,17 +1,23 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .ArbitraryProfile import ArbitraryProfile
-from .BoxProfile import BoxProfile
-from .CircularProfile import CircularProfile
-from .GeneralizedProfile import GeneralizedProfile
-from .HexagonalProfile import HexagonalProfile
-from .IProfile import IProfile
-from .LProfile import LProfile
-from .PipeProfile import PipeProfile
-from .RectangularProfile import RectangularProfile
-from .TProfile import TProfile
-from .TrapezoidalProfile import TrapezoidalProfile
 from ..Odb.OdbBase import OdbBase
 
+if typing.TYPE_CHECKING:
+    from .ArbitraryProfile import ArbitraryProfile
+    from .BoxProfile import BoxProfile
+    from .CircularProfile import CircularProfile
+    from .GeneralizedProfile import GeneralizedProfile
+    from .HexagonalProfile import HexagonalProfile
+    from .IProfile import IProfile
+    from .LProfile import LProfile
+    from .PipeProfile import PipeProfile
+    from .RectangularProfile import RectangularProfile
+    from .TProfile import TProfile
+    from .TrapezoidalProfile import TrapezoidalProfile
+
 
 class BeamSectionProfileOdb(OdbBase):
     """The Odb object is the in-memory representation of an output database (ODB) file.
@@ -55,6 +61,7 @@ class BeamSectionProfileOdb(OdbBase):
             RangeError.
             !img
         """
+        from .ArbitraryProfile import ArbitraryProfile
         self.profiles[name] = arbitraryProfile = ArbitraryProfile(name, table)
         return arbitraryProfile
 
@@ -114,6 +121,7 @@ class BeamSectionProfileOdb(OdbBase):
             RangeError.
             !img
         """
+        from .BoxProfile import BoxProfile
         self.profiles[name] = boxProfile = BoxProfile(
             name, a, b, uniformThickness, t1, t2, t3, t4
         )
@@ -149,6 +157,7 @@ class BeamSectionProfileOdb(OdbBase):
             RangeError.
             !img
         """
+        from .CircularProfile import CircularProfile
         self.profiles[name] = circularProfile = CircularProfile(name, r)
         return circularProfile
 
@@ -202,6 +211,7 @@ class BeamSectionProfileOdb(OdbBase):
             RangeError.
             !img
         """
+        from .GeneralizedProfile import GeneralizedProfile
         self.profiles[name] = generalizedProfile = GeneralizedProfile(
             name, area, i11, i12, i22, j, gammaO, gammaW
         )
@@ -240,6 +250,7 @@ class BeamSectionProfileOdb(OdbBase):
             RangeError.
             !img
         """
+        from .HexagonalProfile import HexagonalProfile
         self.profiles[name] = hexagonalProfile = HexagonalProfile(name, r, t)
         return hexagonalProfile
 
@@ -295,6 +306,7 @@ class BeamSectionProfileOdb(OdbBase):
             RangeError.
             !img
         """
+        from .IProfile import IProfile
         self.profiles[name] = iProfile = IProfile(name, l, h, b1, b2, t1, t2, t3)
         return iProfile
 
@@ -336,6 +348,7 @@ class BeamSectionProfileOdb(OdbBase):
             RangeError.
             !img
         """
+        from .LProfile import LProfile
         self.profiles[name] = lProfile = LProfile(name, a, b, t1, t2)
         return lProfile
 
@@ -371,6 +384,7 @@ class BeamSectionProfileOdb(OdbBase):
             RangeError.
             !img
         """
+        from .PipeProfile import PipeProfile
         self.profiles[name] = pipeProfile = PipeProfile(name, r, t)
         return pipeProfile
 
@@ -406,6 +420,7 @@ class BeamSectionProfileOdb(OdbBase):
             RangeError.
             !img
         """
+        from .RectangularProfile import RectangularProfile
         self.profiles[name] = rectangularProfile = RectangularProfile(name, a, b)
         return rectangularProfile
 
@@ -452,6 +467,7 @@ class BeamSectionProfileOdb(OdbBase):
             RangeError.
             !img
         """
+        from .TProfile import TProfile
         self.profiles[name] = tProfile = TProfile(name, b, h, l, tf, tw)
         return tProfile
 
@@ -493,5 +509,6 @@ class BeamSectionProfileOdb(OdbBase):
             RangeError.
             !img
         """
+        from .TrapezoidalProfile import TrapezoidalProfile
         self.profiles[name] = trapezoidalProfile = TrapezoidalProfile(name, a, b, c, d)
         return trapezoidalProfile
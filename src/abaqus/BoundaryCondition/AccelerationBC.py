@@ -2,6 +2,7 @@ import typing
 
 from abaqusConstants import *
 from .BoundaryCondition import BoundaryCondition
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -58,7 +59,7 @@ class AccelerationBC(BoundaryCondition):
     category: SymbolicConstant = None
 
     # A Region object specifying the region to which the boundary condition is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     # None or a DatumCsys object specifying the local coordinate system of the boundary
     # condition's degrees of freedom. If *localCsys*=None, the degrees of freedom are defined
@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .BoundaryCondition import BoundaryCondition
 from ..Amplitude.CorrelationArray import CorrelationArray
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -62,7 +63,7 @@ class AccelerationBaseMotionBC(BoundaryCondition):
     centerOfRotation: tuple = ()
 
     # A CorrelationArray object.
-    correlation: CorrelationArray = CorrelationArray()
+    correlation: CorrelationArray = lazyDefault(CorrelationArray)
 
     # A String specifying the name of the SecondaryBaseBC object associated with this boundary
     # condition. The default value is an empty string.
@@ -73,7 +74,7 @@ class AccelerationBaseMotionBC(BoundaryCondition):
     category: SymbolicConstant = None
 
     # A Region object specifying the region to which the boundary condition is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     # None or a DatumCsys object specifying the local coordinate system of the boundary
     # condition's degrees of freedom. If *localCsys*=None, the degrees of freedom are defined
@@ -1,4 +1,5 @@
 from abaqusConstants import *
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -41,7 +42,7 @@ class BoundaryCondition:
     category: SymbolicConstant = None
 
     # A Region object specifying the region to which the boundary condition is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     # None or a DatumCsys object specifying the local coordinate system of the boundary
     # condition's degrees of freedom. If *localCsys*=None, the degrees of freedom are defined
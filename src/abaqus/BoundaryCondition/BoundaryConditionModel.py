@@ -1,54 +1,58 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .AccelerationBC import AccelerationBC
-from .AccelerationBCState import AccelerationBCState
-from .AccelerationBaseMotionBC import AccelerationBaseMotionBC
-from .AccelerationBaseMotionBCState import AccelerationBaseMotionBCState
-from .AcousticPressureBC import AcousticPressureBC
-from .AcousticPressureBCState import AcousticPressureBCState
-from .Calibration import Calibration
-from .ConcentrationBC import ConcentrationBC
-from .ConcentrationBCState import ConcentrationBCState
-from .ConnAccelerationBC import ConnAccelerationBC
-from .ConnAccelerationBCState import ConnAccelerationBCState
-from .ConnDisplacementBC import ConnDisplacementBC
-from .ConnDisplacementBCState import ConnDisplacementBCState
-from .ConnVelocityBC import ConnVelocityBC
-from .ConnVelocityBCState import ConnVelocityBCState
-from .DisplacementBC import DisplacementBC
-from .DisplacementBCState import DisplacementBCState
-from .DisplacementBaseMotionBC import DisplacementBaseMotionBC
-from .DisplacementBaseMotionBCState import DisplacementBaseMotionBCState
-from .ElectricPotentialBC import ElectricPotentialBC
-from .ElectricPotentialBCState import ElectricPotentialBCState
-from .EulerianBC import EulerianBC
-from .EulerianBCState import EulerianBCState
-from .EulerianMotionBC import EulerianMotionBC
-from .EulerianMotionBCState import EulerianMotionBCState
-from .FluidCavityPressureBC import FluidCavityPressureBC
-from .FluidCavityPressureBCState import FluidCavityPressureBCState
-from .MagneticVectorPotentialBC import MagneticVectorPotentialBC
-from .MaterialFlowBC import MaterialFlowBC
-from .MaterialFlowBCState import MaterialFlowBCState
-from .PorePressureBC import PorePressureBC
-from .PorePressureBCState import PorePressureBCState
-from .RetainedNodalDofsBC import RetainedNodalDofsBC
-from .SecondaryBaseBC import SecondaryBaseBC
-from .SecondaryBaseBCState import SecondaryBaseBCState
-from .SubmodelBC import SubmodelBC
-from .SubmodelBCState import SubmodelBCState
-from .TemperatureBC import TemperatureBC
-from .TemperatureBCState import TemperatureBCState
-from .TypeBC import TypeBC
-from .VelocityBC import VelocityBC
-from .VelocityBCState import VelocityBCState
-from .VelocityBaseMotionBC import VelocityBaseMotionBC
-from .VelocityBaseMotionBCState import VelocityBaseMotionBCState
-from ..Amplitude.CorrelationArray import CorrelationArray
 from ..Model.ModelBase import ModelBase
 from ..Region.Region import Region
-from ..Region.RegionArray import RegionArray
+
+if typing.TYPE_CHECKING:
+    from .AccelerationBC import AccelerationBC
+    from .AccelerationBCState import AccelerationBCState
+    from .AccelerationBaseMotionBC import AccelerationBaseMotionBC
+    from .AccelerationBaseMotionBCState import AccelerationBaseMotionBCState
+    from .AcousticPressureBC import AcousticPressureBC
+    from .AcousticPressureBCState import AcousticPressureBCState
+    from .Calibration import Calibration
+    from .ConcentrationBC import ConcentrationBC
+    from .ConcentrationBCState import ConcentrationBCState
+    from .ConnAccelerationBC import ConnAccelerationBC
+    from .ConnAccelerationBCState import ConnAccelerationBCState
+    from .ConnDisplacementBC import ConnDisplacementBC
+    from .ConnDisplacementBCState import ConnDisplacementBCState
+    from .ConnVelocityBC import ConnVelocityBC
+    from .ConnVelocityBCState import ConnVelocityBCState
+    from .DisplacementBC import DisplacementBC
+    from .DisplacementBCState import DisplacementBCState
+    from .DisplacementBaseMotionBC import DisplacementBaseMotionBC
+    from .DisplacementBaseMotionBCState import DisplacementBaseMotionBCState
+    from .ElectricPotentialBC import ElectricPotentialBC
+    from .ElectricPotentialBCState import ElectricPotentialBCState
+    from .EulerianBC import EulerianBC
+    from .EulerianBCState import EulerianBCState
+    from .EulerianMotionBC import EulerianMotionBC
+    from .EulerianMotionBCState import EulerianMotionBCState
+    from .FluidCavityPressureBC import FluidCavityPressureBC
+    from .FluidCavityPressureBCState import FluidCavityPressureBCState
+    from .MagneticVectorPotentialBC import MagneticVectorPotentialBC
+    from .MaterialFlowBC import MaterialFlowBC
+    from .MaterialFlowBCState import MaterialFlowBCState
+    from .PorePressureBC import PorePressureBC
+    from .PorePressureBCState import PorePressureBCState
+    from .RetainedNodalDofsBC import RetainedNodalDofsBC
+    from .SecondaryBaseBC import SecondaryBaseBC
+    from .SecondaryBaseBCState import SecondaryBaseBCState
+    from .SubmodelBC import SubmodelBC
+    from .SubmodelBCState import SubmodelBCState
+    from .TemperatureBC import TemperatureBC
+    from .TemperatureBCState import TemperatureBCState
+    from .TypeBC import TypeBC
+    from .VelocityBC import VelocityBC
+    from .VelocityBCState import VelocityBCState
+    from .VelocityBaseMotionBC import VelocityBaseMotionBC
+    from .VelocityBaseMotionBCState import VelocityBaseMotionBCState
+    from ..Amplitude.CorrelationArray import CorrelationArray
+    from ..Region.RegionArray import RegionArray
 
 
 class BoundaryConditionModel(ModelBase):
@@ -119,6 +123,8 @@ class BoundaryConditionModel(ModelBase):
         bc: AccelerationBC
             An AccelerationBaseMotionBC object.
         """
+        from .AccelerationBaseMotionBC import AccelerationBaseMotionBC
+        from .AccelerationBaseMotionBCState import AccelerationBaseMotionBCState
         self.boundaryConditions[name] = boundaryCondition = AccelerationBaseMotionBC(
             name,
             createStepName,
@@ -214,6 +220,8 @@ class BoundaryConditionModel(ModelBase):
         bc: AccelerationBC
             An AccelerationBC object.
         """
+        from .AccelerationBC import AccelerationBC
+        from .AccelerationBCState import AccelerationBCState
         self.boundaryConditions[name] = boundaryCondition = AccelerationBC(
             name,
             createStepName,
@@ -285,6 +293,8 @@ class BoundaryConditionModel(ModelBase):
         bc: AcousticPressureBC
             An AcousticPressureBC object.
         """
+        from .AcousticPressureBC import AcousticPressureBC
+        from .AcousticPressureBCState import AcousticPressureBCState
         self.boundaryConditions[name] = boundaryCondition = AcousticPressureBC(
             name,
             createStepName,
@@ -321,6 +331,7 @@ class BoundaryConditionModel(ModelBase):
         calibration: Calibration
             A Calibration object.
         """
+        from .Calibration import Calibration
         self.boundaryConditions[name] = boundaryCondition = Calibration(name)
         return boundaryCondition
 
@@ -377,6 +388,8 @@ class BoundaryConditionModel(ModelBase):
         bc: ConcentrationBC
             A ConcentrationBC object.
         """
+        from .ConcentrationBC import ConcentrationBC
+        from .ConcentrationBCState import ConcentrationBCState
         self.boundaryConditions[name] = boundaryCondition = ConcentrationBC(
             name,
             createStepName,
@@ -478,6 +491,8 @@ class BoundaryConditionModel(ModelBase):
         bc: ConnAccelerationBC
             A ConnAccelerationBC object.
         """
+        from .ConnAccelerationBC import ConnAccelerationBC
+        from .ConnAccelerationBCState import ConnAccelerationBCState
         self.boundaryConditions[name] = boundaryCondition = ConnAccelerationBC(
             name,
             createStepName,
@@ -593,6 +608,8 @@ class BoundaryConditionModel(ModelBase):
         bc: ConnDisplacementBC
             A ConnDisplacementBC object.
         """
+        from .ConnDisplacementBC import ConnDisplacementBC
+        from .ConnDisplacementBCState import ConnDisplacementBCState
         self.boundaryConditions[name] = boundaryCondition = ConnDisplacementBC(
             name,
             createStepName,
@@ -701,6 +718,8 @@ class BoundaryConditionModel(ModelBase):
         bc: ConnVelocityBC
             A ConnVelocityBC object.
         """
+        from .ConnVelocityBC import ConnVelocityBC
+        from .ConnVelocityBCState import ConnVelocityBCState
         self.boundaryConditions[name] = boundaryCondition = ConnVelocityBC(
             name,
             createStepName,
@@ -774,6 +793,8 @@ class BoundaryConditionModel(ModelBase):
         bc: DisplacementBaseMotionBC
             A DisplacementBaseMotionBC object.
         """
+        from .DisplacementBaseMotionBC import DisplacementBaseMotionBC
+        from .DisplacementBaseMotionBCState import DisplacementBaseMotionBCState
         self.boundaryConditions[name] = boundaryCondition = DisplacementBaseMotionBC(
             name,
             createStepName,
@@ -882,6 +903,8 @@ class BoundaryConditionModel(ModelBase):
         bc: DisplacementBC
             A DisplacementBC object
         """
+        from .DisplacementBC import DisplacementBC
+        from .DisplacementBCState import DisplacementBCState
         self.boundaryConditions[name] = boundaryCondition = DisplacementBC(
             name,
             createStepName,
@@ -955,6 +978,8 @@ class BoundaryConditionModel(ModelBase):
         bc: ElectricPotentialBC
             An ElectricPotentialBC object.
         """
+        from .ElectricPotentialBC import ElectricPotentialBC
+        from .ElectricPotentialBCState import ElectricPotentialBCState
         self.boundaryConditions[name] = boundaryCondition = ElectricPotentialBC(
             name,
             createStepName,
@@ -1013,6 +1038,8 @@ class BoundaryConditionModel(ModelBase):
         bc: EulerianBC
             An EulerianBC object.
         """
+        from .EulerianBC import EulerianBC
+        from .EulerianBCState import EulerianBCState
         self.boundaryConditions[name] = boundaryCondition = EulerianBC(
             name, createStepName, region, definition, inflowType, outflowType
         )
@@ -1149,6 +1176,8 @@ class BoundaryConditionModel(ModelBase):
         bc: EulerianMotionBC
             An EulerianMotionBC object.
         """
+        from .EulerianMotionBC import EulerianMotionBC
+        from .EulerianMotionBCState import EulerianMotionBCState
         self.boundaryConditions[name] = boundaryCondition = EulerianMotionBC(
             name,
             createStepName,
@@ -1225,6 +1254,8 @@ class BoundaryConditionModel(ModelBase):
         bc: FluidCavityPressureBC
             A FluidCavityPressureBC object.
         """
+        from .FluidCavityPressureBC import FluidCavityPressureBC
+        from .FluidCavityPressureBCState import FluidCavityPressureBCState
         self.boundaryConditions[name] = boundaryCondition = FluidCavityPressureBC(
             name, createStepName, fluidCavity, magnitude, amplitude, fixed
         )
@@ -1293,6 +1324,7 @@ class BoundaryConditionModel(ModelBase):
         bc: MagneticVectorPotentialBC
             A MagneticVectorPotentialBC object.
         """
+        from .MagneticVectorPotentialBC import MagneticVectorPotentialBC
         self.boundaryConditions[name] = boundaryCondition = MagneticVectorPotentialBC(
             name,
             createStepName,
@@ -1359,6 +1391,8 @@ class BoundaryConditionModel(ModelBase):
         bc: MaterialFlowBC
             A MaterialFlowBC object.
         """
+        from .MaterialFlowBC import MaterialFlowBC
+        from .MaterialFlowBCState import MaterialFlowBCState
         self.boundaryConditions[name] = boundaryCondition = MaterialFlowBC(
             name,
             createStepName,
@@ -1425,6 +1459,8 @@ class BoundaryConditionModel(ModelBase):
         bc: PorePressureBC
             A PorePressureBC object.
         """
+        from .PorePressureBC import PorePressureBC
+        from .PorePressureBCState import PorePressureBCState
         self.boundaryConditions[name] = boundaryCondition = PorePressureBC(
             name,
             createStepName,
@@ -1495,6 +1531,7 @@ class BoundaryConditionModel(ModelBase):
         bc: RetainedNodalDofsBC
             A RetainedNodalDofsBC object.
         """
+        from .RetainedNodalDofsBC import RetainedNodalDofsBC
         self.boundaryConditions[name] = boundaryCondition = RetainedNodalDofsBC(
             name, createStepName, region, u1, u2, u3, ur1, ur2, ur3
         )
@@ -1530,6 +1567,8 @@ class BoundaryConditionModel(ModelBase):
         bc: SecondaryBaseBC
             A SecondaryBaseBC object.
         """
+        from .SecondaryBaseBC import SecondaryBaseBC
+        from .SecondaryBaseBCState import SecondaryBaseBCState
         self.boundaryConditions[name] = boundaryCondition = SecondaryBaseBC(
             name, createStepName, regions, dofs
         )
@@ -1621,6 +1660,8 @@ class BoundaryConditionModel(ModelBase):
         bc: SubmodelBC
             A SubmodelBC object.
         """
+        from .SubmodelBC import SubmodelBC
+        from .SubmodelBCState import SubmodelBCState
         self.boundaryConditions[name] = boundaryCondition = SubmodelBC(
             name,
             createStepName,
@@ -1696,6 +1737,8 @@ class BoundaryConditionModel(ModelBase):
         bc: TemperatureBC
             A TemperatureBC object.
         """
+        from .TemperatureBC import TemperatureBC
+        from .TemperatureBCState import TemperatureBCState
         self.boundaryConditions[name] = boundaryCondition = TemperatureBC(
             name,
             createStepName,
@@ -1765,6 +1808,8 @@ class BoundaryConditionModel(ModelBase):
         bc: VelocityBaseMotionBC
             A VelocityBaseMotionBC object.
         """
+        from .VelocityBaseMotionBC import VelocityBaseMotionBC
+        from .VelocityBaseMotionBCState import VelocityBaseMotionBCState
         self.boundaryConditions[name] = boundaryCondition = VelocityBaseMotionBC(
             name,
             createStepName,
@@ -1860,6 +1905,8 @@ class BoundaryConditionModel(ModelBase):
         bc: VelocityBC
             A VelocityBC object.
         """
+        from .VelocityBC import VelocityBC
+        from .VelocityBCState import VelocityBCState
         self.boundaryConditions[name] = boundaryCondition = VelocityBC(
             name,
             createStepName,
@@ -1917,6 +1964,7 @@ class BoundaryConditionModel(ModelBase):
         -------
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
         self.boundaryConditions[name] = boundaryCondition = TypeBC.EncastreBC(
             name,
             createStepName,
@@ -1965,6 +2013,7 @@ class BoundaryConditionModel(ModelBase):
         -------
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
         self.boundaryConditions[name] = boundaryCondition = TypeBC.PinnedBC(
             name,
             createStepName,
@@ -2013,6 +2062,7 @@ class BoundaryConditionModel(ModelBase):
         -------
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
         self.boundaryConditions[name] = boundaryCondition = TypeBC.XsymmBC(
             name,
             createStepName,
@@ -2061,6 +2111,7 @@ class BoundaryConditionModel(ModelBase):
         -------
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
         self.boundaryConditions[name] = boundaryCondition = TypeBC.YsymmBC(
             name,
             createStepName,
@@ -2109,6 +2160,7 @@ class BoundaryConditionModel(ModelBase):
         -------
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
         self.boundaryConditions[name] = boundaryCondition = TypeBC.ZsymmBC(
             name,
             createStepName,
@@ -2157,6 +2209,7 @@ class BoundaryConditionModel(ModelBase):
         -------
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
         self.boundaryConditions[name] = boundaryCondition = TypeBC.XasymmBC(
             name,
             createStepName,
@@ -2205,6 +2258,7 @@ class BoundaryConditionModel(ModelBase):
         -------
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
         self.boundaryConditions[name] = boundaryCondition = TypeBC.YasymmBC(
             name,
             createStepName,
@@ -2253,6 +2307,7 @@ class BoundaryConditionModel(ModelBase):
         -------
             A TypeBC object.
         """
+        from .TypeBC import TypeBC
         self.boundaryConditions[name] = boundaryCondition = TypeBC.ZasymmBC(
             name,
             createStepName,
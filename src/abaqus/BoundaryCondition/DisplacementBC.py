@@ -2,6 +2,7 @@ import typing
 
 from abaqusConstants import *
 from .BoundaryCondition import BoundaryCondition
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -79,13 +80,54 @@ class DisplacementBC(BoundaryCondition):
     category: SymbolicConstant = None
 
     # A Region object specifying the region to which the boundary condition is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     # None or a DatumCsys object specifying the local coordinate system of the boundary
     # condition's degrees of freedom. If *localCsys*=None, the degrees of freedom are defined
     # in the global coordinate system. The default value is None.
     localCsys: str = None
 
+    # A String specifying the name of the step in which the boundary condition is
+    # created.
+    createStepName: str = ""
+
+    # A Float, a Complex, or a SymbolicConstant specifying the displacement component in
+    # the 1-direction. Possible values for the SymbolicConstant are UNSET and SET. The
+    # default value is UNSET.Note:Although *u1*, *u2*, *u3*, *ur1*, *ur2*, and *ur3* are
+    # optional arguments, at least one of them must be specified.
+    u1: typing.Union[SymbolicConstant, float] = UNSET
+
+    # A Float, a Complex, or a SymbolicConstant specifying the displacement component in
+    # the 2-direction. Possible values for the SymbolicConstant are UNSET and SET. The
+    # default value is UNSET.
+    u2: typing.Union[SymbolicConstant, float] = UNSET
+
+    # A Float, a Complex, or a SymbolicConstant specifying the displacement component in
+    # the 3-direction. Possible values for the SymbolicConstant are UNSET and SET. The
+    # default value is UNSET.
+    u3: typing.Union[SymbolicConstant, float] = UNSET
+
+    # A Float, a Complex, or a SymbolicConstant specifying the rotational displacement
+    # component about the 1-direction. Possible values for the SymbolicConstant are
+    # UNSET and SET. The default value is UNSET.
+    ur1: typing.Union[SymbolicConstant, float] = UNSET
+
+    # A Float, a Complex, or a SymbolicConstant specifying the rotational displacement
+    # component about the 2-direction. Possible values for the SymbolicConstant are
+    # UNSET and SET. The default value is UNSET.
+    ur2: typing.Union[SymbolicConstant, float] = UNSET
+
+    # A Float, a Complex, or a SymbolicConstant specifying the rotational displacement
+    # component about the 3-direction. Possible values for the SymbolicConstant are
+    # UNSET and SET. The default value is UNSET.
+    ur3: typing.Union[SymbolicConstant, float] = UNSET
+
+    # A String or the SymbolicConstant UNSET specifying the name of the amplitude
+    # reference. UNSET should be used if the boundary condition has no amplitude
+    # reference. The default value is UNSET. You should provide the *amplitude* argument
+    # only if it is valid for the specified step.
+    amplitude: str = UNSET
+
     def __init__(
         self,
         name: str,
@@ -178,7 +220,21 @@ class DisplacementBC(BoundaryCondition):
             A DisplacementBC object.
         """
         super().__init__()
-        pass
+        self.name = name
+        self.createStepName = createStepName
+        self.region = region
+        self.fieldName = fieldName
+        self.u1 = u1
+        self.u2 = u2
+        self.u3 = u3
+        self.ur1 = ur1
+        self.ur2 = ur2
+        self.ur3 = ur3
+        self.fixed = fixed
+        self.amplitude = amplitude
+        self.distributionType = distributionType
+        self.localCsys = localCsys
+        self.buckleCase = buckleCase
 
     def setValues(
         self,
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .BoundaryCondition import BoundaryCondition
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -50,13 +51,21 @@ class TypeBC(BoundaryCondition):
     category: SymbolicConstant = None
 
     # A Region object specifying the region to which the boundary condition is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     # None or a DatumCsys object specifying the local coordinate system of the boundary
     # condition's degrees of freedom. If *localCsys*=None, the degrees of freedom are defined
     # in the global coordinate system. The default value is None.
     localCsys: str = None
     
+    # A String specifying the name of the step in which the boundary condition is
+    # created.
+    createStepName: str = ""
+
+    # A SymbolicConstant specifying the type of the boundary condition. Possible values are
+    # ENCASTRE, PINNED, XSYMM, YSYMM, ZSYMM, XASYMM, YASYMM, and ZASYMM.
+    typeName: SymbolicConstant = None
+
     def __init__(
         self,
         name: str,
@@ -104,9 +113,10 @@ class TypeBC(BoundaryCondition):
         self.buckleCase = buckleCase
         self.region = region
         self.localCsys = localCsys
+        self.createStepName = createStepName
 
+    @staticmethod
     def EncastreBC(
-        self,
         name: str,
         createStepName: str,
         region: Region,
@@ -144,10 +154,12 @@ class TypeBC(BoundaryCondition):
         -------
             A TypeBC object.
         """
-        return TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition = TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition.typeName = ENCASTRE
+        return boundaryCondition
 
+    @staticmethod
     def PinnedBC(
-        self,
         name: str,
         createStepName: str,
         region: Region,
@@ -185,10 +197,12 @@ class TypeBC(BoundaryCondition):
         -------
             A TypeBC object.
         """
-        return TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition = TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition.typeName = PINNED
+        return boundaryCondition
 
+    @staticmethod
     def XsymmBC(
-        self,
         name: str,
         createStepName: str,
         region: Region,
@@ -226,10 +240,12 @@ class TypeBC(BoundaryCondition):
         -------
             A TypeBC object.
         """
-        return TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition = TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition.typeName = XSYMM
+        return boundaryCondition
 
+    @staticmethod
     def YsymmBC(
-        self,
         name: str,
         createStepName: str,
         region: Region,
@@ -267,10 +283,12 @@ class TypeBC(BoundaryCondition):
         -------
             A TypeBC object.
         """
-        return TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition = TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition.typeName = YSYMM
+        return boundaryCondition
 
+    @staticmethod
     def ZsymmBC(
-        self,
         name: str,
         createStepName: str,
         region: Region,
@@ -308,10 +326,12 @@ class TypeBC(BoundaryCondition):
         -------
             A TypeBC object.
         """
-        return TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition = TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition.typeName = ZSYMM
+        return boundaryCondition
 
+    @staticmethod
     def XasymmBC(
-        self,
         name: str,
         createStepName: str,
         region: Region,
@@ -349,10 +369,12 @@ class TypeBC(BoundaryCondition):
         -------
             A TypeBC object.
         """
-        return TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition = TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition.typeName = XASYMM
+        return boundaryCondition
 
+    @staticmethod
     def YasymmBC(
-        self,
         name: str,
         createStepName: str,
         region: Region,
@@ -390,10 +412,12 @@ class TypeBC(BoundaryCondition):
         -------
             A TypeBC object.
         """
-        return TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition = TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition.typeName = YASYMM
+        return boundaryCondition
 
+    @staticmethod
     def ZasymmBC(
-        self,
         name: str,
         createStepName: str,
         region: Region,
@@ -431,7 +455,9 @@ class TypeBC(BoundaryCondition):
         -------
             A TypeBC object.
         """
-        return TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition = TypeBC(name, createStepName, region, buckleCase, localCsys)
+        boundaryCondition.typeName = ZASYMM
+        return boundaryCondition
 
     def setValues(
         self,
@@ -1,6 +1,12 @@
-from ..Calibration.Calibration import Calibration
+from __future__ import annotations
+
+import typing
+
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from ..Calibration.Calibration import Calibration
+
 
 class CalibrationModel(ModelBase):
     """Abaqus creates a Model object named `Model-1` when a session is started.
@@ -35,5 +41,6 @@ class CalibrationModel(ModelBase):
         -------
             A Calibration object.
         """
+        from ..Calibration.Calibration import Calibration
         self.calibrations[name] = calibration = Calibration(name)
         return calibration
@@ -1,6 +1,7 @@
 from .Displayable import Displayable
 from ..DisplayOptions.AssemblyDisplayOptions import AssemblyDisplayOptions
 from ..DisplayOptions.PartDisplayOptions import PartDisplayOptions
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..OdbDisplay.OdbDisplay import OdbDisplay
 from ..UtilityAndView.View import View
 
@@ -36,19 +37,19 @@ class Layer:
     # A Displayable object specifying the object to be displayed. The Displayable type is an
     # abstract generalization. The concrete possible types are Part, Assembly,
     # ConstrainedSketch, Odb, or XYPlot.
-    displayedObject: Displayable = Displayable()
+    displayedObject: Displayable = lazyDefault(Displayable)
 
     # A View object specifying the object that controls viewing of the layer.
     view: View = None
 
     # An OdbDisplay object specifying the display options for the Odb object.
-    odbDisplay: OdbDisplay = OdbDisplay()
+    odbDisplay: OdbDisplay = lazyDefault(OdbDisplay)
 
     # A PartDisplayOptions object specifying the display options for the Part object.
-    partDisplay: PartDisplayOptions = PartDisplayOptions()
+    partDisplay: PartDisplayOptions = lazyDefault(PartDisplayOptions)
 
     # An AssemblyDisplayOptions object specifying the display options for the Assembly object.
-    assemblyDisplay: AssemblyDisplayOptions = AssemblyDisplayOptions()
+    assemblyDisplay: AssemblyDisplayOptions = lazyDefault(AssemblyDisplayOptions)
 
     def __init__(self, name: str, copyViewName: str = ""):
         """This method creates a Layer object in the Layer repository.
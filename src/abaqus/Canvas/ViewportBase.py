@@ -13,6 +13,7 @@ from ..DisplayOptions.AssemblyDisplayOptions import AssemblyDisplayOptions
 from ..DisplayOptions.LightOptions import LightOptions
 from ..DisplayOptions.PartDisplayOptions import PartDisplayOptions
 from ..DisplayOptions.ViewportAnnotationOptions import ViewportAnnotationOptions
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..OdbDisplay.OdbDisplay import OdbDisplay
 from ..PlotOptions.DetailPlotOptions import DetailPlotOptions
 from ..UtilityAndView.View import View
@@ -361,7 +362,9 @@ class ViewportBase:
     #     "initialColor"
     #     "Layup"
     #     "Ply"
-    colorMappings: dict[str, AttributeColorMap] = dict[str, AttributeColorMap]()
+    colorMappings: dict[str, AttributeColorMap] = lazyDefault(
+        dict[str, AttributeColorMap]
+    )
 
     # A String specifying the color that will be applied to all objects in the viewport at the
     # start of color coding. The possible values are 'As is', 'Default' or a string with a
@@ -377,32 +380,34 @@ class ViewportBase:
     # abstract generalization. The concrete possible types are Part, Assembly,
     # ConstrainedSketch, Odb, PlyStackPlot, or XYPlot. If *displayedObject*=None, Abaqus
     # displays an empty viewport.
-    displayedObject: Displayable = Displayable()
+    displayedObject: Displayable = lazyDefault(Displayable)
 
     # A repository of Layer objects specifying the key to the repository is a String with the
     # name of the layer.
-    layers: dict[str, Layer] = dict[str, Layer]()
+    layers: dict[str, Layer] = lazyDefault(dict[str, Layer])
 
     # A View object specifying the object that controls viewing of the viewport content.
     view: View = None
 
     # An OdbDisplay object specifying the display options for the Odb object.
-    odbDisplay: OdbDisplay = OdbDisplay()
+    odbDisplay: OdbDisplay = lazyDefault(OdbDisplay)
 
     # A PartDisplayOptions object specifying the display options for the Part object.
-    partDisplay: PartDisplayOptions = PartDisplayOptions()
+    partDisplay: PartDisplayOptions = lazyDefault(PartDisplayOptions)
 
     # An AssemblyDisplayOptions object specifying the display options for the Assembly object.
-    assemblyDisplay: AssemblyDisplayOptions = AssemblyDisplayOptions()
+    assemblyDisplay: AssemblyDisplayOptions = lazyDefault(AssemblyDisplayOptions)
 
     # A ViewportAnnotationOptions object.
-    viewportAnnotationOptions: ViewportAnnotationOptions = ViewportAnnotationOptions()
+    viewportAnnotationOptions: ViewportAnnotationOptions = lazyDefault(
+        ViewportAnnotationOptions
+    )
 
     # A DetailPlotOptions object.
-    detailPlotOptions: DetailPlotOptions = DetailPlotOptions()
+    detailPlotOptions: DetailPlotOptions = lazyDefault(DetailPlotOptions)
 
     # An AnnotationsToPlotArray object.
-    annotationsToPlot: AnnotationsToPlotArray = AnnotationsToPlotArray()
+    annotationsToPlot: AnnotationsToPlotArray = lazyDefault(AnnotationsToPlotArray)
 
     # A tuple of Strings specifying the names of layers that will be displayed in the viewport
     # when *displayMode* = OVERLAY.
@@ -420,16 +425,16 @@ class ViewportBase:
     iconOrigin: tuple[float] = ()
 
     # A LightOptions object.
-    lightOptions: LightOptions = LightOptions()
+    lightOptions: LightOptions = lazyDefault(LightOptions)
 
     # An ImageOptions object.
-    imageOptions: ImageOptions = ImageOptions()
+    imageOptions: ImageOptions = lazyDefault(ImageOptions)
 
     # A MovieOptions object.
-    movieOptions: MovieOptions = MovieOptions()
+    movieOptions: MovieOptions = lazyDefault(MovieOptions)
 
     # An AnimationController object.
-    animationController: AnimationController = AnimationController()
+    animationController: AnimationController = lazyDefault(AnimationController)
 
     # A tuple of Strings specifying keys to the session.drawings repository. The default value
     # is an empty sequence.
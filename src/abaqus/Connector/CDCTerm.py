@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .ConnectorOptions import ConnectorOptions
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class CDCTerm:
@@ -32,7 +33,7 @@ class CDCTerm:
 
     # A ConnectorOptions object specifying the ConnectorOptions used to define tabular options
     # for this ConnectorBehaviorOption.
-    options: ConnectorOptions = ConnectorOptions()
+    options: ConnectorOptions = lazyDefault(ConnectorOptions)
 
     def __init__(
         self,
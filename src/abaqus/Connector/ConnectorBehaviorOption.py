@@ -3,6 +3,7 @@ from .ConnectorOptions import ConnectorOptions
 from .ConnectorPotentialArray import ConnectorPotentialArray
 
 from .TangentialBehavior import TangentialBehavior
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 # Prevent circular import
@@ -52,32 +53,32 @@ class ConnectorBehaviorOption:
     """
 
     # A ConnectorPotentialArray object.
-    connectorPotentials: ConnectorPotentialArray = ConnectorPotentialArray()
+    connectorPotentials: ConnectorPotentialArray = lazyDefault(ConnectorPotentialArray)
 
     # A DerivedComponent object.
-    derivedComponent: DerivedComponent = DerivedComponent()
+    derivedComponent: DerivedComponent = lazyDefault(DerivedComponent)
 
     # A ConnectorPotentialArray object.
-    evolutionPotentials: ConnectorPotentialArray = ConnectorPotentialArray()
+    evolutionPotentials: ConnectorPotentialArray = lazyDefault(ConnectorPotentialArray)
 
     # A ConnectorPotentialArray object.
-    initiationPotentials: ConnectorPotentialArray = ConnectorPotentialArray()
+    initiationPotentials: ConnectorPotentialArray = lazyDefault(ConnectorPotentialArray)
 
     # A ConnectorOptions object.
-    initiationOptions: ConnectorOptions = ConnectorOptions()
+    initiationOptions: ConnectorOptions = lazyDefault(ConnectorOptions)
 
     # A ConnectorOptions object.
-    isotropicOptions: ConnectorOptions = ConnectorOptions()
+    isotropicOptions: ConnectorOptions = lazyDefault(ConnectorOptions)
 
     # A ConnectorOptions object.
-    kinematicOptions: ConnectorOptions = ConnectorOptions()
+    kinematicOptions: ConnectorOptions = lazyDefault(ConnectorOptions)
 
     # A ConnectorOptions object specifying the ConnectorOptions used to define tabular options
     # for this ConnectorBehaviorOption.
-    options: ConnectorOptions = ConnectorOptions()
+    options: ConnectorOptions = lazyDefault(ConnectorOptions)
 
     # A TangentialBehavior object
-    tangentialBehavior: TangentialBehavior = TangentialBehavior()
+    tangentialBehavior: TangentialBehavior = lazyDefault(TangentialBehavior)
 
     def TangentialBehavior(
         self,
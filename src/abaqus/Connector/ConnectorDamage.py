@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .ConnectorBehaviorOption import ConnectorBehaviorOption
 from .ConnectorOptions import ConnectorOptions
 from .ConnectorPotentialArray import ConnectorPotentialArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class ConnectorDamage(ConnectorBehaviorOption):
@@ -99,11 +100,11 @@ class ConnectorDamage(ConnectorBehaviorOption):
 
     # A ConnectorOptions object specifying the ConnectorOptions used to define tabular options
     # for the damage initiation table.
-    initiationOptions: ConnectorOptions = ConnectorOptions()
+    initiationOptions: ConnectorOptions = lazyDefault(ConnectorOptions)
 
     # A ConnectorOptions object specifying the ConnectorOptions used to define tabular options
     # for the damage evolution table.
-    evolutionOptions: ConnectorOptions = ConnectorOptions()
+    evolutionOptions: ConnectorOptions = lazyDefault(ConnectorOptions)
 
     def __init__(
         self,
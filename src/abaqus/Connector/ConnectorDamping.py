@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .ConnectorBehaviorOption import ConnectorBehaviorOption
 from .ConnectorOptions import ConnectorOptions
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class ConnectorDamping(ConnectorBehaviorOption):
@@ -72,7 +73,7 @@ class ConnectorDamping(ConnectorBehaviorOption):
 
     # A ConnectorOptions object specifying the ConnectorOptions used to define tabular options
     # for this ConnectorBehaviorOption.
-    options: ConnectorOptions = ConnectorOptions()
+    options: ConnectorOptions = lazyDefault(ConnectorOptions)
 
     def __init__(
         self,
@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .ConnectorBehaviorOption import ConnectorBehaviorOption
 from .ConnectorOptions import ConnectorOptions
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class ConnectorElasticity(ConnectorBehaviorOption):
@@ -67,7 +68,7 @@ class ConnectorElasticity(ConnectorBehaviorOption):
 
     # A ConnectorOptions object specifying the ConnectorOptions used to define tabular options
     # for this ConnectorBehaviorOption.
-    options: ConnectorOptions = ConnectorOptions()
+    options: ConnectorOptions = lazyDefault(ConnectorOptions)
 
     def __init__(
         self,
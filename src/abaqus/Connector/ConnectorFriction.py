@@ -4,6 +4,7 @@ from .ConnectorOptions import ConnectorOptions
 from .ConnectorPotentialArray import ConnectorPotentialArray
 from .DerivedComponent import DerivedComponent
 from .TangentialBehavior import TangentialBehavior
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class ConnectorFriction(ConnectorBehaviorOption):
@@ -42,17 +43,17 @@ class ConnectorFriction(ConnectorBehaviorOption):
     """
 
     # A TangentialBehavior object.
-    tangentialBehavior: TangentialBehavior = TangentialBehavior()
+    tangentialBehavior: TangentialBehavior = lazyDefault(TangentialBehavior)
 
     # A DerivedComponent object specifying the DerivedComponent used to compute the contact
     # force component direction. This argument applies only if
     # *frictionModel*=USER_CUSTOMIZED, if *useContactForceComponent*=ON, and if
     # *contactForceStyle*=DERIVED_COMPONENT.
-    derivedComponent: DerivedComponent = DerivedComponent()
+    derivedComponent: DerivedComponent = lazyDefault(DerivedComponent)
 
     # A ConnectorOptions object specifying the ConnectorOptions used to define tabular options
     # for this ConnectorBehaviorOption.
-    options: ConnectorOptions = ConnectorOptions()
+    options: ConnectorOptions = lazyDefault(ConnectorOptions)
 
     def __init__(
         self,
@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .ConnectorBehaviorOption import ConnectorBehaviorOption
 from .ConnectorOptions import ConnectorOptions
 from .ConnectorPotentialArray import ConnectorPotentialArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class ConnectorPlasticity(ConnectorBehaviorOption):
@@ -82,11 +83,11 @@ class ConnectorPlasticity(ConnectorBehaviorOption):
 
     # A ConnectorOptions object specifying the ConnectorOptions used to define tabular options
     # for the isotropic hardening table.
-    isotropicOptions: ConnectorOptions = ConnectorOptions()
+    isotropicOptions: ConnectorOptions = lazyDefault(ConnectorOptions)
 
     # A ConnectorOptions object specifying the ConnectorOptions used to define tabular options
     # for the kinematic hardening table.
-    kinematicOptions: ConnectorOptions = ConnectorOptions()
+    kinematicOptions: ConnectorOptions = lazyDefault(ConnectorOptions)
 
     def __init__(
         self,
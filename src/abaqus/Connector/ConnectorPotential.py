@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .DerivedComponent import DerivedComponent
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class ConnectorPotential:
@@ -40,7 +41,7 @@ class ConnectorPotential:
 
     # A DerivedComponent object specifying the DerivedComponent used in the contribution. This
     # argument is applicable only if *componentStyle*=DERIVED_COMPONENT.
-    derivedComponent: DerivedComponent = DerivedComponent()
+    derivedComponent: DerivedComponent = lazyDefault(DerivedComponent)
 
     def __init__(
         self,
@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .CDCTerm import CDCTerm
 from .CDCTermArray import CDCTermArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class DerivedComponent:
@@ -36,7 +37,7 @@ class DerivedComponent:
     """
 
     # A CDCTermArray object.
-    cdcTerms: CDCTermArray = CDCTermArray()
+    cdcTerms: CDCTermArray = lazyDefault(CDCTermArray)
 
     def __init__(self):
         """This method creates a DerivedComponent object.
@@ -1,19 +1,23 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .AdjustPoints import AdjustPoints
-from .Coupling import Coupling
-from .DisplayBody import DisplayBody
-from .EmbeddedRegion import EmbeddedRegion
-from .Equation import Equation
-from .MultipointConstraint import MultipointConstraint
-from .RigidBody import RigidBody
-from .ShellSolidCoupling import ShellSolidCoupling
-from .Tie import Tie
-from ..Assembly.PartInstance import PartInstance
-from ..BasicGeometry.ModelDotArray import ModelDotArray
 from ..Model.ModelBase import ModelBase
-from ..Region.Region import Region
+
+if typing.TYPE_CHECKING:
+    from .AdjustPoints import AdjustPoints
+    from .Coupling import Coupling
+    from .DisplayBody import DisplayBody
+    from .EmbeddedRegion import EmbeddedRegion
+    from .Equation import Equation
+    from .MultipointConstraint import MultipointConstraint
+    from .RigidBody import RigidBody
+    from .ShellSolidCoupling import ShellSolidCoupling
+    from .Tie import Tie
+    from ..Assembly.PartInstance import PartInstance
+    from ..BasicGeometry.ModelDotArray import ModelDotArray
+    from ..Region.Region import Region
 
 
 class ConstraintModel(ModelBase):
@@ -55,6 +59,7 @@ class ConstraintModel(ModelBase):
         -------
             An AdjustPoints object.
         """
+        from .AdjustPoints import AdjustPoints
         self.constraints[name] = constraint = AdjustPoints(name, surface, controlPoints)
         return constraint
 
@@ -140,6 +145,7 @@ class ConstraintModel(ModelBase):
         -------
             A Coupling object.
         """
+        from .Coupling import Coupling
         self.constraints[name] = constraint = Coupling(
             name,
             surface,
@@ -188,6 +194,7 @@ class ConstraintModel(ModelBase):
         -------
             A DisplayBody object.
         """
+        from .DisplayBody import DisplayBody
         self.constraints[name] = constraint = DisplayBody(name, instance, controlPoints)
         return constraint
 
@@ -243,6 +250,7 @@ class ConstraintModel(ModelBase):
         -------
             An EmbeddedRegion object.
         """
+        from .EmbeddedRegion import EmbeddedRegion
         self.constraints[name] = constraint = EmbeddedRegion(
             name,
             embeddedRegion,
@@ -282,6 +290,7 @@ class ConstraintModel(ModelBase):
             - If *terms* does not contain more than one entry:
               Equation must have two or more terms.
         """
+        from .Equation import Equation
         self.constraints[name] = constraint = Equation(name, terms)
         return constraint
 
@@ -335,6 +344,7 @@ class ConstraintModel(ModelBase):
         -------
             A MultipointConstraint object.
         """
+        from .MultipointConstraint import MultipointConstraint
         self.constraints[name] = constraint = MultipointConstraint(
             name, surface, controlPoint, mpcType, csys, userType, userMode
         )
@@ -390,6 +400,7 @@ class ConstraintModel(ModelBase):
         -------
             A RigidBody object.
         """
+        from .RigidBody import RigidBody
         self.constraints[name] = constraint = RigidBody(
             name,
             refPointRegion,
@@ -449,6 +460,7 @@ class ConstraintModel(ModelBase):
         -------
             A ShellSolidCoupling object.
         """
+        from .ShellSolidCoupling import ShellSolidCoupling
         self.constraints[name] = constraint = ShellSolidCoupling(
             name,
             shellEdge,
@@ -523,6 +535,7 @@ class ConstraintModel(ModelBase):
         -------
             A Tie object.
         """
+        from .Tie import Tie
         self.constraints[name] = constraint = Tie(
             name,
             main,
@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .Datum import Datum
 from .DatumAxis import DatumAxis
 from .DatumPoint import DatumPoint
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class DatumCsys(Datum):
@@ -49,16 +50,16 @@ class DatumCsys(Datum):
     coordSysType: SymbolicConstant = None
 
     # A DatumPoint object specifying the origin of the coordinate system.
-    origin: DatumPoint = DatumPoint()
+    origin: DatumPoint = lazyDefault(DatumPoint)
 
     # A DatumAxis object specifying the 1-direction of the coordinate system.
-    axis1: DatumAxis = DatumAxis()
+    axis1: DatumAxis = lazyDefault(DatumAxis)
 
     # A DatumAxis object specifying the 2-direction of the coordinate system.
-    axis2: DatumAxis = DatumAxis()
+    axis2: DatumAxis = lazyDefault(DatumAxis)
 
     # A DatumAxis object specifying the 3-direction of the coordinate system.
-    axis3: DatumAxis = DatumAxis()
+    axis3: DatumAxis = lazyDefault(DatumAxis)
 
     def globalToLocal(
         self, coordinates: tuple[float, float, float]
@@ -1,4 +1,5 @@
 from abaqusConstants import *
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..PlotOptions.OdbDisplayOptions import OdbDisplayOptions
 
 
@@ -54,7 +55,7 @@ class DisplayGroupInstance:
     # An OdbDisplayOptions object specifying this member is available only for
     # DisplayGroupInstance objects that are members of the DisplayGroupInstance repository
     # member of the OdbDisplay object.
-    odbDisplayOptions: OdbDisplayOptions = OdbDisplayOptions()
+    odbDisplayOptions: OdbDisplayOptions = lazyDefault(OdbDisplayOptions)
 
     def nodes(self):
         """This method is used to obtain the list of nodes present in the DisplayGroupInstance
@@ -1,7 +1,13 @@
-from .DisplayGroup import DisplayGroup
-from .Leaf import Leaf
+from __future__ import annotations
+
+import typing
+
 from ..Session.SessionBase import SessionBase
 
+if typing.TYPE_CHECKING:
+    from .DisplayGroup import DisplayGroup
+    from .Leaf import Leaf
+
 
 class DisplayGroupSession(SessionBase):
     def DisplayGroup(self, name: str, leaf: Leaf) -> DisplayGroup:
@@ -26,5 +32,6 @@ class DisplayGroupSession(SessionBase):
         -------
             A DisplayGroup object.
         """
+        from .DisplayGroup import DisplayGroup
         self.displayGroups[name] = displayGroup = DisplayGroup(name, leaf)
         return displayGroup
@@ -14,6 +14,7 @@ from .SymbolDisplayOptions import SymbolDisplayOptions
 from ..DisplayGroup.DisplayGroup import DisplayGroup
 from ..DisplayGroup.DisplayGroupInstance import DisplayGroupInstance
 from ..DisplayGroup.Leaf import Leaf
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class AssemblyDisplayOptions:
@@ -179,57 +180,63 @@ class AssemblyDisplayOptions:
     renderStyle: SymbolicConstant = WIREFRAME
 
     # A BCDisplayOptions object.
-    bcOptions: BCDisplayOptions = BCDisplayOptions()
+    bcOptions: BCDisplayOptions = lazyDefault(BCDisplayOptions)
 
     # A ConstraintDisplayOptions object.
-    constraintOptions: ConstraintDisplayOptions = ConstraintDisplayOptions()
+    constraintOptions: ConstraintDisplayOptions = lazyDefault(ConstraintDisplayOptions)
 
     # A DisplayGroup object specifying the current display group and referring to an object in
     # the *displayGroups* member of Session.
-    displayGroup: DisplayGroup = DisplayGroup("dg", Leaf(EMPTY_LEAF))
+    displayGroup: DisplayGroup = lazyDefault(
+        lambda: DisplayGroup("dg", Leaf(EMPTY_LEAF))
+    )
 
     # A repository of DisplayGroupInstance objects.
-    displayGroupInstances: dict[str, DisplayGroupInstance] = dict[
-        str, DisplayGroupInstance
-    ]()
+    displayGroupInstances: dict[str, DisplayGroupInstance] = lazyDefault(
+        dict[str, DisplayGroupInstance]
+    )
 
     # An EngineeringFeatureDisplayOptions object.
-    engineeringFeatureOptions: EngineeringFeatureDisplayOptions = (
-        EngineeringFeatureDisplayOptions()
+    engineeringFeatureOptions: EngineeringFeatureDisplayOptions = lazyDefault(
+        EngineeringFeatureDisplayOptions
     )
 
     # A PredefinedFieldDisplayOptions object.
-    predefinedFieldOptions: PredefinedFieldDisplayOptions = (
-        PredefinedFieldDisplayOptions()
+    predefinedFieldOptions: PredefinedFieldDisplayOptions = lazyDefault(
+        PredefinedFieldDisplayOptions
     )
 
     # A GeometricRestrictionDisplayOptions object.
-    geometricRestrictionOptions: GeometricRestrictionDisplayOptions = (
-        GeometricRestrictionDisplayOptions()
+    geometricRestrictionOptions: GeometricRestrictionDisplayOptions = lazyDefault(
+        GeometricRestrictionDisplayOptions
     )
 
     # A GeometryDisplayOptions object.
-    geometryOptions: GeometryDisplayOptions = GeometryDisplayOptions()
+    geometryOptions: GeometryDisplayOptions = lazyDefault(GeometryDisplayOptions)
 
     # An InteractionDisplayOptions object.
-    interactionOptions: InteractionDisplayOptions = InteractionDisplayOptions()
+    interactionOptions: InteractionDisplayOptions = lazyDefault(
+        InteractionDisplayOptions
+    )
 
     # A LoadDisplayOptions object.
-    loadOptions: LoadDisplayOptions = LoadDisplayOptions()
+    loadOptions: LoadDisplayOptions = lazyDefault(LoadDisplayOptions)
 
     # A MeshDisplayOptions object.
-    meshOptions: MeshDisplayOptions = MeshDisplayOptions()
+    meshOptions: MeshDisplayOptions = lazyDefault(MeshDisplayOptions)
 
     # An OptimizationTaskDisplayOptions object.
-    optimizationTaskOptions: OptimizationTaskDisplayOptions = (
-        OptimizationTaskDisplayOptions()
+    optimizationTaskOptions: OptimizationTaskDisplayOptions = lazyDefault(
+        OptimizationTaskDisplayOptions
     )
 
     # A StopConditionDisplayOptions object.
-    stopConditionOptions: StopConditionDisplayOptions = StopConditionDisplayOptions()
+    stopConditionOptions: StopConditionDisplayOptions = lazyDefault(
+        StopConditionDisplayOptions
+    )
 
     # A SymbolDisplayOptions object.
-    symbolOptions: SymbolDisplayOptions = SymbolDisplayOptions()
+    symbolOptions: SymbolDisplayOptions = lazyDefault(SymbolDisplayOptions)
 
     # A tuple of Strings specifying the names of the part instances that are visible in the
     # viewport. The default value is an empty sequence.
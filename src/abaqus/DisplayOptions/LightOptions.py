@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .LightArray import LightArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class LightOptions:
@@ -92,7 +93,7 @@ class LightOptions:
     materialShininess: float = 105
 
     # A LightArray object of length 8.
-    lights: LightArray = LightArray()
+    lights: LightArray = lazyDefault(LightArray)
 
     # A String specifying the light applied evenly to the entire scene independent of any
     # individual light. The initial value is 20% gray. A list of valid color strings is in the
@@ -5,6 +5,7 @@ from .MeshDisplayOptions import MeshDisplayOptions
 from ..DisplayGroup.DisplayGroup import DisplayGroup
 from ..DisplayGroup.DisplayGroupInstance import DisplayGroupInstance
 from ..DisplayGroup.Leaf import Leaf
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class PartDisplayOptions:
@@ -69,23 +70,25 @@ class PartDisplayOptions:
 
     # A DisplayGroup object specifying the current display group and referring to an object in
     # the *displayGroups* member of Session.
-    displayGroup: DisplayGroup = DisplayGroup("dg", Leaf(EMPTY_LEAF))
+    displayGroup: DisplayGroup = lazyDefault(
+        lambda: DisplayGroup("dg", Leaf(EMPTY_LEAF))
+    )
 
     # A repository of DisplayGroupInstance objects.
-    displayGroupInstances: dict[str, DisplayGroupInstance] = dict[
-        str, DisplayGroupInstance
-    ]()
+    displayGroupInstances: dict[str, DisplayGroupInstance] = lazyDefault(
+        dict[str, DisplayGroupInstance]
+    )
 
     # An EngineeringFeatureDisplayOptions object.
-    engineeringFeatureOptions: EngineeringFeatureDisplayOptions = (
-        EngineeringFeatureDisplayOptions()
+    engineeringFeatureOptions: EngineeringFeatureDisplayOptions = lazyDefault(
+        EngineeringFeatureDisplayOptions
     )
 
     # A GeometryDisplayOptions object.
-    geometryOptions: GeometryDisplayOptions = GeometryDisplayOptions()
+    geometryOptions: GeometryDisplayOptions = lazyDefault(GeometryDisplayOptions)
 
     # A MeshDisplayOptions object.
-    meshOptions: MeshDisplayOptions = MeshDisplayOptions()
+    meshOptions: MeshDisplayOptions = lazyDefault(MeshDisplayOptions)
 
     def setValues(
         self,
@@ -2,6 +2,7 @@ from .Crack import Crack
 from .Fastener import Fastener
 from .Inertia import Inertia
 from .SpringDashpot import SpringDashpot
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -34,16 +35,16 @@ class EngineeringFeatureBase:
     """
 
     # A repository of Inertia objects.
-    inertias: dict[str, Inertia] = dict[str, Inertia]()
+    inertias: dict[str, Inertia] = lazyDefault(dict[str, Inertia])
 
     # A repository of Crack objects.
-    cracks: dict[str, Crack] = dict[str, Crack]()
+    cracks: dict[str, Crack] = lazyDefault(dict[str, Crack])
 
     # A repository of Fastener objects.
-    fasteners: dict[str, Fastener] = dict[str, Fastener]()
+    fasteners: dict[str, Fastener] = lazyDefault(dict[str, Fastener])
 
     # A repository of SpringDashpot objects.
-    springDashpots: dict[str, SpringDashpot] = dict[str, SpringDashpot]()
+    springDashpots: dict[str, SpringDashpot] = lazyDefault(dict[str, SpringDashpot])
 
     def assignSeam(self, regions: tuple[Region]):
         """This method creates a seam crack along an edge or a face.
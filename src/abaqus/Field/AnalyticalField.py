@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .Field import Field
 from .OdbMeshRegionData import OdbMeshRegionData
 from ..Datum.DatumCsys import DatumCsys
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class AnalyticalField(Field):
@@ -40,13 +41,13 @@ class AnalyticalField(Field):
     # None or a DatumCsys object specifying the local coordinate system of the field. If
     # *localCsys*=None, the field is defined in the global coordinate system. The default
     # value is None.
-    localCsys: DatumCsys = DatumCsys()
+    localCsys: DatumCsys = lazyDefault(DatumCsys)
 
     # A String specifying the description of the field. The default value is an empty string.
     description: str = ""
 
     # An OdbMeshRegionData object.
-    odbMeshRegionData: OdbMeshRegionData = OdbMeshRegionData("", "")
+    odbMeshRegionData: OdbMeshRegionData = lazyDefault(OdbMeshRegionData, "", "")
 
     def OdbMeshRegionData(
         self,
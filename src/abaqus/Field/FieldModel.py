@@ -1,10 +1,16 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .DataTableArray import DataTableArray
-from .DiscreteField import DiscreteField
-from .ExpressionField import ExpressionField
-from .MappedField import MappedField
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from .DataTableArray import DataTableArray
+    from .DiscreteField import DiscreteField
+    from .ExpressionField import ExpressionField
+    from .MappedField import MappedField
+
 
 class FieldModel(ModelBase):
     def DiscreteField(
@@ -63,6 +69,7 @@ class FieldModel(ModelBase):
         ------
             AbaqusException.
         """
+        from .DiscreteField import DiscreteField
         self.discreteFields[name] = discreteField = DiscreteField(
             name,
             defaultValues,
@@ -111,6 +118,7 @@ class FieldModel(ModelBase):
         ------
             TextException.
         """
+        from .ExpressionField import ExpressionField
         self.analyticalFields[name] = expressionField = ExpressionField(
             name, expression, localCsys, description
         )
@@ -224,6 +232,7 @@ class FieldModel(ModelBase):
         ------
             AbaqusException.
         """
+        from .MappedField import MappedField
         self.analyticalFields[name] = mappedField = MappedField(
             name,
             regionType,
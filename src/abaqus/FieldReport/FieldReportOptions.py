@@ -1,4 +1,5 @@
 from abaqusConstants import *
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Session.NumberFormat import NumberFormat
 
 
@@ -26,7 +27,7 @@ class FieldReportOptions:
     """
 
     # Format of the number
-    numberFormat: NumberFormat = NumberFormat()
+    numberFormat: NumberFormat = lazyDefault(NumberFormat)
 
     def setValues(
         self,
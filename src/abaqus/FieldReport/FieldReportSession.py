@@ -1,8 +1,14 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from ..DisplayGroup.DisplayGroup import DisplayGroup
-from ..Odb.Odb import Odb
 from ..Session.SessionBase import SessionBase
 
+if typing.TYPE_CHECKING:
+    from ..DisplayGroup.DisplayGroup import DisplayGroup
+    from ..Odb.Odb import Odb
+
 
 class FieldReportSession(SessionBase):
     def writeFieldRepor(
@@ -1,10 +1,16 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .ButterworthFilter import ButterworthFilter
-from .Chebyshev1Filter import Chebyshev1Filter
-from .Chebyshev2Filter import Chebyshev2Filter
-from .OperatorFilter import OperatorFilter
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from .ButterworthFilter import ButterworthFilter
+    from .Chebyshev1Filter import Chebyshev1Filter
+    from .Chebyshev2Filter import Chebyshev2Filter
+    from .OperatorFilter import OperatorFilter
+
 
 class FilterModel(ModelBase):
     """Abaqus creates a Model object named `Model-1` when a session is started.
@@ -75,6 +81,7 @@ class FilterModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .ButterworthFilter import ButterworthFilter
         self.filters[name] = butterworthFilter = ButterworthFilter(
             name, cutoffFrequency, order, operation, halt, limit, invariant
         )
@@ -140,6 +147,7 @@ class FilterModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .Chebyshev1Filter import Chebyshev1Filter
         self.filters[name] = chebyshev1Filter = Chebyshev1Filter(
             name,
             cutoffFrequency,
@@ -212,6 +220,7 @@ class FilterModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .Chebyshev2Filter import Chebyshev2Filter
         self.filters[name] = chebyshev2Filter = Chebyshev2Filter(
             name,
             cutoffFrequency,
@@ -280,6 +289,7 @@ class FilterModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .OperatorFilter import OperatorFilter
         self.filters[name] = operatorFilter = OperatorFilter(
             name, cutoffFrequency, order, operation, halt, limit, invariant
         )
@@ -1,10 +1,16 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .ButterworthFilter import ButterworthFilter
-from .Chebyshev1Filter import Chebyshev1Filter
-from .Chebyshev2Filter import Chebyshev2Filter
-from .OperatorFilter import OperatorFilter
 from ..Odb.OdbBase import OdbBase
 
+if typing.TYPE_CHECKING:
+    from .ButterworthFilter import ButterworthFilter
+    from .Chebyshev1Filter import Chebyshev1Filter
+    from .Chebyshev2Filter import Chebyshev2Filter
+    from .OperatorFilter import OperatorFilter
+
 
 class FilterOdb(OdbBase):
     """The Odb object is the in-memory representation of an output database (ODB) file.
@@ -76,6 +82,7 @@ class FilterOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .ButterworthFilter import ButterworthFilter
         self.filters[name] = butterworthFilter = ButterworthFilter(
             name, cutoffFrequency, order, operation, halt, limit, invariant
         )
@@ -141,6 +148,7 @@ class FilterOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .Chebyshev1Filter import Chebyshev1Filter
         self.filters[name] = chebyshev1Filter = Chebyshev1Filter(
             name,
             cutoffFrequency,
@@ -213,6 +221,7 @@ class FilterOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .Chebyshev2Filter import Chebyshev2Filter
         self.filters[name] = chebyshev2Filter = Chebyshev2Filter(
             name,
             cutoffFrequency,
@@ -281,6 +290,7 @@ class FilterOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .OperatorFilter import OperatorFilter
         self.filters[name] = operatorFilter = OperatorFilter(
             name, cutoffFrequency, order, operation, halt, limit, invariant
         )
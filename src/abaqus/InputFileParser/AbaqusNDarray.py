@@ -1,4 +1,7 @@
-class AbaqusNDarray:
+import numpy
+
+
+class AbaqusNDarray(numpy.ndarray):
     """The AbaqusNDarray object is a sequence object derived from numpy.ndarray and is used to
     store numeric keyword data from an Abaqus input file. This object is similar to the
     numpy.ndarray object, but the numeric elements are returned as standard Python objects,
@@ -10,10 +13,72 @@ class AbaqusNDarray:
     In the last of these cases, the member *colZeroIsInt* will be True; in the other two
     cases, it will be False.
 
+    Attributes
+    ----------
+    colZeroIsInt: bool
+        A Boolean specifying whether the elements of the first column are ints while the array
+        stores floats.
+
     Notes
     -----
     This object can be accessed by:
 
+    .. code-block:: python
+
+        import inpParser
+        keywords = inpParser.InputFile('Job-1.inp').parse(usePyArray=True)
+        keywords[0].data
+
     """
 
-    pass
+    # A Boolean specifying whether the elements of the first column are ints while the array
+    # stores floats.
+    colZeroIsInt: bool = False
+
+    def __new__(cls, data, colZeroIsInt: bool = False):
+        array = numpy.asarray(data).view(cls)
+        array.colZeroIsInt = colZeroIsInt
+        return array
+
+    def __array_finalize__(self, obj):
+        # Views with another shape, e.g., a column, do not start with the int column
+        if obj is not None and getattr(obj, "shape", None) == self.shape:
+            self.colZeroIsInt = getattr(obj, "colZeroIsInt", False)
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, numpy.ndarray):
+            if value.ndim == 0:
+                return self._item(value.item(), key)
+            # A row keeps the int element in front
+            value.colZeroIsInt = (
+                self.colZeroIsInt and self.ndim == 2 and value.ndim == 1 and isinstance(key, (int, numpy.integer))
+            )
+            return value
+        return self._item(value.item(), key)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def _item(self, value, key):
+        if self.colZeroIsInt:
+            if self.ndim == 1:
+                column = key
+            elif isinstance(key, tuple) and len(key) == 2:
+                column = key[1]
+            else:
+                column = None
+            if isinstance(column, (int, numpy.integer)) and column % self.shape[-1] == 0:
+                return int(value)
+        return value
+
+    def tolist(self):
+        values = super().tolist()
+        if self.colZeroIsInt and values:
+            if self.ndim == 1:
+                values[0] = int(values[0])
+            elif self.ndim == 2:
+                for row in values:
+                    row[0] = int(row[0])
+        return values
@@ -1,4 +1,13 @@
+import os
+import typing
+
 from abaqusConstants import *
+from .Keyword import Keyword
+from .KeywordIndex import KeywordIndex
+from .KeywordSequence import KeywordSequence
+
+if typing.TYPE_CHECKING:
+    from .InputFileTemplate import InputFileTemplate
 
 
 class InputFile:
@@ -64,7 +73,10 @@ class InputFile:
         -------
             An InputFile object.
         """
-        pass
+        self.file = file
+        self.directory = directory
+        self._parsed = False
+        self._index = None
 
     def parse(
         self,
@@ -72,8 +84,14 @@ class InputFile:
         verbose: Boolean = False,
         bulk: Boolean = True,
         usePyArray: Boolean = False,
-    ):
-        """This method parses the input file associated with the InputFile object.
+        cache: Boolean = False,
+        cacheDirectory: str = "",
+        workers: int = 1,
+    ) -> KeywordSequence:
+        """This method parses the input file associated with the InputFile object. The file is
+        read as a stream, the included files are read in place of the *INCLUDE keywords, and the
+        data of the *NODE, *ELEMENT, *NSET and *ELSET keywords is converted a chunk at a time,
+        so that the memory used besides the parsed data is bounded.
 
         Parameters
         ----------
@@ -86,20 +104,192 @@ class InputFile:
             The default is False.
         bulk
             A Boolean specifying whether the input file includes bulk data that should be parsed.
-            The default is True.
+            If *bulk* is False, the data of the *NODE, *ELEMENT, *NSET and *ELSET keywords is not
+            parsed. The default is True.
         usePyArray
             A Boolean specifying that parse method can return an AbaqusNDarray object for a keyword
             data value. In cases where large amounts of numerical data (i.e., large node arrays) are
             expected, it is recommended that you use the option usePyArray=True. The default is
             False.
+        cache
+            A Boolean specifying whether the parsed keywords of the input file and of each
+            included file are written to a sidecar file, which is read instead of the file when
+            it is parsed again with the same options. A sidecar file is valid while the size and
+            the modification time or the contents of its file are unchanged, so that changing an
+            included file only requires parsing this file again. The bulk data is read as views
+            of the mapped sidecar file. The default is False.
+        cacheDirectory
+            A String specifying the directory where the sidecar files are written. By default,
+            the sidecar file of a file is written next to it, with the suffix `.parsed`.
+        workers
+            An Int specifying the number of worker processes. If it is greater than 1, the
+            included files are located first by indexing the keywords, see :py:meth:`index`, then
+            the files are split at line boundaries into pieces of 16 MB, e.g., the data of a large
+            *NODE or *ELEMENT keyword, which are parsed by the workers. The arrays of the pieces
+            are returned through shared memory and joined in the order of the files. The sidecar
+            files are not used by the workers. The default is 1.
 
         Returns
         -------
-            A KeywordSequence object.
+        KeywordSequence
+            A :py:class:`~abaqus.InputFileParser.KeywordSequence.KeywordSequence` object.
 
         Raises
         ------
             If you parse an input file more than once, a ValueError is raised for each subsequent
             parsing.
         """
-        pass
+        from .InputFileReader import InputFileReader
+
+        if self._parsed:
+            raise ValueError("The input file {} has already been parsed".format(self.file))
+        self._parsed = True
+        reader = InputFileReader(
+            os.path.join(self.directory, self.file),
+            self.directory,
+            organize=bool(organize),
+            bulk=bool(bulk),
+            usePyArray=bool(usePyArray),
+            cache=bool(cache),
+            cacheDirectory=cacheDirectory,
+            workers=workers,
+        )
+        try:
+            keywords = reader.read()
+        except (OSError, ValueError) as error:
+            if verbose:
+                print("***ERROR: {}".format(error))
+            raise
+        self.includes, self.missingIncludes = reader.includes, reader.missingIncludes
+        return keywords
+
+    def index(self, cache: Boolean = False, cacheDirectory: str = "") -> KeywordIndex:
+        """This method builds the index of the keywords of the input file and of the included
+        files, i.e., the name, the parameters and the byte ranges of each keyword. The files
+        are mapped in memory and only the lines starting with a star are read. The index is used
+        by the :py:meth:`keyword` and :py:meth:`iterKeywords` methods to parse selected keywords
+        only.
+
+        Parameters
+        ----------
+        cache
+            A Boolean specifying whether the index is saved to a file, which is read instead of
+            indexing the files again, also by other processes, while the size and the
+            modification time of the files are unchanged. The default is False.
+        cacheDirectory
+            A String specifying the directory where the index is saved. By default, it is saved
+            next to the input file, with the suffix `.index`.
+
+        Returns
+        -------
+        KeywordIndex
+            A :py:class:`~abaqus.InputFileParser.KeywordIndex.KeywordIndex` object.
+
+        Raises
+        ------
+            If a file includes itself, a ValueError is raised.
+        """
+        from .InputFileCache import sidecarPath
+        from .InputFileReader import InputFileReader
+        from .KeywordIndex import SUFFIX, loadIndex
+
+        path = os.path.join(self.directory, self.file)
+        fileName = sidecarPath(path, cacheDirectory, SUFFIX)
+        index = loadIndex(fileName) if cache else None
+        if index is None:
+            index = InputFileReader(path, self.directory).index()
+            if cache:
+                try:
+                    index.save(fileName)
+                except OSError:
+                    pass
+        self._index = index
+        self.includes, self.missingIncludes = index.includes, index.missingIncludes
+        return index
+
+    def template(self, cache: Boolean = False, cacheDirectory: str = "") -> "InputFileTemplate":
+        """This method creates a template of the input file, which writes variants of the input
+        file in which some values are replaced, addressed by the path of their keyword, i.e.,
+        `'*Material, name=steel/*Elastic[0][0]'`. The input file is indexed once, see
+        :py:meth:`index`, and only the byte ranges of the changed values are written, the
+        included files that do not change are linked.
+
+        Parameters
+        ----------
+        cache
+            A Boolean specifying whether the index is saved to a file, see :py:meth:`index`. The
+            default is False.
+        cacheDirectory
+            A String specifying the directory where the index is saved.
+
+        Returns
+        -------
+        InputFileTemplate
+            An :py:class:`~abaqus.InputFileParser.InputFileTemplate.InputFileTemplate` object.
+        """
+        from .InputFileTemplate import InputFileTemplate
+
+        return InputFileTemplate(self.file, self.directory, self.index(cache, cacheDirectory))
+
+    def keyword(self, name: str, /, *, usePyArray: Boolean = False, **parameters) -> Keyword:
+        """This method parses the first keyword with a name and parameters, with its
+        suboptions. Only the byte ranges of the keyword and of its suboptions are read, see
+        :py:meth:`index`.
+
+        Parameters
+        ----------
+        name
+            A String specifying the name of the keyword, i.e., `'Material'`. The name is case
+            insensitive and the blanks are ignored.
+        usePyArray
+            A Boolean specifying that the method can return an AbaqusNDarray object for a keyword
+            data value. The default is False.
+        parameters
+            The values of the parameters of the keyword, i.e., `name='steel'`. The values are
+            compared as case insensitive Strings, the value True matches any value.
+
+        Returns
+        -------
+        Keyword
+            A :py:class:`~abaqus.InputFileParser.Keyword.Keyword` object.
+
+        Raises
+        ------
+            If the input file has no such keyword, a ValueError is raised.
+        """
+        for keyword in self.iterKeywords(name, usePyArray=usePyArray, **parameters):
+            return keyword
+        raise ValueError("The input file {} has no keyword *{}".format(self.file, name))
+
+    def iterKeywords(
+        self, name: str = None, /, *, usePyArray: Boolean = False, **parameters
+    ) -> typing.Iterator[Keyword]:
+        """This method parses the keywords with a name and parameters one at a time, with their
+        suboptions. Only the byte ranges of the keywords and of their suboptions are read, see
+        :py:meth:`index`.
+
+        Parameters
+        ----------
+        name
+            A String specifying the name of the keywords, i.e., `'Elset'`. The name is case
+            insensitive and the blanks are ignored. By default, the keywords that are not
+            suboptions of another keyword are parsed.
+        usePyArray
+            A Boolean specifying that the method can return an AbaqusNDarray object for a keyword
+            data value. The default is False.
+        parameters
+            The values of the parameters of the keywords, i.e., `elset='Bottom'`. The values are
+            compared as case insensitive Strings, the value True matches any value.
+
+        Returns
+        -------
+        typing.Iterator[Keyword]
+            An iterator of :py:class:`~abaqus.InputFileParser.Keyword.Keyword` objects.
+        """
+        from .InputFileReader import InputFileReader
+
+        index = self._index if self._index is not None and self._index.isValid() else self.index()
+        path = os.path.join(self.directory, self.file)
+        for position in index.find(name, **parameters):
+            reader = InputFileReader(path, self.directory, organize=True, usePyArray=bool(usePyArray))
+            yield reader.readRanges(index.ranges(position))[0]
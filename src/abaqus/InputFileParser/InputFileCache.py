@@ -0,0 +1,273 @@
+"""Sidecar files of the parsed keywords of input files.
+
+The events of each file read by :py:class:`~abaqus.InputFileParser.InputFileReader.InputFileReader`
+are written to a sidecar file, see :py:func:`~abaqus.InputFileParser.InputFileReader.readEvents`.
+When the file is read again, the events are read from the sidecar file instead of parsing the
+file, the included files having their own sidecar file, so that a change of an included file
+only invalidates the sidecar file of this file.
+
+A sidecar file starts with the magic bytes, followed by the arrays of the converted data, each
+aligned to 64 bytes, then by the JSON manifest of the events, and it ends with a trailer of the
+offset and the length of the manifest and the magic bytes again. The arrays are read as
+copy-on-write views of the mapped file. A sidecar file is valid if the size and the modification
+time of the file are the recorded ones, or if its contents have the recorded hash, and if it was
+written with the same parsing options.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import typing
+
+import numpy
+
+from .InputFileReader import CHUNK_SIZE, normalize, readEvents
+
+# The first and the last bytes of a sidecar file
+MAGIC = b"PYABQIF1"
+
+# The alignment of the arrays in the file
+ALIGNMENT = 64
+
+# The trailer: offset and length of the manifest, and the magic bytes
+TRAILER = struct.Struct("<QQ8s")
+
+# The version of the layout of the manifest
+VERSION = 2
+
+# The suffix appended to the name of the file to get the name of its sidecar file
+SUFFIX = ".parsed"
+
+
+def sidecarPath(path: str, directory: str = "", suffix: str = SUFFIX) -> str:
+    """This function returns the path of the sidecar file of a file.
+
+    Parameters
+    ----------
+    path
+        A String specifying the path of the file.
+    directory
+        A String specifying the directory of the sidecar files. By default, the sidecar file is
+        next to the file. In a directory, the name of the sidecar file includes a hash of the
+        absolute path of the file, so that the files of different directories can have the
+        same name.
+    suffix
+        A String specifying the suffix of the sidecar file.
+
+    Returns
+    -------
+    str
+        The path of the sidecar file.
+    """
+    if not directory:
+        return path + suffix
+    key = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(directory, "{}-{}{}".format(os.path.basename(path), key, suffix))
+
+
+def fileDigest(path: str) -> str:
+    """This function returns the hash of the contents of a file.
+
+    Parameters
+    ----------
+    path
+        A String specifying the path of the file.
+
+    Returns
+    -------
+    str
+        The hexadecimal BLAKE2b digest of the file.
+    """
+    digest = hashlib.blake2b()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cachedEvents(path: str, context: typing.Optional[tuple], bulk: bool, usePyArray: bool, directory: str = ""):
+    """This function returns the events of a file read from its sidecar file if it is valid.
+    Otherwise, the file is parsed and its sidecar file is written after the last event. A
+    sidecar file that cannot be written is ignored.
+
+    Parameters
+    ----------
+    path
+        A String specifying the path of the file.
+    context
+        A tuple of the normalized name and of the parameters of the keyword whose data
+        continues at the start of the file, or None.
+    bulk
+        A Boolean specifying whether the data of the *NODE, *ELEMENT, *NSET and *ELSET
+        keywords is parsed.
+    usePyArray
+        A Boolean specifying whether the numeric data is returned as AbaqusNDarray objects.
+    directory
+        A String specifying the directory of the sidecar files, see :py:func:`sidecarPath`.
+
+    Yields
+    ------
+    tuple
+        The events of the file, see :py:func:`~abaqus.InputFileParser.InputFileReader.readEvents`.
+    """
+    sidecar = sidecarPath(path, directory)
+    options = {"bulk": bool(bulk), "usePyArray": bool(usePyArray), "context": _context(context)}
+    events = loadSidecar(sidecar, path, options)
+    if events is not None:
+        yield from events
+        return
+    status = os.stat(path)
+    digest = hashlib.blake2b()
+    events = []
+    for event in readEvents(path, context, bulk, usePyArray, digest):
+        events.append(event)
+        yield event
+    try:
+        writeSidecar(sidecar, events, dict(options, size=status.st_size, mtime=status.st_mtime_ns, digest=digest.hexdigest()))
+    except OSError:
+        pass
+
+
+def loadSidecar(sidecar: str, path: str, options: dict) -> typing.Optional[list]:
+    """This function reads the events of a sidecar file.
+
+    Parameters
+    ----------
+    sidecar
+        A String specifying the path of the sidecar file.
+    path
+        A String specifying the path of the file the sidecar file caches.
+    options
+        A Dictionary of the parsing options the sidecar file must have been written with.
+
+    Returns
+    -------
+    list
+        The events, or None if the sidecar file does not exist or is not valid.
+    """
+    try:
+        with open(sidecar, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return None
+    size = len(buffer)
+    if size < len(MAGIC) + TRAILER.size or buffer[: len(MAGIC)] != MAGIC:
+        return None
+    offset, length, magic = TRAILER.unpack(buffer[size - TRAILER.size :])
+    if magic != MAGIC or offset + length > size - TRAILER.size:
+        return None
+    manifest = json.loads(buffer[offset : offset + length].decode("utf-8"))
+    if manifest.get("version") != VERSION or not _valid(manifest, path, options):
+        return None
+
+    def array(reference):
+        if reference is None:
+            return None
+        offset, dtype, shape = reference
+        return numpy.ndarray(shape, dtype, buffer=buffer, offset=offset)
+
+    events = []
+    for event in manifest["events"]:
+        kind = event[0]
+        if kind == "data":
+            events.append(("data", None if event[1] is None else array(event[1]).tobytes()))
+        elif kind == "state":
+            carry = array(event[4])
+            events.append(("state", (event[1], array(event[2]), tuple(event[3]), b"" if carry is None else carry.tobytes())))
+        else:
+            events.append(tuple(event))
+    return events
+
+
+def writeSidecar(sidecar: str, events: list, manifest: dict):
+    """This function writes a sidecar file. The file is written next to the sidecar file and
+    renamed, so that a sidecar file is either complete or missing.
+
+    Parameters
+    ----------
+    sidecar
+        A String specifying the path of the sidecar file.
+    events
+        A sequence of the events of the file.
+    manifest
+        A Dictionary of the parsing options and of the size, the modification time and the
+        hash of the file.
+    """
+    temporary = "{}.{}.tmp".format(sidecar, os.getpid())
+    try:
+        with open(temporary, "wb") as file:
+            file.write(MAGIC)
+
+            def write(values):
+                if values is None:
+                    return None
+                values = numpy.ascontiguousarray(values)
+                position = file.tell()
+                file.write(b"\0" * (-position % ALIGNMENT))
+                offset = file.tell()
+                values.tofile(file)
+                return [offset, values.dtype.str, list(values.shape)]
+
+            records = []
+            for event in events:
+                kind = event[0]
+                if kind == "data":
+                    chunk = event[1]
+                    records.append(["data", None if chunk is None else write(numpy.frombuffer(chunk, numpy.uint8))])
+                elif kind == "state":
+                    stateKind, array, lines, carry = event[1]
+                    carry = write(numpy.frombuffer(carry, numpy.uint8)) if carry else None
+                    records.append(["state", stateKind, write(array), list(lines), carry])
+                else:
+                    records.append(list(event))
+            manifest = json.dumps(dict(manifest, leading=_leading(events), events=records, version=VERSION)).encode("utf-8")
+            position = file.tell()
+            file.write(b"\0" * (-position % ALIGNMENT))
+            offset = file.tell()
+            file.write(manifest)
+            file.write(TRAILER.pack(offset, len(manifest), MAGIC))
+        os.replace(temporary, sidecar)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def _context(context: typing.Optional[tuple]):
+    """The options of the keyword the data at the start of a file belongs to, as used by
+    `_Data`"""
+    if context is None:
+        return None
+    key, parameter = context
+    return [key, any(normalize(name) == "GENERATE" for name in parameter)]
+
+
+def _leading(events: list) -> bool:
+    """Returns whether there are data lines before the first keyword"""
+    for event in events:
+        kind = event[0]
+        if kind in ("keyword", "include"):
+            return False
+        if kind == "data" and event[1] is not None and event[1].strip():
+            return True
+        if kind == "state":
+            _, array, lines, carry = event[1]
+            return array is not None or any(line.strip() for line in lines) or bool(carry)
+    return False
+
+
+def _valid(manifest: dict, path: str, options: dict) -> bool:
+    """Returns whether a sidecar file is valid for the file and the parsing options"""
+    if manifest.get("bulk") != options["bulk"] or manifest.get("usePyArray") != options["usePyArray"]:
+        return False
+    if manifest.get("leading") and manifest.get("context") != options["context"]:
+        return False
+    try:
+        status = os.stat(path)
+    except OSError:
+        return False
+    if status.st_size != manifest.get("size"):
+        return False
+    return status.st_mtime_ns == manifest.get("mtime") or fileDigest(path) == manifest.get("digest")
@@ -0,0 +1,890 @@
+import contextlib
+import io
+import mmap
+import os
+import re
+import typing
+
+import numpy
+
+from .AbaqusNDarray import AbaqusNDarray
+from .Keyword import Keyword
+from .KeywordIndex import KeywordIndex
+from .KeywordLocation import KeywordLocation
+from .KeywordSequence import KeywordSequence
+
+# Size of the blocks read from the files and of the data chunks converted at once. Besides the
+# parsed data, the memory used while parsing is bounded by a few chunks.
+CHUNK_SIZE = 1 << 23
+
+# Commas that are not quoted
+_SEPARATOR = re.compile(r',(?=(?:[^"]*"[^"]*")*[^"]*$)')
+# An element is continued on the next line if the line ends with a comma
+_CONTINUATION = re.compile(rb",[ \t]*\r?\n")
+_TRAILING_COMMA = re.compile(rb",[ \t]*(?=\r?\n)")
+_BLANK_LINE = re.compile(rb"^[ \t\r]*\n", re.MULTILINE)
+_LABEL_SEPARATOR = re.compile(rb"[\s,]+")
+
+
+def normalize(name: str) -> str:
+    """This function returns the normalized form of a keyword or parameter name, they are case
+    insensitive and the blanks are ignored.
+
+    Parameters
+    ----------
+    name
+        A String specifying the name, i.e., `'Node Output'`.
+
+    Returns
+    -------
+    str
+        The normalized name, i.e., `'NODEOUTPUT'`.
+    """
+    return name.replace(" ", "").upper()
+
+
+# Keywords enclosed by an end keyword when the keywords are organized into suboptions
+_BLOCKS = {normalize(name): normalize("End " + name) for name in ("Part", "Assembly", "Instance", "Step")}
+_ENDS = set(_BLOCKS.values())
+
+# Keywords that are suboptions of the preceding keyword when the keywords are organized
+_SUBOPTIONS = {
+    normalize(parent): {normalize(name) for name in names}
+    for parent, names in {
+        "Material": (
+            "Anneal Temperature", "Cap Hardening", "Cap Plasticity", "Cast Iron Plasticity", "Clay Hardening",
+            "Clay Plasticity", "Concrete", "Concrete Compression Damage", "Concrete Compression Hardening",
+            "Concrete Damaged Plasticity", "Concrete Tension Damage", "Concrete Tension Stiffening",
+            "Conductivity", "Creep", "Crushable Foam", "Crushable Foam Hardening", "Damage Evolution",
+            "Damage Initiation", "Damage Stabilization", "Damping", "Density", "Depvar", "Dielectric",
+            "Drucker Prager", "Drucker Prager Creep", "Drucker Prager Hardening", "Elastic",
+            "Electrical Conductivity", "EOS", "Expansion", "Fail Strain", "Fail Stress", "Heat Generation",
+            "Hyperelastic", "Hyperfoam", "Hypoelastic", "Inelastic Heat Fraction", "Joule Heat Fraction",
+            "Latent Heat", "Low Density Foam", "Mohr Coulomb", "Mohr Coulomb Hardening", "Moisture Swelling",
+            "Mullins Effect", "Permeability", "Piezoelectric", "Plastic", "Porous Bulk Moduli", "Porous Elastic",
+            "Porous Metal Plasticity", "Regularize", "Shear Failure", "Sorption", "Specific Heat", "Superelastic",
+            "Swelling", "Tensile Failure", "User Defined Field", "User Material", "User Output Variables",
+            "Viscoelastic", "Viscosity", "Viscous",
+        ),
+        "Plastic": ("Cyclic Hardening", "ORNL", "Potential", "Rate Dependent"),
+        "Creep": ("Potential",),
+        "Damage Initiation": ("Damage Evolution", "Damage Stabilization"),
+        "Surface Interaction": (
+            "Cohesive Behavior", "Contact Damping", "Damage Evolution", "Damage Initiation",
+            "Damage Stabilization", "Friction", "Gap Conductance", "Gap Heat Generation", "Gap Radiation",
+            "Surface Behavior",
+        ),
+        "Connector Behavior": (
+            "Connector Constitutive Reference", "Connector Damage Evolution", "Connector Damage Initiation",
+            "Connector Damping", "Connector Elasticity", "Connector Failure", "Connector Friction",
+            "Connector Hardening", "Connector Lock", "Connector Plasticity", "Connector Potential",
+            "Connector Stop",
+        ),
+        "Connector Plasticity": ("Connector Hardening", "Connector Potential"),
+        "Connector Damage Initiation": ("Connector Damage Evolution", "Connector Potential"),
+        "Contact": (
+            "Contact Controls Assignment", "Contact Exclusions", "Contact Formulation", "Contact Inclusions",
+            "Contact Initialization Assignment", "Contact Property Assignment", "Contact Stabilization",
+            "Surface Property Assignment",
+        ),
+        "Output": (
+            "Contact Output", "Element Output", "Energy Output", "Incrementation Output", "Integrated Output",
+            "Node Output", "Radiation Output",
+        ),
+    }.items()
+}
+
+_NODE, _ELEMENT, _NSET, _ELSET = normalize("Node"), normalize("Element"), normalize("Nset"), normalize("Elset")
+_INCLUDE = normalize("Include")
+
+
+class InputFileReader:
+    """The InputFileReader object reads the keywords of an Abaqus input file, it is used by the
+    InputFile.parse() method. The file is read in blocks of :py:data:`CHUNK_SIZE` bytes, the
+    included files are read in place of the *INCLUDE keyword, and the data of the *NODE,
+    *ELEMENT, *NSET and *ELSET keywords is converted a chunk at a time with numpy.
+
+    Attributes
+    ----------
+    includes: tuple
+        A sequence of Strings specifying the paths of the files included by the input file.
+    missingIncludes: tuple
+        A sequence of Strings specifying the included files that could not be located.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.InputFileParser.InputFileReader import InputFileReader
+
+    """
+
+    # A sequence of Strings specifying the paths of the files included by the input file.
+    includes: tuple = ()
+
+    # A sequence of Strings specifying the included files that could not be located.
+    missingIncludes: tuple = ()
+
+    def __init__(
+        self,
+        path: str,
+        directory: str = "",
+        organize: bool = False,
+        bulk: bool = True,
+        usePyArray: bool = False,
+        cache: bool = False,
+        cacheDirectory: str = "",
+        workers: int = 1,
+    ):
+        """This method creates an InputFileReader object.
+
+        Parameters
+        ----------
+        path
+            A String specifying the path of the input file.
+        directory
+            A String specifying the directory searched for the included files that are not found
+            next to the file including them.
+        organize
+            A Boolean specifying whether keywords should be organized into suboptions.
+        bulk
+            A Boolean specifying whether the data of the *NODE, *ELEMENT, *NSET and *ELSET
+            keywords is parsed.
+        usePyArray
+            A Boolean specifying whether the numeric data is returned as AbaqusNDarray objects.
+        cache
+            A Boolean specifying whether the keywords of each file are read from and written to
+            a sidecar file, see :py:mod:`~abaqus.InputFileParser.InputFileCache`.
+        cacheDirectory
+            A String specifying the directory of the sidecar files. By default, the sidecar file
+            is next to the file it caches.
+        workers
+            An Int specifying the number of worker processes reading the files, see
+            :py:mod:`~abaqus.InputFileParser.ParallelParse`. If it is 1, the files are read in
+            this process.
+        """
+        self.path = path
+        self.directory = directory
+        self.organize = organize
+        self.bulk = bulk
+        self.usePyArray = usePyArray
+        self.cache = cache
+        self.cacheDirectory = cacheDirectory
+        self.workers = workers
+
+    def read(self) -> KeywordSequence:
+        """This method reads the keywords of the input file.
+
+        Returns
+        -------
+        KeywordSequence
+            A :py:class:`~abaqus.InputFileParser.KeywordSequence.KeywordSequence` object.
+
+        Raises
+        ------
+        ValueError
+            If the input file is not valid or includes itself.
+        """
+        if self.workers <= 1:
+            return self.readRanges(((self.path, 0, None),))
+        from .ParallelParse import parallelEvents, splitIndex
+
+        # The included files are located first, the pieces of the files are read by the workers
+        index = self.index()
+        self._begin()
+        for path, events in parallelEvents(splitIndex(self.path, index), self.bulk, self.usePyArray, self.workers):
+            self._replay(path, (), events)
+        keywords = self._end()
+        self.includes = index.includes
+        return keywords
+
+    def readRanges(self, ranges: typing.Sequence[tuple]) -> KeywordSequence:
+        """This method reads the keywords of byte ranges of the input file and of the included
+        files, as if the ranges were one file, i.e., the ranges of keywords of a
+        :py:class:`~abaqus.InputFileParser.KeywordIndex.KeywordIndex` object.
+
+        Parameters
+        ----------
+        ranges
+            A sequence of tuples of the path of a file, the offset of the start of the range and
+            the offset of its end, or None for the end of the file.
+
+        Returns
+        -------
+        KeywordSequence
+            A :py:class:`~abaqus.InputFileParser.KeywordSequence.KeywordSequence` object.
+
+        Raises
+        ------
+        ValueError
+            If the ranges are not valid or if a file includes itself.
+        """
+        self._begin()
+        for path, start, end in ranges:
+            self._readFile(path, (), start, end)
+        return self._end()
+
+    def _begin(self):
+        self._keywords = KeywordSequence()
+        self._includes, self._missingIncludes = [], []
+        self._keyword, self._data, self._comments = None, None, []
+
+    def _end(self) -> KeywordSequence:
+        if self._data is not None:
+            self._keyword.data = self._data.finish()
+        if self._keyword is not None and self._comments:
+            self._keyword.comments += tuple(self._comments)
+
+        keywords = self._keywords
+        self.includes, self.missingIncludes = tuple(self._includes), tuple(self._missingIncludes)
+        del self._keywords, self._includes, self._missingIncludes, self._keyword, self._data, self._comments
+        return organize(keywords) if self.organize else keywords
+
+    def _readFile(self, path: str, including: tuple, start: int = 0, end: int = None):
+        """Reads the events of a file, the included files are read in place of the *INCLUDE
+        keywords."""
+        # The data of the keyword being read continues at the start of an included file
+        data = self._data
+        context = None if data is None or data.carry else (data.key, data.parameter)
+        with contextlib.closing(self._events(path, context, start, end)) as events:
+            self._replay(path, including, events)
+
+    def _replay(self, path: str, including: tuple, events: typing.Iterable[tuple]):
+        """Builds the keywords from the events of a file"""
+        for event in events:
+            kind = event[0]
+            if kind == "data":
+                chunk = event[1]
+                if self._keyword is None:
+                    if chunk is not None and chunk.strip():
+                        raise ValueError("{}: data line before the first keyword".format(path))
+                    continue
+                if self._comments:
+                    self._keyword.comments += tuple(self._comments)
+                    self._comments = []
+                if chunk is not None:
+                    self._data.add(chunk)
+            elif kind == "state":
+                if self._data is not None:
+                    self._data.merge(event[1])
+            elif kind == "comment":
+                self._comments.append(event[1])
+            else:
+                name, parameter = event[1], event[2]
+                if kind == "include":
+                    fileName = next((value for name, value in parameter.items() if normalize(name) == "INPUT"), "")
+                    included = self._locate(fileName, path)
+                    if included is not None:
+                        if any(os.path.samefile(included, opened) for opened in including + (path,)):
+                            raise ValueError("{}: {} includes itself".format(path, fileName))
+                        self._includes.append(included)
+                        self._readFile(included, including + (path,))
+                        continue
+                    # The keyword is kept in place of the missing file
+                    self._missingIncludes.append(fileName)
+                if self._data is not None:
+                    self._keyword.data = self._data.finish()
+                self._keyword = Keyword(name, parameter, comments=tuple(self._comments))
+                self._keywords.append(self._keyword)
+                self._data = _Data(normalize(name), parameter, self.bulk, self.usePyArray)
+                self._comments = []
+
+    def _events(self, path: str, context: typing.Optional[tuple], start: int = 0, end: int = None):
+        """Returns the events of a file, from its sidecar file if it is valid"""
+        if not self.cache or start or end is not None:
+            return readEvents(path, context, self.bulk, self.usePyArray, start=start, end=end)
+        from .InputFileCache import cachedEvents
+
+        return cachedEvents(path, context, self.bulk, self.usePyArray, self.cacheDirectory)
+
+    def index(self) -> KeywordIndex:
+        """This method builds the index of the keywords of the input file and of the included
+        files. The files are mapped in memory and only the lines starting with a star are
+        read, so that the data lines are not looked at.
+
+        Returns
+        -------
+        KeywordIndex
+            A :py:class:`~abaqus.InputFileParser.KeywordIndex.KeywordIndex` object.
+
+        Raises
+        ------
+        ValueError
+            If a file includes itself.
+        """
+        index = KeywordIndex()
+        self._location, self._includes, self._missingIncludes = None, [], []
+        self._indexFile(self.path, (), index)
+        index.includes, index.missingIncludes = tuple(self._includes), tuple(self._missingIncludes)
+        del self._location, self._includes, self._missingIncludes
+        return index
+
+    def _indexFile(self, path: str, including: tuple, index: KeywordIndex):
+        """Adds the keywords of a file to the index, the included files are indexed in place of
+        the *INCLUDE keywords"""
+        status = os.stat(path)
+        index.files[path] = (status.st_size, status.st_mtime_ns)
+        buffer = b""
+        if status.st_size:
+            with open(path, "rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            size = len(buffer)
+            # The start of the bytes of the keyword being indexed
+            position = 0
+            # The start and the end of the comment lines preceding the line
+            commentStart = commentEnd = -1
+            line = 0 if buffer[:1] == b"*" else _nextKeywordLine(buffer, 0)
+            while line >= 0:
+                end = buffer.find(b"\n", line) + 1 or size
+                if buffer[line + 1 : line + 2] == b"*":
+                    if line != commentEnd:
+                        commentStart = line
+                    commentEnd = end
+                    line = _nextKeywordLine(buffer, end - 1)
+                    continue
+                text = buffer[line:end]
+                while text.rstrip().endswith(b",") and end < size and buffer[end : end + 1] != b"*":
+                    following = buffer.find(b"\n", end) + 1 or size
+                    text, end = text.rstrip() + buffer[end:following], following
+                name, parameter = parseKeywordLine(text.decode("utf-8", "replace"))
+                if normalize(name) == _INCLUDE:
+                    fileName = next((value for name, value in parameter.items() if normalize(name) == "INPUT"), "")
+                    included = self._locate(fileName, path)
+                    if included is not None:
+                        if any(os.path.samefile(included, opened) for opened in including + (path,)):
+                            raise ValueError("{}: {} includes itself".format(path, fileName))
+                        self._addRange(path, position, line)
+                        self._includes.append(included)
+                        self._indexFile(included, including + (path,), index)
+                        position = end
+                        line = _nextKeywordLine(buffer, end - 1)
+                        continue
+                    # The keyword is kept in place of the missing file
+                    self._missingIncludes.append(fileName)
+                start = commentStart if commentEnd == line else line
+                self._addRange(path, position, start)
+                self._location = KeywordLocation(name, parameter)
+                index.append(self._location)
+                position = start
+                line = _nextKeywordLine(buffer, end - 1)
+            self._addRange(path, position, size)
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+    def _addRange(self, path: str, start: int, end: int):
+        """Adds a byte range to the keyword being indexed"""
+        location = self._location
+        if location is None or end <= start:
+            return
+        if location.ranges and location.ranges[-1][0] == path and location.ranges[-1][2] == start:
+            location.ranges = location.ranges[:-1] + ((path, location.ranges[-1][1], end),)
+        else:
+            location.ranges += ((path, start, end),)
+
+    def _locate(self, fileName: str, includingFile: str):
+        for directory in (os.path.dirname(includingFile), self.directory):
+            path = os.path.normpath(os.path.join(directory, fileName))
+            if fileName and os.path.isfile(path):
+                return path
+        return None
+
+
+def parseKeywordLine(line: str) -> tuple[str, dict]:
+    """This function parses a keyword line.
+
+    Parameters
+    ----------
+    line
+        A String specifying the keyword line, i.e., `'*Element, type=C3D8R, elset=Part-1'`.
+
+    Returns
+    -------
+    tuple[str, dict]
+        The name of the keyword, i.e., `'Element'`, and the Dictionary of its parameters, i.e.,
+        `{'type': 'C3D8R', 'elset': 'Part-1'}`. The value of a parameter without value is an
+        empty String.
+    """
+    fields = _SEPARATOR.split(line.strip()[1:])
+    parameter = {}
+    for field in fields[1:]:
+        key, _, value = field.partition("=")
+        if key.strip():
+            parameter[key.strip()] = value.strip().strip('"')
+    return fields[0].strip(), parameter
+
+
+def readEvents(
+    path: str,
+    context: typing.Optional[tuple],
+    bulk: bool,
+    usePyArray: bool,
+    digest=None,
+    start: int = 0,
+    end: int = None,
+):
+    """This function reads the events of one file or of a byte range of a file, the *INCLUDE
+    keywords are not followed.
+    An event is a tuple whose first item is its kind:
+
+    - `("comment", text)` for a comment line.
+    - `("keyword", name, parameter)` and `("include", name, parameter)` for a keyword line.
+    - `("data", chunk)` for data lines, *chunk* is None if the lines are converted in the
+      following state event. Converted lines only have an event after a comment line.
+    - `("state", state)` for the converted data lines of the preceding keyword, it is the
+      tuple returned by `_Data.state()`.
+
+    The data lines following an *INCLUDE keyword are passed as is, as the keyword they belong
+    to depends on the included file.
+
+    Parameters
+    ----------
+    path
+        A String specifying the path of the file.
+    context
+        A tuple of the normalized name and of the parameters of the keyword whose data
+        continues at the start of the file, or None if the data lines at the start of the file
+        are passed as is.
+    bulk
+        A Boolean specifying whether the data of the *NODE, *ELEMENT, *NSET and *ELSET
+        keywords is parsed.
+    usePyArray
+        A Boolean specifying whether the numeric data is returned as AbaqusNDarray objects.
+    digest
+        A hashlib object updated with the contents of the file, or None.
+    start
+        An Int specifying the offset of the first byte read, at the start of a line.
+    end
+        An Int specifying the offset of the end of the range read, at the start of a line. By
+        default, the file is read up to its end.
+
+    Yields
+    ------
+    tuple
+        The events of the file.
+    """
+    source = _Source(path, digest, start, end)
+    try:
+        data = None if context is None else _Data(context[0], context[1], bulk, usePyArray)
+        # The comments before the data are comments of the keyword of the context
+        comment = True
+        while True:
+            chunk = source.readData()
+            if chunk:
+                if data is None:
+                    yield "data", chunk
+                else:
+                    if comment:
+                        yield "data", None
+                    data.add(chunk)
+                comment = False
+                continue
+            line = source.readLine()
+            if line is None:
+                break
+            if line.startswith(b"**"):
+                yield "comment", line[2:].decode("utf-8", "replace").strip()
+                comment = True
+                continue
+            while line.rstrip().endswith(b","):  # The parameters are continued on the next line
+                following = source.readLine()
+                if following is None or following.startswith(b"*"):
+                    if following is not None:
+                        source.unreadLine(following)
+                    break
+                line = line.rstrip() + following
+            name, parameter = parseKeywordLine(line.decode("utf-8", "replace"))
+            if data is not None:
+                yield "state", data.state()
+            key = normalize(name)
+            if key == _INCLUDE:
+                yield "include", name, parameter
+                data = None
+            else:
+                yield "keyword", name, parameter
+                data = _Data(key, parameter, bulk, usePyArray)
+            comment = False
+        if data is not None:
+            yield "state", data.state()
+    finally:
+        source.close()
+
+
+def _nextKeywordLine(buffer, position: int) -> int:
+    """Returns the start of the next line starting with a star after a position, or -1. The
+    star is searched alone, which is faster as it is rare in data lines"""
+    found = buffer.find(b"*", position + 1)
+    while found > 0 and buffer[found - 1] != 10:
+        found = buffer.find(b"*", found + 1)
+    return found
+
+
+def organize(keywords: KeywordSequence) -> KeywordSequence:
+    """This function organizes a flat sequence of keywords into suboptions. The keywords
+    between *PART, *ASSEMBLY, *INSTANCE or *STEP and the matching end keyword are the suboptions
+    of the opening keyword, the end keyword being the last one. Material behaviors are
+    suboptions of *MATERIAL, *FRICTION is a suboption of *SURFACE INTERACTION, *NODE OUTPUT is a
+    suboption of *OUTPUT, etc.
+
+    Parameters
+    ----------
+    keywords
+        A KeywordSequence object specifying the keywords in the order of the input file.
+
+    Returns
+    -------
+    KeywordSequence
+        The top-level keywords.
+    """
+    top = KeywordSequence()
+    stack = [(None, top)]
+    for keyword in keywords:
+        key = normalize(keyword.name)
+        # Close the parents the keyword is not a suboption of, the blocks are closed by their end
+        while stack[-1][0] is not None and stack[-1][0] not in _BLOCKS and key not in _SUBOPTIONS[stack[-1][0]]:
+            stack.pop()
+        if key in _ENDS:
+            while len(stack) > 1 and _BLOCKS.get(stack[-1][0]) != key:
+                stack.pop()
+            stack[-1][1].append(keyword)
+            if len(stack) > 1:
+                stack.pop()
+            continue
+        stack[-1][1].append(keyword)
+        if key in _BLOCKS or key in _SUBOPTIONS:
+            stack.append((key, keyword.suboptions))
+    return top
+
+
+def setLabels(keyword: Keyword) -> numpy.ndarray:
+    """This function returns the labels of the members of a *NSET or *ELSET keyword as an
+    array. The data of the keyword is already the flat sequence of the labels, the ranges of the
+    GENERATE option are expanded when the file is read.
+
+    Parameters
+    ----------
+    keyword
+        A Keyword object specifying a *NSET or *ELSET keyword.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of ints specifying the labels.
+
+    Raises
+    ------
+    ValueError
+        If the keyword data contains set names instead of labels.
+    """
+    if not isinstance(keyword.data, numpy.ndarray) and any(isinstance(value, str) for value in keyword.data):
+        raise ValueError("*{} contains set names".format(keyword.name))
+    return numpy.asarray(keyword.data, dtype=numpy.int64).ravel()
+
+
+def _expandRanges(rows: numpy.ndarray) -> numpy.ndarray:
+    """Returns the labels of the rows *first, last, increment* of the GENERATE option of a
+    *NSET or *ELSET keyword, without a loop over the ranges. The default increment is 1."""
+    ranges = numpy.ones((len(rows), 3), numpy.int64)
+    ranges[:, : min(rows.shape[1], 3)] = rows[:, :3]
+    ranges[ranges[:, 2] == 0, 2] = 1
+    first, last, increment = ranges[(ranges[:, 1] - ranges[:, 0]) // ranges[:, 2] >= 0].T
+    counts = (last - first) // increment + 1
+    # Each label is the previous one plus the increment, except at the start of a range
+    steps = numpy.repeat(increment, counts)
+    starts = numpy.cumsum(counts)[:-1]
+    steps[starts] = first[1:] - (first + (counts - 1) * increment)[:-1]
+    if steps.size:
+        steps[0] = first[0]
+    return numpy.cumsum(steps)
+
+
+class _Source:
+    """Reader of the lines of one file, the data lines are returned in chunks"""
+
+    def __init__(self, path: str, digest=None, start: int = 0, end: int = None):
+        self.path = path
+        self.digest = digest
+        self.file = open(path, "rb")
+        if start:
+            self.file.seek(start)
+        # The number of bytes left to read up to the end of the range
+        self.remaining = None if end is None else end - start
+        self.buffer = b""
+        self.position = 0
+        self.eof = False
+
+    def close(self):
+        self.file.close()
+
+    def readLine(self):
+        while True:
+            end = self.buffer.find(b"\n", self.position)
+            if end >= 0:
+                line, self.position = self.buffer[self.position : end + 1], end + 1
+                return line
+            if not self._fill():
+                return None
+
+    def unreadLine(self, line: bytes):
+        self.position -= len(line)
+
+    def readData(self) -> bytes:
+        """Returns the following data lines up to the next keyword or comment line, or the
+        complete lines of a chunk if there are more."""
+        while True:
+            buffer, start = self.buffer, self.position
+            if start < len(buffer):
+                if buffer[start] == 42:  # *
+                    return b""
+                end = buffer.find(b"\n*", start)
+                if end < 0 and len(buffer) - start >= CHUNK_SIZE:
+                    end = buffer.rfind(b"\n", start)
+                if end >= 0:
+                    self.position = end + 1
+                    return buffer[start : end + 1]
+            if not self._fill():
+                self.position = len(buffer)
+                return buffer[start:]
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        if self.remaining is None:
+            block = self.file.read(CHUNK_SIZE)
+        else:
+            block = self.file.read(min(CHUNK_SIZE, self.remaining))
+            self.remaining -= len(block)
+        if self.digest is not None:
+            self.digest.update(block)
+        if not block:
+            self.eof = True
+            if self.position == len(self.buffer) or self.buffer.endswith(b"\n"):
+                return False
+            block = b"\n"
+        self.buffer = self.buffer[self.position :] + block
+        self.position = 0
+        return True
+
+
+class _Rows:
+    """Growable array the rows of the chunks are appended to. The array is grown in place,
+    large arrays are reallocated without a copy of the rows. An array of a sidecar file or
+    of an event is borrowed, it is copied before rows are appended."""
+
+    def __init__(self, dtype):
+        self.dtype = dtype
+        self.array = None
+        self.size = 0
+        self.borrowed = False
+
+    def borrow(self, array: numpy.ndarray):
+        self.array, self.size, self.borrowed = array, len(array), True
+
+    def append(self, rows: numpy.ndarray):
+        if self.array is None:
+            self.array = numpy.empty((max(len(rows), 1024),) + rows.shape[1:], self.dtype)
+        elif rows.ndim == 2 and rows.shape[1] != self.array.shape[1]:
+            # Rows with missing trailing values, they are zero in Abaqus
+            columns = max(rows.shape[1], self.array.shape[1])
+            rows = _pad(rows, columns)
+            if columns > self.array.shape[1]:
+                self.array = _pad(self.array, columns)
+        if self.borrowed:
+            self.array = numpy.array(self.array[: self.size])
+            self.borrowed = False
+        if self.size + len(rows) > len(self.array):
+            self.array.resize((max(2 * len(self.array), self.size + len(rows)),) + self.array.shape[1:], refcheck=False)
+        self.array[self.size : self.size + len(rows)] = rows
+        self.size += len(rows)
+
+    def finish(self) -> numpy.ndarray:
+        if self.array is None:
+            return numpy.empty((0, 0), self.dtype)
+        if self.size != len(self.array):
+            self.array.resize((self.size,) + self.array.shape[1:], refcheck=False)
+        return self.array
+
+
+class _Data:
+    """Conversion of the data lines of a keyword"""
+
+    def __init__(self, key: str, parameter: dict, bulk: bool, usePyArray: bool):
+        self.key = key
+        self.parameter = parameter
+        self.generate = any(normalize(name) == "GENERATE" for name in parameter)
+        self.kind = {_NODE: "node", _ELEMENT: "element", _NSET: "set", _ELSET: "set"}.get(key, "other")
+        self.isSet = self.kind == "set"
+        self.skip = not bulk and self.kind != "other"
+        self.usePyArray = usePyArray
+        self.rows = _Rows(numpy.float64 if self.kind == "node" else numpy.int64)
+        self.lines = []
+        self.carry = b""
+
+    def add(self, chunk: bytes):
+        if self.skip:
+            return
+        if self.kind == "element" and (self.carry or _continued(chunk)):
+            chunk = _CONTINUATION.sub(b",", self.carry + chunk)
+            end = chunk.rfind(b"\n") + 1
+            chunk, self.carry = chunk[:end], chunk[end:]
+        if self.kind == "other":
+            self.lines.extend(chunk.decode("utf-8", "replace").splitlines())
+            return
+        try:
+            rows = self._convert(chunk)
+        except ValueError:
+            # Not numeric, i.e., a set of sets
+            self._toLines()
+            self.lines.extend(chunk.decode("utf-8", "replace").splitlines())
+            return
+        if rows is not None:
+            self.rows.append(rows)
+
+    def finish(self):
+        if self.skip:
+            return ()
+        if self.carry:
+            self.add(self.carry.rstrip(b", \t\r") + b"\n")
+            self.carry = b""
+        if self.kind == "other":
+            rows = [_values(line) for line in self.lines if line.strip()]
+            if self.isSet:
+                # A set of sets, the names and labels are flattened as the labels of a set
+                return tuple(value for row in rows for value in row)
+            if self.usePyArray:
+                return _toArray(rows)
+            return tuple(rows)
+        array = self.rows.finish()
+        if self.kind == "set":
+            # The labels of the explicit and generated sets are the same flat sequence
+            return AbaqusNDarray(array.ravel()) if self.usePyArray else tuple(array.ravel().tolist())
+        if not self.usePyArray:
+            if self.kind == "node":
+                return tuple((int(row[0]),) + tuple(row[1:]) for row in array.tolist())
+            return tuple(map(tuple, array.tolist()))
+        return AbaqusNDarray(array, colZeroIsInt=self.kind == "node")
+
+    def state(self) -> tuple:
+        """Returns the kind, the array of numeric rows or None, the lines and the incomplete
+        element line of the data added so far"""
+        array = None if self.rows.array is None else self.rows.finish()
+        if array is not None:
+            self.rows.borrow(array)
+        return self.kind, array, tuple(self.lines), self.carry
+
+    def merge(self, state: tuple):
+        """Adds the data of a state returned by another _Data object of the same keyword"""
+        kind, array, lines, carry = state
+        if self.skip or (array is None and not lines and not carry):
+            return
+        if self.rows.array is None and not self.lines and not self.carry:
+            self.kind = kind
+            if array is not None:
+                self.rows.borrow(array)
+            self.lines, self.carry = list(lines), carry
+            return
+        if kind != self.kind or self.kind == "other":
+            self._toLines()
+            if array is not None:
+                lines = [", ".join(map(str, row)) for row in array.reshape(len(array), -1).tolist()] + list(lines)
+            self.lines.extend(lines)
+        elif array is not None:
+            self.rows.append(array)
+        self.carry = carry
+
+    def _convert(self, chunk: bytes):
+        if not chunk or chunk.isspace():
+            return None
+        if self.kind == "set" and not self.generate:
+            labels = _LABEL_SEPARATOR.sub(b",", chunk).strip(b",")
+            return numpy.fromstring(labels, dtype=numpy.int64, sep=",")
+        if self.kind == "set":
+            return _expandRanges(_loadRows(chunk, self.rows.dtype))
+        return _loadRows(chunk, self.rows.dtype)
+
+    def _toLines(self):
+        if self.kind != "other":
+            if self.rows.array is not None:
+                array = self.rows.finish()
+                self.lines = [", ".join(map(str, row)) for row in array.reshape(len(array), -1).tolist()]
+            self.kind = "other"
+
+
+def _loadRows(chunk: bytes, dtype) -> numpy.ndarray:
+    """Returns the rows of the comma separated values of a chunk"""
+    try:
+        return numpy.loadtxt(io.BytesIO(chunk), dtype, comments=None, delimiter=",", ndmin=2)
+    except ValueError:
+        pass
+    chunk = _BLANK_LINE.sub(b"", _TRAILING_COMMA.sub(b"", chunk))
+    try:
+        return numpy.loadtxt(io.BytesIO(chunk), dtype, comments=None, delimiter=",", ndmin=2)
+    except ValueError:
+        pass
+    # Blank values, rows of different lengths or Fortran exponents
+    rows = [_numbers(line) for line in chunk.decode("utf-8", "replace").splitlines() if line.strip()]
+    columns = max(map(len, rows))
+    return numpy.array([row + [0] * (columns - len(row)) for row in rows], dtype)
+
+
+def _continued(chunk: bytes) -> bool:
+    """Returns whether a line of the chunk may end with a comma, it is faster than searching
+    the expression as the commas between the values are not looked at"""
+    array = numpy.frombuffer(chunk, numpy.uint8)
+    ends = numpy.flatnonzero(array == 10)
+    ends = ends[ends > 1] - 1
+    ends[array[ends] == 13] -= 1
+    last = array[ends]
+    return bool(((last == 44) | (last == 32) | (last == 9)).any())
+
+
+def _pad(array: numpy.ndarray, columns: int) -> numpy.ndarray:
+    padded = numpy.zeros((len(array), columns), array.dtype)
+    padded[:, : array.shape[1]] = array
+    return padded
+
+
+def _value(field: str):
+    field = field.strip()
+    try:
+        return int(field)
+    except ValueError:
+        pass
+    try:
+        return float(field)
+    except ValueError:
+        pass
+    try:
+        return float(field.replace("D", "E").replace("d", "e"))
+    except ValueError:
+        return field.strip('"')
+
+
+def _values(line: str) -> tuple:
+    fields = _SEPARATOR.split(line) if '"' in line else line.split(",")
+    if len(fields) > 1 and not fields[-1].strip():
+        fields.pop()
+    return tuple(map(_value, fields))
+
+
+def _numbers(line: str) -> list:
+    values = [0 if value == "" else value for value in _values(line)]
+    if any(isinstance(value, str) for value in values):
+        raise ValueError("{!r} is not numeric".format(line))
+    return values
+
+
+def _toArray(rows: list):
+    """Returns an AbaqusNDarray if the rows have the same length and are numeric"""
+    if not rows or any(len(row) != len(rows[0]) for row in rows):
+        return tuple(rows)
+    types = {type(value) for row in rows for value in row}
+    if not types <= {int, float}:
+        return tuple(rows)
+    if types == {int}:
+        return AbaqusNDarray(numpy.array(rows, numpy.int64))
+    colZeroIsInt = len(rows[0]) > 1 and all(type(row[0]) is int for row in rows)
+    return AbaqusNDarray(numpy.array(rows, numpy.float64), colZeroIsInt=colZeroIsInt)
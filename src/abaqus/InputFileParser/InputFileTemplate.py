@@ -0,0 +1,542 @@
+"""Variants of an input file that differ by a few values.
+
+The values are addressed by keyword paths, i.e., `'*Material, name=steel/*Elastic[0][1]'`. The
+path is resolved with the :py:class:`~abaqus.InputFileParser.KeywordIndex.KeywordIndex` of the
+input file, so that only the keyword lines and the data lines of the addressed keywords are
+read. A variant is written by splicing the new values into the byte ranges of the files that
+change, the files that do not change are linked.
+"""
+
+import contextlib
+import mmap
+import numbers
+import os
+import re
+import shutil
+import typing
+
+from abaqusConstants import *
+from .InputFileReader import _ELEMENT, _INCLUDE, CHUNK_SIZE, _nextKeywordLine, _value, normalize, parseKeywordLine
+from .KeywordIndex import KeywordIndex
+
+# The size in bytes from which an unchanged byte range of a changed file is written once to a
+# segment file included by the variants, see InputFileTemplate.write()
+SEGMENT_SIZE = 1 << 16
+
+# The separators of the keywords of a path, and the indices of the data line and of the value
+_PATH_SEPARATOR = re.compile(r"/(?=\s*\*)")
+_INDICES = re.compile(r"(?:\[\s*\d+\s*\]\s*)+$")
+# Commas that are not quoted
+_FIELD_SEPARATOR = re.compile(rb',(?=(?:[^"]*"[^"]*")*[^"]*$)')
+_COMMA = re.compile(rb",")
+# The value of the INPUT parameter of an *INCLUDE keyword line
+_INPUT = re.compile(rb'INPUT\s*=\s*("[^"\r\n]*"|[^,\r\n]*)', re.I)
+_BLANKS = b" \t\r\n"
+
+
+class _Target(typing.NamedTuple):
+    """The byte ranges of the value addressed by a path"""
+
+    # The number of indices of the path: 0 for the data lines, 1 for a data line and 2 for a
+    # value of a data line
+    depth: int
+    # Whether the lines of a data line ending with a comma are continued, as for *ELEMENT
+    element: bool
+    # The byte ranges replaced, the new text is written in place of the first one
+    spans: tuple
+    # The byte ranges of the whole lines including the spans
+    lines: tuple
+
+
+class InputFileTemplate:
+    """The InputFileTemplate object writes variants of an Abaqus input file in which some values
+    are replaced. The values are addressed by the path of their keyword, the names and the
+    parameters of the keyword and of the keywords it is a suboption of separated by slashes,
+    followed by the index of the data line and the index of the value in the data line, i.e.,
+    `'*Material, name=steel/*Elastic[0][0]'`. Without the index of the value, the path addresses
+    a data line, and without indices, the data lines of the keyword. The keywords are organized
+    into suboptions as by the InputFile.parse() method, and the first keyword matching each
+    part of the path is used.
+
+    Attributes
+    ----------
+    file: str
+        A String specifying the source file name of the Abaqus input file.
+    directory: str
+        A String specifying the directory where the input file is located.
+    index: KeywordIndex
+        A :py:class:`~abaqus.InputFileParser.KeywordIndex.KeywordIndex` object of the input file.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        import inpParser
+        inpParser.InputFile('Job-1.inp').template()
+
+    """
+
+    # A String specifying the source file name of the Abaqus input file.
+    file: str = ""
+
+    # A String specifying the directory where the input file is located.
+    directory: str = ""
+
+    # A KeywordIndex object of the input file.
+    index: KeywordIndex = None
+
+    def __init__(self, file: str, directory: str = "", index: KeywordIndex = None):
+        """This method creates an InputFileTemplate object from an Abaqus input file.
+
+        Notes
+        -----
+        This function can be accessed by:
+
+        .. code-block:: python
+
+            inpParser.InputFile('Job-1.inp').template
+
+        Parameters
+        ----------
+        file
+            A String specifying the path to the input file.
+        directory
+            A String specifying the path to the directory containing the input file.
+        index
+            A :py:class:`~abaqus.InputFileParser.KeywordIndex.KeywordIndex` object of the input
+            file. By default, the input file is indexed.
+
+        Returns
+        -------
+            An InputFileTemplate object.
+        """
+        from .InputFileReader import InputFileReader
+
+        self.file = file
+        self.directory = directory
+        self.index = InputFileReader(self._path, directory).index() if index is None else index
+        self._targets = {}
+        # The *INCLUDE keyword lines of the files, see _includeLines()
+        self._includes = None
+        # The first copy of each segment file written, by file and byte range
+        self._segments = {}
+
+    @property
+    def _path(self) -> str:
+        return os.path.join(self.directory, self.file)
+
+    def value(self, path: str):
+        """This method returns the value addressed by a path in the input file.
+
+        Parameters
+        ----------
+        path
+            A String specifying the path of the value, i.e., `'*Material, name=steel/*Elastic[0][0]'`.
+
+        Returns
+        -------
+            The value, an Int, a Float or a String. The values of a data line are returned as a
+            tuple, and the data lines of a keyword as a tuple of tuples.
+
+        Raises
+        ------
+        ValueError
+            If the path does not address a value of the input file.
+        """
+        target = self._target(path)
+        rows = []
+        for fileName, start, end in target.spans:
+            with _mapped(fileName) as buffer:
+                if target.depth == 2:
+                    return _value(buffer[start:end].decode("utf-8", "replace"))
+                for _, _, fields in _rows(buffer, start, end, target.element):
+                    rows.append(tuple(_value(buffer[first:last].decode("utf-8", "replace")) for first, last in fields))
+        return rows[0] if target.depth == 1 else tuple(rows)
+
+    def write(
+        self, fileName: str, values: dict, symbolicLinks: Boolean = False, segments: Boolean = False
+    ):
+        """This method writes a variant of the input file in which values are replaced. The
+        included files are written at the same path relative to the variant as relative to the
+        input file. The files in which no value is replaced are linked, the other files are
+        copied with the new values spliced into their byte ranges. The unchanged bytes are
+        copied by the operating system, which shares them on file systems supporting reflinks.
+        A file included from outside the directory of the input file is not linked, the variant
+        finds it if it is included with an absolute path.
+
+        An included file in which values are replaced is named after the variant, i.e.,
+        `mesh/Job-2_nodes.inp` for the file `mesh/nodes.inp` of the variant `Job-2.inp`, and
+        the *INCLUDE keywords including it are rewritten, so that the variants written to the
+        same directory do not overwrite the included files of each other.
+
+        Parameters
+        ----------
+        fileName
+            A String specifying the path of the variant of the input file.
+        values
+            A Dictionary of the new values by path, see :py:meth:`value`. A value is an Int, a
+            Float or a String, the values of a data line are a sequence, and the data lines of a
+            keyword are a sequence of sequences. Strings are written as is.
+        symbolicLinks
+            A Boolean specifying whether the files in which no value is replaced are linked with
+            symbolic links instead of hard links. A file that cannot be hard linked, i.e., on
+            another file system, is copied. The default is False.
+        segments
+            A Boolean specifying whether the unchanged byte ranges of at least
+            :py:data:`SEGMENT_SIZE` bytes of the changed files are written once to segment files,
+            which are included by the variants with *INCLUDE keywords and are linked when they
+            are needed in another directory. The variants are then written at the cost of the
+            replaced lines. The segment files are named after their file and byte range, i.e.,
+            `Job-1.4096-1048576.inp`, next to the variant. The default is False.
+
+        Raises
+        ------
+        ValueError
+            If a path does not address a value, if two values overlap, if the files of the input
+            file changed since the template was created, or if a variant would overwrite a file of
+            the input file or would not be found by the variant, i.e., a file included from
+            outside the directory of the input file in which values are replaced.
+        """
+        if not self.index.isValid():
+            raise ValueError("The files of the input file {} changed since the template was created".format(self.file))
+        patches = {}
+        for path, value in values.items():
+            target = self._target(path)
+            text = _text(value, target.depth).encode("utf-8")
+            for number, ((name, start, end), (_, lineStart, lineEnd)) in enumerate(zip(target.spans, target.lines)):
+                patches.setdefault(name, []).append((start, end, b"" if number else text, lineStart, lineEnd))
+
+        path = self._path
+        root, base = os.path.dirname(os.path.abspath(fileName)), os.path.dirname(os.path.abspath(path))
+        prefix = os.path.splitext(os.path.basename(fileName))[0] + "_"
+        # The included files in which values are replaced are renamed, the *INCLUDE keywords
+        # including them are rewritten up to the input file
+        renamed = [name for name in patches if name != path]
+        while renamed:
+            name = renamed.pop()
+            for including, included, start, end, lineStart, lineEnd, original in self._includeLines():
+                if included != name:
+                    continue
+                text = '"{}"'.format(os.path.join(os.path.dirname(original), prefix + os.path.basename(original)))
+                if including != path and including not in patches:
+                    renamed.append(including)
+                patches.setdefault(including, []).append((start, end, text.encode("utf-8"), lineStart, lineEnd))
+
+        files = {_location(name) for name in self.index.files}
+        variants = []
+        for name in self.index.files:
+            relative = os.path.relpath(os.path.abspath(name), base)
+            variant = fileName if name == path else os.path.join(root, relative)
+            if name != path and name in patches:
+                variant = os.path.join(os.path.dirname(variant), prefix + os.path.basename(variant))
+            outside = name != path and relative.startswith(os.pardir)
+            filePatches = sorted(patches.get(name, ()))
+            if filePatches:
+                if outside or _location(variant) in files:
+                    raise ValueError("The variant {} of the file {} cannot be written".format(variant, name))
+                for previous, patch in zip(filePatches, filePatches[1:]):
+                    if patch[0] < previous[1] or patch[:2] == previous[:2]:
+                        raise ValueError("Two values of the file {} overlap".format(name))
+            elif outside:
+                # A file included from outside the directory is found at its path
+                continue
+            variants.append((name, variant, filePatches))
+        for name, variant, filePatches in variants:
+            if filePatches:
+                self._splice(name, variant, filePatches, segments, symbolicLinks)
+            else:
+                _link(name, variant, symbolicLinks)
+
+    def _includeLines(self) -> list[tuple]:
+        """Returns the *INCLUDE keyword lines of the files of the input file: the including and
+        the included files, the byte range of the value of the INPUT parameter, the byte range
+        of the keyword line and the value"""
+        if self._includes is not None:
+            return self._includes
+        self._includes = []
+        for including in self.index.files:
+            with _mapped(including) as buffer:
+                line = 0 if buffer[:1] == b"*" else _nextKeywordLine(buffer, 0)
+                while line >= 0:
+                    end = buffer.find(b"\n", line) + 1 or len(buffer)
+                    text = buffer[line:end]
+                    if text[1:2] != b"*" and normalize(parseKeywordLine(text.decode("utf-8", "replace"))[0]) == _INCLUDE:
+                        match = _INPUT.search(text)
+                        if match is not None:
+                            value = match.group(1).strip().strip(b'"').decode("utf-8", "replace")
+                            for directory in (os.path.dirname(including), self.directory):
+                                # The file is located as by the InputFileReader object
+                                included = os.path.normpath(os.path.join(directory, value))
+                                if value and os.path.isfile(included):
+                                    start, stop = line + match.start(1), line + match.end(1)
+                                    self._includes.append((including, included, start, stop, line, end, value))
+                                    break
+                    line = _nextKeywordLine(buffer, end - 1)
+        return self._includes
+
+    def _target(self, path: str) -> _Target:
+        """Returns the byte ranges of the value addressed by a path"""
+        target = self._targets.get(path)
+        if target is not None:
+            return target
+        parts = _PATH_SEPARATOR.split(path.strip())
+        found = _INDICES.search(parts[-1])
+        indices = [int(index) for index in re.findall(r"\d+", found.group())] if found else []
+        if found:
+            parts[-1] = parts[-1][: found.start()]
+        if len(indices) > 2 or not all(part.strip().startswith("*") for part in parts):
+            raise ValueError("{} is not a valid path".format(path))
+
+        ends, positions = self.index._organized()
+        location = None
+        for part in parts:
+            name, parameter = parseKeywordLine(part)
+            key = normalize(name)
+            wanted = {normalize(name): value.upper() for name, value in parameter.items()}
+            for position in positions:
+                location = self.index[position]
+                if normalize(location.name) == key and _matches(location.parameter, wanted):
+                    break
+            else:
+                raise ValueError("The input file {} has no keyword {}".format(self.file, path))
+            positions = _children(ends, position)
+
+        element = normalize(location.name) == _ELEMENT
+        spans, rows = [], 0
+        for number, (fileName, start, end) in enumerate(location.ranges):
+            if number == 0:
+                with _mapped(fileName) as buffer:
+                    start = _dataStart(buffer, start, end)
+            if not indices:
+                spans.append((fileName, start, end))
+                continue
+            with _mapped(fileName) as buffer:
+                for lineStart, lineEnd, fields in _rows(buffer, start, end, element):
+                    if rows < indices[0]:
+                        rows += 1
+                        continue
+                    if len(indices) == 1:
+                        span = (fileName, fields[0][0], fields[-1][1])
+                    elif indices[1] < len(fields):
+                        span = (fileName, fields[indices[1]][0], fields[indices[1]][1])
+                    else:
+                        raise ValueError("The input file {} has no value {}".format(self.file, path))
+                    target = self._targets[path] = _Target(len(indices), element, (span,), ((fileName, lineStart, lineEnd),))
+                    return target
+        if indices:
+            raise ValueError("The input file {} has no value {}".format(self.file, path))
+        target = self._targets[path] = _Target(0, element, tuple(spans), tuple(spans))
+        return target
+
+    def _splice(self, source: str, variant: str, patches: list, segments: bool, symbolicLinks: bool):
+        """Writes the variant of a file with the new text of the byte ranges of the patches"""
+        os.makedirs(os.path.dirname(os.path.abspath(variant)), exist_ok=True)
+        size = os.path.getsize(source)
+        temporary = "{}.{}.tmp".format(variant, os.getpid())
+        try:
+            with open(source, "rb") as file, open(temporary, "wb", buffering=0) as output:
+                if not segments:
+                    position = 0
+                    for start, end, text, _, _ in patches:
+                        _copy(file, output, position, start)
+                        output.write(text)
+                        position = end
+                    _copy(file, output, position, size)
+                else:
+                    # The patches are written with their whole lines, between the unchanged ranges
+                    regions = []
+                    for patch in patches:
+                        if regions and patch[3] < regions[-1][1]:
+                            regions[-1][1] = max(regions[-1][1], patch[4])
+                            regions[-1][2].append(patch)
+                        else:
+                            regions.append([patch[3], patch[4], [patch]])
+                    position = 0
+                    for lineStart, lineEnd, regionPatches in regions:
+                        self._unchanged(file, output, source, variant, position, lineStart, symbolicLinks)
+                        position = lineStart
+                        for start, end, text, _, _ in regionPatches:
+                            _copy(file, output, position, start)
+                            output.write(text)
+                            position = end
+                        _copy(file, output, position, lineEnd)
+                        position = lineEnd
+                    self._unchanged(file, output, source, variant, position, size, symbolicLinks)
+            os.replace(temporary, variant)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+    def _unchanged(self, file, output, source: str, variant: str, start: int, end: int, symbolicLinks: bool):
+        """Writes an unchanged byte range of a file, or includes its segment file"""
+        if end - start < SEGMENT_SIZE:
+            _copy(file, output, start, end)
+            return
+        stem, extension = os.path.splitext(os.path.basename(source))
+        name = "{}.{}-{}{}".format(stem, start, end, extension or ".inp")
+        segment = os.path.join(os.path.dirname(os.path.abspath(variant)), name)
+        written = self._segments.get((source, start, end))
+        if written is None or not os.path.isfile(written):
+            temporary = "{}.{}.tmp".format(segment, os.getpid())
+            try:
+                with open(temporary, "wb", buffering=0) as segmentFile:
+                    _copy(file, segmentFile, start, end)
+                os.replace(temporary, segment)
+            except BaseException:
+                if os.path.exists(temporary):
+                    os.remove(temporary)
+                raise
+            self._segments[source, start, end] = segment
+        elif written != segment:
+            _link(written, segment, symbolicLinks)
+        output.write('*INCLUDE, INPUT="{}"\n'.format(name).encode("utf-8"))
+
+    def __repr__(self):
+        return "InputFileTemplate({!r})".format(self._path)
+
+
+def _matches(parameter: dict, wanted: dict) -> bool:
+    """Returns whether the parameters of a keyword have the wanted values, a parameter without
+    value matches any value"""
+    values = {normalize(name): value.upper() for name, value in parameter.items()}
+    return all(name in values and (not value or value == values[name]) for name, value in wanted.items())
+
+
+def _children(ends: list, position: int) -> list:
+    """Returns the positions of the suboptions of a keyword"""
+    children, child = [], position + 1
+    while child < ends[position]:
+        children.append(child)
+        child = ends[child]
+    return children
+
+
+@contextlib.contextmanager
+def _mapped(fileName: str):
+    """Maps a file in memory"""
+    with open(fileName, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            yield b""
+            return
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield buffer
+    finally:
+        buffer.close()
+
+
+def _location(path: str) -> str:
+    """Returns the path of a file with the symbolic links of its directory resolved"""
+    path = os.path.abspath(path)
+    return os.path.join(os.path.realpath(os.path.dirname(path)), os.path.basename(path))
+
+
+def _dataStart(buffer, start: int, end: int) -> int:
+    """Returns the offset of the first data line of the first byte range of a keyword, after the
+    comments and the keyword line"""
+    position = start
+    while position < end:
+        lineEnd = buffer.find(b"\n", position, end) + 1 or end
+        if buffer[position : position + 1] == b"*" and buffer[position : position + 2] != b"**":
+            # The parameters are continued on the next line
+            while buffer[position:lineEnd].rstrip().endswith(b",") and lineEnd < end:
+                if buffer[lineEnd : lineEnd + 1] == b"*":
+                    break
+                position, lineEnd = lineEnd, buffer.find(b"\n", lineEnd, end) + 1 or end
+            return lineEnd
+        position = lineEnd
+    return position
+
+
+def _rows(buffer, start: int, end: int, element: bool) -> typing.Iterator[tuple]:
+    """Yields the start and the end of the lines of each data line between two offsets, and the
+    byte ranges of its values. The lines of an element ending with a comma are one data line."""
+    line = start
+    while line < end:
+        lineEnd = buffer.find(b"\n", line, end) + 1 or end
+        if buffer[line : line + 2] == b"**" or not buffer[line:lineEnd].strip():
+            line = lineEnd
+            continue
+        rowStart, fields = line, _fields(buffer, line, lineEnd)
+        while element and buffer[line:lineEnd].rstrip().endswith(b",") and lineEnd < end:
+            if buffer[lineEnd : lineEnd + 1] == b"*":
+                break
+            line, lineEnd = lineEnd, buffer.find(b"\n", lineEnd, end) + 1 or end
+            fields += _fields(buffer, line, lineEnd)
+        yield rowStart, lineEnd, fields
+        line = lineEnd
+
+
+def _fields(buffer, start: int, end: int) -> list:
+    """Returns the byte ranges of the values of a line without the blanks, the empty value after
+    a trailing comma is left out"""
+    line = buffer[start:end]
+    if b'"' in line:
+        separators = [match.start() for match in _FIELD_SEPARATOR.finditer(line.rstrip(_BLANKS))]
+    else:
+        separators = [match.start() for match in _COMMA.finditer(line)]
+    fields = []
+    for fieldStart, fieldEnd in zip([0] + [separator + 1 for separator in separators], separators + [len(line)]):
+        text = line[fieldStart:fieldEnd]
+        first = fieldStart + len(text) - len(text.lstrip(_BLANKS))
+        fields.append((start + first, start + max(first, fieldStart + len(text.rstrip(_BLANKS)))))
+    if len(fields) > 1 and fields[-1][0] == fields[-1][1]:
+        fields.pop()
+    return fields
+
+
+def _text(value, depth: int) -> str:
+    """Returns the text of a value, of the values of a data line or of the data lines of a
+    keyword"""
+    if depth == 2 or isinstance(value, str):
+        if isinstance(value, bool) or not isinstance(value, numbers.Real):
+            return str(value)
+        if isinstance(value, numbers.Integral):
+            return str(int(value))
+        return repr(float(value))
+    if depth == 1:
+        return ", ".join(_text(item, 2) for item in value)
+    return "".join(_text(row, 1) + "\n" for row in value)
+
+
+def _link(source: str, target: str, symbolic: bool):
+    """Links a file, a file that cannot be hard linked is copied"""
+    if os.path.exists(target) and os.path.samefile(source, target):
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+    temporary = "{}.{}.tmp".format(target, os.getpid())
+    try:
+        if symbolic:
+            os.symlink(os.path.abspath(source), temporary)
+        else:
+            try:
+                os.link(source, temporary)
+            except OSError:
+                shutil.copyfile(source, temporary)
+        os.replace(temporary, target)
+    except BaseException:
+        if os.path.lexists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def _copy(source, target, start: int, end: int):
+    """Copies a byte range of a file to the end of an unbuffered file, in the kernel if possible"""
+    while start < end:
+        try:
+            copied = os.copy_file_range(source.fileno(), target.fileno(), end - start, start)
+        except (AttributeError, OSError):
+            break
+        if not copied:
+            break
+        start += copied
+    source.seek(start)
+    while start < end:
+        chunk = source.read(min(CHUNK_SIZE, end - start))
+        if not chunk:
+            break
+        target.write(chunk)
+        start += len(chunk)
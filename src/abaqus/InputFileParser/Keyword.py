@@ -1,3 +1,6 @@
+from .KeywordSequence import KeywordSequence
+
+
 class Keyword:
     """The Keyword object is used to store a keyword definition from an Abaqus input file.
     Keyword objects are returned via the InputFile.parse() method.
@@ -9,13 +12,15 @@ class Keyword:
     parameter: dict
         A Dictionary of Strings specifying the keyword parameters.
     data: tuple
-        A sequence of sequences or an :py:class:`~abaqus.InputFileParser.:py:class:`~abaqus.InputFileParser.AbaqusNDarray.AbaqusNDarray`.:py:class:`~abaqus.InputFileParser.AbaqusNDarray.AbaqusNDarray`` object specifying the keyword data. The type
-        of the :py:class:`~.leaf` objects depends on the keyword. The :py:class:`~abaqus.InputFileParser.:py:class:`~abaqus.InputFileParser.AbaqusNDarray.AbaqusNDarray`.:py:class:`~abaqus.InputFileParser.AbaqusNDarray.AbaqusNDarray`` object is returned only if
+        A sequence of sequences or an :py:class:`~abaqus.InputFileParser.AbaqusNDarray.AbaqusNDarray` object specifying the keyword data. The type
+        of the leaf objects depends on the keyword. The :py:class:`~abaqus.InputFileParser.AbaqusNDarray.AbaqusNDarray` object is returned only if
         the data is suitable and if the InputFile.parse() method was called with the option
         usePyArray=True. In cases where large amounts of numerical data (i.e., large node
-        arrays) are expected, it is recommended that you use the option usePyArray=True.
-    suboptions: str
-        A KeywordSequence specifying the suboptions of the keyword.
+        arrays) are expected, it is recommended that you use the option usePyArray=True. The
+        data of the *NSET and *ELSET keywords is the flat sequence of the labels, the ranges of
+        the GENERATE option are expanded.
+    suboptions: KeywordSequence
+        A :py:class:`~abaqus.InputFileParser.KeywordSequence.KeywordSequence` specifying the suboptions of the keyword.
     comments: tuple
         A sequence of Strings specifying the comments.
 
@@ -39,11 +44,49 @@ class Keyword:
     # of the leaf objects depends on the keyword. The AbaqusNDarray object is returned only if
     # the data is suitable and if the InputFile.parse() method was called with the option
     # usePyArray=True. In cases where large amounts of numerical data (i.e., large node
-    # arrays) are expected, it is recommended that you use the option usePyArray=True.
+    # arrays) are expected, it is recommended that you use the option usePyArray=True. The
+    # data of the *NSET and *ELSET keywords is the flat sequence of the labels, the ranges of
+    # the GENERATE option are expanded.
     data: tuple = ()
 
     # A KeywordSequence specifying the suboptions of the keyword.
-    suboptions: str = ""
+    suboptions: KeywordSequence = None
 
     # A sequence of Strings specifying the comments.
     comments: tuple = ()
+
+    def __init__(
+        self,
+        name: str,
+        parameter: dict = None,
+        data: tuple = (),
+        suboptions: KeywordSequence = None,
+        comments: tuple = (),
+    ):
+        self.name = name
+        self.parameter = {} if parameter is None else parameter
+        self.data = data
+        self.suboptions = KeywordSequence() if suboptions is None else suboptions
+        self.comments = comments
+
+    def labels(self):
+        """This method returns the labels of the members of a *NSET or *ELSET keyword as an
+        array.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of ints specifying the labels.
+
+        Raises
+        ------
+        ValueError
+            If the keyword data contains set names instead of labels.
+        """
+        from .InputFileReader import setLabels
+
+        return setLabels(self)
+
+    def __repr__(self):
+        parameters = "".join(", {}={}".format(key, value) if value else ", " + key for key, value in self.parameter.items())
+        return "<Keyword *{}{}>".format(self.name, parameters)
@@ -0,0 +1,218 @@
+import json
+import os
+import typing
+
+from .Keyword import Keyword
+from .KeywordLocation import KeywordLocation
+
+# The version of the layout of a saved index
+VERSION = 1
+
+# The suffix appended to the name of the input file to get the name of its saved index
+SUFFIX = ".index"
+
+
+class KeywordIndex(list):
+    """The KeywordIndex object is a sequence of
+    :py:class:`~abaqus.InputFileParser.KeywordLocation.KeywordLocation` objects, the locations of
+    the keywords of an input file and of the files it includes in the order they are read. It is
+    returned by the InputFile.index() method and is used to parse selected keywords only.
+
+    Attributes
+    ----------
+    files: dict
+        A Dictionary of the size and of the modification time in nanoseconds of each file
+        indexed, by path.
+    includes: tuple
+        A sequence of Strings specifying the paths of the files included by the input file.
+    missingIncludes: tuple
+        A sequence of Strings specifying the included files that could not be located.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        import inpParser
+        inpParser.InputFile('Job-1.inp').index()
+
+    """
+
+    # A Dictionary of the size and of the modification time in nanoseconds of each file
+    # indexed, by path.
+    files: dict = None
+
+    # A sequence of Strings specifying the paths of the files included by the input file.
+    includes: tuple = ()
+
+    # A sequence of Strings specifying the included files that could not be located.
+    missingIncludes: tuple = ()
+
+    def __init__(self, locations: typing.Iterable[KeywordLocation] = (), files: dict = None):
+        super().__init__(locations)
+        self.files = {} if files is None else files
+        self._tree = None
+
+    def find(self, name: str = None, /, **parameters) -> list[int]:
+        """This method returns the positions of the keywords with a name and parameters.
+
+        Parameters
+        ----------
+        name
+            A String specifying the name of the keyword, i.e., `'Material'`. The name is case
+            insensitive and the blanks are ignored. By default, the positions of the keywords
+            that are not suboptions of another keyword are returned.
+        parameters
+            The values of the parameters of the keyword, i.e., `name='steel'`. The values are
+            compared as case insensitive Strings, the value True matches any value.
+
+        Returns
+        -------
+        list[int]
+            The positions of the keywords in the index.
+        """
+        from .InputFileReader import normalize
+
+        if name is None:
+            return list(self._organized()[1])
+        key = normalize(name)
+        wanted = {normalize(name): value for name, value in parameters.items()}
+        positions = []
+        for position, location in enumerate(self):
+            if normalize(location.name) != key:
+                continue
+            values = {normalize(name): value for name, value in location.parameter.items()}
+            if all(
+                name in values and (value is True or str(value).upper() == values[name].upper())
+                for name, value in wanted.items()
+            ):
+                positions.append(position)
+        return positions
+
+    def ranges(self, position: int) -> list[tuple]:
+        """This method returns the byte ranges of a keyword and of its suboptions, as the
+        keywords are organized by the InputFile.parse() method.
+
+        Parameters
+        ----------
+        position
+            An Int specifying the position of the keyword in the index.
+
+        Returns
+        -------
+        list[tuple]
+            A list of tuples of the path of a file, the offset of the start and the offset of
+            the end of a byte range of the file, contiguous ranges are merged.
+        """
+        ranges = []
+        for location in self[position : self._organized()[0][position]]:
+            for path, start, end in location.ranges:
+                if ranges and ranges[-1][0] == path and ranges[-1][2] == start:
+                    ranges[-1] = (path, ranges[-1][1], end)
+                else:
+                    ranges.append((path, start, end))
+        return ranges
+
+    def isValid(self) -> bool:
+        """This method returns whether the indexed files have the recorded size and
+        modification time.
+
+        Returns
+        -------
+        bool
+            True if the index describes the files.
+        """
+        for path, (size, mtime) in self.files.items():
+            try:
+                status = os.stat(path)
+            except OSError:
+                return False
+            if status.st_size != size or status.st_mtime_ns != mtime:
+                return False
+        return True
+
+    def save(self, fileName: str):
+        """This method writes the index to a JSON file, which can be read by
+        :py:func:`loadIndex` in other processes.
+
+        Parameters
+        ----------
+        fileName
+            A String specifying the path of the file.
+        """
+        paths = list(self.files)
+        numbers = {path: number for number, path in enumerate(paths)}
+        document = {
+            "version": VERSION,
+            "files": [[path, size, mtime] for path, (size, mtime) in self.files.items()],
+            "includes": list(self.includes),
+            "missingIncludes": list(self.missingIncludes),
+            "keywords": [
+                [location.name, location.parameter, [[numbers[path], start, end] for path, start, end in location.ranges]]
+                for location in self
+            ],
+        }
+        temporary = "{}.{}.tmp".format(fileName, os.getpid())
+        with open(temporary, "w") as file:
+            json.dump(document, file)
+        os.replace(temporary, fileName)
+
+    def _organized(self) -> tuple[list[int], list[int]]:
+        """Returns the end of the positions of the suboptions of each keyword, and the positions
+        of the keywords that are not suboptions"""
+        if self._tree is None:
+            from .InputFileReader import organize
+
+            keywords = [Keyword(location.name, location.parameter) for location in self]
+            positions = {id(keyword): position for position, keyword in enumerate(keywords)}
+            ends = list(range(1, len(keywords) + 1))
+
+            def walk(sequence):
+                end = 0
+                for keyword in sequence:
+                    position = positions[id(keyword)]
+                    ends[position] = max(ends[position], walk(keyword.suboptions))
+                    end = max(end, ends[position])
+                return end
+
+            top = organize(keywords)
+            walk(top)
+            self._tree = ends, [positions[id(keyword)] for keyword in top]
+        return self._tree
+
+    def __repr__(self):
+        return "KeywordIndex({})".format(super().__repr__())
+
+
+def loadIndex(fileName: str) -> typing.Optional[KeywordIndex]:
+    """This function reads an index written by :py:meth:`KeywordIndex.save`.
+
+    Parameters
+    ----------
+    fileName
+        A String specifying the path of the file.
+
+    Returns
+    -------
+    KeywordIndex
+        A :py:class:`~abaqus.InputFileParser.KeywordIndex.KeywordIndex` object, or None if the
+        file does not exist, was written by another version, or if the indexed files changed.
+    """
+    try:
+        with open(fileName) as file:
+            document = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if document.get("version") != VERSION:
+        return None
+    paths = [path for path, _, _ in document["files"]]
+    index = KeywordIndex(
+        (
+            KeywordLocation(name, parameter, tuple((paths[number], start, end) for number, start, end in ranges))
+            for name, parameter, ranges in document["keywords"]
+        ),
+        {path: (size, mtime) for path, size, mtime in document["files"]},
+    )
+    index.includes, index.missingIncludes = tuple(document["includes"]), tuple(document["missingIncludes"])
+    return index if index.isValid() else None
@@ -0,0 +1,68 @@
+class KeywordLocation:
+    """The KeywordLocation object stores the location of a keyword in an Abaqus input file and
+    in the files it includes. KeywordLocation objects are the items of a
+    :py:class:`~abaqus.InputFileParser.KeywordIndex.KeywordIndex` object.
+
+    Attributes
+    ----------
+    name: str
+        A String specifying the name of the keyword.
+    parameter: dict
+        A Dictionary of Strings specifying the keyword parameters.
+    ranges: tuple
+        A sequence of tuples of the path of a file, the offset of the start and the offset of
+        the end of a byte range of the file. The first range starts with the comments preceding
+        the keyword line, the data of the keyword continues in the following ranges, e.g., in
+        an included file.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        import inpParser
+        inpParser.InputFile('Job-1.inp').index()[i]
+
+    """
+
+    # A String specifying the name of the keyword.
+    name: str = ""
+
+    # A Dictionary of Strings specifying the keyword parameters.
+    parameter: dict = None
+
+    # A sequence of tuples of the path of a file, the offset of the start and the offset of
+    # the end of a byte range of the file. The first range starts with the comments preceding
+    # the keyword line, the data of the keyword continues in the following ranges, e.g., in
+    # an included file.
+    ranges: tuple = ()
+
+    def __init__(self, name: str, parameter: dict, ranges: tuple = ()):
+        self.name = name
+        self.parameter = parameter
+        self.ranges = ranges
+
+    @property
+    def file(self) -> str:
+        """The path of the file of the keyword line."""
+        return self.ranges[0][0]
+
+    @property
+    def start(self) -> int:
+        """The offset of the start of the keyword in its file."""
+        return self.ranges[0][1]
+
+    @property
+    def end(self) -> int:
+        """The offset of the end of the keyword in its file."""
+        return self.ranges[0][2]
+
+    @property
+    def size(self) -> int:
+        """The number of bytes of the ranges of the keyword."""
+        return sum(end - start for _, start, end in self.ranges)
+
+    def __repr__(self):
+        parameters = "".join(", {}={}".format(key, value) if value else ", " + key for key, value in self.parameter.items())
+        return "<KeywordLocation *{}{} {}:{}-{}>".format(self.name, parameters, self.file, self.start, self.end)
@@ -0,0 +1,18 @@
+class KeywordSequence(list):
+    """The KeywordSequence object is a sequence of
+    :py:class:`~abaqus.InputFileParser.Keyword.Keyword` objects. It is returned by the
+    InputFile.parse() method and stores the suboptions of a Keyword object.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        import inpParser
+        inpParser.InputFile('Job-1.inp').parse()
+
+    """
+
+    def __repr__(self):
+        return "KeywordSequence({})".format(super().__repr__())
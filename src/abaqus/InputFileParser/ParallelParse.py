@@ -0,0 +1,200 @@
+"""Parallel parsing of input files.
+
+The keywords of the input file and of the included files are indexed first, see
+:py:meth:`~abaqus.InputFileParser.InputFileReader.InputFileReader.index`. The byte ranges of the
+keywords are split into pieces that are read by worker processes, and the events of the pieces
+are replayed in order by the reader, as the events of the files are when they are read in this
+process.
+"""
+
+import concurrent.futures
+import mmap
+import typing
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy
+
+from .InputFileReader import _ELEMENT, normalize, readEvents
+from .KeywordIndex import KeywordIndex
+
+# The size in bytes of the pieces the byte ranges of the keywords are split into, and of the
+# pieces read by a worker at once
+PIECE_SIZE = 1 << 24
+
+# The size in bytes from which the arrays returned by the workers are sent through shared memory
+SHARED_SIZE = 65536
+
+
+class _SharedArray(typing.NamedTuple):
+    """An array returned by a worker in a shared memory block."""
+
+    name: str
+    dtype: str
+    shape: tuple
+
+
+def splitIndex(path: str, index: KeywordIndex, size: int = PIECE_SIZE) -> list[tuple]:
+    """This function splits the byte ranges of the keywords of an index into pieces that can
+    be read independently, in the order of the keywords. A range is split at the start of a
+    line, not in the middle of an element continued on the next line.
+
+    Parameters
+    ----------
+    path
+        A String specifying the path of the input file.
+    index
+        A :py:class:`~abaqus.InputFileParser.KeywordIndex.KeywordIndex` object of the input file.
+    size
+        An Int specifying the size in bytes of the pieces.
+
+    Returns
+    -------
+    list[tuple]
+        A list of tuples of the path of a file, the offset of the start and the offset of the
+        end of a piece, and the context of the piece, see
+        :py:func:`~abaqus.InputFileParser.InputFileReader.readEvents`. The context is None if
+        the piece starts with a keyword line.
+    """
+    pieces = []
+    # The lines before the first keyword, they are comments or blank lines
+    if index and index[0].file == path and index[0].start:
+        pieces.append((path, 0, index[0].start, None))
+    buffers = {}
+
+    def mapped(fileName):
+        if fileName not in buffers:
+            with open(fileName, "rb") as file:
+                buffers[fileName] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return buffers[fileName]
+
+    try:
+        for location in index:
+            key = normalize(location.name)
+            element = key == _ELEMENT
+            for number, (fileName, start, end) in enumerate(location.ranges):
+                context = (key, location.parameter) if number else None
+                if context and element:
+                    # An element continued in the range is completed by the live reader
+                    previous, _, previousEnd = location.ranges[number - 1]
+                    buffer = mapped(previous)
+                    if buffer[buffer.rfind(b"\n", 0, previousEnd - 1) + 1 : previousEnd].rstrip().endswith(b","):
+                        context = None
+                if end - start <= size:
+                    pieces.append((fileName, start, end, context))
+                    continue
+                buffer = mapped(fileName)
+                while start < end:
+                    split = _lineStart(buffer, start + size, end, element)
+                    pieces.append((fileName, start, split, context))
+                    start, context = split, (key, location.parameter)
+    finally:
+        for buffer in buffers.values():
+            buffer.close()
+    return pieces
+
+
+def parallelEvents(
+    pieces: typing.Sequence[tuple], bulk: bool, usePyArray: bool, workers: int
+) -> typing.Iterator[tuple[str, list]]:
+    """This function reads the events of pieces of files in worker processes and returns them
+    in the order of the pieces. The pieces are grouped in tasks of about
+    :py:data:`PIECE_SIZE` bytes, the arrays of the converted data are sent back through shared
+    memory instead of being pickled.
+
+    Parameters
+    ----------
+    pieces
+        A sequence of pieces returned by :py:func:`splitIndex`.
+    bulk
+        A Boolean specifying whether the data of the *NODE, *ELEMENT, *NSET and *ELSET
+        keywords is parsed.
+    usePyArray
+        A Boolean specifying whether the numeric data is returned as AbaqusNDarray objects.
+    workers
+        An Int specifying the number of worker processes.
+
+    Returns
+    -------
+    typing.Iterator[tuple[str, list]]
+        An iterator of the path of the file and of the events of each piece.
+    """
+    tasks, task, taskSize = [], [], 0
+    for piece in pieces:
+        task.append(piece)
+        taskSize += piece[2] - piece[1]
+        if taskSize >= PIECE_SIZE:
+            tasks.append(task)
+            task, taskSize = [], 0
+    if task:
+        tasks.append(task)
+
+    with concurrent.futures.ProcessPoolExecutor(max(min(workers, len(tasks)), 1)) as executor:
+        futures = [executor.submit(_readTask, task, bulk, usePyArray) for task in tasks]
+        consumed, results = 0, []
+        try:
+            for future in futures:
+                results = future.result()[::-1]
+                consumed += 1
+                while results:
+                    fileName, events = results.pop()
+                    yield fileName, [_unshare(event) for event in events]
+        except BaseException:
+            # The tasks that are not started are cancelled, and the shared memory blocks of the
+            # tasks that are not consumed are released
+            for _, events in results:
+                for event in events:
+                    _unshare(event)
+            remaining = [future for future in futures[consumed:] if not future.cancel()]
+            for future in concurrent.futures.wait(remaining).done:
+                if future.exception() is None:
+                    for _, events in future.result():
+                        for event in events:
+                            _unshare(event)
+            raise
+
+
+def _lineStart(buffer, position: int, end: int, element: bool) -> int:
+    """Returns the start of the first line after a position that does not continue an element,
+    or the end of the range"""
+    while True:
+        found = buffer.find(b"\n", position, end)
+        if found < 0 or found + 1 >= end:
+            return end
+        # An element is continued on the next line if the line ends with a comma
+        if not element or not buffer[buffer.rfind(b"\n", 0, found) + 1 : found].rstrip().endswith(b","):
+            return found + 1
+        position = found + 1
+
+
+def _readTask(task: list, bulk: bool, usePyArray: bool) -> list:
+    return [
+        (fileName, [_share(event) for event in readEvents(fileName, context, bulk, usePyArray, start=start, end=end)])
+        for fileName, start, end, context in task
+    ]
+
+
+def _share(event: tuple) -> tuple:
+    # The large arrays are copied to shared memory blocks, they are released by the parent
+    if event[0] != "state" or event[1][1] is None or event[1][1].nbytes < SHARED_SIZE:
+        return event
+    kind, array, lines, carry = event[1]
+    block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+    numpy.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+    shared = _SharedArray(block.name, array.dtype.str, array.shape)
+    block.close()
+    # The block is unlinked by the parent, not by the resource tracker of the worker
+    resource_tracker.unregister(block._name, "shared_memory")
+    return "state", (kind, shared, lines, carry)
+
+
+def _unshare(event: tuple) -> tuple:
+    if event[0] != "state" or not isinstance(event[1][1], _SharedArray):
+        return event
+    kind, shared, lines, carry = event[1]
+    block = shared_memory.SharedMemory(name=shared.name)
+    try:
+        array = numpy.ndarray(shared.shape, shared.dtype, buffer=block.buf).copy()
+    finally:
+        block.close()
+        block.unlink()
+    return "state", (kind, array, lines, carry)
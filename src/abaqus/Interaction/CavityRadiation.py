@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .Interaction import Interaction
 from ..BasicGeometry.ModelDot import ModelDot
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.RegionArray import RegionArray
 
 
@@ -204,7 +205,7 @@ class CavityRadiation(Interaction):
 
     # A RegionArray object specifying the surfaces for which radiation viewfactor control is
     # being specified.
-    surfaces: RegionArray = RegionArray()
+    surfaces: RegionArray = lazyDefault(RegionArray)
 
     # A tuple of Strings specifying the names of the Cavity Radiation properties containing
     # the surface emissivity data. One name per specified surface. The emissivity data is
@@ -213,15 +214,15 @@ class CavityRadiation(Interaction):
 
     # A ModelDot object specifying the rotation axis point. This argument applies only when
     # *cyclicSymmetry*=ON.
-    cyclicRotPt: ModelDot = ModelDot()
+    cyclicRotPt: ModelDot = lazyDefault(ModelDot)
 
     # A ModelDot object specifying the rotation axis end point. This argument applies only for
     # three-dimensional models, and only when *cyclicSymmetry*=ON.
-    cyclicRotEndPt: ModelDot = ModelDot()
+    cyclicRotEndPt: ModelDot = lazyDefault(ModelDot)
 
     # A ModelDot object specifying the symmetry axis end point. This argument applies only
     # when *cyclicSymmetry*=ON.
-    cyclicSymPt: ModelDot = ModelDot()
+    cyclicSymPt: ModelDot = lazyDefault(ModelDot)
 
     # A tuple of tuples of Floats specifying the two points of the vector that describes the
     # periodic distance for the first periodic symmetry. Each point is defined by a tuple of
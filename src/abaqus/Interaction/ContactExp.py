@@ -12,6 +12,7 @@ from .SurfaceFeatureAssignment import SurfaceFeatureAssignment
 from .SurfaceFrictionAssignment import SurfaceFrictionAssignment
 from .SurfaceOffsetAssignment import SurfaceOffsetAssignment
 from .SurfaceThicknessAssignment import SurfaceThicknessAssignment
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class ContactExp(Interaction):
@@ -74,39 +75,47 @@ class ContactExp(Interaction):
     globalSmoothing: Boolean = ON
 
     # A RegionPairs object specifying the domain pairs included in contact.
-    includedPairs: RegionPairs = RegionPairs()
+    includedPairs: RegionPairs = lazyDefault(RegionPairs)
 
     # A RegionPairs object specifying the domain pairs excluded from contact.
-    excludedPairs: RegionPairs = RegionPairs()
+    excludedPairs: RegionPairs = lazyDefault(RegionPairs)
 
     # A ContactPropertyAssignment object specifying the contact property assignments in the
     # contact domain.
-    contactPropertyAssignments: ContactPropertyAssignment = ContactPropertyAssignment()
+    contactPropertyAssignments: ContactPropertyAssignment = lazyDefault(
+        ContactPropertyAssignment
+    )
 
     # A SurfaceThicknessAssignment object specifying the surface thickness assignments in the
     # contact domain.
-    surfaceThicknessAssignments: SurfaceThicknessAssignment = (
-        SurfaceThicknessAssignment()
+    surfaceThicknessAssignments: SurfaceThicknessAssignment = lazyDefault(
+        SurfaceThicknessAssignment
     )
 
     # A SurfaceOffsetAssignment object specifying the surface offset fraction assignments in
     # the contact domain.
-    surfaceOffsetAssignments: SurfaceOffsetAssignment = SurfaceOffsetAssignment()
+    surfaceOffsetAssignments: SurfaceOffsetAssignment = lazyDefault(
+        SurfaceOffsetAssignment
+    )
 
     # A SurfaceFeatureAssignment object specifying the surface feature angle assignments in
     # the contact domain.
-    surfaceFeatureAssignments: SurfaceFeatureAssignment = SurfaceFeatureAssignment()
+    surfaceFeatureAssignments: SurfaceFeatureAssignment = lazyDefault(
+        SurfaceFeatureAssignment
+    )
 
     # A SmoothingAssignment object specifying the surface smoothing assignments in the contact
     # domain.
-    smoothingAssignments: SmoothingAssignment = SmoothingAssignment()
+    smoothingAssignments: SmoothingAssignment = lazyDefault(SmoothingAssignment)
 
     # A MainSecondaryAssignment object specifying the main-secondary assignments in the
     # contact domain.
-    mainSecondaryAssignments: MainSecondaryAssignment = MainSecondaryAssignment()
+    mainSecondaryAssignments: MainSecondaryAssignment = lazyDefault(
+        MainSecondaryAssignment
+    )
 
     # A PolarityAssignments object specifying the polarity assignments in the contact domain.
-    polarityAssignments: PolarityAssignments = PolarityAssignments()
+    polarityAssignments: PolarityAssignments = lazyDefault(PolarityAssignments)
 
     @typing.overload
     def __init__(
@@ -13,6 +13,7 @@ from .InteractionProperty import InteractionProperty
 from .NormalBehavior import NormalBehavior
 from .Radiation import Radiation
 from .ThermalConductance import ThermalConductance
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class ContactProperty(InteractionProperty):
@@ -60,37 +61,41 @@ class ContactProperty(InteractionProperty):
     """
 
     # A ContactTangentialBehavior object.
-    tangentialBehavior: ContactTangentialBehavior = ContactTangentialBehavior()
+    tangentialBehavior: ContactTangentialBehavior = lazyDefault(
+        ContactTangentialBehavior
+    )
 
     # A NormalBehavior object.
-    normalBehavior: NormalBehavior = NormalBehavior()
+    normalBehavior: NormalBehavior = lazyDefault(NormalBehavior)
 
     # A ContactDamping object.
-    damping: ContactDamping = ContactDamping()
+    damping: ContactDamping = lazyDefault(ContactDamping)
 
     # A ContactDamage object.
-    damage: ContactDamage = ContactDamage(((),))
+    damage: ContactDamage = lazyDefault(ContactDamage, ((),))
 
     # A FractureCriterion object.
-    fractureCriterion: FractureCriterion = FractureCriterion(((),))
+    fractureCriterion: FractureCriterion = lazyDefault(FractureCriterion, ((),))
 
     # A CohesiveBehavior object.
-    cohesiveBehavior: CohesiveBehavior = CohesiveBehavior()
+    cohesiveBehavior: CohesiveBehavior = lazyDefault(CohesiveBehavior)
 
     # A ThermalConductance object.
-    thermalConductance: ThermalConductance = ThermalConductance()
+    thermalConductance: ThermalConductance = lazyDefault(ThermalConductance)
 
     # A GapHeatGeneration object.
-    heatGeneration: GapHeatGeneration = GapHeatGeneration()
+    heatGeneration: GapHeatGeneration = lazyDefault(GapHeatGeneration)
 
     # A Radiation object.
     radiation: Radiation = None
 
     # A GeometricProperties object.
-    geometricProperties: GeometricProperties = GeometricProperties()
+    geometricProperties: GeometricProperties = lazyDefault(GeometricProperties)
 
     # A GapElectricalConductance object.
-    electricalConductance: GapElectricalConductance = GapElectricalConductance()
+    electricalConductance: GapElectricalConductance = lazyDefault(
+        GapElectricalConductance
+    )
 
     def __init__(self, name: str):
         """This method creates a ContactProperty object.
@@ -15,6 +15,7 @@ from .SurfaceFeatureAssignment import SurfaceFeatureAssignment
 from .SurfaceOffsetAssignment import SurfaceOffsetAssignment
 from .SurfaceThicknessAssignment import SurfaceThicknessAssignment
 from .SurfaceVertexCriteriaAssignment import SurfaceVertexCriteriaAssignment
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class ContactStd(Interaction):
@@ -89,49 +90,61 @@ class ContactStd(Interaction):
     globalSmoothing: Boolean = ON
 
     # A RegionPairs object specifying the domain pairs included in contact.
-    includedPairs: RegionPairs = RegionPairs()
+    includedPairs: RegionPairs = lazyDefault(RegionPairs)
 
     # A RegionPairs object specifying the domain pairs excluded from contact.
-    excludedPairs: RegionPairs = RegionPairs()
+    excludedPairs: RegionPairs = lazyDefault(RegionPairs)
 
     # A ContactPropertyAssignment object specifying the contact property assignments in the
     # contact domain.
-    contactPropertyAssignments: ContactPropertyAssignment = ContactPropertyAssignment()
+    contactPropertyAssignments: ContactPropertyAssignment = lazyDefault(
+        ContactPropertyAssignment
+    )
 
     # A SurfaceThicknessAssignment object specifying the surface thickness assignments in the
     # contact domain.
-    surfaceThicknessAssignments: SurfaceThicknessAssignment = (
-        SurfaceThicknessAssignment()
+    surfaceThicknessAssignments: SurfaceThicknessAssignment = lazyDefault(
+        SurfaceThicknessAssignment
     )
 
     # A SurfaceOffsetAssignment object specifying the surface offset fraction assignments in
     # the contact domain.
-    surfaceOffsetAssignments: SurfaceOffsetAssignment = SurfaceOffsetAssignment()
+    surfaceOffsetAssignments: SurfaceOffsetAssignment = lazyDefault(
+        SurfaceOffsetAssignment
+    )
 
     # A MainSecondaryAssignment object specifying the main-secondary assignments in the
     # contact domain.
-    mainSecondaryAssignments: MainSecondaryAssignment = MainSecondaryAssignment()
+    mainSecondaryAssignments: MainSecondaryAssignment = lazyDefault(
+        MainSecondaryAssignment
+    )
 
     # An InitializationAssignment object specifying the contact initialization assignments in
     # the contact domain.
-    initializationAssignments: InitializationAssignment = InitializationAssignment()
+    initializationAssignments: InitializationAssignment = lazyDefault(
+        InitializationAssignment
+    )
 
     # A StabilizationAssignment object specifying the contact stabilization assignments in the
     # contact domain.
-    stabilizationAssignments: StabilizationAssignment = StabilizationAssignment()
+    stabilizationAssignments: StabilizationAssignment = lazyDefault(
+        StabilizationAssignment
+    )
 
     # A SmoothingAssignment object specifying the surface smoothing assignments in the contact
     # domain.
-    smoothingAssignments: SmoothingAssignment = SmoothingAssignment()
+    smoothingAssignments: SmoothingAssignment = lazyDefault(SmoothingAssignment)
 
     # A SurfaceFeatureAssignment object specifying the surface feature angle assignments in
     # the contact domain.
-    surfaceFeatureAssignments: SurfaceFeatureAssignment = SurfaceFeatureAssignment()
+    surfaceFeatureAssignments: SurfaceFeatureAssignment = lazyDefault(
+        SurfaceFeatureAssignment
+    )
 
     # A SlidingTransitionAssignments object specifying the sliding transition assignments in
     # the contact domain.
-    slidingTransitionAssignments: SlidingTransitionAssignment = (
-        SlidingTransitionAssignment()
+    slidingTransitionAssignments: SlidingTransitionAssignment = lazyDefault(
+        SlidingTransitionAssignment
     )
 
     # A Boolean specifying whether to assign the edge-to-edge formulation. The default value
@@ -1,8 +1,14 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .ExpContactControl import ExpContactControl
-from .StdContactControl import StdContactControl
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from .ExpContactControl import ExpContactControl
+    from .StdContactControl import StdContactControl
+
 
 class InteractionContactControlModel(ModelBase):
     def ExpContactControl(
@@ -59,6 +65,7 @@ class InteractionContactControlModel(ModelBase):
         ------
             RangeError.
         """
+        from .ExpContactControl import ExpContactControl
         self.contactControls[name] = contactControl = ExpContactControl(
             name,
             globTrkChoice,
@@ -193,6 +200,7 @@ class InteractionContactControlModel(ModelBase):
         ------
             RangeError.
         """
+        from .StdContactControl import StdContactControl
         self.contactControls[name] = contactControl = StdContactControl(
             name,
             stiffnessScaleFactor,
@@ -1,8 +1,14 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .ExpInitialization import ExpInitialization
-from .StdInitialization import StdInitialization
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from .ExpInitialization import ExpInitialization
+    from .StdInitialization import StdInitialization
+
 
 class InteractionContactInitializationModel(ModelBase):
     def ExpInitialization(
@@ -72,6 +78,7 @@ class InteractionContactInitializationModel(ModelBase):
         ------
             RangeError.
         """
+        from .ExpInitialization import ExpInitialization
         self.contactInitializations[name] = contactInitialization = ExpInitialization(
             name,
             overclosureType,
@@ -135,6 +142,7 @@ class InteractionContactInitializationModel(ModelBase):
         ------
             RangeError.
         """
+        from .StdInitialization import StdInitialization
         self.contactInitializations[name] = contactInitialization = StdInitialization(
             name,
             overclosureType,
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
@@ -8,61 +10,63 @@ from .MainSecondaryAssignment import MainSecondaryAssignment
 from .PolarityAssignments import PolarityAssignments
 from ..BasicGeometry.ModelDot import ModelDot
 from ..Datum.DatumAxis import DatumAxis
-from ..Interaction.AcousticImpedance import AcousticImpedance
-from ..Interaction.AcousticImpedanceProp import AcousticImpedanceProp
-from ..Interaction.ActuatorSensor import ActuatorSensor
-from ..Interaction.ActuatorSensorProp import ActuatorSensorProp
-from ..Interaction.CavityRadiation import CavityRadiation
-from ..Interaction.CavityRadiationProp import CavityRadiationProp
-from ..Interaction.ConcentratedFilmCondition import ConcentratedFilmCondition
-from ..Interaction.ConcentratedRadiationToAmbient import ConcentratedRadiationToAmbient
-from ..Interaction.ContactExp import ContactExp
-from ..Interaction.ContactProperty import ContactProperty
 from ..Interaction.ContactPropertyAssignment import ContactPropertyAssignment
-from ..Interaction.ContactStd import ContactStd
-from ..Interaction.CyclicSymmetry import CyclicSymmetry
-from ..Interaction.ElasticFoundation import ElasticFoundation
-from ..Interaction.ExpContactControl import ExpContactControl
-from ..Interaction.ExpInitialization import ExpInitialization
-from ..Interaction.FilmCondition import FilmCondition
-from ..Interaction.FilmConditionProp import FilmConditionProp
-from ..Interaction.FluidCavity import FluidCavity
-from ..Interaction.FluidCavityProperty import FluidCavityProperty
-from ..Interaction.FluidExchange import FluidExchange
-from ..Interaction.FluidExchangeProperty import FluidExchangeProperty
-from ..Interaction.FluidInflator import FluidInflator
-from ..Interaction.FluidInflatorProperty import FluidInflatorProperty
-from ..Interaction.IncidentWave import IncidentWave
-from ..Interaction.IncidentWaveProperty import IncidentWaveProperty
 from ..Interaction.InitializationAssignment import InitializationAssignment
-from ..Interaction.ModelChange import ModelChange
-from ..Interaction.PressurePenetration import PressurePenetration
-from ..Interaction.RadiationToAmbient import RadiationToAmbient
 from ..Interaction.RegionPairs import RegionPairs
-from ..Interaction.SelfContactExp import SelfContactExp
-from ..Interaction.SelfContactStd import SelfContactStd
 from ..Interaction.SlidingFormulationAssignment import SlidingFormulationAssignment
 from ..Interaction.SlidingTransitionAssignment import SlidingTransitionAssignment
 from ..Interaction.SmoothingAssignment import SmoothingAssignment
 from ..Interaction.StabilizationAssignment import StabilizationAssignment
-from ..Interaction.StdContactControl import StdContactControl
-from ..Interaction.StdInitialization import StdInitialization
-from ..Interaction.StdStabilization import StdStabilization
-from ..Interaction.StdXplCosimulation import StdXplCosimulation
 from ..Interaction.SurfaceBeamSmoothingAssignment import SurfaceBeamSmoothingAssignment
 from ..Interaction.SurfaceCrushTriggerAssignment import SurfaceCrushTriggerAssignment
 from ..Interaction.SurfaceFeatureAssignment import SurfaceFeatureAssignment
 from ..Interaction.SurfaceFrictionAssignment import SurfaceFrictionAssignment
 from ..Interaction.SurfaceOffsetAssignment import SurfaceOffsetAssignment
 from ..Interaction.SurfaceThicknessAssignment import SurfaceThicknessAssignment
-from ..Interaction.SurfaceToSurfaceContactExp import SurfaceToSurfaceContactExp
-from ..Interaction.SurfaceToSurfaceContactStd import SurfaceToSurfaceContactStd
 from ..Interaction.SurfaceVertexCriteriaAssignment import (
     SurfaceVertexCriteriaAssignment,
 )
-from ..Interaction.XFEMCrackGrowth import XFEMCrackGrowth
 from ..Region.Region import Region
-from ..Region.RegionArray import RegionArray
+
+if typing.TYPE_CHECKING:
+    from ..Interaction.AcousticImpedance import AcousticImpedance
+    from ..Interaction.AcousticImpedanceProp import AcousticImpedanceProp
+    from ..Interaction.ActuatorSensor import ActuatorSensor
+    from ..Interaction.ActuatorSensorProp import ActuatorSensorProp
+    from ..Interaction.CavityRadiation import CavityRadiation
+    from ..Interaction.CavityRadiationProp import CavityRadiationProp
+    from ..Interaction.ConcentratedFilmCondition import ConcentratedFilmCondition
+    from ..Interaction.ConcentratedRadiationToAmbient import ConcentratedRadiationToAmbient
+    from ..Interaction.ContactExp import ContactExp
+    from ..Interaction.ContactProperty import ContactProperty
+    from ..Interaction.ContactStd import ContactStd
+    from ..Interaction.CyclicSymmetry import CyclicSymmetry
+    from ..Interaction.ElasticFoundation import ElasticFoundation
+    from ..Interaction.ExpContactControl import ExpContactControl
+    from ..Interaction.ExpInitialization import ExpInitialization
+    from ..Interaction.FilmCondition import FilmCondition
+    from ..Interaction.FilmConditionProp import FilmConditionProp
+    from ..Interaction.FluidCavity import FluidCavity
+    from ..Interaction.FluidCavityProperty import FluidCavityProperty
+    from ..Interaction.FluidExchange import FluidExchange
+    from ..Interaction.FluidExchangeProperty import FluidExchangeProperty
+    from ..Interaction.FluidInflator import FluidInflator
+    from ..Interaction.FluidInflatorProperty import FluidInflatorProperty
+    from ..Interaction.IncidentWave import IncidentWave
+    from ..Interaction.IncidentWaveProperty import IncidentWaveProperty
+    from ..Interaction.ModelChange import ModelChange
+    from ..Interaction.PressurePenetration import PressurePenetration
+    from ..Interaction.RadiationToAmbient import RadiationToAmbient
+    from ..Interaction.SelfContactExp import SelfContactExp
+    from ..Interaction.SelfContactStd import SelfContactStd
+    from ..Interaction.StdContactControl import StdContactControl
+    from ..Interaction.StdInitialization import StdInitialization
+    from ..Interaction.StdStabilization import StdStabilization
+    from ..Interaction.StdXplCosimulation import StdXplCosimulation
+    from ..Interaction.SurfaceToSurfaceContactExp import SurfaceToSurfaceContactExp
+    from ..Interaction.SurfaceToSurfaceContactStd import SurfaceToSurfaceContactStd
+    from ..Interaction.XFEMCrackGrowth import XFEMCrackGrowth
+    from ..Region.RegionArray import RegionArray
 
 
 class InteractionModel(
@@ -280,6 +284,7 @@ class InteractionModel(
         -------
             An AcousticImpedance object.
         """
+        from ..Interaction.AcousticImpedance import AcousticImpedance
         self.interactions[name] = interaction = AcousticImpedance(
             name,
             createStepName,
@@ -334,6 +339,7 @@ class InteractionModel(
         -------
             An AcousticImpedanceProp object.
         """
+        from ..Interaction.AcousticImpedanceProp import AcousticImpedanceProp
         self.interactions[name] = interaction = AcousticImpedanceProp(
             name, tableType, table, frequencyDependency
         )
@@ -392,6 +398,7 @@ class InteractionModel(
         -------
             An ActuatorSensor object.
         """
+        from ..Interaction.ActuatorSensor import ActuatorSensor
         self.interactions[name] = interaction = ActuatorSensor(
             name,
             createStepName,
@@ -434,6 +441,7 @@ class InteractionModel(
         -------
             An ActuatorSensorProp object.
         """
+        from ..Interaction.ActuatorSensorProp import ActuatorSensorProp
         self.interactions[name] = interaction = ActuatorSensorProp(
             name, realProperties, integerProperties
         )
@@ -649,6 +657,7 @@ class InteractionModel(
         -------
             A CavityRadiation object.
         """
+        from ..Interaction.CavityRadiation import CavityRadiation
         self.interactions[name] = interaction = CavityRadiation(
             name,
             createStepName,
@@ -726,6 +735,7 @@ class InteractionModel(
         -------
             A CavityRadiationProp object.
         """
+        from ..Interaction.CavityRadiationProp import CavityRadiationProp
         self.interactions[name] = interaction = CavityRadiationProp(
             name, temperatureDependency, dependencies, property
         )
@@ -820,6 +830,7 @@ class InteractionModel(
         -------
             A ConcentratedFilmCondition object.
         """
+        from ..Interaction.ConcentratedFilmCondition import ConcentratedFilmCondition
         self.interactions[name] = interaction = ConcentratedFilmCondition(
             name,
             createStepName,
@@ -901,6 +912,7 @@ class InteractionModel(
         -------
             A ConcentratedRadiationToAmbient object.
         """
+        from ..Interaction.ConcentratedRadiationToAmbient import ConcentratedRadiationToAmbient
         self.interactions[name] = interaction = ConcentratedRadiationToAmbient(
             name,
             createStepName,
@@ -991,6 +1003,7 @@ class InteractionModel(
         -------
             A ContactExp object.
         """
+        from ..Interaction.ContactExp import ContactExp
         self.interactions[name] = interaction = ContactExp(
             name,
             createStepName,
@@ -1030,6 +1043,7 @@ class InteractionModel(
         -------
             A ContactProperty object.
         """
+        from ..Interaction.ContactProperty import ContactProperty
         interactionProperties = ContactProperty(name)
         self.interactions[name] = interactionProperties
         self.interactionProperties[name] = interactionProperties
@@ -1123,6 +1137,7 @@ class InteractionModel(
         -------
             A ContactStd object.
         """
+        from ..Interaction.ContactStd import ContactStd
         self.interactions[name] = interaction = ContactStd(
             name,
             createStepName,
@@ -1227,6 +1242,7 @@ class InteractionModel(
         -------
             A CyclicSymmetry object.
         """
+        from ..Interaction.CyclicSymmetry import CyclicSymmetry
         self.interactions[name] = interaction = CyclicSymmetry(
             name,
             createStepName,
@@ -1274,6 +1290,7 @@ class InteractionModel(
         -------
             An ElasticFoundation object.
         """
+        from ..Interaction.ElasticFoundation import ElasticFoundation
         self.interactions[name] = interaction = ElasticFoundation(
             name, createStepName, surface, stiffness
         )
@@ -1333,6 +1350,7 @@ class InteractionModel(
         ------
             RangeError.
         """
+        from ..Interaction.ExpContactControl import ExpContactControl
         self.interactions[name] = interaction = ExpContactControl(
             name,
             globTrkChoice,
@@ -1411,6 +1429,7 @@ class InteractionModel(
         ------
             RangeError.
         """
+        from ..Interaction.ExpInitialization import ExpInitialization
         self.interactions[name] = interaction = ExpInitialization(
             name,
             overclosureType,
@@ -1502,6 +1521,7 @@ class InteractionModel(
         -------
             A FilmCondition object.
         """
+        from ..Interaction.FilmCondition import FilmCondition
         self.interactions[name] = interaction = FilmCondition(
             name,
             createStepName,
@@ -1555,6 +1575,7 @@ class InteractionModel(
         -------
             A FilmConditionProp object.
         """
+        from ..Interaction.FilmConditionProp import FilmConditionProp
         self.interactions[name] = interaction = FilmConditionProp(
             name, temperatureDependency, dependencies, property
         )
@@ -1611,6 +1632,7 @@ class InteractionModel(
         -------
             A FluidCavity object.
         """
+        from ..Interaction.FluidCavity import FluidCavity
         self.interactions[name] = interaction = FluidCavity(
             name,
             createStepName,
@@ -1752,6 +1774,7 @@ class InteractionModel(
         -------
             A FluidCavityProperty object.
         """
+        from ..Interaction.FluidCavityProperty import FluidCavityProperty
         self.interactions[name] = interaction = FluidCavityProperty(
             name,
             definition,
@@ -1818,6 +1841,7 @@ class InteractionModel(
         -------
             A FluidExchange object.
         """
+        from ..Interaction.FluidExchange import FluidExchange
         self.interactions[name] = interaction = FluidExchange(
             name,
             createStepName,
@@ -1914,6 +1938,7 @@ class InteractionModel(
         -------
             A FluidExchangeProperty object.
         """
+        from ..Interaction.FluidExchangeProperty import FluidExchangeProperty
         self.interactions[name] = interaction = FluidExchangeProperty(
             name,
             dataTable,
@@ -1964,6 +1989,7 @@ class InteractionModel(
         -------
             A FluidInflator object.
         """
+        from ..Interaction.FluidInflator import FluidInflator
         self.interactions[name] = interaction = FluidInflator(
             name,
             createStepName,
@@ -2036,6 +2062,7 @@ class InteractionModel(
         -------
             A FluidInflatorProperty object.
         """
+        from ..Interaction.FluidInflatorProperty import FluidInflatorProperty
         self.interactions[name] = interaction = FluidInflatorProperty(
             name,
             definition,
@@ -2132,6 +2159,7 @@ class InteractionModel(
         -------
             An IncidentWave object.
         """
+        from ..Interaction.IncidentWave import IncidentWave
         self.interactions[name] = interaction = IncidentWave(
             name,
             createStepName,
@@ -2319,6 +2347,7 @@ class InteractionModel(
         -------
             An IncidentWaveProperty object.
         """
+        from ..Interaction.IncidentWaveProperty import IncidentWaveProperty
         self.interactions[name] = interaction = IncidentWaveProperty(
             name,
             definition,
@@ -2404,6 +2433,7 @@ class InteractionModel(
         -------
             A ModelChange object.
         """
+        from ..Interaction.ModelChange import ModelChange
         self.interactions[name] = interaction = ModelChange(
             name,
             createStepName,
@@ -2471,6 +2501,7 @@ class InteractionModel(
         -------
             A PressurePenetration object.
         """
+        from ..Interaction.PressurePenetration import PressurePenetration
         self.interactions[name] = interaction = PressurePenetration(
             name,
             createStepName,
@@ -2544,6 +2575,7 @@ class InteractionModel(
         -------
             A RadiationToAmbient object.
         """
+        from ..Interaction.RadiationToAmbient import RadiationToAmbient
         self.interactions[name] = interaction = RadiationToAmbient(
             name,
             createStepName,
@@ -2599,6 +2631,7 @@ class InteractionModel(
         -------
             A SelfContactExp object.
         """
+        from ..Interaction.SelfContactExp import SelfContactExp
         self.interactions[name] = interaction = SelfContactExp(
             name,
             createStepName,
@@ -2660,6 +2693,7 @@ class InteractionModel(
         -------
             A SelfContactStd object.
         """
+        from ..Interaction.SelfContactStd import SelfContactStd
         self.interactions[name] = interaction = SelfContactStd(
             name,
             createStepName,
@@ -2795,6 +2829,7 @@ class InteractionModel(
         ------
             RangeError.
         """
+        from ..Interaction.StdContactControl import StdContactControl
         self.interactions[name] = interaction = StdContactControl(
             name,
             stiffnessScaleFactor,
@@ -2867,6 +2902,7 @@ class InteractionModel(
         ------
             RangeError.
         """
+        from ..Interaction.StdInitialization import StdInitialization
         self.interactions[name] = interaction = StdInitialization(
             name,
             overclosureType,
@@ -2929,6 +2965,7 @@ class InteractionModel(
         ------
             RangeError.
         """
+        from ..Interaction.StdStabilization import StdStabilization
         self.interactions[name] = interaction = StdStabilization(
             name,
             zeroDistance,
@@ -2986,6 +3023,7 @@ class InteractionModel(
         -------
             A StdXplCosimulation object.
         """
+        from ..Interaction.StdXplCosimulation import StdXplCosimulation
         self.interactions[name] = interaction = StdXplCosimulation(
             name, createStepName, region, incrementation, stepSize, stepSizeDefinition
         )
@@ -3080,6 +3118,7 @@ class InteractionModel(
         -------
             A SurfaceToSurfaceContactExp object.
         """
+        from ..Interaction.SurfaceToSurfaceContactExp import SurfaceToSurfaceContactExp
         self.interactions[name] = interaction = SurfaceToSurfaceContactExp(
             name,
             createStepName,
@@ -3264,6 +3303,7 @@ class InteractionModel(
         -------
             A SurfaceToSurfaceContactStd object.
         """
+        from ..Interaction.SurfaceToSurfaceContactStd import SurfaceToSurfaceContactStd
         self.interactions[name] = interaction = SurfaceToSurfaceContactStd(
             name,
             createStepName,
@@ -3330,6 +3370,7 @@ class InteractionModel(
         -------
             A XFEMCrackGrowth object.
         """
+        from ..Interaction.XFEMCrackGrowth import XFEMCrackGrowth
         self.interactions[name] = interaction = XFEMCrackGrowth(
             name, createStepName, crackName, allowGrowth
         )
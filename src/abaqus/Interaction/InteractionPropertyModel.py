@@ -1,15 +1,21 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .AcousticImpedanceProp import AcousticImpedanceProp
-from .ActuatorSensorProp import ActuatorSensorProp
-from .CavityRadiationProp import CavityRadiationProp
-from .ContactProperty import ContactProperty
-from .FilmConditionProp import FilmConditionProp
-from .FluidCavityProperty import FluidCavityProperty
-from .FluidExchangeProperty import FluidExchangeProperty
-from .FluidInflatorProperty import FluidInflatorProperty
-from .IncidentWaveProperty import IncidentWaveProperty
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from .AcousticImpedanceProp import AcousticImpedanceProp
+    from .ActuatorSensorProp import ActuatorSensorProp
+    from .CavityRadiationProp import CavityRadiationProp
+    from .ContactProperty import ContactProperty
+    from .FilmConditionProp import FilmConditionProp
+    from .FluidCavityProperty import FluidCavityProperty
+    from .FluidExchangeProperty import FluidExchangeProperty
+    from .FluidInflatorProperty import FluidInflatorProperty
+    from .IncidentWaveProperty import IncidentWaveProperty
+
 
 class InteractionPropertyModel(ModelBase):
     def AcousticImpedanceProp(
@@ -51,6 +57,7 @@ class InteractionPropertyModel(ModelBase):
         -------
             An AcousticImpedanceProp object.
         """
+        from .AcousticImpedanceProp import AcousticImpedanceProp
         self.interactionProperties[name] = interactionProperty = AcousticImpedanceProp(
             name, tableType, table, frequencyDependency
         )
@@ -84,6 +91,7 @@ class InteractionPropertyModel(ModelBase):
         -------
             An ActuatorSensorProp object.
         """
+        from .ActuatorSensorProp import ActuatorSensorProp
         self.interactionProperties[name] = interactionProperty = ActuatorSensorProp(
             name, realProperties, integerProperties
         )
@@ -123,6 +131,7 @@ class InteractionPropertyModel(ModelBase):
         -------
             A CavityRadiationProp object.
         """
+        from .CavityRadiationProp import CavityRadiationProp
         self.interactionProperties[name] = interactionProperty = CavityRadiationProp(
             name, temperatureDependency, dependencies, property
         )
@@ -148,6 +157,7 @@ class InteractionPropertyModel(ModelBase):
         -------
             A ContactProperty object.
         """
+        from .ContactProperty import ContactProperty
         self.interactionProperties[name] = interactionProperty = ContactProperty(name)
         return interactionProperty
 
@@ -188,6 +198,7 @@ class InteractionPropertyModel(ModelBase):
         -------
             A FilmConditionProp object.
         """
+        from .FilmConditionProp import FilmConditionProp
         self.interactionProperties[name] = interactionProperty = FilmConditionProp(
             name, temperatureDependency, dependencies, property
         )
@@ -321,6 +332,7 @@ class InteractionPropertyModel(ModelBase):
         -------
             A FluidCavityProperty object.
         """
+        from .FluidCavityProperty import FluidCavityProperty
         self.interactionProperties[name] = interactionProperty = FluidCavityProperty(
             name,
             definition,
@@ -428,6 +440,7 @@ class InteractionPropertyModel(ModelBase):
         -------
             A FluidExchangeProperty object.
         """
+        from .FluidExchangeProperty import FluidExchangeProperty
         self.interactionProperties[name] = interactionProperty = FluidExchangeProperty(
             name,
             dataTable,
@@ -500,6 +513,7 @@ class InteractionPropertyModel(ModelBase):
         -------
             A FluidInflatorProperty object.
         """
+        from .FluidInflatorProperty import FluidInflatorProperty
         self.interactionProperties[name] = interactionProperty = FluidInflatorProperty(
             name,
             definition,
@@ -684,6 +698,7 @@ class InteractionPropertyModel(ModelBase):
         -------
             An IncidentWaveProperty object.
         """
+        from .IncidentWaveProperty import IncidentWaveProperty
         self.interactionProperties[name] = interactionProperty = IncidentWaveProperty(
             name,
             definition,
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .Interaction import Interaction
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.RegionArray import RegionArray
 
 
@@ -51,11 +52,11 @@ class PressurePenetration(Interaction):
 
     # A RegionArray object specifying the points on the main surface that are exposed to the
     # fluid.
-    mainPoints: RegionArray = RegionArray()
+    mainPoints: RegionArray = lazyDefault(RegionArray)
 
     # A RegionArray object specifying the points on the secondary surface that are exposed to
     # the fluid.
-    secondaryPoints: RegionArray = RegionArray()
+    secondaryPoints: RegionArray = lazyDefault(RegionArray)
 
     def __init__(
         self,
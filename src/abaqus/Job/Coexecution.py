@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .Job import Job
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class Coexecution:
@@ -113,7 +114,7 @@ class Coexecution:
     atTime: str = ""
 
     # A repository of Job objects specifying the jobs that comprise this co-execution.
-    jobs: dict[str, Job] = dict[str, Job]()
+    jobs: dict[str, Job] = lazyDefault(dict[str, Job])
 
     # A tuple of Strings specifying the names of the secondary models for the co-execution.
     secondaryModels: tuple = ()
@@ -0,0 +1,703 @@
+import numbers
+import os
+import re
+import typing
+
+from abaqusConstants import *
+
+# The number of rows of mesh data or of set labels formatted at once
+CHUNK_ROWS = 65536
+
+# The number of significant digits of the Floats of the mesh data
+PRECISION = 12
+
+# The maximum number of entries on a data line, the entries of a longer row continue on the
+# next lines
+ENTRIES_PER_LINE = 16
+
+# The maximum number of entries on a data line of the tables of material data
+TABLE_ENTRIES_PER_LINE = 8
+
+# The values of the parameters that must be quoted
+_QUOTED = re.compile(r"[\s,=]")
+
+# The components of the degrees of freedom of a DisplacementBC object
+_DISPLACEMENTS = ("u1", "u2", "u3", "ur1", "ur2", "ur3")
+
+# The components of the force of a ConcentratedForce object
+_FORCES = ("cf1", "cf2", "cf3")
+
+# The members of a Material object that are written, the other behaviors cannot be written
+_MATERIAL_MEMBERS = ("name", "description", "materialIdentifier", "density", "elastic", "plastic")
+
+
+class InputFileWriter:
+    """The InputFileWriter object writes an Abaqus input file keyword by keyword. The nodes,
+    the elements and the labels of the sets are formatted by blocks of rows with numpy and are
+    written as they are formatted, so that the size of a model does not change the memory used
+    to write it. The file is written next to its path and renamed when the writer is closed, so
+    that an input file is either complete or missing.
+
+    Attributes
+    ----------
+    fileName: str
+        A String specifying the path of the input file.
+    precision: int
+        An Int specifying the number of significant digits of the Floats of the mesh data.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.Job.InputFileWriter import InputFileWriter
+
+    """
+
+    # A String specifying the path of the input file.
+    fileName: str = ""
+
+    # An Int specifying the number of significant digits of the Floats of the mesh data.
+    precision: int = PRECISION
+
+    def __init__(self, fileName: str, precision: int = PRECISION):
+        """This method creates an InputFileWriter object and opens the file.
+
+        Parameters
+        ----------
+        fileName
+            A String specifying the path of the input file.
+        precision
+            An Int specifying the number of significant digits of the Floats of the mesh data.
+            The default value is 12.
+        """
+        self.fileName = fileName
+        self.precision = precision
+        self._temporary = "{}.{}.tmp".format(fileName, os.getpid())
+        self._file = open(self._temporary, "wb")
+
+    def comment(self, text: str = ""):
+        """This method writes comment lines.
+
+        Parameters
+        ----------
+        text
+            A String specifying the text of the comment, a line is written for each line of the
+            text.
+        """
+        self._file.write("".join("** {}\n".format(line).replace(" \n", "\n") for line in text.split("\n")).encode())
+
+    def keyword(self, name: str, parameter: dict = None):
+        """This method writes a keyword line.
+
+        Parameters
+        ----------
+        name
+            A String specifying the name of the keyword, i.e., `'Element'`.
+        parameter
+            A Dictionary of the parameters of the keyword, i.e., `{'type': 'C3D8R'}`. A parameter
+            whose value is an empty String or None is written without value, a String containing
+            blanks is quoted.
+        """
+        fields = [name]
+        for key, value in (parameter or {}).items():
+            if value is None or value == "":
+                fields.append(key)
+            elif isinstance(value, str):
+                fields.append('{}="{}"'.format(key, value) if _QUOTED.search(value) else "{}={}".format(key, value))
+            else:
+                # The words of a SymbolicConstant are separated by blanks, i.e., LONG TERM
+                fields.append("{}={}".format(key, _entry(value).replace("_", " ")))
+        self._file.write("*{}\n".format(", ".join(fields)).encode())
+
+    def dataLine(self, values: typing.Sequence, entriesPerLine: int = ENTRIES_PER_LINE):
+        """This method writes the values of a data line, a row that has more entries than allowed
+        on a line continues on the next lines.
+
+        Parameters
+        ----------
+        values
+            A sequence of Ints, Floats or Strings, None is written as an empty entry.
+        entriesPerLine
+            An Int specifying the maximum number of entries on a line. The default value is 16.
+        """
+        entries = [_entry(value) for value in values]
+        lines = [", ".join(entries[start : start + entriesPerLine]) for start in range(0, len(entries), entriesPerLine)]
+        self._file.write((",\n".join(lines) or ",").encode() + b"\n")
+
+    def table(self, rows: typing.Sequence[typing.Sequence], entriesPerLine: int = TABLE_ENTRIES_PER_LINE):
+        """This method writes the rows of a table of data, i.e., of material data.
+
+        Parameters
+        ----------
+        rows
+            A sequence of sequences of Floats.
+        entriesPerLine
+            An Int specifying the maximum number of entries on a line. The default value is 8.
+        """
+        for row in rows:
+            self.dataLine(row, entriesPerLine)
+
+    def rows(self, labels, values=None):
+        """This method writes the data lines of labeled rows, i.e., of nodes or elements. The rows
+        are formatted by blocks of :py:data:`CHUNK_ROWS` rows, the Ints are right aligned and the
+        Floats are written in scientific notation.
+
+        Parameters
+        ----------
+        labels
+            A sequence of Ints specifying the label of each row.
+        values
+            A sequence of sequences of Ints or Floats specifying the values of each row, i.e.,
+            the coordinates of the nodes or the connectivity of the elements.
+        """
+        import numpy
+
+        labels = numpy.asarray(labels).reshape(-1)
+        if values is not None:
+            values = numpy.asarray(values)
+            values = values.reshape(len(labels), -1)
+        for start in range(0, len(labels), CHUNK_ROWS):
+            blocks = [_integers(labels[start : start + CHUNK_ROWS, None])]
+            if values is not None:
+                chunk = values[start : start + CHUNK_ROWS]
+                if chunk.dtype.kind in "iub":
+                    blocks.append(_integers(chunk))
+                else:
+                    blocks.append(_floats(chunk, self.precision))
+            self._file.write(_lines(blocks))
+
+    def labels(self, labels):
+        """This method writes the data lines of a list of labels, i.e., of the members of a set,
+        :py:data:`ENTRIES_PER_LINE` labels per line.
+
+        Parameters
+        ----------
+        labels
+            A sequence of Ints.
+        """
+        import numpy
+
+        labels = numpy.asarray(labels).reshape(-1)
+        full = len(labels) - len(labels) % ENTRIES_PER_LINE
+        for start in range(0, full, CHUNK_ROWS * ENTRIES_PER_LINE):
+            chunk = labels[start : min(start + CHUNK_ROWS * ENTRIES_PER_LINE, full)]
+            self._file.write(_lines([_integers(chunk.reshape(-1, ENTRIES_PER_LINE))]))
+        if full < len(labels):
+            self._file.write(_lines([_integers(labels[None, full:])]))
+
+    def writeModel(self, model, job=None):
+        """This method writes the keywords of a model: the parts created from nodes and elements
+        with their sets and section assignments, the instances and the sets of the assembly, the
+        materials, the boundary conditions, the concentrated forces and the uniform pressures of
+        the static steps. The output requests of the steps are the preselected variables. The
+        objects of the model that cannot be written, see :py:func:`unsupportedObjects`, raise an
+        exception instead of being left out.
+
+        Parameters
+        ----------
+        model
+            A :py:class:`~abaqus.Model.Model.Model` object.
+        job
+            A :py:class:`~abaqus.Job.ModelJob.ModelJob` object whose description and print
+            options are written, or None.
+
+        Raises
+        ------
+        ValueError
+            If an object of the model cannot be written.
+        """
+        model, job = _unwrap(model), _unwrap(job)
+        unsupported = unsupportedObjects(model)
+        if unsupported:
+            raise ValueError("The model cannot be written:\n" + "\n".join(unsupported))
+
+        modelName = _key(_models(), model) or getattr(model, "name", "")
+        self.keyword("Heading")
+        description = job.description if job is not None else getattr(model, "description", "")
+        for line in description.split("\n") if description else ():
+            # A line of the description must not be read as a keyword
+            self._file.write((line if not line.startswith("*") else "** " + line).encode() + b"\n")
+        self.comment("Job name: {} Model name: {}".format(job.name if job is not None else "", modelName))
+        if job is not None:
+            self.keyword(
+                "Preprint",
+                {
+                    "echo": _yesNo(job.echoPrint),
+                    "model": _yesNo(job.modelPrint),
+                    "history": _yesNo(job.historyPrint),
+                    "contact": _yesNo(job.contactPrint),
+                },
+            )
+        self._section("PARTS")
+        for partName, part in model.parts.items():
+            self._part(model, partName, part)
+        self._section("ASSEMBLY")
+        self._assembly(model)
+        if model.materials:
+            self._section("MATERIALS")
+            for material in model.materials.values():
+                self._material(material)
+        self._boundaryConditions(model, "Initial")
+        for step in model.steps.values():
+            if step.__class__.__name__ != "InitialStep":
+                self._step(model, step)
+
+    def close(self):
+        """This method closes the file and renames it to its path."""
+        if self._file.closed:
+            return
+        self._file.close()
+        os.replace(self._temporary, self.fileName)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exceptionType, exception, traceback):
+        if exceptionType is None:
+            self.close()
+        else:
+            self._file.close()
+            if os.path.exists(self._temporary):
+                os.remove(self._temporary)
+
+    def _section(self, title: str):
+        self.comment("\n{}\n".format(title))
+
+    def _part(self, model, partName: str, part):
+        mesh = part._orphanMesh
+        self.keyword("Part", {"name": partName})
+        self.keyword("Node")
+        self.rows(mesh.nodeLabels, mesh.coordinates)
+        for meshType, elementLabels, elementConns in mesh.elements:
+            self.keyword("Element", {"type": meshType})
+            self.rows(elementLabels, elementConns)
+        for setName, aSet in part.sets.items():
+            self._set(setName, aSet)
+        for surfaceName, surface in part.surfaces.items():
+            self._surface(surfaceName, [(_key(part.sets, aSet), side) for aSet, side in surface._elementSides])
+        for assignment in part.sectionAssignments:
+            section = model.sections[assignment.sectionName]
+            setName = _key(part.sets, assignment.region)
+            self.comment("Section: {}".format(assignment.sectionName))
+            self.keyword("Solid Section", {"elset": setName, "material": section.material})
+            self.dataLine((None,) if mesh.dimensionality == THREE_D else (section.thickness,))
+        self.keyword("End Part")
+
+    def _set(self, setName: str, aSet, instanceParameter: bool = False):
+        for keyword, labelsByInstance in (("Nset", aSet._nodeLabels), ("Elset", aSet._elementLabels)):
+            for instanceName, labels in (labelsByInstance or {}).items():
+                parameter = {keyword.lower(): setName}
+                if instanceParameter:
+                    parameter["instance"] = instanceName
+                step = labels[1] - labels[0] if len(labels) > 2 else 0
+                if step > 0 and (labels[1:] - labels[:-1] == step).all():
+                    parameter["generate"] = ""
+                    self.keyword(keyword, parameter)
+                    self.dataLine((labels[0], labels[-1], step))
+                    continue
+                if len(labels) > 1 and (labels[1:] < labels[:-1]).any():
+                    parameter["unsorted"] = ""
+                self.keyword(keyword, parameter)
+                self.labels(labels)
+
+    def _surface(self, surfaceName: str, elementSides: list):
+        self.keyword("Surface", {"type": "ELEMENT", "name": surfaceName})
+        for setName, side in elementSides:
+            self.dataLine((setName, side))
+
+    def _assembly(self, model):
+        assembly = model.rootAssembly
+        self.keyword("Assembly", {"name": "Assembly"})
+        for instanceName, instance in assembly.instances.items():
+            self.keyword("Instance", {"name": instanceName, "part": _key(model.parts, instance.part)})
+            self.keyword("End Instance")
+        for setName, aSet in assembly.sets.items():
+            self._set(setName, aSet, True)
+        for surfaceName, surface in assembly.surfaces.items():
+            elementSides = [(_regionNames(model, aSet, "sets")[0], side) for aSet, side in surface._elementSides]
+            self._surface(surfaceName, elementSides)
+        self.keyword("End Assembly")
+
+    def _material(self, material):
+        self.keyword("Material", {"name": material.name})
+        behaviors = vars(material)
+        density, elastic, plastic = behaviors.get("density"), behaviors.get("elastic"), behaviors.get("plastic")
+        if density is not None and density.table:
+            self.keyword("Density", _dependencies(density))
+            self.table(density.table)
+        if elastic is not None and elastic.table:
+            parameter = {"type": elastic.type} if elastic.type != ISOTROPIC else {}
+            parameter.update(_dependencies(elastic))
+            parameter.update({"moduli": elastic.moduli} if elastic.moduli != LONG_TERM else {})
+            self.keyword("Elastic", parameter)
+            self.table(elastic.table)
+        if plastic is not None and plastic.table:
+            parameter = {"hardening": plastic.hardening} if plastic.hardening != ISOTROPIC else {}
+            parameter.update(_dependencies(plastic))
+            self.keyword("Plastic", parameter)
+            self.table(plastic.table)
+
+    def _step(self, model, step):
+        self.comment("\nSTEP: {}\n".format(step.name))
+        self.keyword("Step", {"name": step.name, "nlgeom": _yesNo(step.nlgeom), "inc": step.maxNumInc})
+        if step.description:
+            self._file.write((step.description.split("\n")[0] + "\n").encode())
+        self.keyword("Static")
+        initialInc = step.timePeriod if step.initialInc is None else step.initialInc
+        increments = [initialInc, step.timePeriod, step.minInc, step.maxInc]
+        while increments[-1] is None:
+            increments.pop()
+        self.dataLine(increments)
+        self._boundaryConditions(model, step.name)
+        self._loads(model, step.name)
+        self.comment("\nOUTPUT REQUESTS\n")
+        self.keyword("Output", {"field": "", "variable": "PRESELECT"})
+        self.keyword("Output", {"history": "", "variable": "PRESELECT"})
+        self.keyword("End Step")
+
+    def _boundaryConditions(self, model, stepName: str):
+        boundaryConditions = [
+            (name, boundaryCondition)
+            for name, boundaryCondition in model.boundaryConditions.items()
+            if boundaryCondition.createStepName == stepName
+        ]
+        if boundaryConditions:
+            self._section("BOUNDARY CONDITIONS")
+        for name, boundaryCondition in boundaryConditions:
+            region = _regionNames(model, boundaryCondition.region, "sets")[0]
+            if boundaryCondition.__class__.__name__ == "TypeBC":
+                self.comment("Name: {} Type: Symmetry/Antisymmetry/Encastre".format(name))
+                self.keyword("Boundary")
+                self.dataLine((region, boundaryCondition.typeName))
+            else:
+                self.comment("Name: {} Type: Displacement/Rotation".format(name))
+                self.keyword("Boundary")
+                for degreeOfFreedom, component in enumerate(_DISPLACEMENTS, 1):
+                    value = getattr(boundaryCondition, component)
+                    if value == SET:
+                        self.dataLine((region, degreeOfFreedom, degreeOfFreedom))
+                    elif value != UNSET and value is not None:
+                        self.dataLine((region, degreeOfFreedom, degreeOfFreedom, value))
+
+    def _loads(self, model, stepName: str):
+        loads = [(name, load) for name, load in model.loads.items() if load.createStepName == stepName]
+        if loads:
+            self._section("LOADS")
+        for name, load in loads:
+            if load.__class__.__name__ == "Pressure":
+                region = _regionNames(model, load.region, "surfaces")[0]
+                self.comment("Name: {} Type: Pressure".format(name))
+                self.keyword("Dsload")
+                self.dataLine((region, "P", load.magnitude))
+                continue
+            region = _regionNames(model, load.region, "sets")[0]
+            self.comment("Name: {} Type: Concentrated force".format(name))
+            self.keyword("Cload")
+            for degreeOfFreedom, component in enumerate(_FORCES, 1):
+                value = getattr(load, component)
+                if value:
+                    self.dataLine((region, degreeOfFreedom, value))
+
+
+def unsupportedObjects(model) -> list[str]:
+    """This function returns the objects of a model that :py:meth:`InputFileWriter.writeModel`
+    cannot write.
+
+    The parts must be created from nodes and elements with their sets created from labels, their
+    surfaces from element sets, and their sections homogeneous solid sections. The steps must be
+    static steps, the boundary conditions symmetry/encastre or displacement boundary conditions,
+    and the loads concentrated forces or uniform pressures, without amplitude and local system.
+
+    Parameters
+    ----------
+    model
+        A :py:class:`~abaqus.Model.Model.Model` object.
+
+    Returns
+    -------
+    list[str]
+        A list of Strings describing the objects that cannot be written, it is empty if the model
+        can be written.
+    """
+    model = _unwrap(model)
+    unsupported = []
+    assembly = model.rootAssembly
+    for partName, part in model.parts.items():
+        if part._orphanMesh is None:
+            unsupported.append("The part {} has no mesh created by PartFromNodesAndElements".format(partName))
+        unsupported += _unsupportedRegions(model, part, "part {}".format(partName))
+        for assignment in part.sectionAssignments:
+            section = model.sections.get(assignment.sectionName)
+            if section is None:
+                unsupported.append("The section {} of the part {} does not exist".format(assignment.sectionName, partName))
+            elif section.__class__.__name__ != "HomogeneousSolidSection":
+                unsupported.append("The {} {} cannot be written".format(section.__class__.__name__, assignment.sectionName))
+            if _key(part.sets, assignment.region) is None:
+                unsupported.append("The region of the section {} is not a set of the part {}".format(assignment.sectionName, partName))
+    for instanceName, instance in assembly.instances.items():
+        if instance.__class__.__name__ != "PartInstance":
+            unsupported.append("The {} {} cannot be written".format(instance.__class__.__name__, instanceName))
+        elif _key(model.parts, instance.part) is None:
+            unsupported.append("The part of the instance {} is not a part of the model".format(instanceName))
+    unsupported += _unsupportedRegions(model, assembly, "assembly")
+    for material in model.materials.values():
+        for member, behavior in vars(material).items():
+            if member not in _MATERIAL_MEMBERS and behavior is not None:
+                unsupported.append("The {} behavior of the material {} cannot be written".format(member, material.name))
+
+    stepNames = {"Initial"}
+    for step in model.steps.values():
+        kind = step.__class__.__name__
+        if kind not in ("InitialStep", "StaticStep"):
+            unsupported.append("The {} {} cannot be written".format(kind, step.name))
+        stepNames.add(step.name)
+    for name, boundaryCondition in model.boundaryConditions.items():
+        kind = boundaryCondition.__class__.__name__
+        if kind not in ("TypeBC", "DisplacementBC") or kind == "TypeBC" and boundaryCondition.typeName is None:
+            unsupported.append("The {} {} cannot be written".format(kind, name))
+            continue
+        if boundaryCondition.createStepName not in stepNames:
+            unsupported.append("The step {} of the boundary condition {} does not exist".format(boundaryCondition.createStepName, name))
+        if kind == "DisplacementBC" and (boundaryCondition.amplitude != UNSET or boundaryCondition.localCsys is not None):
+            unsupported.append("The amplitude and the local system of the boundary condition {} cannot be written".format(name))
+        unsupported += _unsupportedRegion(model, boundaryCondition.region, "sets", "boundary condition", name)
+    for name, load in model.loads.items():
+        kind = load.__class__.__name__
+        if kind == "ConcentratedForce":
+            if load.amplitude != UNSET or load.localCsys is not None or load.follower:
+                unsupported.append("The amplitude, the local system and the follower option of the load {} cannot be written".format(name))
+            unsupported += _unsupportedRegion(model, load.region, "sets", "load", name)
+        elif kind == "Pressure":
+            if load.amplitude != UNSET or load.distributionType != UNIFORM:
+                unsupported.append("The amplitude and the distribution of the load {} cannot be written".format(name))
+            unsupported += _unsupportedRegion(model, load.region, "surfaces", "load", name)
+        else:
+            unsupported.append("The {} {} cannot be written".format(kind, name))
+            continue
+        if load.createStepName not in stepNames - {"Initial"}:
+            unsupported.append("The step {} of the load {} does not exist".format(load.createStepName, name))
+    return unsupported
+
+
+def _unsupportedRegions(model, owner, ownerName: str) -> list[str]:
+    """Returns the sets and the surfaces of a part or of the assembly that cannot be written"""
+    unsupported = []
+    for setName, aSet in owner.sets.items():
+        if aSet._nodeLabels is None and aSet._elementLabels is None:
+            unsupported.append("The set {} of the {} is not created from labels".format(setName, ownerName))
+    for surfaceName, surface in owner.surfaces.items():
+        if surface._elementSides is None:
+            unsupported.append("The surface {} of the {} is not created from element sets".format(surfaceName, ownerName))
+            continue
+        for aSet, side in surface._elementSides:
+            if owner is model.rootAssembly:
+                found = len(_regionNames(model, aSet, "sets")) == 1
+            else:
+                found = _key(owner.sets, aSet) is not None
+            if not found:
+                unsupported.append("An element set of the surface {} is not a set of the {}".format(surfaceName, ownerName))
+    return unsupported
+
+
+def _unsupportedRegion(model, region, repository: str, kind: str, name: str) -> list[str]:
+    """Returns why the region of a boundary condition or of a load cannot be written"""
+    found = _regionNames(model, region, repository)
+    if len(found) == 1:
+        return []
+    return [
+        "The region of the {} {} is {} {} of the assembly or of an instance".format(
+            kind, name, "an ambiguous" if found else "not a", repository[:-1]
+        )
+    ]
+
+
+def _models() -> dict:
+    """Returns the models of the model database if it is loaded"""
+    import sys
+
+    module = sys.modules.get("abaqus.abaqus")
+    mdb = getattr(module, "mdb", None)
+    return getattr(_unwrap(mdb), "models", {})
+
+
+def _unwrap(value):
+    """Returns the object wrapped by a JournalProxy object, the objects of the model are
+    inspected without recording the calls in the journal"""
+    from ..Journal.Journal import getJournal
+
+    journal = getJournal()
+    return value if journal is None else journal.unwrap(value)
+
+
+def _key(repository: dict, value) -> typing.Optional[str]:
+    """Returns the key of an object in a repository"""
+    for key, item in repository.items():
+        if item is value:
+            return key
+    return None
+
+
+def _regionNames(model, region, repository: str) -> list[str]:
+    """Returns the names of a set or of a surface, as given by *repository*, in the assembly or
+    in the instances, a region of a part instanced several times has several names"""
+    assembly = model.rootAssembly
+    name = _key(getattr(assembly, repository), region)
+    if name is not None:
+        return [name]
+    found = []
+    for instanceName, instance in assembly.instances.items():
+        part = getattr(instance, "part", None)
+        name = _key(getattr(part, repository), region) if part is not None else None
+        if name is not None:
+            found.append("{}.{}".format(instanceName, name))
+    return found
+
+
+def _dependencies(behavior) -> dict:
+    """Returns the dependency parameters of a material behavior"""
+    parameter = {}
+    if behavior.dependencies:
+        parameter["dependencies"] = behavior.dependencies
+    return parameter
+
+
+def _yesNo(value) -> str:
+    return "YES" if value else "NO"
+
+
+def _entry(value) -> str:
+    """Returns the text of a value of a data line or of a parameter"""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return _yesNo(value)
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+    if isinstance(value, numbers.Real):
+        return repr(float(value))
+    return str(value)
+
+
+_TABLE = None
+
+
+def _table():
+    """Returns the text of the Ints from 0 to 9999, right aligned, zero padded, and blank, as
+    uint32 words of 4 characters"""
+    global _TABLE
+    if _TABLE is None:
+        import numpy
+
+        aligned = numpy.array([b"%4d" % number for number in range(10000)], dtype="S4")
+        padded = numpy.array([b"%04d" % number for number in range(10000)], dtype="S4")
+        _TABLE = numpy.concatenate((aligned, padded, numpy.array([b"    "], dtype="S4"))).view(numpy.uint32)
+    return _TABLE
+
+
+def _digits(magnitude, groups: int, padded: bool):
+    """Returns the text of non-negative Ints as uint8 arrays of 4 * groups characters, right
+    aligned or zero padded"""
+    import numpy
+
+    table = _table()
+    text = numpy.empty(magnitude.shape + (groups,), numpy.uint32)
+    higher = None
+    for group in range(groups):
+        power = 10000 ** (groups - 1 - group)
+        value = magnitude // magnitude.dtype.type(power) if power > 1 else magnitude
+        index = value if higher is None else value - higher * magnitude.dtype.type(10000)
+        if padded:
+            index = index + 10000
+        elif higher is not None:
+            index = index + (higher > 0) * magnitude.dtype.type(10000)
+        if not padded and group < groups - 1:
+            index = numpy.where(value == 0, 20000, index)
+        text[..., group] = table.take(index)
+        higher = value
+    return text.view(numpy.uint8).reshape(magnitude.shape + (4 * groups,))
+
+
+def _integers(values):
+    """Returns the text of an array of Ints, right aligned"""
+    import numpy
+
+    negative = values < 0
+    magnitude = numpy.abs(values.astype(numpy.int64))
+    largest = int(magnitude.max(initial=0))
+    magnitude = magnitude.astype(numpy.uint32 if largest < 2**32 else numpy.uint64)
+    signed = int(negative.any())
+    text = _digits(magnitude, (len(str(largest)) + signed + 3) // 4, False)
+    if signed:
+        first = (text != ord(" ")).argmax(axis=-1)[..., None]
+        numpy.put_along_axis(text, first - 1, numpy.where(negative[..., None], ord("-"), ord(" ")).astype(numpy.uint8), axis=-1)
+    return text
+
+
+def _floats(values, precision: int):
+    """Returns the text of an array of Floats in scientific notation"""
+    import numpy
+
+    values = values.astype(numpy.float64)
+    if not numpy.isfinite(values).all():
+        raise ValueError("The values cannot be written, they are not finite")
+    magnitude = numpy.abs(values)
+    nonzero = magnitude > 0
+    with numpy.errstate(divide="ignore"):
+        exponent = numpy.floor(numpy.log10(numpy.where(nonzero, magnitude, 1.0))).astype(numpy.int64)
+    # The exponent is corrected where the logarithm is rounded to the next integer
+    for _ in range(2):
+        mantissa = numpy.rint(magnitude / numpy.power(10.0, exponent) * 10.0 ** (precision - 1))
+        high = mantissa >= 10.0**precision
+        low = nonzero & (mantissa < 10.0 ** (precision - 1))
+        if not high.any() and not low.any():
+            break
+        exponent += high
+        exponent -= low
+    mantissa = mantissa.astype(numpy.uint64)
+    digits = _digits(mantissa, (precision + 3) // 4, True)[..., -precision:]
+    exponentDigits = 3 if numpy.abs(exponent).max(initial=0) >= 100 else 2
+    exponents = _digits(numpy.abs(exponent).astype(numpy.uint32), 1, True)[..., -exponentDigits:]
+    signed = int((values < 0).any())
+    width = signed + precision + 3 + exponentDigits
+    text = numpy.empty(values.shape + (width,), numpy.uint8)
+    if signed:
+        text[..., 0] = numpy.where(values < 0, ord("-"), ord(" "))
+    text[..., signed] = digits[..., 0]
+    text[..., signed + 1] = ord(".")
+    text[..., signed + 2 : signed + precision + 1] = digits[..., 1:]
+    text[..., signed + precision + 1] = ord("e")
+    text[..., signed + precision + 2] = numpy.where(exponent < 0, ord("-"), ord("+"))
+    text[..., signed + precision + 3 :] = exponents
+    return text
+
+
+def _lines(blocks: list):
+    """Returns the data lines of the rows of blocks of text as an uint8 array, the entries of a
+    row are separated by commas and continue on the next line after
+    :py:data:`ENTRIES_PER_LINE` entries"""
+    import numpy
+
+    rows = len(blocks[0])
+    entries = sum(block.shape[1] for block in blocks)
+    lines = numpy.empty((rows, sum(block.shape[1] * (block.shape[2] + 2) for block in blocks)), numpy.uint8)
+    position = 0
+    for block in blocks:
+        _, count, size = block.shape
+        # The entries of a block and their separators are copied at once
+        view = lines[:, position : position + count * (size + 2)]
+        view.shape = (rows, count, size + 2)
+        view[..., :size] = block
+        view[..., size] = ord(",")
+        view[..., size + 1] = ord(" ")
+        position += count * (size + 2)
+    # A row ends with a blank instead of a comma, and continues after a comma at the end of a line
+    ends = numpy.cumsum([size + 2 for block in blocks for size in [block.shape[2]] * block.shape[1]])
+    for end in ends[ENTRIES_PER_LINE - 1 : entries - 1 : ENTRIES_PER_LINE]:
+        lines[:, end - 1] = ord("\n")
+    lines[:, -2] = ord(" ")
+    lines[:, -1] = ord("\n")
+    return lines
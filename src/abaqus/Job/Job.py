@@ -1,5 +1,14 @@
+import asyncio
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
 from abaqusConstants import *
 from .MessageArray import MessageArray
+from ..LazyDefault.LazyDefault import lazyDefault
+
+if typing.TYPE_CHECKING:
+    from .JobMonitor import JobMonitor
+    from .StatusFile import StatusSummary
 
 
 class Job:
@@ -216,7 +225,7 @@ class Job:
     userSubroutine: str = ""
 
     # A MessageArray object specifying the messages received during an analysis.
-    messages: MessageArray = MessageArray()
+    messages: MessageArray = lazyDefault(MessageArray)
 
     # A tuple of Strings specifying the environment variables and their values.
     environment: tuple = ()
@@ -259,8 +268,61 @@ class Job:
         call the waitForCompletion method and the *status* member is neither SUBMITTED nor
         RUNNING, Abaqus assumes the analysis has either completed or aborted and returns
         immediately.
+
+        The files of the job in the current directory are followed by a
+        :py:class:`~abaqus.Job.JobMonitor.JobMonitor` object. In a coroutine, use
+        :py:meth:`wait` instead.
         """
-        pass
+        if self.status not in (SUBMITTED, RUNNING):
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.wait())
+            return
+        # An event loop is already running in this thread, e.g., in Jupyter, the files are
+        # followed by another loop in a worker thread
+        with ThreadPoolExecutor(1) as executor:
+            executor.submit(asyncio.run, self.wait()).result()
+
+    def monitor(self, workDirectory: str = "") -> "JobMonitor":
+        """This method returns a monitor following the analysis of the job. The monitor is an
+        async iterator of the :py:class:`~abaqus.Job.JobMonitor.JobEvent` objects of the
+        analysis.
+
+        Parameters
+        ----------
+        workDirectory
+            A String specifying the directory of the job. The default value is the current
+            directory.
+
+        Returns
+        -------
+        JobMonitor
+            A :py:class:`~abaqus.Job.JobMonitor.JobMonitor` object.
+        """
+        from .JobMonitor import JobMonitor
+
+        return JobMonitor(self.name, workDirectory)
+
+    async def wait(self, workDirectory: str = "") -> "StatusSummary":
+        """This method waits until the analysis has finished and sets the *status* member to
+        COMPLETED or ABORTED.
+
+        Parameters
+        ----------
+        workDirectory
+            A String specifying the directory of the job. The default value is the current
+            directory.
+
+        Returns
+        -------
+        StatusSummary
+            A :py:class:`~abaqus.Job.StatusFile.StatusSummary` object of the finished analysis.
+        """
+        status = await self.monitor(workDirectory).wait()
+        self.status = COMPLETED if status.completed else ABORTED
+        return status
 
     def clearMessage(self):
         """This method clears *messages* and sets the *status* to NONE."""
@@ -0,0 +1,243 @@
+import hashlib
+import json
+import os
+import re
+import shlex
+import shutil
+import tempfile
+import time
+
+# Options of the Abaqus command that do not change the results of the analysis
+_IGNORED_OPTIONS = re.compile(r"^(job|input|user|interactive|int|background|queue|ask_delete|scratch)(=.*)?$", re.I)
+_INCLUDE = re.compile(r"^\*\s*INCLUDE\s*,(.*)$", re.I)
+_INPUT = re.compile(r"INPUT\s*=\s*(\"[^\"]*\"|[^,]*)", re.I)
+
+
+class JobCache:
+    """The JobCache object is an on-disk cache of analysis results, keyed on the content of the
+    input file, its *\\*INCLUDE* closure and the data files read with *INPUT=*, the user
+    subroutine, the Abaqus command and its options. When the same analysis is submitted again, the cached *.odb*, *.dat*, *.sta*, *.msg*
+    files are restored instead of running Abaqus. The least recently used entries are evicted
+    when the total size of the cache exceeds *maxSize*.
+
+    Attributes
+    ----------
+    directory: str
+        A String specifying the directory of the cache.
+    maxSize: float
+        A Float specifying the maximum total size of the cache in bytes, or None for no limit.
+    suffixes: tuple
+        A tuple of Strings specifying the suffixes of the files stored for every analysis.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.Job.JobCache import JobCache
+
+    """
+
+    suffixes: tuple = (".odb", ".dat", ".sta", ".msg")
+
+    def __init__(self, directory: str = None, maxSize: float = None):
+        """This method creates a JobCache object.
+
+        Parameters
+        ----------
+        directory
+            A String specifying the directory of the cache. The default value is the value of
+            the *ABAQUS_JOB_CACHE* environment variable or `~/.cache/pyabaqus/jobs`.
+        maxSize
+            A Float specifying the maximum total size of the cache in bytes. The default value is
+            None, i.e., no limit.
+        """
+        if directory is None:
+            directory = os.environ.get(
+                "ABAQUS_JOB_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "pyabaqus", "jobs")
+            )
+        self.directory = os.path.abspath(directory)
+        self.maxSize = maxSize
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, inputFile: str, userSubroutine: str = None, options: str = "", solver: str = "abaqus") -> str:
+        """This method returns the cache key of an analysis.
+
+        Parameters
+        ----------
+        inputFile
+            A String specifying the path of the input file.
+        userSubroutine
+            A String specifying the path of the user subroutine.
+        options
+            A String specifying the options of the Abaqus command.
+        solver
+            A String specifying the Abaqus command. The resolved executable and its modification
+            time are part of the key, so that the results of another Abaqus version are not
+            reused. The default value is "abaqus".
+
+        Returns
+        -------
+        str
+            The hexadecimal SHA-256 digest of the normalized input deck, its *\\*INCLUDE*
+            closure, the data files read with *INPUT=*, the user subroutine source, the Abaqus
+            command and the options.
+        """
+        digest = hashlib.sha256()
+        self._hashInputFile(digest, os.path.abspath(inputFile), ())
+        digest.update(b"\0user\0")
+        if userSubroutine is not None:
+            with open(userSubroutine, "rb") as file:
+                digest.update(file.read())
+        digest.update(b"\0options\0")
+        tokens = sorted(token.lower() for token in shlex.split(options) if not _IGNORED_OPTIONS.match(token))
+        digest.update(" ".join(tokens).encode())
+        digest.update(b"\0solver\0")
+        digest.update(_solverIdentity(solver).encode())
+        return digest.hexdigest()
+
+    def restore(self, key: str, workDirectory: str, jobName: str) -> bool:
+        """This method restores the cached files of an analysis.
+
+        Parameters
+        ----------
+        key
+            A String specifying the cache key returned by :py:meth:`key`.
+        workDirectory
+            A String specifying the directory to restore the files to.
+        jobName
+            A String specifying the job name, the files are restored as *jobName.suffix*.
+
+        Returns
+        -------
+        bool
+            True if the analysis was found in the cache.
+        """
+        entry = self._entry(key)
+        try:
+            with open(os.path.join(entry, "entry.json")) as file:
+                suffixes = json.load(file)["suffixes"]
+        except (OSError, ValueError, KeyError):
+            return False
+        os.makedirs(workDirectory, exist_ok=True)
+        for suffix in suffixes:
+            target = os.path.join(workDirectory, jobName + suffix)
+            if os.path.exists(target):
+                os.remove(target)
+            # Copied rather than linked, an output database opened for writing must not modify
+            # the cached one
+            shutil.copyfile(os.path.join(entry, "job" + suffix), target)
+        # The modification time of the entry file records the last use, for LRU eviction
+        os.utime(os.path.join(entry, "entry.json"))
+        return True
+
+    def store(self, key: str, workDirectory: str, jobName: str):
+        """This method stores the files of a completed analysis and evicts the least recently
+        used entries if the cache is larger than *maxSize*.
+
+        Parameters
+        ----------
+        key
+            A String specifying the cache key returned by :py:meth:`key`.
+        workDirectory
+            A String specifying the directory of the analysis.
+        jobName
+            A String specifying the job name of the analysis.
+        """
+        entry = self._entry(key)
+        if os.path.exists(entry):
+            return
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        temporary = tempfile.mkdtemp(dir=os.path.dirname(entry))
+        suffixes, size = [], 0
+        for suffix in self.suffixes:
+            source = os.path.join(workDirectory, jobName + suffix)
+            if os.path.exists(source):
+                shutil.copyfile(source, os.path.join(temporary, "job" + suffix))
+                suffixes.append(suffix)
+                size += os.path.getsize(source)
+        with open(os.path.join(temporary, "entry.json"), "w") as file:
+            json.dump({"jobName": jobName, "suffixes": suffixes, "size": size, "created": time.time()}, file)
+        try:
+            os.replace(temporary, entry)
+        except OSError:  # Stored concurrently by another process
+            shutil.rmtree(temporary, ignore_errors=True)
+        if self.maxSize is not None:
+            self.evict(self.maxSize)
+
+    def evict(self, maxSize: float):
+        """This method removes the least recently used entries until the total size of the cache
+        is not larger than *maxSize*.
+
+        Parameters
+        ----------
+        maxSize
+            A Float specifying the maximum total size of the cache in bytes.
+        """
+        entries, total = [], 0
+        for prefix in os.listdir(self.directory):
+            prefixDir = os.path.join(self.directory, prefix)
+            if not os.path.isdir(prefixDir):
+                continue
+            for key in os.listdir(prefixDir):
+                entryFile = os.path.join(prefixDir, key, "entry.json")
+                try:
+                    with open(entryFile) as file:
+                        size = json.load(file)["size"]
+                    entries.append((os.path.getmtime(entryFile), size, os.path.join(prefixDir, key)))
+                except (OSError, ValueError, KeyError):
+                    continue
+                total += size
+        for _, size, entry in sorted(entries):
+            if total <= maxSize:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """This method removes all the entries of the cache."""
+        self.evict(0)
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def _hashInputFile(self, digest, fileName: str, parents: tuple):
+        if fileName in parents:
+            raise ValueError("Recursive *INCLUDE of {}".format(fileName))
+        directory = os.path.dirname(fileName)
+        with open(fileName, "r", errors="replace") as file:
+            for line in file:
+                line = line.rstrip()
+                if not line or line.startswith("**"):
+                    continue
+                if line.startswith("*"):
+                    match = _INPUT.search(line)
+                    if match is not None:
+                        path = os.path.abspath(os.path.join(directory, match.group(1).strip().strip('"')))
+                        if _INCLUDE.match(line) is not None:
+                            digest.update(b"\0include\0")
+                            self._hashInputFile(digest, path, parents + (fileName,))
+                            continue
+                        # The data lines of the keyword are read from another file, e.g.,
+                        # *NODE, INPUT=nodes.inp, the name of the file does not change the results
+                        line = line[: match.start()] + "INPUT=" + line[match.end() :]
+                        digest.update(line.replace(" ", "").upper().encode())
+                        digest.update(b"\0input\0")
+                        with open(path, "rb") as data:
+                            digest.update(hashlib.sha256(data.read()).digest())
+                        continue
+                    # Keywords and parameters are case and space insensitive
+                    line = line.replace(" ", "").upper()
+                digest.update(line.encode())
+                digest.update(b"\n")
+
+
+def _solverIdentity(solver: str) -> str:
+    """Return the Abaqus command with the path and modification time of its executable."""
+    tokens = shlex.split(solver) or [solver]
+    executable = shutil.which(tokens[0])
+    if executable is None:
+        return solver
+    executable = os.path.realpath(executable)
+    return "{}\0{}\0{}".format(solver, executable, os.stat(executable).st_mtime_ns)
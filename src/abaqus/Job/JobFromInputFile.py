@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .Job import Job
 from .MessageArray import MessageArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class JobFromInputFile(Job):
@@ -54,7 +55,7 @@ class JobFromInputFile(Job):
     status: SymbolicConstant = None
 
     # A MessageArray object specifying the messages received during an analysis.
-    messages: MessageArray = MessageArray()
+    messages: MessageArray = lazyDefault(MessageArray)
 
     # A tuple of Strings specifying the environment variables and their values.
     environment: tuple = ()
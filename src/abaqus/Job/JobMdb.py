@@ -1,9 +1,15 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .JobFromInputFile import JobFromInputFile
-from .ModelJob import ModelJob
-from .OptimizationProcess import OptimizationProcess
 from ..Mdb.MdbBase import MdbBase
 
+if typing.TYPE_CHECKING:
+    from .JobFromInputFile import JobFromInputFile
+    from .ModelJob import ModelJob
+    from .OptimizationProcess import OptimizationProcess
+
 
 class JobMdb(MdbBase):
     """The Mdb object is the high-level Abaqus model database. A model database stores models
@@ -154,6 +160,7 @@ class JobMdb(MdbBase):
         ------
             AbaqusException.
         """
+        from .ModelJob import ModelJob
         self.jobs[name] = job = ModelJob(
             name,
             model,
@@ -286,6 +293,7 @@ class JobMdb(MdbBase):
             multiple processes that communicate through a message
         """
 
+        from .JobFromInputFile import JobFromInputFile
         self.jobs[name] = jobFromInputFile = JobFromInputFile(
             name,
             inputFileName,
@@ -380,6 +388,7 @@ class JobMdb(MdbBase):
         ------
             AbaqusException.
         """
+        from .OptimizationProcess import OptimizationProcess
         self.optimizationProcesses[name] = optimizationProcess = OptimizationProcess(
             name,
             model,
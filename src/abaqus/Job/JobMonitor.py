@@ -0,0 +1,431 @@
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import re
+import struct
+import sys
+import typing
+import weakref
+
+from abaqusConstants import *
+from .StatusFile import StatusSummary, STANDARD_INCREMENT, EXPLICIT_INCREMENT
+from ..Messaging.DataObject import DataObject
+from ..Messaging.MonitorMgr import MonitorMgr
+
+_MESSAGE = re.compile(r"^\s*\*{3}(WARNING|ERROR|NOTE)\s*:?\s*(.*)$")
+
+
+class JobEvent(DataObject):
+    """The JobEvent object is the base of the events parsed from the files of a running
+    analysis. It is a :py:class:`~abaqus.Messaging.DataObject.DataObject` object, and is passed
+    as the *data* argument of the message callbacks registered on the MonitorMgr object.
+
+    Attributes
+    ----------
+    jobName: str
+        A String specifying the name of the job.
+    messageType: SymbolicConstant
+        A SymbolicConstant specifying the message type of the event, it is used to select the
+        message callbacks.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.Job.JobMonitor import JobMonitor
+
+        async for event in JobMonitor('Job-1'):
+            print(event)
+
+    """
+
+    jobName: str = ""
+    messageType: SymbolicConstant = None
+
+    def __init__(self, jobName: str, **kwargs):
+        self.jobName = jobName
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def __repr__(self):
+        members = ", ".join("{}={!r}".format(key, value) for key, value in vars(self).items() if key != "jobName")
+        return "{}({!r}, {})".format(type(self).__name__, self.jobName, members)
+
+
+class IncrementEvent(JobEvent):
+    """The IncrementEvent object is sent when an increment converges. It defines the *step*,
+    *increment*, *attempts*, *severe*, *equilibrium*, *iterations*, *totalTime*, *stepTime* and
+    *timeIncrement* members available in the *.sta* file."""
+
+    messageType = STATUS
+
+
+class CutbackEvent(JobEvent):
+    """The CutbackEvent object is sent when an attempt of Abaqus/Standard does not converge and
+    the increment is cut back. It defines the *step*, *increment* and *attempts* members."""
+
+    messageType = STATUS
+
+
+class WarningEvent(JobEvent):
+    """The WarningEvent object is sent for every warning of the *.msg* file. It defines the
+    *message* member."""
+
+    messageType = WARNING
+
+
+class ErrorEvent(JobEvent):
+    """The ErrorEvent object is sent for every error of the *.msg* file. It defines the
+    *message* member."""
+
+    messageType = ERROR
+
+
+class CompletedEvent(JobEvent):
+    """The CompletedEvent object is sent when the analysis completes successfully."""
+
+    messageType = JOB_COMPLETED
+
+
+class AbortedEvent(JobEvent):
+    """The AbortedEvent object is sent when the analysis terminates without completing."""
+
+    messageType = JOB_ABORTED
+
+
+class _FileTail:
+    """Incremental reader of the complete lines appended to a file"""
+
+    def __init__(self, fileName: str):
+        self.fileName = fileName
+        self.offset = 0
+        self.partial = b""
+
+    def readLines(self) -> list[str]:
+        try:
+            with open(self.fileName, "rb") as file:
+                if os.fstat(file.fileno()).st_size < self.offset:  # Truncated, i.e., resubmitted
+                    self.offset, self.partial = 0, b""
+                file.seek(self.offset)
+                data = file.read()
+        except OSError:
+            return []
+        self.offset += len(data)
+        lines = (self.partial + data).split(b"\n")
+        self.partial = lines.pop()
+        return [line.decode("utf-8", "replace").rstrip("\r") for line in lines]
+
+
+class JobMonitor:
+    """The JobMonitor object follows a running analysis by tailing its *.sta*, *.msg* and *.log*
+    files. The lines appended to the files are parsed into
+    :py:class:`~abaqus.Job.JobMonitor.JobEvent` objects, which are delivered to the message
+    callbacks registered on the MonitorMgr object and to the async iterators of the monitor.
+
+    All the monitors of an event loop share one watcher: it uses inotify on Linux and polls the
+    files on the other platforms, so hundreds of jobs can be followed without one thread per job.
+
+    Attributes
+    ----------
+    jobName: str
+        A String specifying the name of the job.
+    workDirectory: str
+        A String specifying the directory of the job.
+    status: StatusSummary
+        A :py:class:`~abaqus.Job.StatusFile.StatusSummary` object summarizing the progress.
+    finished: bool
+        A Boolean specifying whether the analysis has finished.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.Job.JobMonitor import JobMonitor
+
+        monitor = JobMonitor('Job-1', workDirectory)
+        async for event in monitor:
+            print(event)
+        status = await monitor.wait()
+
+    """
+
+    def __init__(self, jobName: str, workDirectory: str = "", monitorManager: MonitorMgr = None):
+        """This method creates a JobMonitor object, the files are followed once the monitor is
+        awaited or iterated.
+
+        Parameters
+        ----------
+        jobName
+            A String specifying the name of the job.
+        workDirectory
+            A String specifying the directory of the job. The default value is the current
+            directory.
+        monitorManager
+            A :py:class:`~abaqus.Messaging.MonitorMgr.MonitorMgr` object the events are delivered
+            to. The default value is the `monitorManager` object of the abaqus module.
+        """
+        self.jobName = jobName
+        self.workDirectory = os.path.abspath(workDirectory or os.getcwd())
+        if monitorManager is None:
+            from abaqus import monitorManager
+        self.monitorManager = monitorManager
+        self.status = StatusSummary()
+        self.finished = False
+        self._tails = {
+            suffix: _FileTail(os.path.join(self.workDirectory, jobName + suffix)) for suffix in (".sta", ".msg", ".log")
+        }
+        self._queues: list[asyncio.Queue] = []
+        self._finishedEvent: typing.Optional[asyncio.Event] = None
+        self._watcher: typing.Optional[_Watcher] = None
+
+    async def wait(self) -> StatusSummary:
+        """This method waits until the analysis has finished.
+
+        Returns
+        -------
+        StatusSummary
+            A :py:class:`~abaqus.Job.StatusFile.StatusSummary` object of the finished analysis.
+        """
+        self._start()
+        await self._finishedEvent.wait()
+        return self.status
+
+    async def events(self) -> typing.AsyncIterator[JobEvent]:
+        """This method iterates over the events of the analysis until it has finished.
+
+        Returns
+        -------
+        AsyncIterator[JobEvent]
+            An async iterator of :py:class:`JobEvent` objects.
+        """
+        if self.finished:
+            return
+        queue = asyncio.Queue()
+        self._queues.append(queue)
+        self._start()
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    return
+                yield event
+        finally:
+            self._queues.remove(queue)
+
+    def __aiter__(self):
+        return self.events()
+
+    def update(self):
+        """This method reads the lines appended to the files of the job and delivers the parsed
+        events, it is called by the watcher when the files change."""
+        if self.finished:
+            return
+        events = []
+        for line in self._tails[".sta"].readLines():
+            events += self._parseStatusLine(line)
+        for line in self._tails[".msg"].readLines():
+            events += self._parseMessageLine(line)
+        for line in self._tails[".log"].readLines():
+            events += self._parseLogLine(line)
+        # The files are read one after the other, the end of the analysis is delivered last
+        events.sort(key=lambda event: isinstance(event, (CompletedEvent, AbortedEvent)))
+        for event in events:
+            if self.finished:
+                break
+            self.monitorManager.dispatchMessage(self.jobName, event.messageType, event)
+            for queue in self._queues:
+                queue.put_nowait(event)
+            if isinstance(event, (CompletedEvent, AbortedEvent)):
+                self._finish()
+
+    def _start(self):
+        if self._watcher is not None:
+            return
+        self._finishedEvent = asyncio.Event()
+        self._watcher = _Watcher.forLoop(asyncio.get_running_loop())
+        self._watcher.add(self)
+        self.update()
+
+    def _finish(self):
+        self.finished = True
+        self._finishedEvent.set()
+        for queue in self._queues:
+            queue.put_nowait(None)
+        self._watcher.remove(self)
+
+    def _parseStatusLine(self, line: str) -> list[JobEvent]:
+        match = STANDARD_INCREMENT.match(line)
+        if match is not None:
+            self.status.update(line)
+            step, increment, attempts = int(match.group(1)), int(match.group(2)), int(match.group(3))
+            if match.group(4) == "U":
+                return [CutbackEvent(self.jobName, step=step, increment=increment, attempts=attempts)]
+            return [
+                IncrementEvent(
+                    self.jobName,
+                    step=step,
+                    increment=increment,
+                    attempts=attempts,
+                    severe=int(match.group(5)),
+                    equilibrium=int(match.group(6)),
+                    iterations=int(match.group(7)),
+                    totalTime=float(match.group(8)),
+                    stepTime=float(match.group(9)),
+                    timeIncrement=float(match.group(10)),
+                )
+            ]
+        match = EXPLICIT_INCREMENT.match(line)
+        if match is not None:
+            self.status.update(line)
+            return [
+                IncrementEvent(
+                    self.jobName,
+                    step=int(match.group(1)),
+                    increment=int(match.group(2)),
+                    stepTime=float(match.group(3)),
+                    totalTime=float(match.group(4)),
+                    timeIncrement=float(match.group(6)),
+                )
+            ]
+        self.status.update(line)
+        if self.status.completed:
+            return [CompletedEvent(self.jobName, message=line.strip())]
+        if self.status.finished:
+            return [AbortedEvent(self.jobName, message=line.strip())]
+        return []
+
+    def _parseMessageLine(self, line: str) -> list[JobEvent]:
+        match = _MESSAGE.match(line)
+        if match is None:
+            return []
+        if match.group(1) == "WARNING":
+            return [WarningEvent(self.jobName, message=match.group(2))]
+        if match.group(1) == "ERROR":
+            return [ErrorEvent(self.jobName, message=match.group(2))]
+        return []
+
+    def _parseLogLine(self, line: str) -> list[JobEvent]:
+        # The log file is the only one written when the analysis fails before the solver starts
+        if "exited with error" in line or "Abaqus Error" in line:
+            self.status.finished = True
+            return [AbortedEvent(self.jobName, message=line.strip())]
+        if re.search(r"Abaqus JOB \S+ COMPLETED", line) and not self.status.finished:
+            self.status.finished = self.status.completed = True
+            return [CompletedEvent(self.jobName, message=line.strip())]
+        return []
+
+
+class _Watcher:
+    """Watches the directories of the monitors of one event loop, with inotify if available"""
+
+    _watchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Watcher]" = weakref.WeakKeyDictionary()
+    pollInterval: float = 0.5
+
+    # inotify(7) constants
+    IN_MODIFY, IN_CLOSE_WRITE, IN_MOVED_TO, IN_CREATE = 0x2, 0x8, 0x80, 0x100
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    @classmethod
+    def forLoop(cls, loop: asyncio.AbstractEventLoop) -> "_Watcher":
+        if loop not in cls._watchers:
+            cls._watchers[loop] = cls(loop)
+        return cls._watchers[loop]
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        # The loop is the key of _watchers, it is not kept alive by its watcher
+        self._loop = weakref.ref(loop)
+        self.monitors: set[JobMonitor] = set()
+        self.directories: dict[str, int] = {}  # directory -> inotify watch descriptor
+        self.watched: dict[int, set[JobMonitor]] = {}  # watch descriptor -> monitors
+        self.polled: set[JobMonitor] = set()
+        self.pollTask: typing.Optional[asyncio.Task] = None
+        self.fd, self.libc = None, None
+        self._closeFd = None
+        if sys.platform.startswith("linux"):
+            try:
+                self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+                fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+                if fd >= 0:
+                    self.fd = fd
+                    # Closed with the last monitor, or when the loop is collected
+                    self._closeFd = weakref.finalize(loop, os.close, fd)
+                    loop.add_reader(fd, self._readInotify)
+            except (OSError, AttributeError, NotImplementedError):
+                self.fd = None
+
+    def add(self, monitor: JobMonitor):
+        self.monitors.add(monitor)
+        wd = self._watch(monitor.workDirectory)
+        if wd is None:
+            self.polled.add(monitor)
+            if self.pollTask is None:
+                self.pollTask = self._loop().create_task(self._poll())
+        else:
+            self.watched.setdefault(wd, set()).add(monitor)
+
+    def remove(self, monitor: JobMonitor):
+        self.monitors.discard(monitor)
+        self.polled.discard(monitor)
+        for directory, wd in list(self.directories.items()):
+            monitors = self.watched.get(wd, set())
+            monitors.discard(monitor)
+            # The watches count against the per-user inotify limit
+            if not monitors:
+                self.libc.inotify_rm_watch(self.fd, wd)
+                del self.directories[directory]
+                self.watched.pop(wd, None)
+        if not self.monitors:
+            self.close()
+
+    def close(self):
+        """Closes the inotify file descriptor and forgets the watcher of the loop"""
+        loop = self._loop()
+        if loop is not None and self._watchers.get(loop) is self:
+            del self._watchers[loop]
+        if self.fd is not None:
+            if loop is not None and not loop.is_closed():
+                loop.remove_reader(self.fd)
+            self._closeFd()
+            self.fd = None
+
+    def _watch(self, directory: str) -> typing.Optional[int]:
+        if self.fd is None:
+            return None
+        if directory not in self.directories:
+            mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+            if wd < 0:
+                return None
+            self.directories[directory] = wd
+        return self.directories[directory]
+
+    def _readInotify(self):
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = struct.unpack_from("iIII", data, offset)
+                name = data[offset + 16 : offset + 16 + length].rstrip(b"\0").decode("utf-8", "replace")
+                offset += 16 + length
+                for monitor in self.watched.get(wd, ()):
+                    if name.startswith(monitor.jobName + "."):
+                        changed.add(monitor)
+        for monitor in changed:
+            monitor.update()
+
+    async def _poll(self):
+        while self.polled:
+            await asyncio.sleep(self.pollInterval)
+            for monitor in list(self.polled):
+                monitor.update()
+        self.pollTask = None
@@ -0,0 +1,367 @@
+import os
+import shlex
+import subprocess
+import threading
+import time
+import typing
+from concurrent.futures import Future
+
+from .JobCache import JobCache
+from .StatusFile import StatusSummary, readStatusFile
+
+
+def licenseTokens(cpus: int) -> int:
+    """This function returns the number of analysis license tokens required by a job.
+
+    Parameters
+    ----------
+    cpus
+        An Int specifying the number of CPUs used by the job.
+
+    Returns
+    -------
+    int
+        The number of tokens, `int(5 * cpus ** 0.422)`.
+    """
+    return int(5 * cpus**0.422)
+
+
+class JobResult:
+    """The JobResult object is the result of a job submitted to a
+    :py:class:`~abaqus.Job.JobPool.JobPool` object.
+
+    Attributes
+    ----------
+    jobName: str
+        A String specifying the name of the job.
+    inputFile: str
+        A String specifying the path of the input file.
+    workDirectory: str
+        A String specifying the directory the job was executed in.
+    exitStatus: int
+        An Int specifying the exit status of the Abaqus command.
+    wallTime: float
+        A Float specifying the wall-clock time of the job in seconds.
+    status: StatusSummary
+        A :py:class:`~abaqus.Job.StatusFile.StatusSummary` object summarizing the *.sta* file.
+    cached: bool
+        A Boolean specifying whether the results were restored from a
+        :py:class:`~abaqus.Job.JobCache.JobCache` object instead of running Abaqus.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.Job.JobPool import JobPool
+        JobPool().submit(...).result()
+
+    """
+
+    def __init__(
+        self,
+        jobName: str,
+        inputFile: str,
+        workDirectory: str,
+        exitStatus: int,
+        wallTime: float,
+        status: StatusSummary,
+        cached: bool = False,
+    ):
+        self.jobName = jobName
+        self.inputFile = inputFile
+        self.workDirectory = workDirectory
+        self.exitStatus = exitStatus
+        self.wallTime = wallTime
+        self.status = status
+        self.cached = cached
+
+    @property
+    def succeeded(self) -> bool:
+        """A Boolean specifying whether the command succeeded and the analysis completed."""
+        return self.exitStatus == 0 and self.status.completed
+
+    def __repr__(self):
+        return "JobResult(jobName={!r}, exitStatus={}, wallTime={:.1f}, status={!r}, cached={})".format(
+            self.jobName, self.exitStatus, self.wallTime, self.status, self.cached
+        )
+
+
+class _PendingJob:
+    def __init__(
+        self,
+        future: Future,
+        jobName: str,
+        inputFile: str,
+        workDirectory: str,
+        command: list[str],
+        userSubroutine: str,
+        options: str,
+        cpus: int,
+        memory: float,
+        tokens: int,
+    ):
+        self.future = future
+        self.jobName = jobName
+        self.inputFile = inputFile
+        self.workDirectory = workDirectory
+        self.command = command
+        self.userSubroutine = userSubroutine
+        self.options = options
+        self.cpus = cpus
+        self.memory = memory
+        self.tokens = tokens
+
+
+class JobPool:
+    """The JobPool object runs many input files in parallel on the local machine. Every job is
+    launched as a separate Abaqus process in its own working directory, and is started as soon
+    as enough CPUs, memory and license tokens are available.
+
+    Attributes
+    ----------
+    cpus: int
+        An Int specifying the number of CPUs available to the pool.
+    memory: float
+        A Float specifying the memory in megabytes available to the pool, or None for no limit.
+    tokens: int
+        An Int specifying the number of license tokens available to the pool, or None for no
+        limit.
+    cache: JobCache
+        A :py:class:`~abaqus.Job.JobCache.JobCache` object the results are restored from and
+        stored to, or None.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.Job.JobPool import JobPool
+
+        with JobPool(cpus=8, tokens=50) as pool:
+            futures = pool.map(['Job-1.inp', 'Job-2.inp'], cpus=2)
+            results = [future.result() for future in futures]
+
+    """
+
+    def __init__(
+        self,
+        cpus: int = None,
+        memory: float = None,
+        tokens: int = None,
+        abaqus: str = None,
+        cache: JobCache = None,
+    ):
+        """This method creates a JobPool object.
+
+        Parameters
+        ----------
+        cpus
+            An Int specifying the number of CPUs available to the pool. The default value is
+            the number of CPUs of the machine.
+        memory
+            A Float specifying the memory in megabytes available to the pool. The default value
+            is None, i.e., no limit.
+        tokens
+            An Int specifying the number of license tokens available to the pool. The default
+            value is None, i.e., no limit.
+        abaqus
+            A String specifying the Abaqus command. The default value is the value of the
+            *ABAQUS_BAT_PATH* environment variable or `abaqus`.
+        cache
+            A :py:class:`~abaqus.Job.JobCache.JobCache` object. If it is given, an analysis
+            already in the cache is restored instead of running Abaqus, and completed analyses are
+            stored in the cache. The default value is None.
+        """
+        self.cpus = cpus or os.cpu_count() or 1
+        self.memory = memory
+        self.tokens = tokens
+        self.abaqus = abaqus or os.environ.get("ABAQUS_BAT_PATH", "abaqus")
+        self.cache = cache
+        self._pending: list[_PendingJob] = []
+        self._running: set[_PendingJob] = set()
+        self._usedCpus = 0
+        self._usedMemory = 0.0
+        self._usedTokens = 0
+        self._shutdown = False
+        self._condition = threading.Condition()
+        self._scheduler = threading.Thread(target=self._schedule, name="JobPool", daemon=True)
+        self._scheduler.start()
+
+    def submit(
+        self,
+        inputFile: str,
+        userSubroutine: str = None,
+        options: str = "",
+        cpus: int = 1,
+        memory: float = None,
+        jobName: str = None,
+        workDirectory: str = None,
+    ) -> Future:
+        """This method queues an input file for analysis.
+
+        Parameters
+        ----------
+        inputFile
+            A String specifying the path of the input file, suffix can be included or not.
+        userSubroutine
+            A String specifying the path of the user subroutine.
+        options
+            A String specifying additional options of the Abaqus command, i.e., `double`. The
+            `job`, `input`, `user`, `cpus`, `memory` and `interactive` options are set by the pool.
+        cpus
+            An Int specifying the number of CPUs used by the job. The default value is 1.
+        memory
+            A Float specifying the memory in megabytes used by the job. The default value is None,
+            i.e., the memory is not accounted and the Abaqus default is used.
+        jobName
+            A String specifying the name of the job. The default value is the name of the input
+            file.
+        workDirectory
+            A String specifying the directory the job is executed in. The default value is the
+            directory of the input file.
+
+        Returns
+        -------
+        Future
+            A `concurrent.futures.Future` object whose result is a :py:class:`JobResult` object.
+
+        Raises
+        ------
+        ValueError
+            If the job requires more resources than the pool has.
+        """
+        inputFile = os.path.abspath(inputFile)
+        if not inputFile.endswith(".inp"):
+            inputFile += ".inp"
+        jobName = jobName or os.path.splitext(os.path.basename(inputFile))[0]
+        workDirectory = os.path.abspath(workDirectory or os.path.dirname(inputFile))
+        tokens = licenseTokens(cpus)
+        if cpus > self.cpus:
+            raise ValueError("Job {} requires {} CPUs, the pool has {}".format(jobName, cpus, self.cpus))
+        if memory is not None and self.memory is not None and memory > self.memory:
+            raise ValueError("Job {} requires {} MB, the pool has {}".format(jobName, memory, self.memory))
+        if self.tokens is not None and tokens > self.tokens:
+            raise ValueError("Job {} requires {} tokens, the pool has {}".format(jobName, tokens, self.tokens))
+
+        command = [self.abaqus, "job={}".format(jobName), "input={}".format(inputFile), "cpus={}".format(cpus)]
+        if userSubroutine is not None:
+            command.append("user={}".format(os.path.abspath(userSubroutine)))
+        if memory is not None:
+            command.append("memory={}mb".format(int(memory)))
+        command += shlex.split(options) + ["interactive"]
+
+        future = Future()
+        job = _PendingJob(
+            future, jobName, inputFile, workDirectory, command, userSubroutine, options, cpus, memory or 0.0, tokens
+        )
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit a job after shutdown")
+            self._pending.append(job)
+            self._condition.notify_all()
+        return future
+
+    def map(self, inputFiles: typing.Iterable[str], **kwargs) -> list[Future]:
+        """This method queues many input files with the same options.
+
+        Parameters
+        ----------
+        inputFiles
+            A sequence of Strings specifying the paths of the input files.
+        kwargs
+            The arguments of :py:meth:`submit`.
+
+        Returns
+        -------
+        list[Future]
+            A list of `concurrent.futures.Future` objects in the order of the input files.
+        """
+        return [self.submit(inputFile, **kwargs) for inputFile in inputFiles]
+
+    def shutdown(self, wait: bool = True, cancelPending: bool = False):
+        """This method stops accepting jobs.
+
+        Parameters
+        ----------
+        wait
+            A Boolean specifying whether to wait for the queued and running jobs to finish.
+        cancelPending
+            A Boolean specifying whether to cancel the jobs that have not started yet.
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancelPending:
+                for job in self._pending:
+                    job.future.cancel()
+                self._pending.clear()
+            self._condition.notify_all()
+        if wait:
+            self._scheduler.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown(wait=True)
+
+    def _fits(self, job: _PendingJob) -> bool:
+        if self._usedCpus + job.cpus > self.cpus:
+            return False
+        if self.memory is not None and self._usedMemory + job.memory > self.memory:
+            return False
+        if self.tokens is not None and self._usedTokens + job.tokens > self.tokens:
+            return False
+        return True
+
+    def _schedule(self):
+        with self._condition:
+            while True:
+                # Start every queued job that fits, in submission order
+                for job in list(self._pending):
+                    if job.future.cancelled():
+                        self._pending.remove(job)
+                    elif self._fits(job):
+                        self._pending.remove(job)
+                        if job.future.set_running_or_notify_cancel():
+                            self._start(job)
+                if self._shutdown and not self._pending and not self._running:
+                    return
+                self._condition.wait(timeout=1.0)
+
+    def _start(self, job: _PendingJob):
+        self._usedCpus += job.cpus
+        self._usedMemory += job.memory
+        self._usedTokens += job.tokens
+        self._running.add(job)
+        threading.Thread(target=self._run, args=(job,), daemon=True).start()
+
+    def _run(self, job: _PendingJob):
+        start = time.perf_counter()
+        try:
+            os.makedirs(job.workDirectory, exist_ok=True)
+            key = cached = None
+            if self.cache is not None:
+                key = self.cache.key(job.inputFile, job.userSubroutine, job.options, self.abaqus)
+                cached = self.cache.restore(key, job.workDirectory, job.jobName)
+            exitStatus = 0 if cached else subprocess.call(job.command, cwd=job.workDirectory, shell=os.name == "nt")
+            status = readStatusFile(os.path.join(job.workDirectory, job.jobName + ".sta"))
+            if key is not None and not cached and exitStatus == 0 and status.completed:
+                self.cache.store(key, job.workDirectory, job.jobName)
+            wallTime = time.perf_counter() - start
+            result = JobResult(
+                job.jobName, job.inputFile, job.workDirectory, exitStatus, wallTime, status, bool(cached)
+            )
+        except BaseException as e:
+            job.future.set_exception(e)
+        else:
+            job.future.set_result(result)
+        finally:
+            with self._condition:
+                self._usedCpus -= job.cpus
+                self._usedMemory -= job.memory
+                self._usedTokens -= job.tokens
+                self._running.discard(job)
+                self._condition.notify_all()
@@ -1,7 +1,13 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .Queue import Queue
 from ..Session.SessionBase import SessionBase
 
+if typing.TYPE_CHECKING:
+    from .Queue import Queue
+
 
 class JobSession(SessionBase):
     def Queue(
@@ -69,6 +75,7 @@ class JobSession(SessionBase):
             - If *fileCopy*=ON and *directory* is empty:
               Directory in which to run the job on the remote computer is not set.
         """
+        from .Queue import Queue
         self.queues[name] = queue = Queue(
             name,
             queueName,
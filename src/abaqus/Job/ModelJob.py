@@ -1,6 +1,9 @@
+import warnings
+
 from abaqusConstants import *
 from .Job import Job
 from .MessageArray import MessageArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class ModelJob(Job):
@@ -236,7 +239,7 @@ class ModelJob(Job):
     userSubroutine: str = ""
 
     # A MessageArray object specifying the messages received during an analysis.
-    messages: MessageArray = MessageArray()
+    messages: MessageArray = lazyDefault(MessageArray)
 
     # A tuple of Strings specifying the environment variables and their values.
     environment: tuple = ()
@@ -367,10 +370,38 @@ class ModelJob(Job):
         -------
             A ModelJob object.
         """
-        pass
+        self.name = name
+        self.model = model
+        self.description = description
+        self.type = type
+        self.queue = queue
+        self.waitHours = waitHours
+        self.waitMinutes = waitMinutes
+        self.atTime = atTime
+        self.echoPrint = echoPrint
+        self.contactPrint = contactPrint
+        self.modelPrint = modelPrint
+        self.historyPrint = historyPrint
+        self.scratch = scratch
+        self.userSubroutine = userSubroutine
+        self.numCpus = numCpus
+        self.memory = memory
+        self.memoryUnits = memoryUnits
+        self.explicitPrecision = explicitPrecision
+        self.nodalOutputPrecision = nodalOutputPrecision
+        self.parallelizationMethodExplicit = parallelizationMethodExplicit
+        self.numDomains = numDomains
+        self.activateLoadBalancing = activateLoadBalancing
+        self.multiprocessingMode = multiprocessingMode
 
     def writeInput(self, consistencyChecking: Boolean = ON):
-        """This method writes an input file.
+        """This method writes an input file named after the job in the current directory. The
+        keywords are written by an
+        :py:class:`~abaqus.Job.InputFileWriter.InputFileWriter` object, see
+        :py:meth:`~abaqus.Job.InputFileWriter.InputFileWriter.writeModel` for the objects of the
+        model that are written. If the model has objects that cannot be written, a warning is
+        issued and no input file is written, the input file is then written by Abaqus/CAE when
+        the script is executed in it.
 
         Parameters
         ----------
@@ -378,8 +409,30 @@ class ModelJob(Job):
             A Boolean specifying whether to perform consistency checking for the job. The default
             value is ON.It is not recommended to turn the consistency checking off unless you are
             absolutely sure the model is consistent.
+
+        Raises
+        ------
+        ValueError
+            If the model does not exist.
         """
-        pass
+        from .InputFileWriter import InputFileWriter, unsupportedObjects
+
+        model = self.model
+        if isinstance(model, str):
+            from abaqus import mdb
+
+            if model not in mdb.models:
+                raise ValueError("The model {} does not exist".format(model))
+            model = mdb.models[model]
+        unsupported = unsupportedObjects(model)
+        if unsupported:
+            warnings.warn(
+                "The input file of the job {} is not written, the model has objects that cannot be written: ".format(self.name)
+                + "; ".join(unsupported)
+            )
+            return
+        with InputFileWriter(self.name + ".inp") as writer:
+            writer.writeModel(model, self)
 
     def setValues(self):
         """This method modifies the ModelJob object."""
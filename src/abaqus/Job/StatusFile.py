@@ -0,0 +1,105 @@
+import os
+import re
+
+# Abaqus/Standard: STEP INC ATT SEVERE-DISCON-ITERS EQUIL-ITERS TOTAL-ITERS TOTAL-TIME STEP-TIME INC
+STANDARD_INCREMENT = re.compile(
+    r"^\s*(\d+)\s+(\d+)\s+(\d+)(U?)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\S+)\s+(\S+)\s+(\S+)"
+)
+# Abaqus/Explicit: STEP INCREMENT STEP-TIME TOTAL-TIME CPU-TIME STABLE-INCREMENT ...
+EXPLICIT_INCREMENT = re.compile(r"^\s*(\d+)\s+(\d+)\s+(\S+E[+-]\d+)\s+(\S+E[+-]\d+)\s+(\d+:\d+:\d+)\s+(\S+)")
+
+
+class StatusSummary:
+    """The StatusSummary object summarizes the status (*.sta*) file of an analysis.
+
+    Attributes
+    ----------
+    completed: bool
+        A Boolean specifying whether the analysis has completed successfully.
+    finished: bool
+        A Boolean specifying whether the analysis has finished, successfully or not.
+    step: int
+        An Int specifying the step number of the last increment.
+    increment: int
+        An Int specifying the number of the last increment.
+    stepTime: float
+        A Float specifying the step time of the last increment.
+    totalTime: float
+        A Float specifying the total time of the last increment.
+    increments: int
+        An Int specifying the number of converged increments.
+    cutbacks: int
+        An Int specifying the number of attempts that were cut back.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.Job.StatusFile import readStatusFile
+
+    """
+
+    completed: bool = False
+    finished: bool = False
+    step: int = 0
+    increment: int = 0
+    stepTime: float = 0.0
+    totalTime: float = 0.0
+    increments: int = 0
+    cutbacks: int = 0
+
+    def update(self, line: str):
+        """This method updates the summary with a line of the status file.
+
+        Parameters
+        ----------
+        line
+            A String specifying the line.
+        """
+        match = STANDARD_INCREMENT.match(line)
+        if match is not None:
+            if match.group(4) == "U":
+                self.cutbacks += 1
+                return
+            self.step, self.increment = int(match.group(1)), int(match.group(2))
+            self.totalTime, self.stepTime = float(match.group(8)), float(match.group(9))
+            self.increments += 1
+            return
+        match = EXPLICIT_INCREMENT.match(line)
+        if match is not None:
+            self.step, self.increment = int(match.group(1)), int(match.group(2))
+            self.stepTime, self.totalTime = float(match.group(3)), float(match.group(4))
+            self.increments += 1
+            return
+        if "HAS COMPLETED SUCCESSFULLY" in line:
+            self.completed = self.finished = True
+        elif "HAS NOT BEEN COMPLETED" in line:
+            self.finished = True
+
+    def __repr__(self):
+        return "StatusSummary(completed={}, step={}, increment={}, totalTime={}, increments={}, cutbacks={})".format(
+            self.completed, self.step, self.increment, self.totalTime, self.increments, self.cutbacks
+        )
+
+
+def readStatusFile(fileName: str) -> StatusSummary:
+    """This function reads the status (*.sta*) file of an analysis.
+
+    Parameters
+    ----------
+    fileName
+        A String specifying the path of the status file.
+
+    Returns
+    -------
+    StatusSummary
+        A :py:class:`StatusSummary` object, empty if the file does not exist.
+    """
+    summary = StatusSummary()
+    if os.path.exists(fileName):
+        with open(fileName, "r", errors="replace") as file:
+            for line in file:
+                summary.update(line)
+    return summary
@@ -0,0 +1,297 @@
+import importlib
+import math
+import os
+import typing
+
+import abaqusConstants
+from .JournalProxy import JournalProxy
+from ..UtilityAndView.SymbolicConstant import SymbolicConstant
+
+# Modules whose functions and classes are called directly in model scripts, their members are
+# replaced by JournalProxy objects when the journal is enabled.
+RECORDED_MODULES = (
+    "connectorBehavior",
+    "displayGroupMdbToolset",
+    "driverUtils",
+    "material",
+    "mesh",
+    "section",
+)
+
+_PLAIN_TYPES = (str, int, float, complex, bool, type(None))
+
+
+class Journal:
+    """The Journal object records the calls made on the model database while the script is
+    running in plain Python, with their already-evaluated arguments. When
+    :py:meth:`~abaqus.abaqus.Mdb.saveAs` is called, only the recorded journal is replayed in
+    Abaqus/CAE instead of the whole script, so the script is not executed twice.
+
+    The journal is enabled by setting the *ABAQUS_JOURNAL* environment variable to `1` before
+    importing the abaqus module.
+
+    Attributes
+    ----------
+    statements: list[str]
+        A list of Strings specifying the recorded Python statements.
+    modules: set[str]
+        A set of Strings specifying the modules referenced by the recorded statements.
+    errors: list[str]
+        A list of Strings specifying why some calls could not be recorded. If it is not empty,
+        the journal is not replayable and the whole script is executed in Abaqus/CAE instead.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.Journal.Journal import getJournal
+
+    """
+
+    def __init__(self):
+        """This method creates an empty Journal object."""
+        self.statements: list[str] = []
+        self.modules: set[str] = set()
+        self.errors: list[str] = []
+        self._variables = 0
+        # id of the recorded objects -> (expression, object), the objects are kept alive so
+        # that their ids are not reused
+        self._expressions: dict[int, tuple[str, typing.Any]] = {}
+
+    @property
+    def isReplayable(self) -> bool:
+        """A Boolean specifying whether the journal can be replayed in Abaqus/CAE."""
+        return not self.errors
+
+    def root(self, obj, expression: str) -> JournalProxy:
+        """This method wraps an object available by name in Abaqus/CAE, i.e., `mdb`.
+
+        Parameters
+        ----------
+        obj
+            The object to wrap.
+        expression
+            A String specifying the name of the object in Abaqus/CAE.
+
+        Returns
+        -------
+        JournalProxy
+            A :py:class:`~abaqus.Journal.JournalProxy.JournalProxy` object.
+        """
+        self._expressions[id(obj)] = (expression, obj)
+        return JournalProxy(obj, expression, self)
+
+    def recordModule(self, name: str):
+        """This method replaces the public functions and classes of a module by JournalProxy
+        objects, so that calling them directly is recorded.
+
+        Parameters
+        ----------
+        name
+            A String specifying the name of the module.
+        """
+        module = importlib.import_module(name)
+        for attr, value in list(vars(module).items()):
+            if attr.startswith("_") or not callable(value) or isinstance(value, JournalProxy):
+                continue
+            setattr(module, attr, JournalProxy(value, "{}.{}".format(name, attr), self))
+
+    def recordStatement(self, statement: str):
+        """This method appends a statement to the journal.
+
+        Parameters
+        ----------
+        statement
+            A String specifying the Python statement.
+        """
+        self.statements.append(statement)
+
+    def recordCall(self, function: JournalProxy, args: tuple, kwargs: dict):
+        """This method executes a call and records it in the journal.
+
+        Parameters
+        ----------
+        function
+            A :py:class:`~abaqus.Journal.JournalProxy.JournalProxy` object wrapping the callable.
+        args
+            A tuple of the positional arguments.
+        kwargs
+            A dict of the keyword arguments.
+
+        Returns
+        -------
+            The result of the call, wrapped by a JournalProxy object unless it is a plain value.
+        """
+        expression = object.__getattribute__(function, "_journalExpression")
+        self._addModule(expression)
+        try:
+            arguments = [self.encode(arg) for arg in args]
+            arguments += ["{}={}".format(key, self.encode(value)) for key, value in kwargs.items()]
+            call = "{}({})".format(expression, ", ".join(arguments))
+        except ValueError as e:
+            self.errors.append("{}: {}".format(expression, e))
+            call = None
+
+        variable = None
+        if call is not None:
+            self._variables += 1
+            variable = "_v{}".format(self._variables)
+            self.recordStatement("{} = {}".format(variable, call))
+        result = self.unwrap(function)(*self.unwrap(args), **self.unwrap(kwargs))
+        if variable is None or (result is not None and isinstance(result, _PLAIN_TYPES)):
+            return result
+        self._expressions.setdefault(id(result), (variable, result))
+        return JournalProxy(result, variable, self)
+
+    def wrap(self, value, expression: str):
+        """This method wraps a value read from a recorded object.
+
+        Parameters
+        ----------
+        value
+            The value.
+        expression
+            A String specifying the Python expression of the value.
+
+        Returns
+        -------
+            A :py:class:`~abaqus.Journal.JournalProxy.JournalProxy` object, or the value itself if
+            it is a plain value.
+        """
+        if isinstance(value, _PLAIN_TYPES) or isinstance(value, JournalProxy):
+            return value
+        self._expressions.setdefault(id(value), (expression, value))
+        return JournalProxy(value, expression, self)
+
+    def unwrap(self, value):
+        """This method replaces the JournalProxy objects in a value by the objects they wrap.
+
+        Parameters
+        ----------
+        value
+            The value, it can be a JournalProxy object, a tuple, a list or a dict.
+
+        Returns
+        -------
+            The unwrapped value.
+        """
+        if isinstance(value, JournalProxy):
+            return object.__getattribute__(value, "_journalObject")
+        if type(value) in (tuple, list):
+            return type(value)(self.unwrap(item) for item in value)
+        if type(value) is dict:
+            return {self.unwrap(key): self.unwrap(item) for key, item in value.items()}
+        return value
+
+    def encode(self, value) -> str:
+        """This method returns the Python source code of a value.
+
+        Parameters
+        ----------
+        value
+            The value.
+
+        Returns
+        -------
+        str
+            The Python source code of the value.
+
+        Raises
+        ------
+        ValueError
+            If the value can not be represented in the journal.
+        """
+        if isinstance(value, JournalProxy):
+            return object.__getattribute__(value, "_journalExpression")
+        if value is None or isinstance(value, (bool, int, complex)):
+            return repr(value)
+        if isinstance(value, float):
+            return repr(value) if math.isfinite(value) else "float('{}')".format(value)
+        if isinstance(value, SymbolicConstant):
+            text = value.getText()
+            if getattr(abaqusConstants, text, None) is value:
+                return text
+            return "SymbolicConstant({!r})".format(text)
+        if isinstance(value, str):
+            return repr(value)
+        if type(value) is tuple:
+            items = [self.encode(item) for item in value]
+            return "({})".format(", ".join(items) + ("," if len(items) == 1 else ""))
+        if type(value) is list:
+            return "[{}]".format(", ".join(self.encode(item) for item in value))
+        if type(value) is dict:
+            return "{{{}}}".format(
+                ", ".join("{}: {}".format(self.encode(k), self.encode(v)) for k, v in value.items())
+            )
+        if type(value).__module__ == "numpy":
+            return self.encode(value.tolist())
+        if id(value) in self._expressions:
+            return self._expressions[id(value)][0]
+        raise ValueError("{!r} was not created through a recorded call".format(value))
+
+    def script(self) -> str:
+        """This method returns the replayable Abaqus/CAE script of the journal.
+
+        Returns
+        -------
+        str
+            The Python source code of the journal.
+        """
+        lines = [
+            "# -*- coding: utf-8 -*-",
+            "from abaqus import *",
+            "from abaqusConstants import *",
+            "from caeModules import *",
+        ]
+        lines += ["import {}".format(module) for module in sorted(self.modules)]
+        return "\n".join(lines + self.statements) + "\n"
+
+    def write(self, fileName: str):
+        """This method writes the replayable script of the journal to a file.
+
+        Parameters
+        ----------
+        fileName
+            A String specifying the path of the file.
+        """
+        with open(fileName, "w", encoding="utf-8") as file:
+            file.write(self.script())
+
+    def _addModule(self, expression: str):
+        module = expression.split(".", 1)[0]
+        if module in RECORDED_MODULES:
+            self.modules.add(module)
+
+
+_journal: typing.Optional[Journal] = None
+
+
+def isJournalEnabled() -> bool:
+    """This function returns whether the journal recording mode is enabled by the
+    *ABAQUS_JOURNAL* environment variable.
+
+    Returns
+    -------
+    bool
+        Whether the calls on the model database are recorded.
+    """
+    return os.environ.get("ABAQUS_JOURNAL", "0").lower() not in ("", "0", "off", "false")
+
+
+def getJournal() -> typing.Optional[Journal]:
+    """This function returns the journal of the current script, it is created on the first call
+    if the journal recording mode is enabled.
+
+    Returns
+    -------
+    Journal
+        A :py:class:`Journal` object, or None if the journal recording mode is disabled.
+    """
+    global _journal
+    if _journal is None and isJournalEnabled():
+        _journal = Journal()
+        for module in RECORDED_MODULES:
+            _journal.recordModule(module)
+    return _journal
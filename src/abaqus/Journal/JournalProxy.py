@@ -0,0 +1,87 @@
+import typing
+
+if typing.TYPE_CHECKING:
+    from .Journal import Journal
+
+
+class JournalProxy:
+    """The JournalProxy object stands in for an object of the model database while a
+    :py:class:`~abaqus.Journal.Journal.Journal` is recording. Attribute and item accesses build
+    the Python expression of the wrapped object, calls and assignments are executed on the
+    wrapped object and recorded in the journal with their already-evaluated arguments.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        mdb
+
+    """
+
+    __slots__ = ("_journalObject", "_journalExpression", "_journal")
+
+    def __init__(self, obj, expression: str, journal: "Journal"):
+        object.__setattr__(self, "_journalObject", obj)
+        object.__setattr__(self, "_journalExpression", expression)
+        object.__setattr__(self, "_journal", journal)
+
+    @property
+    def __class__(self):
+        return type(self._journalObject)
+
+    def __getattr__(self, name: str):
+        value = getattr(self._journalObject, name)
+        return self._journal.wrap(value, "{}.{}".format(self._journalExpression, name))
+
+    def __setattr__(self, name: str, value):
+        self._journal.recordStatement(
+            "{}.{} = {}".format(self._journalExpression, name, self._journal.encode(value))
+        )
+        setattr(self._journalObject, name, self._journal.unwrap(value))
+
+    def __call__(self, *args, **kwargs):
+        return self._journal.recordCall(self, args, kwargs)
+
+    def __getitem__(self, key):
+        value = self._journalObject[self._journal.unwrap(key)]
+        return self._journal.wrap(
+            value, "{}[{}]".format(self._journalExpression, self._journal.encode(key))
+        )
+
+    def __setitem__(self, key, value):
+        self._journal.recordStatement(
+            "{}[{}] = {}".format(
+                self._journalExpression, self._journal.encode(key), self._journal.encode(value)
+            )
+        )
+        self._journalObject[self._journal.unwrap(key)] = self._journal.unwrap(value)
+
+    def __delitem__(self, key):
+        self._journal.recordStatement(
+            "del {}[{}]".format(self._journalExpression, self._journal.encode(key))
+        )
+        del self._journalObject[self._journal.unwrap(key)]
+
+    def __iter__(self):
+        for i, item in enumerate(self._journalObject):
+            yield self._journal.wrap(item, "{}[{}]".format(self._journalExpression, i))
+
+    def __len__(self):
+        return len(self._journalObject)
+
+    def __contains__(self, item):
+        return self._journal.unwrap(item) in self._journalObject
+
+    def __bool__(self):
+        return bool(self._journalObject)
+
+    def __eq__(self, other):
+        return self._journalObject == self._journal.unwrap(other)
+
+    def __hash__(self):
+        return hash(self._journalObject)
+
+    def __repr__(self):
+        return repr(self._journalObject)
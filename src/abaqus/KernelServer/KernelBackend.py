@@ -0,0 +1,124 @@
+import os
+import sys
+
+
+class KernelBackend:
+    """The KernelBackend object describes how the long-lived kernel process is launched. The
+    kernel process runs the *kernelLoop.py* command loop, connects back to the
+    :py:class:`~abaqus.KernelServer.KernelServer.KernelServer` and executes the scripts it
+    receives.
+
+    Attributes
+    ----------
+    resetModelDatabase: bool
+        A Boolean specifying whether the kernel creates a new empty model database before each
+        script is executed, so that every script starts from the same state as a fresh
+        `abaqus cae` launch.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.KernelServer.KernelBackend import KernelBackend
+
+    """
+
+    # A Boolean specifying whether the kernel creates a new empty model database before each
+    # script is executed.
+    resetModelDatabase: bool = False
+
+    def command(self, loopScript: str) -> list[str]:
+        """This method returns the command line used to launch the kernel process.
+
+        Parameters
+        ----------
+        loopScript
+            A String specifying the path of the kernel command loop script.
+
+        Returns
+        -------
+        list[str]
+            The command line as a list of arguments.
+        """
+        raise NotImplementedError
+
+    def environment(self) -> dict[str, str]:
+        """This method returns the environment variables of the kernel process. The
+        *ABAQUS_KERNEL_SERVER* variable is removed, the scripts executed by the kernel must not
+        send their commands to another kernel process.
+
+        Returns
+        -------
+        dict[str, str]
+            A dict of environment variables.
+        """
+        env = dict(os.environ)
+        env.pop("ABAQUS_KERNEL_SERVER", None)
+        if self.resetModelDatabase:
+            env["PYABAQUS_KERNEL_RESET"] = "1"
+        return env
+
+
+class AbaqusKernelBackend(KernelBackend):
+    """The AbaqusKernelBackend object launches the kernel command loop in an `abaqus cae -noGUI`
+    process, the Abaqus command is read from the *ABAQUS_BAT_PATH* environment variable.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.KernelServer.KernelBackend import AbaqusKernelBackend
+
+    """
+
+    resetModelDatabase: bool = True
+
+    def __init__(self, abaqus: str = None):
+        """This method creates an AbaqusKernelBackend object.
+
+        Parameters
+        ----------
+        abaqus
+            A String specifying the Abaqus command. The default value is the value of the
+            *ABAQUS_BAT_PATH* environment variable or `abaqus`.
+        """
+        if abaqus is None:
+            abaqus = os.environ.get("ABAQUS_BAT_PATH", "abaqus")
+        self.abaqus = abaqus
+
+    def command(self, loopScript: str) -> list[str]:
+        return [self.abaqus, "cae", "noGUI={}".format(loopScript)]
+
+
+class FakeKernelBackend(KernelBackend):
+    """The FakeKernelBackend object launches the kernel command loop with a plain Python
+    interpreter, so that the kernel protocol can be used without Abaqus installed. The scripts
+    are executed against the type-hint stubs of this package.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.KernelServer.KernelBackend import FakeKernelBackend
+
+    """
+
+    def __init__(self, python: str = None):
+        """This method creates a FakeKernelBackend object.
+
+        Parameters
+        ----------
+        python
+            A String specifying the Python interpreter. The default value is the current
+            interpreter.
+        """
+        self.python = python or sys.executable
+
+    def command(self, loopScript: str) -> list[str]:
+        return [self.python, loopScript]
@@ -0,0 +1,279 @@
+import atexit
+import json
+import os
+import secrets
+import socket
+import subprocess
+import sys
+import typing
+
+from .KernelBackend import KernelBackend, AbaqusKernelBackend, FakeKernelBackend
+
+
+class KernelServer:
+    """The KernelServer object keeps one Abaqus/CAE kernel process alive and sends scripts to
+    it, so that the CAE startup cost is paid only once instead of once per launch. The kernel
+    process runs the *kernelLoop.py* command loop and streams the output of the scripts back
+    while they are running.
+
+    Attributes
+    ----------
+    backend: KernelBackend
+        A :py:class:`~abaqus.KernelServer.KernelBackend.KernelBackend` object specifying how the
+        kernel process is launched.
+    timeout: float
+        A Float specifying the time in seconds to wait for the kernel process to connect.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.KernelServer.KernelServer import KernelServer, getKernelServer
+
+    """
+
+    def __init__(self, backend: KernelBackend = None, timeout: float = 600.0):
+        """This method creates a KernelServer object, the kernel process is started on the first
+        call of :py:meth:`runScript`.
+
+        Parameters
+        ----------
+        backend
+            A :py:class:`~abaqus.KernelServer.KernelBackend.KernelBackend` object. The default
+            value is an :py:class:`~abaqus.KernelServer.KernelBackend.AbaqusKernelBackend` object.
+        timeout
+            A Float specifying the time in seconds to wait for the kernel process to connect.
+            The default value is 600.
+        """
+        self.backend = backend or AbaqusKernelBackend()
+        self.timeout = timeout
+        self._process = None
+        self._socket = None
+        self._reader = None
+        self._requestId = 0
+
+    @property
+    def isRunning(self) -> bool:
+        """A Boolean specifying whether the kernel process is alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """This method starts the kernel process and waits for it to connect, it does nothing if
+        the kernel process is already running.
+
+        Raises
+        ------
+        RuntimeError
+            If the kernel process exits or does not connect within *timeout* seconds.
+        """
+        if self.isRunning:
+            return
+        self.close()
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        listener.settimeout(1.0)
+        token = secrets.token_hex(16)
+        env = self.backend.environment()
+        env["PYABAQUS_KERNEL_PORT"] = str(listener.getsockname()[1])
+        env["PYABAQUS_KERNEL_TOKEN"] = token
+        loopScript = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kernelLoop.py")
+        self._process = subprocess.Popen(self.backend.command(loopScript), env=env)
+        try:
+            waited = 0.0
+            while True:
+                try:
+                    connection, _ = listener.accept()
+                    break
+                except socket.timeout:
+                    waited += 1.0
+                    if self._process.poll() is not None:
+                        raise RuntimeError(
+                            "Kernel process exited with code {} before connecting".format(
+                                self._process.returncode
+                            )
+                        )
+                    if waited >= self.timeout:
+                        raise RuntimeError("Kernel process did not connect within {} s".format(self.timeout))
+        except BaseException:
+            if self._process.poll() is None:
+                self._process.kill()
+            self._terminate()
+            raise
+        finally:
+            listener.close()
+        connection.settimeout(None)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket = connection
+        self._reader = connection.makefile("rb")
+        hello = self._receive()
+        if hello is None or hello.get("token") != token:
+            self.close()
+            raise RuntimeError("Kernel process failed the handshake")
+
+    def runScript(
+        self,
+        scriptPath: str = "",
+        cwd: str = None,
+        argv: typing.Sequence[str] = (),
+        source: str = None,
+        output: typing.Callable[[str, str], None] = None,
+        database: str = None,
+    ) -> int:
+        """This method executes a script in the kernel process and streams its output back.
+
+        Parameters
+        ----------
+        scriptPath
+            A String specifying the path of the script. If *source* is given, the path is only
+            used as the file name of the script.
+        cwd
+            A String specifying the working directory of the script. The default value is the
+            directory of the script, or the current working directory if *source* is given.
+        argv
+            A sequence of Strings specifying the arguments of the script.
+        source
+            A String specifying the source code to execute instead of reading *scriptPath*.
+        output
+            A callable called as `output(stream, text)` for every chunk written to `stdout` or
+            `stderr` by the script. By default, the chunks are written to `sys.stdout` and
+            `sys.stderr`.
+        database
+            A String specifying the path of an output database opened in the current viewport
+            before the script is executed, as by `abaqus cae database=...`, and closed after it.
+
+        Returns
+        -------
+        int
+            The exit status of the script, 0 on success.
+        """
+        self.start()
+        if scriptPath:
+            scriptPath = os.path.abspath(scriptPath)
+        if cwd is None:
+            cwd = os.path.dirname(scriptPath) if source is None else os.getcwd()
+        self._requestId += 1
+        self._send(
+            {
+                "command": "run",
+                "id": self._requestId,
+                "script": scriptPath,
+                "cwd": os.path.abspath(cwd),
+                "argv": list(argv),
+                "source": source,
+                "database": os.path.abspath(database) if database else None,
+            }
+        )
+        while True:
+            message = self._receive()
+            if message is None:
+                self.close()
+                raise RuntimeError("Kernel process exited while running {}".format(scriptPath or "<source>"))
+            if message["type"] == "output":
+                if output is not None:
+                    output(message["stream"], message["data"])
+                else:
+                    stream = sys.stderr if message["stream"] == "stderr" else sys.stdout
+                    stream.write(message["data"])
+            elif message["type"] == "done" and message.get("id") == self._requestId:
+                if message.get("error"):
+                    if output is not None:
+                        output("stderr", message["error"])
+                    else:
+                        sys.stderr.write(message["error"])
+                return message["status"]
+
+    def close(self):
+        """This method asks the kernel process to exit and releases the connection."""
+        if self._socket is not None:
+            try:
+                self._send({"command": "exit"})
+            except OSError:
+                pass
+        self._terminate()
+
+    def _terminate(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        if self._process is not None:
+            try:
+                self._process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+
+    def _send(self, message: dict):
+        self._socket.sendall((json.dumps(message) + "\n").encode("utf-8"))
+
+    def _receive(self) -> typing.Optional[dict]:
+        line = self._reader.readline()
+        if not line:
+            return None
+        return json.loads(line.decode("utf-8"))
+
+
+_kernelServer: typing.Optional[KernelServer] = None
+
+
+def isKernelServerEnabled() -> bool:
+    """This function returns whether the kernel server mode is enabled. The mode is enabled by
+    setting the *ABAQUS_KERNEL_SERVER* environment variable to `1` (or `abaqus`) for the Abaqus
+    backend, or to `fake` for the fake backend, or by calling :py:func:`setKernelServer`. The
+    environment variable is ignored in the kernel process itself, so that a script it executes
+    does not launch another kernel process.
+
+    Returns
+    -------
+    bool
+        Whether scripts are sent to a long-lived kernel process.
+    """
+    if _kernelServer is not None:
+        return True
+    if os.environ.get("PYABAQUS_KERNEL_PORT"):
+        return False
+    return os.environ.get("ABAQUS_KERNEL_SERVER", "0").lower() not in ("", "0", "off", "false")
+
+
+def setKernelServer(server: typing.Optional[KernelServer]):
+    """This function sets the kernel server used by the launchers, the previous one is closed.
+
+    Parameters
+    ----------
+    server
+        A :py:class:`KernelServer` object, or None to disable the kernel server mode unless the
+        *ABAQUS_KERNEL_SERVER* environment variable is set.
+    """
+    global _kernelServer
+    if _kernelServer is not None and _kernelServer is not server:
+        _kernelServer.close()
+    _kernelServer = server
+
+
+def getKernelServer() -> KernelServer:
+    """This function returns the shared kernel server, it is created on the first call and
+    closed when the interpreter exits.
+
+    Returns
+    -------
+    KernelServer
+        A :py:class:`KernelServer` object.
+    """
+    global _kernelServer
+    if _kernelServer is None:
+        mode = os.environ.get("ABAQUS_KERNEL_SERVER", "").lower()
+        backend = FakeKernelBackend() if mode == "fake" else AbaqusKernelBackend()
+        _kernelServer = KernelServer(backend)
+    return _kernelServer
+
+
+@atexit.register
+def _closeKernelServer():
+    if _kernelServer is not None:
+        _kernelServer.close()
@@ -0,0 +1,162 @@
+"""Command loop of the long-lived kernel process.
+
+This script is executed by `abaqus cae noGUI=kernelLoop.py` (or by a plain Python interpreter
+for the fake kernel backend). It connects back to the KernelServer listening on
+*PYABAQUS_KERNEL_PORT*, then executes the scripts it receives one after another, streaming the
+standard output and error back to the client. It must stay compatible with the Python 2.7
+interpreter shipped with older Abaqus releases, and must not import anything from this package.
+"""
+import json
+import os
+import socket
+import sys
+import traceback
+
+
+class Channel:
+    """Newline delimited JSON messages over a socket"""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.reader = sock.makefile("rb")
+
+    def send(self, message):
+        data = json.dumps(message) + "\n"
+        self.sock.sendall(data.encode("utf-8"))
+
+    def receive(self):
+        line = self.reader.readline()
+        if not line:
+            return None
+        return json.loads(line.decode("utf-8"))
+
+
+class StreamWriter:
+    """File-like object forwarding everything written to it to the client"""
+
+    def __init__(self, channel, stream):
+        self.channel = channel
+        self.stream = stream
+
+    def write(self, text):
+        if text:
+            if isinstance(text, bytes):
+                text = text.decode("utf-8", "replace")
+            self.channel.send({"type": "output", "stream": self.stream, "data": text})
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+def resetModelDatabase():
+    from abaqus import Mdb
+
+    Mdb()
+
+
+def closeOpenedOdbs(opened):
+    try:
+        from abaqus import session
+    except ImportError:
+        return
+    for name in list(session.odbs.keys()):
+        if name not in opened:
+            try:
+                session.odbs[name].close()
+            except Exception:
+                pass
+
+
+def openDatabase(path):
+    from abaqus import session
+
+    odb = session.openOdb(path)
+    if session.currentViewportName in session.viewports.keys():
+        session.viewports[session.currentViewportName].setValues(displayedObject=odb)
+
+
+def openedOdbs():
+    if "abaqus" not in sys.modules:
+        return None
+    try:
+        from abaqus import session
+
+        return set(session.odbs.keys())
+    except Exception:
+        return None
+
+
+def runScript(channel, request):
+    if request.get("cwd"):
+        os.chdir(request["cwd"])
+    if os.environ.get("PYABAQUS_KERNEL_RESET") == "1":
+        resetModelDatabase()
+
+    fileName = request.get("script") or "<kernel>"
+    source = request.get("source")
+    if source is None:
+        with open(fileName, "rb") as file:
+            source = file.read().decode("utf-8")
+
+    opened = openedOdbs()
+    if opened is None and request.get("database"):
+        opened = set()
+    stdout, stderr, argv = sys.stdout, sys.stderr, sys.argv
+    sys.stdout = StreamWriter(channel, "stdout")
+    sys.stderr = StreamWriter(channel, "stderr")
+    sys.argv = [fileName] + list(request.get("argv", []))
+    namespace = {"__name__": "__main__", "__file__": fileName, "__builtins__": __builtins__}
+    status, error = 0, None
+    try:
+        if request.get("database"):
+            openDatabase(request["database"])
+        exec(compile(source, fileName, "exec"), namespace)
+    except SystemExit as e:
+        if e.code is None:
+            status = 0
+        elif isinstance(e.code, int):
+            status = e.code
+        else:
+            status, error = 1, str(e.code)
+    except BaseException:
+        status, error = 1, traceback.format_exc()
+    finally:
+        sys.stdout, sys.stderr, sys.argv = stdout, stderr, argv
+    if opened is not None:
+        closeOpenedOdbs(opened)
+    return status, error
+
+
+def main():
+    port = int(os.environ["PYABAQUS_KERNEL_PORT"])
+    sock = socket.create_connection(("127.0.0.1", port))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    channel = Channel(sock)
+    channel.send({"type": "hello", "token": os.environ.get("PYABAQUS_KERNEL_TOKEN", ""), "pid": os.getpid()})
+    cwd = os.getcwd()
+    while True:
+        request = channel.receive()
+        if request is None or request.get("command") == "exit":
+            break
+        if request.get("command") == "run":
+            try:
+                status, error = runScript(channel, request)
+            except BaseException:
+                status, error = 1, traceback.format_exc()
+            os.chdir(cwd)
+            channel.send({"type": "done", "id": request.get("id"), "status": status, "error": error})
+        else:
+            channel.send({"type": "done", "id": request.get("id"), "status": 1,
+                          "error": "Unknown command: {}".format(request.get("command"))})
+    sock.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import typing
+
+T = typing.TypeVar("T")
+
+
+class LazyDefault:
+    """The LazyDefault object is the default value of an attribute declared in a class body. The
+    default value is created when the attribute is first read on an instance and is stored in
+    the instance, so that no object is created when the class is defined and every instance gets
+    its own containers.
+
+    Notes
+    -----
+    This object is created by :py:func:`lazyDefault`:
+
+    .. code-block:: python
+
+        from abaqus.LazyDefault.LazyDefault import lazyDefault
+
+        class OdbFrame:
+            fieldOutputs: dict[str, FieldOutput] = lazyDefault(dict[str, FieldOutput])
+
+    """
+
+    __slots__ = ("factory", "args", "kwargs", "name")
+
+    def __init__(self, factory: typing.Callable, *args, **kwargs):
+        self.factory = factory
+        self.args = args
+        self.kwargs = kwargs
+        self.name = None
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        deferred = instance.__dict__.get("_deferredAttributes")
+        if deferred and self.name in deferred:
+            factory, args, kwargs = deferred.pop(self.name)
+        else:
+            factory, args, kwargs = self.factory, self.args, self.kwargs
+        # This is not a data descriptor, once the value is stored in the instance dictionary, it
+        # is found there without calling this method again
+        value = instance.__dict__[self.name] = factory(*args, **kwargs)
+        return value
+
+    def __repr__(self):
+        return "lazyDefault({})".format(getattr(self.factory, "__name__", self.factory))
+
+
+def lazyDefault(factory: typing.Callable[..., T], *args, **kwargs) -> T:
+    """This function declares the default value of an attribute in a class body, the value is
+    created by calling `factory(*args, **kwargs)` when the attribute is first read on an
+    instance.
+
+    Parameters
+    ----------
+    factory
+        A callable creating the default value, i.e., a class or a lambda.
+    args
+        The positional arguments of the factory.
+    kwargs
+        The keyword arguments of the factory.
+
+    Returns
+    -------
+    T
+        A :py:class:`LazyDefault` object. It is typed as the value created by the factory, so that
+        the type of the attribute is the type of its default value.
+    """
+    return typing.cast(T, LazyDefault(factory, *args, **kwargs))
+
+
+def deferAttribute(instance, name: str, factory: typing.Callable, *args, **kwargs):
+    """This function replaces the factory of an attribute declared with :py:func:`lazyDefault`
+    for one instance, the value is created by calling `factory(*args, **kwargs)` when the
+    attribute is first read on this instance. It is used to create large members, e.g., the
+    nodes of an instance read from a results store, only when they are used.
+
+    Parameters
+    ----------
+    instance
+        The object owning the attribute.
+    name
+        A String specifying the name of the attribute.
+    factory
+        A callable creating the value of the attribute.
+    args
+        The positional arguments of the factory.
+    kwargs
+        The keyword arguments of the factory.
+    """
+    if not isinstance(getattr(type(instance), name, None), LazyDefault):
+        raise ValueError("{} is not a lazy default of {}".format(name, type(instance).__name__))
+    instance.__dict__.pop(name, None)
+    instance.__dict__.setdefault("_deferredAttributes", {})[name] = (factory, args, kwargs)
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .Load import Load
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -46,7 +47,7 @@ class BodyConcentrationFlux(Load):
     field: str = ""
 
     # A Region object specifying the region to which the load is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     def __init__(
         self,
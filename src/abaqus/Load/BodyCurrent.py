@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .Load import Load
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -45,7 +46,7 @@ class BodyCurrent(Load):
     field: str = ""
 
     # A Region object specifying the region to which the load is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     def __init__(
         self,
@@ -2,6 +2,7 @@ import typing
 
 from abaqusConstants import *
 from .Load import Load
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -51,7 +52,7 @@ class BodyForce(Load):
     field: str = ""
 
     # A Region object specifying the region to which the load is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     def __init__(
         self,
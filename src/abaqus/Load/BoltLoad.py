@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .Load import Load
 from ..Datum.DatumAxis import DatumAxis
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -42,10 +43,10 @@ class BoltLoad(Load):
     # A DatumAxis object specifying the orientation of the pre-tension section
     # normal.Note:*datumAxis* is required only for Solid and Shell regions; it has no meaning
     # for Wire regions.
-    datumAxis: DatumAxis = DatumAxis()
+    datumAxis: DatumAxis = lazyDefault(DatumAxis)
 
     # A Region object specifying the region to which the load is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     def __init__(
         self,
@@ -2,6 +2,7 @@ import typing
 
 from abaqusConstants import *
 from .Load import Load
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -67,7 +68,29 @@ class ConcentratedForce(Load):
     field: str = ""
 
     # A Region object specifying the region to which the load is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
+
+    # A String specifying the name of the step in which the load is created.
+    createStepName: str = ""
+
+    # A Float or a Complex specifying the concentrated force component in the
+    # 1-direction. Although *cf1*, *cf2*, and *cf3* are optional arguments, at least one
+    # of them must be nonzero.
+    cf1: float = None
+
+    # A Float or a Complex specifying the concentrated force component in the
+    # 2-direction.
+    cf2: float = None
+
+    # A Float or a Complex specifying the concentrated force component in the
+    # 3-direction.
+    cf3: float = None
+
+    # A String or the SymbolicConstant UNSET specifying the name of the amplitude
+    # reference. UNSET should be used if the load has no amplitude reference. The
+    # default value is UNSET. You should provide the *amplitude* argument only if it is
+    # valid for the specified step.
+    amplitude: str = UNSET
 
     def __init__(
         self,
@@ -135,7 +158,17 @@ class ConcentratedForce(Load):
             A ConcentratedForce object.
         """
         super().__init__()
-        pass
+        self.name = name
+        self.createStepName = createStepName
+        self.region = region
+        self.distributionType = distributionType
+        self.field = field
+        self.cf1 = cf1
+        self.cf2 = cf2
+        self.cf3 = cf3
+        self.amplitude = amplitude
+        self.follower = follower
+        self.localCsys = localCsys
 
     def setValues(
         self,
@@ -1,3 +1,4 @@
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -28,7 +29,7 @@ class Load:
     name: str = ""
 
     # A Region object specifying the region to which the load is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     def deactivate(self, stepName: str):
         """This method deactivates the load in the specified step and all its subsequent steps.
@@ -1,43 +1,49 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .BodyCharge import BodyCharge
-from .BodyConcentrationFlux import BodyConcentrationFlux
-from .BodyCurrent import BodyCurrent
-from .BodyCurrentDensity import BodyCurrentDensity
-from .BodyForce import BodyForce
-from .BodyHeatFlux import BodyHeatFlux
-from .BoltLoad import BoltLoad
-from .ConcCharge import ConcCharge
-from .ConcConcFlux import ConcConcFlux
-from .ConcCurrent import ConcCurrent
-from .ConcPoreFluid import ConcPoreFluid
-from .ConcentratedForce import ConcentratedForce
-from .ConcentratedHeatFlux import ConcentratedHeatFlux
-from .ConnectorForce import ConnectorForce
-from .ConnectorMoment import ConnectorMoment
-from .CoriolisForce import CoriolisForce
-from .Gravity import Gravity
-from .InertiaRelief import InertiaRelief
-from .InwardVolAccel import InwardVolAccel
-from .LineLoad import LineLoad
-from .Moment import Moment
-from .PEGLoad import PEGLoad
-from .PipePressure import PipePressure
-from .Pressure import Pressure
-from .RotationalBodyForce import RotationalBodyForce
-from .ShellEdgeLoad import ShellEdgeLoad
-from .SubmodelSB import SubmodelSB
-from .SubstructureLoad import SubstructureLoad
-from .SurfaceCharge import SurfaceCharge
-from .SurfaceConcentrationFlux import SurfaceConcentrationFlux
-from .SurfaceCurrent import SurfaceCurrent
-from .SurfaceCurrentDensity import SurfaceCurrentDensity
-from .SurfaceHeatFlux import SurfaceHeatFlux
-from .SurfacePoreFluid import SurfacePoreFluid
-from .SurfaceTraction import SurfaceTraction
 from ..Datum.DatumAxis import DatumAxis
 from ..Model.ModelBase import ModelBase
 from ..Region.Region import Region
 
+if typing.TYPE_CHECKING:
+    from .BodyCharge import BodyCharge
+    from .BodyConcentrationFlux import BodyConcentrationFlux
+    from .BodyCurrent import BodyCurrent
+    from .BodyCurrentDensity import BodyCurrentDensity
+    from .BodyForce import BodyForce
+    from .BodyHeatFlux import BodyHeatFlux
+    from .BoltLoad import BoltLoad
+    from .ConcCharge import ConcCharge
+    from .ConcConcFlux import ConcConcFlux
+    from .ConcCurrent import ConcCurrent
+    from .ConcPoreFluid import ConcPoreFluid
+    from .ConcentratedForce import ConcentratedForce
+    from .ConcentratedHeatFlux import ConcentratedHeatFlux
+    from .ConnectorForce import ConnectorForce
+    from .ConnectorMoment import ConnectorMoment
+    from .CoriolisForce import CoriolisForce
+    from .Gravity import Gravity
+    from .InertiaRelief import InertiaRelief
+    from .InwardVolAccel import InwardVolAccel
+    from .LineLoad import LineLoad
+    from .Moment import Moment
+    from .PEGLoad import PEGLoad
+    from .PipePressure import PipePressure
+    from .Pressure import Pressure
+    from .RotationalBodyForce import RotationalBodyForce
+    from .ShellEdgeLoad import ShellEdgeLoad
+    from .SubmodelSB import SubmodelSB
+    from .SubstructureLoad import SubstructureLoad
+    from .SurfaceCharge import SurfaceCharge
+    from .SurfaceConcentrationFlux import SurfaceConcentrationFlux
+    from .SurfaceCurrent import SurfaceCurrent
+    from .SurfaceCurrentDensity import SurfaceCurrentDensity
+    from .SurfaceHeatFlux import SurfaceHeatFlux
+    from .SurfacePoreFluid import SurfacePoreFluid
+    from .SurfaceTraction import SurfaceTraction
+
 
 class LoadModel(ModelBase):
     """Abaqus creates a Model object named `Model-1` when a session is started.
@@ -99,6 +105,7 @@ class LoadModel(ModelBase):
         -------
             A BodyCharge object.
         """
+        from .BodyCharge import BodyCharge
         self.loads[name] = load = BodyCharge(
             name, createStepName, region, magnitude, amplitude, distributionType, field
         )
@@ -151,6 +158,7 @@ class LoadModel(ModelBase):
         -------
             A BodyConcentrationFlux object.
         """
+        from .BodyConcentrationFlux import BodyConcentrationFlux
         self.loads[name] = load = BodyConcentrationFlux(
             name, createStepName, region, magnitude, field, distributionType, amplitude
         )
@@ -203,6 +211,7 @@ class LoadModel(ModelBase):
         -------
             A BodyCurrent object.
         """
+        from .BodyCurrent import BodyCurrent
         self.loads[name] = load = BodyCurrent(
             name, createStepName, region, magnitude, amplitude, distributionType, field
         )
@@ -256,6 +265,7 @@ class LoadModel(ModelBase):
         -------
             A BodyCurrentDensity object.
         """
+        from .BodyCurrentDensity import BodyCurrentDensity
         self.loads[name] = load = BodyCurrentDensity(
             name,
             createStepName,
@@ -322,6 +332,7 @@ class LoadModel(ModelBase):
         -------
             A BodyForce object.
         """
+        from .BodyForce import BodyForce
         self.loads[name] = load = BodyForce(
             name,
             createStepName,
@@ -382,6 +393,7 @@ class LoadModel(ModelBase):
         -------
             A BodyHeatFlux object.
         """
+        from .BodyHeatFlux import BodyHeatFlux
         self.loads[name] = load = BodyHeatFlux(
             name, createStepName, region, magnitude, field, distributionType, amplitude
         )
@@ -444,6 +456,7 @@ class LoadModel(ModelBase):
         ------
             TextError.
         """
+        from .BoltLoad import BoltLoad
         self.loads[name] = load = BoltLoad(
             name,
             createStepName,
@@ -503,6 +516,7 @@ class LoadModel(ModelBase):
         -------
             A ConcCharge object.
         """
+        from .ConcCharge import ConcCharge
         self.loads[name] = load = ConcCharge(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -555,6 +569,7 @@ class LoadModel(ModelBase):
         -------
             A ConcConcFlux object.
         """
+        from .ConcConcFlux import ConcConcFlux
         self.loads[name] = load = ConcConcFlux(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -607,6 +622,7 @@ class LoadModel(ModelBase):
         -------
             A ConcCurrent object.
         """
+        from .ConcCurrent import ConcCurrent
         self.loads[name] = load = ConcCurrent(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -677,6 +693,7 @@ class LoadModel(ModelBase):
         -------
             A ConcentratedForce object.
         """
+        from .ConcentratedForce import ConcentratedForce
         self.loads[name] = load = ConcentratedForce(
             name,
             createStepName,
@@ -743,6 +760,7 @@ class LoadModel(ModelBase):
         -------
             A ConcentratedHeatFlux object.
         """
+        from .ConcentratedHeatFlux import ConcentratedHeatFlux
         self.loads[name] = load = ConcentratedHeatFlux(
             name,
             createStepName,
@@ -802,6 +820,7 @@ class LoadModel(ModelBase):
         -------
             A ConcPoreFluid object.
         """
+        from .ConcPoreFluid import ConcPoreFluid
         self.loads[name] = load = ConcPoreFluid(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -867,6 +886,7 @@ class LoadModel(ModelBase):
         -------
             A ConnectorForce object.
         """
+        from .ConnectorForce import ConnectorForce
         self.loads[name] = load = ConnectorForce(
             name,
             createStepName,
@@ -939,6 +959,7 @@ class LoadModel(ModelBase):
         -------
             A ConnectorMoment object.
         """
+        from .ConnectorMoment import ConnectorMoment
         self.loads[name] = load = ConnectorMoment(
             name,
             createStepName,
@@ -1005,6 +1026,7 @@ class LoadModel(ModelBase):
         -------
             A CoriolisForce object.
         """
+        from .CoriolisForce import CoriolisForce
         self.loads[name] = load = CoriolisForce(
             name,
             createStepName,
@@ -1072,6 +1094,7 @@ class LoadModel(ModelBase):
         -------
             A Gravity object.
         """
+        from .Gravity import Gravity
         self.loads[name] = load = Gravity(
             name,
             createStepName,
@@ -1144,6 +1167,7 @@ class LoadModel(ModelBase):
         -------
             An InertiaRelief object.
         """
+        from .InertiaRelief import InertiaRelief
         self.loads[name] = load = InertiaRelief(
             name,
             createStepName,
@@ -1205,6 +1229,7 @@ class LoadModel(ModelBase):
         -------
             An InwardVolAccel object.
         """
+        from .InwardVolAccel import InwardVolAccel
         self.loads[name] = load = InwardVolAccel(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -1269,6 +1294,7 @@ class LoadModel(ModelBase):
         -------
             A LineLoad object.
         """
+        from .LineLoad import LineLoad
         self.loads[name] = load = LineLoad(
             name,
             createStepName,
@@ -1348,6 +1374,7 @@ class LoadModel(ModelBase):
         -------
             A Moment object.
         """
+        from .Moment import Moment
         self.loads[name] = load = Moment(
             name,
             createStepName,
@@ -1417,6 +1444,7 @@ class LoadModel(ModelBase):
         -------
             A PEGLoad object.
         """
+        from .PEGLoad import PEGLoad
         self.loads[name] = load = PEGLoad(
             name,
             createStepName,
@@ -1492,6 +1520,7 @@ class LoadModel(ModelBase):
         -------
             A PipePressure object.
         """
+        from .PipePressure import PipePressure
         self.loads[name] = load = PipePressure(
             name,
             createStepName,
@@ -1567,6 +1596,7 @@ class LoadModel(ModelBase):
         -------
             A Pressure object.
         """
+        from .Pressure import Pressure
         self.loads[name] = load = Pressure(
             name,
             createStepName,
@@ -1644,6 +1674,7 @@ class LoadModel(ModelBase):
         -------
             A RotationalBodyForce object.
         """
+        from .RotationalBodyForce import RotationalBodyForce
         self.loads[name] = load = RotationalBodyForce(
             name,
             createStepName,
@@ -1749,6 +1780,7 @@ class LoadModel(ModelBase):
         -------
             A ShellEdgeLoad object.
         """
+        from .ShellEdgeLoad import ShellEdgeLoad
         self.loads[name] = load = ShellEdgeLoad(
             name,
             createStepName,
@@ -1823,6 +1855,7 @@ class LoadModel(ModelBase):
         -------
             A SubmodelSB object.
         """
+        from .SubmodelSB import SubmodelSB
         self.loads[name] = load = SubmodelSB(
             name,
             createStepName,
@@ -1875,6 +1908,7 @@ class LoadModel(ModelBase):
         -------
             A SubstructureLoad object.
         """
+        from .SubstructureLoad import SubstructureLoad
         self.loads[name] = load = SubstructureLoad(
             name, createStepName, region, loadCaseNames, magnitude, amplitude
         )
@@ -1927,6 +1961,7 @@ class LoadModel(ModelBase):
         -------
             A SurfaceCharge object.
         """
+        from .SurfaceCharge import SurfaceCharge
         self.loads[name] = load = SurfaceCharge(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -1980,6 +2015,7 @@ class LoadModel(ModelBase):
         -------
             A SurfaceConcentrationFlux object.
         """
+        from .SurfaceConcentrationFlux import SurfaceConcentrationFlux
         self.loads[name] = load = SurfaceConcentrationFlux(
             name, createStepName, region, magnitude, field, distributionType, amplitude
         )
@@ -2032,6 +2068,7 @@ class LoadModel(ModelBase):
         -------
             A SurfaceCurrent object.
         """
+        from .SurfaceCurrent import SurfaceCurrent
         self.loads[name] = load = SurfaceCurrent(
             name, createStepName, region, magnitude, distributionType, field, amplitude
         )
@@ -2085,6 +2122,7 @@ class LoadModel(ModelBase):
         -------
             A SurfaceCurrentDensity object.
         """
+        from .SurfaceCurrentDensity import SurfaceCurrentDensity
         self.loads[name] = load = SurfaceCurrentDensity(
             name,
             createStepName,
@@ -2144,6 +2182,7 @@ class LoadModel(ModelBase):
         -------
             A SurfaceHeatFlux object.
         """
+        from .SurfaceHeatFlux import SurfaceHeatFlux
         self.loads[name] = load = SurfaceHeatFlux(
             name, createStepName, region, magnitude, field, distributionType, amplitude
         )
@@ -2196,6 +2235,7 @@ class LoadModel(ModelBase):
         -------
             A SurfacePoreFluid object.
         """
+        from .SurfacePoreFluid import SurfacePoreFluid
         self.loads[name] = load = SurfacePoreFluid(
             name, createStepName, region, magnitude, field, distributionType, amplitude
         )
@@ -2289,6 +2329,7 @@ class LoadModel(ModelBase):
         -------
             A SurfaceTraction object.
         """
+        from .SurfaceTraction import SurfaceTraction
         self.loads[name] = load = SurfaceTraction(
             name,
             createStepName,
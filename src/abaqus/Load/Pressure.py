@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .Load import Load
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -47,7 +48,30 @@ class Pressure(Load):
     field: str = ""
 
     # A Region object specifying the region to which the load is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
+
+    # A String specifying the name of the step in which the pressure is created.
+    createStepName: str = ""
+
+    # A Float or a Complex specifying the pressure magnitude.
+    magnitude: float = 0.0
+
+    # A Float specifying the height of the zero pressure level when
+    # *distributionType*=HYDROSTATIC.
+    hZero: float = 0.0
+
+    # A Float specifying the height of the reference pressure level when
+    # *distributionType*=HYDROSTATIC.
+    hReference: float = 0.0
+
+    # A Region specifying the reference point from which the relative velocity is determined
+    # when *distributionType*=STAGNATION or VISCOUS.
+    refPoint: str = ""
+
+    # A String or the SymbolicConstant UNSET specifying the name of the amplitude
+    # reference. UNSET should be used if the load has no amplitude reference. The
+    # default value is UNSET.
+    amplitude: str = UNSET
 
     def __init__(
         self,
@@ -110,7 +134,16 @@ class Pressure(Load):
             A Pressure object.
         """
         super().__init__()
-        pass
+        self.name = name
+        self.createStepName = createStepName
+        self.region = region
+        self.magnitude = magnitude
+        self.hZero = hZero
+        self.hReference = hReference
+        self.field = field
+        self.refPoint = refPoint
+        self.distributionType = distributionType
+        self.amplitude = amplitude
 
     def setValues(
         self,
@@ -29,6 +29,29 @@ class Density:
 
     """
 
+    # A sequence of sequences of Floats specifying the mass density, and the temperature
+    # and the field variables the density depends on.
+    table: tuple = ()
+
+    # A Boolean specifying whether the data depend on temperature. The default value is
+    # OFF.
+    temperatureDependency: Boolean = OFF
+
+    # An Int specifying the number of field variable dependencies. The default value is
+    # 0.
+    dependencies: int = 0
+
+    # A SymbolicConstant specifying how the density is distributed spatially. Possible
+    # values are UNIFORM, ANALYTICAL_FIELD, and DISCRETE_FIELD. The default value is
+    # UNIFORM.
+    distributionType: SymbolicConstant = UNIFORM
+
+    # A String specifying the name of the AnalyticalField or DiscreteField object
+    # associated with this material option. The *fieldName* argument applies only when
+    # *distributionType*=ANALYTICAL_FIELD or *distributionType*=DISCRETE_FIELD. The
+    # default value is an empty string.
+    fieldName: str = ""
+
     def __init__(
         self,
         table: tuple,
@@ -73,7 +96,11 @@ class Density:
         ------
         RangeError
         """
-        pass
+        self.table = table
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.distributionType = distributionType
+        self.fieldName = fieldName
 
     def setValues(self):
         """This method modifies the Density object.
@@ -4,6 +4,7 @@ from ....TestData.PlanarTestData import PlanarTestData
 from ....TestData.SimpleShearTestData import SimpleShearTestData
 from ....TestData.UniaxialTestData import UniaxialTestData
 from ....TestData.VolumetricTestData import VolumetricTestData
+from .....LazyDefault.LazyDefault import lazyDefault
 
 
 class Hyperfoam:
@@ -35,19 +36,19 @@ class Hyperfoam:
     """
 
     # A BiaxialTestData object.
-    biaxialTestData: BiaxialTestData = BiaxialTestData(((),))
+    biaxialTestData: BiaxialTestData = lazyDefault(BiaxialTestData, ((),))
 
     # A VolumetricTestData object.
-    volumetricTestData: VolumetricTestData = VolumetricTestData(((),))
+    volumetricTestData: VolumetricTestData = lazyDefault(VolumetricTestData, ((),))
 
     # A PlanarTestData object.
-    planarTestData: PlanarTestData = PlanarTestData(((),))
+    planarTestData: PlanarTestData = lazyDefault(PlanarTestData, ((),))
 
     # A SimpleShearTestData object.
-    simpleShearTestData: SimpleShearTestData = SimpleShearTestData(((),))
+    simpleShearTestData: SimpleShearTestData = lazyDefault(SimpleShearTestData, ((),))
 
     # A UniaxialTestData object.
-    uniaxialTestData: UniaxialTestData = UniaxialTestData(((),))
+    uniaxialTestData: UniaxialTestData = lazyDefault(UniaxialTestData, ((),))
 
     def __init__(
         self,
@@ -6,6 +6,7 @@ from ...TestData.BiaxialTestData import BiaxialTestData
 from ...TestData.PlanarTestData import PlanarTestData
 from ...TestData.UniaxialTestData import UniaxialTestData
 from ...TestData.VolumetricTestData import VolumetricTestData
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class Hyperelastic:
@@ -79,19 +80,19 @@ class Hyperelastic:
     """
 
     # A BiaxialTestData object.
-    biaxialTestData: BiaxialTestData = BiaxialTestData(((),))
+    biaxialTestData: BiaxialTestData = lazyDefault(BiaxialTestData, ((),))
 
     # A PlanarTestData object.
-    planarTestData: PlanarTestData = PlanarTestData(((),))
+    planarTestData: PlanarTestData = lazyDefault(PlanarTestData, ((),))
 
     # A UniaxialTestData object.
-    uniaxialTestData: UniaxialTestData = UniaxialTestData(((),))
+    uniaxialTestData: UniaxialTestData = lazyDefault(UniaxialTestData, ((),))
 
     # A VolumetricTestData object.
-    volumetricTestData: VolumetricTestData = VolumetricTestData(((),))
+    volumetricTestData: VolumetricTestData = lazyDefault(VolumetricTestData, ((),))
 
     # A Hysteresis object.
-    hysteresis: Hysteresis = Hysteresis(((),))
+    hysteresis: Hysteresis = lazyDefault(Hysteresis, ((),))
 
     def __init__(
         self,
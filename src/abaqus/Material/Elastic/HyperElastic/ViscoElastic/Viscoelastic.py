@@ -3,6 +3,7 @@ from .CombinedTestData import CombinedTestData
 from ....Others.Mechanical.Viscosity.Trs import Trs
 from ....TestData.ShearTestData import ShearTestData
 from ....TestData.VolumetricTestData import VolumetricTestData
+from .....LazyDefault.LazyDefault import lazyDefault
 
 
 class Viscoelastic:
@@ -68,16 +69,16 @@ class Viscoelastic:
     """
 
     # A CombinedTestData object.
-    combinedTestData: CombinedTestData = CombinedTestData(((),))
+    combinedTestData: CombinedTestData = lazyDefault(CombinedTestData, ((),))
 
     # A ShearTestData object.
-    shearTestData: ShearTestData = ShearTestData(((),))
+    shearTestData: ShearTestData = lazyDefault(ShearTestData, ((),))
 
     # A Trs object.
-    trs: Trs = Trs()
+    trs: Trs = lazyDefault(Trs)
 
     # A VolumetricTestData object.
-    volumetricTestData: VolumetricTestData = VolumetricTestData(((),))
+    volumetricTestData: VolumetricTestData = lazyDefault(VolumetricTestData, ((),))
 
     def __init__(
         self,
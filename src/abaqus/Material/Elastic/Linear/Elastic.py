@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .FailStrain import FailStrain
 from .FailStress import FailStress
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class Elastic:
@@ -114,10 +115,40 @@ class Elastic:
     """
 
     # A FailStress object.
-    failStress: FailStress = FailStress(((),))
+    failStress: FailStress = lazyDefault(FailStress, ((),))
 
     # A FailStrain object.
-    failStrain: FailStrain = FailStrain(((),))
+    failStrain: FailStrain = lazyDefault(FailStrain, ((),))
+
+    # A sequence of sequences of Floats specifying the elastic data of the type of
+    # elasticity.
+    table: tuple = ()
+
+    # A SymbolicConstant specifying the type of elasticity data provided. Possible
+    # values are ISOTROPIC, ORTHOTROPIC, ANISOTROPIC, ENGINEERING_CONSTANTS, LAMINA,
+    # TRACTION, COUPLED_TRACTION, SHORT_FIBER, SHEAR, and BILAMINA. The default value is
+    # ISOTROPIC.
+    type: SymbolicConstant = ISOTROPIC
+
+    # A Boolean specifying whether compressive stress is allowed. The default value is
+    # OFF.
+    noCompression: Boolean = OFF
+
+    # A Boolean specifying whether tensile stress is allowed. The default value is OFF.
+    noTension: Boolean = OFF
+
+    # A Boolean specifying whether the data depend on temperature. The default value is
+    # OFF.
+    temperatureDependency: Boolean = OFF
+
+    # An Int specifying the number of field variable dependencies. The default value is
+    # 0.
+    dependencies: int = 0
+
+    # A SymbolicConstant specifying the time-dependence of the elastic material
+    # constants. Possible values are INSTANTANEOUS and LONG_TERM. The default value is
+    # LONG_TERM.
+    moduli: SymbolicConstant = LONG_TERM
 
     def __init__(
         self,
@@ -178,7 +209,13 @@ class Elastic:
         ------
         RangeError
         """
-        pass
+        self.table = table
+        self.type = type
+        self.noCompression = noCompression
+        self.noTension = noTension
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.moduli = moduli
 
     def setValues(self):
         """This method modifies the Elastic object.
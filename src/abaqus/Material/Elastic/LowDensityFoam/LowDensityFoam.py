@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from ...TestData.UniaxialTestData import UniaxialTestData
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class LowDensityFoam:
@@ -23,10 +24,10 @@ class LowDensityFoam:
     """
 
     # A UniaxialTestData object.
-    uniaxialTensionTestData: UniaxialTestData = UniaxialTestData(((),))
+    uniaxialTensionTestData: UniaxialTestData = lazyDefault(UniaxialTestData, ((),))
 
     # A UniaxialTestData object.
-    uniaxialCompressionTestData: UniaxialTestData = UniaxialTestData(((),))
+    uniaxialCompressionTestData: UniaxialTestData = lazyDefault(UniaxialTestData, ((),))
 
     def __init__(
         self,
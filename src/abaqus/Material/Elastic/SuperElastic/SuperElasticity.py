@@ -2,6 +2,7 @@ from ...Plastic.SuperElastic.SuperElasticHardening import SuperElasticHardening
 from ...Plastic.SuperElastic.SuperElasticHardeningModifications import (
     SuperElasticHardeningModifications,
 )
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class SuperElasticity:
@@ -39,12 +40,14 @@ class SuperElasticity:
 
     # A [SuperElasticHardening
     # object](https://help.3ds.com/2022/english/DSSIMULIA_Established/SIMACAEKERRefMap/simaker-c-superelastichardeningpyc.htm?ContextScope=all#simaker-c-superelastichardeningpyc).
-    superElasticHardening: SuperElasticHardening = SuperElasticHardening(((),))
+    superElasticHardening: SuperElasticHardening = lazyDefault(
+        SuperElasticHardening, ((),)
+    )
 
     # A [SuperElasticHardeningModifications
     # object](https://help.3ds.com/2022/english/DSSIMULIA_Established/SIMACAEKERRefMap/simaker-c-superelastichardeningmodificationpyc.htm?ContextScope=all#simaker-c-superelastichardeningmodificationpyc).
     superElasticHardeningModifications: SuperElasticHardeningModifications = (
-        SuperElasticHardeningModifications(((),))
+        lazyDefault(SuperElasticHardeningModifications, ((),))
     )
 
     def __init__(self, table: tuple, nonassociated: float = None):
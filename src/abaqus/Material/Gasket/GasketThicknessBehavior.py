@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .ContactArea import ContactArea
+from ...LazyDefault.LazyDefault import lazyDefault
 
 
 class GasketThicknessBehavior:
@@ -73,7 +74,7 @@ class GasketThicknessBehavior:
     """
 
     # A ContactArea object.
-    contactArea: ContactArea = ContactArea(((),))
+    contactArea: ContactArea = lazyDefault(ContactArea, ((),))
 
     def __init__(
         self,
@@ -1,62 +1,66 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .Density.Density import Density
-from .Elastic.HyperElastic.HyperFoam.Hyperfoam import Hyperfoam
-from .Elastic.HyperElastic.Hyperelastic import Hyperelastic
-from .Elastic.HyperElastic.ViscoElastic.Viscoelastic import Viscoelastic
-from .Elastic.HypoElastic.Hypoelastic import Hypoelastic
-from .Elastic.Linear.Elastic import Elastic
-from .Elastic.LowDensityFoam.LowDensityFoam import LowDensityFoam
-from .Elastic.Porous.PorousElastic import PorousElastic
-from .Eos.Eos import Eos
-from .Gap.GapFlow import GapFlow
-from .Gasket.GasketMembraneElastic import GasketMembraneElastic
-from .Gasket.GasketThicknessBehavior import GasketThicknessBehavior
-from .Gasket.GasketTransverseShearElastic import GasketTransverseShearElastic
 from .MaterialBase import MaterialBase
-from .Others.Acoustic.AcousticMedium import AcousticMedium
-from .Others.Electromagnetic.Dielectric import Dielectric
-from .Others.Electromagnetic.ElectricalConductivity import ElectricalConductivity
-from .Others.Electromagnetic.MagneticPermeability import MagneticPermeability
-from .Others.Electromagnetic.Piezoelectric import Piezoelectric
-from .Others.HeatTransfer.Conductivity import Conductivity
-from .Others.HeatTransfer.InelasticHeatFraction import InelasticHeatFraction
-from .Others.HeatTransfer.JouleHeatFraction import JouleHeatFraction
-from .Others.HeatTransfer.LatentHeat import LatentHeat
-from .Others.HeatTransfer.SpecificHeat import SpecificHeat
-from .Others.MassDiffusion.Diffusivity import Diffusivity
-from .Others.MassDiffusion.Solubility import Solubility
-from .Others.Mechanical.Damping import Damping
-from .Others.Mechanical.Expansion import Expansion
-from .Others.Mechanical.PoreFluidExpansion import PoreFluidExpansion
-from .Others.Mechanical.Viscosity.Viscosity import Viscosity
-from .Others.PoreFluidFlow.FluidLeakoff import FluidLeakoff
-from .Others.PoreFluidFlow.Gel import Gel
-from .Others.PoreFluidFlow.MoistureSwelling.MoistureSwelling import MoistureSwelling
-from .Others.PoreFluidFlow.Permeability.Permeability import Permeability
-from .Others.PoreFluidFlow.PorousBulkModuli import PorousBulkModuli
-from .Others.PoreFluidFlow.Sorption import Sorption
-from .Others.User.Depvar import Depvar
-from .Others.User.UserMaterial import UserMaterial
-from .Others.User.UserOutputVariables import UserOutputVariables
-from .Plastic.Concrete.BrittleCracking import BrittleCracking
-from .Plastic.Concrete.Concrete import Concrete
-from .Plastic.Concrete.ConcreteDamagedPlasticity import ConcreteDamagedPlasticity
-from .Plastic.Creep.Creep import Creep
-from .Plastic.CriticalStateClay.ClayPlasticity import ClayPlasticity
-from .Plastic.CrushableFoam.CrushableFoam import CrushableFoam
-from .Plastic.CrushStress.CrushStress import CrushStress
-from .Plastic.DruckerPrager.Extended.DruckerPrager import DruckerPrager
-from .Plastic.DruckerPrager.ModifiedCap.CapPlasticity import CapPlasticity
-from .Plastic.Metal.CastIron.CastIronPlasticity import CastIronPlasticity
-from .Plastic.Metal.Deformation.DeformationPlasticity import DeformationPlasticity
-from .Plastic.Metal.Porous.PorousMetalPlasticity import PorousMetalPlasticity
-from .Plastic.Metal.TwoLayerViscoPlasticity.Viscous import Viscous
-from .Plastic.MohrCoulomb.MohrCoulombPlasticity import MohrCoulombPlasticity
-from .Plastic.Plastic import Plastic
-from .Plastic.Swelling.Swelling import Swelling
-from .Regularization import Regularization
+
+if typing.TYPE_CHECKING:
+    from .Density.Density import Density
+    from .Elastic.HyperElastic.HyperFoam.Hyperfoam import Hyperfoam
+    from .Elastic.HyperElastic.Hyperelastic import Hyperelastic
+    from .Elastic.HyperElastic.ViscoElastic.Viscoelastic import Viscoelastic
+    from .Elastic.HypoElastic.Hypoelastic import Hypoelastic
+    from .Elastic.Linear.Elastic import Elastic
+    from .Elastic.LowDensityFoam.LowDensityFoam import LowDensityFoam
+    from .Elastic.Porous.PorousElastic import PorousElastic
+    from .Eos.Eos import Eos
+    from .Gap.GapFlow import GapFlow
+    from .Gasket.GasketMembraneElastic import GasketMembraneElastic
+    from .Gasket.GasketThicknessBehavior import GasketThicknessBehavior
+    from .Gasket.GasketTransverseShearElastic import GasketTransverseShearElastic
+    from .Others.Acoustic.AcousticMedium import AcousticMedium
+    from .Others.Electromagnetic.Dielectric import Dielectric
+    from .Others.Electromagnetic.ElectricalConductivity import ElectricalConductivity
+    from .Others.Electromagnetic.MagneticPermeability import MagneticPermeability
+    from .Others.Electromagnetic.Piezoelectric import Piezoelectric
+    from .Others.HeatTransfer.Conductivity import Conductivity
+    from .Others.HeatTransfer.InelasticHeatFraction import InelasticHeatFraction
+    from .Others.HeatTransfer.JouleHeatFraction import JouleHeatFraction
+    from .Others.HeatTransfer.LatentHeat import LatentHeat
+    from .Others.HeatTransfer.SpecificHeat import SpecificHeat
+    from .Others.MassDiffusion.Diffusivity import Diffusivity
+    from .Others.MassDiffusion.Solubility import Solubility
+    from .Others.Mechanical.Damping import Damping
+    from .Others.Mechanical.Expansion import Expansion
+    from .Others.Mechanical.PoreFluidExpansion import PoreFluidExpansion
+    from .Others.Mechanical.Viscosity.Viscosity import Viscosity
+    from .Others.PoreFluidFlow.FluidLeakoff import FluidLeakoff
+    from .Others.PoreFluidFlow.Gel import Gel
+    from .Others.PoreFluidFlow.MoistureSwelling.MoistureSwelling import MoistureSwelling
+    from .Others.PoreFluidFlow.Permeability.Permeability import Permeability
+    from .Others.PoreFluidFlow.PorousBulkModuli import PorousBulkModuli
+    from .Others.PoreFluidFlow.Sorption import Sorption
+    from .Others.User.Depvar import Depvar
+    from .Others.User.UserMaterial import UserMaterial
+    from .Others.User.UserOutputVariables import UserOutputVariables
+    from .Plastic.Concrete.BrittleCracking import BrittleCracking
+    from .Plastic.Concrete.Concrete import Concrete
+    from .Plastic.Concrete.ConcreteDamagedPlasticity import ConcreteDamagedPlasticity
+    from .Plastic.Creep.Creep import Creep
+    from .Plastic.CriticalStateClay.ClayPlasticity import ClayPlasticity
+    from .Plastic.CrushableFoam.CrushableFoam import CrushableFoam
+    from .Plastic.CrushStress.CrushStress import CrushStress
+    from .Plastic.DruckerPrager.Extended.DruckerPrager import DruckerPrager
+    from .Plastic.DruckerPrager.ModifiedCap.CapPlasticity import CapPlasticity
+    from .Plastic.Metal.CastIron.CastIronPlasticity import CastIronPlasticity
+    from .Plastic.Metal.Deformation.DeformationPlasticity import DeformationPlasticity
+    from .Plastic.Metal.Porous.PorousMetalPlasticity import PorousMetalPlasticity
+    from .Plastic.Metal.TwoLayerViscoPlasticity.Viscous import Viscous
+    from .Plastic.MohrCoulomb.MohrCoulombPlasticity import MohrCoulombPlasticity
+    from .Plastic.Plastic import Plastic
+    from .Plastic.Swelling.Swelling import Swelling
+    from .Regularization import Regularization
 
 
 class Material(MaterialBase):
@@ -296,6 +300,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.Acoustic.AcousticMedium import AcousticMedium
         self.acousticMedium = AcousticMedium(
             acousticVolumetricDrag,
             temperatureDependencyB,
@@ -341,6 +346,7 @@ class Material(MaterialBase):
         -------
             A BrittleCracking object.
         """
+        from .Plastic.Concrete.BrittleCracking import BrittleCracking
         self.brittleCracking = BrittleCracking(
             table, temperatureDependency, dependencies, type
         )
@@ -377,6 +383,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.DruckerPrager.ModifiedCap.CapPlasticity import CapPlasticity
         self.capPlasticity = CapPlasticity(table, temperatureDependency, dependencies)
         return self.capPlasticity
 
@@ -411,6 +418,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.Metal.CastIron.CastIronPlasticity import CastIronPlasticity
         self.castIronPlasticity = CastIronPlasticity(
             table, temperatureDependency, dependencies
         )
@@ -459,6 +467,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.CriticalStateClay.ClayPlasticity import ClayPlasticity
         self.clayPlasticity = ClayPlasticity(
             table, intercept, hardening, temperatureDependency, dependencies
         )
@@ -495,6 +504,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.Concrete.Concrete import Concrete
         self.concrete = Concrete(table, temperatureDependency, dependencies)
         return self.concrete
 
@@ -529,6 +539,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.Concrete.ConcreteDamagedPlasticity import ConcreteDamagedPlasticity
         self.concreteDamagedPlasticity = ConcreteDamagedPlasticity(
             table, temperatureDependency, dependencies
         )
@@ -572,6 +583,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.HeatTransfer.Conductivity import Conductivity
         self.conductivity = Conductivity(
             table, type, temperatureDependency, dependencies
         )
@@ -620,6 +632,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.Creep.Creep import Creep
         self.creep = Creep(table, law, temperatureDependency, dependencies, time)
         return self.creep
 
@@ -661,6 +674,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.CrushableFoam.CrushableFoam import CrushableFoam
         self.crushableFoam = CrushableFoam(
             table, hardening, temperatureDependency, dependencies
         )
@@ -696,6 +710,7 @@ class Material(MaterialBase):
         -------
             A CrushStress object.
         """
+        from .Plastic.CrushStress.CrushStress import CrushStress
         self.crushStress = CrushStress(
             crushStressTable, temperatureDependency, dependencies
         )
@@ -743,6 +758,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.Mechanical.Damping import Damping
         self.damping = Damping(alpha, beta, composite, structural)
         return self.damping
 
@@ -775,6 +791,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.Metal.Deformation.DeformationPlasticity import DeformationPlasticity
         self.deformationPlasticity = DeformationPlasticity(table, temperatureDependency)
         return self.deformationPlasticity
 
@@ -829,6 +846,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Density.Density import Density
         self.density = Density(
             table, temperatureDependency, dependencies, distributionType, fieldName
         )
@@ -863,6 +881,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.User.Depvar import Depvar
         self.depvar = Depvar(deleteVar, n)
         return self.depvar
 
@@ -903,6 +922,7 @@ class Material(MaterialBase):
         -------
             A Dielectric object.
         """
+        from .Others.Electromagnetic.Dielectric import Dielectric
         self.dielectric = Dielectric(
             table, type, frequencyDependency, temperatureDependency, dependencies
         )
@@ -950,6 +970,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.MassDiffusion.Diffusivity import Diffusivity
         self.diffusivity = Diffusivity(
             table, type, law, temperatureDependency, dependencies
         )
@@ -1006,6 +1027,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.DruckerPrager.Extended.DruckerPrager import DruckerPrager
         self.druckerPrager = DruckerPrager(
             table,
             shearCriterion,
@@ -1164,6 +1186,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Elastic.Linear.Elastic import Elastic
         self.elastic = Elastic(
             table,
             type,
@@ -1216,6 +1239,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.Electromagnetic.ElectricalConductivity import ElectricalConductivity
         self.electricalConductivity = ElectricalConductivity(
             table, type, frequencyDependency, temperatureDependency, dependencies
         )
@@ -1308,6 +1332,7 @@ class Material(MaterialBase):
         Raises
         ------
         """
+        from .Eos.Eos import Eos
         self.eos = Eos(
             type,
             temperatureDependency,
@@ -1368,6 +1393,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.Mechanical.Expansion import Expansion
         self.expansion = Expansion(
             type, userSubroutine, zero, temperatureDependency, dependencies, table
         )
@@ -1408,6 +1434,7 @@ class Material(MaterialBase):
         -------
             A FluidLeakoff object.
         """
+        from .Others.PoreFluidFlow.FluidLeakoff import FluidLeakoff
         self.fluidLeakoff = FluidLeakoff(
             temperatureDependency, dependencies, type, table
         )
@@ -1452,6 +1479,7 @@ class Material(MaterialBase):
         -------
             A GapFlow object.
         """
+        from .Gap.GapFlow import GapFlow
         self.gapFlow = GapFlow(table, kmax, temperatureDependency, dependencies, type)
         return self.gapFlow
 
@@ -1486,6 +1514,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Gasket.GasketMembraneElastic import GasketMembraneElastic
         self.gasketMembraneElastic = GasketMembraneElastic(
             table, temperatureDependency, dependencies
         )
@@ -1565,6 +1594,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Gasket.GasketThicknessBehavior import GasketThicknessBehavior
         self.gasketThicknessBehavior = GasketThicknessBehavior(
             table,
             temperatureDependency,
@@ -1618,6 +1648,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Gasket.GasketTransverseShearElastic import GasketTransverseShearElastic
         self.gasketTransverseShearElastic = GasketTransverseShearElastic(
             table, variableUnits, temperatureDependency, dependencies
         )
@@ -1644,6 +1675,7 @@ class Material(MaterialBase):
         -------
             A Gel object.
         """
+        from .Others.PoreFluidFlow.Gel import Gel
         self.gel = Gel(table)
         return self.gel
 
@@ -1764,6 +1796,7 @@ class Material(MaterialBase):
         InvalidNameError
         RangeError
         """
+        from .Elastic.HyperElastic.Hyperelastic import Hyperelastic
         self.hyperelastic = Hyperelastic(
             table,
             type,
@@ -1833,6 +1866,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Elastic.HyperElastic.HyperFoam.Hyperfoam import Hyperfoam
         self.hyperfoam = Hyperfoam(
             testData, poisson, n, temperatureDependency, moduli, table
         )
@@ -1862,6 +1896,7 @@ class Material(MaterialBase):
         -------
             A Hypoelastic object.
         """
+        from .Elastic.HypoElastic.Hypoelastic import Hypoelastic
         self.hypoelastic = Hypoelastic(table, user)
         return self.hypoelastic
 
@@ -1892,6 +1927,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.HeatTransfer.InelasticHeatFraction import InelasticHeatFraction
         self.inelasticHeatFraction = InelasticHeatFraction(fraction)
         return self.inelasticHeatFraction
 
@@ -1921,6 +1957,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.HeatTransfer.JouleHeatFraction import JouleHeatFraction
         self.jouleHeatFraction = JouleHeatFraction(fraction)
         return self.jouleHeatFraction
 
@@ -1949,6 +1986,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.HeatTransfer.LatentHeat import LatentHeat
         self.latentHeat = LatentHeat(table)
         return self.latentHeat
 
@@ -2003,6 +2041,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Elastic.LowDensityFoam.LowDensityFoam import LowDensityFoam
         self.lowDensityFoam = LowDensityFoam(
             elementRemoval,
             maxAllowablePrincipalStress,
@@ -2071,6 +2110,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.Electromagnetic.MagneticPermeability import MagneticPermeability
         self.magneticPermeability = MagneticPermeability(
             table,
             table2,
@@ -2130,6 +2170,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.MohrCoulomb.MohrCoulombPlasticity import MohrCoulombPlasticity
         self.mohrCoulombPlasticity = MohrCoulombPlasticity(
             table,
             deviatoricEccentricity,
@@ -2161,6 +2202,7 @@ class Material(MaterialBase):
         -------
             A MoistureSwelling object.
         """
+        from .Others.PoreFluidFlow.MoistureSwelling.MoistureSwelling import MoistureSwelling
         self.moistureSwelling = MoistureSwelling(table)
         return self.moistureSwelling
 
@@ -2208,6 +2250,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.PoreFluidFlow.Permeability.Permeability import Permeability
         self.permeability = Permeability(
             specificWeight,
             inertialDragCoefficient,
@@ -2252,6 +2295,7 @@ class Material(MaterialBase):
         -------
             A Piezoelectric object.
         """
+        from .Others.Electromagnetic.Piezoelectric import Piezoelectric
         self.piezoelectric = Piezoelectric(
             table, type, temperatureDependency, dependencies
         )
@@ -2311,6 +2355,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.Plastic import Plastic
         self.plastic = Plastic(
             table,
             hardening,
@@ -2360,6 +2405,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.Mechanical.PoreFluidExpansion import PoreFluidExpansion
         self.poreFluidExpansion = PoreFluidExpansion(
             table, zero, temperatureDependency, dependencies
         )
@@ -2390,6 +2436,7 @@ class Material(MaterialBase):
         -------
             A PorousBulkModuli object.
         """
+        from .Others.PoreFluidFlow.PorousBulkModuli import PorousBulkModuli
         self.porousBulkModuli = PorousBulkModuli(table, temperatureDependency)
         return self.porousBulkModuli
 
@@ -2431,6 +2478,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Elastic.Porous.PorousElastic import PorousElastic
         self.porousElastic = PorousElastic(
             table, shear, temperatureDependency, dependencies
         )
@@ -2474,6 +2522,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.Metal.Porous.PorousMetalPlasticity import PorousMetalPlasticity
         self.porousMetalPlasticity = PorousMetalPlasticity(
             table, relativeDensity, temperatureDependency, dependencies
         )
@@ -2511,6 +2560,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Regularization import Regularization
         self.regularization = Regularization(rtol, strainRateRegularization)
         return self.regularization
 
@@ -2545,6 +2595,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.MassDiffusion.Solubility import Solubility
         self.solubility = Solubility(table, temperatureDependency, dependencies)
         return self.solubility
 
@@ -2596,6 +2647,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.PoreFluidFlow.Sorption import Sorption
         self.sorption = Sorption(
             absorptionTable,
             lawAbsorption,
@@ -2644,6 +2696,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.HeatTransfer.SpecificHeat import SpecificHeat
         self.specificHeat = SpecificHeat(
             table, law, temperatureDependency, dependencies
         )
@@ -2688,6 +2741,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Plastic.Swelling.Swelling import Swelling
         self.swelling = Swelling(table, law, temperatureDependency, dependencies)
         return self.swelling
 
@@ -2746,6 +2800,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.User.UserMaterial import UserMaterial
         self.userMaterial = UserMaterial(
             type,
             unsymm,
@@ -2782,6 +2837,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.User.UserOutputVariables import UserOutputVariables
         self.userOutputVariables = UserOutputVariables(n)
         return self.userOutputVariables
 
@@ -2855,6 +2911,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Elastic.HyperElastic.ViscoElastic.Viscoelastic import Viscoelastic
         self.viscoelastic = Viscoelastic(
             domain, table, frequency, type, preload, time, errtol, nmax, volumetricTable
         )
@@ -2897,6 +2954,7 @@ class Material(MaterialBase):
         ------
         RangeError
         """
+        from .Others.Mechanical.Viscosity.Viscosity import Viscosity
         self.viscosity = Viscosity(table, type, temperatureDependency, dependencies)
         return self.viscosity
 
@@ -2939,5 +2997,6 @@ class Material(MaterialBase):
         -------
             A Viscous object.
         """
+        from .Plastic.Metal.TwoLayerViscoPlasticity.Viscous import Viscous
         self.viscous = Viscous(table, law, temperatureDependency, dependencies, time)
         return self.viscous
@@ -58,6 +58,7 @@ from .Plastic.Swelling.Swelling import Swelling
 from .ProgressiveDamageFailure.DamageInitiation import DamageInitiation
 from .Regularization import Regularization
 from .TestData.MullinsEffect import MullinsEffect
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class MaterialBase:
@@ -233,226 +234,238 @@ class MaterialBase:
     """
 
     # An AcousticMedium object.
-    acousticMedium: AcousticMedium = AcousticMedium()
+    acousticMedium: AcousticMedium = lazyDefault(AcousticMedium)
 
     # A BrittleCracking object.
-    brittleCracking: BrittleCracking = BrittleCracking(((),))
+    brittleCracking: BrittleCracking = lazyDefault(BrittleCracking, ((),))
 
     # A CapPlasticity object.
-    capPlasticity: CapPlasticity = CapPlasticity(((),))
+    capPlasticity: CapPlasticity = lazyDefault(CapPlasticity, ((),))
 
     # A CastIronPlasticity object.
-    castIronPlasticity: CastIronPlasticity = CastIronPlasticity(((),))
+    castIronPlasticity: CastIronPlasticity = lazyDefault(CastIronPlasticity, ((),))
 
     # A ClayPlasticity object.
-    clayPlasticity: ClayPlasticity = ClayPlasticity(((),))
+    clayPlasticity: ClayPlasticity = lazyDefault(ClayPlasticity, ((),))
 
     # A Concrete object.
-    concrete: Concrete = Concrete(((),))
+    concrete: Concrete = lazyDefault(Concrete, ((),))
 
     # A ConcreteDamagedPlasticity object.
-    concreteDamagedPlasticity: ConcreteDamagedPlasticity = ConcreteDamagedPlasticity(
-        ((),)
+    concreteDamagedPlasticity: ConcreteDamagedPlasticity = lazyDefault(
+        ConcreteDamagedPlasticity, ((),)
     )
 
     # A Conductivity object.
-    conductivity: Conductivity = Conductivity(((),))
+    conductivity: Conductivity = lazyDefault(Conductivity, ((),))
 
     # A Creep object.
-    creep: Creep = Creep(((),))
+    creep: Creep = lazyDefault(Creep, ((),))
 
     # A CrushableFoam object.
-    crushableFoam: CrushableFoam = CrushableFoam(((),))
+    crushableFoam: CrushableFoam = lazyDefault(CrushableFoam, ((),))
 
     # A CrushStress object
-    crushStress: CrushStress = CrushStress(((),))
+    crushStress: CrushStress = lazyDefault(CrushStress, ((),))
 
     # A DamageInitiation object.
-    ductileDamageInitiation: DamageInitiation = DamageInitiation()
+    ductileDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    fldDamageInitiation: DamageInitiation = DamageInitiation()
+    fldDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    flsdDamageInitiation: DamageInitiation = DamageInitiation()
+    flsdDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    johnsonCookDamageInitiation: DamageInitiation = DamageInitiation()
+    johnsonCookDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    maxeDamageInitiation: DamageInitiation = DamageInitiation()
+    maxeDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    maxsDamageInitiation: DamageInitiation = DamageInitiation()
+    maxsDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    maxpeDamageInitiation: DamageInitiation = DamageInitiation()
+    maxpeDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    maxpsDamageInitiation: DamageInitiation = DamageInitiation()
+    maxpsDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    mkDamageInitiation: DamageInitiation = DamageInitiation()
+    mkDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    msfldDamageInitiation: DamageInitiation = DamageInitiation()
+    msfldDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    quadeDamageInitiation: DamageInitiation = DamageInitiation()
+    quadeDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    quadsDamageInitiation: DamageInitiation = DamageInitiation()
+    quadsDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    shearDamageInitiation: DamageInitiation = DamageInitiation()
+    shearDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A DamageInitiation object.
-    hashinDamageInitiation: DamageInitiation = DamageInitiation()
+    hashinDamageInitiation: DamageInitiation = lazyDefault(DamageInitiation)
 
     # A Damping object.
-    damping: Damping = Damping()
+    damping: Damping = lazyDefault(Damping)
 
     # A DeformationPlasticity object.
-    deformationPlasticity: DeformationPlasticity = DeformationPlasticity(((),))
+    deformationPlasticity: DeformationPlasticity = lazyDefault(
+        DeformationPlasticity, ((),)
+    )
 
     # A Density object.
-    density: Density = Density(((),))
+    density: Density = lazyDefault(Density, ((),))
 
     # A Depvar object.
-    depvar: Depvar = Depvar()
+    depvar: Depvar = lazyDefault(Depvar)
 
     # A Dielectric object.
-    dielectric: Dielectric = Dielectric(((),))
+    dielectric: Dielectric = lazyDefault(Dielectric, ((),))
 
     # A Diffusivity object.
-    diffusivity: Diffusivity = Diffusivity(((),))
+    diffusivity: Diffusivity = lazyDefault(Diffusivity, ((),))
 
     # A DruckerPrager object.
-    druckerPrager: DruckerPrager = DruckerPrager(((),))
+    druckerPrager: DruckerPrager = lazyDefault(DruckerPrager, ((),))
 
     # An Elastic object.
-    elastic: Elastic = Elastic(((),))
+    elastic: Elastic = lazyDefault(Elastic, ((),))
 
     # An ElectricalConductivity object.
-    electricalConductivity: ElectricalConductivity = ElectricalConductivity(((),))
+    electricalConductivity: ElectricalConductivity = lazyDefault(
+        ElectricalConductivity, ((),)
+    )
 
     # An Eos object.
-    eos: Eos = Eos()
+    eos: Eos = lazyDefault(Eos)
 
     # An Expansion object.
-    expansion: Expansion = Expansion()
+    expansion: Expansion = lazyDefault(Expansion)
 
     # A FluidLeakoff object.
-    fluidLeakoff: FluidLeakoff = FluidLeakoff()
+    fluidLeakoff: FluidLeakoff = lazyDefault(FluidLeakoff)
 
     # A GapFlow object.
-    gapFlow: GapFlow = GapFlow(((),))
+    gapFlow: GapFlow = lazyDefault(GapFlow, ((),))
 
     # A GasketThicknessBehavior object.
-    gasketThicknessBehavior: GasketThicknessBehavior = GasketThicknessBehavior(((),))
+    gasketThicknessBehavior: GasketThicknessBehavior = lazyDefault(
+        GasketThicknessBehavior, ((),)
+    )
 
     # A GasketTransverseShearElastic object.
-    gasketTransverseShearElastic: GasketTransverseShearElastic = (
-        GasketTransverseShearElastic(((),))
+    gasketTransverseShearElastic: GasketTransverseShearElastic = lazyDefault(
+        GasketTransverseShearElastic, ((),)
     )
 
     # A GasketMembraneElastic object.
-    gasketMembraneElastic: GasketMembraneElastic = GasketMembraneElastic(((),))
+    gasketMembraneElastic: GasketMembraneElastic = lazyDefault(
+        GasketMembraneElastic, ((),)
+    )
 
     # A Gel object.
-    gel: Gel = Gel(((),))
+    gel: Gel = lazyDefault(Gel, ((),))
 
     # A HeatGeneration object.
-    heatGeneration: HeatGeneration = HeatGeneration()
+    heatGeneration: HeatGeneration = lazyDefault(HeatGeneration)
 
     # A Hyperelastic object.
-    hyperelastic: Hyperelastic = Hyperelastic(((),))
+    hyperelastic: Hyperelastic = lazyDefault(Hyperelastic, ((),))
 
     # A Hyperfoam object.
-    hyperfoam: Hyperfoam = Hyperfoam()
+    hyperfoam: Hyperfoam = lazyDefault(Hyperfoam)
 
     # A Hypoelastic object.
-    hypoelastic: Hypoelastic = Hypoelastic(((),))
+    hypoelastic: Hypoelastic = lazyDefault(Hypoelastic, ((),))
 
     # An InelasticHeatFraction object.
-    inelasticHeatFraction: InelasticHeatFraction = InelasticHeatFraction()
+    inelasticHeatFraction: InelasticHeatFraction = lazyDefault(InelasticHeatFraction)
 
     # A JouleHeatFraction object.
-    jouleHeatFraction: JouleHeatFraction = JouleHeatFraction()
+    jouleHeatFraction: JouleHeatFraction = lazyDefault(JouleHeatFraction)
 
     # A LatentHeat object.
-    latentHeat: LatentHeat = LatentHeat(((),))
+    latentHeat: LatentHeat = lazyDefault(LatentHeat, ((),))
 
     # A LowDensityFoam object.
-    lowDensityFoam: LowDensityFoam = LowDensityFoam()
+    lowDensityFoam: LowDensityFoam = lazyDefault(LowDensityFoam)
 
     # A MagneticPermeability object.
-    magneticPermeability: MagneticPermeability = MagneticPermeability(
-        ((),), ((),), ((),)
+    magneticPermeability: MagneticPermeability = lazyDefault(
+        MagneticPermeability, ((),), ((),), ((),)
     )
 
     # A MohrCoulombPlasticity object.
-    mohrCoulombPlasticity: MohrCoulombPlasticity = MohrCoulombPlasticity(((),))
+    mohrCoulombPlasticity: MohrCoulombPlasticity = lazyDefault(
+        MohrCoulombPlasticity, ((),)
+    )
 
     # A MoistureSwelling object.
-    moistureSwelling: MoistureSwelling = MoistureSwelling(((),))
+    moistureSwelling: MoistureSwelling = lazyDefault(MoistureSwelling, ((),))
 
     # A MullinsEffect object.
-    mullinsEffect: MullinsEffect = MullinsEffect()
+    mullinsEffect: MullinsEffect = lazyDefault(MullinsEffect)
 
     # A Permeability object.
-    permeability: Permeability = Permeability(0, 0, ((),))
+    permeability: Permeability = lazyDefault(Permeability, 0, 0, ((),))
 
     # A Piezoelectric object.
-    piezoelectric: Piezoelectric = Piezoelectric(((),))
+    piezoelectric: Piezoelectric = lazyDefault(Piezoelectric, ((),))
 
     # A Plastic object.
-    plastic: Plastic = Plastic(((),))
+    plastic: Plastic = lazyDefault(Plastic, ((),))
 
     # A PoreFluidExpansion object.
-    poreFluidExpansion: PoreFluidExpansion = PoreFluidExpansion(((),))
+    poreFluidExpansion: PoreFluidExpansion = lazyDefault(PoreFluidExpansion, ((),))
 
     # A PorousBulkModuli object.
-    porousBulkModuli: PorousBulkModuli = PorousBulkModuli(((),))
+    porousBulkModuli: PorousBulkModuli = lazyDefault(PorousBulkModuli, ((),))
 
     # A PorousElastic object.
-    porousElastic: PorousElastic = PorousElastic(((),))
+    porousElastic: PorousElastic = lazyDefault(PorousElastic, ((),))
 
     # A PorousMetalPlasticity object.
-    porousMetalPlasticity: PorousMetalPlasticity = PorousMetalPlasticity(((),))
+    porousMetalPlasticity: PorousMetalPlasticity = lazyDefault(
+        PorousMetalPlasticity, ((),)
+    )
 
     # A Regularization object.
-    regularization: Regularization = Regularization()
+    regularization: Regularization = lazyDefault(Regularization)
 
     # A Solubility object.
-    solubility: Solubility = Solubility(((),))
+    solubility: Solubility = lazyDefault(Solubility, ((),))
 
     # A Sorption object.
-    sorption: Sorption = Sorption(((),))
+    sorption: Sorption = lazyDefault(Sorption, ((),))
 
     # A SpecificHeat object.
-    specificHeat: SpecificHeat = SpecificHeat(((),))
+    specificHeat: SpecificHeat = lazyDefault(SpecificHeat, ((),))
 
     # A Swelling object.
-    swelling: Swelling = Swelling(((),))
+    swelling: Swelling = lazyDefault(Swelling, ((),))
 
     # A UserDefinedField object.
-    userDefinedField: UserDefinedField = UserDefinedField()
+    userDefinedField: UserDefinedField = lazyDefault(UserDefinedField)
 
     # A UserMaterial object.
-    userMaterial: UserMaterial = UserMaterial()
+    userMaterial: UserMaterial = lazyDefault(UserMaterial)
 
     # A UserOutputVariables object.
-    userOutputVariables: UserOutputVariables = UserOutputVariables()
+    userOutputVariables: UserOutputVariables = lazyDefault(UserOutputVariables)
 
     # A Viscoelastic object.
-    viscoelastic: Viscoelastic = Viscoelastic(FREQUENCY, ((),))
+    viscoelastic: Viscoelastic = lazyDefault(Viscoelastic, FREQUENCY, ((),))
 
     # A Viscosity object.
-    viscosity: Viscosity = Viscosity(((),))
+    viscosity: Viscosity = lazyDefault(Viscosity, ((),))
 
     # A Viscous object.
-    viscous: Viscous = Viscous(((),))
+    viscous: Viscous = lazyDefault(Viscous, ((),))
 
     def __init__(self, name: str, description: str = "", materialIdentifier: str = ""):
         """This method creates a Material object.
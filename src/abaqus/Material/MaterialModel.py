@@ -1,6 +1,12 @@
-from ..Material.Material import Material
+from __future__ import annotations
+
+import typing
+
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from ..Material.Material import Material
+
 
 class MaterialModel(ModelBase):
     """Abaqus creates a Model object named `Model-1` when a session is started.
@@ -41,6 +47,7 @@ class MaterialModel(ModelBase):
         -------
             A Material object.
         """
+        from ..Material.Material import Material
         self.materials[name] = material = Material(
             name, description, materialIdentifier
         )
@@ -1,6 +1,12 @@
-from .Material import Material
+from __future__ import annotations
+
+import typing
+
 from ..Odb.OdbBase import OdbBase
 
+if typing.TYPE_CHECKING:
+    from .Material import Material
+
 
 class MaterialOdb(OdbBase):
     """The Odb object is the in-memory representation of an output database (ODB) file.
@@ -42,6 +48,7 @@ class MaterialOdb(OdbBase):
         -------
             A Material object.
         """
+        from .Material import Material
         self.materials[name] = material = Material(
             name, description, materialIdentifier
         )
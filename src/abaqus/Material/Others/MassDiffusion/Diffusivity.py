@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .PressureEffect import PressureEffect
 from .SoretEffect import SoretEffect
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class Diffusivity:
@@ -55,10 +56,10 @@ class Diffusivity:
     """
 
     # A PressureEffect object.
-    pressureEffect: PressureEffect = PressureEffect(((),))
+    pressureEffect: PressureEffect = lazyDefault(PressureEffect, ((),))
 
     # A SoretEffect object.
-    soretEffect: SoretEffect = SoretEffect(((),))
+    soretEffect: SoretEffect = lazyDefault(SoretEffect, ((),))
 
     def __init__(
         self,
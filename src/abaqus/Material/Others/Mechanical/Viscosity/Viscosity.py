@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .Trs import Trs
+from .....LazyDefault.LazyDefault import lazyDefault
 
 
 class Viscosity:
@@ -33,7 +34,7 @@ class Viscosity:
     """
 
     # A Trs object.
-    trs: Trs = Trs()
+    trs: Trs = lazyDefault(Trs)
 
     def __init__(
         self,
@@ -1,4 +1,5 @@
 from ....Ratios import Ratios
+from .....LazyDefault.LazyDefault import lazyDefault
 
 
 class MoistureSwelling:
@@ -27,7 +28,7 @@ class MoistureSwelling:
     """
 
     # A Ratios object.
-    ratios: Ratios = Ratios(((),))
+    ratios: Ratios = lazyDefault(Ratios, ((),))
 
     def __init__(self, table: tuple):
         """This method creates a MoistureSwelling object.
@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .SaturationDependence import SaturationDependence
 from .VelocityDependence import VelocityDependence
+from .....LazyDefault.LazyDefault import lazyDefault
 
 
 class Permeability:
@@ -47,11 +48,13 @@ class Permeability:
 
     # A SaturationDependence object specifying the dependence of the permeability of a
     # material on the saturation of the wetting liquid.
-    saturationDependence: SaturationDependence = SaturationDependence(((),))
+    saturationDependence: SaturationDependence = lazyDefault(
+        SaturationDependence, ((),)
+    )
 
     # A VelocityDependence object specifying the dependence of the permeability of a material
     # on the velocity of fluid flow.
-    velocityDependence: VelocityDependence = VelocityDependence(((),))
+    velocityDependence: VelocityDependence = lazyDefault(VelocityDependence, ((),))
 
     def __init__(
         self,
@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .BrittleFailure import BrittleFailure
 from .BrittleShear import BrittleShear
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class BrittleCracking:
@@ -49,10 +50,10 @@ class BrittleCracking:
     """
 
     # A BrittleShear object.
-    brittleShear: BrittleShear = BrittleShear(((),))
+    brittleShear: BrittleShear = lazyDefault(BrittleShear, ((),))
 
     # A BrittleFailure object.
-    brittleFailure: BrittleFailure = BrittleFailure(((),))
+    brittleFailure: BrittleFailure = lazyDefault(BrittleFailure, ((),))
 
     def __init__(
         self,
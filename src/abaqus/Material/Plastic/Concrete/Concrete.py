@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .FailureRatios import FailureRatios
 from .ShearRetention import ShearRetention
 from .TensionStiffening import TensionStiffening
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class Concrete:
@@ -34,13 +35,13 @@ class Concrete:
     """
 
     # A FailureRatios object.
-    failureRatios: FailureRatios = FailureRatios(((),))
+    failureRatios: FailureRatios = lazyDefault(FailureRatios, ((),))
 
     # A ShearRetention object.
-    shearRetention: ShearRetention = ShearRetention(((),))
+    shearRetention: ShearRetention = lazyDefault(ShearRetention, ((),))
 
     # A TensionStiffening object.
-    tensionStiffening: TensionStiffening = TensionStiffening(((),))
+    tensionStiffening: TensionStiffening = lazyDefault(TensionStiffening, ((),))
 
     def __init__(
         self, table: tuple, temperatureDependency: Boolean = OFF, dependencies: int = 0
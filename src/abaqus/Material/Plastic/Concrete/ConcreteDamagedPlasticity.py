@@ -3,6 +3,7 @@ from .ConcreteCompressionDamage import ConcreteCompressionDamage
 from .ConcreteCompressionHardening import ConcreteCompressionHardening
 from .ConcreteTensionDamage import ConcreteTensionDamage
 from .ConcreteTensionStiffening import ConcreteTensionStiffening
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class ConcreteDamagedPlasticity:
@@ -38,22 +39,24 @@ class ConcreteDamagedPlasticity:
     """
 
     # A ConcreteCompressionHardening object.
-    concreteCompressionHardening: ConcreteCompressionHardening = (
-        ConcreteCompressionHardening(((),))
+    concreteCompressionHardening: ConcreteCompressionHardening = lazyDefault(
+        ConcreteCompressionHardening, ((),)
     )
 
     # A ConcreteTensionStiffening object.
-    concreteTensionStiffening: ConcreteTensionStiffening = ConcreteTensionStiffening(
-        ((),)
+    concreteTensionStiffening: ConcreteTensionStiffening = lazyDefault(
+        ConcreteTensionStiffening, ((),)
     )
 
     # A ConcreteCompressionDamage object.
-    concreteCompressionDamage: ConcreteCompressionDamage = ConcreteCompressionDamage(
-        ((),)
+    concreteCompressionDamage: ConcreteCompressionDamage = lazyDefault(
+        ConcreteCompressionDamage, ((),)
     )
 
     # A ConcreteTensionDamage object.
-    concreteTensionDamage: ConcreteTensionDamage = ConcreteTensionDamage(((),))
+    concreteTensionDamage: ConcreteTensionDamage = lazyDefault(
+        ConcreteTensionDamage, ((),)
+    )
 
     def __init__(
         self, table: tuple, temperatureDependency: Boolean = OFF, dependencies: int = 0
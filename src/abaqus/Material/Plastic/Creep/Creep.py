@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from ..Metal.ORNL.Ornl import Ornl
 from ..Potential import Potential
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class Creep:
@@ -84,10 +85,10 @@ class Creep:
     """
 
     # An Ornl object.
-    ornl: Ornl = Ornl()
+    ornl: Ornl = lazyDefault(Ornl)
 
     # A Potential object.
-    potential: Potential = Potential(((),))
+    potential: Potential = lazyDefault(Potential, ((),))
 
     def __init__(
         self,
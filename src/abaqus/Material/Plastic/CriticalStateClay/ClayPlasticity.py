@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .ClayHardening import ClayHardening
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class ClayPlasticity:
@@ -45,7 +46,7 @@ class ClayPlasticity:
     """
 
     # A ClayHardening object.
-    clayHardening: ClayHardening = ClayHardening(((),))
+    clayHardening: ClayHardening = lazyDefault(ClayHardening, ((),))
 
     def __init__(
         self,
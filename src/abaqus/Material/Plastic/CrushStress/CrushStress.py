@@ -1,6 +1,7 @@
 from abaqusConstants import *
 
 from .CrushStressVelocityFactor import CrushStressVelocityFactor
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class CrushStress:
@@ -49,8 +50,8 @@ class CrushStress:
     dependencies: int = 0
 
     # A :py:class:`~abaqus.Material.Plastic.CrushStress.CrushStressVelocityFactor.CrushStressVelocityFactor` object.
-    crushStressVelocityFactor: CrushStressVelocityFactor = CrushStressVelocityFactor(
-        ((),)
+    crushStressVelocityFactor: CrushStressVelocityFactor = lazyDefault(
+        CrushStressVelocityFactor, ((),)
     )
 
     def __init__(
@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .CrushableFoamHardening import CrushableFoamHardening
 from ..Metal.RateDependent.RateDependent import RateDependent
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class CrushableFoam:
@@ -41,10 +42,12 @@ class CrushableFoam:
     """
 
     # A CrushableFoamHardening object.
-    crushableFoamHardening: CrushableFoamHardening = CrushableFoamHardening(((),))
+    crushableFoamHardening: CrushableFoamHardening = lazyDefault(
+        CrushableFoamHardening, ((),)
+    )
 
     # A RateDependent object.
-    rateDependent: RateDependent = RateDependent(((),))
+    rateDependent: RateDependent = lazyDefault(RateDependent, ((),))
 
     def __init__(
         self,
@@ -3,6 +3,7 @@ from .DruckerPragerCreep import DruckerPragerCreep
 from .DruckerPragerHardening import DruckerPragerHardening
 from .TriaxialTestData import TriaxialTestData
 from ...Metal.RateDependent.RateDependent import RateDependent
+from .....LazyDefault.LazyDefault import lazyDefault
 
 
 class DruckerPrager:
@@ -52,16 +53,18 @@ class DruckerPrager:
     """
 
     # A DruckerPragerCreep object.
-    druckerPragerCreep: DruckerPragerCreep = DruckerPragerCreep(((),))
+    druckerPragerCreep: DruckerPragerCreep = lazyDefault(DruckerPragerCreep, ((),))
 
     # A DruckerPragerHardening object.
-    druckerPragerHardening: DruckerPragerHardening = DruckerPragerHardening(((),))
+    druckerPragerHardening: DruckerPragerHardening = lazyDefault(
+        DruckerPragerHardening, ((),)
+    )
 
     # A RateDependent object.
-    rateDependent: RateDependent = RateDependent(((),))
+    rateDependent: RateDependent = lazyDefault(RateDependent, ((),))
 
     # A TriaxialTestData object.
-    triaxialTestData: TriaxialTestData = TriaxialTestData(((),))
+    triaxialTestData: TriaxialTestData = lazyDefault(TriaxialTestData, ((),))
 
     def __init__(
         self,
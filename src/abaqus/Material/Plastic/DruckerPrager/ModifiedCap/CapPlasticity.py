@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .CapCreepCohesion import CapCreepCohesion
 from .CapCreepConsolidation import CapCreepConsolidation
 from .CapHardening import CapHardening
+from .....LazyDefault.LazyDefault import lazyDefault
 
 
 class CapPlasticity:
@@ -38,13 +39,15 @@ class CapPlasticity:
     """
 
     # A CapCreepCohesion object.
-    capCreepCohesion: CapCreepCohesion = CapCreepCohesion(((),))
+    capCreepCohesion: CapCreepCohesion = lazyDefault(CapCreepCohesion, ((),))
 
     # A CapCreepConsolidation object.
-    capCreepConsolidation: CapCreepConsolidation = CapCreepConsolidation(((),))
+    capCreepConsolidation: CapCreepConsolidation = lazyDefault(
+        CapCreepConsolidation, ((),)
+    )
 
     # A CapHardening object.
-    capHardening: CapHardening = CapHardening(((),))
+    capHardening: CapHardening = lazyDefault(CapHardening, ((),))
 
     def __init__(
         self, table: tuple, temperatureDependency: Boolean = OFF, dependencies: int = 0
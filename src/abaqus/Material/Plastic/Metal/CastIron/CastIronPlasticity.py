@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .CastIronCompressionHardening import CastIronCompressionHardening
 from .CastIronTensionHardening import CastIronTensionHardening
+from .....LazyDefault.LazyDefault import lazyDefault
 
 
 class CastIronPlasticity:
@@ -32,11 +33,13 @@ class CastIronPlasticity:
     """
 
     # A CastIronTensionHardening object.
-    castIronTensionHardening: CastIronTensionHardening = CastIronTensionHardening(((),))
+    castIronTensionHardening: CastIronTensionHardening = lazyDefault(
+        CastIronTensionHardening, ((),)
+    )
 
     # A CastIronCompressionHardening object.
-    castIronCompressionHardening: CastIronCompressionHardening = (
-        CastIronCompressionHardening(((),))
+    castIronCompressionHardening: CastIronCompressionHardening = lazyDefault(
+        CastIronCompressionHardening, ((),)
     )
 
     def __init__(
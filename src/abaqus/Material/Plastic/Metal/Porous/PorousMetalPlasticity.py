@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .PorousFailureCriteria import PorousFailureCriteria
 from .VoidNucleation import VoidNucleation
+from .....LazyDefault.LazyDefault import lazyDefault
 
 
 class PorousMetalPlasticity:
@@ -34,10 +35,10 @@ class PorousMetalPlasticity:
     """
 
     # A PorousFailureCriteria object.
-    porousFailureCriteria: PorousFailureCriteria = PorousFailureCriteria()
+    porousFailureCriteria: PorousFailureCriteria = lazyDefault(PorousFailureCriteria)
 
     # A VoidNucleation object.
-    voidNucleation: VoidNucleation = VoidNucleation(((),))
+    voidNucleation: VoidNucleation = lazyDefault(VoidNucleation, ((),))
 
     def __init__(
         self,
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from ...Potential import Potential
+from .....LazyDefault.LazyDefault import lazyDefault
 
 
 class Viscous:
@@ -86,7 +87,7 @@ class Viscous:
     """
 
     # A Potential object.
-    potential: Potential = Potential(((),))
+    potential: Potential = lazyDefault(Potential, ((),))
 
     def __init__(
         self,
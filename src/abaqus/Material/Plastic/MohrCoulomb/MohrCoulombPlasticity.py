@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .MohrCoulombHardening import MohrCoulombHardening
 from .TensionCutOff import TensionCutOff
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class MohrCoulombPlasticity:
@@ -33,10 +34,12 @@ class MohrCoulombPlasticity:
     """
 
     # A MohrCoulombHardening object.
-    mohrCoulombHardening: MohrCoulombHardening = MohrCoulombHardening(((),))
+    mohrCoulombHardening: MohrCoulombHardening = lazyDefault(
+        MohrCoulombHardening, ((),)
+    )
 
     # A TensionCutOff object.
-    tensionCutOff: TensionCutOff = TensionCutOff(((),))
+    tensionCutOff: TensionCutOff = lazyDefault(TensionCutOff, ((),))
 
     def __init__(
         self,
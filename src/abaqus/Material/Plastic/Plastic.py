@@ -6,6 +6,7 @@ from .Metal.ORNL.Ornl import Ornl
 from .Metal.RateDependent.RateDependent import RateDependent
 from .Potential import Potential
 from .TensileFailure import TensileFailure
+from ...LazyDefault.LazyDefault import lazyDefault
 
 
 class Plastic:
@@ -72,25 +73,65 @@ class Plastic:
     """
 
     # A RateDependent object.
-    rateDependent: RateDependent = RateDependent(((),))
+    rateDependent: RateDependent = lazyDefault(RateDependent, ((),))
 
     # A Potential object.
-    potential: Potential = Potential(((),))
+    potential: Potential = lazyDefault(Potential, ((),))
 
     # A CyclicHardening object.
-    cyclicHardening: CyclicHardening = CyclicHardening(((),))
+    cyclicHardening: CyclicHardening = lazyDefault(CyclicHardening, ((),))
 
     # An Ornl object.
-    ornl: Ornl = Ornl()
+    ornl: Ornl = lazyDefault(Ornl)
 
     # A CycledPlastic object.
-    cycledPlastic: CycledPlastic = CycledPlastic(((),))
+    cycledPlastic: CycledPlastic = lazyDefault(CycledPlastic, ((),))
 
     # An AnnealTemperature object.
-    annealTemperature: AnnealTemperature = AnnealTemperature(((),))
+    annealTemperature: AnnealTemperature = lazyDefault(AnnealTemperature, ((),))
 
     # A TensileFailure object.
-    tensileFailure: TensileFailure = TensileFailure()
+    tensileFailure: TensileFailure = lazyDefault(TensileFailure)
+
+    # A sequence of sequences of Floats specifying the yield stress, the plastic strain,
+    # and the rate, the temperature and the field variables the yield stress depends on.
+    table: tuple = ()
+
+    # A SymbolicConstant specifying the type of hardening. Possible values are
+    # ISOTROPIC, KINEMATIC, COMBINED, JOHNSON_COOK, and USER. The default value is
+    # ISOTROPIC.
+    hardening: SymbolicConstant = ISOTROPIC
+
+    # A Boolean specifying whether the data depend on rate. The default value is OFF.
+    rate: Boolean = OFF
+
+    # A SymbolicConstant specifying the type of combined hardening. This argument is
+    # only valid if *hardening*=COMBINED. Possible values are HALF_CYCLE, PARAMETERS,
+    # and STABILIZED. The default value is HALF_CYCLE.
+    dataType: SymbolicConstant = HALF_CYCLE
+
+    # A Boolean specifying whether the data depend on strain range. This argument is
+    # only valid if *hardening*=COMBINED and *dataType*=STABILIZED. The default value is
+    # OFF.
+    strainRangeDependency: Boolean = OFF
+
+    # An Int specifying the number of backstresses. This argument is only valid if
+    # *hardening*=COMBINED. The default value is 1.
+    numBackstresses: int = 1
+
+    # A Boolean specifying whether the data depend on temperature. The default value is
+    # OFF.
+    temperatureDependency: Boolean = OFF
+
+    # An Int specifying the number of field variable dependencies. The default value is
+    # 0.
+    dependencies: int = 0
+
+    # A SymbolicConstant specifying the extrapolation method for the yield stress with
+    # respect to the equivalent plastic strain. This argument is valid only if
+    # hardening=ISOTROPIC. Possible values are CONSTANT and LINEAR . The default value
+    # is CONSTANT.
+    extrapolation: SymbolicConstant = CONSTANT
 
     def __init__(
         self,
@@ -151,7 +192,15 @@ class Plastic:
         ------
         RangeError
         """
-        pass
+        self.table = table
+        self.hardening = hardening
+        self.rate = rate
+        self.dataType = dataType
+        self.strainRangeDependency = strainRangeDependency
+        self.numBackstresses = numBackstresses
+        self.temperatureDependency = temperatureDependency
+        self.dependencies = dependencies
+        self.extrapolation = extrapolation
 
     def setValues(self):
         """This method modifies the Plastic object.
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from ...Ratios import Ratios
+from ....LazyDefault.LazyDefault import lazyDefault
 
 
 class Swelling:
@@ -31,7 +32,7 @@ class Swelling:
     """
 
     # A Ratios object.
-    ratios: Ratios = Ratios(((),))
+    ratios: Ratios = lazyDefault(Ratios, ((),))
 
     def __init__(
         self,
@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .DamageEvolution import DamageEvolution
 from .DamageStabilization import DamageStabilization
 from .DamageStabilizationCohesive import DamageStabilizationCohesive
+from ...LazyDefault.LazyDefault import lazyDefault
 
 
 class DamageInitiation:
@@ -218,8 +219,8 @@ class DamageInitiation:
     damageStabilization: DamageStabilization = None
 
     # A DamageStabilizationCohesive object.
-    damageStabilizationCohesive: DamageStabilizationCohesive = (
-        DamageStabilizationCohesive()
+    damageStabilizationCohesive: DamageStabilizationCohesive = lazyDefault(
+        DamageStabilizationCohesive
     )
 
     def DuctileDamageInitiation(
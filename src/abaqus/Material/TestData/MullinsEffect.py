@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .BiaxialTestDataArray import BiaxialTestDataArray
 from .PlanarTestDataArray import PlanarTestDataArray
 from .UniaxialTestDataArray import UniaxialTestDataArray
+from ...LazyDefault.LazyDefault import lazyDefault
 
 
 class MullinsEffect:
@@ -39,10 +40,10 @@ class MullinsEffect:
     table: tuple = ()
 
     # A UniaxialTestDataArray object.
-    uniaxialTests: UniaxialTestDataArray = UniaxialTestDataArray()
+    uniaxialTests: UniaxialTestDataArray = lazyDefault(UniaxialTestDataArray)
 
     # A BiaxialTestDataArray object.
-    biaxialTests: BiaxialTestDataArray = BiaxialTestDataArray()
+    biaxialTests: BiaxialTestDataArray = lazyDefault(BiaxialTestDataArray)
 
     # A PlanarTestDataArray object.
-    planarTests: PlanarTestDataArray = PlanarTestDataArray()
+    planarTests: PlanarTestDataArray = lazyDefault(PlanarTestDataArray)
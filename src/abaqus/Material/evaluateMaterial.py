@@ -1,5 +1,11 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .Material import Material
+
+if typing.TYPE_CHECKING:
+    from .Material import Material
 
 """ This command evaluates the behavior of a hyperelastic material under standard test 
 conditions. 
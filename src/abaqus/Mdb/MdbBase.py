@@ -5,6 +5,7 @@ from ..EditMesh.MeshEditOptions import MeshEditOptions
 from ..Job.Coexecution import Coexecution
 from ..Job.Job import Job
 from ..Job.OptimizationProcess import OptimizationProcess
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Model.Model import Model
 
 
@@ -55,31 +56,33 @@ class MdbBase:
     lastChangedCount: float = None
 
     # A repository of Job objects.
-    jobs: dict[str, Job] = dict[str, Job]()
+    jobs: dict[str, Job] = lazyDefault(dict[str, Job])
 
     # A repository of AdaptivityProcess objects.
-    adaptivityProcesses: dict[str, AdaptivityProcess] = dict[str, AdaptivityProcess]()
+    adaptivityProcesses: dict[str, AdaptivityProcess] = lazyDefault(
+        dict[str, AdaptivityProcess]
+    )
 
     # A repository of Coexecution objects.
-    coexecutions: dict[str, Coexecution] = dict[str, Coexecution]()
+    coexecutions: dict[str, Coexecution] = lazyDefault(dict[str, Coexecution])
 
     # A repository of OptimizationProcess objects.
-    optimizationProcesses: dict[str, OptimizationProcess] = dict[
-        str, OptimizationProcess
-    ]()
+    optimizationProcesses: dict[str, OptimizationProcess] = lazyDefault(
+        dict[str, OptimizationProcess]
+    )
 
     # A MeshEditOptions object specifying the undo/redo behavior when editing meshes on parts
     # or part instances.
-    meshEditOptions: MeshEditOptions = MeshEditOptions()
+    meshEditOptions: MeshEditOptions = lazyDefault(MeshEditOptions)
 
     # A repository of Model objects.
-    models: dict[str, Model] = dict[str, Model]()
+    models: dict[str, Model] = lazyDefault(dict[str, Model])
 
     # A RepositorySupport object.
-    customData: RepositorySupport = RepositorySupport()
+    customData: RepositorySupport = lazyDefault(RepositorySupport)
 
     # A repository of Annotation objects.
-    annotations: dict[str, Annotation] = dict[str, Annotation]()
+    annotations: dict[str, Annotation] = lazyDefault(dict[str, Annotation])
 
     def __init__(self, pathName: str = ""):
         """This constructor creates an empty Mdb object.
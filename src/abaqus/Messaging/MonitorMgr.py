@@ -1,4 +1,5 @@
 from abaqusConstants import *
+from .DataObject import DataObject
 
 
 class MonitorMgr:
@@ -17,6 +18,10 @@ class MonitorMgr:
 
     """
 
+    def __init__(self):
+        # (jobName, messageType, callback, userData) of the registered callbacks
+        self._callbacks: list[tuple] = []
+
     def addMessageCallback(
         self,
         jobName: str,
@@ -45,7 +50,7 @@ class MonitorMgr:
         userData
             Any Python object or None. This object is passed to the callback function.
         """
-        pass
+        self._callbacks.append((jobName, messageType, callback, userData))
 
     def removeMessageCallback(
         self, jobName: str, messageType: SymbolicConstant, callback: str, userData: str
@@ -93,7 +98,9 @@ class MonitorMgr:
             Any Python object or None; it must be the same as the *userData* argument specified in
             the original call to addMessageCallback.
         """
-        pass
+        entry = (jobName, messageType, callback, userData)
+        if entry in self._callbacks:
+            self._callbacks.remove(entry)
 
     def checkMonitorStatus(self):
         """This method raises a MonitorError exception if the monitoring status is not ENABLED.
@@ -104,3 +111,24 @@ class MonitorMgr:
             Status is not ENABLED
         """
         pass
+
+    def dispatchMessage(self, jobName: str, messageType: SymbolicConstant, data: DataObject):
+        """This method calls the callback functions registered for a message, callbacks
+        registered with ANY_JOB or ANY_MESSAGE_TYPE are called for every job or message type.
+
+        Parameters
+        ----------
+        jobName
+            A String specifying the name of the job that sent the message.
+        messageType
+            A SymbolicConstant specifying the message type.
+        data
+            A :py:class:`~abaqus.Messaging.DataObject.DataObject` object specifying the message
+            data.
+        """
+        for callbackJobName, callbackMessageType, callback, userData in list(self._callbacks):
+            if callbackJobName not in (jobName, ANY_JOB):
+                continue
+            if callbackMessageType not in (messageType, ANY_MESSAGE_TYPE):
+                continue
+            callback(jobName, messageType, data, userData)
@@ -19,6 +19,7 @@ from ..Interaction.ContactInitialization import ContactInitialization
 from ..Interaction.ContactProperty import ContactProperty
 from ..Interaction.ContactStabilization import ContactStabilization
 from ..Interaction.Interaction import Interaction
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Load.Load import Load
 from ..Material.Material import Material
 from ..Optimization.OptimizationTask import OptimizationTask
@@ -235,50 +236,58 @@ class ModelBase:
     copyInteractions: Boolean = OFF
 
     # A KeywordBlock object.
-    keywordBlock: KeywordBlock = KeywordBlock()
+    keywordBlock: KeywordBlock = lazyDefault(KeywordBlock)
 
     # An Assembly object.
-    rootAssembly: Assembly = Assembly()
+    rootAssembly: Assembly = lazyDefault(Assembly)
 
     # A repository of Amplitude objects.
-    amplitudes: dict[str, Amplitude] = dict[str, Amplitude]()
+    amplitudes: dict[str, Amplitude] = lazyDefault(dict[str, Amplitude])
 
     # A repository of Profile objects.
-    profiles: dict[str, Profile] = dict[str, Profile]()
+    profiles: dict[str, Profile] = lazyDefault(dict[str, Profile])
 
     # A repository of BoundaryCondition objects.
-    boundaryConditions: dict[str, BoundaryCondition] = dict[str, BoundaryCondition]()
+    boundaryConditions: dict[str, BoundaryCondition] = lazyDefault(
+        dict[str, BoundaryCondition]
+    )
 
     # A repository of ConstrainedSketchConstraint objects.
-    constraints: dict[str, Constraint] = dict[str, Constraint]()
+    constraints: dict[str, Constraint] = lazyDefault(dict[str, Constraint])
 
     # A repository of AnalyticalField objects.
-    analyticalFields: dict[str, AnalyticalField] = dict[str, AnalyticalField]()
+    analyticalFields: dict[str, AnalyticalField] = lazyDefault(
+        dict[str, AnalyticalField]
+    )
 
     # A repository of DiscreteField objects.
-    discreteFields: dict[str, DiscreteField] = dict[str, DiscreteField]()
+    discreteFields: dict[str, DiscreteField] = lazyDefault(dict[str, DiscreteField])
 
     # A repository of PredefinedField objects.
-    predefinedFields: dict[str, PredefinedField] = dict[str, PredefinedField]()
+    predefinedFields: dict[str, PredefinedField] = lazyDefault(
+        dict[str, PredefinedField]
+    )
 
     # A repository of Interaction objects.
-    interactions: dict[str, Interaction] = dict[str, Interaction]()
+    interactions: dict[str, Interaction] = lazyDefault(dict[str, Interaction])
 
     # A repository of InteractionProperty objects.
-    interactionProperties: dict[str, ContactProperty] = dict[str, ContactProperty]()
+    interactionProperties: dict[str, ContactProperty] = lazyDefault(
+        dict[str, ContactProperty]
+    )
 
     # A repository of ContactControl objects.
-    contactControls: dict[str, ContactControl] = dict[str, ContactControl]()
+    contactControls: dict[str, ContactControl] = lazyDefault(dict[str, ContactControl])
 
     # A repository of ContactInitialization objects.
-    contactInitializations: dict[str, ContactInitialization] = dict[
-        str, ContactInitialization
-    ]()
+    contactInitializations: dict[str, ContactInitialization] = lazyDefault(
+        dict[str, ContactInitialization]
+    )
 
     # A repository of ContactStabilization objects.
-    contactStabilizations: dict[str, ContactStabilization] = dict[
-        str, ContactStabilization
-    ]()
+    contactStabilizations: dict[str, ContactStabilization] = lazyDefault(
+        dict[str, ContactStabilization]
+    )
 
     # A tuple of tuples of Strings specifying the linked child PartInstance name in the
     # current model to the corresponding parent PartInstance name in a different model.
@@ -289,72 +298,82 @@ class ModelBase:
     linkedParts: tuple = ()
 
     # A repository of Load objects.
-    loads: dict[str, Load] = dict[str, Load]()
+    loads: dict[str, Load] = lazyDefault(dict[str, Load])
 
     # A repository of Material objects.
-    materials: dict[str, Material] = dict[str, Material]()
+    materials: dict[str, Material] = lazyDefault(dict[str, Material])
 
     # A repository of Calibration objects.
-    calibrations: dict[str, Calibration] = dict[str, Calibration]()
+    calibrations: dict[str, Calibration] = lazyDefault(dict[str, Calibration])
 
     # A repository of Section objects.
-    sections: dict[str, Section] = dict[str, Section]()
+    sections: dict[str, Section] = lazyDefault(dict[str, Section])
 
     # A repository of RemeshingRule objects.
-    remeshingRules: dict[str, RemeshingRule] = dict[str, RemeshingRule]()
+    remeshingRules: dict[str, RemeshingRule] = lazyDefault(dict[str, RemeshingRule])
 
     # A repository of ConstrainedSketch objects.
-    sketches: dict[str, ConstrainedSketch] = dict[str, ConstrainedSketch]()
+    sketches: dict[str, ConstrainedSketch] = lazyDefault(dict[str, ConstrainedSketch])
 
     # A repository of Part objects.
-    parts: dict[str, Part] = dict[str, Part]()
+    parts: dict[str, Part] = lazyDefault(dict[str, Part])
 
     # A repository of Step objects.
-    steps: dict[str, Step] = dict[str, Step]()
+    steps: dict[str, Step] = lazyDefault(dict[str, Step])
 
     # A FeatureOptions object.
-    featureOptions: FeatureOptions = FeatureOptions()
+    featureOptions: FeatureOptions = lazyDefault(FeatureOptions)
 
     # A repository of AdaptiveMeshConstraint objects.
-    adaptiveMeshConstraints: dict[str, AdaptiveMeshConstraint] = dict[
-        str, AdaptiveMeshConstraint
-    ]()
+    adaptiveMeshConstraints: dict[str, AdaptiveMeshConstraint] = lazyDefault(
+        dict[str, AdaptiveMeshConstraint]
+    )
 
     # A repository of AdaptiveMeshControl objects.
-    adaptiveMeshControls: dict[str, AdaptiveMeshControl] = dict[
-        str, AdaptiveMeshControl
-    ]()
+    adaptiveMeshControls: dict[str, AdaptiveMeshControl] = lazyDefault(
+        dict[str, AdaptiveMeshControl]
+    )
 
     # A repository of TimePoint objects.
-    timePoints: dict[str, TimePoint] = dict[str, TimePoint]()
+    timePoints: dict[str, TimePoint] = lazyDefault(dict[str, TimePoint])
 
     # A repository of Filter objects.
-    filters: dict[str, Filter] = dict[str, Filter]()
+    filters: dict[str, Filter] = lazyDefault(dict[str, Filter])
 
     # A repository of IntegratedOutputSection objects.
-    integratedOutputSections: dict[str, IntegratedOutputSection] = dict[
-        str, IntegratedOutputSection
-    ]()
+    integratedOutputSections: dict[str, IntegratedOutputSection] = lazyDefault(
+        dict[str, IntegratedOutputSection]
+    )
 
     # A repository of FieldOutputRequest objects.
-    fieldOutputRequests: dict[str, FieldOutputRequest] = dict[str, FieldOutputRequest]()
+    fieldOutputRequests: dict[str, FieldOutputRequest] = lazyDefault(
+        dict[str, FieldOutputRequest]
+    )
 
     # A repository of HistoryOutputRequest objects.
-    historyOutputRequests: dict[str, HistoryOutputRequest] = dict[
-        str, HistoryOutputRequest
-    ]()
+    historyOutputRequests: dict[str, HistoryOutputRequest] = lazyDefault(
+        dict[str, HistoryOutputRequest]
+    )
 
     # A repository of OptimizationTask objects.
-    optimizationTasks: dict[str, OptimizationTask] = dict[str, OptimizationTask]()
+    optimizationTasks: dict[str, OptimizationTask] = lazyDefault(
+        dict[str, OptimizationTask]
+    )
 
     # A repository of TableCollection objects.
-    tableCollections: dict[str, TableCollection] = dict[str, TableCollection]()
+    tableCollections: dict[str, TableCollection] = lazyDefault(
+        dict[str, TableCollection]
+    )
 
     # A repository of EventSeriesType objects.
-    eventSeriesTypes: dict[str, EventSeriesType] = dict[str, EventSeriesType]()
+    eventSeriesTypes: dict[str, EventSeriesType] = lazyDefault(
+        dict[str, EventSeriesType]
+    )
 
     # A repository of EventSeriesData objects.
-    eventSeriesDatas: dict[str, EventSeriesData] = dict[str, EventSeriesData]()
+    eventSeriesDatas: dict[str, EventSeriesData] = lazyDefault(
+        dict[str, EventSeriesData]
+    )
 
     def __init__(
         self,
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import typing
+
+# Version of the conversion, it is part of the cache key so that a changed conversion does not
+# reuse the scripts converted by an older one
+_VERSION = "2"
+# IPython line magics, shell escapes and help requests, they can not run in Abaqus/CAE
+_MAGIC = re.compile(r"^\s*(%|!|\?)|^\s*\S+\?\s*$")
+# The comments, quotes and escapes that start or end a string literal
+_QUOTES = re.compile(r"#|\\.|\"\"\"|\'\'\'|\"|\'")
+
+LOCAL_ONLY_TAGS = ("local-only",)
+
+
+def notebookToScript(notebook: str, localOnlyTags: typing.Iterable[str] = LOCAL_ONLY_TAGS) -> str:
+    """This function converts a Jupyter notebook to the source code of a Python script.
+
+    Only the code cells are kept, the cells tagged with one of *localOnlyTags* are dropped, and
+    the IPython magics and shell escapes are commented out.
+
+    Parameters
+    ----------
+    notebook
+        A String specifying the path of the notebook.
+    localOnlyTags
+        A sequence of Strings specifying the tags of the cells that are only executed locally,
+        i.e., not in Abaqus/CAE. The default value is `('local-only',)`.
+
+    Returns
+    -------
+    str
+        The source code of the script.
+    """
+    with open(notebook, "rb") as file:
+        return _convert(json.loads(file.read().decode("utf-8")), set(localOnlyTags))
+
+
+def cachedNotebookScript(
+    notebook: str,
+    scriptPath: str = None,
+    cacheDirectory: str = None,
+    localOnlyTags: typing.Iterable[str] = LOCAL_ONLY_TAGS,
+) -> str:
+    """This function writes the script of a Jupyter notebook, the conversion is cached on the
+    content hash of the notebook, so an unchanged notebook is not converted again. The script is
+    only rewritten if its content changes.
+
+    Parameters
+    ----------
+    notebook
+        A String specifying the path of the notebook.
+    scriptPath
+        A String specifying the path of the script. The default value is the path of the notebook
+        with the *.py* suffix.
+    cacheDirectory
+        A String specifying the directory of the cache. The default value is the value of the
+        *ABAQUS_NOTEBOOK_CACHE* environment variable or `~/.cache/pyabaqus/notebooks`.
+    localOnlyTags
+        A sequence of Strings specifying the tags of the cells that are only executed locally.
+
+    Returns
+    -------
+    str
+        The path of the script.
+    """
+    if scriptPath is None:
+        scriptPath = os.path.splitext(notebook)[0] + ".py"
+    if cacheDirectory is None:
+        cacheDirectory = os.environ.get(
+            "ABAQUS_NOTEBOOK_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "pyabaqus", "notebooks")
+        )
+    localOnlyTags = sorted(set(localOnlyTags))
+
+    with open(notebook, "rb") as file:
+        content = file.read()
+    key = hashlib.sha256()
+    for part in (_VERSION, ",".join(localOnlyTags)):
+        key.update(part.encode("utf-8") + b"\0")
+    key.update(content)
+    cacheFile = os.path.join(cacheDirectory, key.hexdigest() + ".py")
+
+    try:
+        with open(cacheFile, "r", encoding="utf-8") as file:
+            script = file.read()
+    except OSError:
+        script = _convert(json.loads(content.decode("utf-8")), set(localOnlyTags))
+        _writeAtomic(cacheFile, script)
+
+    try:
+        with open(scriptPath, "r", encoding="utf-8") as file:
+            unchanged = file.read() == script
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        _writeAtomic(scriptPath, script)
+    return scriptPath
+
+
+def currentScript() -> tuple[str, str]:
+    """This function returns the script executed by the current process, it is the script
+    Abaqus/CAE has to run when the model or output database is sent to it. If the process is a
+    Jupyter kernel, the notebook is converted with :py:func:`cachedNotebookScript`.
+
+    Returns
+    -------
+    tuple[str, str]
+        The directory and the file name of the script.
+    """
+    filePath = os.path.abspath(sys.argv[0])
+    try:  # If it is a jupyter notebook
+        import ipynbname
+
+        notebook = str(ipynbname.path())
+    except Exception:
+        notebook = None
+    if notebook is not None:
+        filePath = cachedNotebookScript(notebook)
+    return os.path.dirname(filePath), os.path.basename(filePath)
+
+
+def _convert(notebook: dict, localOnlyTags: set[str]) -> str:
+    cells = []
+    for cell in notebook.get("cells", []):
+        if cell.get("cell_type") != "code":
+            continue
+        if localOnlyTags.intersection(cell.get("metadata", {}).get("tags", ())):
+            continue
+        source = cell.get("source", "")
+        if not isinstance(source, str):
+            source = "".join(source)
+        lines = source.splitlines()
+        if lines and lines[0].lstrip().startswith("%%"):
+            # A cell magic runs the whole cell with another interpreter
+            lines = ["# " + line for line in lines]
+        else:
+            lines = _commentMagics(lines)
+        if any(line.strip() for line in lines):
+            cells.append("\n".join(lines).rstrip())
+    return "\n\n\n".join(cells) + "\n"
+
+
+def _commentMagics(lines: list[str]) -> list[str]:
+    # A line is a magic only if it does not start inside a string literal, the tokenize module
+    # can not be used as the magics are not valid Python
+    result, quote = [], None
+    for line in lines:
+        if quote is None and _MAGIC.match(line):
+            result.append("# " + line)
+            continue
+        result.append(line)
+        for match in _QUOTES.finditer(line):
+            token = match.group()
+            if quote is None:
+                if token == "#":
+                    break
+                if token[0] in "\"'":
+                    quote = token
+            elif token == quote:
+                quote = None
+        # A single quoted string ends with the line unless the line is continued
+        if quote is not None and len(quote) == 1 and not line.endswith("\\"):
+            quote = None
+    return result
+
+
+def _writeAtomic(path: str, text: str):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(text)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
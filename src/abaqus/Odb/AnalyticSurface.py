@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .OdbSequenceAnalyticSurfaceSegment import OdbSequenceAnalyticSurfaceSegment
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class AnalyticSurface:
@@ -49,7 +50,9 @@ class AnalyticSurface:
 
     # An OdbSequenceAnalyticSurfaceSegment object specifying the profile associated with the
     # surface.
-    segments: OdbSequenceAnalyticSurfaceSegment = OdbSequenceAnalyticSurfaceSegment()
+    segments: OdbSequenceAnalyticSurfaceSegment = lazyDefault(
+        OdbSequenceAnalyticSurfaceSegment
+    )
 
     # A tuple of tuples of Floats specifying the global coordinates of points representing the
     # local coordinate system, if used.
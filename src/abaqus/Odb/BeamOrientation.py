@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .OdbMeshNode import OdbMeshNode
 from .OdbSet import OdbSet
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class BeamOrientation:
@@ -37,7 +38,7 @@ class BeamOrientation:
     method: SymbolicConstant = None
 
     # An OdbSet object specifying a region for which the beam orientation is defined.
-    region: OdbSet = OdbSet("set", tuple[OdbMeshNode]())
+    region: OdbSet = lazyDefault(lambda: OdbSet("set", tuple[OdbMeshNode]()))
 
     # A tuple of Floats specifying direction cosines of the n1-direction of the beam
     # cross-section.
@@ -0,0 +1,337 @@
+import typing
+
+import numpy
+
+from abaqusConstants import *
+from .FieldBulkData import FieldBulkData
+from .FieldOutput import FieldOutput
+from .HistoryOutput import HistoryOutput
+from .OdbInstance import OdbInstance
+from .OdbSet import OdbSet
+from .RegionIndex import setLabels
+from .SectionPoint import SectionPoint
+
+# The positions of the data written at the nodes, the data at the other positions are written
+# at the elements
+NODAL_POSITIONS = (NODAL,)
+
+
+class BulkWriter:
+    """The BulkWriter object collects the data added to the field outputs and the history
+    outputs of an output database as numpy arrays and adds them when it is flushed. The data of
+    a field output at a position, in an instance, and at a section point are added as a single
+    bulk data block sorted by label, whatever the number of calls that added them, and the data
+    of a history output are added by a single call of its addData method. The shape of the data
+    is validated once per call instead of once per value.
+
+    The arrays are used when the writer is flushed, they must not be modified before.
+
+    Attributes
+    ----------
+    odb: Odb
+        An :py:class:`~abaqus.Odb.Odb.Odb` object specifying the output database.
+    blockCount: int
+        An Int specifying the number of bulk data blocks added to the field outputs.
+    rowCount: int
+        An Int specifying the number of rows of data added to the field outputs.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        import odbAccess
+        with session.odbs[name].bulkWriter() as writer:
+            writer.addData(fieldOutput, NODAL, instance, labels, data)
+
+    """
+
+    # An Int specifying the number of bulk data blocks added to the field outputs.
+    blockCount: int = 0
+
+    # An Int specifying the number of rows of data added to the field outputs.
+    rowCount: int = 0
+
+    def __init__(self, odb):
+        self.odb = odb
+        # The arrays waiting to be added by field output block and by history output
+        self._blocks = {}
+        self._histories = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        # The data are not added if the block of the with statement failed
+        if excType is None:
+            self.flush()
+        else:
+            self.discard()
+
+    def addData(
+        self,
+        fieldOutput: FieldOutput,
+        position: SymbolicConstant,
+        instance: OdbInstance,
+        labels: typing.Sequence[int],
+        data: typing.Sequence[typing.Sequence[float]],
+        sectionPoint: SectionPoint = None,
+        conjugateData: typing.Sequence[typing.Sequence[float]] = None,
+        localCoordSystem: typing.Sequence = None,
+    ):
+        """This method adds data to a field output when the writer is flushed, see
+        :py:meth:`~abaqus.Odb.FieldOutput.FieldOutput.addData`.
+
+        Parameters
+        ----------
+        fieldOutput
+            A :py:class:`~abaqus.Odb.FieldOutput.FieldOutput` object.
+        position
+            A SymbolicConstant specifying the position of the output, e.g., NODAL or
+            INTEGRATION_POINT.
+        instance
+            An :py:class:`~abaqus.Odb.OdbInstance.OdbInstance` object specifying the namespace
+            for labels.
+        labels
+            A sequence of Ints specifying the labels of the nodes or elements.
+        data
+            An array of shape (rows, components) specifying the values. If there is more than
+            one row per label, e.g., one row per integration point, the rows of a label are
+            consecutive.
+        sectionPoint
+            A :py:class:`~abaqus.Odb.SectionPoint.SectionPoint` object specifying the location
+            in the section.
+        conjugateData
+            An array of the shape of *data* specifying the imaginary part of complex values.
+        localCoordSystem
+            A 3 × 3 array or an array of shape (rows, 3, 3) specifying the direction cosines of
+            the local coordinate systems.
+
+        Raises
+        ------
+        ValueError
+            If the shape of the data does not match the type of the field output or the number
+            of labels.
+        """
+        labels = numpy.asarray(labels, numpy.int64).reshape(-1)
+        data, conjugateData, localCoordSystem = _blockArrays(fieldOutput, labels, data, conjugateData, localCoordSystem)
+        if not len(labels):
+            return
+        key = (id(fieldOutput), position, id(instance), _sectionPointKey(sectionPoint))
+        pending = self._blocks.get(key)
+        if pending is None:
+            pending = self._blocks[key] = _PendingBlock(fieldOutput, position, instance, sectionPoint, len(data) // len(labels))
+        elif len(data) != pending.rowsPerLabel * len(labels):
+            raise ValueError("The data of {} must have {} rows per label".format(fieldOutput.name, pending.rowsPerLabel))
+        if localCoordSystem is not None and localCoordSystem.ndim == 2:
+            localCoordSystem = numpy.broadcast_to(localCoordSystem, (len(data), 3, 3))
+        pending.append(labels, data, conjugateData, localCoordSystem)
+
+    def addSetData(
+        self,
+        fieldOutput: FieldOutput,
+        position: SymbolicConstant,
+        set: OdbSet,
+        data: typing.Sequence[typing.Sequence[float]],
+        sectionPoint: SectionPoint = None,
+        conjugateData: typing.Sequence[typing.Sequence[float]] = None,
+    ):
+        """This method adds data at the members of an instance-level set to a field output when
+        the writer is flushed, the rows of *data* are in the order of the members of the set.
+        """
+        instance, labels = _setInstanceLabels(self.odb, set)
+        self.addData(fieldOutput, position, instance, labels, data, sectionPoint, conjugateData)
+
+    def addHistoryData(self, historyOutput: HistoryOutput, frame, value):
+        """This method adds data to a history output when the writer is flushed.
+
+        Parameters
+        ----------
+        historyOutput
+            A :py:class:`~abaqus.Odb.HistoryOutput.HistoryOutput` object.
+        frame
+            A Float or an array of Floats specifying the frame values.
+        value
+            A Float or an array of Floats specifying the values at the frame values.
+
+        Raises
+        ------
+        ValueError
+            If the lengths of *frame* and *value* are not the same.
+        """
+        frame = numpy.asarray(frame, numpy.float64).reshape(-1)
+        value = numpy.asarray(value, numpy.float64).reshape(-1)
+        if len(frame) != len(value):
+            raise ValueError("The frame values and the values of {} do not have the same length".format(historyOutput.name))
+        pending = self._histories.setdefault(id(historyOutput), (historyOutput, [], []))
+        pending[1].append(frame)
+        pending[2].append(value)
+
+    def flush(self):
+        """This method adds the data collected to the field outputs and the history outputs.
+
+        Raises
+        ------
+        ValueError
+            If the data of a block are not valid, e.g., a label is added twice. Nothing is added
+            and the data collected are kept.
+        """
+        # Every block is built before one is added
+        blocks = [(pending.fieldOutput, pending.block()) for pending in self._blocks.values()]
+        histories = [
+            (historyOutput, numpy.concatenate(frames), numpy.concatenate(values))
+            for historyOutput, frames, values in self._histories.values()
+        ]
+        self.discard()
+        for fieldOutput, block in blocks:
+            fieldOutput._addBlock(block)
+            self.blockCount += 1
+            self.rowCount += len(block.data)
+        for historyOutput, frames, values in histories:
+            historyOutput.addData(frames, values)
+
+    def discard(self):
+        """This method discards the data collected since the last flush."""
+        self._blocks.clear()
+        self._histories.clear()
+
+    def __repr__(self):
+        return "<BulkWriter {} blocks and {} history outputs pending>".format(len(self._blocks), len(self._histories))
+
+
+class _PendingBlock:
+    """The arrays added to a bulk data block."""
+
+    def __init__(self, fieldOutput, position, instance, sectionPoint, rowsPerLabel):
+        self.fieldOutput = fieldOutput
+        self.position = position
+        self.instance = instance
+        self.sectionPoint = sectionPoint
+        self.rowsPerLabel = rowsPerLabel
+        self.arrays = ([], [], [], [])
+
+    def append(self, *arrays):
+        for pieces, array in zip(self.arrays, arrays):
+            if array is not None:
+                pieces.append(array)
+
+    def block(self) -> FieldBulkData:
+        if any(pieces and len(pieces) != len(self.arrays[0]) for pieces in self.arrays):
+            raise ValueError("The conjugate data or the local coordinate systems of {} are not given for every call".format(self.fieldOutput.name))
+        labels, data, conjugateData, localCoordSystem = (
+            numpy.concatenate(pieces) if pieces else None for pieces in self.arrays
+        )
+        return fieldBlock(
+            self.fieldOutput, self.position, self.instance, labels, data, self.sectionPoint, conjugateData, localCoordSystem
+        )
+
+
+def fieldBlock(
+    fieldOutput: FieldOutput,
+    position: SymbolicConstant,
+    instance: OdbInstance,
+    labels,
+    data,
+    sectionPoint: SectionPoint = None,
+    conjugateData=None,
+    localCoordSystem=None,
+) -> FieldBulkData:
+    """This function returns the bulk data block of data added to a field output, the rows are
+    sorted by label.
+
+    Raises
+    ------
+    ValueError
+        If the shape of the data does not match the type of the field output or the number of
+        labels, or if a label is repeated.
+    """
+    labels = numpy.asarray(labels, numpy.int64).reshape(-1)
+    data, conjugateData, localCoordSystem = _blockArrays(fieldOutput, labels, data, conjugateData, localCoordSystem)
+    if len(labels) and numpy.any(labels[1:] < labels[:-1]):
+        order = numpy.argsort(labels, kind="stable")
+        labels = labels[order]
+        rows = len(data) // len(labels)
+        if rows > 1:
+            order = (order[:, None] * rows + numpy.arange(rows)).reshape(-1)
+        data = data[order]
+        conjugateData = conjugateData[order] if conjugateData is not None else None
+        if localCoordSystem is not None and localCoordSystem.ndim == 3:
+            localCoordSystem = localCoordSystem[order]
+    if len(labels) > 1 and numpy.any(labels[1:] == labels[:-1]):
+        raise ValueError("The labels of the data of {} are not unique".format(fieldOutput.name))
+
+    block = FieldBulkData()
+    block.position = position
+    block.type = fieldOutput.type
+    block.instance = instance
+    block.sectionPoint = sectionPoint
+    block.componentLabels = fieldOutput.componentLabels
+    block.data = data
+    block.precision = DOUBLE_PRECISION if data.dtype == numpy.float64 else SINGLE_PRECISION
+    rows = len(data) // len(labels) if len(labels) else 1
+    labels = numpy.repeat(labels, rows) if rows > 1 else labels
+    if position in NODAL_POSITIONS:
+        block.nodeLabels = labels
+    else:
+        block.elementLabels = labels
+        if position is INTEGRATION_POINT:
+            block.integrationPoints = numpy.tile(numpy.arange(1, rows + 1, dtype=numpy.int32), len(labels) // rows)
+    if conjugateData is not None:
+        block.conjugateData = conjugateData
+    if localCoordSystem is not None:
+        block.localCoordSystem = localCoordSystem
+    return block
+
+
+def _blockArrays(fieldOutput: FieldOutput, labels, data, conjugateData, localCoordSystem):
+    # The shapes are validated once for all the rows
+    components = max(len(fieldOutput.componentLabels), 1)
+    # As in Abaqus, the data are stored in double precision only if they are given as a float64
+    # array, the sequences of Python floats are stored in single precision
+    dtype = numpy.float64 if isinstance(data, numpy.ndarray) and data.dtype == numpy.float64 else numpy.float32
+    data = numpy.asarray(data)
+    data = numpy.asarray(data, dtype).reshape(len(data), -1) if data.size else numpy.empty((0, components), dtype)
+    if data.shape[1] != components:
+        raise ValueError(
+            "The data of {} must have {} components, not {}".format(fieldOutput.name, components, data.shape[1])
+        )
+    if len(labels) and len(data) % len(labels):
+        raise ValueError("The data of {} must have the same number of rows for each label".format(fieldOutput.name))
+    if len(data) and not len(labels):
+        raise ValueError("The data of {} have no labels".format(fieldOutput.name))
+    if conjugateData is not None:
+        conjugateData = numpy.asarray(conjugateData, dtype).reshape(data.shape)
+    if localCoordSystem is not None:
+        if fieldOutput.type is SCALAR:
+            raise ValueError("Transformation not allowed for scalar data.")
+        # The direction cosines are transposed before they are stored
+        localCoordSystem = numpy.asarray(localCoordSystem, numpy.float64)
+        if localCoordSystem.shape not in ((3, 3), (len(data), 3, 3)):
+            raise ValueError("The local coordinate system of {} must be a 3 x 3 matrix per row".format(fieldOutput.name))
+        localCoordSystem = numpy.ascontiguousarray(numpy.swapaxes(localCoordSystem, -1, -2))
+    return data, conjugateData, localCoordSystem
+
+
+def _setInstanceLabels(odb, odbSet: OdbSet) -> tuple[OdbInstance, numpy.ndarray]:
+    if len(odbSet.instanceNames) > 1:
+        raise ValueError("Entities from multiple instances present in set.")
+    instance = odbSet.instances if isinstance(odbSet.instances, OdbInstance) else None
+    instanceName = odbSet.instanceNames[0] if odbSet.instanceNames else getattr(instance, "name", "")
+    if not instanceName:
+        # The labels of an instance-level set read from a results store are stored by instance
+        stored = odbSet.__dict__.get("_nodeLabels") or odbSet.__dict__.get("_elementLabels") or {}
+        if len(stored) == 1:
+            instanceName = next(iter(stored))
+    if instance is None and odb is not None:
+        instance = odb.rootAssembly.instances.get(instanceName)
+    member, labels = setLabels(odbSet, instanceName)
+    if labels is None:
+        raise ValueError("The set {} has no members".format(odbSet.name))
+    return instance, labels
+
+
+def _sectionPointKey(sectionPoint: SectionPoint):
+    if sectionPoint is None:
+        return None
+    return sectionPoint.number, sectionPoint.description
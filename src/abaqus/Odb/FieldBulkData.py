@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .OdbInstance import OdbInstance
 from .OdbPart import OdbPart
 from .SectionPoint import SectionPoint
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class FieldBulkData:
@@ -24,6 +25,11 @@ class FieldBulkData:
         A SymbolicConstant specifying the output type. Possible values are SCALAR, VECTOR,
         TENSOR_3D_FULL, TENSOR_3D_PLANAR, TENSOR_3D_SURFACE, TENSOR_2D_PLANAR, and
         TENSOR_2D_SURFACE.
+    precision: SymbolicConstant
+        A SymbolicConstant specifying the precision of the output in the element. Possible
+        values are SINGLE_PRECISION and DOUBLE_PRECISION.
+    baseElementType: str
+        A String specifying the base element type of the elements in the block.
     instance: OdbInstance
         An :py:class:`~abaqus.Odb.OdbInstance.OdbInstance` object specifying the part to which the labels belong.
     sectionPoint: SectionPoint
@@ -93,9 +99,16 @@ class FieldBulkData:
     # TENSOR_2D_SURFACE.
     type: SymbolicConstant = None
 
+    # A SymbolicConstant specifying the precision of the output in the element. Possible
+    # values are SINGLE_PRECISION and DOUBLE_PRECISION.
+    precision: SymbolicConstant = SINGLE_PRECISION
+
+    # A String specifying the base element type of the elements in the block.
+    baseElementType: str = ""
+
     # An OdbInstance object specifying the part to which the labels belong.
-    instance: OdbInstance = OdbInstance(
-        "instance", OdbPart("part", THREE_D, DEFORMABLE_BODY)
+    instance: OdbInstance = lazyDefault(
+        lambda: OdbInstance("instance", OdbPart("part", THREE_D, DEFORMABLE_BODY))
     )
 
     # A SectionPoint object specifying the section point number of the current block of data.
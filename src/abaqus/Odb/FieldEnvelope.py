@@ -0,0 +1,207 @@
+import typing
+
+import numpy
+
+from abaqusConstants import *
+from .FieldBulkData import FieldBulkData
+from .FieldInvariants import blockInvariant
+from .FieldOutput import FieldOutput, _BULK_VALUES
+
+
+class FieldEnvelope:
+    """The FieldEnvelope object computes the maximum or the minimum of an output variable over
+    a sequence of fields, e.g., the field output of every frame of a step, and the index of the
+    field of the extreme value. The fields are added one at a time and only the running extreme
+    values and their indexes are kept, so that the memory used does not depend on the number of
+    fields.
+
+    Attributes
+    ----------
+    maximum: Boolean
+        A Boolean specifying whether the maximum or the minimum is computed.
+    invariant: SymbolicConstant
+        A SymbolicConstant specifying the invariant of the fields, or None.
+    componentLabel: str
+        A String specifying the component of the fields, or an empty string.
+    count: int
+        An Int specifying the number of fields added.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.Odb.FieldEnvelope import FieldEnvelope
+
+    """
+
+    # A Boolean specifying whether the maximum or the minimum is computed.
+    maximum: Boolean = ON
+
+    # A SymbolicConstant specifying the invariant of the fields, or None.
+    invariant: SymbolicConstant = None
+
+    # A String specifying the component of the fields, or an empty string.
+    componentLabel: str = ""
+
+    # An Int specifying the number of fields added.
+    count: int = 0
+
+    def __init__(self, maximum: Boolean = ON, invariant: SymbolicConstant = None, componentLabel: str = ""):
+        """This method creates a FieldEnvelope object.
+
+        Parameters
+        ----------
+        maximum
+            A Boolean specifying whether the maximum or the minimum is computed. The default
+            value is ON.
+        invariant
+            A SymbolicConstant specifying the invariant of the fields, e.g., MISES.
+        componentLabel
+            A String specifying the component of the fields, e.g., "S11". If neither
+            *invariant* nor *componentLabel* is given, the fields must be SCALAR fields.
+        """
+        self.maximum = maximum
+        self.invariant = invariant
+        self.componentLabel = componentLabel
+        self._field = None
+        # The extreme values and the indexes of their fields for each bulk data block
+        self._values = []
+        self._indexes = []
+
+    def add(self, field: FieldOutput):
+        """This method adds a field to the envelope.
+
+        Parameters
+        ----------
+        field
+            A :py:class:`~abaqus.Odb.FieldOutput.FieldOutput` object with the same bulk data
+            blocks, in the same order, as the fields added before.
+
+        Raises
+        ------
+        ValueError
+            If the field does not have the invariant or the component, or if its bulk data
+            blocks do not match the fields added before.
+        """
+        columns = [self._column(field, block) for block in field.bulkDataBlocks]
+        if self._field is None:
+            self._field = field
+            self._values = [numpy.array(values) for values in columns]
+            self._indexes = [numpy.zeros(len(values), numpy.int32) for values in columns]
+        else:
+            if [len(values) for values in columns] != [len(values) for values in self._values]:
+                raise ValueError("The bulk data blocks of {} do not match the previous fields".format(field.name))
+            compare = numpy.greater if self.maximum else numpy.less
+            for values, indexes, column in zip(self._values, self._indexes, columns):
+                # The first field of equal values is kept
+                mask = compare(column, values)
+                numpy.copyto(values, column, where=mask, casting="unsafe")
+                indexes[mask] = self.count
+        self.count += 1
+
+    def extend(self, fields: typing.Iterable[FieldOutput]):
+        """This method adds the fields of an iterable to the envelope, e.g., a generator of the
+        field outputs of the frames of a step, so that only one field is used at a time."""
+        for field in fields:
+            self.add(field)
+
+    def fieldOutputs(self) -> tuple[FieldOutput, FieldOutput]:
+        """This method returns the envelope of the fields added.
+
+        Returns
+        -------
+        tuple[FieldOutput, FieldOutput]
+            A sequence of two SCALAR FieldOutput objects. The first one contains the extreme
+            values. The second one contains the index of the field containing the extreme value,
+            in the order in which the fields were added.
+
+        Raises
+        ------
+        ValueError
+            If no field was added.
+        """
+        field = self._field
+        if field is None:
+            raise ValueError("No field was added to the envelope")
+        quantity = str(self.invariant) if self.invariant is not None else self.componentLabel or field.name
+        kind = "Maximum" if self.maximum else "Minimum"
+        envelope = FieldOutput(field.name, "{} of {}".format(kind, quantity), SCALAR)
+        index = FieldOutput(field.name, "Field index of the {} of {}".format(kind.lower(), quantity), SCALAR)
+        for fieldOutput in (envelope, index):
+            fieldOutput.isComplex = OFF
+            fieldOutput.locations.extend(field.locations)
+        for block, values, indexes in zip(field.bulkDataBlocks, self._values, self._indexes):
+            envelope.bulkDataBlocks.append(_scalarBlock(block, values))
+            index.bulkDataBlocks.append(_scalarBlock(block, indexes))
+        return envelope, index
+
+    def _column(self, field: FieldOutput, block: FieldBulkData) -> numpy.ndarray:
+        # The conjugate data are ignored
+        if self.invariant is not None:
+            if self.invariant not in field.validInvariants:
+                raise ValueError("{} is not a valid invariant of {}".format(self.invariant, field.name))
+            return blockInvariant(block, self.invariant, field.isEngineeringTensor)
+        data = numpy.asarray(block.data)
+        data = data.reshape(len(data), -1)
+        if self.componentLabel:
+            labels = block.componentLabels or field.componentLabels
+            if self.componentLabel not in labels:
+                raise ValueError("{} is not a component of {}".format(self.componentLabel, field.name))
+            return data[:, list(labels).index(self.componentLabel)]
+        if field.type is not SCALAR and data.shape[1] != 1:
+            raise ValueError("The envelope of {} requires an invariant or a component".format(field.name))
+        return data[:, 0]
+
+
+def envelope(
+    fields: typing.Iterable[FieldOutput],
+    invariant: SymbolicConstant = None,
+    componentLabel: str = "",
+    maximum: Boolean = ON,
+) -> tuple[FieldOutput, FieldOutput]:
+    """This function returns the maximum or the minimum of an output variable over an iterable
+    of fields and the index of the field of the extreme value, see :py:class:`FieldEnvelope`.
+    """
+    fieldEnvelope = FieldEnvelope(maximum, invariant, componentLabel)
+    fieldEnvelope.extend(fields)
+    return fieldEnvelope.fieldOutputs()
+
+
+def stepEnvelope(
+    step, name: str, invariant: SymbolicConstant = None, componentLabel: str = "", maximum: Boolean = ON
+) -> tuple[FieldOutput, FieldOutput]:
+    """This function returns the maximum or the minimum of a field output over the frames of a
+    step and the index of the frame of the extreme value. The frames are used one at a time.
+
+    Parameters
+    ----------
+    step
+        An :py:class:`~abaqus.Odb.OdbStep.OdbStep` object.
+    name
+        A String specifying the name of the field output, e.g., "S".
+    invariant
+        A SymbolicConstant specifying the invariant of the field output, e.g., MISES.
+    componentLabel
+        A String specifying the component of the field output, e.g., "S11".
+    maximum
+        A Boolean specifying whether the maximum or the minimum is computed. The default value
+        is ON.
+
+    Returns
+    -------
+    tuple[FieldOutput, FieldOutput]
+        A sequence of two SCALAR FieldOutput objects with the extreme values and the index of
+        the frame of each extreme value.
+    """
+    return envelope((frame.fieldOutputs[name] for frame in step.frames), invariant, componentLabel, maximum)
+
+
+def _scalarBlock(block: FieldBulkData, values: numpy.ndarray) -> FieldBulkData:
+    scalar = FieldBulkData()
+    scalar.__dict__.update((key, value) for key, value in block.__dict__.items() if key not in _BULK_VALUES)
+    scalar.type = SCALAR
+    scalar.componentLabels = ()
+    scalar.data = values.reshape(len(values), 1)
+    return scalar
@@ -0,0 +1,278 @@
+import numbers
+import typing
+
+from abaqusConstants import *
+from .FieldBulkData import FieldBulkData
+from .FieldOutput import FieldOutput, _BULK_VALUES
+from .FieldValueArray import FieldValueArray
+
+# The number of rows of the bulk data blocks evaluated at a time, the temporary arrays of a chunk
+# are small enough to stay in the cache of the processor
+CHUNK_SIZE = 16384
+
+# The number of operands of the numpy functions used by the expressions
+OPERATORS = {
+    "add": 2,
+    "subtract": 2,
+    "multiply": 2,
+    "true_divide": 2,
+    "power": 2,
+    "negative": 1,
+    "positive": 1,
+    "absolute": 1,
+    "sqrt": 1,
+    "exp": 1,
+    "log": 1,
+    "log10": 1,
+    "sin": 1,
+    "cos": 1,
+    "tan": 1,
+    "arcsin": 1,
+    "arccos": 1,
+    "arctan": 1,
+}
+
+
+class FieldExpression(FieldOutput):
+    """The FieldExpression object is a FieldOutput object computed from other FieldOutput objects
+    and numbers by arithmetic operators and mathematical functions, e.g., `f1 + 2*f2`. The
+    expression is not evaluated when it is created, its bulk data blocks are computed when they
+    or its values are first used, and a whole expression is evaluated in a single pass over the
+    bulk data blocks of its fields: the rows are evaluated by chunks, every operator of the
+    expression is applied to a chunk before the next chunk is read, and the subexpressions that
+    appear more than once are computed once.
+
+    The fields of an expression must have the same bulk data blocks, e.g., the field outputs of
+    the same variable in several frames. The conjugate data are ignored.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        import odbAccess
+        field = session.odbs[name].steps[name].frames[i].fieldOutputs[name]
+        expression = field + 2 * field
+
+    """
+
+    def __init__(self, operator: str, *operands):
+        if OPERATORS.get(operator) != len(operands):
+            raise ValueError("{} is not an operator with {} operands".format(operator, len(operands)))
+        fields = [operand for operand in operands if isinstance(operand, FieldOutput)]
+        if not fields:
+            raise ValueError("An expression requires a FieldOutput object")
+        # The metadata are those of the first field that is not SCALAR
+        field = next((field for field in fields if field.type is not SCALAR), fields[0])
+        self._initFromField(field)
+        self.isComplex = OFF
+        self.locations.extend(field.locations)
+        self.operator = operator
+        self.operands = operands
+
+    @property
+    def bulkDataBlocks(self) -> list[FieldBulkData]:
+        """A sequence of FieldBulkData objects computed when they are first used."""
+        blocks = self.__dict__.get("_bulkDataBlocks")
+        if blocks is None:
+            blocks = self.__dict__["_bulkDataBlocks"] = ExpressionPlan(self).evaluate()
+        return blocks
+
+    @property
+    def values(self) -> FieldValueArray:
+        """A FieldValueArray object of the values of the bulk data blocks."""
+        values = self.__dict__.get("_values")
+        if values is None:
+            values = self.__dict__["_values"] = FieldValueArray(
+                bulkDataBlocks=self.bulkDataBlocks,
+                validInvariants=self.validInvariants,
+                isEngineeringTensor=self.isEngineeringTensor,
+            )
+        return values
+
+    def isEvaluated(self) -> bool:
+        """This method returns whether the bulk data blocks of the expression are computed."""
+        return "_bulkDataBlocks" in self.__dict__
+
+    def explain(self) -> str:
+        """This method returns a description of the evaluation of the expression: its fields and
+        constants, the operators in the order in which they are applied to each chunk, and the
+        temporary arrays used."""
+        return ExpressionPlan(self).explain()
+
+    def __repr__(self):
+        return "<FieldExpression {}>".format(_format(self))
+
+
+class ExpressionPlan:
+    """The ExpressionPlan object is the sequence of operations evaluating a FieldExpression
+    object. Each distinct subexpression is an operation writing a register, the registers of the
+    fields are views of the rows of a chunk, and the registers of the operations are temporary
+    arrays of a chunk that are reused once their values are no longer used.
+    """
+
+    def __init__(self, expression: FieldExpression):
+        # The fields, the constants, and the operations by register
+        self.fields = {}
+        self.constants = {}
+        self.operations = []
+        self._registers = {}
+        self._expression = expression
+        self.result = self._register(expression)
+        widths = self._widths()
+        self.width = widths[self.result]
+        self.buffers = self._allocate(widths)
+
+    def _register(self, operand) -> int:
+        # The expressions that are already evaluated are used as fields
+        if isinstance(operand, FieldExpression) and (operand is self._expression or not operand.isEvaluated()):
+            operands = tuple(self._register(item) for item in operand.operands)
+            key = (operand.operator,) + operands
+        elif isinstance(operand, FieldOutput):
+            key = ("field", id(operand))
+        elif isinstance(operand, numbers.Real):
+            key = ("constant", float(operand))
+        else:
+            raise ValueError("{!r} is not a FieldOutput object or a number".format(operand))
+        # The common subexpressions are evaluated once
+        register = self._registers.get(key)
+        if register is None:
+            register = self._registers[key] = len(self._registers)
+            if key[0] == "field":
+                self.fields[register] = operand
+            elif key[0] == "constant":
+                self.constants[register] = key[1]
+            else:
+                self.operations.append((register, key[0], key[1:]))
+        return register
+
+    def _widths(self) -> dict:
+        widths = {register: 1 for register in self.constants}
+        for register, field in self.fields.items():
+            widths[register] = max(len(field.componentLabels), 1)
+        for register, operator, operands in self.operations:
+            width = {widths[operand] for operand in operands} - {1}
+            if len(width) > 1:
+                raise ValueError("The operands of {} have {} components".format(operator, sorted(width)))
+            widths[register] = width.pop() if width else 1
+        return widths
+
+    def _allocate(self, widths: dict) -> dict:
+        # The temporary array of an operation is released after the last operation using it,
+        # the result of the last operation is written to the output
+        lastUse = {}
+        for index, (register, operator, operands) in enumerate(self.operations):
+            for operand in operands:
+                lastUse[operand] = index
+        buffers, free, count = {}, {}, 0
+        for index, (register, operator, operands) in enumerate(self.operations):
+            if register != self.result:
+                pool = free.setdefault(widths[register], [])
+                if pool:
+                    buffers[register] = pool.pop()
+                else:
+                    buffers[register] = (count, widths[register])
+                    count += 1
+            for operand in set(operands):
+                if lastUse.get(operand) == index and operand in buffers:
+                    free.setdefault(buffers[operand][1], []).append(buffers[operand])
+        return buffers
+
+    def evaluate(self) -> list[FieldBulkData]:
+        """This method computes the bulk data blocks of the expression."""
+        import numpy
+
+        fields = list(self.fields.values())
+        reference = next((field for field in fields if field.type is not SCALAR), fields[0])
+        counts = {tuple(len(block.data) for block in field.bulkDataBlocks) for field in fields}
+        if len(counts) > 1:
+            raise ValueError("The fields of the expression do not have the same bulk data blocks")
+        dtype = numpy.result_type(
+            numpy.float32, *(numpy.asarray(block.data).dtype for field in fields for block in field.bulkDataBlocks)
+        )
+        if dtype.kind != "f":
+            dtype = numpy.dtype(numpy.float64)
+        functions = {register: getattr(numpy, operator) for register, operator, operands in self.operations}
+        temporaries = {}
+        for register, (number, width) in self.buffers.items():
+            if number not in temporaries:
+                temporaries[number] = numpy.empty((CHUNK_SIZE, width), dtype)
+        constants = {register: dtype.type(value) for register, value in self.constants.items()}
+
+        blocks = []
+        for index, block in enumerate(reference.bulkDataBlocks):
+            inputs = {}
+            for register, field in self.fields.items():
+                data = numpy.asarray(field.bulkDataBlocks[index].data)
+                inputs[register] = data.reshape(len(data), -1)
+            rows = len(block.data)
+            output = numpy.empty((rows, self.width), dtype)
+            for start in range(0, rows, CHUNK_SIZE):
+                stop = min(start + CHUNK_SIZE, rows)
+                values = dict(constants)
+                values.update((register, data[start:stop]) for register, data in inputs.items())
+                if self.result in values:
+                    output[start:stop] = values[self.result]
+                    continue
+                for register, operator, operands in self.operations:
+                    if register == self.result:
+                        out = output[start:stop]
+                    else:
+                        out = temporaries[self.buffers[register][0]][: stop - start]
+                    values[register] = functions[register](*(values[operand] for operand in operands), out=out)
+            blocks.append(_resultBlock(block, output, self.width))
+        return blocks
+
+    def explain(self) -> str:
+        """This method returns a description of the plan."""
+        uses = {}
+        for register, operator, operands in self.operations:
+            for operand in operands:
+                uses[operand] = uses.get(operand, 0) + 1
+        lines = [
+            "fused evaluation in 1 pass, chunks of {} rows, {} operations, {} temporary arrays".format(
+                CHUNK_SIZE, len(self.operations), len({number for number, width in self.buffers.values()})
+            )
+        ]
+        for register, field in self.fields.items():
+            lines.append("  %{} = field {} ({}, {} components)".format(register, field.name, field.type, max(len(field.componentLabels), 1)))
+        for register, value in self.constants.items():
+            lines.append("  %{} = constant {!r}".format(register, value))
+        for register, operator, operands in self.operations:
+            line = "  %{} = {}({})".format(register, operator, ", ".join("%{}".format(operand) for operand in operands))
+            target = "output" if register == self.result else "temporary {}".format(self.buffers[register][0])
+            reused = ", reused {} times".format(uses[register]) if uses.get(register, 0) > 1 else ""
+            lines.append("{:40s} -> {}{}".format(line, target, reused))
+        return "\n".join(lines)
+
+
+def _resultBlock(block: FieldBulkData, data, width: int) -> FieldBulkData:
+    result = FieldBulkData()
+    result.__dict__.update((key, value) for key, value in block.__dict__.items() if key not in _BULK_VALUES)
+    result.data = data
+    result.precision = DOUBLE_PRECISION if data.dtype.itemsize == 8 else SINGLE_PRECISION
+    if width == 1 and len(block.componentLabels) > 1:
+        result.type = SCALAR
+        result.componentLabels = ()
+    else:
+        result.componentLabels = block.componentLabels
+    return result
+
+
+def _format(operand) -> str:
+    if isinstance(operand, FieldExpression) and not operand.isEvaluated():
+        return "{}({})".format(operand.operator, ", ".join(_format(item) for item in operand.operands))
+    if isinstance(operand, FieldOutput):
+        return operand.name
+    return repr(operand)
+
+
+def expression(operator: str, *operands) -> typing.Union[FieldExpression, float]:
+    """This function returns the FieldExpression object applying a numpy function to operands,
+    or the number computed by the function if no operand is a FieldOutput object."""
+    if any(isinstance(operand, FieldOutput) for operand in operands):
+        return FieldExpression(operator, *operands)
+    import numpy
+
+    return float(getattr(numpy, operator)(*operands))
@@ -0,0 +1,204 @@
+import numpy
+
+from abaqusConstants import *
+from .FieldBulkData import FieldBulkData
+
+# The rows of the symmetric 3 × 3 tensor (11, 22, 33, 12, 13, 23) given by the components of each
+# tensor type, the missing components are zero
+TENSOR_COMPONENTS = {
+    TENSOR_3D_FULL: (0, 1, 2, 3, 4, 5),
+    TENSOR_3D_PLANAR: (0, 1, 2, 3),
+    TENSOR_3D_SURFACE: (0, 1, 3),
+    TENSOR_2D_PLANAR: (0, 1, 2, 3),
+    TENSOR_2D_SURFACE: (0, 1, 3),
+}
+
+# The members of the FieldValue object holding the invariants
+INVARIANT_MEMBERS = {
+    MAGNITUDE: "magnitude",
+    MISES: "mises",
+    TRESCA: "tresca",
+    PRESS: "press",
+    INV3: "inv3",
+    MAX_PRINCIPAL: "maxPrincipal",
+    MID_PRINCIPAL: "midPrincipal",
+    MIN_PRINCIPAL: "minPrincipal",
+    MAX_INPLANE_PRINCIPAL: "maxInPlanePrincipal",
+    MIN_INPLANE_PRINCIPAL: "minInPlanePrincipal",
+    OUTOFPLANE_PRINCIPAL: "outOfPlanePrincipal",
+}
+
+# The invariants of the in-plane components, which are only defined for planar and surface tensors
+IN_PLANE_INVARIANTS = (MAX_INPLANE_PRINCIPAL, MIN_INPLANE_PRINCIPAL, OUTOFPLANE_PRINCIPAL)
+
+
+def tensorComponents(data, type: SymbolicConstant, isEngineeringTensor: Boolean = OFF) -> numpy.ndarray:
+    """This function returns the components 11, 22, 33, 12, 13, and 23 of the tensors of a
+    bulk data array in double precision, one column per component.
+
+    Parameters
+    ----------
+    data
+        An array of Floats with one row per value and one column per component of *type*.
+    type
+        A SymbolicConstant specifying the tensor type. Possible values are TENSOR_3D_FULL,
+        TENSOR_3D_PLANAR, TENSOR_3D_SURFACE, TENSOR_2D_PLANAR, and TENSOR_2D_SURFACE.
+    isEngineeringTensor
+        A Boolean specifying whether the shear components are engineering shear components,
+        which are halved.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of Floats of shape (n, 6).
+
+    Raises
+    ------
+    ValueError
+        If *type* is not a tensor type or if the number of columns does not match it.
+    """
+    if type not in TENSOR_COMPONENTS:
+        raise ValueError("{} is not a tensor type".format(type))
+    columns = TENSOR_COMPONENTS[type]
+    data = numpy.asarray(data, numpy.float64).reshape(len(data), -1)
+    if data.shape[1] != len(columns):
+        raise ValueError("The data of a {} tensor have {} components".format(type, len(columns)))
+    tensors = numpy.zeros((len(data), 6))
+    tensors[:, columns] = data
+    if isEngineeringTensor:
+        tensors[:, 3:] *= 0.5
+    return tensors
+
+
+def principalValues(tensors: numpy.ndarray) -> numpy.ndarray:
+    """This function returns the principal values of symmetric 3 × 3 tensors in decreasing
+    order, computed in closed form from the invariants of the deviatoric tensors.
+
+    Parameters
+    ----------
+    tensors
+        An array of Floats of shape (n, 6) with the components 11, 22, 33, 12, 13, and 23.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of Floats of shape (n, 3).
+    """
+    s11, s22, s33, s12, s13, s23 = tensors.T
+    mean = (s11 + s22 + s33) / 3.0
+    d11, d22, d33 = s11 - mean, s22 - mean, s33 - mean
+    # The norm of the deviatoric tensor scaled so that its eigenvalues are 2 cos(angle)
+    scale = numpy.sqrt((d11 * d11 + d22 * d22 + d33 * d33 + 2.0 * (s12 * s12 + s13 * s13 + s23 * s23)) / 6.0)
+    determinant = d11 * (d22 * d33 - s23 * s23) - s12 * (s12 * d33 - s23 * s13) + s13 * (s12 * s23 - d22 * s13)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        ratio = numpy.where(scale > 0.0, determinant / (2.0 * scale**3), 0.0)
+    angle = numpy.arccos(numpy.clip(ratio, -1.0, 1.0)) / 3.0
+    values = numpy.empty((len(tensors), 3))
+    values[:, 0] = mean + 2.0 * scale * numpy.cos(angle)
+    values[:, 2] = mean + 2.0 * scale * numpy.cos(angle + 2.0 * numpy.pi / 3.0)
+    values[:, 1] = 3.0 * mean - values[:, 0] - values[:, 2]
+    return values
+
+
+def tensorInvariant(tensors: numpy.ndarray, invariant: SymbolicConstant, principals: numpy.ndarray = None) -> numpy.ndarray:
+    """This function returns an invariant of symmetric 3 × 3 tensors.
+
+    Parameters
+    ----------
+    tensors
+        An array of Floats of shape (n, 6) with the components 11, 22, 33, 12, 13, and 23.
+    invariant
+        A SymbolicConstant specifying the invariant. Possible values are MISES, TRESCA, PRESS,
+        INV3, MAX_PRINCIPAL, MID_PRINCIPAL, MIN_PRINCIPAL, MAX_INPLANE_PRINCIPAL,
+        MIN_INPLANE_PRINCIPAL, and OUTOFPLANE_PRINCIPAL.
+    principals
+        An array of Floats of shape (n, 3) specifying the principal values of the tensors, they
+        are computed if they are required and not given.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of Floats of shape (n,).
+
+    Raises
+    ------
+    ValueError
+        If *invariant* is not an invariant of a tensor.
+    """
+    s11, s22, s33, s12, s13, s23 = tensors.T
+    if invariant is MISES:
+        return numpy.sqrt(
+            0.5 * ((s11 - s22) ** 2 + (s22 - s33) ** 2 + (s33 - s11) ** 2) + 3.0 * (s12 * s12 + s13 * s13 + s23 * s23)
+        )
+    if invariant is PRESS:
+        return -(s11 + s22 + s33) / 3.0
+    if invariant is INV3:
+        mean = (s11 + s22 + s33) / 3.0
+        d11, d22, d33 = s11 - mean, s22 - mean, s33 - mean
+        determinant = d11 * (d22 * d33 - s23 * s23) - s12 * (s12 * d33 - s23 * s13) + s13 * (s12 * s23 - d22 * s13)
+        return numpy.cbrt(13.5 * determinant)
+    if invariant in (MAX_INPLANE_PRINCIPAL, MIN_INPLANE_PRINCIPAL):
+        radius = numpy.hypot(0.5 * (s11 - s22), s12)
+        return 0.5 * (s11 + s22) + (radius if invariant is MAX_INPLANE_PRINCIPAL else -radius)
+    if invariant is OUTOFPLANE_PRINCIPAL:
+        return s33.copy()
+    if invariant in (TRESCA, MAX_PRINCIPAL, MID_PRINCIPAL, MIN_PRINCIPAL):
+        if principals is None:
+            principals = principalValues(tensors)
+        if invariant is TRESCA:
+            return principals[:, 0] - principals[:, 2]
+        return principals[:, (MAX_PRINCIPAL, MID_PRINCIPAL, MIN_PRINCIPAL).index(invariant)].copy()
+    raise ValueError("{} is not an invariant of a tensor".format(invariant))
+
+
+def blockInvariant(block: FieldBulkData, invariant: SymbolicConstant, isEngineeringTensor: Boolean = OFF) -> numpy.ndarray:
+    """This function returns an invariant of the values of a bulk data block. The invariants
+    are computed for the whole block when they are first used and are kept by the block, the
+    principal values are computed once for all the principal invariants.
+
+    Parameters
+    ----------
+    block
+        A :py:class:`~abaqus.Odb.FieldBulkData.FieldBulkData` object of VECTOR or tensor type.
+    invariant
+        A SymbolicConstant specifying the invariant. Possible values are MAGNITUDE, MISES, TRESCA,
+        PRESS, INV3, MAX_PRINCIPAL, MID_PRINCIPAL, MIN_PRINCIPAL, MAX_INPLANE_PRINCIPAL,
+        MIN_INPLANE_PRINCIPAL, and OUTOFPLANE_PRINCIPAL.
+    isEngineeringTensor
+        A Boolean specifying whether the shear components are engineering shear components.
+
+    Returns
+    -------
+    numpy.ndarray
+        A read-only array of Floats with one value per row of the block, in the precision of the
+        block.
+
+    Raises
+    ------
+    ValueError
+        If *invariant* is not an invariant of the type of the block.
+    """
+    cache = block.__dict__.setdefault("_invariants", {})
+    key = (invariant, bool(isEngineeringTensor))
+    if key in cache:
+        return cache[key]
+    data = numpy.asarray(block.data)
+    dtype = data.dtype if data.dtype.kind == "f" else numpy.float64
+    if invariant is MAGNITUDE:
+        if block.type is not VECTOR:
+            raise ValueError("MAGNITUDE is an invariant of a VECTOR field")
+        values = numpy.sqrt(numpy.square(data.reshape(len(data), -1), dtype=numpy.float64).sum(axis=1))
+    else:
+        if invariant in IN_PLANE_INVARIANTS and block.type is TENSOR_3D_FULL:
+            raise ValueError("{} is not an invariant of a TENSOR_3D_FULL field".format(invariant))
+        tensors = tensorComponents(data, block.type, isEngineeringTensor)
+        principals = None
+        if invariant in (TRESCA, MAX_PRINCIPAL, MID_PRINCIPAL, MIN_PRINCIPAL):
+            principals = cache.get((None, key[1]))
+            if principals is None:
+                principals = cache[(None, key[1])] = principalValues(tensors)
+        values = tensorInvariant(tensors, invariant, principals)
+    values = values.astype(dtype, copy=False)
+    values.flags.writeable = False
+    cache[key] = values
+    return values
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .SectionPointArray import SectionPointArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class FieldLocation:
@@ -41,4 +42,4 @@ class FieldLocation:
     position: SymbolicConstant = None
 
     # A SectionPointArray object.
-    sectionPoints: SectionPointArray = SectionPointArray()
+    sectionPoints: SectionPointArray = lazyDefault(SectionPointArray)
@@ -1,12 +1,28 @@
 import typing
 
 from abaqusConstants import *
+from .FieldBulkData import FieldBulkData
 from .FieldLocation import FieldLocation
 from .FieldLocationArray import FieldLocationArray
 from .FieldValueArray import FieldValueArray
 from .OdbInstance import OdbInstance
 from .OdbSet import OdbSet
 from .SectionPoint import SectionPoint
+from ..LazyDefault.LazyDefault import lazyDefault
+
+# The suffixes of the default component labels of each output type
+COMPONENT_SUFFIXES = {
+    SCALAR: (),
+    VECTOR: ("1", "2", "3"),
+    TENSOR_3D_FULL: ("11", "22", "33", "12", "13", "23"),
+    TENSOR_3D_PLANAR: ("11", "22", "33", "12"),
+    TENSOR_3D_SURFACE: ("11", "22", "12"),
+    TENSOR_2D_PLANAR: ("11", "22", "33", "12"),
+    TENSOR_2D_SURFACE: ("11", "22", "12"),
+}
+
+# The members of a bulk data block that are not copied to the blocks of a scalar field
+_BULK_VALUES = ("data", "conjugateData", "mises", "componentLabels", "_invariants")
 
 
 class FieldOutput:
@@ -14,6 +30,21 @@ class FieldOutput:
 
     Attributes
     ----------
+    name: str
+        A String specifying the output variable name.
+    description: str
+        A String specifying the output variable.
+    type: SymbolicConstant
+        A SymbolicConstant specifying the output type. Possible values are SCALAR, VECTOR,
+        TENSOR_3D_FULL, TENSOR_3D_PLANAR, TENSOR_3D_SURFACE, TENSOR_2D_PLANAR, and
+        TENSOR_2D_SURFACE.
+    componentLabels: tuple
+        A sequence of Strings specifying the labels for each component of the value.
+    validInvariants: tuple
+        A sequence of SymbolicConstants specifying which invariants should be calculated for
+        this field.
+    isEngineeringTensor: Boolean
+        A Boolean specifying whether the field is an engineering tensor or not.
     dim: int
         An Int specifying the dimension of vector or the first dimension (number of rows) of
         matrix.
@@ -23,6 +54,10 @@ class FieldOutput:
         A Boolean specifying whether the data are complex.
     locations: FieldLocationArray
         A :py:class:`~abaqus.Odb.FieldLocationArray.FieldLocationArray` object.
+    bulkDataBlocks: list[FieldBulkData]
+        A sequence of :py:class:`~abaqus.Odb.FieldBulkData.FieldBulkData` objects specifying the
+        field data by blocks of nodes or elements of the same type. The data of a field output
+        read from a results store are numpy arrays mapped from the file, they are not copied.
     values: FieldValueArray
         A :py:class:`~.FieldValueArray` object specifying :py:class:`~.the` order of :py:class:`~.the` objects in
         :py:class:`~.the` array is determined
@@ -42,6 +77,27 @@ class FieldOutput:
 
     """
 
+    # A String specifying the output variable name.
+    name: str = ""
+
+    # A String specifying the output variable.
+    description: str = ""
+
+    # A SymbolicConstant specifying the output type. Possible values are SCALAR, VECTOR,
+    # TENSOR_3D_FULL, TENSOR_3D_PLANAR, TENSOR_3D_SURFACE, TENSOR_2D_PLANAR, and
+    # TENSOR_2D_SURFACE.
+    type: SymbolicConstant = None
+
+    # A sequence of Strings specifying the labels for each component of the value.
+    componentLabels: tuple = ()
+
+    # A sequence of SymbolicConstants specifying which invariants should be calculated for
+    # this field.
+    validInvariants: tuple = ()
+
+    # A Boolean specifying whether the field is an engineering tensor or not.
+    isEngineeringTensor: Boolean = OFF
+
     # An Int specifying the dimension of vector or the first dimension (number of rows) of
     # matrix.
     dim: int = None
@@ -53,7 +109,11 @@ class FieldOutput:
     isComplex: Boolean = OFF
 
     # A FieldLocationArray object.
-    locations: FieldLocationArray = FieldLocationArray()
+    locations: FieldLocationArray = lazyDefault(FieldLocationArray)
+
+    # A sequence of FieldBulkData objects specifying the field data by blocks of nodes or
+    # elements of the same type.
+    bulkDataBlocks: list[FieldBulkData] = lazyDefault(list[FieldBulkData])
 
     # A FieldValueArray object specifying the order of the objects in the array is determined
     # by the Abaqus Scripting Interface; see the *data* argument to the addData method for a
@@ -145,7 +205,45 @@ class FieldOutput:
         pass
 
     def __init__(self, *args, **kwargs):
-        pass
+        if isinstance(kwargs.get("field", args[0] if args else None), FieldOutput):
+            self._initFromField(*args, **kwargs)
+        else:
+            self._init(*args, **kwargs)
+        # The values are created from the blocks when they are used
+        self.values = FieldValueArray(
+            bulkDataBlocks=self.bulkDataBlocks,
+            validInvariants=self.validInvariants,
+            isEngineeringTensor=self.isEngineeringTensor,
+        )
+
+    def _init(
+        self,
+        name: str,
+        description: str,
+        type: SymbolicConstant,
+        componentLabels: tuple = (),
+        validInvariants: SymbolicConstant = None,
+        isEngineeringTensor: Boolean = OFF,
+    ):
+        self.name = name
+        self.description = description
+        self.type = type
+        self.componentLabels = tuple(componentLabels) or tuple(
+            name + suffix for suffix in COMPONENT_SUFFIXES.get(type, ())
+        )
+        self.validInvariants = tuple(validInvariants or ())
+        self.isEngineeringTensor = isEngineeringTensor
+
+    def _initFromField(self, field: "FieldOutput", name: str = "", description: str = ""):
+        self.name = name or field.name
+        self.description = description or field.description
+        self.type = field.type
+        self.componentLabels = field.componentLabels
+        self.validInvariants = field.validInvariants
+        self.isEngineeringTensor = field.isEngineeringTensor
+        self.isComplex = field.isComplex
+        self.dim = field.dim
+        self.dim2 = field.dim2
 
     @typing.overload
     def addData(
@@ -293,7 +391,92 @@ class FieldOutput:
         pass
 
     def addData(self, *args, **kwargs):
-        pass
+        from .BulkWriter import _setInstanceLabels, fieldBlock
+
+        field = kwargs.get("field", args[0] if len(args) == 1 else None)
+        if isinstance(field, FieldOutput):
+            self._addField(field)
+            return
+        if "set" in kwargs or (len(args) > 1 and isinstance(args[1], OdbSet)):
+            names = ("position", "set", "data", "sectionPoint", "conjugateData")
+        else:
+            names = ("position", "instance", "labels", "data", "sectionPoint", "localCoordSystem")
+        arguments = dict(zip(names, args), **kwargs)
+        odbSet = arguments.pop("set", None)
+        if odbSet is not None:
+            arguments["instance"], arguments["labels"] = _setInstanceLabels(None, odbSet)
+        self._addBlock(fieldBlock(self, **arguments))
+
+    def _addField(self, field: "FieldOutput"):
+        # The bulk data blocks of an expression are evaluated in one pass when they are added
+        if max(len(field.componentLabels), 1) != max(len(self.componentLabels), 1):
+            raise ValueError("The type of {} does not match the type of {}".format(field.name, self.name))
+        for location in field.locations:
+            if location not in self.locations:
+                self.locations.append(location)
+        self.bulkDataBlocks.extend(field.bulkDataBlocks)
+
+    def _addBlock(self, block: FieldBulkData):
+        location = next((location for location in self.locations if location.position is block.position), None)
+        if location is None:
+            location = FieldLocation()
+            location.position = block.position
+            self.locations.append(location)
+        sectionPoint = block.sectionPoint
+        if sectionPoint is not None and not any(
+            point.number == sectionPoint.number and point.description == sectionPoint.description
+            for point in location.sectionPoints
+        ):
+            location.sectionPoints.append(sectionPoint)
+        if len(block.conjugateData):
+            self.isComplex = ON
+        self.bulkDataBlocks.append(block)
+
+    def _operation(self, operator: str, *operands):
+        from .FieldExpression import FieldExpression
+
+        if not all(isinstance(operand, (FieldOutput, int, float)) for operand in operands):
+            return NotImplemented
+        return FieldExpression(operator, *operands)
+
+    def __add__(self, other):
+        return self._operation("add", self, other)
+
+    def __radd__(self, other):
+        return self._operation("add", other, self)
+
+    def __sub__(self, other):
+        return self._operation("subtract", self, other)
+
+    def __rsub__(self, other):
+        return self._operation("subtract", other, self)
+
+    def __mul__(self, other):
+        return self._operation("multiply", self, other)
+
+    def __rmul__(self, other):
+        return self._operation("multiply", other, self)
+
+    def __truediv__(self, other):
+        return self._operation("true_divide", self, other)
+
+    def __rtruediv__(self, other):
+        return self._operation("true_divide", other, self)
+
+    def __pow__(self, other):
+        return self._operation("power", self, other)
+
+    def __rpow__(self, other):
+        return self._operation("power", other, self)
+
+    def __neg__(self):
+        return self._operation("negative", self)
+
+    def __pos__(self):
+        return self._operation("positive", self)
+
+    def __abs__(self):
+        return self._operation("absolute", self)
 
     @typing.overload
     def getScalarField(self, invariant: SymbolicConstant):
@@ -335,8 +518,40 @@ class FieldOutput:
         """
         pass
 
-    def getScalarField(self, *args, **kwargs):
-        pass
+    def getScalarField(self, invariant: SymbolicConstant = None, componentLabel: str = ""):
+        # The invariants are computed for whole bulk data blocks and kept by the blocks, the
+        # components are views of the columns of the blocks
+        import numpy
+
+        if invariant is not None:
+            from .FieldInvariants import blockInvariant
+
+            if invariant not in self.validInvariants:
+                raise ValueError("{} is not a valid invariant of {}".format(invariant, self.name))
+            scalar = FieldOutput(self.name, self.description, SCALAR)
+            columns = [blockInvariant(block, invariant, self.isEngineeringTensor) for block in self.bulkDataBlocks]
+        elif componentLabel:
+            if componentLabel not in self.componentLabels:
+                raise ValueError("{} is not a component of {}".format(componentLabel, self.name))
+            column = self.componentLabels.index(componentLabel)
+            scalar = FieldOutput(componentLabel, self.description, SCALAR)
+            columns = [
+                numpy.asarray(block.data).reshape(len(block.data), -1)[:, column] for block in self.bulkDataBlocks
+            ]
+        else:
+            raise ValueError("getScalarField requires an invariant or a componentLabel")
+        scalar.isComplex = OFF
+        scalar.locations.extend(self.locations)
+        for block, values in zip(self.bulkDataBlocks, columns):
+            bulkData = FieldBulkData()
+            bulkData.__dict__.update(
+                (key, value) for key, value in block.__dict__.items() if key not in _BULK_VALUES
+            )
+            bulkData.type = SCALAR
+            bulkData.componentLabels = ()
+            bulkData.data = values.reshape(len(values), 1)
+            scalar.bulkDataBlocks.append(bulkData)
+        return scalar
 
     @typing.overload
     def getSubset(self, position: SymbolicConstant = None, readOnly: Boolean = OFF):
@@ -493,8 +708,67 @@ class FieldOutput:
         """
         pass
 
-    def getSubset(self, *args, **kwargs):
-        pass
+    def getSubset(
+        self,
+        position: SymbolicConstant = None,
+        readOnly: Boolean = OFF,
+        region=None,
+        localCoordSystem: tuple = None,
+        sectionPoint: SectionPoint = None,
+        location: FieldLocation = None,
+        elementType: str = "",
+    ):
+        # The values are not extrapolated to another position, the blocks of the requested
+        # position are selected, and the rows of a block in a region are read from the indexes of
+        # the instance shared by every frame
+        import numpy
+
+        from .OdbMeshElement import OdbMeshElement
+        from .OdbMeshNode import OdbMeshNode
+        from .RegionIndex import regionIndex, subsetBlock
+
+        if localCoordSystem is not None:
+            raise ValueError("getSubset does not select the values by local coordinate system")
+        if location is not None:
+            position = location.position
+            if len(location.sectionPoints):
+                sectionPoint = location.sectionPoints[0]
+
+        subset = FieldOutput(self)
+        subset.locations.extend(loc for loc in self.locations if position is None or loc.position is position)
+        for block in self.bulkDataBlocks:
+            if position is not None and block.position is not position:
+                continue
+            if elementType and block.baseElementType != elementType:
+                continue
+            if sectionPoint is not None and (
+                block.sectionPoint is None or block.sectionPoint.number != sectionPoint.number
+            ):
+                continue
+            if region is None:
+                subset.bulkDataBlocks.append(block)
+                continue
+            if isinstance(region, OdbInstance):
+                if block.instance is region:
+                    subset.bulkDataBlocks.append(block)
+                continue
+            if isinstance(region, OdbMeshElement):
+                if block.instance is None or block.instance.name != region.instanceName:
+                    continue
+                rows = numpy.flatnonzero(numpy.asarray(block.elementLabels) == region.label)
+            elif isinstance(region, OdbMeshNode):
+                if block.instance is None or block.instance.name != region.instanceName:
+                    continue
+                if not len(block.nodeLabels):
+                    continue
+                rows = numpy.flatnonzero(numpy.asarray(block.nodeLabels) == region.label)
+            else:
+                if block.instance is None:
+                    continue
+                rows = regionIndex(block.instance).rows(region, block)
+            if len(rows):
+                subset.bulkDataBlocks.append(subsetBlock(block, rows))
+        return subset
 
     @typing.overload
     def getTransformedField(
@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .OdbInstance import OdbInstance
 from .OdbPart import OdbPart
 from .SectionPoint import SectionPoint
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class FieldValue:
@@ -231,8 +232,8 @@ class FieldValue:
     outOfPlanePrincipal: float = None
 
     # An OdbInstance object specifying the part to which the labels belong.
-    instance: OdbInstance = OdbInstance(
-        "instance", OdbPart("part", THREE_D, DEFORMABLE_BODY)
+    instance: OdbInstance = lazyDefault(
+        lambda: OdbInstance("instance", OdbPart("part", THREE_D, DEFORMABLE_BODY))
     )
 
     # A SectionPoint object.
@@ -1,5 +1,159 @@
+import bisect
+import typing
+
+from abaqusConstants import *
 from .FieldValue import FieldValue
 
+# The number of FieldValue objects created at a time when a bulk data block is iterated
+CHUNK_SIZE = 4096
+
+
+class FieldValueArray(typing.Sequence[FieldValue]):
+    """The FieldValueArray object is a sequence of FieldValue objects. The *values* member of a
+    FieldOutput object reads the bulk data blocks of the field output, the FieldValue objects
+    are created only when they are indexed or iterated, and they are not kept by this object.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        import odbAccess
+        session.odbs[name].steps[name].frames[i].fieldOutputs[name].values
+
+    """
+
+    def __init__(
+        self,
+        values: typing.Iterable[FieldValue] = (),
+        bulkDataBlocks: list = None,
+        validInvariants: tuple = (),
+        isEngineeringTensor: Boolean = OFF,
+    ):
+        self._values = list(values)
+        self._blocks = bulkDataBlocks
+        # The invariants of the values, the field output is not referenced so that it is not
+        # kept in a reference cycle with its values
+        self._invariants = (tuple(validInvariants), isEngineeringTensor)
+        # The index of the first value of each block, blocks may be added after this object is
+        # created
+        self._offsets = [0]
+
+    def _update(self):
+        offsets = self._offsets
+        for block in self._blocks[len(offsets) - 1 :]:
+            offsets.append(offsets[-1] + len(block.data))
+
+    def __len__(self):
+        if self._blocks is None:
+            return len(self._values)
+        self._update()
+        return self._offsets[-1]
+
+    def __getitem__(self, index):
+        if self._blocks is None:
+            if isinstance(index, slice):
+                return FieldValueArray(self._values[index])
+            return self._values[index]
+        if isinstance(index, slice):
+            return FieldValueArray(self[i] for i in range(*index.indices(len(self))))
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("FieldValueArray index out of range")
+        blockIndex = bisect.bisect_right(self._offsets, index) - 1
+        row = index - self._offsets[blockIndex]
+        return fieldValues(self._blocks[blockIndex], row, row + 1, *self._invariants)[0]
+
+    def __iter__(self):
+        if self._blocks is None:
+            yield from self._values
+            return
+        for block in list(self._blocks):
+            for start in range(0, len(block.data), CHUNK_SIZE):
+                yield from fieldValues(block, start, start + CHUNK_SIZE, *self._invariants)
+
+    def __repr__(self):
+        return "<FieldValueArray of {} FieldValue objects>".format(len(self))
+
+
+def fieldValues(
+    block, start: int = 0, stop: int = None, invariants: tuple = (), isEngineeringTensor: Boolean = OFF
+) -> list[FieldValue]:
+    """This function creates the FieldValue objects of the rows *start* to *stop* of a bulk data
+    block. The invariants of the values are read from the invariants of the whole block, which
+    are computed once.
+
+    Parameters
+    ----------
+    block
+        A :py:class:`~abaqus.Odb.FieldBulkData.FieldBulkData` object.
+    start
+        An Int specifying the first row.
+    stop
+        An Int specifying the row after the last row, the default is the end of the block.
+    invariants
+        A sequence of SymbolicConstants specifying the invariants set in the FieldValue objects,
+        those that are not defined for the type of the block are ignored.
+    isEngineeringTensor
+        A Boolean specifying whether the shear components are engineering shear components.
+
+    Returns
+    -------
+    list[FieldValue]
+        A list of FieldValue objects.
+    """
+    data = _rows(block.data, start, stop)
+    count = len(data)
+    elementLabels = _rows(block.elementLabels, start, stop) or [None] * count
+    nodeLabels = _rows(block.nodeLabels, start, stop) or [None] * count
+    integrationPoints = _rows(block.integrationPoints, start, stop) or [None] * count
+    conjugateData = _rows(block.conjugateData, start, stop)
+    mises = _rows(block.mises, start, stop)
+    members = {}
+    if invariants and block.type is not SCALAR and count:
+        from .FieldInvariants import INVARIANT_MEMBERS, blockInvariant
+
+        for invariant in invariants:
+            try:
+                values = blockInvariant(block, invariant, isEngineeringTensor)
+            except ValueError:
+                continue
+            members[INVARIANT_MEMBERS[invariant]] = values[start:stop].tolist()
+    scalar = block.type is SCALAR
+    suffix = "Double" if block.precision is DOUBLE_PRECISION else ""
+    common = dict(
+        position=block.position,
+        precision=block.precision,
+        type=block.type,
+        instance=block.instance,
+        sectionPoint=block.sectionPoint,
+    )
+
+    values = []
+    for index, row in enumerate(data):
+        value = FieldValue()
+        attributes = value.__dict__
+        attributes.update(common)
+        attributes["elementLabel"] = elementLabels[index]
+        attributes["nodeLabel"] = nodeLabels[index]
+        attributes["integrationPoint"] = integrationPoints[index]
+        attributes["data" + suffix] = row[0] if scalar else tuple(row)
+        if conjugateData:
+            row = conjugateData[index]
+            attributes["conjugateData" + suffix] = row[0] if scalar else tuple(row)
+        if mises:
+            attributes["mises"] = mises[index]
+        for member, invariantValues in members.items():
+            attributes[member] = invariantValues[index]
+        values.append(value)
+    return values
+
 
-class FieldValueArray(list[FieldValue]):
-    pass
+def _rows(values, start: int, stop: int) -> list:
+    if values is None:
+        return []
+    values = values[start:stop]
+    return values.tolist() if hasattr(values, "tolist") else list(values)
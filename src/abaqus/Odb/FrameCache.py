@@ -0,0 +1,184 @@
+import collections
+import os
+import typing
+
+from abaqusConstants import *
+
+# The memory assumed if the physical memory of the machine is not known, in bytes
+DEFAULT_MEMORY = 4 * 1024**3
+
+
+class FrameCache:
+    """The FrameCache object keeps the field outputs of the frames of a results store that were
+    used last. The field outputs of a frame are decoded when the frame is first used and are
+    released when the size of the bulk data blocks of the cached frames exceeds *maxBytes*, the
+    frames used least recently are released first. A released frame is decoded again when it is
+    used.
+
+    Attributes
+    ----------
+    maxBytes: int
+        An Int specifying the maximum size in bytes of the bulk data blocks of the cached frames.
+    currentBytes: int
+        An Int specifying the size in bytes of the bulk data blocks of the cached frames.
+    hits: int
+        An Int specifying the number of times the field outputs of a frame were found in the
+        cache.
+    misses: int
+        An Int specifying the number of times the field outputs of a frame were decoded.
+    evictions: int
+        An Int specifying the number of times the field outputs of a frame were released.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.Odb.ResultsStore import frameCache
+        frameCache(session.odbs[name])
+
+    """
+
+    # An Int specifying the maximum size in bytes of the bulk data blocks of the cached frames.
+    maxBytes: int = 0
+
+    # An Int specifying the size in bytes of the bulk data blocks of the cached frames.
+    currentBytes: int = 0
+
+    # An Int specifying the number of times the field outputs of a frame were found in the
+    # cache.
+    hits: int = 0
+
+    # An Int specifying the number of times the field outputs of a frame were decoded.
+    misses: int = 0
+
+    # An Int specifying the number of times the field outputs of a frame were released.
+    evictions: int = 0
+
+    def __init__(self, maxBytes: int):
+        self.maxBytes = maxBytes
+        # The field outputs, their size, and the frame using them by key, the last entry is the
+        # most recently used
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def fieldOutputs(self, frame, key, load: typing.Callable, *args) -> dict:
+        """This method returns the field outputs of a frame from the cache, or decodes them with
+        *load*(\\*args) and adds them to the cache.
+
+        Parameters
+        ----------
+        frame
+            A weak reference to the :py:class:`~abaqus.Odb.OdbFrame.OdbFrame` object, its
+            *fieldOutputs* member is released with the cached field outputs.
+        key
+            A hashable object identifying the frame in the results store.
+        load
+            A function decoding the field outputs of the frame.
+
+        Returns
+        -------
+        dict[str, FieldOutput]
+            A repository of FieldOutput objects.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            entry[2] = frame
+            return entry[0]
+        self.misses += 1
+        fieldOutputs = load(*args)
+        size = fieldOutputsSize(fieldOutputs)
+        self._entries[key] = [fieldOutputs, size, frame, (load, args)]
+        self.currentBytes += size
+        self.evict()
+        return fieldOutputs
+
+    def evict(self, maxBytes: int = None):
+        """This method releases the least recently used frames until the size of the cached
+        frames is at most *maxBytes*, the default is the *maxBytes* member. The most recently
+        used frame is kept even if it is larger.
+        """
+        if maxBytes is None:
+            maxBytes = self.maxBytes
+        while self.currentBytes > maxBytes and len(self._entries) > 1:
+            self._release(next(iter(self._entries)))
+
+    def setValues(self, maxBytes: int):
+        """This method modifies the FrameCache object and releases the frames exceeding the new
+        size.
+
+        Parameters
+        ----------
+        maxBytes
+            An Int specifying the maximum size in bytes of the bulk data blocks of the cached
+            frames.
+        """
+        self.maxBytes = maxBytes
+        self.evict()
+
+    def clear(self):
+        """This method releases all the cached frames."""
+        for key in list(self._entries):
+            self._release(key)
+
+    def _release(self, key):
+        from ..LazyDefault.LazyDefault import deferAttribute
+
+        fieldOutputs, size, reference, (load, args) = self._entries.pop(key)
+        self.currentBytes -= size
+        self.evictions += 1
+        frame = reference()
+        if frame is not None and frame.__dict__.get("fieldOutputs") is fieldOutputs:
+            # The frame decodes its field outputs again when they are used
+            deferAttribute(frame, "fieldOutputs", self.fieldOutputs, reference, key, load, *args)
+
+    def __repr__(self):
+        return "<FrameCache {} frames {}/{} bytes hits={} misses={} evictions={}>".format(
+            len(self._entries), self.currentBytes, self.maxBytes, self.hits, self.misses, self.evictions
+        )
+
+
+def fieldOutputsSize(fieldOutputs: dict) -> int:
+    """This function returns the size in bytes of the arrays of the bulk data blocks of a
+    repository of FieldOutput objects."""
+    size = 0
+    for fieldOutput in fieldOutputs.values():
+        for block in fieldOutput.bulkDataBlocks:
+            for value in block.__dict__.values():
+                size += getattr(value, "nbytes", 0)
+    return size
+
+
+def cacheLimit(percentThreshold: float = 75.0, memoryLimit: float = None, reducedMemoryMode: Boolean = ON) -> int:
+    """This function returns the maximum size in bytes of a FrameCache object.
+
+    Parameters
+    ----------
+    percentThreshold
+        A Float specifying the percent of the memory used by the cache in reduced memory mode.
+        The default value is 75.0.
+    memoryLimit
+        A Float specifying the memory limit in megabytes, the default is the physical memory of
+        the machine.
+    reducedMemoryMode
+        A Boolean specifying whether the memory used by the cache is limited to
+        *percentThreshold*. If OFF, the cache may use all the memory. The default value is ON.
+
+    Returns
+    -------
+    int
+        An Int specifying the size in bytes.
+    """
+    if memoryLimit:
+        memory = int(memoryLimit * 1024**2)
+    else:
+        try:
+            memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        except (AttributeError, ValueError, OSError):
+            memory = DEFAULT_MEMORY
+    return int(memory * (percentThreshold / 100.0 if reducedMemoryMode else 1.0))
@@ -0,0 +1,133 @@
+import typing
+
+import numpy
+
+# The number of pairs allocated by the first append, the capacity is doubled when it is full
+INITIAL_CAPACITY = 64
+
+
+class HistoryBuffer(typing.Sequence[tuple[float, float]]):
+    """The HistoryBuffer object is a sequence of pairs (**frameValue**, **value**) stored in a
+    contiguous float64 array that grows by doubling its capacity, so that appending is amortized
+    O(1) and a pair costs 16 bytes. It is read as the tuple of pairs of the *data* member of a
+    HistoryOutput object, and its *times* and *values* members are numpy views of the columns
+    that are not copied.
+
+    Attributes
+    ----------
+    times: numpy.ndarray
+        A read-only array of Floats specifying the frame values.
+    values: numpy.ndarray
+        A read-only array of Floats specifying the values at the frame values.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        import odbAccess
+        session.odbs[name].steps[name].historyRegions[name].historyOutputs[name].data
+
+    """
+
+    def __init__(self, pairs: typing.Iterable = ()):
+        self._array = numpy.empty((0, 2), numpy.float64)
+        self._size = 0
+        pairs = numpy.asarray(pairs if isinstance(pairs, (numpy.ndarray, HistoryBuffer)) else list(pairs), numpy.float64)
+        if pairs.size:
+            if pairs.ndim != 2 or pairs.shape[1] != 2:
+                raise ValueError("The data must be a sequence of pairs of Floats")
+            self.extend(pairs[:, 0], pairs[:, 1])
+
+    def extend(self, times, values):
+        """This method appends pairs of frame values and values.
+
+        Parameters
+        ----------
+        times
+            A Float or an array of Floats specifying the frame values.
+        values
+            A Float or an array of Floats specifying the values.
+
+        Raises
+        ------
+        ValueError
+            If the lengths of *times* and *values* are not the same.
+        """
+        if isinstance(times, (int, float)) and isinstance(values, (int, float)):
+            self.append(times, values)
+            return
+        times = numpy.asarray(times, numpy.float64).reshape(-1)
+        values = numpy.asarray(values, numpy.float64).reshape(-1)
+        if len(times) != len(values):
+            raise ValueError("The lengths of frame and value are not the same")
+        size = self._size + len(times)
+        if size > len(self._array):
+            self._grow(size)
+        self._array[self._size : size, 0] = times
+        self._array[self._size : size, 1] = values
+        self._size = size
+
+    def append(self, time: float, value: float):
+        """This method appends a pair of a frame value and a value."""
+        size = self._size
+        if size == len(self._array):
+            self._grow(size + 1)
+        self._array[size] = time, value
+        self._size = size + 1
+
+    def _grow(self, size: int):
+        capacity = max(INITIAL_CAPACITY, len(self._array))
+        while capacity < size:
+            capacity *= 2
+        array = numpy.empty((capacity, 2), numpy.float64)
+        array[: self._size] = self._array[: self._size]
+        self._array = array
+
+    @property
+    def times(self) -> numpy.ndarray:
+        return self._view(0)
+
+    @property
+    def values(self) -> numpy.ndarray:
+        return self._view(1)
+
+    def _view(self, column: int) -> numpy.ndarray:
+        # The views are read-only, the buffer is modified only by appending
+        view = self._array[: self._size, column]
+        view.flags.writeable = False
+        return view
+
+    def __array__(self, dtype=None, copy=None):
+        array = self._array[: self._size]
+        return array.astype(dtype) if dtype is not None else array.copy()
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(map(tuple, self._array[: self._size][index].tolist()))
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("HistoryBuffer index out of range")
+        return tuple(self._array[index].tolist())
+
+    def __iter__(self):
+        return iter(tuple(map(tuple, self._array[: self._size].tolist())))
+
+    def __eq__(self, other):
+        if isinstance(other, (HistoryBuffer, tuple, list)):
+            return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+        return NotImplemented
+
+    def __add__(self, other):
+        return tuple(self) + tuple(other)
+
+    def __radd__(self, other):
+        return tuple(other) + tuple(self)
+
+    def __repr__(self):
+        return repr(tuple(self)) if self._size <= 6 else "<HistoryBuffer of {} pairs>".format(self._size)
@@ -17,6 +17,12 @@ class HistoryOutput:
         A tuple of pairs of Floats specifying the imaginary portion of a specified complex
         variable at each frame value (time, frequency, or mode). The pairs have the form
         (**frameValue**, **value**).
+    times: numpy.ndarray
+        A read-only array of Floats specifying the frame values of *data*, a view of the buffer
+        of *data* that is not copied.
+    values: numpy.ndarray
+        A read-only array of Floats specifying the values of *data*, a view of the buffer of
+        *data* that is not copied.
 
     Notes
     -----
@@ -32,12 +38,42 @@ class HistoryOutput:
     # A tuple of pairs of Floats specifying the pairs (*frameValue*, *value*) where
     # *frameValue* is either time, frequency, or mode and *value* is the value of the
     # specified variable at *frameValue*. (This value depends on the type of the variable.)
-    data: float = None
+    # The pairs are stored in a HistoryBuffer object read as a tuple.
+    @property
+    def data(self) -> "HistoryBuffer":
+        return self._buffer("_data")
+
+    @data.setter
+    def data(self, data: tuple):
+        self.__dict__["_data"] = _historyBuffer(data)
 
     # A tuple of pairs of Floats specifying the imaginary portion of a specified complex
     # variable at each frame value (time, frequency, or mode). The pairs have the form
-    # (*frameValue*, *value*).
-    conjugateData: float = None
+    # (*frameValue*, *value*). The pairs are stored in a HistoryBuffer object parallel to
+    # *data*, or None if the variable is not complex.
+    @property
+    def conjugateData(self) -> "HistoryBuffer":
+        return self.__dict__.get("_conjugateData")
+
+    @conjugateData.setter
+    def conjugateData(self, conjugateData: tuple):
+        self.__dict__["_conjugateData"] = _historyBuffer(conjugateData) if conjugateData is not None else None
+
+    # A read-only array of Floats specifying the frame values of *data*.
+    @property
+    def times(self):
+        return self._buffer("_data").times
+
+    # A read-only array of Floats specifying the values of *data*.
+    @property
+    def values(self):
+        return self._buffer("_data").values
+
+    def _buffer(self, name: str) -> "HistoryBuffer":
+        buffer = self.__dict__.get(name)
+        if buffer is None:
+            buffer = self.__dict__[name] = _historyBuffer()
+        return buffer
 
     def __init__(
         self,
@@ -73,7 +109,10 @@ class HistoryOutput:
         -------
             A HistoryOutput object.
         """
-        pass
+        self.name = name
+        self.description = description
+        self.type = type
+        self.validInvariants = tuple(validInvariants or ())
 
     @typing.overload
     def addData(self, frame: str, value: str):
@@ -123,4 +162,19 @@ class HistoryOutput:
         pass
 
     def addData(self, *args, **kwargs):
-        pass
+        # The pairs are appended to the buffer of data, its capacity is doubled when it is full
+        buffer = self._buffer("_data")
+        if len(args) == 2 and not kwargs:
+            buffer.extend(*args)
+        elif "data" in kwargs or (len(args) == 1 and "frame" not in kwargs):
+            data = _historyBuffer(kwargs.get("data", args[0] if args else ()))
+            buffer.extend(data.times, data.values)
+        else:
+            arguments = dict(zip(("frame", "value"), args), **kwargs)
+            buffer.extend(arguments["frame"], arguments["value"])
+
+
+def _historyBuffer(pairs=()) -> "HistoryBuffer":
+    from .HistoryBuffer import HistoryBuffer
+
+    return HistoryBuffer(pairs)
@@ -8,6 +8,7 @@ from .OdbMeshNode import OdbMeshNode
 from .OdbPart import OdbPart
 from .OdbSet import OdbSet
 from .SectionPoint import SectionPoint
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class HistoryPoint:
@@ -117,20 +118,20 @@ class HistoryPoint:
     position: SymbolicConstant = None
 
     # An OdbMeshElement object specifying the element for which the data are to be collected.
-    element: OdbMeshElement = OdbMeshElement()
+    element: OdbMeshElement = lazyDefault(OdbMeshElement)
 
     # A SectionPoint object.
     sectionPoint: SectionPoint = None
 
     # An OdbSet object specifying the region for which the data are to be collected.
-    region: OdbSet = OdbSet("set", tuple[OdbMeshNode]())
+    region: OdbSet = lazyDefault(lambda: OdbSet("set", tuple[OdbMeshNode]()))
 
     # An OdbAssembly object specifying the assembly for which the data are to be collected.
-    assembly: OdbAssembly = OdbAssembly()
+    assembly: OdbAssembly = lazyDefault(OdbAssembly)
 
     # An OdbInstance object specifying the instance for which the data are to be collected.
-    instance: OdbInstance = OdbInstance(
-        "instance", OdbPart("part", THREE_D, DEFORMABLE_BODY)
+    instance: OdbInstance = lazyDefault(
+        lambda: OdbInstance("instance", OdbPart("part", THREE_D, DEFORMABLE_BODY))
     )
 
     @typing.overload
@@ -3,6 +3,7 @@ import typing
 from abaqusConstants import *
 from .HistoryOutput import HistoryOutput
 from .HistoryPoint import HistoryPoint
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class HistoryRegion:
@@ -32,7 +33,7 @@ class HistoryRegion:
     position: SymbolicConstant = None
 
     # A repository of HistoryOutput objects.
-    historyOutputs: dict[str, HistoryOutput] = dict[str, HistoryOutput]()
+    historyOutputs: dict[str, HistoryOutput] = lazyDefault(dict[str, HistoryOutput])
 
     def __init__(
         self, name: str, description: str, point: HistoryPoint, loadCase: str = None
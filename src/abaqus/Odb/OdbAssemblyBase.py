@@ -8,6 +8,7 @@ from .OdbRigidBodyArray import OdbRigidBodyArray
 from .OdbSet import OdbSet
 from .SectionCategory import SectionCategory
 from ..Assembly.ConnectorOrientationArray import ConnectorOrientationArray
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Property.SectionAssignmentArray import SectionAssignmentArray
 from ..Section.Section import Section
 
@@ -54,37 +55,41 @@ class OdbAssemblyBase:
     """
 
     # A repository of OdbInstance objects.
-    instances: dict[str, OdbInstance] = dict[str, OdbInstance]()
+    instances: dict[str, OdbInstance] = lazyDefault(dict[str, OdbInstance])
 
     # A repository of OdbSet objects specifying node sets.
-    nodeSets: dict[str, OdbSet] = dict[str, OdbSet]()
+    nodeSets: dict[str, OdbSet] = lazyDefault(dict[str, OdbSet])
 
     # A repository of OdbSet objects specifying element sets.
-    elementSets: dict[str, OdbSet] = dict[str, OdbSet]()
+    elementSets: dict[str, OdbSet] = lazyDefault(dict[str, OdbSet])
 
     # A repository of OdbSet objects specifying surfaces.
-    surfaces: dict[str, OdbSet] = dict[str, OdbSet]()
+    surfaces: dict[str, OdbSet] = lazyDefault(dict[str, OdbSet])
 
     # An OdbMeshNodeArray object.
-    nodes: OdbMeshNodeArray = OdbMeshNodeArray()
+    nodes: OdbMeshNodeArray = lazyDefault(OdbMeshNodeArray)
 
     # An OdbMeshElementArray object.
-    elements: OdbMeshElementArray = OdbMeshElementArray()
+    elements: OdbMeshElementArray = lazyDefault(OdbMeshElementArray)
 
     # A repository of OdbDatumCsys objects.
-    datumCsyses: dict[str, OdbDatumCsys] = dict[str, OdbDatumCsys]()
+    datumCsyses: dict[str, OdbDatumCsys] = lazyDefault(dict[str, OdbDatumCsys])
 
     # A SectionAssignmentArray object.
-    sectionAssignments: SectionAssignmentArray = SectionAssignmentArray()
+    sectionAssignments: SectionAssignmentArray = lazyDefault(SectionAssignmentArray)
 
     # An OdbRigidBodyArray object.
-    rigidBodies: OdbRigidBodyArray = OdbRigidBodyArray()
+    rigidBodies: OdbRigidBodyArray = lazyDefault(OdbRigidBodyArray)
 
     # An OdbPretensionSectionArray object.
-    pretensionSections: OdbPretensionSectionArray = OdbPretensionSectionArray()
+    pretensionSections: OdbPretensionSectionArray = lazyDefault(
+        OdbPretensionSectionArray
+    )
 
     # A ConnectorOrientationArray object.
-    connectorOrientations: ConnectorOrientationArray = ConnectorOrientationArray()
+    connectorOrientations: ConnectorOrientationArray = lazyDefault(
+        ConnectorOrientationArray
+    )
 
     def ConnectorOrientation(
         self,
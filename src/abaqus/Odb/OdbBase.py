@@ -10,6 +10,7 @@ from ..Amplitude.Amplitude import Amplitude
 from ..BeamSectionProfile.Profile import Profile
 from ..CustomKernel.RepositorySupport import RepositorySupport
 from ..Filter.Filter import Filter
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Material.Material import Material
 from ..Section.Section import Section
 
@@ -19,6 +20,14 @@ class OdbBase:
 
     Attributes
     ----------
+    name: str
+        A String specifying the repository key.
+    analysisTitle: str
+        A String specifying the title of the output database.
+    description: str
+        A String specifying the description of the output database.
+    path: str
+        A String specifying the path to the file of the output database.
     isReadOnly: Boolean
         A Boolean specifying whether the output database was opened with read-only access.
     amplitudes: dict[str, Amplitude]
@@ -59,47 +68,61 @@ class OdbBase:
 
     """
 
+    # A String specifying the repository key.
+    name: str = ""
+
+    # A String specifying the title of the output database.
+    analysisTitle: str = ""
+
+    # A String specifying the description of the output database.
+    description: str = ""
+
+    # A String specifying the path to the file of the output database.
+    path: str = ""
+
     # A Boolean specifying whether the output database was opened with read-only access.
     isReadOnly: Boolean = OFF
 
     # A repository of Amplitude objects.
-    amplitudes: dict[str, Amplitude] = dict[str, Amplitude]()
+    amplitudes: dict[str, Amplitude] = lazyDefault(dict[str, Amplitude])
 
     # A repository of Filter objects.
-    filters: dict[str, Filter] = dict[str, Filter]()
+    filters: dict[str, Filter] = lazyDefault(dict[str, Filter])
 
     # An OdbAssembly object.
-    rootAssembly: OdbAssembly = OdbAssembly()
+    rootAssembly: OdbAssembly = lazyDefault(OdbAssembly)
 
     # A JobData object.
-    jobData: JobData = JobData()
+    jobData: JobData = lazyDefault(JobData)
 
     # A repository of OdbPart objects.
-    parts: dict[str, OdbPart] = dict[str, OdbPart]()
+    parts: dict[str, OdbPart] = lazyDefault(dict[str, OdbPart])
 
     # A repository of Material objects.
-    materials: dict[str, Material] = dict[str, Material]()
+    materials: dict[str, Material] = lazyDefault(dict[str, Material])
 
     # A repository of OdbStep objects.
-    steps: dict[str, OdbStep] = dict[str, OdbStep]()
+    steps: dict[str, OdbStep] = lazyDefault(dict[str, OdbStep])
 
     # A repository of Section objects.
-    sections: dict[str, Section] = dict[str, Section]()
+    sections: dict[str, Section] = lazyDefault(dict[str, Section])
 
     # A repository of SectionCategory objects.
-    sectionCategories: dict[str, SectionCategory] = dict[str, SectionCategory]()
+    sectionCategories: dict[str, SectionCategory] = lazyDefault(
+        dict[str, SectionCategory]
+    )
 
     # A SectorDefinition object.
-    sectorDefinition: SectorDefinition = SectorDefinition()
+    sectorDefinition: SectorDefinition = lazyDefault(SectorDefinition)
 
     # A UserData object.
-    userData: UserData = UserData()
+    userData: UserData = lazyDefault(UserData)
 
     # A RepositorySupport object.
-    customData: RepositorySupport = RepositorySupport()
+    customData: RepositorySupport = lazyDefault(RepositorySupport)
 
     # A repository of Profile objects.
-    profiles: dict[str, Profile] = dict[str, Profile]()
+    profiles: dict[str, Profile] = lazyDefault(dict[str, Profile])
 
     def __init__(
         self, name: str, analysisTitle: str = "", description: str = "", path: str = ""
@@ -132,11 +155,17 @@ class OdbBase:
         -------
             An Odb object.
         """
-        pass
+        self.name = name
+        self.analysisTitle = analysisTitle
+        self.description = description
+        self.path = path
 
     def close(self):
         """This method closes an output database."""
-        pass
+        # The arrays of an output database read from a results store are views of the mapped file
+        store = self.__dict__.pop("_resultsStore", None)
+        if store is not None:
+            store.close()
 
     def getFrame(self, frameValue: str, match: SymbolicConstant = CLOSEST):
         """This method returns the frame at the specified time, frequency, or mode. It will not
@@ -179,6 +208,20 @@ class OdbBase:
         """
         pass
 
+    def bulkWriter(self):
+        """This method returns a BulkWriter object adding numpy arrays of data to the field
+        outputs and the history outputs of the output database, the data added by many calls are
+        added as one bulk data block per field output, position, instance, and section point
+        when the writer is flushed, e.g., at the end of a with statement.
+
+        Returns
+        -------
+            A :py:class:`~abaqus.Odb.BulkWriter.BulkWriter` object.
+        """
+        from .BulkWriter import BulkWriter
+
+        return BulkWriter(self)
+
     def update(self):
         """This method is used to update an Odb object in memory while an Abaqus analysis writes
         data to the associated output database. update checks if additional steps have been
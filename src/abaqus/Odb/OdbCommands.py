@@ -10,6 +10,7 @@ example, over a number of load cases.
 - Open an existing output database file and create a new Odb object. 
 - Upgrade an output database file to the current release and write the upgraded output 
 database to a new file. 
+- Calculate mathematical functions of fields, see the FieldExpression object. 
 
 """
 
@@ -45,11 +46,19 @@ def isUpgradeRequiredForOdb(upgradeRequiredOdbPath: str):
     pass
 
 
-def maxEnvelop():
-    """Retrieve the maximum value of an output variable over a number of fields.
+def maxEnvelop(*args, **kwargs):
+    """Retrieve the maximum value of an output variable over a number of fields. The fields are
+    read one at a time and only the running maximum values and their indexes are kept, see
+    :py:class:`~abaqus.Odb.FieldEnvelope.FieldEnvelope`.
 
     Parameters
     ----------
+    fieldList
+        A sequence of FieldOutput objects, or an iterable such as a generator of the field
+        outputs of the frames of a step.
+    invariant
+        A SymbolicConstant specifying the invariant, or a String specifying the component label,
+        of the fields. It is required if the fields are not SCALAR fields.
 
     Returns
     -------
@@ -64,14 +73,22 @@ def maxEnvelop():
             - TypeError
           This function takes no keyword arguments.
     """
-    pass
+    return _envelop(ON, args, kwargs)
 
 
-def minEnvelop():
-    """Retrieve the minimum value of an output variable over a number of fields.
+def minEnvelop(*args, **kwargs):
+    """Retrieve the minimum value of an output variable over a number of fields. The fields are
+    read one at a time and only the running minimum values and their indexes are kept, see
+    :py:class:`~abaqus.Odb.FieldEnvelope.FieldEnvelope`.
 
     Parameters
     ----------
+    fieldList
+        A sequence of FieldOutput objects, or an iterable such as a generator of the field
+        outputs of the frames of a step.
+    invariant
+        A SymbolicConstant specifying the invariant, or a String specifying the component label,
+        of the fields. It is required if the fields are not SCALAR fields.
 
     Returns
     -------
@@ -86,7 +103,7 @@ def minEnvelop():
             - TypeError
           This function takes no keyword arguments.
     """
-    pass
+    return _envelop(OFF, args, kwargs)
 
 
 @typing.overload
@@ -176,6 +193,19 @@ def openOdb(name: str, *args, **kwargs):
     pass
 
 
+def _envelop(maximum: Boolean, args: tuple, kwargs: dict):
+    from .FieldEnvelope import envelope
+
+    if kwargs:
+        raise TypeError("This function takes no keyword arguments.")
+    if not 1 <= len(args) <= 2:
+        raise TypeError("This function takes a list of fields and an optional invariant or component label")
+    fieldList, invariant = (args + (None,))[:2]
+    if isinstance(invariant, str):
+        return envelope(fieldList, componentLabel=invariant, maximum=maximum)
+    return envelope(fieldList, invariant, maximum=maximum)
+
+
 def upgradeOdb(existingOdbPath: str, upgradedOdbPath: str):
     """This method upgrades an existing Odb object to the current release and writes the
     upgraded version of the Odb object to a file. In addition, Abaqus/CAE writes information
@@ -206,3 +236,80 @@ def upgradeOdb(existingOdbPath: str, upgradedOdbPath: str):
           OdbError: cannot convert database
     """
     pass
+
+
+def acos(field):
+    """Calculate the arccosine of a field or a number, see
+    :py:class:`~abaqus.Odb.FieldExpression.FieldExpression`."""
+    return _function("arccos", field)
+
+
+def asin(field):
+    """Calculate the arcsine of a field or a number."""
+    return _function("arcsin", field)
+
+
+def atan(field):
+    """Calculate the arctangent of a field or a number."""
+    return _function("arctan", field)
+
+
+def cos(field):
+    """Calculate the cosine of a field or a number."""
+    return _function("cos", field)
+
+
+def degreeToRadian(field):
+    """Convert a field or a number from degrees to radians."""
+    return _function("multiply", field, 0.017453292519943295)
+
+
+def exp(field):
+    """Calculate the natural exponential of a field or a number."""
+    return _function("exp", field)
+
+
+def exp10(field):
+    """Calculate the base 10 exponential of a field or a number."""
+    return _function("power", 10.0, field)
+
+
+def log(field):
+    """Calculate the natural logarithm of a field or a number."""
+    return _function("log", field)
+
+
+def log10(field):
+    """Calculate the base 10 logarithm of a field or a number."""
+    return _function("log10", field)
+
+
+def power(field, exponent):
+    """Raise a field or a number to a power."""
+    return _function("power", field, exponent)
+
+
+def radianToDegree(field):
+    """Convert a field or a number from radians to degrees."""
+    return _function("multiply", field, 57.29577951308232)
+
+
+def sin(field):
+    """Calculate the sine of a field or a number."""
+    return _function("sin", field)
+
+
+def sqrt(field):
+    """Calculate the square root of a field or a number."""
+    return _function("sqrt", field)
+
+
+def tan(field):
+    """Calculate the tangent of a field or a number."""
+    return _function("tan", field)
+
+
+def _function(operator: str, *operands):
+    from .FieldExpression import expression
+
+    return expression(operator, *operands)
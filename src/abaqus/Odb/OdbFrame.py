@@ -3,6 +3,7 @@ import typing
 from abaqusConstants import *
 from .FieldOutput import FieldOutput
 from .OdbLoadCase import OdbLoadCase
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class OdbFrame:
@@ -10,6 +11,15 @@ class OdbFrame:
 
     Attributes
     ----------
+    incrementNumber: int
+        An Int specifying the frame increment number within the step.
+    frameId: int
+        An Int specifying the index of the frame in the frame sequence of the step.
+    frameValue: float
+        A Float specifying the value in units determined by the **domain** member of the Step
+        object.
+    description: str
+        A String specifying the contents of the frame.
     cyclicModeNumber: int
         An Int specifying the cyclic mode number associated with the data stored on this frame.
         Only frequency analyses of cyclic symmetry models possess cyclic mode numbers.
@@ -41,6 +51,19 @@ class OdbFrame:
 
     """
 
+    # An Int specifying the frame increment number within the step.
+    incrementNumber: int = None
+
+    # An Int specifying the index of the frame in the frame sequence of the step.
+    frameId: int = None
+
+    # A Float specifying the value in units determined by the *domain* member of the Step
+    # object.
+    frameValue: float = None
+
+    # A String specifying the contents of the frame.
+    description: str = ""
+
     # An Int specifying the cyclic mode number associated with the data stored on this frame.
     # Only frequency analyses of cyclic symmetry models possess cyclic mode numbers.
     cyclicModeNumber: int = None
@@ -62,10 +85,10 @@ class OdbFrame:
 
     # A repository of FieldOutput objects specifying the key to the *fieldOutputs*repository
     # is a String representing an output variable.
-    fieldOutputs: dict[str, FieldOutput] = dict[str, FieldOutput]()
+    fieldOutputs: dict[str, FieldOutput] = lazyDefault(dict[str, FieldOutput])
 
     # An OdbLoadCase object specifying the load case for the frame.
-    loadCase: OdbLoadCase = OdbLoadCase("loadCase")
+    loadCase: OdbLoadCase = lazyDefault(OdbLoadCase, "loadCase")
 
     @typing.overload
     def __init__(self, incrementNumber: int, frameValue: float, description: str = ""):
@@ -159,6 +182,29 @@ class OdbFrame:
         """
         pass
 
+    def __init__(self, *args, **kwargs):
+        if isinstance(kwargs.get("loadCase", args[0] if args else None), OdbLoadCase):
+            self._initLoadCase(*args, **kwargs)
+        elif "mode" in kwargs:
+            self._initMode(*args, **kwargs)
+        else:
+            self._initIncrement(*args, **kwargs)
+
+    def _initIncrement(self, incrementNumber: int, frameValue: float, description: str = ""):
+        self.incrementNumber = incrementNumber
+        self.frameValue = frameValue
+        self.description = description
+
+    def _initMode(self, mode: int, frequency: float, description: str = ""):
+        self.incrementNumber = self.mode = mode
+        self.frameValue = self.frequency = frequency
+        self.description = description
+
+    def _initLoadCase(self, loadCase: OdbLoadCase, description: str = "", frequency: float = 0):
+        self.loadCase = loadCase
+        self.description = description
+        self.frequency = frequency
+
     def Frame(self, *args, **kwargs):
         pass
 
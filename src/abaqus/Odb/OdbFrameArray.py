@@ -1,6 +1,65 @@
+import typing
+import weakref
+
 from .OdbFrame import OdbFrame
 
 
-class OdbFrameArray(list[OdbFrame]):
+class OdbFrameArray(typing.MutableSequence[OdbFrame]):
+    """The OdbFrameArray object is a sequence of OdbFrame objects. The frames of a step read
+    from a results store are created by *loader* when they are indexed or iterated, and they
+    are kept only while they are used, so that iterating the frames of a long step does not
+    create all the frames and their field outputs at once.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        import odbAccess
+        session.odbs[name].steps[name].frames
+
+    """
+
+    def __init__(self, frames: typing.Iterable[OdbFrame] = (), length: int = 0, loader: typing.Callable = None):
+        # The frames added to the array, None for the frames created by the loader
+        self._frames = [None] * length + list(frames)
+        self._loader = loader
+        # The frames created by the loader that are used
+        self._loaded = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self._frames)
+        frame = self._frames[index]
+        if frame is None:
+            frame = self._loaded.get(index)
+            if frame is None:
+                frame = self._loaded[index] = self._loader(index)
+        return frame
+
+    def __setitem__(self, index, frame: OdbFrame):
+        self._frames[index] = frame
+
+    def __delitem__(self, index):
+        raise ValueError("The frames of a step cannot be deleted")
+
+    def insert(self, index: int, frame: OdbFrame):
+        if index < len(self._frames):
+            raise ValueError("Frames can only be added after the last frame of a step")
+        self._frames.append(frame)
+
+    def __iter__(self):
+        for index in range(len(self._frames)):
+            yield self[index]
+
+    def __repr__(self):
+        return "<OdbFrameArray of {} OdbFrame objects>".format(len(self))
+
     def findAt(self):
         pass
@@ -9,6 +9,7 @@ from .OdbPart import OdbPart
 from .OdbRigidBodyArray import OdbRigidBodyArray
 from .OdbSet import OdbSet
 from .RebarOrientationArray import RebarOrientationArray
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Property.MaterialOrientationArray import MaterialOrientationArray
 from ..Property.SectionAssignmentArray import SectionAssignmentArray
 from ..Section.Section import Section
@@ -87,37 +88,39 @@ class OdbInstanceBase:
     resultState: SymbolicConstant = PROPAGATED
 
     # An OdbMeshNodeArray object.
-    nodes: OdbMeshNodeArray = OdbMeshNodeArray()
+    nodes: OdbMeshNodeArray = lazyDefault(OdbMeshNodeArray)
 
     # An OdbMeshElementArray object.
-    elements: OdbMeshElementArray = OdbMeshElementArray()
+    elements: OdbMeshElementArray = lazyDefault(OdbMeshElementArray)
 
     # A repository of OdbSet objects specifying node sets.
-    nodeSets: dict[str, OdbSet] = dict[str, OdbSet]()
+    nodeSets: dict[str, OdbSet] = lazyDefault(dict[str, OdbSet])
 
     # A repository of OdbSet objects specifying element sets.
-    elementSets: dict[str, OdbSet] = dict[str, OdbSet]()
+    elementSets: dict[str, OdbSet] = lazyDefault(dict[str, OdbSet])
 
     # A repository of OdbSet objects specifying surfaces.
-    surfaces: dict[str, OdbSet] = dict[str, OdbSet]()
+    surfaces: dict[str, OdbSet] = lazyDefault(dict[str, OdbSet])
 
     # A SectionAssignmentArray object.
-    sectionAssignments: SectionAssignmentArray = SectionAssignmentArray()
+    sectionAssignments: SectionAssignmentArray = lazyDefault(SectionAssignmentArray)
 
     # An OdbRigidBodyArray object.
-    rigidBodies: OdbRigidBodyArray = OdbRigidBodyArray()
+    rigidBodies: OdbRigidBodyArray = lazyDefault(OdbRigidBodyArray)
 
     # A BeamOrientationArray object.
-    beamOrientations: BeamOrientationArray = BeamOrientationArray()
+    beamOrientations: BeamOrientationArray = lazyDefault(BeamOrientationArray)
 
     # A MaterialOrientationArray object.
-    materialOrientations: MaterialOrientationArray = MaterialOrientationArray()
+    materialOrientations: MaterialOrientationArray = lazyDefault(
+        MaterialOrientationArray
+    )
 
     # A RebarOrientationArray object.
-    rebarOrientations: RebarOrientationArray = RebarOrientationArray()
+    rebarOrientations: RebarOrientationArray = lazyDefault(RebarOrientationArray)
 
     # An AnalyticSurface object specifying analytic Surface defined on the instance.
-    analyticSurface: AnalyticSurface = AnalyticSurface()
+    analyticSurface: AnalyticSurface = lazyDefault(AnalyticSurface)
 
     def __init__(self, name: str, object: OdbPart, localCoordSystem: tuple = ()):
         """This method creates an OdbInstance object from an OdbPart object.
@@ -153,7 +156,9 @@ class OdbInstanceBase:
         -------
             An OdbInstance object.
         """
-        pass
+        self.name = name
+        self.type = object.type
+        self.embeddedSpace = object.embeddedSpace
 
     def assignBeamOrientation(
         self, region: str, method: SymbolicConstant, vector: tuple
@@ -248,7 +253,12 @@ class OdbInstanceBase:
             - If no element with the specified label exists:
               OdbError: Invalid element label
         """
-        pass
+        from .RegionIndex import regionIndex
+
+        row = int(regionIndex(self).elements.rows([label])[0])
+        if row < 0:
+            raise ValueError("Invalid element label")
+        return self.elements[row]
 
     def getNodeFromLabel(self, label: int):
         """This method is used to retrieved a node with a specific label from an instance object.
@@ -267,7 +277,12 @@ class OdbInstanceBase:
             - If no node with the specified label exists:
               OdbError: Invalid node label
         """
-        pass
+        from .RegionIndex import regionIndex
+
+        row = int(regionIndex(self).nodes.rows([label])[0])
+        if row < 0:
+            raise ValueError("Invalid node label")
+        return self.nodes[row]
 
     def assignSection(self, region: str, section: Section):
         """This method is used to assign a section to a region on an instance.
@@ -8,6 +8,8 @@ class OdbMeshNode:
     coordinates: float
         A tuple of Floats specifying the nodal coordinates in the global Cartesian coordinate
         system.
+    instanceName: str
+        A String specifying the instance name.
 
     Notes
     -----
@@ -37,3 +39,6 @@ class OdbMeshNode:
     # A tuple of Floats specifying the nodal coordinates in the global Cartesian coordinate
     # system.
     coordinates: float = None
+
+    # A String specifying the instance name.
+    instanceName: str = ""
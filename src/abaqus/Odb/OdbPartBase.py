@@ -11,6 +11,7 @@ from .OdbRigidBodyArray import OdbRigidBodyArray
 from .OdbSet import OdbSet
 from .RebarOrientationArray import RebarOrientationArray
 from .SectionCategory import SectionCategory
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Property.MaterialOrientationArray import MaterialOrientationArray
 from ..Property.SectionAssignmentArray import SectionAssignmentArray
 
@@ -21,6 +22,14 @@ class OdbPartBase:
 
     Attributes
     ----------
+    name: str
+        A String specifying the part name.
+    embeddedSpace: SymbolicConstant
+        A SymbolicConstant specifying the dimensionality of the Part object. Possible values are
+        THREE_D, TWO_D_PLANAR, and AXISYMMETRIC.
+    type: SymbolicConstant
+        A SymbolicConstant specifying the type of the Part object. Possible values are
+        DEFORMABLE_BODY and ANALYTIC_RIGID_SURFACE.
     nodes: OdbMeshNodeArray
         An :py:class:`~abaqus.Odb.OdbMeshNodeArray.OdbMeshNodeArray` object.
     elements: OdbMeshElementArray
@@ -55,38 +64,51 @@ class OdbPartBase:
 
     """
 
+    # A String specifying the part name.
+    name: str = ""
+
+    # A SymbolicConstant specifying the dimensionality of the Part object. Possible values are
+    # THREE_D, TWO_D_PLANAR, and AXISYMMETRIC.
+    embeddedSpace: SymbolicConstant = None
+
+    # A SymbolicConstant specifying the type of the Part object. Possible values are
+    # DEFORMABLE_BODY and ANALYTIC_RIGID_SURFACE.
+    type: SymbolicConstant = None
+
     # An OdbMeshNodeArray object.
-    nodes: OdbMeshNodeArray = OdbMeshNodeArray()
+    nodes: OdbMeshNodeArray = lazyDefault(OdbMeshNodeArray)
 
     # An OdbMeshElementArray object.
-    elements: OdbMeshElementArray = OdbMeshElementArray()
+    elements: OdbMeshElementArray = lazyDefault(OdbMeshElementArray)
 
     # A repository of OdbSet objects specifying node sets.
-    nodeSets: dict[str, OdbSet] = dict[str, OdbSet]()
+    nodeSets: dict[str, OdbSet] = lazyDefault(dict[str, OdbSet])
 
     # A repository of OdbSet objects specifying element sets.
-    elementSets: dict[str, OdbSet] = dict[str, OdbSet]()
+    elementSets: dict[str, OdbSet] = lazyDefault(dict[str, OdbSet])
 
     # A repository of OdbSet objects specifying surfaces.
-    surfaces: dict[str, OdbSet] = dict[str, OdbSet]()
+    surfaces: dict[str, OdbSet] = lazyDefault(dict[str, OdbSet])
 
     # A SectionAssignmentArray object.
-    sectionAssignments: SectionAssignmentArray = SectionAssignmentArray()
+    sectionAssignments: SectionAssignmentArray = lazyDefault(SectionAssignmentArray)
 
     # A BeamOrientationArray object.
-    beamOrientations: BeamOrientationArray = BeamOrientationArray()
+    beamOrientations: BeamOrientationArray = lazyDefault(BeamOrientationArray)
 
     # A MaterialOrientationArray object.
-    materialOrientations: MaterialOrientationArray = MaterialOrientationArray()
+    materialOrientations: MaterialOrientationArray = lazyDefault(
+        MaterialOrientationArray
+    )
 
     # A RebarOrientationArray object.
-    rebarOrientations: RebarOrientationArray = RebarOrientationArray()
+    rebarOrientations: RebarOrientationArray = lazyDefault(RebarOrientationArray)
 
     # An OdbRigidBodyArray object.
-    rigidBodies: OdbRigidBodyArray = OdbRigidBodyArray()
+    rigidBodies: OdbRigidBodyArray = lazyDefault(OdbRigidBodyArray)
 
     # An AnalyticSurface object specifying analytic Surface defined on the instance.
-    analyticSurface: AnalyticSurface = AnalyticSurface()
+    analyticSurface: AnalyticSurface = lazyDefault(AnalyticSurface)
 
     def __init__(
         self, name: str, embeddedSpace: SymbolicConstant, type: SymbolicConstant
@@ -117,7 +139,9 @@ class OdbPartBase:
         -------
             An OdbPart object.
         """
-        pass
+        self.name = name
+        self.embeddedSpace = embeddedSpace
+        self.type = type
 
     @typing.overload
     def addElements(
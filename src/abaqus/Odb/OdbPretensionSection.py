@@ -1,5 +1,6 @@
 from .OdbMeshNode import OdbMeshNode
 from .OdbSet import OdbSet
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class OdbPretensionSection:
@@ -29,13 +30,13 @@ class OdbPretensionSection:
     """
 
     # An OdbSet object specifying the node set containing the pretension node.
-    node: OdbSet = OdbSet("set", tuple[OdbMeshNode]())
+    node: OdbSet = lazyDefault(lambda: OdbSet("set", tuple[OdbMeshNode]()))
 
     # An OdbSet object specifying the element set that defines the pretension section.
-    element: OdbSet = OdbSet("set", tuple[OdbMeshNode]())
+    element: OdbSet = lazyDefault(lambda: OdbSet("set", tuple[OdbMeshNode]()))
 
     # An OdbSet object specifying the surface set that defines the pretension section.
-    surface: OdbSet = OdbSet("set", tuple[OdbMeshNode]())
+    surface: OdbSet = lazyDefault(lambda: OdbSet("set", tuple[OdbMeshNode]()))
 
     # A tuple of Floats specifying the components of the normal to the pretension section.
     normal: float = None
@@ -1,7 +1,13 @@
-from .Odb import Odb
-from .ScratchOdb import ScratchOdb
+from __future__ import annotations
+
+import typing
+
 from ..Session.SessionBase import SessionBase
 
+if typing.TYPE_CHECKING:
+    from .Odb import Odb
+    from .ScratchOdb import ScratchOdb
+
 
 class OdbSession(SessionBase):
     def ScratchOdb(self, odb: Odb) -> ScratchOdb:
@@ -24,5 +30,6 @@ class OdbSession(SessionBase):
         -------
             A ScratchOdb object.
         """
+        from .ScratchOdb import ScratchOdb
         self.scratchOdbs["odb"] = scratchOdb = ScratchOdb(odb)
         return scratchOdb
@@ -3,6 +3,7 @@ from .OdbMeshElement import OdbMeshElement
 from .OdbMeshElementArray import OdbMeshElementArray
 from .OdbMeshNode import OdbMeshNode
 from .OdbMeshNodeArray import OdbMeshNodeArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class OdbSet:
@@ -60,11 +61,11 @@ class OdbSet:
 
     # An OdbMeshNodeArray object specifying the nodes of an OdbSet. If a set spans more than
     # one part instance, this member is a sequence of sequences for each part instance.
-    nodes: OdbMeshNodeArray = OdbMeshNodeArray()
+    nodes: OdbMeshNodeArray = lazyDefault(OdbMeshNodeArray)
 
     # An OdbMeshElementArray object specifying the elements of an OdbSet. If a set spans more
     # than one part instance, this member is a sequence of sequences for each part instance.
-    elements: OdbMeshElementArray = OdbMeshElementArray()
+    elements: OdbMeshElementArray = lazyDefault(OdbMeshElementArray)
 
     # A tuple of SymbolicConstants specifying the element face. If a set spans more than one
     # part instance, this member is a sequence of sequences for each part instance.
@@ -103,7 +104,8 @@ class OdbSet:
         -------
             An OdbSet object.
         """
-        pass
+        self.name = name
+        self.nodes = OdbMeshNodeArray(nodes)
 
     def NodeSetFromNodeLabels(self, name: str, nodeLabels: tuple):
         """This method creates a node set from a sequence of node labels.
@@ -138,6 +138,8 @@ class OdbStep(OdbStepBase):
 
     def Frame(self, *args, **kwargs) -> OdbFrame:
         frame = OdbFrame(*args, **kwargs)
+        frame.frameId = len(self.frames)
+        frame.domain = self.domain
         self.frames.append(frame)
         return frame
 
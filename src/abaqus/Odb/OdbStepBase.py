@@ -6,6 +6,7 @@ from .HistoryPoint import HistoryPoint
 from .HistoryRegion import HistoryRegion
 from .OdbFrameArray import OdbFrameArray
 from .OdbLoadCase import OdbLoadCase
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class OdbStepBase:
@@ -13,6 +14,21 @@ class OdbStepBase:
 
     Attributes
     ----------
+    name: str
+        A String specifying the repository key.
+    description: str
+        A String specifying the step description.
+    domain: SymbolicConstant
+        A SymbolicConstant specifying the domain of the step. Possible values are TIME,
+        FREQUENCY, ARC_LENGTH, and MODAL.
+    timePeriod: float
+        A Float specifying the time period of the step.
+    previousStepName: str
+        A String specifying the preceding step.
+    procedure: str
+        A String specifying the step procedure.
+    totalTime: float
+        A Float specifying the analysis time spend in all the steps previous to this step.
     number: int
         An Int specifying the step number.
     nlgeom: Boolean
@@ -55,6 +71,28 @@ class OdbStepBase:
 
     """
 
+    # A String specifying the repository key.
+    name: str = ""
+
+    # A String specifying the step description.
+    description: str = ""
+
+    # A SymbolicConstant specifying the domain of the step. Possible values are TIME,
+    # FREQUENCY, ARC_LENGTH, and MODAL.
+    domain: SymbolicConstant = None
+
+    # A Float specifying the time period of the step.
+    timePeriod: float = 0
+
+    # A String specifying the preceding step.
+    previousStepName: str = ""
+
+    # A String specifying the step procedure.
+    procedure: str = ""
+
+    # A Float specifying the analysis time spend in all the steps previous to this step.
+    totalTime: float = None
+
     # An Int specifying the step number.
     number: int = None
 
@@ -69,13 +107,13 @@ class OdbStepBase:
     acousticMass: float = None
 
     # An OdbFrameArray object.
-    frames: OdbFrameArray = OdbFrameArray()
+    frames: OdbFrameArray = lazyDefault(OdbFrameArray)
 
     # A repository of HistoryRegion objects.
-    historyRegions: dict[str, HistoryRegion] = dict[str, HistoryRegion]()
+    historyRegions: dict[str, HistoryRegion] = lazyDefault(dict[str, HistoryRegion])
 
     # A repository of OdbLoadCase objects.
-    loadCases: dict[str, OdbLoadCase] = dict[str, OdbLoadCase]()
+    loadCases: dict[str, OdbLoadCase] = lazyDefault(dict[str, OdbLoadCase])
 
     # A tuple of Floats specifying the coordinates of the center of mass.
     massCenter: float = None
@@ -199,7 +237,13 @@ class OdbStepBase:
             - If *previousStepName* is invalid:
               ValueError: previousStepName is invalid
         """
-        pass
+        self.name = name
+        self.description = description
+        self.domain = domain
+        self.timePeriod = timePeriod
+        self.previousStepName = previousStepName
+        self.procedure = procedure
+        self.totalTime = totalTime
 
     @typing.overload
     def getFrame(self, frameValue: str, match: SymbolicConstant = CLOSEST):
@@ -0,0 +1,154 @@
+import concurrent.futures
+import os
+import typing
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy
+
+from .Odb import Odb
+
+# The size in bytes from which the arrays returned by the workers are sent through shared memory
+SHARED_SIZE = 65536
+
+# The number of chunks of frames per worker, the frames of a chunk are consecutive
+CHUNKS_PER_WORKER = 4
+
+# The Odb objects opened by a worker process by file name
+_odbs = {}
+
+
+class _SharedArray(typing.NamedTuple):
+    """An array returned by a worker in a shared memory block."""
+
+    name: str
+    dtype: str
+    shape: tuple
+
+
+def parallelMap(
+    odb: Odb,
+    function: typing.Callable,
+    steps: typing.Sequence[str] = None,
+    frames: typing.Union[typing.Sequence[int], slice] = None,
+    workers: int = None,
+) -> list:
+    """This function calls a function on frames of an output database in worker processes and
+    returns the results in the order of the steps and of the frames. The frames are split in
+    chunks of consecutive frames, each worker opens the results store file of the output
+    database read-only once, and the arrays returned by the function are sent back through
+    shared memory instead of being pickled.
+
+    Parameters
+    ----------
+    odb
+        An :py:class:`~abaqus.Odb.Odb.Odb` object opened from a results store file, see
+        :py:func:`~abaqus.Odb.ResultsStore.openResultsStore`.
+    function
+        A function of an :py:class:`~abaqus.Odb.OdbFrame.OdbFrame` object. It must be defined
+        at the top level of a module so that it can be sent to the workers, it may return
+        numpy arrays, also in tuples, lists, and dictionaries.
+    steps
+        A sequence of Strings specifying the names of the steps. The default is all the steps.
+    frames
+        A sequence of Ints or a slice specifying the indexes of the frames in each step. The
+        default is all the frames.
+    workers
+        An Int specifying the number of worker processes. The default is the number of CPUs. If
+        it is 1, the function is called in this process.
+
+    Returns
+    -------
+    list
+        A list of the results of the function for each frame.
+
+    Raises
+    ------
+    ValueError
+        If the Odb object was not opened from a results store file, or if a step does not
+        exist.
+    """
+    store = odb.__dict__.get("_resultsStore")
+    if store is None:
+        raise ValueError("{} was not opened from a results store file".format(odb.name))
+    tasks = []
+    for stepName in odb.steps.keys() if steps is None else steps:
+        if stepName not in odb.steps:
+            raise ValueError("The step {} does not exist".format(stepName))
+        count = len(odb.steps[stepName].frames)
+        if frames is None:
+            indexes = range(count)
+        elif isinstance(frames, slice):
+            indexes = range(*frames.indices(count))
+        else:
+            indexes = [index + count if index < 0 else index for index in frames]
+        tasks.extend((stepName, index) for index in indexes)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) < 2:
+        return [function(odb.steps[stepName].frames[index]) for stepName, index in tasks]
+
+    size = max(-(-len(tasks) // (workers * CHUNKS_PER_WORKER)), 1)
+    chunks = [tasks[start : start + size] for start in range(0, len(tasks), size)]
+    # Each worker gets a share of the frame cache of the output database
+    cacheSize = store.frameCache.maxBytes // workers
+    results = []
+    with concurrent.futures.ProcessPoolExecutor(min(workers, len(chunks))) as executor:
+        futures = [executor.submit(_mapChunk, store.fileName, cacheSize, function, chunk) for chunk in chunks]
+        consumed = 0
+        try:
+            for future in futures:
+                chunk = future.result()
+                consumed += 1
+                results.extend(_unshare(result) for result in chunk)
+        except BaseException:
+            # The chunks that are not started are cancelled, and the shared memory blocks of the
+            # chunks that are not consumed are released
+            remaining = [future for future in futures[consumed:] if not future.cancel()]
+            for future in concurrent.futures.wait(remaining).done:
+                if future.exception() is None:
+                    for result in future.result():
+                        _unshare(result)
+            raise
+    return results
+
+
+def _mapChunk(fileName: str, cacheSize: int, function: typing.Callable, chunk: list) -> list:
+    from .ResultsStore import openResultsStore
+
+    odb = _odbs.get(fileName)
+    if odb is None:
+        odb = _odbs[fileName] = openResultsStore(fileName, cacheSize)
+    return [_share(function(odb.steps[stepName].frames[index])) for stepName, index in chunk]
+
+
+def _share(value):
+    # The large arrays are copied to shared memory blocks, they are released by the parent
+    if isinstance(value, numpy.ndarray) and value.nbytes >= SHARED_SIZE:
+        block = shared_memory.SharedMemory(create=True, size=value.nbytes)
+        numpy.ndarray(value.shape, value.dtype, buffer=block.buf)[...] = value
+        shared = _SharedArray(block.name, value.dtype.str, value.shape)
+        block.close()
+        # The block is unlinked by the parent, not by the resource tracker of the worker
+        resource_tracker.unregister(block._name, "shared_memory")
+        return shared
+    if type(value) in (list, tuple):
+        return type(value)(_share(item) for item in value)
+    if type(value) is dict:
+        return {key: _share(item) for key, item in value.items()}
+    return value
+
+
+def _unshare(value):
+    if isinstance(value, _SharedArray):
+        block = shared_memory.SharedMemory(name=value.name)
+        try:
+            array = numpy.ndarray(value.shape, value.dtype, buffer=block.buf).copy()
+        finally:
+            block.close()
+            block.unlink()
+        return array
+    if type(value) in (list, tuple):
+        return type(value)(_unshare(item) for item in value)
+    if type(value) is dict:
+        return {key: _unshare(item) for key, item in value.items()}
+    return value
@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .OdbDatumCsys import OdbDatumCsys
 from .OdbMeshNode import OdbMeshNode
 from .OdbSet import OdbSet
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class RebarOrientation:
@@ -42,7 +43,7 @@ class RebarOrientation:
     angle: float = None
 
     # An OdbSet object specifying a region for which the rebar orientation is defined.
-    region: OdbSet = OdbSet("set", tuple[OdbMeshNode]())
+    region: OdbSet = lazyDefault(lambda: OdbSet("set", tuple[OdbMeshNode]()))
 
     # An OdbDatumCsys object specifying a datum coordinates system.
-    csys: OdbDatumCsys = OdbDatumCsys()
+    csys: OdbDatumCsys = lazyDefault(OdbDatumCsys)
@@ -0,0 +1,221 @@
+import typing
+
+import numpy
+
+from abaqusConstants import *
+from .FieldBulkData import FieldBulkData
+
+
+class LabelIndex:
+    """The LabelIndex object returns the rows of labels in an array of node or element labels.
+    The rows are read from a table indexed by label if the labels are dense enough, otherwise
+    they are found by a binary search.
+
+    Attributes
+    ----------
+    labels: numpy.ndarray
+        An array of Ints specifying the labels in the order of the rows.
+    """
+
+    # An array of Ints specifying the labels in the order of the rows.
+    labels: numpy.ndarray = None
+
+    def __init__(self, labels):
+        self.labels = labels = numpy.asarray(labels, numpy.int64)
+        self._table = self._order = None
+        if len(labels) and labels.min() >= 0 and labels.max() < 4 * len(labels) + 1024:
+            self._table = numpy.full(labels.max() + 1, -1, numpy.int64)
+            self._table[labels] = numpy.arange(len(labels))
+        else:
+            self._order = numpy.argsort(labels, kind="stable")
+
+    def rows(self, labels) -> numpy.ndarray:
+        """This method returns the rows of labels, -1 for the labels that are not found."""
+        labels = numpy.asarray(labels, numpy.int64)
+        if self._table is not None:
+            inside = (labels >= 0) & (labels < len(self._table))
+            return numpy.where(inside, self._table[numpy.where(inside, labels, 0)], -1)
+        if not len(self.labels):
+            return numpy.full(labels.shape, -1, numpy.int64)
+        rows = self._order[numpy.searchsorted(self.labels, labels, sorter=self._order).clip(0, len(self.labels) - 1)]
+        return numpy.where(self.labels[rows] == labels, rows, -1)
+
+
+class LabelBitmap:
+    """The LabelBitmap object is the membership bitmap of a set of labels, one bit per label
+    between the smallest and the largest label of the set.
+    """
+
+    def __init__(self, labels):
+        labels = numpy.asarray(labels, numpy.int64)
+        self.start = int(labels.min()) if len(labels) else 0
+        self.size = int(labels.max()) + 1 - self.start if len(labels) else 0
+        bits = numpy.zeros(self.size, bool)
+        bits[labels - self.start] = True
+        self._bits = numpy.packbits(bits, bitorder="little")
+
+    def __contains__(self, label: int) -> bool:
+        return bool(self.contains([label])[0])
+
+    def contains(self, labels) -> numpy.ndarray:
+        """This method returns an array of Booleans specifying whether the labels are members."""
+        offsets = numpy.asarray(labels, numpy.int64) - self.start
+        inside = (offsets >= 0) & (offsets < self.size)
+        if not self.size:
+            return inside
+        offsets = numpy.where(inside, offsets, 0)
+        return inside & ((self._bits[offsets >> 3] >> (offsets & 7)) & 1).astype(bool)
+
+
+class RegionIndex:
+    """The RegionIndex object holds the indexes of the nodes, the elements, and the sets of an
+    OdbInstance object used to extract the subsets of the field outputs. The indexes are built
+    when they are first used and are reused for the field outputs of every frame, a subset is
+    then a gather of the rows of the bulk data blocks.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        from abaqus.Odb.RegionIndex import regionIndex
+        regionIndex(session.odbs[name].rootAssembly.instances[name])
+
+    """
+
+    def __init__(self, instance):
+        self.instance = instance
+        self._nodes = self._elements = None
+        # The bitmaps by set and the rows by set and block labels, with the objects of the key
+        # so that their ids are not reused
+        self._bitmaps = {}
+        self._rows = {}
+
+    @property
+    def nodes(self) -> LabelIndex:
+        """A LabelIndex object of the node labels of the instance."""
+        if self._nodes is None:
+            mesh = self.instance.__dict__.get("_mesh")
+            if mesh is not None:
+                self._nodes = LabelIndex(mesh.nodeLabels())
+            else:
+                self._nodes = LabelIndex([node.label for node in self.instance.nodes])
+        return self._nodes
+
+    @property
+    def elements(self) -> LabelIndex:
+        """A LabelIndex object of the element labels of the instance."""
+        if self._elements is None:
+            mesh = self.instance.__dict__.get("_mesh")
+            if mesh is not None:
+                self._elements = LabelIndex(mesh.elementLabels())
+            else:
+                self._elements = LabelIndex([element.label for element in self.instance.elements])
+        return self._elements
+
+    def elementNodes(self, labels) -> numpy.ndarray:
+        """This method returns the sorted labels of the nodes of elements."""
+        rows = self.elements.rows(labels)
+        rows = rows[rows >= 0]
+        mesh = self.instance.__dict__.get("_mesh")
+        if mesh is not None:
+            connectivity, offsets = mesh.connectivity()
+            starts, stops = offsets[rows], offsets[rows + 1]
+            lengths = stops - starts
+            positions = numpy.repeat(starts - numpy.cumsum(lengths) + lengths, lengths) + numpy.arange(lengths.sum())
+            return numpy.unique(connectivity[positions])
+        elements = self.instance.elements
+        return numpy.unique([label for row in rows.tolist() for label in elements[row].connectivity])
+
+    def bitmap(self, odbSet, nodal: bool) -> typing.Optional[LabelBitmap]:
+        """This method returns the membership bitmap of the node labels (*nodal*=True) or of the
+        element labels of a set in this instance, None if the set has no such members. The
+        node labels of an element set are the nodes of its elements."""
+        key = (id(odbSet), nodal)
+        if key not in self._bitmaps:
+            member, labels = setLabels(odbSet, self.instance.name)
+            if labels is not None and member == "elements" and nodal:
+                labels = self.elementNodes(labels)
+            elif labels is not None and member == "nodes" and not nodal:
+                labels = None
+            self._bitmaps[key] = (odbSet, None if labels is None else LabelBitmap(labels))
+        return self._bitmaps[key][1]
+
+    def rows(self, odbSet, block: FieldBulkData) -> numpy.ndarray:
+        """This method returns the rows of a bulk data block in a set. The rows are cached for
+        the label arrays shared by the blocks of every frame."""
+        labels = (block.elementLabels, block.nodeLabels)
+        if not all(isinstance(values, numpy.ndarray) or not _hasLabels(values) for values in labels):
+            return self._findRows(odbSet, block)
+        key = (id(odbSet), block.position) + tuple(map(_address, labels))
+        if key not in self._rows:
+            self._rows[key] = (odbSet, labels, self._findRows(odbSet, block))
+        return self._rows[key][2]
+
+    def _findRows(self, odbSet, block: FieldBulkData) -> numpy.ndarray:
+        # The element labels are used if the set has elements and the block has element
+        # labels, otherwise the node labels are used
+        bitmap = None
+        if block.position is not NODAL and _hasLabels(block.elementLabels):
+            bitmap, labels = self.bitmap(odbSet, False), block.elementLabels
+        if bitmap is None:
+            bitmap, labels = self.bitmap(odbSet, True), block.nodeLabels
+        if bitmap is None or not _hasLabels(labels):
+            return numpy.zeros(0, numpy.int64)
+        return numpy.flatnonzero(bitmap.contains(labels))
+
+
+def regionIndex(instance) -> RegionIndex:
+    """This function returns the RegionIndex object of an OdbInstance object, it is created
+    when it is first used and is kept by the instance."""
+    index = instance.__dict__.get("_regionIndex")
+    if index is None:
+        index = instance.__dict__["_regionIndex"] = RegionIndex(instance)
+    return index
+
+
+def setLabels(odbSet, instanceName: str) -> tuple[str, typing.Optional[numpy.ndarray]]:
+    """This function returns the kind of members ("nodes" or "elements") of a set and the labels
+    of its members in an instance, or None if the set has no members in the instance.
+    """
+    for member, attribute in (("nodes", "_nodeLabels"), ("elements", "_elementLabels")):
+        # The labels of the sets read from a results store
+        labels = odbSet.__dict__.get(attribute)
+        if labels is not None:
+            return member, labels.get(instanceName)
+    for member in ("elements", "nodes"):
+        members = getattr(odbSet, member)
+        if not len(members):
+            continue
+        if odbSet.instanceNames:
+            # The members of an assembly set are grouped by instance
+            members = dict(zip(odbSet.instanceNames, members)).get(instanceName)
+            if members is None:
+                return member, None
+        return member, numpy.array([item.label for item in members], numpy.int64)
+    return "nodes", None
+
+
+def subsetBlock(block: FieldBulkData, rows) -> FieldBulkData:
+    """This function returns a bulk data block with the rows of a block."""
+    if isinstance(rows, numpy.ndarray) and len(rows) == len(block.data):
+        if not len(rows) or (rows[0] == 0 and rows[-1] == len(rows) - 1):
+            return block
+    subset = FieldBulkData()
+    subset.__dict__.update(block.__dict__)
+    for key in ("data", "conjugateData", "elementLabels", "nodeLabels", "integrationPoints", "mises", "localCoordSystem"):
+        values = block.__dict__.get(key)
+        if _hasLabels(values):
+            subset.__dict__[key] = numpy.asarray(values)[rows]
+    return subset
+
+
+def _hasLabels(values) -> bool:
+    return values is not None and len(values) > 0
+
+
+def _address(values):
+    if not isinstance(values, numpy.ndarray):
+        return None
+    return values.__array_interface__["data"][0], values.shape
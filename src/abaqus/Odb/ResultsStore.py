@@ -0,0 +1,435 @@
+import json
+import mmap
+import os
+import subprocess
+import typing
+import weakref
+
+import numpy
+
+from abaqusConstants import *
+from .FieldBulkData import FieldBulkData
+from .FieldLocation import FieldLocation
+from .FieldOutput import FieldOutput
+from .FrameCache import FrameCache, cacheLimit
+from .Odb import Odb
+from .OdbFrame import OdbFrame
+from .OdbFrameArray import OdbFrameArray
+from .OdbInstance import OdbInstance
+from .OdbMeshElement import OdbMeshElement
+from .OdbMeshElementArray import OdbMeshElementArray
+from .OdbMeshNode import OdbMeshNode
+from .OdbMeshNodeArray import OdbMeshNodeArray
+from .OdbPart import OdbPart
+from .OdbSet import OdbSet
+from .ResultsStoreWriter import MAGIC, TRAILER, VERSION
+from .SectionPoint import SectionPoint
+from .SectionPointArray import SectionPointArray
+from ..LazyDefault.LazyDefault import deferAttribute
+from ..UtilityAndView.SymbolicConstant import SymbolicConstant
+
+
+class ResultsStore:
+    """The ResultsStore object reads a results store file, i.e., an output database exported
+    by :py:func:`writeResultsStore`. The file is mapped in memory, the arrays are read-only
+    views of the mapped file.
+
+    Attributes
+    ----------
+    fileName: str
+        A String specifying the path of the results store file.
+    manifest: dict
+        A Dictionary describing the output database and the location of the arrays.
+    frameCache: FrameCache
+        A :py:class:`~abaqus.Odb.FrameCache.FrameCache` object keeping the field outputs of the
+        frames used last.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        import odbAccess
+        odb = odbAccess.openOdb('Job-1.odbstore')
+
+    """
+
+    # A String specifying the path of the results store file.
+    fileName: str = ""
+
+    # A Dictionary describing the output database and the location of the arrays.
+    manifest: dict = None
+
+    # A FrameCache object keeping the field outputs of the frames used last.
+    frameCache: FrameCache = None
+
+    def __init__(self, fileName: str, cacheSize: int = None):
+        self.fileName = fileName
+        self.frameCache = FrameCache(cacheLimit() if cacheSize is None else cacheSize)
+        with open(fileName, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(self._map)
+        if size < len(MAGIC) + TRAILER.size or self._map[: len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError("{} is not a results store file".format(fileName))
+        offset, length, magic = TRAILER.unpack(self._map[size - TRAILER.size :])
+        if magic != MAGIC or offset + length > size - TRAILER.size:
+            self._map.close()
+            raise ValueError("{} is truncated".format(fileName))
+        self.manifest = json.loads(self._map[offset : offset + length].decode("utf-8"))
+        if self.manifest.get("version") != VERSION:
+            self._map.close()
+            raise ValueError("{} was written by another version of pyabaqus".format(fileName))
+
+    def array(self, reference: list) -> typing.Optional[numpy.ndarray]:
+        """This method returns an array of the file.
+
+        Parameters
+        ----------
+        reference
+            A list of the offset, the dtype and the shape of the array, as written in the
+            manifest.
+
+        Returns
+        -------
+        numpy.ndarray
+            A read-only view of the mapped file, or None if *reference* is None.
+        """
+        if reference is None:
+            return None
+        offset, dtype, shape = reference
+        return numpy.ndarray(shape, dtype, buffer=self._map, offset=offset)
+
+    def document(self, reference: list):
+        """This method decodes a JSON document stored as an array of the file."""
+        return json.loads(self.array(reference).tobytes().decode("utf-8"))
+
+    def close(self):
+        """This method unmaps the file. The file stays mapped while arrays of the file are
+        used. The frames kept by the frame cache are released."""
+        self.frameCache.clear()
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+
+
+def isResultsStore(fileName: str) -> bool:
+    """This function returns whether a file is a results store file.
+
+    Parameters
+    ----------
+    fileName
+        A String specifying the path of the file.
+
+    Returns
+    -------
+    bool
+        True if the file starts with the magic bytes of a results store file.
+    """
+    try:
+        with open(fileName, "rb") as file:
+            return file.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def writeResultsStore(name: str, fileName: str = None) -> str:
+    """This function exports an output database to a results store file. The export runs once
+    in the Python interpreter of Abaqus, the results store file is then opened by
+    :py:func:`openResultsStore` without Abaqus.
+
+    Parameters
+    ----------
+    name
+        A String specifying the path of the output database (.odb) file.
+    fileName
+        A String specifying the path of the results store file. The default is the path of the
+        output database with the extension .odbstore.
+
+    Returns
+    -------
+    str
+        A String specifying the path of the results store file.
+    """
+    abaqus = "abaqus"
+    if "ABAQUS_BAT_PATH" in os.environ.keys():
+        abaqus = os.environ["ABAQUS_BAT_PATH"]
+    if fileName is None:
+        fileName = os.path.splitext(name)[0] + ".odbstore"
+    writer = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ResultsStoreWriter.py")
+    subprocess.run([abaqus, "python", writer, os.path.abspath(name), os.path.abspath(fileName)], check=True)
+    return fileName
+
+
+def openResultsStore(fileName: str, cacheSize: int = None) -> Odb:
+    """This function opens a results store file as a read-only Odb object. The nodes, elements
+    and set members are created when they are first used, the frames are created when they are
+    indexed or iterated, the field outputs of a frame are created when they are first used and
+    are kept by the frame cache of the results store, and the data of the field outputs are not
+    copied.
+
+    Parameters
+    ----------
+    fileName
+        A String specifying the path of the results store file.
+    cacheSize
+        An Int specifying the maximum size in bytes of the bulk data blocks of the frames kept
+        by the frame cache. The default is 75 percent of the physical memory, see
+        :py:func:`~abaqus.Odb.FrameCache.cacheLimit`.
+
+    Returns
+    -------
+    Odb
+        An :py:class:`~abaqus.Odb.Odb.Odb` object.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a results store file.
+    """
+    store = ResultsStore(fileName, cacheSize)
+    manifest = store.manifest
+    odb = Odb(**manifest["odb"])
+    odb.isReadOnly = ON
+    odb._resultsStore = store
+
+    for key, value in manifest["jobData"].items():
+        setattr(odb.jobData, key, _constant(value) if key in ("analysisCode", "precision") else value)
+    for entry in manifest["sectionCategories"]:
+        category = odb.SectionCategory(entry["name"], entry["description"])
+        for number, description in entry["sectionPoints"]:
+            category.SectionPoint(number, description)
+    categories = list(odb.sectionCategories.values())
+    for entry in manifest["parts"]:
+        odb.Part(entry["name"], _constant(entry["embeddedSpace"]), _constant(entry["type"]))
+
+    assembly = odb.rootAssembly
+    meshes = {}
+    for entry in manifest["instances"]:
+        name = entry["name"]
+        part = OdbPart(name, _constant(entry["embeddedSpace"]), _constant(entry["type"]))
+        assembly.instances[name] = instance = OdbInstance(name, part)
+        meshes[name] = instance._mesh = mesh = _Mesh(store, entry, name, categories)
+        deferAttribute(instance, "nodes", mesh.nodes)
+        deferAttribute(instance, "elements", mesh.elements)
+        _loadSets(instance.nodeSets, entry["nodeSets"], "nodes", meshes, name)
+        _loadSets(instance.elementSets, entry["elementSets"], "elements", meshes, name)
+    entry = manifest["rootAssembly"]
+    assembly._mesh = mesh = _Mesh(store, entry, "ASSEMBLY", categories)
+    deferAttribute(assembly, "nodes", mesh.nodes)
+    deferAttribute(assembly, "elements", mesh.elements)
+    _loadSets(assembly.nodeSets, entry["nodeSets"], "nodes", meshes)
+    _loadSets(assembly.elementSets, entry["elementSets"], "elements", meshes)
+
+    for entry in manifest["steps"]:
+        step = odb.Step(
+            entry["name"],
+            entry["description"],
+            _constant(entry["domain"]),
+            entry["timePeriod"],
+            entry["previousStepName"],
+            entry["procedure"],
+            entry["totalTime"],
+        )
+        step.number = entry["number"]
+        step.nlgeom = ON if entry["nlgeom"] else OFF
+        frames = _Frames(odb, store, step, entry["frames"])
+        step.frames = OdbFrameArray(length=len(frames), loader=frames)
+    return odb
+
+
+def frameCache(odb: Odb) -> FrameCache:
+    """This function returns the frame cache of an Odb object opened from a results store file.
+
+    Parameters
+    ----------
+    odb
+        An :py:class:`~abaqus.Odb.Odb.Odb` object returned by :py:func:`openResultsStore`.
+
+    Returns
+    -------
+    FrameCache
+        A :py:class:`~abaqus.Odb.FrameCache.FrameCache` object.
+
+    Raises
+    ------
+    ValueError
+        If the Odb object was not opened from a results store file.
+    """
+    store = odb.__dict__.get("_resultsStore")
+    if store is None:
+        raise ValueError("{} was not opened from a results store file".format(odb.name))
+    return store.frameCache
+
+
+def _constant(name: typing.Optional[str]):
+    return None if name is None else SymbolicConstant(name)
+
+
+class _Frames:
+    """The frames of a step in a results store, a frame is created from the columns of the step
+    when it is used."""
+
+    def __init__(self, odb: Odb, store: ResultsStore, step, entry: dict):
+        self.odb = odb
+        self.store = store
+        self.step = step
+        self.entry = entry
+        self.columns = {
+            key: store.array(entry[key]) for key in ("incrementNumber", "frameId", "frameValue", "frequency", "mode")
+        }
+
+    def __len__(self):
+        return len(self.entry["fieldOutputs"])
+
+    def __call__(self, index: int) -> OdbFrame:
+        columns = self.columns
+        frame = OdbFrame(
+            int(columns["incrementNumber"][index]), float(columns["frameValue"][index]), self.entry["description"][index]
+        )
+        frame.frameId = int(columns["frameId"][index])
+        frame.domain = self.step.domain
+        frame.frequency = float(columns["frequency"][index])
+        if self.step.domain is MODAL:
+            frame.mode = int(columns["mode"][index])
+        # The field outputs are kept by the frame cache, the frame is referenced weakly so that
+        # it is released when it is not used
+        key = (self.step.name, index)
+        reference = weakref.ref(frame)
+        fieldOutputs = self.entry["fieldOutputs"][index]
+        load = (_fieldOutputs, self.odb, self.store, fieldOutputs)
+        deferAttribute(frame, "fieldOutputs", self.store.frameCache.fieldOutputs, reference, key, *load)
+        return frame
+
+
+class _Mesh:
+    """The nodes and the elements of an instance or of the assembly in a results store."""
+
+    def __init__(self, store: ResultsStore, entry: dict, instanceName: str, categories: list):
+        self.store = store
+        self.entry = entry
+        self.instanceName = instanceName
+        self.categories = categories
+
+    def nodeLabels(self) -> numpy.ndarray:
+        return self.store.array(self.entry["nodes"]["labels"])
+
+    def elementLabels(self) -> numpy.ndarray:
+        return self.store.array(self.entry["elements"]["labels"])
+
+    def connectivity(self) -> tuple[numpy.ndarray, numpy.ndarray]:
+        entry = self.entry["elements"]
+        return self.store.array(entry["connectivity"]), self.store.array(entry["offsets"])
+
+    def _rows(self, labels: numpy.ndarray, members: typing.Optional[numpy.ndarray]):
+        if members is None:
+            return numpy.arange(len(labels))
+        order = numpy.argsort(labels, kind="stable")
+        rows = order[numpy.searchsorted(labels, members, sorter=order).clip(0, max(len(labels) - 1, 0))]
+        return rows[labels[rows] == members]
+
+    def nodes(self, members: numpy.ndarray = None) -> OdbMeshNodeArray:
+        entry = self.entry["nodes"]
+        labels = self.store.array(entry["labels"])
+        rows = self._rows(labels, members)
+        nodes = OdbMeshNodeArray()
+        for label, coordinates in zip(labels[rows].tolist(), self.store.array(entry["coordinates"])[rows].tolist()):
+            node = OdbMeshNode()
+            node.label = label
+            node.coordinates = tuple(coordinates)
+            node.instanceName = self.instanceName
+            nodes.append(node)
+        return nodes
+
+    def elements(self, members: numpy.ndarray = None) -> OdbMeshElementArray:
+        entry = self.entry["elements"]
+        labels = self.store.array(entry["labels"])
+        rows = self._rows(labels, members)
+        typeNames = entry["typeNames"]
+        connectivity = self.store.array(entry["connectivity"])
+        offsets = self.store.array(entry["offsets"])
+        columns = zip(
+            labels[rows].tolist(),
+            self.store.array(entry["types"])[rows].tolist(),
+            offsets[rows].tolist(),
+            offsets[rows + 1].tolist(),
+            self.store.array(entry["sectionCategories"])[rows].tolist(),
+        )
+        elements = OdbMeshElementArray()
+        for label, type, start, stop, category in columns:
+            element = OdbMeshElement()
+            element.label = label
+            element.type = typeNames[type]
+            element.connectivity = tuple(connectivity[start:stop].tolist())
+            element.instanceName = self.instanceName
+            element.instanceNames = (self.instanceName,)
+            element.sectionCategory = self.categories[category] if category >= 0 else None
+            elements.append(element)
+        return elements
+
+
+def _loadSets(sets: dict, entries: dict, member: str, meshes: dict, instanceName: str = None):
+    # The labels of the members by instance are kept by the set as _nodeLabels or
+    # _elementLabels, the members are created when they are used
+    attribute = "_nodeLabels" if member == "nodes" else "_elementLabels"
+    for name, entry in entries.items():
+        sets[name] = odbSet = OdbSet(name, ())
+        odbSet.isInternal = ON if entry["isInternal"] else OFF
+        if instanceName is not None:
+            mesh = meshes[instanceName]
+            labels = mesh.store.array(entry["labels"])
+            setattr(odbSet, attribute, {instanceName: labels})
+            deferAttribute(odbSet, member, getattr(mesh, member), labels)
+        else:
+            odbSet.instanceNames = tuple(entry["instanceNames"])
+            memberLabels = {
+                name: meshes[name].store.array(labels) for name, labels in zip(entry["instanceNames"], entry["labels"])
+            }
+            setattr(odbSet, attribute, memberLabels)
+            deferAttribute(odbSet, member, _assemblyMembers, memberLabels, member, meshes)
+
+
+def _assemblyMembers(memberLabels: dict, member: str, meshes: dict):
+    # The members of an assembly set are a sequence of sequences for each part instance
+    arrayType = OdbMeshNodeArray if member == "nodes" else OdbMeshElementArray
+    return arrayType(getattr(meshes[name], member)(labels) for name, labels in memberLabels.items())
+
+
+def _fieldOutputs(odb: Odb, store: ResultsStore, reference: list) -> dict[str, FieldOutput]:
+    instances = odb.rootAssembly.instances
+    fieldOutputs = {}
+    for entry in store.document(reference):
+        fieldOutput = FieldOutput(
+            entry["name"],
+            entry["description"],
+            _constant(entry["type"]),
+            entry["componentLabels"],
+            [_constant(invariant) for invariant in entry["validInvariants"]],
+            ON if entry["isEngineeringTensor"] else OFF,
+        )
+        fieldOutput.isComplex = ON if entry["isComplex"] else OFF
+        fieldOutput.dim = entry["dim"]
+        fieldOutput.dim2 = entry["dim2"]
+        for location in entry["locations"]:
+            fieldLocation = FieldLocation()
+            fieldLocation.position = _constant(location["position"])
+            fieldLocation.sectionPoints = SectionPointArray(SectionPoint(*point) for point in location["sectionPoints"])
+            fieldOutput.locations.append(fieldLocation)
+        for block in entry["blocks"]:
+            bulkData = FieldBulkData()
+            bulkData.position = _constant(block["position"])
+            bulkData.type = fieldOutput.type
+            bulkData.instance = instances.get(block["instance"]) if block["instance"] is not None else None
+            bulkData.sectionPoint = SectionPoint(*block["sectionPoint"]) if block["sectionPoint"] else None
+            bulkData.baseElementType = block["baseElementType"]
+            bulkData.componentLabels = tuple(block["componentLabels"])
+            bulkData.data = store.array(block["data"])
+            bulkData.precision = DOUBLE_PRECISION if bulkData.data.dtype == numpy.float64 else SINGLE_PRECISION
+            for key in ("conjugateData", "elementLabels", "nodeLabels", "integrationPoints", "mises", "localCoordSystem"):
+                if block[key] is not None:
+                    setattr(bulkData, key, store.array(block[key]))
+            fieldOutput.bulkDataBlocks.append(bulkData)
+        fieldOutputs[fieldOutput.name] = fieldOutput
+    return fieldOutputs
@@ -0,0 +1,286 @@
+"""Writes an output database to a results store file.
+
+This module is executed by the Python interpreter of Abaqus, which imports the odbAccess module of
+Abaqus, so it only imports the standard library and numpy and it is compatible with Python 2.7::
+
+    abaqus python ResultsStoreWriter.py Job-1.odb Job-1.odbstore
+
+A results store file starts with the magic bytes, followed by the arrays, each aligned to 64
+bytes, then by the JSON manifest describing the output database and the location of the arrays,
+and it ends with a trailer of the offset and the length of the manifest and the magic bytes
+again. An array is referenced in the manifest by its offset, its dtype, and its shape, so that it
+can be read as a view of the mapped file. The field outputs of each frame are described by a
+separate JSON document stored as an array, it is only decoded when the frame is used.
+"""
+
+import hashlib
+import json
+import struct
+import sys
+
+import numpy
+
+# The first and the last bytes of a results store file
+MAGIC = b"PYABQRS1"
+
+# The alignment of the arrays in the file
+ALIGNMENT = 64
+
+# The trailer: offset and length of the manifest, and the magic bytes
+TRAILER = struct.Struct("<QQ8s")
+
+# The version of the layout of the manifest
+VERSION = 1
+
+
+class ResultsStoreWriter(object):
+    """The ResultsStoreWriter object writes the arrays and the manifest of a results store
+    file."""
+
+    def __init__(self, fileName):
+        self.fileName = fileName
+        self._file = open(fileName, "wb")
+        self._file.write(MAGIC)
+        # The references of the shared arrays by content
+        self._shared = {}
+
+    def _align(self):
+        position = self._file.tell()
+        padding = -position % ALIGNMENT
+        if padding:
+            self._file.write(b"\0" * padding)
+        return position + padding
+
+    def array(self, values, dtype=None, shared=False):
+        """Writes an array and returns its reference, or None if *values* is None. A shared
+        array, e.g., the labels of a block of every frame, is written once and every reference
+        to an equal array is the same, so that the indexes built for it can be reused."""
+        if values is None:
+            return None
+        values = numpy.ascontiguousarray(values, dtype=dtype)
+        if shared:
+            key = (values.dtype.str, values.shape, hashlib.sha1(values.data).hexdigest())
+            if key not in self._shared:
+                self._shared[key] = self.array(values)
+            return self._shared[key]
+        offset = self._align()
+        values.tofile(self._file)
+        return [offset, values.dtype.str, list(values.shape)]
+
+    def document(self, value):
+        """Writes a JSON document as an array of bytes and returns its reference."""
+        return self.array(numpy.frombuffer(json.dumps(value).encode("utf-8"), numpy.uint8))
+
+    def close(self, manifest):
+        """Writes the manifest and the trailer and closes the file."""
+        manifest = json.dumps(dict(manifest, version=VERSION)).encode("utf-8")
+        offset = self._align()
+        self._file.write(manifest)
+        self._file.write(TRAILER.pack(offset, len(manifest), MAGIC))
+        self._file.close()
+
+
+def _name(constant):
+    return None if constant is None else str(constant)
+
+
+def _bulkArray(block, name):
+    # The single precision members throw an exception if the data are in double precision
+    for member in (name, name + "Double"):
+        try:
+            values = getattr(block, member)
+        except Exception:
+            continue
+        if values is not None and len(values):
+            return numpy.asarray(values)
+    return None
+
+
+def _bulkData(block):
+    # The data are stored with one row per value, also for scalar fields
+    data = _bulkArray(block, "data")
+    return numpy.reshape(data, (len(data), -1))
+
+
+def _mesh(writer, nodes, elements, categories):
+    nodeLabels = [node.label for node in nodes]
+    coordinates = numpy.reshape([tuple(node.coordinates) for node in nodes], (-1, 3))
+    typeNames, types, connectivity, offsets, sectionCategories = [], [], [], [0], []
+    for element in elements:
+        if element.type not in typeNames:
+            typeNames.append(element.type)
+        types.append(typeNames.index(element.type))
+        connectivity.extend(element.connectivity)
+        offsets.append(len(connectivity))
+        category = element.sectionCategory
+        sectionCategories.append(categories.index(category.name) if category is not None else -1)
+    return {
+        "nodes": {
+            "labels": writer.array(nodeLabels, numpy.int32),
+            "coordinates": writer.array(coordinates, numpy.float32),
+        },
+        "elements": {
+            "labels": writer.array([element.label for element in elements], numpy.int32),
+            "typeNames": typeNames,
+            "types": writer.array(types, numpy.int16),
+            "connectivity": writer.array(connectivity, numpy.int32),
+            "offsets": writer.array(offsets, numpy.int64),
+            "sectionCategories": writer.array(sectionCategories, numpy.int32),
+        },
+    }
+
+
+def _sets(writer, sets, member, assembly):
+    result = {}
+    for name, odbSet in sets.items():
+        members = getattr(odbSet, member)
+        if assembly:
+            # The members of an assembly set are grouped by instance
+            instanceNames = list(odbSet.instanceNames)
+            labels = [writer.array([item.label for item in group], numpy.int32) for group in members]
+        else:
+            instanceNames = None
+            labels = writer.array([item.label for item in members], numpy.int32)
+        result[name] = {"instanceNames": instanceNames, "labels": labels, "isInternal": bool(odbSet.isInternal)}
+    return result
+
+
+def _field(writer, field):
+    blocks = []
+    for block in field.bulkDataBlocks:
+        sectionPoint = block.sectionPoint
+        blocks.append(
+            {
+                "position": _name(block.position),
+                "instance": block.instance.name if block.instance is not None else None,
+                "sectionPoint": [sectionPoint.number, sectionPoint.description] if sectionPoint else None,
+                "baseElementType": block.baseElementType,
+                "componentLabels": list(block.componentLabels),
+                "data": writer.array(_bulkData(block)),
+                "conjugateData": writer.array(_bulkArray(block, "conjugateData")),
+                "elementLabels": writer.array(_bulkArray(block, "elementLabels"), shared=True),
+                "nodeLabels": writer.array(_bulkArray(block, "nodeLabels"), shared=True),
+                "integrationPoints": writer.array(_bulkArray(block, "integrationPoints"), shared=True),
+                "mises": writer.array(_bulkArray(block, "mises")),
+                "localCoordSystem": writer.array(_bulkArray(block, "localCoordSystem")),
+            }
+        )
+    return {
+        "name": field.name,
+        "description": field.description,
+        "type": _name(field.type),
+        "componentLabels": list(field.componentLabels),
+        "validInvariants": [_name(invariant) for invariant in field.validInvariants],
+        "isEngineeringTensor": bool(getattr(field, "isEngineeringTensor", False)),
+        "isComplex": bool(field.isComplex),
+        "dim": field.dim,
+        "dim2": field.dim2,
+        "locations": [
+            {
+                "position": _name(location.position),
+                "sectionPoints": [[point.number, point.description] for point in location.sectionPoints],
+            }
+            for location in field.locations
+        ],
+        "blocks": blocks,
+    }
+
+
+def _step(writer, step):
+    frames = step.frames
+    return {
+        "name": step.name,
+        "description": step.description,
+        "domain": _name(step.domain),
+        "timePeriod": step.timePeriod,
+        "previousStepName": step.previousStepName,
+        "procedure": step.procedure,
+        "totalTime": step.totalTime,
+        "number": step.number,
+        "nlgeom": bool(step.nlgeom),
+        "frames": {
+            "incrementNumber": writer.array([frame.incrementNumber for frame in frames], numpy.int32),
+            "frameId": writer.array([frame.frameId for frame in frames], numpy.int32),
+            "frameValue": writer.array([frame.frameValue for frame in frames], numpy.float64),
+            "frequency": writer.array([frame.frequency or 0.0 for frame in frames], numpy.float64),
+            "mode": writer.array([getattr(frame, "mode", None) or 0 for frame in frames], numpy.int32),
+            "description": [frame.description for frame in frames],
+            "fieldOutputs": [
+                writer.document([_field(writer, field) for field in frame.fieldOutputs.values()]) for frame in frames
+            ],
+        },
+    }
+
+
+def exportOdb(odb, fileName):
+    """Writes an output database opened by the odbAccess module of Abaqus to a results store
+    file.
+
+    Parameters
+    ----------
+    odb
+        An Odb object of Abaqus.
+    fileName
+        A String specifying the path of the results store file.
+    """
+    writer = ResultsStoreWriter(fileName)
+    categories = list(odb.sectionCategories.keys())
+    assembly = odb.rootAssembly
+    jobData = odb.jobData
+    manifest = {
+        "odb": {
+            "name": odb.name,
+            "analysisTitle": odb.analysisTitle,
+            "description": odb.description,
+            "path": odb.path,
+        },
+        "jobData": {
+            "name": jobData.name,
+            "analysisCode": _name(jobData.analysisCode),
+            "precision": _name(jobData.precision),
+            "version": jobData.version,
+            "creationTime": jobData.creationTime,
+            "modificationTime": jobData.modificationTime,
+            "machineName": jobData.machineName,
+        },
+        "sectionCategories": [
+            {
+                "name": category.name,
+                "description": category.description,
+                "sectionPoints": [[point.number, point.description] for point in category.sectionPoints],
+            }
+            for category in odb.sectionCategories.values()
+        ],
+        "parts": [
+            {"name": part.name, "embeddedSpace": _name(part.embeddedSpace), "type": _name(part.type)}
+            for part in odb.parts.values()
+        ],
+        "instances": [
+            dict(
+                _mesh(writer, instance.nodes, instance.elements, categories),
+                name=instance.name,
+                embeddedSpace=_name(instance.embeddedSpace),
+                type=_name(instance.type),
+                nodeSets=_sets(writer, instance.nodeSets, "nodes", False),
+                elementSets=_sets(writer, instance.elementSets, "elements", False),
+            )
+            for instance in assembly.instances.values()
+        ],
+        "rootAssembly": dict(
+            _mesh(writer, assembly.nodes, assembly.elements, categories),
+            nodeSets=_sets(writer, assembly.nodeSets, "nodes", True),
+            elementSets=_sets(writer, assembly.elementSets, "elements", True),
+        ),
+        "steps": [_step(writer, step) for step in odb.steps.values()],
+    }
+    writer.close(manifest)
+
+
+if __name__ == "__main__":
+    from odbAccess import openOdb
+
+    odb = openOdb(sys.argv[1], readOnly=True)
+    try:
+        exportOdb(odb, sys.argv[2])
+    finally:
+        odb.close()
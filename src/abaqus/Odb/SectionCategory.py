@@ -1,5 +1,6 @@
 from .SectionPoint import SectionPoint
 from .SectionPointArray import SectionPointArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class SectionCategory:
@@ -12,6 +13,10 @@ class SectionCategory:
 
     Attributes
     ----------
+    name: str
+        A String specifying the name of the category.
+    description: str
+        A String specifying the description of the category.
     sectionPoints: SectionPointArray
         A :py:class:`~abaqus.Odb.SectionPointArray.SectionPointArray` object.
 
@@ -43,8 +48,14 @@ class SectionCategory:
 
     """
 
+    # A String specifying the name of the category.
+    name: str = ""
+
+    # A String specifying the description of the category.
+    description: str = ""
+
     # A SectionPointArray object.
-    sectionPoints: SectionPointArray = SectionPointArray()
+    sectionPoints: SectionPointArray = lazyDefault(SectionPointArray)
 
     def __init__(self, name: str, description: str):
         """This method creates a SectionCategory object.
@@ -68,7 +79,8 @@ class SectionCategory:
         -------
             A SectionCategory object.
         """
-        pass
+        self.name = name
+        self.description = description
 
     def SectionPoint(self, number: int, description: str) -> SectionPoint:
         """This method creates a SectionPoint object.
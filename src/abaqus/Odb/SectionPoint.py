@@ -1,6 +1,13 @@
 class SectionPoint:
     """The SectionPoint object describes the location of a section point within a section
-    category. 
+    category.
+
+    Attributes
+    ----------
+    number: int
+        An Int specifying the number of the section point.
+    description: str
+        A String specifying the description of the section point.
 
     Notes
     -----
@@ -33,6 +40,12 @@ class SectionPoint:
 
     """
 
+    # An Int specifying the number of the section point.
+    number: int = None
+
+    # A String specifying the description of the section point.
+    description: str = ""
+
     def __init__(self, number: int, description: str):
         """This method creates a SectionPoint object.
 
@@ -56,4 +69,5 @@ class SectionPoint:
         -------
             A SectionPoint object.
         """
-        pass
+        self.number = number
+        self.description = description
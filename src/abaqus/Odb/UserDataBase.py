@@ -1,4 +1,5 @@
 from ..Annotation.Annotation import Annotation
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..XY.QuantityType import QuantityType
 from ..XY.XYData import XYData
 
@@ -78,21 +79,21 @@ class UserDataBase:
 
     # A QuantityType object specifying the QuantityType object associated to the X -axis1-
     # values.
-    axis1QuantityType: QuantityType = QuantityType()
+    axis1QuantityType: QuantityType = lazyDefault(QuantityType)
 
     # A QuantityType object specifying the QuantityType object associated to the Y -axis2-
     # values.
-    axis2QuantityType: QuantityType = QuantityType()
+    axis2QuantityType: QuantityType = lazyDefault(QuantityType)
 
     # A String specifying the label to be used in the legend. The default value is the name of
     # the XYData object.
     legendLabel: str = ""
 
     # A repository of XYData objects.
-    xyDataObjects: dict[str, XYData] = dict[str, XYData]()
+    xyDataObjects: dict[str, XYData] = lazyDefault(dict[str, XYData])
 
     # A repository of Annotation objects.
-    annotations: dict[str, Annotation] = dict[str, Annotation]()
+    annotations: dict[str, Annotation] = lazyDefault(dict[str, Annotation])
 
     # A tuple of pairs of Floats specifying the *X–Y* data pairs.
     data: float = None
@@ -4,6 +4,7 @@ from .DisplayBodyOptions import DisplayBodyOptions
 from .OrientationOptions import OrientationOptions
 from .SuperimposeOptions import SuperimposeOptions
 from .SymbolOptions import SymbolOptions
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..PlotOptions.BasicOptions import BasicOptions
 from ..PlotOptions.FreeBodyOptions import FreeBodyOptions
 from ..PlotOptions.StreamOptions import StreamOptions
@@ -49,31 +50,31 @@ class DefaultOdbDisplay:
     """
 
     # A BasicOptions object.
-    basicOptions: BasicOptions = BasicOptions()
+    basicOptions: BasicOptions = lazyDefault(BasicOptions)
 
     # A CommonOptions object.
-    commonOptions: CommonOptions = CommonOptions()
+    commonOptions: CommonOptions = lazyDefault(CommonOptions)
 
     # A ContourOptions object.
-    contourOptions: ContourOptions = ContourOptions()
+    contourOptions: ContourOptions = lazyDefault(ContourOptions)
 
     # A DisplayBodyOptions object.
-    displayBodyOptions: DisplayBodyOptions = DisplayBodyOptions()
+    displayBodyOptions: DisplayBodyOptions = lazyDefault(DisplayBodyOptions)
 
     # A FreeBodyOptions object.
-    freeBodyOptions: FreeBodyOptions = FreeBodyOptions()
+    freeBodyOptions: FreeBodyOptions = lazyDefault(FreeBodyOptions)
 
     # A StreamOptions object.
-    streamOptions: StreamOptions = StreamOptions()
+    streamOptions: StreamOptions = lazyDefault(StreamOptions)
 
     # An OrientationOptions object.
-    materialOrientationOptions: OrientationOptions = OrientationOptions()
+    materialOrientationOptions: OrientationOptions = lazyDefault(OrientationOptions)
 
     # A SuperimposeOptions object.
-    superimposeOptions: SuperimposeOptions = SuperimposeOptions()
+    superimposeOptions: SuperimposeOptions = lazyDefault(SuperimposeOptions)
 
     # A SymbolOptions object.
-    symbolOptions: SymbolOptions = SymbolOptions()
+    symbolOptions: SymbolOptions = lazyDefault(SymbolOptions)
 
     # A ViewCutOptions object.
-    viewCutOptions: ViewCutOptions = ViewCutOptions()
+    viewCutOptions: ViewCutOptions = lazyDefault(ViewCutOptions)
@@ -13,6 +13,7 @@ from ..DisplayGroup.DisplayGroupInstanceRepository import DisplayGroupInstanceRe
 from ..DisplayGroup.Leaf import Leaf
 from ..FieldReport.OdbFieldVarList import OdbFieldVarList
 from ..FieldReport.OdbModelFieldVarList import OdbModelFieldVarList
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Odb.OdbFrame import OdbFrame
 from ..Odb.OdbSet import OdbSet
 from ..PlotOptions.BasicOptions import BasicOptions
@@ -246,64 +247,66 @@ class OdbDisplay:
     fieldSteps: tuple = ()
 
     # An OdbFieldVarList object.
-    fieldVariables: OdbFieldVarList = OdbFieldVarList()
+    fieldVariables: OdbFieldVarList = lazyDefault(OdbFieldVarList)
 
     # An OdbModelFieldVarList object.
-    modelVariableList: OdbModelFieldVarList = OdbModelFieldVarList()
+    modelVariableList: OdbModelFieldVarList = lazyDefault(OdbModelFieldVarList)
 
     # A repository of OdbSet objects specifying the set label. The repository is read-only.
-    nodeSet: dict[str, OdbSet] = dict[str, OdbSet]()
+    nodeSet: dict[str, OdbSet] = lazyDefault(dict[str, OdbSet])
 
     # A repository of OdbSet objects specifying the set label. The repository is read-only.
-    elementSet: dict[str, OdbSet] = dict[str, OdbSet]()
+    elementSet: dict[str, OdbSet] = lazyDefault(dict[str, OdbSet])
 
     # A repository of OdbSet objects specifying the set label. The repository is read-only.
-    surfaceSet: dict[str, OdbSet] = dict[str, OdbSet]()
+    surfaceSet: dict[str, OdbSet] = lazyDefault(dict[str, OdbSet])
 
     # A DisplayOptions object.
-    display: DisplayOptions = DisplayOptions()
+    display: DisplayOptions = lazyDefault(DisplayOptions)
 
     # A ContourOptions object.
-    contourOptions: ContourOptions = ContourOptions()
+    contourOptions: ContourOptions = lazyDefault(ContourOptions)
 
     # A CommonOptions object.
-    commonOptions: CommonOptions = CommonOptions()
+    commonOptions: CommonOptions = lazyDefault(CommonOptions)
 
     # A SymbolOptions object.
-    symbolOptions: SymbolOptions = SymbolOptions()
+    symbolOptions: SymbolOptions = lazyDefault(SymbolOptions)
 
     # A SuperimposeOptions object.
-    superimposeOptions: SuperimposeOptions = SuperimposeOptions()
+    superimposeOptions: SuperimposeOptions = lazyDefault(SuperimposeOptions)
 
     # A DisplayBodyOptions object.
-    displayBodyOptions: DisplayBodyOptions = DisplayBodyOptions()
+    displayBodyOptions: DisplayBodyOptions = lazyDefault(DisplayBodyOptions)
 
     # A FreeBodyOptions object.
-    freeBodyOptions: FreeBodyOptions = FreeBodyOptions()
+    freeBodyOptions: FreeBodyOptions = lazyDefault(FreeBodyOptions)
 
     # A StreamOptions object.
-    streamOptions: StreamOptions = StreamOptions()
+    streamOptions: StreamOptions = lazyDefault(StreamOptions)
 
     # A ViewCutOptions object.
-    viewCutOptions: ViewCutOptions = ViewCutOptions()
+    viewCutOptions: ViewCutOptions = lazyDefault(ViewCutOptions)
 
     # A repository of ViewCut objects.
-    viewCuts: dict[str, ViewCut] = dict[str, ViewCut]()
+    viewCuts: dict[str, ViewCut] = lazyDefault(dict[str, ViewCut])
 
     # A DisplayGroup object specifying the current display group and referring to an object in
     # the *displayGroups* member of Session.
-    displayGroup: DisplayGroup = DisplayGroup("dg", Leaf(EMPTY_LEAF))
+    displayGroup: DisplayGroup = lazyDefault(
+        lambda: DisplayGroup("dg", Leaf(EMPTY_LEAF))
+    )
 
     # A DisplayGroupInstanceRepository object.
-    displayGroupInstances: DisplayGroupInstanceRepository = (
-        DisplayGroupInstanceRepository()
+    displayGroupInstances: DisplayGroupInstanceRepository = lazyDefault(
+        DisplayGroupInstanceRepository
     )
 
     # A BasicOptions object.
-    basicOptions: BasicOptions = BasicOptions()
+    basicOptions: BasicOptions = lazyDefault(BasicOptions)
 
     # An OrientationOptions object.
-    materialOrientationOptions: OrientationOptions = OrientationOptions()
+    materialOrientationOptions: OrientationOptions = lazyDefault(OrientationOptions)
 
     # A tuple of Strings specifying the step label and the frame label when the current step
     # is user defined. Alternatively, *fieldFrame* maybe specified as a pair of Ints with the
@@ -1,3 +1,4 @@
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -33,4 +34,4 @@ class GeometricRestriction:
     # A Region object specifying the region to which the geometric restriction is applied.
     # When used with a TopologyTask, there is no default value. When used with a ShapeTask,
     # the default value is MODEL.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .OptimizationObjectiveArray import OptimizationObjectiveArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class ObjectiveFunction:
@@ -22,7 +23,7 @@ class ObjectiveFunction:
     """
 
     # Optimization objectives
-    objectives: OptimizationObjectiveArray = OptimizationObjectiveArray()
+    objectives: OptimizationObjectiveArray = lazyDefault(OptimizationObjectiveArray)
 
     def __init__(
         self,
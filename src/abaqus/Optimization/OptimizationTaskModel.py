@@ -1,12 +1,16 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .BeadTask import BeadTask
-from .ShapeTask import ShapeTask
-from .SizingTask import SizingTask
-from .TopologyTask import TopologyTask
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from .BeadTask import BeadTask
+    from .ShapeTask import ShapeTask
+    from .SizingTask import SizingTask
+    from .TopologyTask import TopologyTask
+
 
 class OptimizationTaskModel(ModelBase):
     """Abaqus creates a Model object named `Model-1` when a session is started.
@@ -126,6 +130,7 @@ class OptimizationTaskModel(ModelBase):
         -------
             A BeadTask object.
         """
+        from .BeadTask import BeadTask
         self.optimizationTasks[name] = optimizationTask = BeadTask(
             name,
             abaqusSensitivities,
@@ -365,6 +370,7 @@ class OptimizationTaskModel(ModelBase):
         -------
             A ShapeTask object.
         """
+        from .ShapeTask import ShapeTask
         self.optimizationTasks[name] = optimizationTask = ShapeTask(
             name,
             abaqusSensitivities,
@@ -482,6 +488,7 @@ class OptimizationTaskModel(ModelBase):
         -------
             A SizingTask object.
         """
+        from .SizingTask import SizingTask
         self.optimizationTasks[name] = optimizationTask = SizingTask(
             name,
             abaqusSensitivities,
@@ -663,6 +670,7 @@ class OptimizationTaskModel(ModelBase):
         -------
             A TopologyTask object.
         """
+        from .TopologyTask import TopologyTask
         self.optimizationTasks[name] = optimizationTask = TopologyTask(
             name,
             abaqusSensitivities,
@@ -7,6 +7,7 @@ from .ObjectiveFunction import ObjectiveFunction
 from .OptimizationConstraint import OptimizationConstraint
 from .OptimizationTask import OptimizationTask
 from .StopCondition import StopCondition
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class TopologyTask(OptimizationTask):
@@ -38,23 +39,25 @@ class TopologyTask(OptimizationTask):
     """
 
     # A repository of DesignResponse objects.
-    designResponses: dict[str, DesignResponse] = dict[str, DesignResponse]()
+    designResponses: dict[str, DesignResponse] = lazyDefault(dict[str, DesignResponse])
 
     # A repository of ObjectiveFunction objects.
-    objectiveFunctions: dict[str, ObjectiveFunction] = dict[str, ObjectiveFunction]()
+    objectiveFunctions: dict[str, ObjectiveFunction] = lazyDefault(
+        dict[str, ObjectiveFunction]
+    )
 
     # A repository of OptimizationConstraint objects.
-    optimizationConstraints: dict[str, OptimizationConstraint] = dict[
-        str, OptimizationConstraint
-    ]()
+    optimizationConstraints: dict[str, OptimizationConstraint] = lazyDefault(
+        dict[str, OptimizationConstraint]
+    )
 
     # A repository of GeometricRestriction objects.
-    geometricRestrictions: dict[str, GeometricRestriction] = dict[
-        str, GeometricRestriction
-    ]()
+    geometricRestrictions: dict[str, GeometricRestriction] = lazyDefault(
+        dict[str, GeometricRestriction]
+    )
 
     # A repository of StopCondition objects.
-    stopConditions: dict[str, StopCondition] = dict[str, StopCondition]()
+    stopConditions: dict[str, StopCondition] = lazyDefault(dict[str, StopCondition])
 
     def __init__(
         self,
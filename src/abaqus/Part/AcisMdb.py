@@ -1,7 +1,13 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .AcisFile import AcisFile
 from ..Mdb.MdbBase import MdbBase
 
+if typing.TYPE_CHECKING:
+    from .AcisFile import AcisFile
+
 
 class AcisMdb(MdbBase):
     """The Mdb object is the high-level Abaqus model database. A model database stores models
@@ -49,6 +55,7 @@ class AcisMdb(MdbBase):
             - The data in the ACIS file are corrupted.
               Texterror: Failed to read ACIS file.
         """
+        from .AcisFile import AcisFile
         return AcisFile()
 
     @staticmethod
@@ -91,6 +98,7 @@ class AcisMdb(MdbBase):
         -------
             An AcisFile object.
         """
+        from .AcisFile import AcisFile
         return AcisFile()
 
     @staticmethod
@@ -135,6 +143,7 @@ class AcisMdb(MdbBase):
         -------
             An AcisFile object.
         """
+        from .AcisFile import AcisFile
         return AcisFile()
 
     @staticmethod
@@ -200,6 +209,7 @@ class AcisMdb(MdbBase):
             - The data in the IGES file are corrupted.
               Texterror: Failed to read IGES file.
         """
+        from .AcisFile import AcisFile
         return AcisFile()
 
     @staticmethod
@@ -230,6 +240,7 @@ class AcisMdb(MdbBase):
         -------
             An AcisFile object.
         """
+        from .AcisFile import AcisFile
         return AcisFile()
 
     @staticmethod
@@ -262,6 +273,7 @@ class AcisMdb(MdbBase):
             - The data in the STEP file are corrupted.
               Texterror: Failed to read STEP file.
         """
+        from .AcisFile import AcisFile
         return AcisFile()
 
     @staticmethod
@@ -291,6 +303,7 @@ class AcisMdb(MdbBase):
             - The data in the VDA-FS file are corrupted.
               Texterror: Failed to read VDA file.
         """
+        from .AcisFile import AcisFile
         return AcisFile()
 
     @staticmethod
@@ -326,4 +339,5 @@ class AcisMdb(MdbBase):
             - The data in the Solidworks file are corrupted.
               Texterror: Failed to read Solidworks file.
         """
+        from .AcisFile import AcisFile
         return AcisFile()
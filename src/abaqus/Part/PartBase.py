@@ -18,6 +18,7 @@ from ..BasicGeometry.VertexArray import VertexArray
 from ..Datum.Datum import Datum
 from ..Datum.DatumCsys import DatumCsys
 from ..EngineeringFeature.EngineeringFeature import EngineeringFeature
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Mesh.MeshEdge import MeshEdge
 from ..Mesh.MeshEdgeArray import MeshEdgeArray
 from ..Mesh.MeshElement import MeshElement
@@ -167,104 +168,107 @@ class PartBase(Feature):
     timeStamp: float = None
 
     # A VertexArray object specifying all the vertices in the part.
-    vertices: VertexArray = VertexArray([])
+    vertices: VertexArray = lazyDefault(lambda: VertexArray([]))
 
     # An IgnoredVertexArray object specifying all the ignored vertices in the part.
-    ignoredVertices: IgnoredVertexArray = IgnoredVertexArray()
+    ignoredVertices: IgnoredVertexArray = lazyDefault(IgnoredVertexArray)
 
     # An EdgeArray object specifying all the edges in the part.
-    edges: EdgeArray = EdgeArray([])
+    edges: EdgeArray = lazyDefault(lambda: EdgeArray([]))
 
     # An IgnoredEdgeArray object specifying all the ignored edges in the part.
-    ignoredEdges: IgnoredEdgeArray = IgnoredEdgeArray()
+    ignoredEdges: IgnoredEdgeArray = lazyDefault(IgnoredEdgeArray)
 
     # A FaceArray object specifying all the faces in the part.
-    faces: FaceArray = FaceArray([])
+    faces: FaceArray = lazyDefault(lambda: FaceArray([]))
 
     # A CellArray object specifying all the cells in the part.
-    cells: CellArray = CellArray([])
+    cells: CellArray = lazyDefault(lambda: CellArray([]))
 
     # A repository of Feature objects specifying all the features in the part.
-    features: dict[str, Feature] = dict[str, Feature]()
+    features: dict[str, Feature] = lazyDefault(dict[str, Feature])
 
     # A repository of Feature objects specifying all Feature objects in the part. The Feature
     # objects in the featuresById repository are the same as the Feature objects in the
     # features' repository. However, the key to the objects in the featuresById repository is
     # an integer specifying the *ID*, whereas the key to the objects in the features
     # repository is a string specifying the *name*.
-    featuresById: dict[str, Feature] = dict[str, Feature]()
+    featuresById: dict[str, Feature] = lazyDefault(dict[str, Feature])
 
     # A repository of Datum objects specifying all the datums in the part.
-    datums: list[Datum] = list[Datum]()
+    datums: list[Datum] = lazyDefault(list[Datum])
 
     # A MeshElementArray object specifying all the elements in the part.
-    elements: MeshElementArray = MeshElementArray([])
+    elements: MeshElementArray = lazyDefault(lambda: MeshElementArray([]))
 
     # A repository of MeshFace objects specifying all the element faces in the part. For a
     # given element and a given face index within that element, the corresponding MeshFace
     # object can be retrieved from the repository by using the key calculated as (i*8 + j),
     # where i and j are zero-based element and face indices, respectively.
-    elemFaces: dict[str, MeshFace] = dict[str, MeshFace]()
+    elemFaces: dict[str, MeshFace] = lazyDefault(dict[str, MeshFace])
 
     # A MeshFaceArray object specifying all the unique element faces in the part.
-    elementFaces: MeshFaceArray = MeshFaceArray([])
+    elementFaces: MeshFaceArray = lazyDefault(lambda: MeshFaceArray([]))
 
     # A MeshNodeArray object specifying all the nodes in the part.
-    nodes: MeshNodeArray = MeshNodeArray([])
+    nodes: MeshNodeArray = lazyDefault(lambda: MeshNodeArray([]))
 
     # A MeshNodeArray object specifying all the retained nodes in the substructure part.
-    retainedNodes: MeshNodeArray = MeshNodeArray([])
+    retainedNodes: MeshNodeArray = lazyDefault(lambda: MeshNodeArray([]))
 
     # A repository of Set objects specifying for more information, see Set.
-    sets: dict[str, Set] = dict[str, Set]()
+    sets: dict[str, Set] = lazyDefault(dict[str, Set])
 
     # A repository of Set objects specifying the contents of the *allSets* repository is the
     # same as the contents of the *sets* repository.
-    allSets: dict[str, Set] = dict[str, Set]()
+    allSets: dict[str, Set] = lazyDefault(dict[str, Set])
 
     # A repository of Set objects specifying picked regions.
-    allInternalSets: dict[str, Set] = dict[str, Set]()
+    allInternalSets: dict[str, Set] = lazyDefault(dict[str, Set])
 
     # A repository of Surface objects specifying for more information, see Surface.
-    surfaces: dict[str, Surface] = dict[str, Surface]()
+    surfaces: dict[str, Surface] = lazyDefault(dict[str, Surface])
 
     # A repository of Surface objects specifying the contents of the *allSurfaces* repository
     # is the same as the contents of the *surfaces* repository.
-    allSurfaces: dict[str, Surface] = dict[str, Surface]()
+    allSurfaces: dict[str, Surface] = lazyDefault(dict[str, Surface])
 
     # A repository of Surface objects specifying picked regions.
-    allInternalSurfaces: dict[str, Surface] = dict[str, Surface]()
+    allInternalSurfaces: dict[str, Surface] = lazyDefault(dict[str, Surface])
 
     # A repository of Skin objects specifying the skins created on the part.
-    skins: dict[str, Skin] = dict[str, Skin]()
+    skins: dict[str, Skin] = lazyDefault(dict[str, Skin])
 
     # A repository of Stringer objects specifying the stringers created on the part.
-    stringers: dict[str, Stringer] = dict[str, Stringer]()
+    stringers: dict[str, Stringer] = lazyDefault(dict[str, Stringer])
 
     # A repository of ReferencePoint objects.
-    referencePoints: ReferencePoints = ReferencePoints()
+    referencePoints: ReferencePoints = lazyDefault(ReferencePoints)
 
     # An EngineeringFeature object.
-    engineeringFeatures: EngineeringFeature = EngineeringFeature()
+    engineeringFeatures: EngineeringFeature = lazyDefault(EngineeringFeature)
 
     # A SectionAssignmentArray object.
-    sectionAssignments: SectionAssignmentArray = SectionAssignmentArray()
+    sectionAssignments: SectionAssignmentArray = lazyDefault(SectionAssignmentArray)
+
+    # The nodes and the elements of a part created by PartFromNodesAndElements, or None.
+    _orphanMesh: typing.NamedTuple = None
 
     # A MaterialOrientationArray object.
-    materialOrientations: MaterialOrientationArray = MaterialOrientationArray()
+    materialOrientations: MaterialOrientationArray = lazyDefault(MaterialOrientationArray)
 
     # A repository of CompositeLayup objects.
-    compositeLayups: dict[str, CompositeLayup] = dict[str, CompositeLayup]()
+    compositeLayups: dict[str, CompositeLayup] = lazyDefault(dict[str, CompositeLayup])
 
     # A repository of MeshEdge objects specifying all the element edges in the part. For a
     # given element and a given edge index on a given face within that element, the
     # corresponding MeshEdge object can be retrieved from the repository by using the key
     # calculated as (i*32 + j*4 + k), where i, j, and k are zero-based element, face, and edge
     # indices, respectively.
-    elemEdges: dict[str, MeshEdge] = dict[str, MeshEdge]()
+    elemEdges: dict[str, MeshEdge] = lazyDefault(dict[str, MeshEdge])
 
     # A MeshEdgeArray object specifying all the unique element edges in the part.
-    elementEdges: MeshEdgeArray = MeshEdgeArray([])
+    elementEdges: MeshEdgeArray = lazyDefault(lambda: MeshEdgeArray([]))
 
     @typing.overload
     def __init__(
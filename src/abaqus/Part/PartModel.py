@@ -1,6 +1,21 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
 from ..Model.ModelBase import ModelBase
-from ..Part.Part import Part
+
+if typing.TYPE_CHECKING:
+    from ..Part.Part import Part
+
+
+class _OrphanMesh(typing.NamedTuple):
+    """The nodes and the elements of a part created from nodes and elements."""
+
+    dimensionality: SymbolicConstant
+    nodeLabels: typing.Any
+    coordinates: typing.Any
+    elements: list
 
 
 class PartModel(ModelBase):
@@ -52,5 +67,82 @@ class PartModel(ModelBase):
         -------
             A Part object.
         """
+        from ..Part.Part import Part
+        self.parts[name] = part = Part(name, dimensionality, type, twist)
+        return part
+
+    def PartFromNodesAndElements(
+        self,
+        name: str,
+        dimensionality: SymbolicConstant,
+        type: SymbolicConstant,
+        nodes: tuple,
+        elements: tuple,
+        twist: Boolean = OFF,
+    ):
+        """This method creates a Part object from nodes and elements and places it in the parts
+        repository. The labels, the coordinates and the connectivity are kept as arrays, they
+        are written by ModelJob.writeInput().
+
+        Notes
+        -----
+            This function can be accessed by:
+
+            .. code-block:: python
+
+                mdb.models[name].PartFromNodesAndElements
+
+        Parameters
+        ----------
+        name
+            A String specifying the repository key.
+        dimensionality
+            A SymbolicConstant specifying the dimensionality of the part. Possible values are
+            THREE_D, TWO_D_PLANAR, and AXISYMMETRIC.
+        type
+            A SymbolicConstant specifying the type of the part. Possible values are DEFORMABLE_BODY,
+            EULERIAN, DISCRETE_RIGID_SURFACE, and ANALYTIC_RIGID_SURFACE.
+        nodes
+            A sequence of (*nodeLabels*, *nodeCoords*) specifying the nodes of the mesh.
+            *nodeLabels* is a sequence of Ints specifying the node labels, and *nodeCoords* is a
+            sequence of sequences of three Floats specifying the nodal coordinates.
+        elements
+            A sequence of sequences of(*meshType*, *elementLabels*, *elementConns*) specifying the
+            elements of the mesh. *meshType* is a String specifying the element type.
+            *elementlabels* is a sequence of Ints specifying the element labels. *elementConns* is a
+            sequence of sequences of node labels specifying the element connectivity.
+        twist
+            A boolean specifying whether the part is defined with twist. This option has meaning
+            only when *dimensionality*=AXISYMMETRIC. Possible values are ON and OFF. The default
+            value is OFF.
+
+        Returns
+        -------
+            A Part object.
+
+        Raises
+        ------
+        ValueError
+            If the numbers of labels and of coordinates or connectivities are not the same.
+        """
+        import numpy
+
+        from ..Part.Part import Part
+
+        nodeLabels, coordinates = nodes
+        nodeLabels = numpy.asarray(nodeLabels, dtype=numpy.int64).reshape(-1)
+        coordinates = numpy.asarray(coordinates, dtype=numpy.float64)
+        if coordinates.ndim != 2 or len(coordinates) != len(nodeLabels):
+            raise ValueError("The numbers of node labels and of node coordinates are not the same")
+        blocks = []
+        for meshType, elementLabels, elementConns in elements:
+            elementLabels = numpy.asarray(elementLabels, dtype=numpy.int64).reshape(-1)
+            elementConns = numpy.asarray(elementConns, dtype=numpy.int64)
+            if elementConns.ndim != 2 or len(elementConns) != len(elementLabels):
+                raise ValueError(
+                    "The numbers of labels and of connectivities of the {} elements are not the same".format(meshType)
+                )
+            blocks.append((str(meshType), elementLabels, elementConns))
         self.parts[name] = part = Part(name, dimensionality, type, twist)
+        part._orphanMesh = _OrphanMesh(dimensionality, nodeLabels, coordinates, blocks)
         return part
@@ -1,6 +1,7 @@
 import typing
 
 from abaqusConstants import *
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class Path:
@@ -28,7 +29,7 @@ class Path:
     # If *type*=NODE_LIST, *coordinates* is a sequence of tuples of three Floats. This can be
     # used as the value for the *expression* argument when creating a Path object of *type* =
     # POINT_LIST.
-    coordinates: list[tuple[float]] = []
+    coordinates: list[tuple[float]] = lazyDefault(list)
 
     def __init__(
         self,
@@ -1,11 +1,15 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .Path import Path
-from .Spectrum import Spectrum
-from .Stream import Stream
 from ..Session.SessionBase import SessionBase
 
+if typing.TYPE_CHECKING:
+    from .Path import Path
+    from .Spectrum import Spectrum
+    from .Stream import Stream
+
 
 class PathSession(SessionBase):
     def Path(
@@ -100,6 +104,7 @@ class PathSession(SessionBase):
             ValueError: When *type*=CIRCUMFERENTIAL or RADIAL, the three points specified in
             *expression* are collinear.
         """
+        from .Path import Path
         self.paths[name] = path = Path(
             name,
             type,
@@ -137,6 +142,7 @@ class PathSession(SessionBase):
         -------
             A Spectrum object.
         """
+        from .Spectrum import Spectrum
         self.spectrums[name] = spectrum = Spectrum(name, colors)
         return spectrum
 
@@ -177,6 +183,7 @@ class PathSession(SessionBase):
         -------
             A Stream object.
         """
+        from .Stream import Stream
         self.streams[name] = stream = Stream(
             name, numPointsOnRake, pointA, pointB, path
         )
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from ..Datum.DatumCsys import DatumCsys
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class BasicOptions:
@@ -656,7 +657,7 @@ class BasicOptions:
 
     # A DatumCsys object specifying the coordinate system to use for results transformation
     # when *transformationType*=USER_SPECIFIED.
-    datumCsys: DatumCsys = DatumCsys()
+    datumCsys: DatumCsys = lazyDefault(DatumCsys)
 
     # A tuple of Ints specifying which sectors to display when
     # *sectorSelectionType*=SELECT_BY_NUMBER. Possible values are 1 ≤≤ *selectedSectorNumbers*
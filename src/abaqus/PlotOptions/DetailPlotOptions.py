@@ -1,4 +1,5 @@
 from .PlyStackPlotOptions import PlyStackPlotOptions
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class DetailPlotOptions:
@@ -22,4 +23,4 @@ class DetailPlotOptions:
     """
 
     # A PlyStackPlotOptions object.
-    plyStackPlotOptions: PlyStackPlotOptions = PlyStackPlotOptions()
+    plyStackPlotOptions: PlyStackPlotOptions = lazyDefault(PlyStackPlotOptions)
@@ -1,5 +1,6 @@
 from .MdbDataInstance import MdbDataInstance
 from .MdbDataStep import MdbDataStep
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class MdbData:
@@ -34,8 +35,8 @@ class MdbData:
 
     # A repository of MdbDataStep objects specifying the list of steps. The repository is
     # read-only.
-    steps: dict[str, MdbDataStep] = dict[str, MdbDataStep]()
+    steps: dict[str, MdbDataStep] = lazyDefault(dict[str, MdbDataStep])
 
     # A repository of MdbDataInstance objects specifying the list of instances. The repository
     # is read-only.
-    instances: dict[str, MdbDataInstance] = dict[str, MdbDataInstance]()
+    instances: dict[str, MdbDataInstance] = lazyDefault(dict[str, MdbDataInstance])
@@ -1,4 +1,5 @@
 from .MdbDataFrameArray import MdbDataFrameArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class MdbDataStep:
@@ -23,4 +24,4 @@ class MdbDataStep:
 
     # A MdbDataFrameArray object specifying the list of frames. The list is read-only. There
     # is only one frame in a step.
-    frames: MdbDataFrameArray = MdbDataFrameArray()
+    frames: MdbDataFrameArray = lazyDefault(MdbDataFrameArray)
@@ -1,4 +1,5 @@
 from .OdbAuxiliaryData import OdbAuxiliaryData
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class OdbAnalysisError:
@@ -60,7 +61,7 @@ class OdbAnalysisError:
     category: str = ""
 
     # An OdbAuxiliaryData object.
-    data: OdbAuxiliaryData = OdbAuxiliaryData()
+    data: OdbAuxiliaryData = lazyDefault(OdbAuxiliaryData)
 
     # String specifying the cause of the error. This attribute is read-only.
     description: str = ""
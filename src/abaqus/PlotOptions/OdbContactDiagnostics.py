@@ -1,4 +1,5 @@
 from .OdbAuxiliaryData import OdbAuxiliaryData
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class OdbContactDiagnostics:
@@ -35,7 +36,7 @@ class OdbContactDiagnostics:
     """
 
     # A repository of OdbAuxiliaryData objects. This attribute is read-only.
-    data: dict[str, OdbAuxiliaryData] = dict[str, OdbAuxiliaryData]()
+    data: dict[str, OdbAuxiliaryData] = lazyDefault(dict[str, OdbAuxiliaryData])
 
     # A string specifying the opening/overclosure status of the contact. This attribute is
     # read-only.
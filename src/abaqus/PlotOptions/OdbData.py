@@ -13,6 +13,7 @@ from .OdbDataSurfaceSet import OdbDataSurfaceSet
 from .OdbDiagnosticData import OdbDiagnosticData
 from .RigidBodyConstraint import RigidBodyConstraint
 from .TieConstraint import TieConstraint
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class OdbData:
@@ -110,68 +111,82 @@ class OdbData:
 
     # A repository of HistoryVariable objects specifying the history request label. The
     # repository is read-only.
-    historyVariables: dict[str, HistoryVariable] = dict[str, HistoryVariable]()
+    historyVariables: dict[str, HistoryVariable] = lazyDefault(
+        dict[str, HistoryVariable]
+    )
 
     # A repository of OdbDataStep objects specifying the list of steps. The repository is
     # read-only.
-    steps: dict[str, OdbDataStep] = dict[str, OdbDataStep]()
+    steps: dict[str, OdbDataStep] = lazyDefault(dict[str, OdbDataStep])
 
     # A repository of OdbDataInstance objects specifying the list of instances. The repository
     # is read-only.
-    instances: dict[str, OdbDataInstance] = dict[str, OdbDataInstance]()
+    instances: dict[str, OdbDataInstance] = lazyDefault(dict[str, OdbDataInstance])
 
     # A repository of OdbDataMaterial objects specifying the list of materials. The repository
     # is read-only.
-    materials: dict[str, OdbDataMaterial] = dict[str, OdbDataMaterial]()
+    materials: dict[str, OdbDataMaterial] = lazyDefault(dict[str, OdbDataMaterial])
 
     # A repository of OdbDataSection objects specifying the list of sections. The repository
     # is read-only.
-    sections: dict[str, OdbDataSection] = dict[str, OdbDataSection]()
+    sections: dict[str, OdbDataSection] = lazyDefault(dict[str, OdbDataSection])
 
     # A repository of OdbDataElementSet objects specifying the list of element sets. The
     # repository is read-only.
-    elementSets: dict[str, OdbDataElementSet] = dict[str, OdbDataElementSet]()
+    elementSets: dict[str, OdbDataElementSet] = lazyDefault(
+        dict[str, OdbDataElementSet]
+    )
 
     # A repository of OdbDataNodeSet objects specifying the list of node sets. The repository
     # is read-only.
-    nodeSets: dict[str, OdbDataNodeSet] = dict[str, OdbDataNodeSet]()
+    nodeSets: dict[str, OdbDataNodeSet] = lazyDefault(dict[str, OdbDataNodeSet])
 
     # A repository of OdbDataSurfaceSet objects specifying the list of surface sets. The
     # repository is read-only.
-    surfaceSets: dict[str, OdbDataSurfaceSet] = dict[str, OdbDataSurfaceSet]()
+    surfaceSets: dict[str, OdbDataSurfaceSet] = lazyDefault(
+        dict[str, OdbDataSurfaceSet]
+    )
 
     # A repository of OdbDataDatumCsys objects specifying the list of coordinate systems
     # defined in the model. The repository is read-only.
-    datumCsyses: dict[str, OdbDataDatumCsys] = dict[str, OdbDataDatumCsys]()
+    datumCsyses: dict[str, OdbDataDatumCsys] = lazyDefault(dict[str, OdbDataDatumCsys])
 
     # A repository of CouplingConstraint objects specifying the list of kinematic couplings.
     # The repository is read-only.
-    kinematicCouplings: dict[str, CouplingConstraint] = dict[str, CouplingConstraint]()
+    kinematicCouplings: dict[str, CouplingConstraint] = lazyDefault(
+        dict[str, CouplingConstraint]
+    )
 
     # A repository of CouplingConstraint objects specifying the list of distributing
     # couplings. The repository is read-only.
-    distributingCouplings: dict[str, CouplingConstraint] = dict[
-        str, CouplingConstraint
-    ]()
+    distributingCouplings: dict[str, CouplingConstraint] = lazyDefault(
+        dict[str, CouplingConstraint]
+    )
 
     # A repository of CouplingConstraint objects specifying the list of shellsolid couplings.
     # The repository is read-only.
-    shellSolidCouplings: dict[str, CouplingConstraint] = dict[str, CouplingConstraint]()
+    shellSolidCouplings: dict[str, CouplingConstraint] = lazyDefault(
+        dict[str, CouplingConstraint]
+    )
 
     # A repository of RigidBodyConstraint objects specifying the list of rigid body
     # constraints. The repository is read-only.
-    rigidbodies: dict[str, RigidBodyConstraint] = dict[str, RigidBodyConstraint]()
+    rigidbodies: dict[str, RigidBodyConstraint] = lazyDefault(
+        dict[str, RigidBodyConstraint]
+    )
 
     # A repository of MpcConstraint objects specifying the list of multipoint constraints. The
     # repository is read-only.
-    multiPointConstraints: dict[str, MpcConstraint] = dict[str, MpcConstraint]()
+    multiPointConstraints: dict[str, MpcConstraint] = lazyDefault(
+        dict[str, MpcConstraint]
+    )
 
     # A repository of TieConstraint objects specifying the list of Tie constraints. The
     # repository is read-only.
-    ties: dict[str, TieConstraint] = dict[str, TieConstraint]()
+    ties: dict[str, TieConstraint] = lazyDefault(dict[str, TieConstraint])
 
     # An OdbDiagnosticData object.
-    diagnosticData: OdbDiagnosticData = OdbDiagnosticData()
+    diagnosticData: OdbDiagnosticData = lazyDefault(OdbDiagnosticData)
 
     def setValues(self, activeFrames: SymbolicConstant = None, stepPeriods: tuple = ()):
         """This method modifies the OdbData object.
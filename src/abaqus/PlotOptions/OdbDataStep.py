@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .OdbDataFrameArray import OdbDataFrameArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class OdbDataStep:
@@ -22,7 +23,7 @@ class OdbDataStep:
     """
 
     # An OdbDataFrameArray object specifying the list of frames. The list is read-only.
-    frames: OdbDataFrameArray = OdbDataFrameArray()
+    frames: OdbDataFrameArray = lazyDefault(OdbDataFrameArray)
 
     def setValues(self, activateFrames: Boolean, update: Boolean = OFF):
         """This method modifies the OdbDataStep object.
@@ -4,6 +4,7 @@ from .OdbAnalysisWarning import OdbAnalysisWarning
 from .OdbDiagnosticStep import OdbDiagnosticStep
 from .OdbJobTime import OdbJobTime
 from .OdbNumericalProblemSummary import OdbNumericalProblemSummary
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class OdbDiagnosticData:
@@ -50,19 +51,25 @@ class OdbDiagnosticData:
     """
 
     # A repository of OdbAnalysisError objects.
-    analysisErrors: dict[str, OdbAnalysisError] = dict[str, OdbAnalysisError]()
+    analysisErrors: dict[str, OdbAnalysisError] = lazyDefault(
+        dict[str, OdbAnalysisError]
+    )
 
     # A repository of OdbAnalysisWarning objects.
-    analysisWarnings: dict[str, OdbAnalysisWarning] = dict[str, OdbAnalysisWarning]()
+    analysisWarnings: dict[str, OdbAnalysisWarning] = lazyDefault(
+        dict[str, OdbAnalysisWarning]
+    )
 
     # A repository of OdbDiagnosticStep objects.
-    steps: dict[str, OdbDiagnosticStep] = dict[str, OdbDiagnosticStep]()
+    steps: dict[str, OdbDiagnosticStep] = lazyDefault(dict[str, OdbDiagnosticStep])
 
     # An OdbJobTime object.
-    jobTime: OdbJobTime = OdbJobTime()
+    jobTime: OdbJobTime = lazyDefault(OdbJobTime)
 
     # An OdbNumericalProblemSummary object.
-    numericalProblemSummary: OdbNumericalProblemSummary = OdbNumericalProblemSummary()
+    numericalProblemSummary: OdbNumericalProblemSummary = lazyDefault(
+        OdbNumericalProblemSummary
+    )
 
     # A boolean specifying whether or not double precision is used for the analysis. This
     # attribute is read-only.
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .OdbDiagnosticAttempt import OdbDiagnosticAttempt
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class OdbDiagnosticIncrement:
@@ -38,7 +39,9 @@ class OdbDiagnosticIncrement:
     """
 
     # A repository of OdbDiagnosticAttempt objects.
-    attempts: dict[str, OdbDiagnosticAttempt] = dict[str, OdbDiagnosticAttempt]()
+    attempts: dict[str, OdbDiagnosticAttempt] = lazyDefault(
+        dict[str, OdbDiagnosticAttempt]
+    )
 
     # A float specifying the size of the initial increment. This attribute is read-only.
     initialSize: str = ""
@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .OdbContactDiagnostics import OdbContactDiagnostics
 from .OdbDiagnosticIncrement import OdbDiagnosticIncrement
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class OdbDiagnosticStep:
@@ -95,9 +96,9 @@ class OdbDiagnosticStep:
     characteristicElementLength: str = ""
 
     # A repository of OdbContactDiagnostics objects.
-    contactDiagnostics: dict[str, OdbContactDiagnostics] = dict[
-        str, OdbContactDiagnostics
-    ]()
+    contactDiagnostics: dict[str, OdbContactDiagnostics] = lazyDefault(
+        dict[str, OdbContactDiagnostics]
+    )
 
     # A sequence of string specifying the explicit increment status. This attribute is
     # read-only.
@@ -115,7 +116,9 @@ class OdbDiagnosticStep:
     incrementsCompleted: str = ""
 
     # A repository of OdbDiagnosticIncrement objects.
-    increments: dict[str, OdbDiagnosticIncrement] = dict[str, OdbDiagnosticIncrement]()
+    increments: dict[str, OdbDiagnosticIncrement] = lazyDefault(
+        dict[str, OdbDiagnosticIncrement]
+    )
 
     # A float specifying the initial increment size for the step. This attribute is read-only.
     initialTimeIncrement: str = ""
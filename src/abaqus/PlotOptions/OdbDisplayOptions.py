@@ -4,6 +4,7 @@ from .DGDisplayBodyOptions import DGDisplayBodyOptions
 from .DGOrientationOptions import DGOrientationOptions
 from .DGSuperimposeOptions import DGSuperimposeOptions
 from .DGSymbolOptions import DGSymbolOptions
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class OdbDisplayOptions:
@@ -46,19 +47,19 @@ class OdbDisplayOptions:
     """
 
     # A DGCommonOptions object.
-    commonOptions: DGCommonOptions = DGCommonOptions()
+    commonOptions: DGCommonOptions = lazyDefault(DGCommonOptions)
 
     # A DGSuperimposeOptions object.
-    superimposeOptions: DGSuperimposeOptions = DGSuperimposeOptions()
+    superimposeOptions: DGSuperimposeOptions = lazyDefault(DGSuperimposeOptions)
 
     # A DGContourOptions object.
-    contourOptions: DGContourOptions = DGContourOptions()
+    contourOptions: DGContourOptions = lazyDefault(DGContourOptions)
 
     # A DGSymbolOptions object.
-    symbolOptions: DGSymbolOptions = DGSymbolOptions()
+    symbolOptions: DGSymbolOptions = lazyDefault(DGSymbolOptions)
 
     # A DGOrientationOptions object.
-    materialOrientationOptions: DGOrientationOptions = DGOrientationOptions()
+    materialOrientationOptions: DGOrientationOptions = lazyDefault(DGOrientationOptions)
 
     # A DGDisplayBodyOptions object.
-    displayBodyOptions: DGDisplayBodyOptions = DGDisplayBodyOptions()
+    displayBodyOptions: DGDisplayBodyOptions = lazyDefault(DGDisplayBodyOptions)
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .PredefinedField import PredefinedField
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -60,7 +61,7 @@ class Field(PredefinedField):
     # is ignored if the predefined field has an *instances* member available. *Region* is also
     # ignored if the predefined field has a *distributionType* member available, and
     # *distributionType*=FROM_FILE or FROM_FILE_AND_USER_DEFINED.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     def __init__(
         self,
@@ -1,4 +1,5 @@
 from .PredefinedField import PredefinedField
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -28,7 +29,7 @@ class FluidCavityPressure(PredefinedField):
     """
 
     # A Region object on which the *fluidCavity* interaction is specified.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     def __init__(self, name: str, fluidCavity: str, fluidPressure: float):
         """This method creates a FluidCavityPressure object.
@@ -1,3 +1,4 @@
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -28,7 +29,7 @@ class IMAField:
 
     # A Region object specifying the sub-region of the selected part instance to which the
     # volume fractions will be applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     # A tuple of Strings specifying the name of the discrete fields that contain the volume
     # fraction data. The length of the tuple corresponds to the number of material instance
@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .PredefinedField import PredefinedField
 from ..Assembly.PartInstanceArray import PartInstanceArray
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -30,7 +31,7 @@ class MaterialAssignment(PredefinedField):
     """
 
     # A Region object specifying the region to which the predefined field is applied.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     def __init__(
         self,
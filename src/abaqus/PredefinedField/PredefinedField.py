@@ -1,4 +1,5 @@
 from .IMAField import IMAField
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -40,10 +41,10 @@ class PredefinedField:
     # is ignored if the predefined field has an *instances* member available. *Region* is also
     # ignored if the predefined field has a *distributionType* member available, and
     # *distributionType*=FROM_FILE or FROM_FILE_AND_USER_DEFINED.
-    region: Region = Region()
+    region: Region = lazyDefault(Region)
 
     # An IMAField for MaterialAssignment predefined field。
-    fieldList: IMAField = IMAField()
+    fieldList: IMAField = lazyDefault(IMAField)
 
     def move(self, fromStepName: str, toStepName: str):
         """This method moves a specific PredefinedFieldState object from one step to a different
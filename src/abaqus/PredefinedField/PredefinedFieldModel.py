@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
 from .Field import Field
 from .FluidCavityPressure import FluidCavityPressure
@@ -7,9 +11,11 @@ from .MaterialAssignment import MaterialAssignment
 from .Stress import Stress
 from .Temperature import Temperature
 from .Velocity import Velocity
-from ..Assembly.PartInstanceArray import PartInstanceArray
 from ..Model.ModelBase import ModelBase
-from ..Region.Region import Region
+
+if typing.TYPE_CHECKING:
+    from ..Assembly.PartInstanceArray import PartInstanceArray
+    from ..Region.Region import Region
 
 
 class PredefinedFieldModel(
@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .CompositePly import CompositePly
 from .CompositePlyArray import CompositePlyArray
 from .MaterialOrientation import MaterialOrientation
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 from ..Section.CompositeShellSection import CompositeShellSection
 from ..Section.GeometryShellSection import GeometryShellSection
@@ -39,13 +40,13 @@ class CompositeLayup:
     """
 
     # A GeometryShellSection object.
-    section: GeometryShellSection = GeometryShellSection()
+    section: GeometryShellSection = lazyDefault(GeometryShellSection)
 
     # A MaterialOrientation object.
-    orientation: MaterialOrientation = MaterialOrientation()
+    orientation: MaterialOrientation = lazyDefault(MaterialOrientation)
 
     # A CompositePlyArray object specifying the plies that make up this composite layup.
-    plies: CompositePlyArray = CompositePlyArray()
+    plies: CompositePlyArray = lazyDefault(CompositePlyArray)
 
     def __init__(
         self,
@@ -1,6 +1,11 @@
-from ..Odb.Odb import Odb
-from ..Part.Part import Part
-from ..Region.Region import Region
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from ..Odb.Odb import Odb
+    from ..Part.Part import Part
+    from ..Region.Region import Region
 
 
 class PlyStackPlot:
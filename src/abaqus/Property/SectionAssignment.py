@@ -34,6 +34,29 @@ class SectionAssignment:
     # value is OFF.
     suppressed: Boolean = OFF
 
+    # A Set object specifying the region to which the section is assigned.
+    region: Set = None
+
+    # A String specifying the name of the section.
+    sectionName: str = ""
+
+    # A SymbolicConstant specifying section thickness assignment method. Possible values
+    # are FROM_SECTION and FROM_GEOMETRY. The default value is FROM_SECTION.
+    thicknessAssignment: SymbolicConstant = FROM_SECTION
+
+    # A Float specifying the offset of the shell section. The default value is 0.0.
+    offset: float = 0
+
+    # A SymbolicConstant specifying the method used to define the shell offset. If
+    # *offsetType* is set to OFFSET_FIELD the *offsetField* must have a value. Possible
+    # values are SINGLE_VALUE, MIDDLE_SURFACE, TOP_SURFACE, BOTTOM_SURFACE,
+    # FROM_GEOMETRY, and OFFSET_FIELD. The default value is SINGLE_VALUE.
+    offsetType: SymbolicConstant = SINGLE_VALUE
+
+    # A String specifying the name of the field specifying the offset. The default value
+    # is "".
+    offsetField: str = ""
+
     def __init__(
         self,
         region: Set,
@@ -78,7 +101,12 @@ class SectionAssignment:
         -------
             A SectionAssignment object.
         """
-        pass
+        self.region = region
+        self.sectionName = sectionName
+        self.thicknessAssignment = thicknessAssignment
+        self.offset = offset
+        self.offsetType = offsetType
+        self.offsetField = offsetField
 
     def resume(self):
         """This method resumes the section assignment that was previously suppressed."""
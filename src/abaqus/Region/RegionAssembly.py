@@ -1,8 +1,10 @@
 import typing
 
+from abaqusConstants import *
+
 from .Region import Region
 from .RegionAssemblyBase import RegionAssemblyBase
-from .Set import Set
+from .Set import Set, _labelsByInstance
 from .Surface import Surface
 from ..BasicGeometry.Cell import Cell
 from ..BasicGeometry.Edge import Edge
@@ -234,3 +236,90 @@ class RegionAssembly(RegionAssemblyBase):
     def Set(self, name, *args, **kwargs):
         self.sets[name] = aSet = Set(name, *args, **kwargs)
         return aSet
+
+    def SetFromElementLabels(self, name: str, elementLabels: tuple) -> Set:
+        """This method creates a set from a sequence of element labels in a model database.
+
+        Notes
+        -----
+            This function can be accessed by:
+
+            .. code-block:: python
+
+                mdb.models[name].rootAssembly.SetFromElementLabels
+
+        Parameters
+        ----------
+        name
+            A String specifying the repository key.
+        elementLabels
+            A sequence of element labels. An element label is a sequence of Int element identifiers.
+            For example, for an assembly:`elementLabels=(('Instance-1', (2,3,5,7)), ('Instance-2', (1,2,3)))`
+
+        Returns
+        -------
+        set: Set
+            A Set object
+        """
+        self.sets[name] = aSet = Set(name)
+        aSet._elementLabels = _labelsByInstance(elementLabels, True)
+        return aSet
+
+    def SetFromNodeLabels(self, name: str, nodeLabels: tuple, unsorted: Boolean = False) -> Set:
+        """This method creates a set from a sequence of node labels in a model database.
+
+        Notes
+        -----
+            This function can be accessed by:
+
+            .. code-block:: python
+
+                mdb.models[name].rootAssembly.SetFromNodeLabels
+
+        Parameters
+        ----------
+        name
+            A String specifying the repository key.
+        nodeLabels
+            A sequence of node labels. A node label is a sequence of Int node identifiers. For
+            example, for an assembly:`nodeLabels=(('Instance-1', (2,3,5,7)), ('Instance-2', (1,2,3)))`
+        unsorted
+            A Boolean specifying whether the created set is unsorted. The default value is False.
+
+        Returns
+        -------
+        set: Set
+            A Set object
+        """
+        self.sets[name] = aSet = Set(name)
+        aSet._nodeLabels = _labelsByInstance(nodeLabels, True, unsorted)
+        return aSet
+
+    def SurfaceFromElsets(self, name: str, elementSetSeq: tuple) -> Surface:
+        """This method creates a surface from a sequence of element sets in a model database.
+
+        Notes
+        -----
+            This function can be accessed by:
+
+            .. code-block:: python
+
+                mdb.models[name].rootAssembly.SurfaceFromElsets
+
+        Parameters
+        ----------
+        name
+            A String specifying the repository key.
+        elementSetSeq
+            A sequence of element sets. For example,`elementSetSeq=((elset1, S1),(elset2, S2))`where
+            `elset1=mdb.models[name].rootAssembly.sets['Clutch']` and `S1` and `S2` indicate the
+            side of the element set.
+
+        Returns
+        -------
+        surf: Surface
+            A Surface object
+        """
+        self.surfaces[name] = surface = Surface(name=name)
+        surface._elementSides = tuple((elementSet, side) for elementSet, side in elementSetSeq)
+        return surface
@@ -1,8 +1,10 @@
 import typing
 
+from abaqusConstants import *
+
 from .Region import Region
 from .RegionPartBase import RegionPartBase
-from .Set import Set
+from .Set import Set, _labelsByInstance
 from .Skin import Skin
 from .Stringer import Stringer
 from .Surface import Surface
@@ -315,6 +317,93 @@ class RegionPart(RegionPartBase):
         self.sets[name] = aSet = Set(name, *args, **kwargs)
         return aSet
 
+    def SetFromElementLabels(self, name: str, elementLabels: tuple) -> Set:
+        """This method creates a set from a sequence of element labels in a model database.
+
+        Notes
+        -----
+            This function can be accessed by:
+
+            .. code-block:: python
+
+                mdb.models[name].parts[*name*].SetFromElementLabels
+
+        Parameters
+        ----------
+        name
+            A String specifying the repository key.
+        elementLabels
+            A sequence of element labels. An element label is a sequence of Int element identifiers.
+            For example, for a part:`elementLabels=(2,3,5,7)`
+
+        Returns
+        -------
+        set: Set
+            A Set object
+        """
+        self.sets[name] = aSet = Set(name)
+        aSet._elementLabels = _labelsByInstance(elementLabels, False)
+        return aSet
+
+    def SetFromNodeLabels(self, name: str, nodeLabels: tuple, unsorted: Boolean = False) -> Set:
+        """This method creates a set from a sequence of node labels in a model database.
+
+        Notes
+        -----
+            This function can be accessed by:
+
+            .. code-block:: python
+
+                mdb.models[name].parts[*name*].SetFromNodeLabels
+
+        Parameters
+        ----------
+        name
+            A String specifying the repository key.
+        nodeLabels
+            A sequence of node labels. A node label is a sequence of Int node identifiers. For
+            example, for a part:`nodeLabels=(2,3,5,7)`
+        unsorted
+            A Boolean specifying whether the created set is unsorted. The default value is False.
+
+        Returns
+        -------
+        set: Set
+            A Set object
+        """
+        self.sets[name] = aSet = Set(name)
+        aSet._nodeLabels = _labelsByInstance(nodeLabels, False, unsorted)
+        return aSet
+
+    def SurfaceFromElsets(self, name: str, elementSetSeq: tuple) -> Surface:
+        """This method creates a surface from a sequence of element sets in a model database.
+
+        Notes
+        -----
+            This function can be accessed by:
+
+            .. code-block:: python
+
+                mdb.models[name].parts[*name*].SurfaceFromElsets
+
+        Parameters
+        ----------
+        name
+            A String specifying the repository key.
+        elementSetSeq
+            A sequence of element sets. For example,`elementSetSeq=((elset1, S1),(elset2, S2))`where
+            `elset1=mdb.models[name].parts[name].sets['Clutch']` and `S1` and `S2` indicate the
+            side of the element set.
+
+        Returns
+        -------
+        surf: Surface
+            A Surface object
+        """
+        self.surfaces[name] = surface = Surface(name=name)
+        surface._elementSides = tuple((elementSet, side) for elementSet, side in elementSetSeq)
+        return surface
+
     def Skin(
         self,
         name: str,
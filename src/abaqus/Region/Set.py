@@ -12,6 +12,7 @@ from ..BasicGeometry.ReferencePoint import ReferencePoint
 from ..BasicGeometry.ReferencePointArray import ReferencePointArray
 from ..BasicGeometry.Vertex import Vertex
 from ..BasicGeometry.VertexArray import VertexArray
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Mesh.MeshElement import MeshElement
 from ..Mesh.MeshElementArray import MeshElementArray
 from ..Mesh.MeshNode import MeshNode
@@ -79,34 +80,42 @@ class Set:
     """
 
     # A MeshElementArray object.
-    elements: MeshElementArray = MeshElementArray([])
+    elements: MeshElementArray = lazyDefault(lambda: MeshElementArray([]))
 
     # A MeshNodeArray object.
-    nodes: MeshNodeArray = MeshNodeArray([])
+    nodes: MeshNodeArray = lazyDefault(lambda: MeshNodeArray([]))
 
     # A VertexArray object.
-    vertices: VertexArray = VertexArray([])
+    vertices: VertexArray = lazyDefault(lambda: VertexArray([]))
 
     # An EdgeArray object.
-    edges: EdgeArray = EdgeArray([])
+    edges: EdgeArray = lazyDefault(lambda: EdgeArray([]))
 
     # A FaceArray object.
-    faces: FaceArray = FaceArray([])
+    faces: FaceArray = lazyDefault(lambda: FaceArray([]))
 
     # A CellArray object.
-    cells: CellArray = CellArray([])
+    cells: CellArray = lazyDefault(lambda: CellArray([]))
 
     # A VertexArray object.
-    xVertices: VertexArray = VertexArray([])
+    xVertices: VertexArray = lazyDefault(lambda: VertexArray([]))
 
     # An EdgeArray object.
-    xEdges: EdgeArray = EdgeArray([])
+    xEdges: EdgeArray = lazyDefault(lambda: EdgeArray([]))
 
     # A FaceArray object.
-    xFaces: FaceArray = FaceArray([])
+    xFaces: FaceArray = lazyDefault(lambda: FaceArray([]))
 
     # A ReferencePointArray object.
-    referencePoints: ReferencePointArray = ReferencePointArray()
+    referencePoints: ReferencePointArray = lazyDefault(ReferencePointArray)
+
+    # The labels of the nodes of a set created from node labels by instance name, the
+    # instance name of a set of a part is an empty string.
+    _nodeLabels: dict = None
+
+    # The labels of the elements of a set created from element labels by instance name, the
+    # instance name of a set of a part is an empty string.
+    _elementLabels: dict = None
 
     @typing.overload
     def __init__(
@@ -365,3 +374,19 @@ class Set:
             A Set object or a tuple of Set objects.
         """
         pass
+
+
+def _labelsByInstance(labels: tuple, assembly: bool, unsorted: bool = False) -> dict:
+    """Returns the labels of a set created from labels as arrays by instance name, sorted
+    unless the set is unsorted"""
+    import numpy
+
+    byInstance = {}
+    for instanceName, instanceLabels in labels if assembly else (("", labels),):
+        instanceLabels = numpy.asarray(instanceLabels, dtype=numpy.int64).reshape(-1)
+        if instanceName in byInstance:
+            instanceLabels = numpy.concatenate((byInstance[instanceName], instanceLabels))
+        byInstance[instanceName] = instanceLabels
+    if not unsorted:
+        byInstance = {instanceName: numpy.unique(instanceLabels) for instanceName, instanceLabels in byInstance.items()}
+    return byInstance
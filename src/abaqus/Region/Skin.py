@@ -2,6 +2,7 @@ from ..BasicGeometry.Edge import Edge
 from ..BasicGeometry.EdgeArray import EdgeArray
 from ..BasicGeometry.Face import Face
 from ..BasicGeometry.FaceArray import FaceArray
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Mesh.MeshEdge import MeshEdge
 from ..Mesh.MeshElementArray import MeshElementArray
 from ..Mesh.MeshFace import MeshFace
@@ -35,13 +36,13 @@ class Skin:
     """
 
     # A MeshElementArray object.
-    elements: MeshElementArray = MeshElementArray([])
+    elements: MeshElementArray = lazyDefault(lambda: MeshElementArray([]))
 
     # An EdgeArray object.
-    edges: EdgeArray = EdgeArray([])
+    edges: EdgeArray = lazyDefault(lambda: EdgeArray([]))
 
     # A FaceArray object.
-    faces: FaceArray = FaceArray([])
+    faces: FaceArray = lazyDefault(lambda: FaceArray([]))
 
     def __init__(
         self,
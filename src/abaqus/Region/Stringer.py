@@ -1,5 +1,6 @@
 from ..BasicGeometry.Edge import Edge
 from ..BasicGeometry.EdgeArray import EdgeArray
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Mesh.MeshEdge import MeshEdge
 from ..Mesh.MeshElementArray import MeshElementArray
 
@@ -30,10 +31,10 @@ class Stringer:
     """
 
     # A MeshElementArray object.
-    elements: MeshElementArray = MeshElementArray([])
+    elements: MeshElementArray = lazyDefault(lambda: MeshElementArray([]))
 
     # An EdgeArray object.
-    edges: EdgeArray = EdgeArray([])
+    edges: EdgeArray = lazyDefault(lambda: EdgeArray([]))
 
     def __init__(
         self, name: str, edges: tuple[Edge] = (), elementEdges: tuple[MeshEdge] = ()
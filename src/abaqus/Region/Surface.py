@@ -4,6 +4,7 @@ from abaqusConstants import *
 from ..BasicGeometry.EdgeArray import EdgeArray
 from ..BasicGeometry.Face import Face
 from ..BasicGeometry.FaceArray import FaceArray
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Mesh.MeshElementArray import MeshElementArray
 from ..Mesh.MeshNodeArray import MeshNodeArray
 
@@ -50,16 +51,16 @@ class Surface:
     """
 
     # An EdgeArray object.
-    edges: EdgeArray = EdgeArray([])
+    edges: EdgeArray = lazyDefault(lambda: EdgeArray([]))
 
     # A FaceArray object.
-    faces: FaceArray = FaceArray([])
+    faces: FaceArray = lazyDefault(lambda: FaceArray([]))
 
     # A MeshElementArray object.
-    elements: MeshElementArray = MeshElementArray([])
+    elements: MeshElementArray = lazyDefault(lambda: MeshElementArray([]))
 
     # A MeshNodeArray object.
-    nodes: MeshNodeArray = MeshNodeArray([])
+    nodes: MeshNodeArray = lazyDefault(lambda: MeshNodeArray([]))
 
     # A tuple of SymbolicConstants specifying the sides; for example, (SIDE1, SIDE2).
     sides: SymbolicConstant = None
@@ -68,6 +69,10 @@ class Surface:
     # object on an output database.
     instances: int = None
 
+    # The element sets and the sides of a surface created from element sets, a sequence of
+    # (Set, SymbolicConstant) pairs.
+    _elementSides: tuple = None
+
     @typing.overload
     def __init__(
         self,
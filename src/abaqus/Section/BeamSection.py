@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .Section import Section
 from .TransverseShearBeam import TransverseShearBeam
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class BeamSection(Section):
@@ -46,7 +47,9 @@ class BeamSection(Section):
     """
 
     # A TransverseShearBeam object specifying the transverse shear stiffness properties.
-    beamTransverseShear: TransverseShearBeam = TransverseShearBeam(ANALYSIS_DEFAULT)
+    beamTransverseShear: TransverseShearBeam = lazyDefault(
+        TransverseShearBeam, ANALYSIS_DEFAULT
+    )
 
     def __init__(
         self,
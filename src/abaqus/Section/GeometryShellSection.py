@@ -3,6 +3,7 @@ from .LayerPropertiesArray import LayerPropertiesArray
 from .RebarLayers import RebarLayers
 from .ShellSection import ShellSection
 from .TransverseShearShell import TransverseShearShell
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class GeometryShellSection(ShellSection):
@@ -149,7 +150,9 @@ class GeometryShellSection(ShellSection):
     thicknessField: str = ""
 
     # A RebarLayers object specifying reinforcement properties.
-    rebarLayers: RebarLayers = RebarLayers(CONSTANT, LayerPropertiesArray())
+    rebarLayers: RebarLayers = lazyDefault(
+        lambda: RebarLayers(CONSTANT, LayerPropertiesArray())
+    )
 
     # A String specifying the name of the AnalyticalField or DiscreteField object used to
     # define the thickness of the shell elements at each node. The *nodalThicknessField*
@@ -22,6 +22,16 @@ class HomogeneousSolidSection(SolidSection):
 
     """
 
+    # A String specifying the repository key.
+    name: str = ""
+
+    # A String specifying the name of the material.
+    material: str = ""
+
+    # A Float specifying the thickness of the section. Possible values are None or
+    # greater than zero. The default value is 1.0.
+    thickness: float = 1
+
     def __init__(self, name: str, material: str, thickness: float = 1):
         """This method creates a HomogeneousSolidSection object.
 
@@ -54,7 +64,9 @@ class HomogeneousSolidSection(SolidSection):
         RangeError
         """
         super().__init__()
-        pass
+        self.name = name
+        self.material = material
+        self.thickness = thickness
 
     def setValues(self, thickness: float = 1):
         """This method modifies the HomogeneousSolidSection object.
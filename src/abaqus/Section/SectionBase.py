@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .TransverseShearBeam import TransverseShearBeam
 from .TransverseShearShell import TransverseShearShell
 from ..Connector.ConnectorBehaviorOptionArray import ConnectorBehaviorOptionArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class SectionBase:
@@ -35,16 +36,20 @@ class SectionBase:
     """
 
     # A ConnectorBehaviorOptionArray object.
-    behaviorOptions: ConnectorBehaviorOptionArray = ConnectorBehaviorOptionArray()
+    behaviorOptions: ConnectorBehaviorOptionArray = lazyDefault(
+        ConnectorBehaviorOptionArray
+    )
 
     # A String specifying the repository key.
     name: str = ""
 
     # A TransverseShearBeam object.
-    beamTransverseShear: TransverseShearBeam = TransverseShearBeam(ANALYSIS_DEFAULT)
+    beamTransverseShear: TransverseShearBeam = lazyDefault(
+        TransverseShearBeam, ANALYSIS_DEFAULT
+    )
 
     # A TransverseShearShell object.
-    transverseShear: TransverseShearShell = TransverseShearShell(0, 0, 0)
+    transverseShear: TransverseShearShell = lazyDefault(TransverseShearShell, 0, 0, 0)
 
     def sectionsFromOdb(self, fileName: str):
         """This method creates Section objects by reading an output database. The new sections are
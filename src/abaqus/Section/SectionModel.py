@@ -1,27 +1,31 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .AcousticInfiniteSection import AcousticInfiniteSection
-from .AcousticInterfaceSection import AcousticInterfaceSection
-from .BeamSection import BeamSection
-from .CohesiveSection import CohesiveSection
-from .CompositeShellSection import CompositeShellSection
-from .CompositeSolidSection import CompositeSolidSection
-from .ConnectorSection import ConnectorSection
-from .EulerianSection import EulerianSection
-from .GasketSection import GasketSection
-from .GeneralStiffnessSection import GeneralStiffnessSection
-from .HomogeneousShellSection import HomogeneousShellSection
-from .HomogeneousSolidSection import HomogeneousSolidSection
-from .MPCSection import MPCSection
-from .MembraneSection import MembraneSection
-from .PEGSection import PEGSection
-from .SectionLayerArray import SectionLayerArray
-from .SurfaceSection import SurfaceSection
-from .TrussSection import TrussSection
-from ..Connector.ConnectorBehaviorOptionArray import ConnectorBehaviorOptionArray
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from .AcousticInfiniteSection import AcousticInfiniteSection
+    from .AcousticInterfaceSection import AcousticInterfaceSection
+    from .BeamSection import BeamSection
+    from .CohesiveSection import CohesiveSection
+    from .CompositeShellSection import CompositeShellSection
+    from .CompositeSolidSection import CompositeSolidSection
+    from .ConnectorSection import ConnectorSection
+    from .EulerianSection import EulerianSection
+    from .GasketSection import GasketSection
+    from .GeneralStiffnessSection import GeneralStiffnessSection
+    from .HomogeneousShellSection import HomogeneousShellSection
+    from .HomogeneousSolidSection import HomogeneousSolidSection
+    from .MPCSection import MPCSection
+    from .MembraneSection import MembraneSection
+    from .PEGSection import PEGSection
+    from .SectionLayerArray import SectionLayerArray
+    from .SurfaceSection import SurfaceSection
+    from .TrussSection import TrussSection
+    from ..Connector.ConnectorBehaviorOptionArray import ConnectorBehaviorOptionArray
+
 
 class SectionModel(ModelBase):
     """Abaqus creates a Model object named `Model-1` when a session is started.
@@ -73,6 +77,7 @@ class SectionModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .AcousticInfiniteSection import AcousticInfiniteSection
         self.sections[name] = section = AcousticInfiniteSection(
             name, material, thickness, order
         )
@@ -109,6 +114,7 @@ class SectionModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .AcousticInterfaceSection import AcousticInterfaceSection
         self.sections[name] = section = AcousticInterfaceSection(name, thickness)
         return section
 
@@ -248,6 +254,7 @@ class SectionModel(ModelBase):
         -------
             A BeamSection object.
         """
+        from .BeamSection import BeamSection
         self.sections[name] = section = BeamSection(
             name,
             integration,
@@ -331,6 +338,7 @@ class SectionModel(ModelBase):
         ------
             RangeError and InvalidNameError.
         """
+        from .CohesiveSection import CohesiveSection
         self.sections[name] = section = CohesiveSection(
             name,
             response,
@@ -442,6 +450,7 @@ class SectionModel(ModelBase):
         -------
             A CompositeShellSection object.
         """
+        from .CompositeShellSection import CompositeShellSection
         self.sections[name] = section = CompositeShellSection(
             name,
             layup,
@@ -498,6 +507,7 @@ class SectionModel(ModelBase):
         -------
             A CompositeSolidSection object.
         """
+        from .CompositeSolidSection import CompositeSolidSection
         self.sections[name] = section = CompositeSolidSection(
             name, layup, symmetric, layupName
         )
@@ -625,6 +635,7 @@ class SectionModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .ConnectorSection import ConnectorSection
         self.sections[name] = section = ConnectorSection(
             name,
             assembledType,
@@ -672,6 +683,7 @@ class SectionModel(ModelBase):
         -------
             An EulerianSection object.
         """
+        from .EulerianSection import EulerianSection
         self.sections[name] = section = EulerianSection(name, data)
         return section
 
@@ -725,6 +737,7 @@ class SectionModel(ModelBase):
         -------
             A GasketSection object. and ValueError.
         """
+        from .GasketSection import GasketSection
         self.sections[name] = section = GasketSection(
             name,
             material,
@@ -807,6 +820,7 @@ class SectionModel(ModelBase):
         -------
             A GeneralStiffnessSection object.
         """
+        from .GeneralStiffnessSection import GeneralStiffnessSection
         self.sections[name] = section = GeneralStiffnessSection(
             name,
             stiffnessMatrix,
@@ -927,6 +941,7 @@ class SectionModel(ModelBase):
         -------
             A HomogeneousShellSection object.
         """
+        from .HomogeneousShellSection import HomogeneousShellSection
         self.sections[name] = section = HomogeneousShellSection(
             name,
             material,
@@ -981,6 +996,7 @@ class SectionModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .HomogeneousSolidSection import HomogeneousSolidSection
         self.sections[name] = section = HomogeneousSolidSection(
             name, material, thickness
         )
@@ -1044,6 +1060,7 @@ class SectionModel(ModelBase):
         ------
             RangeError and InvalidNameError.
         """
+        from .MembraneSection import MembraneSection
         self.sections[name] = section = MembraneSection(
             name,
             material,
@@ -1097,6 +1114,7 @@ class SectionModel(ModelBase):
         ------
             RangeError and InvalidNameError.
         """
+        from .MPCSection import MPCSection
         self.sections[name] = section = MPCSection(name, mpcType, userMode, userType)
         return section
 
@@ -1144,6 +1162,7 @@ class SectionModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .PEGSection import PEGSection
         self.sections[name] = section = PEGSection(
             name, material, thickness, wedgeAngle1, wedgeAngle2
         )
@@ -1182,6 +1201,7 @@ class SectionModel(ModelBase):
         ------
             RangeError and InvalidNameError.
         """
+        from .SurfaceSection import SurfaceSection
         self.sections[name] = section = SurfaceSection(name, useDensity, density)
         return section
 
@@ -1215,5 +1235,6 @@ class SectionModel(ModelBase):
         ------
             RangeError and InvalidNameError.
         """
+        from .TrussSection import TrussSection
         self.sections[name] = section = TrussSection(name, material, area)
         return section
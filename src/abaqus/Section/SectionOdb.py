@@ -1,27 +1,31 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .AcousticInfiniteSection import AcousticInfiniteSection
-from .AcousticInterfaceSection import AcousticInterfaceSection
-from .BeamSection import BeamSection
-from .CohesiveSection import CohesiveSection
-from .CompositeShellSection import CompositeShellSection
-from .CompositeSolidSection import CompositeSolidSection
-from .ConnectorSection import ConnectorSection
-from .EulerianSection import EulerianSection
-from .GasketSection import GasketSection
-from .GeneralStiffnessSection import GeneralStiffnessSection
-from .HomogeneousShellSection import HomogeneousShellSection
-from .HomogeneousSolidSection import HomogeneousSolidSection
-from .MPCSection import MPCSection
-from .MembraneSection import MembraneSection
-from .PEGSection import PEGSection
-from .SectionLayerArray import SectionLayerArray
-from .SurfaceSection import SurfaceSection
-from .TrussSection import TrussSection
-from ..Connector.ConnectorBehaviorOptionArray import ConnectorBehaviorOptionArray
 from ..Odb.OdbBase import OdbBase
 
+if typing.TYPE_CHECKING:
+    from .AcousticInfiniteSection import AcousticInfiniteSection
+    from .AcousticInterfaceSection import AcousticInterfaceSection
+    from .BeamSection import BeamSection
+    from .CohesiveSection import CohesiveSection
+    from .CompositeShellSection import CompositeShellSection
+    from .CompositeSolidSection import CompositeSolidSection
+    from .ConnectorSection import ConnectorSection
+    from .EulerianSection import EulerianSection
+    from .GasketSection import GasketSection
+    from .GeneralStiffnessSection import GeneralStiffnessSection
+    from .HomogeneousShellSection import HomogeneousShellSection
+    from .HomogeneousSolidSection import HomogeneousSolidSection
+    from .MPCSection import MPCSection
+    from .MembraneSection import MembraneSection
+    from .PEGSection import PEGSection
+    from .SectionLayerArray import SectionLayerArray
+    from .SurfaceSection import SurfaceSection
+    from .TrussSection import TrussSection
+    from ..Connector.ConnectorBehaviorOptionArray import ConnectorBehaviorOptionArray
+
 
 class SectionOdb(OdbBase):
     def AcousticInfiniteSection(
@@ -61,6 +65,7 @@ class SectionOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .AcousticInfiniteSection import AcousticInfiniteSection
         self.sections[name] = section = AcousticInfiniteSection(
             name, material, thickness, order
         )
@@ -97,6 +102,7 @@ class SectionOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .AcousticInterfaceSection import AcousticInterfaceSection
         self.sections[name] = section = AcousticInterfaceSection(name, thickness)
         return section
 
@@ -236,6 +242,7 @@ class SectionOdb(OdbBase):
         -------
             A BeamSection object.
         """
+        from .BeamSection import BeamSection
         self.sections[name] = section = BeamSection(
             name,
             integration,
@@ -319,6 +326,7 @@ class SectionOdb(OdbBase):
         ------
             RangeError and InvalidNameError.
         """
+        from .CohesiveSection import CohesiveSection
         self.sections[name] = section = CohesiveSection(
             name,
             response,
@@ -430,6 +438,7 @@ class SectionOdb(OdbBase):
         -------
             A CompositeShellSection object.
         """
+        from .CompositeShellSection import CompositeShellSection
         self.sections[name] = section = CompositeShellSection(
             name,
             layup,
@@ -486,6 +495,7 @@ class SectionOdb(OdbBase):
         -------
             A CompositeSolidSection object.
         """
+        from .CompositeSolidSection import CompositeSolidSection
         self.sections[name] = section = CompositeSolidSection(
             name, layup, symmetric, layupName
         )
@@ -613,6 +623,7 @@ class SectionOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .ConnectorSection import ConnectorSection
         self.sections[name] = section = ConnectorSection(
             name,
             assembledType,
@@ -660,6 +671,7 @@ class SectionOdb(OdbBase):
         -------
             An EulerianSection object.
         """
+        from .EulerianSection import EulerianSection
         self.sections[name] = section = EulerianSection(name, data)
         return section
 
@@ -713,6 +725,7 @@ class SectionOdb(OdbBase):
         -------
             A GasketSection object. and ValueError.
         """
+        from .GasketSection import GasketSection
         self.sections[name] = section = GasketSection(
             name,
             material,
@@ -795,6 +808,7 @@ class SectionOdb(OdbBase):
         -------
             A GeneralStiffnessSection object.
         """
+        from .GeneralStiffnessSection import GeneralStiffnessSection
         self.sections[name] = section = GeneralStiffnessSection(
             name,
             stiffnessMatrix,
@@ -915,6 +929,7 @@ class SectionOdb(OdbBase):
         -------
             A HomogeneousShellSection object.
         """
+        from .HomogeneousShellSection import HomogeneousShellSection
         self.sections[name] = section = HomogeneousShellSection(
             name,
             material,
@@ -969,6 +984,7 @@ class SectionOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .HomogeneousSolidSection import HomogeneousSolidSection
         self.sections[name] = section = HomogeneousSolidSection(
             name, material, thickness
         )
@@ -1032,6 +1048,7 @@ class SectionOdb(OdbBase):
         ------
             RangeError and InvalidNameError.
         """
+        from .MembraneSection import MembraneSection
         self.sections[name] = section = MembraneSection(
             name,
             material,
@@ -1085,6 +1102,7 @@ class SectionOdb(OdbBase):
         ------
             RangeError and InvalidNameError.
         """
+        from .MPCSection import MPCSection
         self.sections[name] = section = MPCSection(name, mpcType, userMode, userType)
         return section
 
@@ -1132,6 +1150,7 @@ class SectionOdb(OdbBase):
         InvalidNameError
         RangeError
         """
+        from .PEGSection import PEGSection
         self.sections[name] = section = PEGSection(
             name, material, thickness, wedgeAngle1, wedgeAngle2
         )
@@ -1170,6 +1189,7 @@ class SectionOdb(OdbBase):
         ------
             RangeError and InvalidNameError.
         """
+        from .SurfaceSection import SurfaceSection
         self.sections[name] = section = SurfaceSection(name, useDensity, density)
         return section
 
@@ -1203,5 +1223,6 @@ class SectionOdb(OdbBase):
         ------
             RangeError and InvalidNameError.
         """
+        from .TrussSection import TrussSection
         self.sections[name] = section = TrussSection(name, material, area)
         return section
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .NumberFormat import NumberFormat
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class JournalOptions:
@@ -25,7 +26,7 @@ class JournalOptions:
     """
 
     # Format of the number
-    numberFormat: NumberFormat = NumberFormat()
+    numberFormat: NumberFormat = lazyDefault(NumberFormat)
 
     def setValues(
         self,
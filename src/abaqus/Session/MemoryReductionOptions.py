@@ -6,6 +6,16 @@ class MemoryReductionOptions:
     running in reduced memory mode. The MemoryReductionOptions object has no constructor.
     Abaqus creates the *MemoryReductionOptions* member when a session is started.
 
+    Attributes
+    ----------
+    reducedMemoryMode: Boolean
+        A Boolean specifying whether Abaqus/CAE should run in reduced memory mode. The default
+        value is ON.
+    percentThreshold: float
+        A Float specifying the percent of *kernelMemoryLimit* at which the reduced memory mode
+        starts. It is also the percent of the memory used by the frame caches of the results
+        stores opened by the session. The default value is 75.0.
+
     Notes
     -----
     This object can be accessed by:
@@ -16,6 +26,15 @@ class MemoryReductionOptions:
 
     """
 
+    # A Boolean specifying whether Abaqus/CAE should run in reduced memory mode. The default
+    # value is ON.
+    reducedMemoryMode: Boolean = ON
+
+    # A Float specifying the percent of *kernelMemoryLimit* at which the reduced memory mode
+    # starts. It is also the percent of the memory used by the frame caches of the results
+    # stores opened by the session. The default value is 75.0.
+    percentThreshold: float = 75.0
+
     def setValues(self, reducedMemoryMode: Boolean = ON, percentThreshold: float = 75):
         """This method modifies the MemoryReductionOptions object.
 
@@ -28,4 +47,5 @@ class MemoryReductionOptions:
             A Float specifying the percent of *kernelMemoryLimit* at which the reduced memory mode
             starts. The default value is 75.0.
         """
-        pass
+        self.reducedMemoryMode = reducedMemoryMode
+        self.percentThreshold = percentThreshold
@@ -26,6 +26,7 @@ from ..DisplayOptions.ViewportAnnotationOptions import ViewportAnnotationOptions
 from ..FieldReport.FieldReportOptions import FieldReportOptions
 from ..FieldReport.FreeBodyReportOptions import FreeBodyReportOptions
 from ..Job.Queue import Queue
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Mesh.MesherOptions import MesherOptions
 from ..Odb.Odb import Odb
 from ..Odb.ScratchOdb import ScratchOdb
@@ -244,180 +245,184 @@ class SessionBase:
     kernelMemoryLimit: float = None
 
     # A repository of Color objects.
-    colors: dict[str, Color] = dict[str, Color]()
+    colors: dict[str, Color] = lazyDefault(dict[str, Color])
 
     # A JournalOptions object specifying how to record selection of geometry in the journal
     # and replay files.
-    journalOptions: JournalOptions = JournalOptions()
+    journalOptions: JournalOptions = lazyDefault(JournalOptions)
 
     # A MemoryReductionOptions object specifying options for running in reduced memory mode.
-    memoryReductionOptions: MemoryReductionOptions = MemoryReductionOptions()
+    memoryReductionOptions: MemoryReductionOptions = lazyDefault(MemoryReductionOptions)
 
     # A NodeQuery object specifying nodes and their coordinates in a path.
-    nodeQuery: NodeQuery = NodeQuery()
+    nodeQuery: NodeQuery = lazyDefault(NodeQuery)
 
     # A ConstrainedSketcherOptions object specifying common options for all sketches.
-    sketcherOptions: ConstrainedSketcherOptions = ConstrainedSketcherOptions()
+    sketcherOptions: ConstrainedSketcherOptions = lazyDefault(
+        ConstrainedSketcherOptions
+    )
 
     # A ViewerOptions object.
-    viewerOptions: ViewerOptions = ViewerOptions()
+    viewerOptions: ViewerOptions = lazyDefault(ViewerOptions)
 
     # An AnimationOptions object.
-    animationOptions: AnimationOptions = AnimationOptions()
+    animationOptions: AnimationOptions = lazyDefault(AnimationOptions)
 
     # An AVIOptions object.
-    aviOptions: AVIOptions = AVIOptions()
+    aviOptions: AVIOptions = lazyDefault(AVIOptions)
 
     # An ImageAnimationOptions object.
-    imageAnimationOptions: ImageAnimationOptions = ImageAnimationOptions()
+    imageAnimationOptions: ImageAnimationOptions = lazyDefault(ImageAnimationOptions)
 
     # An ImageAnimation object.
-    imageAnimation: ImageAnimation = ImageAnimation("img", AVI)
+    imageAnimation: ImageAnimation = lazyDefault(ImageAnimation, "img", AVI)
 
     # A QuickTimeOptions object.
-    quickTimeOptions: QuickTimeOptions = QuickTimeOptions()
+    quickTimeOptions: QuickTimeOptions = lazyDefault(QuickTimeOptions)
 
     # A repository of Viewport objects.
-    viewports: dict[str, Viewport] = dict[str, Viewport]()
+    viewports: dict[str, Viewport] = lazyDefault(dict[str, Viewport])
 
     # A RepositorySupport object.
-    customData: RepositorySupport = RepositorySupport()
+    customData: RepositorySupport = lazyDefault(RepositorySupport)
 
     # A FieldReportOptions object.
-    defaultFieldReportOptions: FieldReportOptions = FieldReportOptions()
+    defaultFieldReportOptions: FieldReportOptions = lazyDefault(FieldReportOptions)
 
     # A FreeBodyReportOptions object.
-    defaultFreeBodyReportOptions: FreeBodyReportOptions = FreeBodyReportOptions()
+    defaultFreeBodyReportOptions: FreeBodyReportOptions = lazyDefault(
+        FreeBodyReportOptions
+    )
 
     # A FieldReportOptions object.
-    fieldReportOptions: FieldReportOptions = FieldReportOptions()
+    fieldReportOptions: FieldReportOptions = lazyDefault(FieldReportOptions)
 
     # A FreeBodyReportOptions object.
-    freeBodyReportOptions: FreeBodyReportOptions = FreeBodyReportOptions()
+    freeBodyReportOptions: FreeBodyReportOptions = lazyDefault(FreeBodyReportOptions)
 
     # A repository of Odb objects.
-    odbs: dict[str, Odb] = dict[str, Odb]()
+    odbs: dict[str, Odb] = lazyDefault(dict[str, Odb])
 
     # A repository of ScratchOdb objects.
-    scratchOdbs: dict[str, ScratchOdb] = dict[str, ScratchOdb]()
+    scratchOdbs: dict[str, ScratchOdb] = lazyDefault(dict[str, ScratchOdb])
 
     # A DefaultOdbDisplay object.
-    defaultOdbDisplay: DefaultOdbDisplay = DefaultOdbDisplay()
+    defaultOdbDisplay: DefaultOdbDisplay = lazyDefault(DefaultOdbDisplay)
 
     # A DefaultPlot object.
-    defaultPlot: DefaultPlot = DefaultPlot()
+    defaultPlot: DefaultPlot = lazyDefault(DefaultPlot)
 
     # A DefaultChartOptions object.
-    defaultChartOptions: DefaultChartOptions = DefaultChartOptions()
+    defaultChartOptions: DefaultChartOptions = lazyDefault(DefaultChartOptions)
 
     # A repository of OdbData objects.
-    odbData: dict[str, OdbData] = dict[str, OdbData]()
+    odbData: dict[str, OdbData] = lazyDefault(dict[str, OdbData])
 
     # A repository of MdbData objects.
-    mdbData: dict[str, MdbData] = dict[str, MdbData]()
+    mdbData: dict[str, MdbData] = lazyDefault(dict[str, MdbData])
 
     # A repository of Path objects.
-    paths: dict[str, Path] = dict[str, Path]()
+    paths: dict[str, Path] = lazyDefault(dict[str, Path])
 
     # A repository of FreeBody objects.
-    freeBodies: dict[str, FreeBody] = dict[str, FreeBody]()
+    freeBodies: dict[str, FreeBody] = lazyDefault(dict[str, FreeBody])
 
     # A repository of Stream objects.
-    streams: dict[str, Stream] = dict[str, Stream]()
+    streams: dict[str, Stream] = lazyDefault(dict[str, Stream])
 
     # A repository of Spectrum objects.
-    spectrums: dict[str, Spectrum] = dict[str, Spectrum]()
+    spectrums: dict[str, Spectrum] = lazyDefault(dict[str, Spectrum])
 
     # A CurrentProbeValues object.
-    currentProbeValues: CurrentProbeValues = CurrentProbeValues()
+    currentProbeValues: CurrentProbeValues = lazyDefault(CurrentProbeValues)
 
     # A ProbeOptions object.
-    defaultProbeOptions: ProbeOptions = ProbeOptions()
+    defaultProbeOptions: ProbeOptions = lazyDefault(ProbeOptions)
 
     # A ProbeOptions object.
-    probeOptions: ProbeOptions = ProbeOptions()
+    probeOptions: ProbeOptions = lazyDefault(ProbeOptions)
 
     # A ProbeReport object.
-    probeReport: ProbeReport = ProbeReport()
+    probeReport: ProbeReport = lazyDefault(ProbeReport)
 
     # A ProbeReport object.
-    defaultProbeReport: ProbeReport = ProbeReport()
+    defaultProbeReport: ProbeReport = lazyDefault(ProbeReport)
 
     # A SelectedProbeValues object.
-    selectedProbeValues: SelectedProbeValues = SelectedProbeValues()
+    selectedProbeValues: SelectedProbeValues = lazyDefault(SelectedProbeValues)
 
     # A PrintOptions object.
-    printOptions: PrintOptions = PrintOptions()
+    printOptions: PrintOptions = lazyDefault(PrintOptions)
 
     # An EpsOptions object.
-    epsOptions: EpsOptions = EpsOptions()
+    epsOptions: EpsOptions = lazyDefault(EpsOptions)
 
     # A PageSetupOptions object.
-    pageSetupOptions: PageSetupOptions = PageSetupOptions()
+    pageSetupOptions: PageSetupOptions = lazyDefault(PageSetupOptions)
 
     # A PngOptions object.
-    pngOptions: PngOptions = PngOptions()
+    pngOptions: PngOptions = lazyDefault(PngOptions)
 
     # A PsOptions object.
-    psOptions: PsOptions = PsOptions()
+    psOptions: PsOptions = lazyDefault(PsOptions)
 
     # A SvgOptions object.
-    svgOptions: SvgOptions = SvgOptions()
+    svgOptions: SvgOptions = lazyDefault(SvgOptions)
 
     # A TiffOptions object.
-    tiffOptions: TiffOptions = TiffOptions()
+    tiffOptions: TiffOptions = lazyDefault(TiffOptions)
 
     # An AutoColors object specifying the color palette to be used for color coding.
-    autoColors: AutoColors = AutoColors()
+    autoColors: AutoColors = lazyDefault(AutoColors)
 
     # An AutoColors object specifying the color palette to be used forXYCurve objects.
-    xyColors: AutoColors = AutoColors()
+    xyColors: AutoColors = lazyDefault(AutoColors)
 
     # A repository of XYData objects.
-    xyDataObjects: dict[str, XYData] = dict[str, XYData]()
+    xyDataObjects: dict[str, XYData] = lazyDefault(dict[str, XYData])
 
     # A repository of XYCurve objects.
-    curves: dict[str, XYCurve] = dict[str, XYCurve]()
+    curves: dict[str, XYCurve] = lazyDefault(dict[str, XYCurve])
 
     # A repository of XYPlot objects.
-    xyPlots: dict[str, XYPlot] = dict[str, XYPlot]()
+    xyPlots: dict[str, XYPlot] = lazyDefault(dict[str, XYPlot])
 
     # A repository of Chart objects.
-    charts: dict[str, Chart] = dict[str, Chart]()
+    charts: dict[str, Chart] = lazyDefault(dict[str, Chart])
 
     # An XYReportOptions object.
-    defaultXYReportOptions: XYReportOptions = XYReportOptions()
+    defaultXYReportOptions: XYReportOptions = lazyDefault(XYReportOptions)
 
     # An XYReportOptions object.
-    xyReportOptions: XYReportOptions = XYReportOptions()
+    xyReportOptions: XYReportOptions = lazyDefault(XYReportOptions)
 
     # A repository of View objects.
-    views: dict[str, View] = dict[str, View]()
+    views: dict[str, View] = lazyDefault(dict[str, View])
 
     # A repository of NetworkDatabaseConnector objects.
-    networkDatabaseConnectors: dict[str, NetworkDatabaseConnector] = dict[
-        str, NetworkDatabaseConnector
-    ]()
+    networkDatabaseConnectors: dict[str, NetworkDatabaseConnector] = lazyDefault(
+        dict[str, NetworkDatabaseConnector]
+    )
 
     # A repository of DisplayGroup objects.
-    displayGroups: dict[str, DisplayGroup] = dict[str, DisplayGroup]()
+    displayGroups: dict[str, DisplayGroup] = lazyDefault(dict[str, DisplayGroup])
 
     # A GraphicsInfo object.
-    graphicsInfo: GraphicsInfo = GraphicsInfo()
+    graphicsInfo: GraphicsInfo = lazyDefault(GraphicsInfo)
 
     # A GraphicsOptions object.
-    defaultGraphicsOptions: GraphicsOptions = GraphicsOptions()
+    defaultGraphicsOptions: GraphicsOptions = lazyDefault(GraphicsOptions)
 
     # A GraphicsOptions object.
-    graphicsOptions: GraphicsOptions = GraphicsOptions()
+    graphicsOptions: GraphicsOptions = lazyDefault(GraphicsOptions)
 
     # A ViewportAnnotationOptions object.
-    defaultViewportAnnotationOptions: ViewportAnnotationOptions = (
-        ViewportAnnotationOptions()
+    defaultViewportAnnotationOptions: ViewportAnnotationOptions = lazyDefault(
+        ViewportAnnotationOptions
     )
 
     # A repository of Queue objects.
-    queues: dict[str, Queue] = dict[str, Queue]()
+    queues: dict[str, Queue] = lazyDefault(dict[str, Queue])
 
     # A String specifying the name of the current viewport.
     currentViewportName: str = ""
@@ -428,22 +433,22 @@ class SessionBase:
     sessionState: dict = None
 
     # A repository of Image objects.
-    images: dict[str, Image] = dict[str, Image]()
+    images: dict[str, Image] = lazyDefault(dict[str, Image])
 
     # A repository of Movie objects.
-    movies: dict[str, Movie] = dict[str, Movie]()
+    movies: dict[str, Movie] = lazyDefault(dict[str, Movie])
 
     # A LightOptions object.
-    defaultLightOptions: LightOptions = LightOptions()
+    defaultLightOptions: LightOptions = lazyDefault(LightOptions)
 
     # A DrawingArea object.
-    drawingArea: DrawingArea = DrawingArea()
+    drawingArea: DrawingArea = lazyDefault(DrawingArea)
 
     # A MesherOptions object specifying how to control default settings in the Mesh module.
-    defaultMesherOptions: MesherOptions = MesherOptions()
+    defaultMesherOptions: MesherOptions = lazyDefault(MesherOptions)
 
     # A repository of Drawing objects.
-    drawings: dict[str, Drawing] = dict[str, Drawing]()
+    drawings: dict[str, Drawing] = lazyDefault(dict[str, Drawing])
 
     def setValues(self, kernelMemoryLimit: float = None):
         """This method modifies the Session object.
@@ -463,7 +468,8 @@ class SessionBase:
             less than the physical amount of memory on the machine.The minimum setting allowed is
             256 MB.
         """
-        pass
+        if kernelMemoryLimit is not None:
+            self.kernelMemoryLimit = kernelMemoryLimit
 
     def enableCADConnection(self, CADName: str, portNum: int = None):
         """This method enables the Abaqus/CAE listening port for the specified *CAD* system.
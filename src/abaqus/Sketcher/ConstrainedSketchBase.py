@@ -15,6 +15,7 @@ from .ConstrainedSketchVertex.ConstrainedSketchVertexArray import (
     ConstrainedSketchVertexArray,
 )
 from ..Amplitude.ConstrainedSketchGeometryArray import ConstrainedSketchGeometryArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class ConstrainedSketchBase:
@@ -54,30 +55,34 @@ class ConstrainedSketchBase:
     """
 
     # A repository of ConstrainedSketchConstraint objects.
-    constraints: dict[str, ConstrainedSketchConstraint] = dict[
-        str, ConstrainedSketchConstraint
-    ]()
+    constraints: dict[str, ConstrainedSketchConstraint] = lazyDefault(
+        dict[str, ConstrainedSketchConstraint]
+    )
 
     # A repository of ConstrainedSketchDimension objects.
-    dimensions: dict[str, ConstrainedSketchDimension] = dict[
-        str, ConstrainedSketchDimension
-    ]()
+    dimensions: dict[str, ConstrainedSketchDimension] = lazyDefault(
+        dict[str, ConstrainedSketchDimension]
+    )
 
     # A ConstrainedSketchGeometryArray object specifying the sketch geometry, such as lines,
     # arcs, circles, and splines.
-    geometry: ConstrainedSketchGeometryArray = ConstrainedSketchGeometryArray()
+    geometry: ConstrainedSketchGeometryArray = lazyDefault(
+        ConstrainedSketchGeometryArray
+    )
 
     # A repository of ConstrainedSketchParameter objects specifying sketch parameters, which
     # may be associated with dimensions.
-    parameters: dict[str, ConstrainedSketchParameter] = dict[
-        str, ConstrainedSketchParameter
-    ]()
+    parameters: dict[str, ConstrainedSketchParameter] = lazyDefault(
+        dict[str, ConstrainedSketchParameter]
+    )
 
     # A ConstrainedSketchOptions object specifying the sketch option settings.
-    sketchOptions: ConstrainedSketchOptions = ConstrainedSketchOptions()
+    sketchOptions: ConstrainedSketchOptions = lazyDefault(ConstrainedSketchOptions)
 
     # A ConstrainedSketchVertexArray object.
-    vertices: ConstrainedSketchVertexArray = ConstrainedSketchVertexArray()
+    vertices: ConstrainedSketchVertexArray = lazyDefault(ConstrainedSketchVertexArray)
 
     # A ConstrainedSketchImageOptions object.
-    imageOptions: ConstrainedSketchImageOptions = ConstrainedSketchImageOptions()
+    imageOptions: ConstrainedSketchImageOptions = lazyDefault(
+        ConstrainedSketchImageOptions
+    )
@@ -1,6 +1,12 @@
-from .ConstrainedSketch import ConstrainedSketch
+from __future__ import annotations
+
+import typing
+
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from .ConstrainedSketch import ConstrainedSketch
+
 
 class SketchModel(ModelBase):
     """Abaqus creates a Model object named `Model-1` when a session is started.
@@ -55,6 +61,7 @@ class SketchModel(ModelBase):
         sketch: ConstrainedSketch
             A ConstrainedSketch object.
         """
+        from .ConstrainedSketch import ConstrainedSketch
         self.sketches[name] = sketch = ConstrainedSketch(
             name, sheetSize, gridSpacing, transform
         )
@@ -3,6 +3,7 @@ from .AnalysisStep import AnalysisStep
 from ..Adaptivity.AdaptiveMeshConstraintState import AdaptiveMeshConstraintState
 from ..Adaptivity.AdaptiveMeshDomain import AdaptiveMeshDomain
 from ..BoundaryCondition.BoundaryConditionState import BoundaryConditionState
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Load.LoadCase import LoadCase
 from ..Load.LoadState import LoadState
 from ..PredefinedField.PredefinedFieldState import PredefinedFieldState
@@ -224,56 +225,58 @@ class BuckleStep(AnalysisStep):
     suppressed: Boolean = OFF
 
     # A repository of FieldOutputRequestState objects.
-    fieldOutputRequestState: dict[str, FieldOutputRequestState] = dict[
-        str, FieldOutputRequestState
-    ]()
+    fieldOutputRequestState: dict[str, FieldOutputRequestState] = lazyDefault(
+        dict[str, FieldOutputRequestState]
+    )
 
     # A repository of HistoryOutputRequestState objects.
-    historyOutputRequestState: dict[str, HistoryOutputRequestState] = dict[
-        str, HistoryOutputRequestState
-    ]()
+    historyOutputRequestState: dict[str, HistoryOutputRequestState] = lazyDefault(
+        dict[str, HistoryOutputRequestState]
+    )
 
     # A DiagnosticPrint object.
-    diagnosticPrint: DiagnosticPrint = DiagnosticPrint()
+    diagnosticPrint: DiagnosticPrint = lazyDefault(DiagnosticPrint)
 
     # A Monitor object.
     monitor: Monitor = None
 
     # A Restart object.
-    restart: Restart = Restart()
+    restart: Restart = lazyDefault(Restart)
 
     # A repository of AdaptiveMeshConstraintState objects.
-    adaptiveMeshConstraintStates: dict[str, AdaptiveMeshConstraintState] = dict[
-        str, AdaptiveMeshConstraintState
-    ]()
+    adaptiveMeshConstraintStates: dict[str, AdaptiveMeshConstraintState] = lazyDefault(
+        dict[str, AdaptiveMeshConstraintState]
+    )
 
     # A repository of AdaptiveMeshDomain objects.
-    adaptiveMeshDomains: dict[str, AdaptiveMeshDomain] = dict[str, AdaptiveMeshDomain]()
+    adaptiveMeshDomains: dict[str, AdaptiveMeshDomain] = lazyDefault(
+        dict[str, AdaptiveMeshDomain]
+    )
 
     # A Control object.
-    control: Control = Control()
+    control: Control = lazyDefault(Control)
 
     # A SolverControl object.
-    solverControl: SolverControl = SolverControl()
+    solverControl: SolverControl = lazyDefault(SolverControl)
 
     # A repository of BoundaryConditionState objects.
-    boundaryConditionStates: dict[str, BoundaryConditionState] = dict[
-        str, BoundaryConditionState
-    ]()
+    boundaryConditionStates: dict[str, BoundaryConditionState] = lazyDefault(
+        dict[str, BoundaryConditionState]
+    )
 
     # A repository of InteractionState objects.
     interactionStates: int = None
 
     # A repository of LoadState objects.
-    loadStates: dict[str, LoadState] = dict[str, LoadState]()
+    loadStates: dict[str, LoadState] = lazyDefault(dict[str, LoadState])
 
     # A repository of LoadCase objects.
-    loadCases: dict[str, LoadCase] = dict[str, LoadCase]()
+    loadCases: dict[str, LoadCase] = lazyDefault(dict[str, LoadCase])
 
     # A repository of PredefinedFieldState objects.
-    predefinedFieldStates: dict[str, PredefinedFieldState] = dict[
-        str, PredefinedFieldState
-    ]()
+    predefinedFieldStates: dict[str, PredefinedFieldState] = lazyDefault(
+        dict[str, PredefinedFieldState]
+    )
 
     def __init__(
         self,
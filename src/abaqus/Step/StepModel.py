@@ -1,72 +1,76 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
 from ..Model.ModelBase import ModelBase
 from ..Region.Region import Region
-from ..Step.AnnealStep import AnnealStep
-from ..Step.BuckleStep import BuckleStep
-from ..Step.ComplexFrequencyStep import ComplexFrequencyStep
-from ..Step.CoupledTempDisplacementStep import CoupledTempDisplacementStep
-from ..Step.CoupledThermalElectricStep import CoupledThermalElectricStep
-from ..Step.CoupledThermalElectricalStructuralStep import (
-    CoupledThermalElectricalStructuralStep,
-)
-from ..Step.DirectCyclicStep import DirectCyclicStep
-from ..Step.EmagTimeHarmonicStep import EmagTimeHarmonicStep
-from ..Step.ExplicitDynamicsStep import ExplicitDynamicsStep
-from ..Step.FrequencyStep import FrequencyStep
-from ..Step.GeostaticStep import GeostaticStep
-from ..Step.HeatTransferStep import HeatTransferStep
-from ..Step.ImplicitDynamicsStep import ImplicitDynamicsStep
-from ..Step.MassDiffusionStep import MassDiffusionStep
-from ..Step.ModalDynamicsStep import ModalDynamicsStep
-from ..Step.RandomResponseStep import RandomResponseStep
-from ..Step.ResponseSpectrumStep import ResponseSpectrumStep
-from ..Step.SoilsStep import SoilsStep
-from ..Step.StaticLinearPerturbationStep import StaticLinearPerturbationStep
-from ..Step.StaticRiksStep import StaticRiksStep
-from ..Step.StaticStep import StaticStep
-from ..Step.SteadyStateDirectStep import SteadyStateDirectStep
-from ..Step.SteadyStateModalStep import SteadyStateModalStep
-from ..Step.SteadyStateSubspaceStep import SteadyStateSubspaceStep
-from ..Step.SubspaceDynamicsStep import SubspaceDynamicsStep
-from ..Step.SubstructureGenerateStep import SubstructureGenerateStep
-from ..Step.TempDisplacementDynamicsStep import TempDisplacementDynamicsStep
-from ..Step.ViscoStep import ViscoStep
 from ..StepMiscellaneous.CompositeDamping import CompositeDamping
 from ..StepMiscellaneous.DirectDamping import DirectDamping
 from ..StepMiscellaneous.DirectDampingByFrequency import DirectDampingByFrequency
-from ..StepMiscellaneous.EmagTimeHarmonicFrequencyArray import (
-    EmagTimeHarmonicFrequencyArray,
-)
-from ..StepMiscellaneous.MassScalingArray import MassScalingArray
-from ..StepMiscellaneous.RandomResponseFrequencyArray import (
-    RandomResponseFrequencyArray,
-)
 from ..StepMiscellaneous.RayleighDamping import RayleighDamping
 from ..StepMiscellaneous.RayleighDampingByFrequency import RayleighDampingByFrequency
-from ..StepMiscellaneous.ResponseSpectrumComponentArray import (
-    ResponseSpectrumComponentArray,
-)
-from ..StepMiscellaneous.SteadyStateDirectFrequencyArray import (
-    SteadyStateDirectFrequencyArray,
-)
-from ..StepMiscellaneous.SteadyStateModalFrequencyArray import (
-    SteadyStateModalFrequencyArray,
-)
-from ..StepMiscellaneous.SteadyStateSubspaceFrequencyArray import (
-    SteadyStateSubspaceFrequencyArray,
-)
 from ..StepMiscellaneous.StructuralDamping import StructuralDamping
 from ..StepMiscellaneous.StructuralDampingByFrequency import (
     StructuralDampingByFrequency,
 )
-from ..StepMiscellaneous.SubstructureGenerateFrequencyArray import (
-    SubstructureGenerateFrequencyArray,
-)
-from ..StepMiscellaneous.SubstructureGenerateModesArray import (
-    SubstructureGenerateModesArray,
-)
+
+if typing.TYPE_CHECKING:
+    from ..Step.AnnealStep import AnnealStep
+    from ..Step.BuckleStep import BuckleStep
+    from ..Step.ComplexFrequencyStep import ComplexFrequencyStep
+    from ..Step.CoupledTempDisplacementStep import CoupledTempDisplacementStep
+    from ..Step.CoupledThermalElectricStep import CoupledThermalElectricStep
+    from ..Step.CoupledThermalElectricalStructuralStep import (
+        CoupledThermalElectricalStructuralStep,
+    )
+    from ..Step.DirectCyclicStep import DirectCyclicStep
+    from ..Step.EmagTimeHarmonicStep import EmagTimeHarmonicStep
+    from ..Step.ExplicitDynamicsStep import ExplicitDynamicsStep
+    from ..Step.FrequencyStep import FrequencyStep
+    from ..Step.GeostaticStep import GeostaticStep
+    from ..Step.HeatTransferStep import HeatTransferStep
+    from ..Step.ImplicitDynamicsStep import ImplicitDynamicsStep
+    from ..Step.MassDiffusionStep import MassDiffusionStep
+    from ..Step.ModalDynamicsStep import ModalDynamicsStep
+    from ..Step.RandomResponseStep import RandomResponseStep
+    from ..Step.ResponseSpectrumStep import ResponseSpectrumStep
+    from ..Step.SoilsStep import SoilsStep
+    from ..Step.StaticLinearPerturbationStep import StaticLinearPerturbationStep
+    from ..Step.StaticRiksStep import StaticRiksStep
+    from ..Step.StaticStep import StaticStep
+    from ..Step.SteadyStateDirectStep import SteadyStateDirectStep
+    from ..Step.SteadyStateModalStep import SteadyStateModalStep
+    from ..Step.SteadyStateSubspaceStep import SteadyStateSubspaceStep
+    from ..Step.SubspaceDynamicsStep import SubspaceDynamicsStep
+    from ..Step.SubstructureGenerateStep import SubstructureGenerateStep
+    from ..Step.TempDisplacementDynamicsStep import TempDisplacementDynamicsStep
+    from ..Step.ViscoStep import ViscoStep
+    from ..StepMiscellaneous.EmagTimeHarmonicFrequencyArray import (
+        EmagTimeHarmonicFrequencyArray,
+    )
+    from ..StepMiscellaneous.MassScalingArray import MassScalingArray
+    from ..StepMiscellaneous.RandomResponseFrequencyArray import (
+        RandomResponseFrequencyArray,
+    )
+    from ..StepMiscellaneous.ResponseSpectrumComponentArray import (
+        ResponseSpectrumComponentArray,
+    )
+    from ..StepMiscellaneous.SteadyStateDirectFrequencyArray import (
+        SteadyStateDirectFrequencyArray,
+    )
+    from ..StepMiscellaneous.SteadyStateModalFrequencyArray import (
+        SteadyStateModalFrequencyArray,
+    )
+    from ..StepMiscellaneous.SteadyStateSubspaceFrequencyArray import (
+        SteadyStateSubspaceFrequencyArray,
+    )
+    from ..StepMiscellaneous.SubstructureGenerateFrequencyArray import (
+        SubstructureGenerateFrequencyArray,
+    )
+    from ..StepMiscellaneous.SubstructureGenerateModesArray import (
+        SubstructureGenerateModesArray,
+    )
 
 
 class StepModel(ModelBase):
@@ -121,6 +125,7 @@ class StepModel(ModelBase):
         step: AnnealStep
             An AnnealStep object.
         """
+        from ..Step.AnnealStep import AnnealStep
         self.steps[name] = step = AnnealStep(
             name, previous, description, refTemp, maintainAttributes
         )
@@ -196,6 +201,7 @@ class StepModel(ModelBase):
         step: BuckleStep
             A BuckleStep object.
         """
+        from ..Step.BuckleStep import BuckleStep
         self.steps[name] = step = BuckleStep(
             name,
             previous,
@@ -280,6 +286,7 @@ class StepModel(ModelBase):
         step: ComplexFrequencyStep
             A ComplexFrequencyStep object.
         """
+        from ..Step.ComplexFrequencyStep import ComplexFrequencyStep
         self.steps[name] = step = ComplexFrequencyStep(
             name,
             previous,
@@ -415,6 +422,7 @@ class StepModel(ModelBase):
         step: CoupledTempDisplacementStep
             A CoupledTempDisplacementStep object.
         """
+        from ..Step.CoupledTempDisplacementStep import CoupledTempDisplacementStep
         self.steps[name] = step = CoupledTempDisplacementStep(
             name,
             previous,
@@ -559,6 +567,7 @@ class StepModel(ModelBase):
         step: CoupledThermalElectricalStructuralStep
             A CoupledThermalElectricalStructuralStep object.
         """
+        from ..Step.CoupledThermalElectricalStructuralStep import CoupledThermalElectricalStructuralStep
         self.steps[name] = step = CoupledThermalElectricalStructuralStep(
             name,
             previous,
@@ -681,6 +690,7 @@ class StepModel(ModelBase):
         step: CoupledThermalElectricStep
             A CoupledThermalElectricStep object.
         """
+        from ..Step.CoupledThermalElectricStep import CoupledThermalElectricStep
         self.steps[name] = step = CoupledThermalElectricStep(
             name,
             previous,
@@ -829,6 +839,7 @@ class StepModel(ModelBase):
         step: DirectCyclicStep
             A DirectCyclicStep object.
         """
+        from ..Step.DirectCyclicStep import DirectCyclicStep
         self.steps[name] = step = DirectCyclicStep(
             name,
             previous,
@@ -898,6 +909,7 @@ class StepModel(ModelBase):
         step: EmagTimeHarmonicStep
             An EmagTimeHarmonicStep object.
         """
+        from ..Step.EmagTimeHarmonicStep import EmagTimeHarmonicStep
         self.steps[name] = step = EmagTimeHarmonicStep(
             name, previous, frequencyRange, description, factorization
         )
@@ -986,6 +998,7 @@ class StepModel(ModelBase):
         step: ExplicitDynamicsStep
             An ExplicitDynamicsStep object.
         """
+        from ..Step.ExplicitDynamicsStep import ExplicitDynamicsStep
         self.steps[name] = step = ExplicitDynamicsStep(
             name,
             previous,
@@ -1152,6 +1165,7 @@ class StepModel(ModelBase):
         step: FrequencyStep
             A FrequencyStep object.
         """
+        from ..Step.FrequencyStep import FrequencyStep
         self.steps[name] = step = FrequencyStep(
             name,
             previous,
@@ -1274,6 +1288,7 @@ class StepModel(ModelBase):
         step: GeostaticStep
             A GeostaticStep object.
         """
+        from ..Step.GeostaticStep import GeostaticStep
         self.steps[name] = step = GeostaticStep(
             name,
             previous,
@@ -1400,6 +1415,7 @@ class StepModel(ModelBase):
         step: HeatTransferStep
             A HeatTransferStep object.
         """
+        from ..Step.HeatTransferStep import HeatTransferStep
         self.steps[name] = step = HeatTransferStep(
             name,
             previous,
@@ -1554,6 +1570,7 @@ class StepModel(ModelBase):
         step: ImplicitDynamicsStep
             An ImplicitDynamicsStep object.
         """
+        from ..Step.ImplicitDynamicsStep import ImplicitDynamicsStep
         self.steps[name] = step = ImplicitDynamicsStep(
             name,
             previous,
@@ -1667,6 +1684,7 @@ class StepModel(ModelBase):
         step: MassDiffusionStep
             A MassDiffusionStep object.
         """
+        from ..Step.MassDiffusionStep import MassDiffusionStep
         self.steps[name] = step = MassDiffusionStep(
             name,
             previous,
@@ -1751,6 +1769,7 @@ class StepModel(ModelBase):
         step: ModalDynamicsStep
             A ModalDynamicsStep object.
         """
+        from ..Step.ModalDynamicsStep import ModalDynamicsStep
         self.steps[name] = step = ModalDynamicsStep(
             name,
             previous,
@@ -1831,6 +1850,7 @@ class StepModel(ModelBase):
         step: RandomResponseStep
             A RandomResponseStep object.
         """
+        from ..Step.RandomResponseStep import RandomResponseStep
         self.steps[name] = step = RandomResponseStep(
             name,
             previous,
@@ -1911,6 +1931,7 @@ class StepModel(ModelBase):
         step: ResponseSpectrumStep
             A ResponseSpectrumStep object.
         """
+        from ..Step.ResponseSpectrumStep import ResponseSpectrumStep
         self.steps[name] = step = ResponseSpectrumStep(
             name,
             previous,
@@ -2058,6 +2079,7 @@ class StepModel(ModelBase):
         step: SoilsStep
             A SoilsStep object.
         """
+        from ..Step.SoilsStep import SoilsStep
         self.steps[name] = step = SoilsStep(
             name,
             previous,
@@ -2132,6 +2154,7 @@ class StepModel(ModelBase):
         step: StaticLinearPerturbationStep
             A StaticLinearPerturbationStep object.
         """
+        from ..Step.StaticLinearPerturbationStep import StaticLinearPerturbationStep
         self.steps[name] = step = StaticLinearPerturbationStep(
             name, previous, description, matrixSolver, matrixStorage, maintainAttributes
         )
@@ -2254,6 +2277,7 @@ class StepModel(ModelBase):
         step: StaticRiksStep
             A StaticRiksStep object.
         """
+        from ..Step.StaticRiksStep import StaticRiksStep
         self.steps[name] = step = StaticRiksStep(
             name,
             previous,
@@ -2410,6 +2434,7 @@ class StepModel(ModelBase):
         step: StaticRiksStep
             A StaticRiksStep object.
         """
+        from ..Step.StaticStep import StaticStep
         self.steps[name] = step = StaticStep(
             name,
             previous,
@@ -2499,6 +2524,7 @@ class StepModel(ModelBase):
         step: SteadyStateDirectStep
             A SteadyStateDirectStep object.
         """
+        from ..Step.SteadyStateDirectStep import SteadyStateDirectStep
         self.steps[name] = step = SteadyStateDirectStep(
             name,
             previous,
@@ -2580,6 +2606,7 @@ class StepModel(ModelBase):
         step: SteadyStateModalStep
             A SteadyStateModalStep object.
         """
+        from ..Step.SteadyStateModalStep import SteadyStateModalStep
         self.steps[name] = step = SteadyStateModalStep(
             name,
             previous,
@@ -2670,6 +2697,7 @@ class StepModel(ModelBase):
         step: SteadyStateSubspaceStep
             A SteadyStateSubspaceStep object.
         """
+        from ..Step.SteadyStateSubspaceStep import SteadyStateSubspaceStep
         self.steps[name] = step = SteadyStateSubspaceStep(
             name,
             previous,
@@ -2744,6 +2772,7 @@ class StepModel(ModelBase):
         step: SubspaceDynamicsStep
             A SubspaceDynamicsStep object.
         """
+        from ..Step.SubspaceDynamicsStep import SubspaceDynamicsStep
         self.steps[name] = step = SubspaceDynamicsStep(
             name,
             previous,
@@ -2860,6 +2889,7 @@ class StepModel(ModelBase):
         step: SubstructureGenerateStep
             A SubstructureGenerateStep object.
         """
+        from ..Step.SubstructureGenerateStep import SubstructureGenerateStep
         self.steps[name] = step = SubstructureGenerateStep(
             name,
             previous,
@@ -2962,6 +2992,7 @@ class StepModel(ModelBase):
         step: TempDisplacementDynamicsStep
             A TempDisplacementDynamicsStep object.
         """
+        from ..Step.TempDisplacementDynamicsStep import TempDisplacementDynamicsStep
         self.steps[name] = step = TempDisplacementDynamicsStep(
             name,
             previous,
@@ -3100,6 +3131,7 @@ class StepModel(ModelBase):
         step: ViscoStep
             A ViscoStep object.
         """
+        from ..Step.ViscoStep import ViscoStep
         self.steps[name] = step = ViscoStep(
             name,
             previous,
@@ -1,4 +1,5 @@
 from .CompositeDampingComponentArray import CompositeDampingComponentArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class CompositeDamping:
@@ -21,4 +22,6 @@ class CompositeDamping:
     """
 
     # A CompositeDampingComponentArray object.
-    components: CompositeDampingComponentArray = CompositeDampingComponentArray()
+    components: CompositeDampingComponentArray = lazyDefault(
+        CompositeDampingComponentArray
+    )
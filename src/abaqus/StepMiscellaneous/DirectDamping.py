@@ -1,4 +1,5 @@
 from .DirectDampingComponentArray import DirectDampingComponentArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class DirectDamping:
@@ -21,4 +22,4 @@ class DirectDamping:
     """
 
     # A DirectDampingComponentArray object.
-    components: DirectDampingComponentArray = DirectDampingComponentArray()
+    components: DirectDampingComponentArray = lazyDefault(DirectDampingComponentArray)
@@ -1,6 +1,7 @@
 from .DirectDampingByFrequencyComponentArray import (
     DirectDampingByFrequencyComponentArray,
 )
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class DirectDampingByFrequency:
@@ -23,6 +24,6 @@ class DirectDampingByFrequency:
     """
 
     # A DirectDampingByFrequencyComponentArray object.
-    components: DirectDampingByFrequencyComponentArray = (
-        DirectDampingByFrequencyComponentArray()
+    components: DirectDampingByFrequencyComponentArray = lazyDefault(
+        DirectDampingByFrequencyComponentArray
     )
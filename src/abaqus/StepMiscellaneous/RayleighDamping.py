@@ -1,4 +1,5 @@
 from .RayleighDampingComponentArray import RayleighDampingComponentArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class RayleighDamping:
@@ -21,4 +22,6 @@ class RayleighDamping:
     """
 
     # A RayleighDampingComponentArray object.
-    components: RayleighDampingComponentArray = RayleighDampingComponentArray()
+    components: RayleighDampingComponentArray = lazyDefault(
+        RayleighDampingComponentArray
+    )
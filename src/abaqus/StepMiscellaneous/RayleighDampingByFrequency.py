@@ -1,6 +1,7 @@
 from .RayleighDampingByFrequencyComponentArray import (
     RayleighDampingByFrequencyComponentArray,
 )
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class RayleighDampingByFrequency:
@@ -23,6 +24,6 @@ class RayleighDampingByFrequency:
     """
 
     # A RayleighDampingByFrequencyComponentArray object.
-    components: RayleighDampingByFrequencyComponentArray = (
-        RayleighDampingByFrequencyComponentArray()
+    components: RayleighDampingByFrequencyComponentArray = lazyDefault(
+        RayleighDampingByFrequencyComponentArray
     )
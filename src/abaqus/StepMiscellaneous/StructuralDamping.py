@@ -1,4 +1,5 @@
 from .StructuralDampingComponentArray import StructuralDampingComponentArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class StructuralDamping:
@@ -21,4 +22,6 @@ class StructuralDamping:
     """
 
     # A StructuralDampingComponentArray object.
-    components: StructuralDampingComponentArray = StructuralDampingComponentArray()
+    components: StructuralDampingComponentArray = lazyDefault(
+        StructuralDampingComponentArray
+    )
@@ -1,6 +1,7 @@
 from .StructuralDampingByFrequencyComponentArray import (
     StructuralDampingByFrequencyComponentArray,
 )
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class StructuralDampingByFrequency:
@@ -23,6 +24,6 @@ class StructuralDampingByFrequency:
     """
 
     # A StructuralDampingByFrequencyComponentArray object.
-    components: StructuralDampingByFrequencyComponentArray = (
-        StructuralDampingByFrequencyComponentArray()
+    components: StructuralDampingByFrequencyComponentArray = lazyDefault(
+        StructuralDampingByFrequencyComponentArray
     )
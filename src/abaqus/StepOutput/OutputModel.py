@@ -1,13 +1,17 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .FieldOutputRequest import FieldOutputRequest
-from .HistoryOutputRequest import HistoryOutputRequest
-from .IntegratedOutputSection import IntegratedOutputSection
-from .TimePoint import TimePoint
 from ..Model.ModelBase import ModelBase
 from ..Region.Region import Region
 
+if typing.TYPE_CHECKING:
+    from .FieldOutputRequest import FieldOutputRequest
+    from .HistoryOutputRequest import HistoryOutputRequest
+    from .IntegratedOutputSection import IntegratedOutputSection
+    from .TimePoint import TimePoint
+
 
 class OutputModel(ModelBase):
     """Abaqus creates a Model object named `Model-1` when a session is started.
@@ -143,6 +147,7 @@ class OutputModel(ModelBase):
         -------
             A FieldOutputRequest object.
         """
+        from .FieldOutputRequest import FieldOutputRequest
         self.fieldOutputRequests[name] = FieldOutputRequest(
             name,
             createStepName,
@@ -294,6 +299,7 @@ class OutputModel(ModelBase):
         -------
             A HistoryOutputRequest object.
         """
+        from .HistoryOutputRequest import HistoryOutputRequest
         self.historyOutputRequests[name] = HistoryOutputRequest(
             name,
             createStepName,
@@ -380,6 +386,7 @@ class OutputModel(ModelBase):
         -------
             An IntegratedOutputSection object.
         """
+        from .IntegratedOutputSection import IntegratedOutputSection
         self.integratedOutputSections[
             name
         ] = integratedOutputSection = IntegratedOutputSection(
@@ -421,5 +428,6 @@ class OutputModel(ModelBase):
         InvalidNameError
         RangeError
         """
+        from .TimePoint import TimePoint
         self.timePoints[name] = timePoint = TimePoint(name, points)
         return timePoint
@@ -1,4 +1,5 @@
 from abaqusConstants import *
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..TableCollection.ParameterColumn import ParameterColumn
 from ..TableCollection.ParameterColumnArray import ParameterColumnArray
 
@@ -32,7 +33,7 @@ class ParameterTable:
     """
 
     # A ParameterColumnArray specifying all the columns in the ParameterTable.
-    columns: ParameterColumnArray = ParameterColumnArray()
+    columns: ParameterColumnArray = lazyDefault(ParameterColumnArray)
 
     # A DataTableArray specifying all the dataTables in the ParameterTable.
     dataTables: str = ""
@@ -1,5 +1,6 @@
 from abaqusConstants import *
 from .PropertyTableData import PropertyTableData
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class PropertyTable:
@@ -31,7 +32,9 @@ class PropertyTable:
     """
 
     # A repository of PropertyTableData. Specifies all the propertyTableData in PropertyTable
-    propertyTableDatas: dict[str, PropertyTableData] = dict[str, PropertyTableData]()
+    propertyTableDatas: dict[str, PropertyTableData] = lazyDefault(
+        dict[str, PropertyTableData]
+    )
 
     def __init__(self, name: str, properties: str, variables: str = ""):
         """This method creates a PropertyTable object.
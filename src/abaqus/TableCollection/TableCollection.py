@@ -1,3 +1,4 @@
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..TableCollection.DataTable import DataTable
 from ..TableCollection.ParameterTable import ParameterTable
 from ..TableCollection.PropertyTable import PropertyTable
@@ -31,13 +32,13 @@ class TableCollection:
     """
 
     # A repository of the PropertyTable object.
-    propertyTables: dict[str, PropertyTable] = dict[str, PropertyTable]()
+    propertyTables: dict[str, PropertyTable] = lazyDefault(dict[str, PropertyTable])
 
     # A repository of the ParameterTable object
-    parameterTables: dict[str, ParameterTable] = dict[str, ParameterTable]()
+    parameterTables: dict[str, ParameterTable] = lazyDefault(dict[str, ParameterTable])
 
     # sequence of the DataTable object
-    dataTables: list[DataTable] = []
+    dataTables: list[DataTable] = lazyDefault(list)
 
     def __init__(self, name: str):
         """This method creates a TableCollection object and places it in the tableCollections
@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .ElementProgressiveActivation import ElementProgressiveActivation
 from ..Assembly.AssemblyBase import AssemblyBase
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..Region.Region import Region
 
 
@@ -20,9 +21,9 @@ class TableCollectionAssembly(AssemblyBase):
 
     """
 
-    elementProgressiveActivations: dict[str, ElementProgressiveActivation] = dict[
+    elementProgressiveActivations: dict[str, ElementProgressiveActivation] = lazyDefault(dict[
         str, ElementProgressiveActivation
-    ]()
+    ])
 
     def ElementProgressiveActivation(
         self,
@@ -1,8 +1,14 @@
+from __future__ import annotations
+
+import typing
+
 from abaqusConstants import *
-from .EventSeries import EventSeries
-from .EventSeriesType import EventSeriesType
 from ..Model.ModelBase import ModelBase
 
+if typing.TYPE_CHECKING:
+    from .EventSeries import EventSeries
+    from .EventSeriesType import EventSeriesType
+
 
 class TableCollectionModel(ModelBase):
     """Abaqus creates a Model object named `Model-1` when a session is started.
@@ -67,6 +73,7 @@ class TableCollectionModel(ModelBase):
         ------
             RangeError.
         """
+        from .EventSeries import EventSeries
         self.eventSeriesDatas[name] = eventSeries = EventSeries(
             name,
             createStepName,
@@ -109,6 +116,7 @@ class TableCollectionModel(ModelBase):
         ------
             RangeError.
         """
+        from .EventSeriesType import EventSeriesType
         self.eventSeriesTypes[name] = eventSeriesType = EventSeriesType(
             name, createStepName, fields
         )
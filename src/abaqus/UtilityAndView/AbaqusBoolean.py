@@ -1,4 +1,4 @@
-class AbaqusBoolean:
+class AbaqusBoolean(int):
     """The AbaqusBoolean object is used in a similar way to the SymbolicConstant object. If you
     pass an AbaqusBoolean object to the Python repr() function, the function returns the
     text without quotes. In effect, the text is the variable that, by convention, refers to
@@ -24,7 +24,19 @@ class AbaqusBoolean:
 
     """
 
-    def __init__(self, value: int):
+    __slots__ = ()
+
+    # OFF and ON, they are created after the class
+    _values: tuple = ()
+
+    def __new__(cls, value=0):
+        if isinstance(value, str):
+            if value not in ("ON", "OFF"):
+                raise ValueError("Invalid AbaqusBoolean text {!r}".format(value))
+            value = value == "ON"
+        return cls._values[bool(value)]
+
+    def __init__(self, value: int = 0):
         """The AbaqusBoolean method creates an AbaqusBoolean object.
 
         Notes
@@ -46,3 +58,50 @@ class AbaqusBoolean:
             An AbaqusBoolean object.
         """
         pass
+
+    def getText(self) -> str:
+        """This method returns the text of the AbaqusBoolean object.
+
+        Returns
+        -------
+        str
+            A String specifying the text, ON or OFF.
+        """
+        return "ON" if self else "OFF"
+
+    def getId(self) -> int:
+        """This method returns the id of the AbaqusBoolean object.
+
+        Returns
+        -------
+        int
+            An Int specifying the id, 1 for ON and 0 for OFF.
+        """
+        return int(self)
+
+    def isTrue(self) -> bool:
+        """This method returns whether the AbaqusBoolean object is ON.
+
+        Returns
+        -------
+        bool
+            A Boolean specifying whether the object is ON.
+        """
+        return bool(self)
+
+    def __repr__(self):
+        return self.getText()
+
+    __str__ = __repr__
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return AbaqusBoolean, (int(self),)
+
+
+AbaqusBoolean._values = (int.__new__(AbaqusBoolean, 0), int.__new__(AbaqusBoolean, 1))
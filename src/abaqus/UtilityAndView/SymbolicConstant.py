@@ -1,3 +1,8 @@
+import re
+
+_TEXT = re.compile(r"[A-Z_][A-Z0-9_]*\Z")
+
+
 class SymbolicConstant:
     """The SymbolicConstant object represents a string in a way that can be stored in a replay
     file and used as an argument to Abaqus Scripting Interface methods and functions. By
@@ -11,6 +16,10 @@ class SymbolicConstant:
     module. Some SymbolicConstant objects and the SymbolicConstant constructor are defined
     in the abaqus module. The SymbolicConstant constructor is also defined in the
     symbolicConstants module.
+    SymbolicConstant objects are compared by identity and are not Strings, i.e.,
+    `FIELD == 'FIELD'` is False. Every SymbolicConstant object has an Int id, the ids of the
+    constants of the abaqusConstants module are fixed in that module, the ids of other constants
+    are assigned in the order of creation.
 
     Notes
     -----
@@ -23,7 +32,41 @@ class SymbolicConstant:
 
     """
 
-    def __init__(self, text: str):
+    __slots__ = ("_text", "_id", "__weakref__")
+
+    # The SymbolicConstant objects by text and by id
+    _cache: dict = {}
+    _ids: dict = {}
+    _counter = 2
+
+    def __new__(cls, text: str, scdId: int = -1):
+        self = cls._cache.get(text)
+        if self is not None:
+            return self
+        if text in ("ON", "OFF"):
+            from .AbaqusBoolean import AbaqusBoolean
+
+            return AbaqusBoolean(text)
+        if not isinstance(text, str) or not _TEXT.match(text):
+            raise ValueError("Invalid SymbolicConstant text {!r}".format(text))
+        if scdId < 0:
+            scdId = cls._counter
+        elif scdId in cls._ids or scdId in (0, 1):
+            raise ValueError("SymbolicConstant id {} is already used".format(scdId))
+        return cls._define(text, scdId)
+
+    @classmethod
+    def _define(cls, text: str, scdId: int) -> "SymbolicConstant":
+        # Create a new constant without validation, the abaqusConstants module defines its
+        # frozen table of constants with this method, which is much faster than the constructor
+        self = object.__new__(cls)
+        self._text = text
+        self._id = scdId
+        cls._cache[text] = cls._ids[scdId] = self
+        cls._counter = max(cls._counter, scdId + 1)
+        return self
+
+    def __init__(self, text: str, scdId: int = -1):
         """The SymbolicConstant method creates a SymbolicConstant object.
 
         Notes
@@ -39,9 +82,84 @@ class SymbolicConstant:
         text
             A String specifying the text of the SymbolicConstant object. The String must contain
             only capital letters, digits, or underscores and must not start with a digit.
+        scdId
+            An Int specifying the id of a new SymbolicConstant object. The default value is -1,
+            i.e., the next free id.
 
         Returns
         -------
             A SymbolicConstant object.
+
+        Raises
+        ------
+        ValueError
+            If the text is not valid.
         """
         pass
+
+    @classmethod
+    def fromId(cls, scdId: int) -> "SymbolicConstant":
+        """This method returns the SymbolicConstant object with the given id.
+
+        Parameters
+        ----------
+        scdId
+            An Int specifying the id of the SymbolicConstant object.
+
+        Returns
+        -------
+        SymbolicConstant
+            A SymbolicConstant object.
+
+        Raises
+        ------
+        KeyError
+            If no SymbolicConstant object has the id.
+        """
+        if scdId in (0, 1):
+            from .AbaqusBoolean import AbaqusBoolean
+
+            return AbaqusBoolean(scdId)
+        return cls._ids[scdId]
+
+    def getText(self) -> str:
+        """This method returns the text of the SymbolicConstant object.
+
+        Returns
+        -------
+        str
+            A String specifying the text.
+        """
+        return self._text
+
+    def getId(self) -> int:
+        """This method returns the id of the SymbolicConstant object.
+
+        Returns
+        -------
+        int
+            An Int specifying the id.
+        """
+        return self._id
+
+    def __hash__(self):
+        return self._id
+
+    def __lt__(self, other):
+        if isinstance(other, SymbolicConstant):
+            return self._text < other._text
+        return NotImplemented
+
+    def __repr__(self):
+        return self._text
+
+    __str__ = __repr__
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return SymbolicConstant, (self._text,)
@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .AreaStyle import AreaStyle
 from .LineStyle import LineStyle
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class Area:
@@ -137,10 +138,10 @@ class Area:
     pb: float = 1
 
     # An AreaStyle object specifying whether and how to fill the area.
-    style: AreaStyle = AreaStyle()
+    style: AreaStyle = lazyDefault(AreaStyle)
 
     # A LineStyle object specifying whether and how to draw the border of the area.
-    border: LineStyle = LineStyle()
+    border: LineStyle = lazyDefault(LineStyle)
 
     # A pair of Floats specifying the X- and Y-offsets in millimeters from the lower-left
     # corner of the XYPlot.
@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .AxisData import AxisData
 from .LineStyle import LineStyle
 from .TextStyle import TextStyle
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class Axis:
@@ -95,21 +96,21 @@ class Axis:
     labelPlacement: SymbolicConstant = INSIDE
 
     # An AxisData object specifying the numerical data of the axis.
-    axisData: AxisData = AxisData()
+    axisData: AxisData = lazyDefault(AxisData)
 
     # A LineStyle object specifying the line properties used to display the axis.
-    lineStyle: LineStyle = LineStyle()
+    lineStyle: LineStyle = lazyDefault(LineStyle)
 
     # A TextStyle object specifying the text properties to be used when displaying axis
     # labels.
-    labelStyle: TextStyle = TextStyle()
+    labelStyle: TextStyle = lazyDefault(TextStyle)
 
     # A TextStyle object specifying the text properties to be used when displaying the axis
     # title.
-    titleStyle: TextStyle = TextStyle()
+    titleStyle: TextStyle = lazyDefault(TextStyle)
 
     # A LineStyle object specifying the line properties to be used when displaying axis ticks.
-    tickStyle: LineStyle = LineStyle()
+    tickStyle: LineStyle = lazyDefault(LineStyle)
 
     def setValues(
         self,
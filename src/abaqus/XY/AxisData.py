@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .QuantityType import QuantityType
 from .XYCurveArray import XYCurveArray
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class AxisData:
@@ -210,11 +211,11 @@ class AxisData:
 
     # An XYCurveArray object specifying a read-only sequence of Curve objects associated to
     # this axis.
-    curves: XYCurveArray = XYCurveArray()
+    curves: XYCurveArray = lazyDefault(XYCurveArray)
 
     # A QuantityType object specifying the quantity type: i.e. the physical dimension and
     # associated label of the data represented by this axis.
-    quantityType: QuantityType = QuantityType()
+    quantityType: QuantityType = lazyDefault(QuantityType)
 
     # A tuple of Floats specifying the read-only major tick values shown.
     tickValues: float = None
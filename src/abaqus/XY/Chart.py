@@ -6,6 +6,7 @@ from .Legend import Legend
 from .LineStyle import LineStyle
 from .TextStyle import TextStyle
 from .XYCurve import XYCurve
+from ..LazyDefault.LazyDefault import lazyDefault
 from ..UtilityAndView.View import View
 
 
@@ -86,50 +87,50 @@ class Chart:
 
     # A repository of XYCurve objects specifying a repository of XYCurve objects to display in
     # the Chart.
-    curves: dict[str, XYCurve] = dict[str, XYCurve]()
+    curves: dict[str, XYCurve] = lazyDefault(dict[str, XYCurve])
 
     # An AxisArray object specifying a read-only sequence of axis objects displayed as axes1 -
     # the abscissa for a Cartesian chart.
-    axes1: AxisArray = AxisArray()
+    axes1: AxisArray = lazyDefault(AxisArray)
 
     # An AxisArray object specifying a read-only sequence of axis objects displayed as axes2 -
     # the ordinate for a Cartesian chart.
-    axes2: AxisArray = AxisArray()
+    axes2: AxisArray = lazyDefault(AxisArray)
 
     # An Area object specifying position, padding, background and borders of the chart.
-    area: Area = Area()
+    area: Area = lazyDefault(Area)
 
     # An Area object specifying how to display the grid area.
-    gridArea: Area = Area()
+    gridArea: Area = lazyDefault(Area)
 
     # A Legend object specifying the attributes for the legend of the chart.
-    legend: Legend = Legend()
+    legend: Legend = lazyDefault(Legend)
 
     # A LineStyle object specifying the line properties to be used when drawing major
     # gridlines along axis 1.
-    majorAxis1GridStyle: LineStyle = LineStyle()
+    majorAxis1GridStyle: LineStyle = lazyDefault(LineStyle)
 
     # A LineStyle object specifying the line properties to be used when drawing major
     # gridlines along axis 2.
-    majorAxis2GridStyle: LineStyle = LineStyle()
+    majorAxis2GridStyle: LineStyle = lazyDefault(LineStyle)
 
     # A LineStyle object specifying the line properties to be used when drawing minor
     # gridlines along axis 1.
-    minorAxis1GridStyle: LineStyle = LineStyle()
+    minorAxis1GridStyle: LineStyle = lazyDefault(LineStyle)
 
     # A LineStyle object specifying the line properties to be used when drawing minor
     # gridlines along axis 2.
-    minorAxis2GridStyle: LineStyle = LineStyle()
+    minorAxis2GridStyle: LineStyle = lazyDefault(LineStyle)
 
     # A TextStyle object specifying the text properties to be used when creating tags.
-    tagTextStyle: TextStyle = TextStyle()
+    tagTextStyle: TextStyle = lazyDefault(TextStyle)
 
     # An AreaStyle object specifying the area properties to be used when creating tags.
-    tagAreaStyle: AreaStyle = AreaStyle()
+    tagAreaStyle: AreaStyle = lazyDefault(AreaStyle)
 
     # A LineStyle object specifying the tag area border properties to be used when creating
     # tags.
-    tagBorder: LineStyle = LineStyle()
+    tagBorder: LineStyle = lazyDefault(LineStyle)
 
     # A tuple of Floats specifying a transformation matrix used to scale or pan along the axes
     # of the Chart.
@@ -5,6 +5,7 @@ from .Axis import Axis
 from .Legend import Legend
 from .LineStyle import LineStyle
 from .TextStyle import TextStyle
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class DefaultChartOptions:
@@ -23,7 +24,7 @@ class DefaultChartOptions:
 
     """
 
-    areaStyle: AreaStyle = AreaStyle()
+    areaStyle: AreaStyle = lazyDefault(AreaStyle)
 
     def setValues(
         self,
@@ -1,5 +1,6 @@
 from .Area import Area
 from .Title import Title
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class DefaultPlot:
@@ -29,8 +30,8 @@ class DefaultPlot:
 
     # An Area object specifying an Area used to hold on to the default display properties for
     # the plot area.
-    area: Area = Area()
+    area: Area = lazyDefault(Area)
 
     # A Title object specifying a Title object used to hold on to the default properties of
     # the XY-Plot title.
-    title: Title = Title()
+    title: Title = lazyDefault(Title)
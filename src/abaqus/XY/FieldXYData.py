@@ -0,0 +1,370 @@
+import re
+import typing
+
+import numpy
+
+from abaqusConstants import *
+from .XYData import XYData
+from .XYValues import XYValues
+from ..Odb.FieldInvariants import tensorComponents, tensorInvariant
+from ..Odb.RegionIndex import LabelBitmap, _address, regionIndex, setLabels
+
+# The position of the bulk data blocks read for each output position
+BLOCK_POSITIONS = {
+    NODAL: NODAL,
+    INTEGRATION_POINT: INTEGRATION_POINT,
+    ELEMENT_NODAL: ELEMENT_NODAL,
+    ELEMENT_CENTROID: CENTROID,
+}
+
+# The invariants by the labels of the refinements, e.g., (INVARIANT, 'Mises')
+INVARIANT_LABELS = {
+    "Magnitude": MAGNITUDE,
+    "Mises": MISES,
+    "Tresca": TRESCA,
+    "Pressure": PRESS,
+    "Third Invariant": INV3,
+    "Max. Principal": MAX_PRINCIPAL,
+    "Mid. Principal": MID_PRINCIPAL,
+    "Min. Principal": MIN_PRINCIPAL,
+    "Max. In-Plane Principal": MAX_INPLANE_PRINCIPAL,
+    "Min. In-Plane Principal": MIN_INPLANE_PRINCIPAL,
+    "Out-of-Plane Principal": OUTOFPLANE_PRINCIPAL,
+}
+
+# The operators applied to the Y-values of each curve
+UNARY_OPERATORS = {
+    ABSOLUTE: numpy.abs,
+    COSINE: numpy.cos,
+    SINE: numpy.sin,
+    TANGENT: numpy.tan,
+    HYPERBOLIC_SINE: numpy.sinh,
+    EXPONENTIAL: numpy.exp,
+    NATURAL_LOG: numpy.log,
+    LOG: numpy.log10,
+    SQUARE_ROOT: numpy.sqrt,
+}
+
+# The operators combining the Y-values of all the curves of a quantity into one curve
+REDUCTIONS = {
+    ADD: lambda values: values.sum(axis=1),
+    MULTIPLY: lambda values: values.prod(axis=1),
+    MAXIMUM: lambda values: values.max(axis=1),
+    MINIMUM: lambda values: values.min(axis=1),
+    AVERAGE: lambda values: values.mean(axis=1),
+    RANGE: lambda values: numpy.ptp(values, axis=1),
+    SRSS: lambda values: numpy.sqrt(numpy.square(values, dtype=numpy.float64).sum(axis=1)),
+}
+
+
+def xyDataListFromField(
+    odb,
+    outputPosition: SymbolicConstant,
+    variable: tuple,
+    elementSets: typing.Union[str, tuple] = (),
+    elementLabels: tuple = (),
+    nodeSets: typing.Union[str, tuple] = (),
+    nodeLabels: tuple = (),
+    numericForm: SymbolicConstant = REAL,
+    complexAngle: float = 0,
+    operator: SymbolicConstant = None,
+) -> list[XYData]:
+    """This function creates the XYData objects of field output variables at nodes or elements
+    over all the frames of an output database, see
+    :py:meth:`~abaqus.XY.XYSession.XYSession.xyDataListFromField`. The rows of the bulk data
+    blocks of the requested labels are found once, with the indexes of the labels, and are
+    gathered from every frame into a matrix of shape (frames, curves) per component or
+    invariant. The data of each XYData object is an
+    :py:class:`~abaqus.XY.XYValues.XYValues` object of the frame times and of a column of the
+    matrix, which are not copied.
+
+    The X-values are the total times of the frames. The XYData objects are named by the Abaqus
+    convention, e.g., "U:U1 PI: PART-1-1 N: 12" or "S:Mises PI: PART-1-1 E: 5 IP: 1".
+
+    Returns
+    -------
+    list[XYData]
+        A list of XYData objects, in the order of the variables, of the components or
+        invariants, and of the labels.
+
+    Raises
+    ------
+    ValueError
+        If a set, an instance, a variable, a component, or an invariant does not exist, or if the
+        operator is not supported.
+    """
+    if operator is not None and operator not in UNARY_OPERATORS and operator not in REDUCTIONS:
+        raise ValueError("The operator {} is not supported".format(operator))
+    regions = _regions(odb, elementSets, elementLabels, nodeSets, nodeLabels)
+    frames = [(step, index) for step in odb.steps.values() for index in range(len(step.frames))]
+    xyDataList = []
+    for name, position, refinements, location in _variables(variable, outputPosition):
+        gather = _FieldGather(odb, regions, name, BLOCK_POSITIONS.get(position, position), refinements, location)
+        times = numpy.empty(len(frames), numpy.float64)
+        count = 0
+        for step, index in frames:
+            frame = step.frames[index]
+            field = frame.fieldOutputs.get(name)
+            if field is None:
+                continue
+            times[count] = (step.totalTime or 0.0) + frame.frameValue
+            gather.add(field, count, len(frames), numericForm, complexAngle)
+            count += 1
+        if gather.values is None:
+            raise ValueError("The variable {} is not in the output database".format(name))
+        times = times[:count]
+        values = gather.values[:count]
+        for quantity, label in enumerate(gather.quantityLabels):
+            matrix = values[:, :, quantity]
+            if operator in REDUCTIONS:
+                xyDataList.append(_xyData(name, "{}({}:{})".format(operator, name, label), times, REDUCTIONS[operator](matrix), ""))
+                continue
+            if operator is not None:
+                matrix = UNARY_OPERATORS[operator](matrix)
+            for curve, (curveName, description) in enumerate(gather.curveNames(label)):
+                xyDataList.append(_xyData(name, curveName, times, matrix[:, curve], description))
+    return xyDataList
+
+
+class _FieldGather:
+    """The rows of the bulk data blocks of a field output in the requested regions, and the
+    matrix of the values gathered from the frames."""
+
+    def __init__(self, odb, regions: dict, name: str, position: SymbolicConstant, refinements: tuple, location: dict):
+        self.odb = odb
+        self.name = name
+        self.position = position
+        self.refinements = refinements
+        self.location = location
+        # The membership bitmaps of the labels by instance
+        self.bitmaps = {}
+        for instanceName, (nodes, elements) in regions.items():
+            if position is NODAL:
+                instance = odb.rootAssembly.instances[instanceName]
+                if elements is not None:
+                    elementNodes = regionIndex(instance).elementNodes(elements)
+                    nodes = elementNodes if nodes is None else numpy.union1d(nodes, elementNodes)
+                labels = nodes
+            else:
+                labels = elements
+            if labels is not None and len(labels):
+                self.bitmaps[instanceName] = LabelBitmap(labels)
+        # The curves of each block by block key, the rows by label array, and the values
+        self.layout = None
+        self.curves = []
+        self._rows = {}
+        self.values = None
+        self.quantityLabels = ()
+        self._quantities = ()
+
+    def add(self, field, frame: int, frames: int, numericForm: SymbolicConstant, complexAngle: float):
+        blocks = [(key, block, rows) for key, block, rows in self._blocks(field) if len(rows)]
+        if self.layout is None:
+            self._quantities, self.quantityLabels = _quantities(field, self.refinements)
+            self.layout = {}
+            for key, block, rows in blocks:
+                self.layout[key] = slice(len(self.curves), len(self.curves) + len(rows))
+                self.curves.extend(_curves(key[0], block, rows))
+            dtype = numpy.result_type(numpy.asarray(blocks[0][1].data).dtype, numpy.float32) if blocks else numpy.float32
+            self.values = numpy.full((frames, len(self.curves), len(self._quantities)), numpy.nan, dtype)
+        for key, block, rows in blocks:
+            columns = self.layout.get(key)
+            if columns is None or columns.stop - columns.start != len(rows):
+                raise ValueError("The labels of {} are not the same in every frame".format(self.name))
+            data = numpy.asarray(block.data)
+            data = data.reshape(len(data), -1)[rows]
+            if numericForm is not REAL:
+                conjugate = block.conjugateData
+                conjugate = numpy.asarray(conjugate).reshape(len(conjugate), -1)[rows] if len(conjugate) else numpy.zeros_like(data)
+                data = _numericForm(data, conjugate, numericForm, complexAngle)
+            for quantity, (kind, value) in enumerate(self._quantities):
+                if kind is COMPONENT:
+                    self.values[frame, columns, quantity] = data[:, value]
+                elif value is MAGNITUDE:
+                    self.values[frame, columns, quantity] = numpy.sqrt(numpy.square(data, dtype=numpy.float64).sum(axis=1))
+                else:
+                    tensors = tensorComponents(data, block.type, field.isEngineeringTensor)
+                    self.values[frame, columns, quantity] = tensorInvariant(tensors, value)
+
+    def _blocks(self, field):
+        for block in field.bulkDataBlocks:
+            if block.position is not self.position or block.instance is None:
+                continue
+            bitmap = self.bitmaps.get(block.instance.name)
+            if bitmap is None or not _sectionPointMatches(block.sectionPoint, self.location):
+                continue
+            labels = block.nodeLabels if self.position is NODAL else block.elementLabels
+            sectionPoint = block.sectionPoint.number if block.sectionPoint is not None else None
+            key = (block.instance.name, sectionPoint)
+            # The rows are found once for the label arrays shared by the blocks of every frame
+            address = _address(labels)
+            rows = self._rows.get((key, address)) if address is not None else None
+            if rows is None:
+                rows = numpy.flatnonzero(bitmap.contains(labels)) if len(labels) else numpy.zeros(0, numpy.int64)
+                if address is not None:
+                    self._rows[(key, address)] = rows
+            yield key, block, rows
+
+    def curveNames(self, label: str) -> typing.Iterator[tuple[str, str]]:
+        for instanceName, sectionPoint, suffix, description in self.curves:
+            point = " SP:{}".format(sectionPoint) if sectionPoint is not None else ""
+            yield (
+                "{}:{}{} PI: {} {}".format(self.name, label, point, instanceName, suffix),
+                "{}:{} at {} in {}".format(self.name, label, description, instanceName),
+            )
+
+
+def _quantities(field, refinements: tuple) -> tuple[list, list]:
+    # The components and the invariants read, and their labels
+    components = list(field.componentLabels) or [field.name]
+    invariantLabels = {invariant: label for label, invariant in INVARIANT_LABELS.items()}
+    if not refinements:
+        quantities = [(COMPONENT, column) for column in range(len(components))]
+        quantities += [(INVARIANT, invariant) for invariant in field.validInvariants if invariant in invariantLabels]
+        labels = components + [invariantLabels[invariant] for kind, invariant in quantities[len(components) :]]
+        return quantities, labels
+    quantities, labels = [], []
+    for kind, label in refinements:
+        if kind is COMPONENT:
+            if label not in components:
+                raise ValueError("{} is not a component of {}".format(label, field.name))
+            quantities.append((COMPONENT, components.index(label)))
+        else:
+            invariant = INVARIANT_LABELS.get(label)
+            if invariant is None or invariant not in field.validInvariants:
+                raise ValueError("{} is not an invariant of {}".format(label, field.name))
+            quantities.append((INVARIANT, invariant))
+        labels.append(label)
+    return quantities, labels
+
+
+def _curves(instanceName: str, block, rows: numpy.ndarray) -> list[tuple]:
+    # The name suffix and the description of the curve of each row
+    sectionPoint = block.sectionPoint.number if block.sectionPoint is not None else None
+    if block.position is NODAL:
+        nodes = numpy.asarray(block.nodeLabels)[rows].tolist()
+        return [(instanceName, sectionPoint, "N: {}".format(label), "Node {}".format(label)) for label in nodes]
+    elements = numpy.asarray(block.elementLabels)[rows].tolist()
+    if block.position is CENTROID:
+        return [(instanceName, sectionPoint, "E: {} Centroid".format(label), "Element {}".format(label)) for label in elements]
+    if block.position is ELEMENT_NODAL and len(block.nodeLabels):
+        nodes = numpy.asarray(block.nodeLabels)[rows].tolist()
+        return [
+            (instanceName, sectionPoint, "E: {} N: {}".format(element, node), "Element {} Node {}".format(element, node))
+            for element, node in zip(elements, nodes)
+        ]
+    if len(block.integrationPoints):
+        points = numpy.asarray(block.integrationPoints)[rows].tolist()
+    else:
+        # The rows of an element are numbered in order
+        points, previous, point = [], None, 0
+        for element in elements:
+            point = point + 1 if element == previous else 1
+            previous = element
+            points.append(point)
+    kind = "IP" if block.position is INTEGRATION_POINT else "N"
+    return [
+        (instanceName, sectionPoint, "E: {} {}: {}".format(element, kind, point), "Element {} {} {}".format(element, kind, point))
+        for element, point in zip(elements, points)
+    ]
+
+
+def _numericForm(data: numpy.ndarray, conjugate: numpy.ndarray, numericForm: SymbolicConstant, complexAngle: float):
+    if numericForm is IMAGINARY:
+        return conjugate
+    if numericForm is COMPLEX_MAGNITUDE:
+        return numpy.hypot(data, conjugate)
+    if numericForm is COMPLEX_PHASE:
+        return numpy.degrees(numpy.arctan2(conjugate, data))
+    if numericForm is COMPLEX_VAL_AT_ANGLE:
+        angle = numpy.radians(complexAngle)
+        return data * numpy.cos(angle) - conjugate * numpy.sin(angle)
+    raise ValueError("{} is not a numeric form".format(numericForm))
+
+
+def _sectionPointMatches(sectionPoint, location: dict) -> bool:
+    if not location:
+        return True
+    if sectionPoint is None:
+        return False
+    return any(sectionPoint.description and sectionPoint.description in str(value) for value in location.values())
+
+
+def _variables(variable: tuple, outputPosition: SymbolicConstant) -> list[tuple]:
+    # A single variable may be given instead of a tuple of variables
+    if variable and isinstance(variable[0], str):
+        variable = (variable,)
+    variables = []
+    for item in variable:
+        name = item[0]
+        position = item[1] if len(item) > 1 else outputPosition
+        refinements = tuple(item[2]) if len(item) > 2 and item[2] else ()
+        location = item[3] if len(item) > 3 else {}
+        variables.append((name, position, refinements, location))
+    return variables
+
+
+def _regions(odb, elementSets, elementLabels, nodeSets, nodeLabels) -> dict:
+    """The labels of the nodes and of the elements requested by instance name."""
+    members = {"nodes": {}, "elements": {}}
+    for setNames, repository in ((nodeSets, "nodeSets"), (elementSets, "elementSets")):
+        for setName in (setNames,) if isinstance(setNames, str) else setNames:
+            for instanceName, member, labels in _setMembers(odb, setName, repository):
+                members[member].setdefault(instanceName, []).append(labels)
+    for expressions, member in ((nodeLabels, "nodes"), (elementLabels, "elements")):
+        for instanceName, labels in expressions:
+            if instanceName not in odb.rootAssembly.instances:
+                raise ValueError("The part instance {} does not exist".format(instanceName))
+            members[member].setdefault(instanceName, []).append(_labels(labels))
+    regions = {}
+    for member, index in (("nodes", 0), ("elements", 1)):
+        for instanceName, arrays in members[member].items():
+            region = regions.setdefault(instanceName, [None, None])
+            region[index] = numpy.unique(numpy.concatenate(arrays))
+    return regions
+
+
+def _setMembers(odb, setName: str, repository: str) -> typing.Iterator[tuple]:
+    assembly = odb.rootAssembly
+    sets = getattr(assembly, repository)
+    odbSet = sets.get(setName, sets.get(setName.upper()))
+    if odbSet is not None:
+        instanceNames = odbSet.instanceNames or tuple(assembly.instances.keys())
+    else:
+        instanceName, _, name = setName.rpartition(".")
+        instance = assembly.instances.get(instanceName, assembly.instances.get(instanceName.upper()))
+        if instance is None:
+            raise ValueError("The set {} does not exist".format(setName))
+        instanceSets = getattr(instance, repository)
+        odbSet = instanceSets.get(name, instanceSets.get(name.upper()))
+        if odbSet is None:
+            raise ValueError("The set {} does not exist".format(setName))
+        instanceNames = (instance.name,)
+    for instanceName in instanceNames:
+        member, labels = setLabels(odbSet, instanceName)
+        if labels is not None:
+            yield instanceName, member, numpy.asarray(labels, numpy.int64)
+
+
+def _labels(expressions) -> numpy.ndarray:
+    # An Int, a String of a label, or a String of a range "first:last" or "first:last:increment"
+    if isinstance(expressions, (int, str)):
+        expressions = (expressions,)
+    labels = []
+    for expression in expressions:
+        if isinstance(expression, int):
+            labels.append(numpy.array([expression], numpy.int64))
+            continue
+        for item in str(expression).split(","):
+            bounds = [int(value) for value in re.split("[:;]", item.strip())]
+            first, last = bounds[0], bounds[1] if len(bounds) > 1 else bounds[0]
+            increment = bounds[2] if len(bounds) > 2 else 1
+            labels.append(numpy.arange(first, last + 1, increment, dtype=numpy.int64))
+    return numpy.concatenate(labels) if labels else numpy.zeros(0, numpy.int64)
+
+
+def _xyData(name: str, curveName: str, times: numpy.ndarray, values: numpy.ndarray, description: str) -> XYData:
+    xyData = XYData(XYValues(times, values), curveName, contentDescription=description, xValuesLabel="Time", yValuesLabel=name)
+    xyData.sourceType = FROM_ODB
+    xyData.description = description
+    return xyData
@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .Area import Area
 from .TextStyle import TextStyle
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class Legend:
@@ -61,17 +62,17 @@ class Legend:
     showMinMax: Boolean = OFF
 
     # An Area object specifying the area of the legend.
-    area: Area = Area()
+    area: Area = lazyDefault(Area)
 
     # A TextStyle object specifying the text properties used to display the legend text.
-    textStyle: TextStyle = TextStyle()
+    textStyle: TextStyle = lazyDefault(TextStyle)
 
     # A String specifying the title to appear on the legend. The default value is an empty
     # string.
     title: str = ""
 
     # A TextStyle object specifying the text properties used to display the legend title.
-    titleStyle: TextStyle = TextStyle()
+    titleStyle: TextStyle = lazyDefault(TextStyle)
 
     def setValues(
         self,
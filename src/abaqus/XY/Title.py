@@ -1,6 +1,7 @@
 from abaqusConstants import *
 from .Area import Area
 from .TextStyle import TextStyle
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class Title:
@@ -35,14 +36,14 @@ class Title:
     useDefault: Boolean = OFF
 
     # An Area object specifying the area of the title.
-    area: Area = Area()
+    area: Area = lazyDefault(Area)
 
     # A String specifying the text to appear as a title. By default the title is set to the
     # XYPlot object name. The default value is an empty string.
     text: str = ""
 
     # A TextStyle object specifying the text properties used to display the legend title.
-    titleStyle: TextStyle = TextStyle()
+    titleStyle: TextStyle = lazyDefault(TextStyle)
 
     def setValues(
         self,
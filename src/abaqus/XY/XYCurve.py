@@ -2,6 +2,7 @@ from abaqusConstants import *
 from .LineStyle import LineStyle
 from .SymbolStyle import SymbolStyle
 from .XYData import XYData
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class XYCurve:
@@ -76,10 +77,10 @@ class XYCurve:
     data: XYData = None
 
     # A LineStyle object specifying the line properties used to display the curve.
-    lineStyle: LineStyle = LineStyle()
+    lineStyle: LineStyle = lazyDefault(LineStyle)
 
     # A SymbolStyle object specifying the symbol properties used to display the curve.
-    symbolStyle: SymbolStyle = SymbolStyle()
+    symbolStyle: SymbolStyle = lazyDefault(SymbolStyle)
 
     # A String specifying the label to be displayed in the legend. By default, the label is
     # system defined.
@@ -154,7 +154,38 @@ class XYData:
         pass
 
     def __init__(self, *args, **kwargs):
-        pass
+        source = kwargs.get("objectToCopy", args[0] if args else None)
+        if isinstance(source, XYData):
+            self.__dict__.update(source.__dict__)
+            return
+        names = (
+            "data",
+            "name",
+            "sourceDescription",
+            "contentDescription",
+            "positionDescription",
+            "legendLabel",
+            "xValuesLabel",
+            "yValuesLabel",
+            "axis1QuantityType",
+            "axis2QuantityType",
+        )
+        arguments = dict(zip(names, args), **kwargs)
+        # The pairs are kept as given, e.g., an XYValues object of arrays that are not copied
+        self.data = arguments.pop("data", ())
+        self.name = arguments.pop("name", "")
+        self.legendLabel = arguments.pop("legendLabel", "") or self.name
+        for key, value in arguments.items():
+            setattr(self, key, value)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __iter__(self):
+        return iter(self.data)
 
     def XYDataFromFile(
         self,
@@ -410,7 +441,11 @@ class XYData:
         InvalidNameError
         RangeError
         """
-        pass
+        from .FieldXYData import xyDataListFromField
+
+        return xyDataListFromField(
+            odb, outputPosition, variable, elementSets, elementLabels, nodeSets, nodeLabels, numericForm, complexAngle, operator
+        )
 
     def XYDataFromFreeBody(
         self,
@@ -3,6 +3,7 @@ from .Area import Area
 from .Chart import Chart
 from .Title import Title
 from .XYCurve import XYCurve
+from ..LazyDefault.LazyDefault import lazyDefault
 
 
 class XYPlotBase:
@@ -36,16 +37,16 @@ class XYPlotBase:
 
     # An Area object specifying position, padding, background and borders of the XYPlot
     # object.
-    area: Area = Area()
+    area: Area = lazyDefault(Area)
 
     # A Title object specifying the title of the XYPlot object.
-    title: Title = Title()
+    title: Title = lazyDefault(Title)
 
     # A repository of Chart objects.
-    charts: dict[str, Chart] = dict[str, Chart]()
+    charts: dict[str, Chart] = lazyDefault(dict[str, Chart])
 
     # A repository of XYCurve objects.
-    curves: dict[str, XYCurve] = dict[str, XYCurve]()
+    curves: dict[str, XYCurve] = lazyDefault(dict[str, XYCurve])
 
     # A tuple of Floats specifying a transformation matrix used to scale or pan along the axes
     # of the active Chart object of this XYPlot.
@@ -1,14 +1,18 @@
+from __future__ import annotations
+
 import typing
 
 from abaqusConstants import *
-from .AreaStyle import AreaStyle
-from .LineStyle import LineStyle
-from .QuantityType import QuantityType
-from .SymbolStyle import SymbolStyle
-from .TextStyle import TextStyle
-from .XYData import XYData
 from .XYSessionBase import XYSessionBase
-from ..PathAndProbe.Path import Path
+
+if typing.TYPE_CHECKING:
+    from .AreaStyle import AreaStyle
+    from .LineStyle import LineStyle
+    from .QuantityType import QuantityType
+    from .SymbolStyle import SymbolStyle
+    from .TextStyle import TextStyle
+    from .XYData import XYData
+    from ..PathAndProbe.Path import Path
 
 
 # prevent circular imports
@@ -52,6 +56,7 @@ class XYSession(XYSessionBase):
         ------
             ColorError
         """
+        from .AreaStyle import AreaStyle
         areaStyle = AreaStyle(color, fill, style)
         return areaStyle
 
@@ -97,6 +102,7 @@ class XYSession(XYSessionBase):
         ------
             ColorError
         """
+        from .LineStyle import LineStyle
         lineStyle = LineStyle(color, show, style, thickness)
         return lineStyle
 
@@ -197,6 +203,7 @@ class XYSession(XYSessionBase):
         -------
             A QuantityType object.
         """
+        from .QuantityType import QuantityType
         quantityType = QuantityType(label, type)
         return quantityType
 
@@ -253,6 +260,7 @@ class XYSession(XYSessionBase):
         ------
             ColorError
         """
+        from .SymbolStyle import SymbolStyle
         symbolStyle = SymbolStyle(color, show, marker, size)
         return symbolStyle
 
@@ -294,6 +302,7 @@ class XYSession(XYSessionBase):
         ------
             ColorError
         """
+        from .TextStyle import TextStyle
         textStyle = TextStyle(color, show, font, rotationAngle)
         return textStyle
 
@@ -390,7 +399,8 @@ class XYSession(XYSessionBase):
 
     @staticmethod
     def XYData(*args, **kwargs) -> XYData:
-        return XYData(())
+        from .XYData import XYData
+        return XYData(*args, **kwargs)
 
     def XYDataFromFile(
         self,
@@ -465,6 +475,7 @@ class XYSession(XYSessionBase):
         -------
             An XYData object
         """
+        from .XYData import XYData
         self.xyDataObjects[name] = xyData = XYData(())
         return xyData
 
@@ -538,6 +549,7 @@ class XYSession(XYSessionBase):
         -------
             An XYData object
         """
+        from .XYData import XYData
         self.xyDataObjects[name] = xyData = XYData(())
         return xyData
 
@@ -633,8 +645,14 @@ class XYSession(XYSessionBase):
         -------
             A list of XYData objects
         """
-        self.xyDataObjects["name"] = xyData = XYData(())
-        return [xyData]
+        from .FieldXYData import xyDataListFromField
+
+        xyDataList = xyDataListFromField(
+            odb, outputPosition, variable, elementSets, elementLabels, nodeSets, nodeLabels, numericForm, complexAngle, operator
+        )
+        for xyData in xyDataList:
+            self.xyDataObjects[xyData.name] = xyData
+        return xyDataList
 
     def XYDataFromFreeBody(
         self,
@@ -687,6 +705,7 @@ class XYSession(XYSessionBase):
         -------
             A list of XYData objects
         """
+        from .XYData import XYData
         self.xyDataObjects["name"] = xyData = XYData(())
         return [xyData]
 
@@ -825,5 +844,6 @@ class XYSession(XYSessionBase):
               ErrorDeformedMagTupleInPathExtract: Deformed magnification tuple must contain X, Y and
             Z values.
         """
+        from .XYData import XYData
         self.xyDataObjects[name] = xyData = XYData(())
         return xyData
@@ -0,0 +1,61 @@
+import typing
+
+import numpy
+
+
+class XYValues(typing.Sequence[tuple[float, float]]):
+    """The XYValues object is a sequence of *X–Y* data pairs read from an array of X-values and
+    an array of Y-values that are not copied, e.g., a column of a matrix of Y-values shared by
+    the XYData objects extracted from a field output.
+
+    Attributes
+    ----------
+    x: numpy.ndarray
+        An array of Floats specifying the X-values.
+    y: numpy.ndarray
+        An array of Floats specifying the Y-values.
+
+    Notes
+    -----
+    This object can be accessed by:
+
+    .. code-block:: python
+
+        import visualization
+        session.xyDataObjects[name].data
+
+    """
+
+    # An array of Floats specifying the X-values.
+    x: numpy.ndarray = None
+
+    # An array of Floats specifying the Y-values.
+    y: numpy.ndarray = None
+
+    def __init__(self, x: numpy.ndarray, y: numpy.ndarray):
+        if len(x) != len(y):
+            raise ValueError("The X-values and the Y-values do not have the same length")
+        self.x = x
+        self.y = y
+
+    def __array__(self, dtype=None, copy=None):
+        return numpy.column_stack((self.x, self.y)).astype(dtype or numpy.float64, copy=False)
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(zip(self.x[index].tolist(), self.y[index].tolist()))
+        return float(self.x[index]), float(self.y[index])
+
+    def __iter__(self):
+        return zip(self.x.tolist(), self.y.tolist())
+
+    def __eq__(self, other):
+        if isinstance(other, (XYValues, tuple, list)):
+            return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(tuple(self)) if len(self) <= 6 else "<XYValues of {} pairs>".format(len(self))
@@ -1,2 +1,31 @@
-from .Canvas.Highlight import *
-from .abaqus import *
+"""The names of the abaqus module (`mdb`, `session`, `highlight`, ...) are imported on first
+access, so that importing a submodule (e.g., from `odbAccess` or `inpParser`) does not import
+the whole model database.
+
+"""
+
+import importlib as _importlib
+
+# The public names of the abaqus module and the modules defining them
+_LAZY_NAMES = {
+    "highlight": "abaqus.Canvas.Highlight",
+    "unhighlight": "abaqus.Canvas.Highlight",
+    "Mdb": "abaqus.abaqus",
+    "Session": "abaqus.abaqus",
+    "mdb": "abaqus.abaqus",
+    "session": "abaqus.abaqus",
+    "monitorManager": "abaqus.abaqus",
+    "runPythonScript": "abaqus.abaqus",
+    "extractOutputData": "abaqus.abaqus",
+    "submitJobByInputFile": "abaqus.abaqus",
+}
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(_LAZY_NAMES[name]), name)
+    globals()[name] = value
+    return value
@@ -1,7 +1,15 @@
 import os
+import subprocess
 import sys
+import warnings
 
+from .Job.JobCache import JobCache
+from .Job.StatusFile import readStatusFile
+from .Journal.Journal import getJournal
+from .KernelServer.KernelServer import getKernelServer, isKernelServerEnabled
 from .Mdb.Mdb import Mdb as AbaqusMdb
+from .Messaging.MonitorMgr import MonitorMgr
+from .Notebook.NotebookScript import currentScript
 from .Odb.Odb import Odb
 from .Session.Session import Session as AbaqusSession
 
@@ -18,58 +26,72 @@ class Mdb(AbaqusMdb):
         if "ABAQUS_BAT_PATH" in os.environ.keys():
             abaqus = os.environ["ABAQUS_BAT_PATH"]
 
-        filePath = os.path.abspath(sys.argv[0])
-        fileDir = os.path.dirname(filePath)
-        fileName = os.path.basename(filePath)
-
-        os.system(f"cd {fileDir}")
-        try:  # If it is a jupyter notebook
-            import ipynbname
-
-            fileName = os.path.basename(ipynbname.path())
-            fileDir = os.path.dirname(ipynbname.path())
-            os.system(f"cd {fileDir}")
-            os.system(f"jupyter nbconvert --to python {fileName}")
-            fileName = fileName.replace(".ipynb", ".py")
-        except:
-            pass
-        os.system(f"{abaqus} cae -noGUI {fileName}")
+        journal = getJournal()
+        if journal is not None:
+            if journal.isReplayable:
+                # Replay only the recorded calls instead of executing the whole script again
+                workDir = os.getcwd()
+                journalName = os.path.splitext(os.path.basename(pathName))[0] + "_journal.py"
+                journalFile = os.path.join(workDir, journalName)
+                if isKernelServerEnabled():
+                    getKernelServer().runScript(journalFile, cwd=workDir, source=journal.script())
+                else:
+                    journal.write(journalFile)
+                    os.system(f"{abaqus} cae -noGUI {journalFile}")
+                return
+            warnings.warn(
+                "The journal is not replayable, the whole script is executed in Abaqus/CAE: "
+                + "; ".join(journal.errors)
+            )
+
+        fileDir, fileName = currentScript()
+        if isKernelServerEnabled():
+            getKernelServer().runScript(os.path.join(fileDir, fileName), cwd=fileDir)
+        else:
+            os.system(f"{abaqus} cae -noGUI {fileName}")
 
 
 class Session(AbaqusSession):
     def openOdb(self, name: str, *args, **kwargs) -> Odb:
+        from .Odb.FrameCache import cacheLimit
+        from .Odb.ResultsStore import isResultsStore, openResultsStore
+
+        # A results store is read in this process, Abaqus is not launched, the frames it keeps
+        # are limited by the memory reduction options
+        if isResultsStore(name):
+            options = self.memoryReductionOptions
+            cacheSize = cacheLimit(options.percentThreshold, self.kernelMemoryLimit, options.reducedMemoryMode)
+            self.odbs[name] = odb = openResultsStore(name, cacheSize)
+            return odb
+
         self.odbs[name] = odb = Odb(name, *args, **kwargs)
 
         abaqus = "abaqus"
         if "ABAQUS_BAT_PATH" in os.environ.keys():
             abaqus = os.environ["ABAQUS_BAT_PATH"]
 
-        filePath = os.path.abspath(sys.argv[0])
-        fileDir = os.path.dirname(filePath)
-        fileName = os.path.basename(filePath)
+        fileDir, fileName = currentScript()
         odbName = os.path.basename(os.path.abspath(name))
 
-        os.system(f"cd {fileDir}")
-        try:  # If it is a jupyter notebook
-            import ipynbname
-
-            fileName = os.path.basename(ipynbname.path())
-            os.system(f"jupyter nbconvert --to python {fileName}")
-            fileName = fileName.replace(".ipynb", ".py")
-        except:
-            pass
-        os.system(f"{abaqus} cae database={odbName} script={fileName}")
+        if isKernelServerEnabled():
+            getKernelServer().runScript(os.path.join(fileDir, fileName), cwd=fileDir, database=os.path.abspath(name))
+        else:
+            os.system(f"{abaqus} cae database={odbName} script={fileName}")
 
         self.exit()
         return odb
 
 
 session = Session()
+monitorManager = MonitorMgr()
 mdb = Mdb()
+if getJournal() is not None:
+    mdb = getJournal().root(mdb, "mdb")
 
 
 def runPythonScript(scriptPath: str):
-    """Run python script
+    """Run python script, the script is sent to the long-lived kernel process if the kernel
+    server mode is enabled, see :py:func:`~abaqus.KernelServer.KernelServer.isKernelServerEnabled`
 
     Parameters
     ----------
@@ -79,12 +101,16 @@ def runPythonScript(scriptPath: str):
     abaqus = "abaqus"
     if "ABAQUS_BAT_PATH" in os.environ.keys():
         abaqus = os.environ["ABAQUS_BAT_PATH"]
+    if isKernelServerEnabled():
+        getKernelServer().runScript(scriptPath)
+        return
     os.chdir(os.path.dirname(os.path.abspath(scriptPath)))
     os.system("{} cae noGUI={}".format(abaqus, scriptPath))
 
 
 def extractOutputData(odb: str, script: str):
-    """Extract output data using python script
+    """Extract output data using python script, the script is sent to the long-lived kernel
+    process if the kernel server mode is enabled
 
     Parameters
     ----------
@@ -96,6 +122,9 @@ def extractOutputData(odb: str, script: str):
     abaqus = "abaqus"
     if "ABAQUS_BAT_PATH" in os.environ.keys():
         abaqus = os.environ["ABAQUS_BAT_PATH"]
+    if isKernelServerEnabled():
+        getKernelServer().runScript(script, cwd=os.getcwd(), database=odb)
+        return
     os.system(
         "{} cae database={} script={}".format(
             abaqus, os.path.abspath(odb), os.path.abspath(script)
@@ -108,6 +137,7 @@ def submitJobByInputFile(
     userSubroutine: str = None,
     options: str = "int",
     showStatus: bool = True,
+    cache: JobCache = None,
 ):
     """Submit job by input file, can not execute in Python environment of Abaqus
 
@@ -125,6 +155,11 @@ def submitJobByInputFile(
         or https://abaqus-docs.mit.edu/2017/English/SIMACAEEXCRefMap/simaexc-c-analysisproc.htm>`_ for details, job or input options shouldn't be included, i.e. `int double'.
     showStatus: bool
         Show status or not when the calculation starts.
+    cache: JobCache
+        A :py:class:`~abaqus.Job.JobCache.JobCache` object. If the same input file (with the same
+        included files, user subroutine and options) was already analyzed, its results are
+        restored from the cache instead of running Abaqus. Completed analyses are stored in the
+        cache. The default value is None.
     """
     abaqus = "abaqus"
     if "ABAQUS_BAT_PATH" in os.environ.keys():
@@ -139,5 +174,11 @@ def submitJobByInputFile(
         )
     else:
         commandLine = "{} job={} {}".format(abaqus, jobName, options)
-    os.system("cd {}".format(workDirectory))
-    os.system(commandLine)
+    if cache is not None:
+        subroutine = None if userSubroutine is None else os.path.join(workDirectory, userSubroutine)
+        key = cache.key(os.path.join(workDirectory, jobName + ".inp"), subroutine, options, abaqus)
+        if cache.restore(key, workDirectory, jobName):
+            return
+    subprocess.call(commandLine, shell=True, cwd=workDirectory)
+    if cache is not None and readStatusFile(os.path.join(workDirectory, jobName + ".sta")).completed:
+        cache.store(key, workDirectory, jobName)
@@ -1,2739 +1,2531 @@
+"""The SymbolicConstant objects of the Abaqus Scripting Interface.
 
-def SymbolicConstant(in_str) -> str:
-    """
+The ids of the constants are fixed here, new constants are appended with new ids so that the ids
+of the existing constants do not change. ON and OFF are the AbaqusBoolean objects with ids 1 and 0.
 
-    :param in_str:
-    :return:
-    """
-    # type: "(str) -> str"
-    in_str = in_str
-    return in_str
-
-
-
-A0 = SymbolicConstant('A0')
-A1 = SymbolicConstant('A1')
-A2 = SymbolicConstant('A2')
-A3 = SymbolicConstant('A3')
-A4 = SymbolicConstant('A4')
-A5 = SymbolicConstant('A5')
-ABAQUS = SymbolicConstant('ABAQUS')
-ABAQUS_AQUA = SymbolicConstant('ABAQUS_AQUA')
-ABAQUS_BIORID = SymbolicConstant('ABAQUS_BIORID')
-ABAQUS_CEL = SymbolicConstant('ABAQUS_CEL')
-ABAQUS_CFD = SymbolicConstant('ABAQUS_CFD')
-ABAQUS_DESIGN = SymbolicConstant('ABAQUS_DESIGN')
-ABAQUS_EXPLICIT = SymbolicConstant('ABAQUS_EXPLICIT')
-ABAQUS_STANDARD = SymbolicConstant('ABAQUS_STANDARD')
-ABORTED = SymbolicConstant('ABORTED')
-ABS = SymbolicConstant('ABS')
-ABSCISSA = SymbolicConstant('ABSCISSA')
-ABSOLUTE = SymbolicConstant('ABSOLUTE')
-ABSOLUTE_DIFFERENCE = SymbolicConstant('ABSOLUTE_DIFFERENCE')
-ABSOLUTE_DISTANCE = SymbolicConstant('ABSOLUTE_DISTANCE')
-ABSOLUTE_EQUAL = SymbolicConstant('ABSOLUTE_EQUAL')
-ABSOLUTE_GREATER_THAN_EQUAL = SymbolicConstant('ABSOLUTE_GREATER_THAN_EQUAL')
-ABSOLUTE_GROWTH_MOVEMENT = SymbolicConstant('ABSOLUTE_GROWTH_MOVEMENT')
-ABSOLUTE_LESS_THAN_EQUAL = SymbolicConstant('ABSOLUTE_LESS_THAN_EQUAL')
-ABSOLUTE_SHRINK_MOVEMENT = SymbolicConstant('ABSOLUTE_SHRINK_MOVEMENT')
-ABSOLUTE_VALUE = SymbolicConstant('ABSOLUTE_VALUE')
-ABS_DEFAULT = SymbolicConstant('ABS_DEFAULT')
-AC1D2 = SymbolicConstant('AC1D2')
-AC1D3 = SymbolicConstant('AC1D3')
-AC2D3 = SymbolicConstant('AC2D3')
-AC2D4 = SymbolicConstant('AC2D4')
-AC2D4R = SymbolicConstant('AC2D4R')
-AC2D6 = SymbolicConstant('AC2D6')
-AC2D8 = SymbolicConstant('AC2D8')
-AC3D10 = SymbolicConstant('AC3D10')
-AC3D15 = SymbolicConstant('AC3D15')
-AC3D20 = SymbolicConstant('AC3D20')
-AC3D4 = SymbolicConstant('AC3D4')
-AC3D6 = SymbolicConstant('AC3D6')
-AC3D8 = SymbolicConstant('AC3D8')
-AC3D8R = SymbolicConstant('AC3D8R')
-ACAX3 = SymbolicConstant('ACAX3')
-ACAX4 = SymbolicConstant('ACAX4')
-ACAX4R = SymbolicConstant('ACAX4R')
-ACAX6 = SymbolicConstant('ACAX6')
-ACAX8 = SymbolicConstant('ACAX8')
-ACCELERATION = SymbolicConstant('ACCELERATION')
-ACCELEROMETER = SymbolicConstant('ACCELEROMETER')
-ACIN2D2 = SymbolicConstant('ACIN2D2')
-ACIN2D3 = SymbolicConstant('ACIN2D3')
-ACIN3D3 = SymbolicConstant('ACIN3D3')
-ACIN3D4 = SymbolicConstant('ACIN3D4')
-ACIN3D6 = SymbolicConstant('ACIN3D6')
-ACIN3D8 = SymbolicConstant('ACIN3D8')
-ACINAX2 = SymbolicConstant('ACINAX2')
-ACINAX3 = SymbolicConstant('ACINAX3')
-ACOUSTIC = SymbolicConstant('ACOUSTIC')
-ACOUSTICS = SymbolicConstant('ACOUSTICS')
-ACOUSTIC_INTENSITY = SymbolicConstant('ACOUSTIC_INTENSITY')
-ACROSS = SymbolicConstant('ACROSS')
-ACTIVE_CUT_RANGE = SymbolicConstant('ACTIVE_CUT_RANGE')
-AC_OFF = SymbolicConstant('AC_OFF')
-AC_ON = SymbolicConstant('AC_ON')
-AC_PROJECTION = SymbolicConstant('AC_PROJECTION')
-ADAPTIVE_MESHING = SymbolicConstant('ADAPTIVE_MESHING')
-ADAPTIVE_MESH_SMOOTHING_FAILED = SymbolicConstant('ADAPTIVE_MESH_SMOOTHING_FAILED')
-ADD = SymbolicConstant('ADD')
-ADJUST = SymbolicConstant('ADJUST')
-ADJUST_LENGTH = SymbolicConstant('ADJUST_LENGTH')
-ADMITTANCE = SymbolicConstant('ADMITTANCE')
-ADVANCING_FRONT = SymbolicConstant('ADVANCING_FRONT')
-AFTER = SymbolicConstant('AFTER')
-AGGRESSIVE = SymbolicConstant('AGGRESSIVE')
-AIR_BLAST = SymbolicConstant('AIR_BLAST')
-ALGORITHM = SymbolicConstant('ALGORITHM')
-ALIGN = SymbolicConstant('ALIGN')
-ALL = SymbolicConstant('ALL')
-ALLISO = SymbolicConstant('ALLISO')
-ALLOW_SUBCYCLING = SymbolicConstant('ALLOW_SUBCYCLING')
-ALLSTAR = SymbolicConstant('ALLSTAR')
-ALL_DAMAGE_STEPS = SymbolicConstant('ALL_DAMAGE_STEPS')
-ALL_DATUMS = SymbolicConstant('ALL_DATUMS')
-ALL_DIRECT = SymbolicConstant('ALL_DIRECT')
-ALL_DIRECT_COMPONENTS = SymbolicConstant('ALL_DIRECT_COMPONENTS')
-ALL_DISTRIB_CONTINUUM_COUPLING = SymbolicConstant('ALL_DISTRIB_CONTINUUM_COUPLING')
-ALL_DISTRIB_COUPLING = SymbolicConstant('ALL_DISTRIB_COUPLING')
-ALL_DISTRIB_STRUCTURAL_COUPLING = SymbolicConstant('ALL_DISTRIB_STRUCTURAL_COUPLING')
-ALL_EDGES = SymbolicConstant('ALL_EDGES')
-ALL_ELEMENTS = SymbolicConstant('ALL_ELEMENTS')
-ALL_FRAMES = SymbolicConstant('ALL_FRAMES')
-ALL_FREQUENCIES = SymbolicConstant('ALL_FREQUENCIES')
-ALL_GEOMETRY = SymbolicConstant('ALL_GEOMETRY')
-ALL_INCREMENTS = SymbolicConstant('ALL_INCREMENTS')
-ALL_KINEM_COUPLING = SymbolicConstant('ALL_KINEM_COUPLING')
-ALL_LOCATIONS = SymbolicConstant('ALL_LOCATIONS')
-ALL_MODAL_STEPS = SymbolicConstant('ALL_MODAL_STEPS')
-ALL_MPCS = SymbolicConstant('ALL_MPCS')
-ALL_NODAL_DIAMETER = SymbolicConstant('ALL_NODAL_DIAMETER')
-ALL_NODES = SymbolicConstant('ALL_NODES')
-ALL_NONLINEAR_STEPS = SymbolicConstant('ALL_NONLINEAR_STEPS')
-ALL_PRINCIPALS = SymbolicConstant('ALL_PRINCIPALS')
-ALL_PRINCIPAL_COMPONENTS = SymbolicConstant('ALL_PRINCIPAL_COMPONENTS')
-ALL_RIGID_BODY = SymbolicConstant('ALL_RIGID_BODY')
-ALL_SHELL_SOLID_COUPLING = SymbolicConstant('ALL_SHELL_SOLID_COUPLING')
-ALL_STATIC_STEPS = SymbolicConstant('ALL_STATIC_STEPS')
-ALL_SURFACES = SymbolicConstant('ALL_SURFACES')
-ALL_TIES = SymbolicConstant('ALL_TIES')
-ALWAYS = SymbolicConstant('ALWAYS')
-AMBIENT = SymbolicConstant('AMBIENT')
-AMG = SymbolicConstant('AMG')
-AMPLITUDE = SymbolicConstant('AMPLITUDE')
-AMS = SymbolicConstant('AMS')
-ANALYSIS = SymbolicConstant('ANALYSIS')
-ANALYSIS_CHECKS = SymbolicConstant('ANALYSIS_CHECKS')
-ANALYSIS_DEFAULT = SymbolicConstant('ANALYSIS_DEFAULT')
-ANALYSIS_PRODUCT_DEFAULT = SymbolicConstant('ANALYSIS_PRODUCT_DEFAULT')
-ANALYTICAL_FIELD = SymbolicConstant('ANALYTICAL_FIELD')
-ANALYTIC_RIGID_SURFACE = SymbolicConstant('ANALYTIC_RIGID_SURFACE')
-ANGLE = SymbolicConstant('ANGLE')
-ANGLE_0 = SymbolicConstant('ANGLE_0')
-ANGLE_45 = SymbolicConstant('ANGLE_45')
-ANGLE_90 = SymbolicConstant('ANGLE_90')
-ANGLE_NEG45 = SymbolicConstant('ANGLE_NEG45')
-ANGULAR = SymbolicConstant('ANGULAR')
-ANGULAR_DEVIATION = SymbolicConstant('ANGULAR_DEVIATION')
-ANGULAR_MOMENTUM = SymbolicConstant('ANGULAR_MOMENTUM')
-ANIMATION = SymbolicConstant('ANIMATION')
-ANISOTROPIC = SymbolicConstant('ANISOTROPIC')
-ANNEAL = SymbolicConstant('ANNEAL')
-ANNEALING = SymbolicConstant('ANNEALING')
-ANTIALIASING = SymbolicConstant('ANTIALIASING')
-ANY_JOB = SymbolicConstant('ANY_JOB')
-ANY_MESSAGE_TYPE = SymbolicConstant('ANY_MESSAGE_TYPE')
-APPLY_FORCE = SymbolicConstant('APPLY_FORCE')
-AQUA = SymbolicConstant('AQUA')
-ARC = SymbolicConstant('ARC')
-ARC_LENGTH = SymbolicConstant('ARC_LENGTH')
-AREA = SymbolicConstant('AREA')
-AREA_VELOCITY_SQUARED = SymbolicConstant('AREA_VELOCITY_SQUARED')
-ARRAY = SymbolicConstant('ARRAY')
-ARRAY_1D = SymbolicConstant('ARRAY_1D')
-ARRHENIUS = SymbolicConstant('ARRHENIUS')
-ARROW = SymbolicConstant('ARROW')
-ARRUDA_BOYCE = SymbolicConstant('ARRUDA_BOYCE')
-ASCENDING = SymbolicConstant('ASCENDING')
-ASI2D2 = SymbolicConstant('ASI2D2')
-ASI2D3 = SymbolicConstant('ASI2D3')
-ASI3D3 = SymbolicConstant('ASI3D3')
-ASI3D4 = SymbolicConstant('ASI3D4')
-ASI3D6 = SymbolicConstant('ASI3D6')
-ASI3D8 = SymbolicConstant('ASI3D8')
-ASIAX2 = SymbolicConstant('ASIAX2')
-ASIAX3 = SymbolicConstant('ASIAX3')
-ASPECT_RATIO = SymbolicConstant('ASPECT_RATIO')
-ASSEMBLY = SymbolicConstant('ASSEMBLY')
-ASSEMBLY_LOAD = SymbolicConstant('ASSEMBLY_LOAD')
-ASSEMBLY_MAP = SymbolicConstant('ASSEMBLY_MAP')
-ASSEMBLY_MAP_COLORS = SymbolicConstant('ASSEMBLY_MAP_COLORS')
-ASSEMBLY_SET = SymbolicConstant('ASSEMBLY_SET')
-AS_DISPLAYED = SymbolicConstant('AS_DISPLAYED')
-AS_IS = SymbolicConstant('AS_IS')
-ATTACH_TO_POINT = SymbolicConstant('ATTACH_TO_POINT')
-ATTACH_TO_REGION = SymbolicConstant('ATTACH_TO_REGION')
-AT_BEGINNING = SymbolicConstant('AT_BEGINNING')
-AUGMENTED_LAGRANGE = SymbolicConstant('AUGMENTED_LAGRANGE')
-AUGMENTED_LAGRANGE_INCOMPATIBILITIES = SymbolicConstant('AUGMENTED_LAGRANGE_INCOMPATIBILITIES')
-AUTO = SymbolicConstant('AUTO')
-AUTOCAD = SymbolicConstant('AUTOCAD')
-AUTOCOMPUTE = SymbolicConstant('AUTOCOMPUTE')
-AUTOMATIC = SymbolicConstant('AUTOMATIC')
-AUTOMATIC_EBE = SymbolicConstant('AUTOMATIC_EBE')
-AUTOMATIC_GLOBAL = SymbolicConstant('AUTOMATIC_GLOBAL')
-AUTO_ALIGN = SymbolicConstant('AUTO_ALIGN')
-AUTO_FIT = SymbolicConstant('AUTO_FIT')
-AUTO_FIT_PTS = SymbolicConstant('AUTO_FIT_PTS')
-AUTO_INCREMENTATION = SymbolicConstant('AUTO_INCREMENTATION')
-AUTO_TIGHT = SymbolicConstant('AUTO_TIGHT')
-AVERAGE = SymbolicConstant('AVERAGE')
-AVERAGE_EDGE_LENGTH = SymbolicConstant('AVERAGE_EDGE_LENGTH')
-AVERAGE_SIZE = SymbolicConstant('AVERAGE_SIZE')
-AVERAGE_STRAIN = SymbolicConstant('AVERAGE_STRAIN')
-AVERAGE_TRANSLATION = SymbolicConstant('AVERAGE_TRANSLATION')
-AVERAGING_REGION_MAP = SymbolicConstant('AVERAGING_REGION_MAP')
-AVERAGING_REGION_MAP_COLORS = SymbolicConstant('AVERAGING_REGION_MAP_COLORS')
-AVI = SymbolicConstant('AVI')
-AXIAL = SymbolicConstant('AXIAL')
-AXIAL_FORCE_CONSTRAINT = SymbolicConstant('AXIAL_FORCE_CONSTRAINT')
-AXISYM = SymbolicConstant('AXISYM')
-AXISYMMETRIC = SymbolicConstant('AXISYMMETRIC')
-AXIS_1 = SymbolicConstant('AXIS_1')
-AXIS_2 = SymbolicConstant('AXIS_2')
-AXIS_3 = SymbolicConstant('AXIS_3')
-B21 = SymbolicConstant('B21')
-B21H = SymbolicConstant('B21H')
-B22 = SymbolicConstant('B22')
-B22H = SymbolicConstant('B22H')
-B23 = SymbolicConstant('B23')
-B23H = SymbolicConstant('B23H')
-B31 = SymbolicConstant('B31')
-B31H = SymbolicConstant('B31H')
-B31OS = SymbolicConstant('B31OS')
-B31OSH = SymbolicConstant('B31OSH')
-B32 = SymbolicConstant('B32')
-B32H = SymbolicConstant('B32H')
-B32OS = SymbolicConstant('B32OS')
-B32OSH = SymbolicConstant('B32OSH')
-B33 = SymbolicConstant('B33')
-B33H = SymbolicConstant('B33H')
-BACKWARD_EULER = SymbolicConstant('BACKWARD_EULER')
-BALANCED = SymbolicConstant('BALANCED')
-BANDED = SymbolicConstant('BANDED')
-BAR = SymbolicConstant('BAR')
-BASE = SymbolicConstant('BASE')
-BATCHPRE_PHASE = SymbolicConstant('BATCHPRE_PHASE')
-BCGS = SymbolicConstant('BCGS')
-BC_MAP = SymbolicConstant('BC_MAP')
-BC_MAP_COLORS = SymbolicConstant('BC_MAP_COLORS')
-BEAM = SymbolicConstant('BEAM')
-BEAM_MPC = SymbolicConstant('BEAM_MPC')
-BEFORE = SymbolicConstant('BEFORE')
-BEFORE_ANALYSIS = SymbolicConstant('BEFORE_ANALYSIS')
-BELOW_MIN = SymbolicConstant('BELOW_MIN')
-BENDING = SymbolicConstant('BENDING')
-BEST_FIT = SymbolicConstant('BEST_FIT')
-BETWEEN_CAVITIES = SymbolicConstant('BETWEEN_CAVITIES')
-BIASED = SymbolicConstant('BIASED')
-BIAS_MAX_SIZE = SymbolicConstant('BIAS_MAX_SIZE')
-BIAS_METHOD = SymbolicConstant('BIAS_METHOD')
-BIAS_MIN_SIZE = SymbolicConstant('BIAS_MIN_SIZE')
-BIAS_RATIO = SymbolicConstant('BIAS_RATIO')
-BIAXIAL = SymbolicConstant('BIAXIAL')
-BIDIRECTIONAL = SymbolicConstant('BIDIRECTIONAL')
-BILINEAR = SymbolicConstant('BILINEAR')
-BIMOMENT = SymbolicConstant('BIMOMENT')
-BK = SymbolicConstant('BK')
-BLACK_AND_WHITE = SymbolicConstant('BLACK_AND_WHITE')
-BLACK_TO_WHITE = SymbolicConstant('BLACK_TO_WHITE')
-BLEND = SymbolicConstant('BLEND')
-BLOCKING_ALL = SymbolicConstant('BLOCKING_ALL')
-BLUE_TO_RED = SymbolicConstant('BLUE_TO_RED')
-BOLT = SymbolicConstant('BOLT')
-BOOLEAN = SymbolicConstant('BOOLEAN')
-BOTH = SymbolicConstant('BOTH')
-BOTHSIDES = SymbolicConstant('BOTHSIDES')
-BOTH_SIDES = SymbolicConstant('BOTH_SIDES')
-BOTH_SURFACES = SymbolicConstant('BOTH_SURFACES')
-BOTTOM = SymbolicConstant('BOTTOM')
-BOTTOM_CENTER = SymbolicConstant('BOTTOM_CENTER')
-BOTTOM_LEFT = SymbolicConstant('BOTTOM_LEFT')
-BOTTOM_RIGHT = SymbolicConstant('BOTTOM_RIGHT')
-BOTTOM_SURFACE = SymbolicConstant('BOTTOM_SURFACE')
-BOTTOM_UP = SymbolicConstant('BOTTOM_UP')
-BOUNDARY_CONDITION = SymbolicConstant('BOUNDARY_CONDITION')
-BOUNDARY_ONLY = SymbolicConstant('BOUNDARY_ONLY')
-BOX_OFF = SymbolicConstant('BOX_OFF')
-BOX_ON = SymbolicConstant('BOX_ON')
-BUCKLE = SymbolicConstant('BUCKLE')
-BUCKLING_MODES = SymbolicConstant('BUCKLING_MODES')
-BUILT_INTO_BASE_STATE = SymbolicConstant('BUILT_INTO_BASE_STATE')
-BUILT_INTO_MODES = SymbolicConstant('BUILT_INTO_MODES')
-BULK_VISCOSITY = SymbolicConstant('BULK_VISCOSITY')
-BUSHING = SymbolicConstant('BUSHING')
-BY_NUMBER = SymbolicConstant('BY_NUMBER')
-BY_SPACING = SymbolicConstant('BY_SPACING')
-C3D10 = SymbolicConstant('C3D10')
-C3D10E = SymbolicConstant('C3D10E')
-C3D10H = SymbolicConstant('C3D10H')
-C3D10I = SymbolicConstant('C3D10I')
-C3D10M = SymbolicConstant('C3D10M')
-C3D10MH = SymbolicConstant('C3D10MH')
-C3D10MHT = SymbolicConstant('C3D10MHT')
-C3D10MP = SymbolicConstant('C3D10MP')
-C3D10MPH = SymbolicConstant('C3D10MPH')
-C3D10MPT = SymbolicConstant('C3D10MPT')
-C3D10MT = SymbolicConstant('C3D10MT')
-C3D15 = SymbolicConstant('C3D15')
-C3D15E = SymbolicConstant('C3D15E')
-C3D15H = SymbolicConstant('C3D15H')
-C3D20 = SymbolicConstant('C3D20')
-C3D20E = SymbolicConstant('C3D20E')
-C3D20H = SymbolicConstant('C3D20H')
-C3D20HT = SymbolicConstant('C3D20HT')
-C3D20P = SymbolicConstant('C3D20P')
-C3D20PH = SymbolicConstant('C3D20PH')
-C3D20R = SymbolicConstant('C3D20R')
-C3D20RE = SymbolicConstant('C3D20RE')
-C3D20RH = SymbolicConstant('C3D20RH')
-C3D20RHT = SymbolicConstant('C3D20RHT')
-C3D20RP = SymbolicConstant('C3D20RP')
-C3D20RPH = SymbolicConstant('C3D20RPH')
-C3D20RT = SymbolicConstant('C3D20RT')
-C3D20T = SymbolicConstant('C3D20T')
-C3D4 = SymbolicConstant('C3D4')
-C3D4E = SymbolicConstant('C3D4E')
-C3D4H = SymbolicConstant('C3D4H')
-C3D4P = SymbolicConstant('C3D4P')
-C3D4T = SymbolicConstant('C3D4T')
-C3D6 = SymbolicConstant('C3D6')
-C3D6E = SymbolicConstant('C3D6E')
-C3D6H = SymbolicConstant('C3D6H')
-C3D6P = SymbolicConstant('C3D6P')
-C3D6T = SymbolicConstant('C3D6T')
-C3D8 = SymbolicConstant('C3D8')
-C3D8E = SymbolicConstant('C3D8E')
-C3D8H = SymbolicConstant('C3D8H')
-C3D8HT = SymbolicConstant('C3D8HT')
-C3D8I = SymbolicConstant('C3D8I')
-C3D8IH = SymbolicConstant('C3D8IH')
-C3D8P = SymbolicConstant('C3D8P')
-C3D8PH = SymbolicConstant('C3D8PH')
-C3D8PHT = SymbolicConstant('C3D8PHT')
-C3D8PT = SymbolicConstant('C3D8PT')
-C3D8R = SymbolicConstant('C3D8R')
-C3D8RH = SymbolicConstant('C3D8RH')
-C3D8RHT = SymbolicConstant('C3D8RHT')
-C3D8RP = SymbolicConstant('C3D8RP')
-C3D8RPH = SymbolicConstant('C3D8RPH')
-C3D8RPHT = SymbolicConstant('C3D8RPHT')
-C3D8RPT = SymbolicConstant('C3D8RPT')
-C3D8RT = SymbolicConstant('C3D8RT')
-C3D8T = SymbolicConstant('C3D8T')
-CALCULATE = SymbolicConstant('CALCULATE')
-CALCULATOR_PHASE = SymbolicConstant('CALCULATOR_PHASE')
-CAMERA = SymbolicConstant('CAMERA')
-CARDAN = SymbolicConstant('CARDAN')
-CARMAN_KOZENY = SymbolicConstant('CARMAN_KOZENY')
-CARTESIAN = SymbolicConstant('CARTESIAN')
-CATEGORY_BASED = SymbolicConstant('CATEGORY_BASED')
-CAVITY = SymbolicConstant('CAVITY')
-CAVITY_RADIATION = SymbolicConstant('CAVITY_RADIATION')
-CAVITY_RADIATION_EMMISIVITY_TOO_LARGE = SymbolicConstant('CAVITY_RADIATION_EMMISIVITY_TOO_LARGE')
-CAVITY_RADIATION_PARALLEL_DECOMPOSITION = SymbolicConstant('CAVITY_RADIATION_PARALLEL_DECOMPOSITION')
-CAX3 = SymbolicConstant('CAX3')
-CAX3E = SymbolicConstant('CAX3E')
-CAX3H = SymbolicConstant('CAX3H')
-CAX3T = SymbolicConstant('CAX3T')
-CAX4 = SymbolicConstant('CAX4')
-CAX4E = SymbolicConstant('CAX4E')
-CAX4H = SymbolicConstant('CAX4H')
-CAX4HT = SymbolicConstant('CAX4HT')
-CAX4I = SymbolicConstant('CAX4I')
-CAX4IH = SymbolicConstant('CAX4IH')
-CAX4P = SymbolicConstant('CAX4P')
-CAX4PH = SymbolicConstant('CAX4PH')
-CAX4R = SymbolicConstant('CAX4R')
-CAX4RH = SymbolicConstant('CAX4RH')
-CAX4RHT = SymbolicConstant('CAX4RHT')
-CAX4RP = SymbolicConstant('CAX4RP')
-CAX4RPH = SymbolicConstant('CAX4RPH')
-CAX4RT = SymbolicConstant('CAX4RT')
-CAX4T = SymbolicConstant('CAX4T')
-CAX6 = SymbolicConstant('CAX6')
-CAX6E = SymbolicConstant('CAX6E')
-CAX6H = SymbolicConstant('CAX6H')
-CAX6M = SymbolicConstant('CAX6M')
-CAX6MH = SymbolicConstant('CAX6MH')
-CAX6MHT = SymbolicConstant('CAX6MHT')
-CAX6MP = SymbolicConstant('CAX6MP')
-CAX6MPH = SymbolicConstant('CAX6MPH')
-CAX6MT = SymbolicConstant('CAX6MT')
-CAX8 = SymbolicConstant('CAX8')
-CAX8E = SymbolicConstant('CAX8E')
-CAX8H = SymbolicConstant('CAX8H')
-CAX8HT = SymbolicConstant('CAX8HT')
-CAX8P = SymbolicConstant('CAX8P')
-CAX8PH = SymbolicConstant('CAX8PH')
-CAX8R = SymbolicConstant('CAX8R')
-CAX8RE = SymbolicConstant('CAX8RE')
-CAX8RH = SymbolicConstant('CAX8RH')
-CAX8RHT = SymbolicConstant('CAX8RHT')
-CAX8RP = SymbolicConstant('CAX8RP')
-CAX8RPH = SymbolicConstant('CAX8RPH')
-CAX8RT = SymbolicConstant('CAX8RT')
-CAX8T = SymbolicConstant('CAX8T')
-CAXA41 = SymbolicConstant('CAXA41')
-CAXA42 = SymbolicConstant('CAXA42')
-CAXA43 = SymbolicConstant('CAXA43')
-CAXA44 = SymbolicConstant('CAXA44')
-CAXA4H1 = SymbolicConstant('CAXA4H1')
-CAXA4H2 = SymbolicConstant('CAXA4H2')
-CAXA4H3 = SymbolicConstant('CAXA4H3')
-CAXA4H4 = SymbolicConstant('CAXA4H4')
-CAXA4R1 = SymbolicConstant('CAXA4R1')
-CAXA4R2 = SymbolicConstant('CAXA4R2')
-CAXA4R3 = SymbolicConstant('CAXA4R3')
-CAXA4R4 = SymbolicConstant('CAXA4R4')
-CAXA4RH1 = SymbolicConstant('CAXA4RH1')
-CAXA4RH2 = SymbolicConstant('CAXA4RH2')
-CAXA4RH3 = SymbolicConstant('CAXA4RH3')
-CAXA4RH4 = SymbolicConstant('CAXA4RH4')
-CAXA81 = SymbolicConstant('CAXA81')
-CAXA82 = SymbolicConstant('CAXA82')
-CAXA83 = SymbolicConstant('CAXA83')
-CAXA84 = SymbolicConstant('CAXA84')
-CAXA8H1 = SymbolicConstant('CAXA8H1')
-CAXA8H2 = SymbolicConstant('CAXA8H2')
-CAXA8H3 = SymbolicConstant('CAXA8H3')
-CAXA8H4 = SymbolicConstant('CAXA8H4')
-CAXA8P1 = SymbolicConstant('CAXA8P1')
-CAXA8P2 = SymbolicConstant('CAXA8P2')
-CAXA8P3 = SymbolicConstant('CAXA8P3')
-CAXA8P4 = SymbolicConstant('CAXA8P4')
-CAXA8R1 = SymbolicConstant('CAXA8R1')
-CAXA8R2 = SymbolicConstant('CAXA8R2')
-CAXA8R3 = SymbolicConstant('CAXA8R3')
-CAXA8R4 = SymbolicConstant('CAXA8R4')
-CAXA8RH1 = SymbolicConstant('CAXA8RH1')
-CAXA8RH2 = SymbolicConstant('CAXA8RH2')
-CAXA8RH3 = SymbolicConstant('CAXA8RH3')
-CAXA8RH4 = SymbolicConstant('CAXA8RH4')
-CAXA8RP1 = SymbolicConstant('CAXA8RP1')
-CAXA8RP2 = SymbolicConstant('CAXA8RP2')
-CAXA8RP3 = SymbolicConstant('CAXA8RP3')
-CAXA8RP4 = SymbolicConstant('CAXA8RP4')
-CCL12 = SymbolicConstant('CCL12')
-CCL12H = SymbolicConstant('CCL12H')
-CCL18 = SymbolicConstant('CCL18')
-CCL18H = SymbolicConstant('CCL18H')
-CCL24 = SymbolicConstant('CCL24')
-CCL24H = SymbolicConstant('CCL24H')
-CCL24R = SymbolicConstant('CCL24R')
-CCL24RH = SymbolicConstant('CCL24RH')
-CCL9 = SymbolicConstant('CCL9')
-CCL9H = SymbolicConstant('CCL9H')
-CCW = SymbolicConstant('CCW')
-CENTER = SymbolicConstant('CENTER')
-CENTER_LEFT = SymbolicConstant('CENTER_LEFT')
-CENTER_OF_MASS = SymbolicConstant('CENTER_OF_MASS')
-CENTER_RIGHT = SymbolicConstant('CENTER_RIGHT')
-CENTROID = SymbolicConstant('CENTROID')
-CFD = SymbolicConstant('CFD')
-CFD_ANALYSIS = SymbolicConstant('CFD_ANALYSIS')
-CFD_PHASE = SymbolicConstant('CFD_PHASE')
-CG = SymbolicConstant('CG')
-CGAX3 = SymbolicConstant('CGAX3')
-CGAX3H = SymbolicConstant('CGAX3H')
-CGAX3HT = SymbolicConstant('CGAX3HT')
-CGAX3T = SymbolicConstant('CGAX3T')
-CGAX4 = SymbolicConstant('CGAX4')
-CGAX4H = SymbolicConstant('CGAX4H')
-CGAX4HT = SymbolicConstant('CGAX4HT')
-CGAX4R = SymbolicConstant('CGAX4R')
-CGAX4RH = SymbolicConstant('CGAX4RH')
-CGAX4RHT = SymbolicConstant('CGAX4RHT')
-CGAX4RT = SymbolicConstant('CGAX4RT')
-CGAX4T = SymbolicConstant('CGAX4T')
-CGAX6 = SymbolicConstant('CGAX6')
-CGAX6H = SymbolicConstant('CGAX6H')
-CGAX6M = SymbolicConstant('CGAX6M')
-CGAX6MH = SymbolicConstant('CGAX6MH')
-CGAX6MHT = SymbolicConstant('CGAX6MHT')
-CGAX6MT = SymbolicConstant('CGAX6MT')
-CGAX8 = SymbolicConstant('CGAX8')
-CGAX8H = SymbolicConstant('CGAX8H')
-CGAX8HT = SymbolicConstant('CGAX8HT')
-CGAX8R = SymbolicConstant('CGAX8R')
-CGAX8RH = SymbolicConstant('CGAX8RH')
-CGAX8RHT = SymbolicConstant('CGAX8RHT')
-CGAX8RT = SymbolicConstant('CGAX8RT')
-CGAX8T = SymbolicConstant('CGAX8T')
-CGPE10 = SymbolicConstant('CGPE10')
-CGPE10H = SymbolicConstant('CGPE10H')
-CGPE10R = SymbolicConstant('CGPE10R')
-CGPE10RH = SymbolicConstant('CGPE10RH')
-CGPE5 = SymbolicConstant('CGPE5')
-CGPE5H = SymbolicConstant('CGPE5H')
-CGPE6 = SymbolicConstant('CGPE6')
-CGPE6H = SymbolicConstant('CGPE6H')
-CGPE6I = SymbolicConstant('CGPE6I')
-CGPE6IH = SymbolicConstant('CGPE6IH')
-CGPE6MH = SymbolicConstant('CGPE6MH')
-CGPE6R = SymbolicConstant('CGPE6R')
-CGPE6RH = SymbolicConstant('CGPE6RH')
-CGPE8 = SymbolicConstant('CGPE8')
-CGPE8H = SymbolicConstant('CGPE8H')
-CHEBYCHEV = SymbolicConstant('CHEBYCHEV')
-CHECKER = SymbolicConstant('CHECKER')
-CHECK_COMPLETED = SymbolicConstant('CHECK_COMPLETED')
-CHECK_RUNNING = SymbolicConstant('CHECK_RUNNING')
-CHECK_SUBMITTED = SymbolicConstant('CHECK_SUBMITTED')
-CINAX4 = SymbolicConstant('CINAX4')
-CINAX5R = SymbolicConstant('CINAX5R')
-CINPE4 = SymbolicConstant('CINPE4')
-CINPE5R = SymbolicConstant('CINPE5R')
-CINPS4 = SymbolicConstant('CINPS4')
-CINPS5R = SymbolicConstant('CINPS5R')
-CIRCLE = SymbolicConstant('CIRCLE')
-CIRCLE_RADIUS = SymbolicConstant('CIRCLE_RADIUS')
-CIRCULAR = SymbolicConstant('CIRCULAR')
-CIRCUM = SymbolicConstant('CIRCUM')
-CIRCUMF = SymbolicConstant('CIRCUMF')
-CIRCUMFERENTIAL = SymbolicConstant('CIRCUMFERENTIAL')
-CIRC_MIRROR_RECT = SymbolicConstant('CIRC_MIRROR_RECT')
-CIRC_RECT_MIRROR = SymbolicConstant('CIRC_RECT_MIRROR')
-CLEARANCE = SymbolicConstant('CLEARANCE')
-CLOCKWISE = SymbolicConstant('CLOCKWISE')
-CLOSEST = SymbolicConstant('CLOSEST')
-CLOSEST_POINT_FRACTION = SymbolicConstant('CLOSEST_POINT_FRACTION')
-CLOSURE_VALUE = SymbolicConstant('CLOSURE_VALUE')
-COARSE = SymbolicConstant('COARSE')
-COD = SymbolicConstant('COD')
-CODEC = SymbolicConstant('CODEC')
-COEFFICIENT = SymbolicConstant('COEFFICIENT')
-COEFFICIENTS = SymbolicConstant('COEFFICIENTS')
-COH2D4 = SymbolicConstant('COH2D4')
-COH2D4P = SymbolicConstant('COH2D4P')
-COH3D6 = SymbolicConstant('COH3D6')
-COH3D6P = SymbolicConstant('COH3D6P')
-COH3D8 = SymbolicConstant('COH3D8')
-COH3D8P = SymbolicConstant('COH3D8P')
-COHAX4 = SymbolicConstant('COHAX4')
-COHAX4P = SymbolicConstant('COHAX4P')
-COLOR = SymbolicConstant('COLOR')
-COMBINED = SymbolicConstant('COMBINED')
-COMMA_SEPARATED_VALUES = SymbolicConstant('COMMA_SEPARATED_VALUES')
-COMPLETED = SymbolicConstant('COMPLETED')
-COMPLEX = SymbolicConstant('COMPLEX')
-COMPLEX_EIGENSOLVER = SymbolicConstant('COMPLEX_EIGENSOLVER')
-COMPLEX_FREQUENCY = SymbolicConstant('COMPLEX_FREQUENCY')
-COMPLEX_MAGNITUDE = SymbolicConstant('COMPLEX_MAGNITUDE')
-COMPLEX_PHASE = SymbolicConstant('COMPLEX_PHASE')
-COMPLEX_VAL_AT_ANGLE = SymbolicConstant('COMPLEX_VAL_AT_ANGLE')
-COMPONENT = SymbolicConstant('COMPONENT')
-COMPONENT_NUMBER = SymbolicConstant('COMPONENT_NUMBER')
-COMPRESSEDINDEX = SymbolicConstant('COMPRESSEDINDEX')
-COMPRESSED_VRML = SymbolicConstant('COMPRESSED_VRML')
-COMPRESSIBLE = SymbolicConstant('COMPRESSIBLE')
-COMPRESSION = SymbolicConstant('COMPRESSION')
-COMPUTE = SymbolicConstant('COMPUTE')
-COMPUTED = SymbolicConstant('COMPUTED')
-COMPUTED_TOLERANCE = SymbolicConstant('COMPUTED_TOLERANCE')
-COMP_DEFAULT = SymbolicConstant('COMP_DEFAULT')
-CONCENTRIC = SymbolicConstant('CONCENTRIC')
-CONDITION_BASED_OPTIMIZATION = SymbolicConstant('CONDITION_BASED_OPTIMIZATION')
-CONN2D2 = SymbolicConstant('CONN2D2')
-CONN3D2 = SymbolicConstant('CONN3D2')
-CONNECTOR = SymbolicConstant('CONNECTOR')
-CONNECTOR_MAP = SymbolicConstant('CONNECTOR_MAP')
-CONNECTOR_MAP_COLORS = SymbolicConstant('CONNECTOR_MAP_COLORS')
-CONNECTOR_PROP_MAP = SymbolicConstant('CONNECTOR_PROP_MAP')
-CONNECTOR_PROP_MAP_COLORS = SymbolicConstant('CONNECTOR_PROP_MAP_COLORS')
-CONNECTOR_TYPE_MAP = SymbolicConstant('CONNECTOR_TYPE_MAP')
-CONNECTOR_TYPE_MAP_COLORS = SymbolicConstant('CONNECTOR_TYPE_MAP_COLORS')
-CONSERVATIVE = SymbolicConstant('CONSERVATIVE')
-CONSOLIDATION = SymbolicConstant('CONSOLIDATION')
-CONSTANT = SymbolicConstant('CONSTANT')
-CONSTANTPRESSURE = SymbolicConstant('CONSTANTPRESSURE')
-CONSTANTS = SymbolicConstant('CONSTANTS')
-CONSTANTVOLUME = SymbolicConstant('CONSTANTVOLUME')
-CONSTANT_RATIO = SymbolicConstant('CONSTANT_RATIO')
-CONSTANT_THROUGH_THICKNESS = SymbolicConstant('CONSTANT_THROUGH_THICKNESS')
-CONSTANT_VELOCITY = SymbolicConstant('CONSTANT_VELOCITY')
-CONSTRAINED_LAPLACIAN = SymbolicConstant('CONSTRAINED_LAPLACIAN')
-CONSTRAINT = SymbolicConstant('CONSTRAINT')
-CONSTRAINT_MAP = SymbolicConstant('CONSTRAINT_MAP')
-CONSTRAINT_MAP_COLORS = SymbolicConstant('CONSTRAINT_MAP_COLORS')
-CONSTRAINT_TYPE_MAP = SymbolicConstant('CONSTRAINT_TYPE_MAP')
-CONSTRAINT_TYPE_MAP_COLORS = SymbolicConstant('CONSTRAINT_TYPE_MAP_COLORS')
-CONSTRUCTION = SymbolicConstant('CONSTRUCTION')
-CONTACT = SymbolicConstant('CONTACT')
-CONTACT_ALL = SymbolicConstant('CONTACT_ALL')
-CONTACT_EXPLICIT = SymbolicConstant('CONTACT_EXPLICIT')
-CONTACT_PRESELECT = SymbolicConstant('CONTACT_PRESELECT')
-CONTACT_STANDARD = SymbolicConstant('CONTACT_STANDARD')
-CONTINUE = SymbolicConstant('CONTINUE')
-CONTINUOUS = SymbolicConstant('CONTINUOUS')
-CONTINUUM = SymbolicConstant('CONTINUUM')
-CONTINUUM_SHELL = SymbolicConstant('CONTINUUM_SHELL')
-CONTOURS_ON_DEF = SymbolicConstant('CONTOURS_ON_DEF')
-CONTOURS_ON_UNDEF = SymbolicConstant('CONTOURS_ON_UNDEF')
-CONTROL_POINTS = SymbolicConstant('CONTROL_POINTS')
-CONVERGENCE = SymbolicConstant('CONVERGENCE')
-CONVERT_SDI_OFF = SymbolicConstant('CONVERT_SDI_OFF')
-CONVERT_SDI_ON = SymbolicConstant('CONVERT_SDI_ON')
-CONWEP = SymbolicConstant('CONWEP')
-COORDINATE = SymbolicConstant('COORDINATE')
-COPLANAR_EDGES = SymbolicConstant('COPLANAR_EDGES')
-CORIOLIS_LOAD = SymbolicConstant('CORIOLIS_LOAD')
-CORRECTION_ACCEPTED = SymbolicConstant('CORRECTION_ACCEPTED')
-CORRECTION_ACCEPTED_ESTIMATED_CORRECTION = SymbolicConstant('CORRECTION_ACCEPTED_ESTIMATED_CORRECTION')
-CORRECTION_ACCEPTED_SMALL_INCREMENT = SymbolicConstant('CORRECTION_ACCEPTED_SMALL_INCREMENT')
-CORRECTION_NOT_ACCEPTED = SymbolicConstant('CORRECTION_NOT_ACCEPTED')
-CORRELATED = SymbolicConstant('CORRELATED')
-COSINE = SymbolicConstant('COSINE')
-COUNT = SymbolicConstant('COUNT')
-COUNTERCLOCKWISE = SymbolicConstant('COUNTERCLOCKWISE')
-COUPLED = SymbolicConstant('COUPLED')
-COUPLED_MOTION = SymbolicConstant('COUPLED_MOTION')
-COUPLED_POSITION = SymbolicConstant('COUPLED_POSITION')
-COUPLED_TEMP_DISPLACEMENT = SymbolicConstant('COUPLED_TEMP_DISPLACEMENT')
-COUPLED_THERMAL_ELECTRIC = SymbolicConstant('COUPLED_THERMAL_ELECTRIC')
-COUPLED_THERMAL_ELECTRICAL = SymbolicConstant('COUPLED_THERMAL_ELECTRICAL')
-COUPLED_THERMAL_ELECTRICAL_STRUCTURAL = SymbolicConstant('COUPLED_THERMAL_ELECTRICAL_STRUCTURAL')
-COUPLED_THERMAL_STRESS = SymbolicConstant('COUPLED_THERMAL_STRESS')
-COUPLED_TRACTION = SymbolicConstant('COUPLED_TRACTION')
-COUPLING_FORCE_CONSTRAINT = SymbolicConstant('COUPLING_FORCE_CONSTRAINT')
-COUPLING_MOMENT_CONSTRAINT = SymbolicConstant('COUPLING_MOMENT_CONSTRAINT')
-CPE3 = SymbolicConstant('CPE3')
-CPE3E = SymbolicConstant('CPE3E')
-CPE3H = SymbolicConstant('CPE3H')
-CPE3T = SymbolicConstant('CPE3T')
-CPE4 = SymbolicConstant('CPE4')
-CPE4E = SymbolicConstant('CPE4E')
-CPE4H = SymbolicConstant('CPE4H')
-CPE4HT = SymbolicConstant('CPE4HT')
-CPE4I = SymbolicConstant('CPE4I')
-CPE4IH = SymbolicConstant('CPE4IH')
-CPE4P = SymbolicConstant('CPE4P')
-CPE4PH = SymbolicConstant('CPE4PH')
-CPE4R = SymbolicConstant('CPE4R')
-CPE4RH = SymbolicConstant('CPE4RH')
-CPE4RHT = SymbolicConstant('CPE4RHT')
-CPE4RP = SymbolicConstant('CPE4RP')
-CPE4RPH = SymbolicConstant('CPE4RPH')
-CPE4RT = SymbolicConstant('CPE4RT')
-CPE4T = SymbolicConstant('CPE4T')
-CPE6 = SymbolicConstant('CPE6')
-CPE6E = SymbolicConstant('CPE6E')
-CPE6H = SymbolicConstant('CPE6H')
-CPE6M = SymbolicConstant('CPE6M')
-CPE6MH = SymbolicConstant('CPE6MH')
-CPE6MHT = SymbolicConstant('CPE6MHT')
-CPE6MP = SymbolicConstant('CPE6MP')
-CPE6MPH = SymbolicConstant('CPE6MPH')
-CPE6MT = SymbolicConstant('CPE6MT')
-CPE8 = SymbolicConstant('CPE8')
-CPE8E = SymbolicConstant('CPE8E')
-CPE8H = SymbolicConstant('CPE8H')
-CPE8HT = SymbolicConstant('CPE8HT')
-CPE8P = SymbolicConstant('CPE8P')
-CPE8PH = SymbolicConstant('CPE8PH')
-CPE8R = SymbolicConstant('CPE8R')
-CPE8RE = SymbolicConstant('CPE8RE')
-CPE8RH = SymbolicConstant('CPE8RH')
-CPE8RHT = SymbolicConstant('CPE8RHT')
-CPE8RP = SymbolicConstant('CPE8RP')
-CPE8RPH = SymbolicConstant('CPE8RPH')
-CPE8RT = SymbolicConstant('CPE8RT')
-CPE8T = SymbolicConstant('CPE8T')
-CPEG3 = SymbolicConstant('CPEG3')
-CPEG3H = SymbolicConstant('CPEG3H')
-CPEG3HT = SymbolicConstant('CPEG3HT')
-CPEG3T = SymbolicConstant('CPEG3T')
-CPEG4 = SymbolicConstant('CPEG4')
-CPEG4H = SymbolicConstant('CPEG4H')
-CPEG4HT = SymbolicConstant('CPEG4HT')
-CPEG4I = SymbolicConstant('CPEG4I')
-CPEG4IH = SymbolicConstant('CPEG4IH')
-CPEG4R = SymbolicConstant('CPEG4R')
-CPEG4RH = SymbolicConstant('CPEG4RH')
-CPEG4RT = SymbolicConstant('CPEG4RT')
-CPEG4RHT = SymbolicConstant('CPEG4RHT')
-CPEG4T = SymbolicConstant('CPEG4T')
-CPEG6 = SymbolicConstant('CPEG6')
-CPEG6H = SymbolicConstant('CPEG6H')
-CPEG6M = SymbolicConstant('CPEG6M')
-CPEG6MH = SymbolicConstant('CPEG6MH')
-CPEG6MHT = SymbolicConstant('CPEG6MHT')
-CPEG6MT = SymbolicConstant('CPEG6MT')
-CPEG8 = SymbolicConstant('CPEG8')
-CPEG8H = SymbolicConstant('CPEG8H')
-CPEG8HT = SymbolicConstant('CPEG8HT')
-CPEG8R = SymbolicConstant('CPEG8R')
-CPEG8RH = SymbolicConstant('CPEG8RH')
-CPEG8RT = SymbolicConstant('CPEG8RT')
-CPEG8RHT = SymbolicConstant('CPEG8RHT')
-CPEG8T = SymbolicConstant('CPEG8T')
-CPS3 = SymbolicConstant('CPS3')
-CPS3E = SymbolicConstant('CPS3E')
-CPS3T = SymbolicConstant('CPS3T')
-CPS4 = SymbolicConstant('CPS4')
-CPS4E = SymbolicConstant('CPS4E')
-CPS4I = SymbolicConstant('CPS4I')
-CPS4R = SymbolicConstant('CPS4R')
-CPS4RT = SymbolicConstant('CPS4RT')
-CPS4T = SymbolicConstant('CPS4T')
-CPS6 = SymbolicConstant('CPS6')
-CPS6E = SymbolicConstant('CPS6E')
-CPS6M = SymbolicConstant('CPS6M')
-CPS6MT = SymbolicConstant('CPS6MT')
-CPS8 = SymbolicConstant('CPS8')
-CPS8E = SymbolicConstant('CPS8E')
-CPS8R = SymbolicConstant('CPS8R')
-CPS8RE = SymbolicConstant('CPS8RE')
-CPS8RT = SymbolicConstant('CPS8RT')
-CPS8T = SymbolicConstant('CPS8T')
-CPU_TIME_XPL = SymbolicConstant('CPU_TIME_XPL')
-CQC = SymbolicConstant('CQC')
-CRACKTIP = SymbolicConstant('CRACKTIP')
-CRACK_GROWTH = SymbolicConstant('CRACK_GROWTH')
-CRACK_LENGTH = SymbolicConstant('CRACK_LENGTH')
-CRACK_NORMAL = SymbolicConstant('CRACK_NORMAL')
-CREATED = SymbolicConstant('CREATED')
-CREEP = SymbolicConstant('CREEP')
-CREEP_OFF = SymbolicConstant('CREEP_OFF')
-CREEP_TEST_DATA = SymbolicConstant('CREEP_TEST_DATA')
-CRITICAL_DAMPING_FRACTION = SymbolicConstant('CRITICAL_DAMPING_FRACTION')
-CRITICAL_STRESS = SymbolicConstant('CRITICAL_STRESS')
-CROSS = SymbolicConstant('CROSS')
-CROSSED_SURFACES = SymbolicConstant('CROSSED_SURFACES')
-CROSSING_VALUE = SymbolicConstant('CROSSING_VALUE')
-CRUSHABLE_FOAM = SymbolicConstant('CRUSHABLE_FOAM')
-CSYS = SymbolicConstant('CSYS')
-CUBIC = SymbolicConstant('CUBIC')
-CUBIC_SPLINE = SymbolicConstant('CUBIC_SPLINE')
-CURRENT = SymbolicConstant('CURRENT')
-CURRENT_DISPLAY_GROUP = SymbolicConstant('CURRENT_DISPLAY_GROUP')
-CURRENT_FRAME = SymbolicConstant('CURRENT_FRAME')
-CURVATURE = SymbolicConstant('CURVATURE')
-CURVATURE_BASED_BY_SIZE = SymbolicConstant('CURVATURE_BASED_BY_SIZE')
-CURVE_LEGEND = SymbolicConstant('CURVE_LEGEND')
-CURVE_NAME = SymbolicConstant('CURVE_NAME')
-CURVE_NAME_LEGEND = SymbolicConstant('CURVE_NAME_LEGEND')
-CUSTOM = SymbolicConstant('CUSTOM')
-CUT = SymbolicConstant('CUT')
-CUT_OFF = SymbolicConstant('CUT_OFF')
-CVJOINT = SymbolicConstant('CVJOINT')
-CW = SymbolicConstant('CW')
-CYCLIC_SYMMETRY = SymbolicConstant('CYCLIC_SYMMETRY')
-CYLINDER = SymbolicConstant('CYLINDER')
-CYLINDRICAL = SymbolicConstant('CYLINDRICAL')
-C_INTEGRAL = SymbolicConstant('C_INTEGRAL')
-DAMAGE = SymbolicConstant('DAMAGE')
-DAMAGE_CRITERION = SymbolicConstant('DAMAGE_CRITERION')
-DAMPING_COEFFICIENT = SymbolicConstant('DAMPING_COEFFICIENT')
-DAMPING_FACTOR = SymbolicConstant('DAMPING_FACTOR')
-DASHED = SymbolicConstant('DASHED')
-DASHPOT1 = SymbolicConstant('DASHPOT1')
-DASHPOT2 = SymbolicConstant('DASHPOT2')
-DASHPOTA = SymbolicConstant('DASHPOTA')
-DATACHECK = SymbolicConstant('DATACHECK')
-DATUM = SymbolicConstant('DATUM')
-DB = SymbolicConstant('DB')
-DB2 = SymbolicConstant('DB2')
-DC1D2 = SymbolicConstant('DC1D2')
-DC1D2E = SymbolicConstant('DC1D2E')
-DC1D3 = SymbolicConstant('DC1D3')
-DC1D3E = SymbolicConstant('DC1D3E')
-DC2D3 = SymbolicConstant('DC2D3')
-DC2D3E = SymbolicConstant('DC2D3E')
-DC2D4 = SymbolicConstant('DC2D4')
-DC2D4E = SymbolicConstant('DC2D4E')
-DC2D6 = SymbolicConstant('DC2D6')
-DC2D6E = SymbolicConstant('DC2D6E')
-DC2D8 = SymbolicConstant('DC2D8')
-DC2D8E = SymbolicConstant('DC2D8E')
-DC3D10 = SymbolicConstant('DC3D10')
-DC3D10E = SymbolicConstant('DC3D10E')
-DC3D15 = SymbolicConstant('DC3D15')
-DC3D15E = SymbolicConstant('DC3D15E')
-DC3D20 = SymbolicConstant('DC3D20')
-DC3D20E = SymbolicConstant('DC3D20E')
-DC3D4 = SymbolicConstant('DC3D4')
-DC3D4E = SymbolicConstant('DC3D4E')
-DC3D6 = SymbolicConstant('DC3D6')
-DC3D6E = SymbolicConstant('DC3D6E')
-DC3D8 = SymbolicConstant('DC3D8')
-DC3D8E = SymbolicConstant('DC3D8E')
-DCAX3 = SymbolicConstant('DCAX3')
-DCAX3E = SymbolicConstant('DCAX3E')
-DCAX4 = SymbolicConstant('DCAX4')
-DCAX4E = SymbolicConstant('DCAX4E')
-DCAX6 = SymbolicConstant('DCAX6')
-DCAX6E = SymbolicConstant('DCAX6E')
-DCAX8 = SymbolicConstant('DCAX8')
-DCAX8E = SymbolicConstant('DCAX8E')
-DCC1D2 = SymbolicConstant('DCC1D2')
-DCC1D2D = SymbolicConstant('DCC1D2D')
-DCC2D4 = SymbolicConstant('DCC2D4')
-DCC2D4D = SymbolicConstant('DCC2D4D')
-DCC3D8 = SymbolicConstant('DCC3D8')
-DCC3D8D = SymbolicConstant('DCC3D8D')
-DCCAX2 = SymbolicConstant('DCCAX2')
-DCCAX2D = SymbolicConstant('DCCAX2D')
-DCCAX4 = SymbolicConstant('DCCAX4')
-DCCAX4D = SymbolicConstant('DCCAX4D')
-DCOUP2D = SymbolicConstant('DCOUP2D')
-DCOUP3D = SymbolicConstant('DCOUP3D')
-DDM_ITERATIVE = SymbolicConstant('DDM_ITERATIVE')
-DEACTIVATED = SymbolicConstant('DEACTIVATED')
-DEACTIVATED_FROM_BASE_STATE = SymbolicConstant('DEACTIVATED_FROM_BASE_STATE')
-DEBONDING = SymbolicConstant('DEBONDING')
-DECIMAL = SymbolicConstant('DECIMAL')
-DEFAULT = SymbolicConstant('DEFAULT')
-DEFAULTFORMAT = SymbolicConstant('DEFAULTFORMAT')
-DEFAULT_COLORS = SymbolicConstant('DEFAULT_COLORS')
-DEFAULT_LIMIT = SymbolicConstant('DEFAULT_LIMIT')
-DEFAULT_MODEL = SymbolicConstant('DEFAULT_MODEL')
-DEFAULT_SIZE = SymbolicConstant('DEFAULT_SIZE')
-DEFINE = SymbolicConstant('DEFINE')
-DEFORMABLE_BODY = SymbolicConstant('DEFORMABLE_BODY')
-DEFORMED = SymbolicConstant('DEFORMED')
-DELAYED = SymbolicConstant('DELAYED')
-DELETE = SymbolicConstant('DELETE')
-DELTA_OVER_1_ITERATION = SymbolicConstant('DELTA_OVER_1_ITERATION')
-DELTA_OVER_2_ITERATIONS = SymbolicConstant('DELTA_OVER_2_ITERATIONS')
-DELTA_OVER_3_ITERATIONS = SymbolicConstant('DELTA_OVER_3_ITERATIONS')
-DELTA_OVER_4_ITERATIONS = SymbolicConstant('DELTA_OVER_4_ITERATIONS')
-DELTA_OVER_5_ITERATIONS = SymbolicConstant('DELTA_OVER_5_ITERATIONS')
-DELTA_OVER_6_ITERATIONS = SymbolicConstant('DELTA_OVER_6_ITERATIONS')
-DEMOLD_REGION = SymbolicConstant('DEMOLD_REGION')
-DENSITY = SymbolicConstant('DENSITY')
-DENSITY_ROTATIONAL_ACCELERATION = SymbolicConstant('DENSITY_ROTATIONAL_ACCELERATION')
-DERIVED_COMPONENT = SymbolicConstant('DERIVED_COMPONENT')
-DESCENDING = SymbolicConstant('DESCENDING')
-DESIGN_SENSITIVITY = SymbolicConstant('DESIGN_SENSITIVITY')
-DEVIATION_FACTOR = SymbolicConstant('DEVIATION_FACTOR')
-DGAP = SymbolicConstant('DGAP')
-DIFFERENCE = SymbolicConstant('DIFFERENCE')
-DIFFUSE = SymbolicConstant('DIFFUSE')
-DIRECT = SymbolicConstant('DIRECT')
-DIRECTION = SymbolicConstant('DIRECTION')
-DIRECTIONAL = SymbolicConstant('DIRECTIONAL')
-DIRECTION_COSINE = SymbolicConstant('DIRECTION_COSINE')
-DIRECT_COMPONENT = SymbolicConstant('DIRECT_COMPONENT')
-DIRECT_CYCLIC = SymbolicConstant('DIRECT_CYCLIC')
-DIRECT_INCREMENTATION = SymbolicConstant('DIRECT_INCREMENTATION')
-DIRECT_NO_STOP_INCREMENTATION = SymbolicConstant('DIRECT_NO_STOP_INCREMENTATION')
-DIRECT_SOLVER = SymbolicConstant('DIRECT_SOLVER')
-DIRECT_STEADY_STATE_DYNAMIC = SymbolicConstant('DIRECT_STEADY_STATE_DYNAMIC')
-DIRECT_SYMMETRIC = SymbolicConstant('DIRECT_SYMMETRIC')
-DIRECT_UNSYMMETRIC = SymbolicConstant('DIRECT_UNSYMMETRIC')
-DISABLED_BY_SYSTEM = SymbolicConstant('DISABLED_BY_SYSTEM')
-DISABLED_BY_USER = SymbolicConstant('DISABLED_BY_USER')
-DISABLE_THROUGHOUT_STEP = SymbolicConstant('DISABLE_THROUGHOUT_STEP')
-DISCONTINUITIES = SymbolicConstant('DISCONTINUITIES')
-DISCRETE = SymbolicConstant('DISCRETE')
-DISCRETE_FIELD = SymbolicConstant('DISCRETE_FIELD')
-DISCRETE_RIGID_SURFACE = SymbolicConstant('DISCRETE_RIGID_SURFACE')
-DISK = SymbolicConstant('DISK')
-DISPLACEMENT = SymbolicConstant('DISPLACEMENT')
-DISPLACEMENT_FIELD = SymbolicConstant('DISPLACEMENT_FIELD')
-DISPLAY_GROUPS = SymbolicConstant('DISPLAY_GROUPS')
-DISPLAY_GRP_MAP = SymbolicConstant('DISPLAY_GRP_MAP')
-DISPLAY_GRP_MAP_COLORS = SymbolicConstant('DISPLAY_GRP_MAP_COLORS')
-DISSIPATED_ENERGY_FRACTION = SymbolicConstant('DISSIPATED_ENERGY_FRACTION')
-DISTRIBUTING = SymbolicConstant('DISTRIBUTING')
-DISTRIBUTING_COUPLING = SymbolicConstant('DISTRIBUTING_COUPLING')
-DIVIDE = SymbolicConstant('DIVIDE')
-DMASS_XPL = SymbolicConstant('DMASS_XPL')
-DOF_MODE = SymbolicConstant('DOF_MODE')
-DOF_MODE_MPC = SymbolicConstant('DOF_MODE_MPC')
-DOMAIN = SymbolicConstant('DOMAIN')
-DOTTED = SymbolicConstant('DOTTED')
-DOT_DASH = SymbolicConstant('DOT_DASH')
-DOUBLE = SymbolicConstant('DOUBLE')
-DOUBLE_CONSTRAINT_ONLY = SymbolicConstant('DOUBLE_CONSTRAINT_ONLY')
-DOUBLE_PLUS_PACK = SymbolicConstant('DOUBLE_PLUS_PACK')
-DOUBLE_PRECISION = SymbolicConstant('DOUBLE_PRECISION')
-DOUBLE_SIDED = SymbolicConstant('DOUBLE_SIDED')
-DPI_1200 = SymbolicConstant('DPI_1200')
-DPI_150 = SymbolicConstant('DPI_150')
-DPI_300 = SymbolicConstant('DPI_300')
-DPI_450 = SymbolicConstant('DPI_450')
-DPI_600 = SymbolicConstant('DPI_600')
-DPI_75 = SymbolicConstant('DPI_75')
-DRAG2D = SymbolicConstant('DRAG2D')
-DRAG3D = SymbolicConstant('DRAG3D')
-DS3 = SymbolicConstant('DS3')
-DS4 = SymbolicConstant('DS4')
-DS6 = SymbolicConstant('DS6')
-DS8 = SymbolicConstant('DS8')
-DSAX1 = SymbolicConstant('DSAX1')
-DSAX2 = SymbolicConstant('DSAX2')
-DSC = SymbolicConstant('DSC')
-DUPLICATE_NODES = SymbolicConstant('DUPLICATE_NODES')
-DURING_ANALYSIS = SymbolicConstant('DURING_ANALYSIS')
-DYNAMIC = SymbolicConstant('DYNAMIC')
-DYNAMIC_EXPLICIT = SymbolicConstant('DYNAMIC_EXPLICIT')
-DYNAMIC_IMPLICIT = SymbolicConstant('DYNAMIC_IMPLICIT')
-DYNAMIC_SUBSPACE = SymbolicConstant('DYNAMIC_SUBSPACE')
-DYNAMIC_TEMP_DISPLACEMENT = SymbolicConstant('DYNAMIC_TEMP_DISPLACEMENT')
-EC3D8R = SymbolicConstant('EC3D8R')
-EC3D8RT = SymbolicConstant('EC3D8RT')
-ECURRENT_AREA_TIME = SymbolicConstant('ECURRENT_AREA_TIME')
-EDGE = SymbolicConstant('EDGE')
-EDGE1 = SymbolicConstant('EDGE1')
-EDGE2 = SymbolicConstant('EDGE2')
-EDGE3 = SymbolicConstant('EDGE3')
-EDGE4 = SymbolicConstant('EDGE4')
-EDGES = SymbolicConstant('EDGES')
-EDGETOEDGE = SymbolicConstant('EDGETOEDGE')
-EDGETOFACE = SymbolicConstant('EDGETOFACE')
-EDGE_LIST = SymbolicConstant('EDGE_LIST')
-EDGE_SEEDING_METHOD = SymbolicConstant('EDGE_SEEDING_METHOD')
-EIGENFREQUENCY = SymbolicConstant('EIGENFREQUENCY')
-EIGENVALUE_BUCKLING = SymbolicConstant('EIGENVALUE_BUCKLING')
-EITHER = SymbolicConstant('EITHER')
-ELASTIC = SymbolicConstant('ELASTIC')
-ELASTIC_PLASTIC = SymbolicConstant('ELASTIC_PLASTIC')
-ELBOW31 = SymbolicConstant('ELBOW31')
-ELBOW31B = SymbolicConstant('ELBOW31B')
-ELBOW31C = SymbolicConstant('ELBOW31C')
-ELBOW32 = SymbolicConstant('ELBOW32')
-ELBOW_MPC = SymbolicConstant('ELBOW_MPC')
-ELECTRICAL = SymbolicConstant('ELECTRICAL')
-ELECTRICAL_CONTACT = SymbolicConstant('ELECTRICAL_CONTACT')
-ELECTRICAL_POTENTIAL_FIELD = SymbolicConstant('ELECTRICAL_POTENTIAL_FIELD')
-ELECTRIC_CHARGE = SymbolicConstant('ELECTRIC_CHARGE')
-ELECTRIC_CURRENT = SymbolicConstant('ELECTRIC_CURRENT')
-ELECTRIC_CURRENT_AREA = SymbolicConstant('ELECTRIC_CURRENT_AREA')
-ELECTRIC_POTENTIAL = SymbolicConstant('ELECTRIC_POTENTIAL')
-ELECTROMAGNETIC_TIME_HARMONIC = SymbolicConstant('ELECTROMAGNETIC_TIME_HARMONIC')
-ELEMENT = SymbolicConstant('ELEMENT')
-ELEMENTS = SymbolicConstant('ELEMENTS')
-ELEMENT_ALL = SymbolicConstant('ELEMENT_ALL')
-ELEMENT_BY_ELEMENT_INCREMENTATION = SymbolicConstant('ELEMENT_BY_ELEMENT_INCREMENTATION')
-ELEMENT_CENTER_PROJECTION = SymbolicConstant('ELEMENT_CENTER_PROJECTION')
-ELEMENT_CENTROID = SymbolicConstant('ELEMENT_CENTROID')
-ELEMENT_FACE = SymbolicConstant('ELEMENT_FACE')
-ELEMENT_FACE_INTEGRATION_POINT = SymbolicConstant('ELEMENT_FACE_INTEGRATION_POINT')
-ELEMENT_NODAL = SymbolicConstant('ELEMENT_NODAL')
-ELEMENT_NODES = SymbolicConstant('ELEMENT_NODES')
-ELEMENT_PRESELECT = SymbolicConstant('ELEMENT_PRESELECT')
-ELEMENT_SET = SymbolicConstant('ELEMENT_SET')
-ELEM_SHAPE = SymbolicConstant('ELEM_SHAPE')
-ELLIPSE = SymbolicConstant('ELLIPSE')
-ELLIPTICAL = SymbolicConstant('ELLIPTICAL')
-ELSET_MAP = SymbolicConstant('ELSET_MAP')
-ELSET_MAP_COLORS = SymbolicConstant('ELSET_MAP_COLORS')
-ELTYPE_MAP = SymbolicConstant('ELTYPE_MAP')
-ELTYPE_MAP_COLORS = SymbolicConstant('ELTYPE_MAP_COLORS')
-EMAG = SymbolicConstant('EMAG')
-EMBEDDED_COEFF = SymbolicConstant('EMBEDDED_COEFF')
-EMBEDDED_ELEMENT = SymbolicConstant('EMBEDDED_ELEMENT')
-EMC2D3 = SymbolicConstant('EMC2D3')
-EMC2D4 = SymbolicConstant('EMC2D4')
-EMC3D4 = SymbolicConstant('EMC3D4')
-EMC3D6 = SymbolicConstant('EMC3D6')
-EMC3D8 = SymbolicConstant('EMC3D8')
-EMF = SymbolicConstant('EMF')
-EMPTY_FIELD = SymbolicConstant('EMPTY_FIELD')
-EMPTY_LEAF = SymbolicConstant('EMPTY_LEAF')
-ENABLED = SymbolicConstant('ENABLED')
-ENCASTRE = SymbolicConstant('ENCASTRE')
-END = SymbolicConstant('END')
-END1 = SymbolicConstant('END1')
-END2 = SymbolicConstant('END2')
-END3 = SymbolicConstant('END3')
-END_FRAME_TIME = SymbolicConstant('END_FRAME_TIME')
-END_RELEASE = SymbolicConstant('END_RELEASE')
-END_STEP = SymbolicConstant('END_STEP')
-ENERGY = SymbolicConstant('ENERGY')
-ENERGY_ALL = SymbolicConstant('ENERGY_ALL')
-ENERGY_DENSITY = SymbolicConstant('ENERGY_DENSITY')
-ENERGY_NONE = SymbolicConstant('ENERGY_NONE')
-ENERGY_PRESELECT = SymbolicConstant('ENERGY_PRESELECT')
-ENERGY_RELEASE_RATE = SymbolicConstant('ENERGY_RELEASE_RATE')
-ENERGY_TYPE = SymbolicConstant('ENERGY_TYPE')
-ENFORCEMENT_OFF = SymbolicConstant('ENFORCEMENT_OFF')
-ENFORCEMENT_ON = SymbolicConstant('ENFORCEMENT_ON')
-ENGINEERING = SymbolicConstant('ENGINEERING')
-ENGINEERING_CONSTANTS = SymbolicConstant('ENGINEERING_CONSTANTS')
-ENHANCED = SymbolicConstant('ENHANCED')
-ENHANCED_VCCT = SymbolicConstant('ENHANCED_VCCT')
-ENTEREDCOORD = SymbolicConstant('ENTEREDCOORD')
-ENUMERATION = SymbolicConstant('ENUMERATION')
-ENVELOPE = SymbolicConstant('ENVELOPE')
-EPOTENTIAL_GRADIENT = SymbolicConstant('EPOTENTIAL_GRADIENT')
-EPS = SymbolicConstant('EPS')
-EQUAL = SymbolicConstant('EQUAL')
-EQUALRADIUS = SymbolicConstant('EQUALRADIUS')
-EQUATION = SymbolicConstant('EQUATION')
-EQUILIBRIUM = SymbolicConstant('EQUILIBRIUM')
-EQUIV_STRESS = SymbolicConstant('EQUIV_STRESS')
-ERROR = SymbolicConstant('ERROR')
-ETOTAL_XPL = SymbolicConstant('ETOTAL_XPL')
-EULER = SymbolicConstant('EULER')
-EULERIAN = SymbolicConstant('EULERIAN')
-EVENT_ACCELERATION = SymbolicConstant('EVENT_ACCELERATION')
-EVENT_DISPLACEMENT = SymbolicConstant('EVENT_DISPLACEMENT')
-EVENT_GRAVITY = SymbolicConstant('EVENT_GRAVITY')
-EVENT_VELOCITY = SymbolicConstant('EVENT_VELOCITY')
-EVERY_CYCLE = SymbolicConstant('EVERY_CYCLE')
-EVERY_NCYCLES = SymbolicConstant('EVERY_NCYCLES')
-EVERY_TIME_INCREMENT = SymbolicConstant('EVERY_TIME_INCREMENT')
-EXACT = SymbolicConstant('EXACT')
-EXACT_TARGETS = SymbolicConstant('EXACT_TARGETS')
-EXCESSIVE_DISTORTION = SymbolicConstant('EXCESSIVE_DISTORTION')
-EXCESSIVE_ELEMENT_DISTORTION = SymbolicConstant('EXCESSIVE_ELEMENT_DISTORTION')
-EXCESSIVE_STRAIN_INCREMENT = SymbolicConstant('EXCESSIVE_STRAIN_INCREMENT')
-EXCLUDE = SymbolicConstant('EXCLUDE')
-EXPLICIT = SymbolicConstant('EXPLICIT')
-EXPLICIT_ANALYSIS = SymbolicConstant('EXPLICIT_ANALYSIS')
-EXPLICIT_DYNAMIC = SymbolicConstant('EXPLICIT_DYNAMIC')
-EXPLICIT_ONLY = SymbolicConstant('EXPLICIT_ONLY')
-EXPLICIT_PHASE = SymbolicConstant('EXPLICIT_PHASE')
-EXPONENTIAL = SymbolicConstant('EXPONENTIAL')
-EXPONENTIAL_DECAY = SymbolicConstant('EXPONENTIAL_DECAY')
-EXPONENTIAL_LAW = SymbolicConstant('EXPONENTIAL_LAW')
-EXPORT_STEP_SIZE = SymbolicConstant('EXPORT_STEP_SIZE')
-EXTERIOR = SymbolicConstant('EXTERIOR')
-EXTERNAL = SymbolicConstant('EXTERNAL')
-EXTRAPOLATE_AVERAGE_COMPUTE = SymbolicConstant('EXTRAPOLATE_AVERAGE_COMPUTE')
-EXTRAPOLATE_COMPUTE = SymbolicConstant('EXTRAPOLATE_COMPUTE')
-EXTRAPOLATE_COMPUTE_AVERAGE = SymbolicConstant('EXTRAPOLATE_COMPUTE_AVERAGE')
-EXTRAPOLATE_COMPUTE_DISCONTINUITIES = SymbolicConstant('EXTRAPOLATE_COMPUTE_DISCONTINUITIES')
-EXTRA_COARSE = SymbolicConstant('EXTRA_COARSE')
-EXTRA_FINE = SymbolicConstant('EXTRA_FINE')
-F2D2 = SymbolicConstant('F2D2')
-F3D3 = SymbolicConstant('F3D3')
-F3D4 = SymbolicConstant('F3D4')
-FACE1 = SymbolicConstant('FACE1')
-FACE2 = SymbolicConstant('FACE2')
-FACE3 = SymbolicConstant('FACE3')
-FACE4 = SymbolicConstant('FACE4')
-FACE5 = SymbolicConstant('FACE5')
-FACE6 = SymbolicConstant('FACE6')
-FACETOEDGE = SymbolicConstant('FACETOEDGE')
-FACETOFACE = SymbolicConstant('FACETOFACE')
-FACETS = SymbolicConstant('FACETS')
-FACE_CENTERED = SymbolicConstant('FACE_CENTERED')
-FACE_UNKNOWN = SymbolicConstant('FACE_UNKNOWN')
-FACTOR = SymbolicConstant('FACTOR')
-FARTHEST_POINT_FRACTION = SymbolicConstant('FARTHEST_POINT_FRACTION')
-FAST = SymbolicConstant('FAST')
-FASTENER = SymbolicConstant('FASTENER')
-FATIGUE = SymbolicConstant('FATIGUE')
-FAX2 = SymbolicConstant('FAX2')
-FC3D4 = SymbolicConstant('FC3D4')
-FC3D5 = SymbolicConstant('FC3D5')
-FC3D6 = SymbolicConstant('FC3D6')
-FC3D8 = SymbolicConstant('FC3D8')
-FEATURE = SymbolicConstant('FEATURE')
-FE_SAFE = SymbolicConstant('FE_SAFE')
-FGMRES = SymbolicConstant('FGMRES')
-FICK = SymbolicConstant('FICK')
-FIELD = SymbolicConstant('FIELD')
-FIELDREPORTFORMAT = SymbolicConstant('FIELDREPORTFORMAT')
-FIELD_OUTPUT = SymbolicConstant('FIELD_OUTPUT')
-FIELD_THICKNESS = SymbolicConstant('FIELD_THICKNESS')
-FILE = SymbolicConstant('FILE')
-FILL = SymbolicConstant('FILL')
-FILLED = SymbolicConstant('FILLED')
-FILLED_ARROW = SymbolicConstant('FILLED_ARROW')
-FILLED_CIRCLE = SymbolicConstant('FILLED_CIRCLE')
-FILLED_DIAMOND = SymbolicConstant('FILLED_DIAMOND')
-FILLED_SQUARE = SymbolicConstant('FILLED_SQUARE')
-FILLED_TRI = SymbolicConstant('FILLED_TRI')
-FILTER = SymbolicConstant('FILTER')
-FINE = SymbolicConstant('FINE')
-FINER = SymbolicConstant('FINER')
-FINITE = SymbolicConstant('FINITE')
-FIRST = SymbolicConstant('FIRST')
-FIRST_AND_LAST = SymbolicConstant('FIRST_AND_LAST')
-FIRST_CYCLE = SymbolicConstant('FIRST_CYCLE')
-FIRST_FRAME = SymbolicConstant('FIRST_FRAME')
-FIRST_ORDER_ADVECTION = SymbolicConstant('FIRST_ORDER_ADVECTION')
-FIRST_STEP = SymbolicConstant('FIRST_STEP')
-FITTED_VALUE = SymbolicConstant('FITTED_VALUE')
-FIT_HEIGHT = SymbolicConstant('FIT_HEIGHT')
-FIT_TO_PAGE = SymbolicConstant('FIT_TO_PAGE')
-FIT_TO_VIEWPORT = SymbolicConstant('FIT_TO_VIEWPORT')
-FIT_WIDTH = SymbolicConstant('FIT_WIDTH')
-FIXED = SymbolicConstant('FIXED')
-FIXED_CFL = SymbolicConstant('FIXED_CFL')
-FIXED_DOF = SymbolicConstant('FIXED_DOF')
-FIXED_EBE = SymbolicConstant('FIXED_EBE')
-FIXED_INCREMENTATION = SymbolicConstant('FIXED_INCREMENTATION')
-FIXED_TIME = SymbolicConstant('FIXED_TIME')
-FIXED_USER_DEFINED_INC = SymbolicConstant('FIXED_USER_DEFINED_INC')
-FIX_LENGTH = SymbolicConstant('FIX_LENGTH')
-FIX_NONE = SymbolicConstant('FIX_NONE')
-FLD = SymbolicConstant('FLD')
-FLEXIBLE = SymbolicConstant('FLEXIBLE')
-FLEXION_TORSION = SymbolicConstant('FLEXION_TORSION')
-FLINK = SymbolicConstant('FLINK')
-FLOAT = SymbolicConstant('FLOAT')
-FLOW = SymbolicConstant('FLOW')
-FLOW_CONVERTER = SymbolicConstant('FLOW_CONVERTER')
-FLUID = SymbolicConstant('FLUID')
-FLUID_PRESSURE_FIELD = SymbolicConstant('FLUID_PRESSURE_FIELD')
-FOLLOW = SymbolicConstant('FOLLOW')
-FONT = SymbolicConstant('FONT')
-FORCE = SymbolicConstant('FORCE')
-FORCE_SINGLE = SymbolicConstant('FORCE_SINGLE')
-FORCE_VOLUME = SymbolicConstant('FORCE_VOLUME')
-FORMULA = SymbolicConstant('FORMULA')
-FORWARD = SymbolicConstant('FORWARD')
-FRACTION = SymbolicConstant('FRACTION')
-FRACTIONAL = SymbolicConstant('FRACTIONAL')
-FRACTURE_MECHANICS = SymbolicConstant('FRACTURE_MECHANICS')
-FRAME2D = SymbolicConstant('FRAME2D')
-FRAME3D = SymbolicConstant('FRAME3D')
-FRAME_BASED = SymbolicConstant('FRAME_BASED')
-FRAME_VALUE = SymbolicConstant('FRAME_VALUE')
-FREE = SymbolicConstant('FREE')
-FREED = SymbolicConstant('FREED')
-FREE_FORM = SymbolicConstant('FREE_FORM')
-FREE_TASK_REGION_EQUIV_STRESS = SymbolicConstant('FREE_TASK_REGION_EQUIV_STRESS')
-FREQUENCY = SymbolicConstant('FREQUENCY')
-FREQUENCY_DATA = SymbolicConstant('FREQUENCY_DATA')
-FREQUENCY_RANGE = SymbolicConstant('FREQUENCY_RANGE')
-FRICTIONLESS = SymbolicConstant('FRICTIONLESS')
-FROM_ASCII_FILE = SymbolicConstant('FROM_ASCII_FILE')
-FROM_FILE = SymbolicConstant('FROM_FILE')
-FROM_FILE_AND_USER_DEFINED = SymbolicConstant('FROM_FILE_AND_USER_DEFINED')
-FROM_GEOMETRY = SymbolicConstant('FROM_GEOMETRY')
-FROM_KEYBOARD = SymbolicConstant('FROM_KEYBOARD')
-FROM_ODB = SymbolicConstant('FROM_ODB')
-FROM_OPERATION = SymbolicConstant('FROM_OPERATION')
-FROM_SECTION = SymbolicConstant('FROM_SECTION')
-FROM_USER_DEFINED = SymbolicConstant('FROM_USER_DEFINED')
-FULL = SymbolicConstant('FULL')
-FULLY = SymbolicConstant('FULLY')
-FULL_CYCLE = SymbolicConstant('FULL_CYCLE')
-FULL_FIELD = SymbolicConstant('FULL_FIELD')
-FULL_NEWTON = SymbolicConstant('FULL_NEWTON')
-FUNG_ANISOTROPIC = SymbolicConstant('FUNG_ANISOTROPIC')
-FUNG_ORTHOTROPIC = SymbolicConstant('FUNG_ORTHOTROPIC')
-G = SymbolicConstant('G')
-GALERKIN = SymbolicConstant('GALERKIN')
-GAPCYL = SymbolicConstant('GAPCYL')
-GAPSPHER = SymbolicConstant('GAPSPHER')
-GAPUNI = SymbolicConstant('GAPUNI')
-GAPUNIT = SymbolicConstant('GAPUNIT')
-GASKET = SymbolicConstant('GASKET')
-GAUSS = SymbolicConstant('GAUSS')
-GAUSS_COUPLING = SymbolicConstant('GAUSS_COUPLING')
-GENERAL = SymbolicConstant('GENERAL')
-GENERALIZED = SymbolicConstant('GENERALIZED')
-GENERALIZED_BEAM = SymbolicConstant('GENERALIZED_BEAM')
-GENERALIZED_DECAY = SymbolicConstant('GENERALIZED_DECAY')
-GENERALIZED_SHELL = SymbolicConstant('GENERALIZED_SHELL')
-GENERAL_OPTIMIZATION = SymbolicConstant('GENERAL_OPTIMIZATION')
-GENERAL_PARTICLE = SymbolicConstant('GENERAL_PARTICLE')
-GEOMETRY = SymbolicConstant('GEOMETRY')
-GEOMETRYFORMAT = SymbolicConstant('GEOMETRYFORMAT')
-GEOMETRY_ENHANCED = SymbolicConstant('GEOMETRY_ENHANCED')
-GEOM_DEVIATION_FACTOR = SymbolicConstant('GEOM_DEVIATION_FACTOR')
-GEOSTATIC = SymbolicConstant('GEOSTATIC')
-GFI = SymbolicConstant('GFI')
-GIGA_BYTES = SymbolicConstant('GIGA_BYTES')
-GK2D2 = SymbolicConstant('GK2D2')
-GK2D2N = SymbolicConstant('GK2D2N')
-GK3D12M = SymbolicConstant('GK3D12M')
-GK3D12MN = SymbolicConstant('GK3D12MN')
-GK3D18 = SymbolicConstant('GK3D18')
-GK3D18N = SymbolicConstant('GK3D18N')
-GK3D2 = SymbolicConstant('GK3D2')
-GK3D2N = SymbolicConstant('GK3D2N')
-GK3D4L = SymbolicConstant('GK3D4L')
-GK3D4LN = SymbolicConstant('GK3D4LN')
-GK3D6 = SymbolicConstant('GK3D6')
-GK3D6L = SymbolicConstant('GK3D6L')
-GK3D6LN = SymbolicConstant('GK3D6LN')
-GK3D6N = SymbolicConstant('GK3D6N')
-GK3D8 = SymbolicConstant('GK3D8')
-GK3D8N = SymbolicConstant('GK3D8N')
-GKAX2 = SymbolicConstant('GKAX2')
-GKAX2N = SymbolicConstant('GKAX2N')
-GKAX4 = SymbolicConstant('GKAX4')
-GKAX4N = SymbolicConstant('GKAX4N')
-GKAX6 = SymbolicConstant('GKAX6')
-GKAX6N = SymbolicConstant('GKAX6N')
-GKPE4 = SymbolicConstant('GKPE4')
-GKPE6 = SymbolicConstant('GKPE6')
-GKPS4 = SymbolicConstant('GKPS4')
-GKPS4N = SymbolicConstant('GKPS4N')
-GKPS6 = SymbolicConstant('GKPS6')
-GKPS6N = SymbolicConstant('GKPS6N')
-GLOBAL = SymbolicConstant('GLOBAL')
-GLOBAL_NONE = SymbolicConstant('GLOBAL_NONE')
-GLOBAL_X = SymbolicConstant('GLOBAL_X')
-GLOBAL_Y = SymbolicConstant('GLOBAL_Y')
-GLOBAL_Z = SymbolicConstant('GLOBAL_Z')
-GOURAUD = SymbolicConstant('GOURAUD')
-GRADED = SymbolicConstant('GRADED')
-GRADIENT = SymbolicConstant('GRADIENT')
-GRADIENTS = SymbolicConstant('GRADIENTS')
-GRADIENTS_THROUGH_BEAM_CS = SymbolicConstant('GRADIENTS_THROUGH_BEAM_CS')
-GRADIENTS_THROUGH_SHELL_CS = SymbolicConstant('GRADIENTS_THROUGH_SHELL_CS')
-GRAVITY = SymbolicConstant('GRAVITY')
-GREATER_THAN = SymbolicConstant('GREATER_THAN')
-GREATER_THAN_EQUAL = SymbolicConstant('GREATER_THAN_EQUAL')
-GREYSCALE = SymbolicConstant('GREYSCALE')
-GRID = SymbolicConstant('GRID')
-GROUND = SymbolicConstant('GROUND')
-GROUP_BY_MATERIAL = SymbolicConstant('GROUP_BY_MATERIAL')
-GROWTH_MOVEMENT = SymbolicConstant('GROWTH_MOVEMENT')
-GRP = SymbolicConstant('GRP')
-HALF = SymbolicConstant('HALF')
-HALF_CYCLE = SymbolicConstant('HALF_CYCLE')
-HALF_INDEX_SHIFT = SymbolicConstant('HALF_INDEX_SHIFT')
-HALF_OF_AVERAGE = SymbolicConstant('HALF_OF_AVERAGE')
-HARD = SymbolicConstant('HARD')
-HARDWARE_OVERLAY = SymbolicConstant('HARDWARE_OVERLAY')
-HARMONIC = SymbolicConstant('HARMONIC')
-HEADING = SymbolicConstant('HEADING')
-HEALER_TYPE = SymbolicConstant('HEALER_TYPE')
-HEATCAP = SymbolicConstant('HEATCAP')
-HEAT_FLUX = SymbolicConstant('HEAT_FLUX')
-HEAT_FLUX_AREA = SymbolicConstant('HEAT_FLUX_AREA')
-HEAT_FLUX_RATE = SymbolicConstant('HEAT_FLUX_RATE')
-HEAT_FLUX_VOLUME = SymbolicConstant('HEAT_FLUX_VOLUME')
-HEAT_TRANSFER = SymbolicConstant('HEAT_TRANSFER')
-HEIGHT = SymbolicConstant('HEIGHT')
-HEX = SymbolicConstant('HEX')
-HEX20 = SymbolicConstant('HEX20')
-HEX8 = SymbolicConstant('HEX8')
-HEX_DOMINATED = SymbolicConstant('HEX_DOMINATED')
-HIDDEN = SymbolicConstant('HIDDEN')
-HIGH = SymbolicConstant('HIGH')
-HINGE = SymbolicConstant('HINGE')
-HISTORY = SymbolicConstant('HISTORY')
-HOLLOW_CIRCLE = SymbolicConstant('HOLLOW_CIRCLE')
-HOLLOW_DIAMOND = SymbolicConstant('HOLLOW_DIAMOND')
-HOLLOW_SQUARE = SymbolicConstant('HOLLOW_SQUARE')
-HOLLOW_TRI = SymbolicConstant('HOLLOW_TRI')
-HOLZAPFEL = SymbolicConstant('HOLZAPFEL')
-HOME = SymbolicConstant('HOME')
-HORIZONTAL = SymbolicConstant('HORIZONTAL')
-HYBRID = SymbolicConstant('HYBRID')
-HYDRAULIC = SymbolicConstant('HYDRAULIC')
-HYDROSTATIC = SymbolicConstant('HYDROSTATIC')
-HYDROSTATIC_FLUID_MODELING = SymbolicConstant('HYDROSTATIC_FLUID_MODELING')
-HYPERBOLIC = SymbolicConstant('HYPERBOLIC')
-HYPERBOLIC_SINE = SymbolicConstant('HYPERBOLIC_SINE')
-HYSTERESIS_INITIAL_GUESSES_EXHAUSTED = SymbolicConstant('HYSTERESIS_INITIAL_GUESSES_EXHAUSTED')
-HYSTERESIS_JACOBIAN_CANNOT_BE_INVERTED = SymbolicConstant('HYSTERESIS_JACOBIAN_CANNOT_BE_INVERTED')
-ICC = SymbolicConstant('ICC')
-IDEALGAS = SymbolicConstant('IDEALGAS')
-IDENTICAL = SymbolicConstant('IDENTICAL')
-IDENTITY = SymbolicConstant('IDENTITY')
-IGNITIONANDGROWTH = SymbolicConstant('IGNITIONANDGROWTH')
-IMAGINARY = SymbolicConstant('IMAGINARY')
-IMMEDIATE = SymbolicConstant('IMMEDIATE')
-IMPEDANCE = SymbolicConstant('IMPEDANCE')
-IMPERFECTION = SymbolicConstant('IMPERFECTION')
-IMPLICIT = SymbolicConstant('IMPLICIT')
-IMPLICIT_DYNAMIC = SymbolicConstant('IMPLICIT_DYNAMIC')
-IMPLICIT_EXPLICIT = SymbolicConstant('IMPLICIT_EXPLICIT')
-IMPORT = SymbolicConstant('IMPORT')
-IMPORT_STEP_SIZE = SymbolicConstant('IMPORT_STEP_SIZE')
-IMPRINT = SymbolicConstant('IMPRINT')
-IMPROVED = SymbolicConstant('IMPROVED')
-INCHES = SymbolicConstant('INCHES')
-INCLUDE = SymbolicConstant('INCLUDE')
-INCOMPRESSIBLE = SymbolicConstant('INCOMPRESSIBLE')
-INCREMENT = SymbolicConstant('INCREMENT')
-INCREMENTAL = SymbolicConstant('INCREMENTAL')
-INCREMENTATION = SymbolicConstant('INCREMENTATION')
-INCREMENTATION_ALL = SymbolicConstant('INCREMENTATION_ALL')
-INCREMENTATION_PRESELECT = SymbolicConstant('INCREMENTATION_PRESELECT')
-INC_SIZE = SymbolicConstant('INC_SIZE')
-INDEPENDENT = SymbolicConstant('INDEPENDENT')
-INDEX = SymbolicConstant('INDEX')
-INERTIA_RELIEF = SymbolicConstant('INERTIA_RELIEF')
-INFILTRATION = SymbolicConstant('INFILTRATION')
-INFINITE = SymbolicConstant('INFINITE')
-INFLOW = SymbolicConstant('INFLOW')
-INITIAL = SymbolicConstant('INITIAL')
-INITIAL_AND_LAST = SymbolicConstant('INITIAL_AND_LAST')
-INITIAL_CONDITION = SymbolicConstant('INITIAL_CONDITION')
-INITIAL_NODES = SymbolicConstant('INITIAL_NODES')
-INITIAL_OPENINGS = SymbolicConstant('INITIAL_OPENINGS')
-INITIAL_OVERCLOSURES = SymbolicConstant('INITIAL_OVERCLOSURES')
-INITIAL_OVERCLOSURES_EXPLICIT = SymbolicConstant('INITIAL_OVERCLOSURES_EXPLICIT')
-INPUT = SymbolicConstant('INPUT')
-INPUT_FILE = SymbolicConstant('INPUT_FILE')
-INSIDE = SymbolicConstant('INSIDE')
-INSTANCE = SymbolicConstant('INSTANCE')
-INSTANCE_FROM_INSTANCE = SymbolicConstant('INSTANCE_FROM_INSTANCE')
-INSTANCE_FROM_PART = SymbolicConstant('INSTANCE_FROM_PART')
-INSTANCE_MAP = SymbolicConstant('INSTANCE_MAP')
-INSTANCE_MAP_COLORS = SymbolicConstant('INSTANCE_MAP_COLORS')
-INSTANCE_NOT_APPLICABLE = SymbolicConstant('INSTANCE_NOT_APPLICABLE')
-INSTANCE_TYPE_MAP = SymbolicConstant('INSTANCE_TYPE_MAP')
-INSTANCE_TYPE_MAP_COLORS = SymbolicConstant('INSTANCE_TYPE_MAP_COLORS')
-INSTANTANEOUS = SymbolicConstant('INSTANTANEOUS')
-INTEGER = SymbolicConstant('INTEGER')
-INTEGRATED_ALL = SymbolicConstant('INTEGRATED_ALL')
-INTEGRATED_PRESELECT = SymbolicConstant('INTEGRATED_PRESELECT')
-INTEGRATION_POINT = SymbolicConstant('INTEGRATION_POINT')
-INTEGRATION_POINTS = SymbolicConstant('INTEGRATION_POINTS')
-INTERACTION_MAP = SymbolicConstant('INTERACTION_MAP')
-INTERACTION_MAP_COLORS = SymbolicConstant('INTERACTION_MAP_COLORS')
-INTERACTION_PROP_MAP = SymbolicConstant('INTERACTION_PROP_MAP')
-INTERACTION_PROP_MAP_COLORS = SymbolicConstant('INTERACTION_PROP_MAP_COLORS')
-INTERACTION_TYPE_MAP = SymbolicConstant('INTERACTION_TYPE_MAP')
-INTERACTION_TYPE_MAP_COLORS = SymbolicConstant('INTERACTION_TYPE_MAP_COLORS')
-INTERFERENCE = SymbolicConstant('INTERFERENCE')
-INTERNAL = SymbolicConstant('INTERNAL')
-INTERNAL_SET_MAP = SymbolicConstant('INTERNAL_SET_MAP')
-INTERNAL_SET_MAP_COLORS = SymbolicConstant('INTERNAL_SET_MAP_COLORS')
-INTERNAL_SURFACE_MAP = SymbolicConstant('INTERNAL_SURFACE_MAP')
-INTERNAL_SURFACE_MAP_COLORS = SymbolicConstant('INTERNAL_SURFACE_MAP_COLORS')
-INTERPOLATED = SymbolicConstant('INTERPOLATED')
-INTERPOLATE_OFF = SymbolicConstant('INTERPOLATE_OFF')
-INTERPOLATE_ON = SymbolicConstant('INTERPOLATE_ON')
-INTERRUPTED = SymbolicConstant('INTERRUPTED')
-INTERSECTION = SymbolicConstant('INTERSECTION')
-INTERSECTIONS = SymbolicConstant('INTERSECTIONS')
-INV3 = SymbolicConstant('INV3')
-INVALID = SymbolicConstant('INVALID')
-INVALID_SURF = SymbolicConstant('INVALID_SURF')
-INVARIANT = SymbolicConstant('INVARIANT')
-INWARD = SymbolicConstant('INWARD')
-ISL21A = SymbolicConstant('ISL21A')
-ISL22A = SymbolicConstant('ISL22A')
-ISOLINES = SymbolicConstant('ISOLINES')
-ISOSURFACE = SymbolicConstant('ISOSURFACE')
-ISOTROPIC = SymbolicConstant('ISOTROPIC')
-ISOTROPIC_CFD = SymbolicConstant('ISOTROPIC_CFD')
-ITERATION = SymbolicConstant('ITERATION')
-ITERATIVE = SymbolicConstant('ITERATIVE')
-ITERATIVE_SOLVER = SymbolicConstant('ITERATIVE_SOLVER')
-ITSCYL = SymbolicConstant('ITSCYL')
-ITSUNI = SymbolicConstant('ITSUNI')
-ITT21 = SymbolicConstant('ITT21')
-ITT31 = SymbolicConstant('ITT31')
-JACOBI_COUPLING = SymbolicConstant('JACOBI_COUPLING')
-JAMA = SymbolicConstant('JAMA')
-JOB_ABORTED = SymbolicConstant('JOB_ABORTED')
-JOB_COMPLETED = SymbolicConstant('JOB_COMPLETED')
-JOB_INTERRUPTED = SymbolicConstant('JOB_INTERRUPTED')
-JOB_STATUS_COMPLETED_SUCCESSFULLY = SymbolicConstant('JOB_STATUS_COMPLETED_SUCCESSFULLY')
-JOB_STATUS_EXITED_WITH_ERROR = SymbolicConstant('JOB_STATUS_EXITED_WITH_ERROR')
-JOB_STATUS_TERMINATED_BY_EXTERNAL_REQUEST = SymbolicConstant('JOB_STATUS_TERMINATED_BY_EXTERNAL_REQUEST')
-JOB_STATUS_UNKNOWN = SymbolicConstant('JOB_STATUS_UNKNOWN')
-JOB_SUBMITTED = SymbolicConstant('JOB_SUBMITTED')
-JOHNSON_COOK = SymbolicConstant('JOHNSON_COOK')
-JOIN = SymbolicConstant('JOIN')
-JOINT2D = SymbolicConstant('JOINT2D')
-JOINT3D = SymbolicConstant('JOINT3D')
-JOINTC = SymbolicConstant('JOINTC')
-JUSTIFY_LEFT = SymbolicConstant('JUSTIFY_LEFT')
-JWL = SymbolicConstant('JWL')
-J_INTEGRAL = SymbolicConstant('J_INTEGRAL')
-KEPS_RNG = SymbolicConstant('KEPS_RNG')
-KII0 = SymbolicConstant('KII0')
-KINEMATIC = SymbolicConstant('KINEMATIC')
-KINEMATIC_COUPLING = SymbolicConstant('KINEMATIC_COUPLING')
-KINEMATIC_HARDENING = SymbolicConstant('KINEMATIC_HARDENING')
-KINEMATIC_VIOLATIONS = SymbolicConstant('KINEMATIC_VIOLATIONS')
-KINETIC_ENERGY_XPL = SymbolicConstant('KINETIC_ENERGY_XPL')
-K_FACTORS = SymbolicConstant('K_FACTORS')
-LAGRANGE = SymbolicConstant('LAGRANGE')
-LAGRANGIAN = SymbolicConstant('LAGRANGIAN')
-LAG_ANALYSIS = SymbolicConstant('LAG_ANALYSIS')
-LAMINA = SymbolicConstant('LAMINA')
-LANCZOS = SymbolicConstant('LANCZOS')
-LANCZOS_EIGENSOLVER = SymbolicConstant('LANCZOS_EIGENSOLVER')
-LANDSCAPE = SymbolicConstant('LANDSCAPE')
-LARGE = SymbolicConstant('LARGE')
-LARGE_ANGLE = SymbolicConstant('LARGE_ANGLE')
-LARGE_ANGLE_QUAD_FACE = SymbolicConstant('LARGE_ANGLE_QUAD_FACE')
-LARGE_ANGLE_TRI_FACE = SymbolicConstant('LARGE_ANGLE_TRI_FACE')
-LARGE_STRAIN_INCREMENT = SymbolicConstant('LARGE_STRAIN_INCREMENT')
-LAST = SymbolicConstant('LAST')
-LAST_FRAME = SymbolicConstant('LAST_FRAME')
-LAST_INCREMENT = SymbolicConstant('LAST_INCREMENT')
-LAST_STEP = SymbolicConstant('LAST_STEP')
-LATERAL_EXTENSION_RATIO_NOT_FOUND = SymbolicConstant('LATERAL_EXTENSION_RATIO_NOT_FOUND')
-LATERAL_NOMINAL_STRAIN = SymbolicConstant('LATERAL_NOMINAL_STRAIN')
-LAYUP = SymbolicConstant('LAYUP')
-LAYUP_MAP = SymbolicConstant('LAYUP_MAP')
-LAYUP_MAP_COLORS = SymbolicConstant('LAYUP_MAP_COLORS')
-LAYUP_ORIENTATION = SymbolicConstant('LAYUP_ORIENTATION')
-LEAD_ANALYSIS = SymbolicConstant('LEAD_ANALYSIS')
-LEAF_COLORS = SymbolicConstant('LEAF_COLORS')
-LEDGER = SymbolicConstant('LEDGER')
-LEFT = SymbolicConstant('LEFT')
-LEGAL = SymbolicConstant('LEGAL')
-LENGTH = SymbolicConstant('LENGTH')
-LESS_THAN = SymbolicConstant('LESS_THAN')
-LESS_THAN_EQUAL = SymbolicConstant('LESS_THAN_EQUAL')
-LETTER = SymbolicConstant('LETTER')
-LETTERS = SymbolicConstant('LETTERS')
-LICENSING = SymbolicConstant('LICENSING')
-LIFT_EQUATION = SymbolicConstant('LIFT_EQUATION')
-LINE = SymbolicConstant('LINE')
-LINE2 = SymbolicConstant('LINE2')
-LINE3 = SymbolicConstant('LINE3')
-LINEAR = SymbolicConstant('LINEAR')
-LINEAR_EXTRAPOLATION = SymbolicConstant('LINEAR_EXTRAPOLATION')
-LINEAR_LEAST_SQUARES = SymbolicConstant('LINEAR_LEAST_SQUARES')
-LINEAR_PRESSURE = SymbolicConstant('LINEAR_PRESSURE')
-LINELINEDIST = SymbolicConstant('LINELINEDIST')
-LINES = SymbolicConstant('LINES')
-LINE_LOOP = SymbolicConstant('LINE_LOOP')
-LINE_SEARCH = SymbolicConstant('LINE_SEARCH')
-LINE_STRIP = SymbolicConstant('LINE_STRIP')
-LINK = SymbolicConstant('LINK')
-LINK_MPC = SymbolicConstant('LINK_MPC')
-LINUX = SymbolicConstant('LINUX')
-LIST_OF_MODES = SymbolicConstant('LIST_OF_MODES')
-LOAD = SymbolicConstant('LOAD')
-LOAD_CASE = SymbolicConstant('LOAD_CASE')
-LOAD_MAP = SymbolicConstant('LOAD_MAP')
-LOAD_MAP_COLORS = SymbolicConstant('LOAD_MAP_COLORS')
-LOCAL = SymbolicConstant('LOCAL')
-LOCAL_GRADIENT = SymbolicConstant('LOCAL_GRADIENT')
-LOCKSTEP = SymbolicConstant('LOCKSTEP')
-LOG = SymbolicConstant('LOG')
-LOGARITHMIC = SymbolicConstant('LOGARITHMIC')
-LONG = SymbolicConstant('LONG')
-LONGEST_EDGE = SymbolicConstant('LONGEST_EDGE')
-LONG_TERM = SymbolicConstant('LONG_TERM')
-LOOP = SymbolicConstant('LOOP')
-LOOP_BACKWARD = SymbolicConstant('LOOP_BACKWARD')
-LOOSE_COUPLING = SymbolicConstant('LOOSE_COUPLING')
-LOW = SymbolicConstant('LOW')
-LS3S = SymbolicConstant('LS3S')
-LS6 = SymbolicConstant('LS6')
-LUMIN = SymbolicConstant('LUMIN')
-M3D3 = SymbolicConstant('M3D3')
-M3D4 = SymbolicConstant('M3D4')
-M3D4R = SymbolicConstant('M3D4R')
-M3D6 = SymbolicConstant('M3D6')
-M3D8 = SymbolicConstant('M3D8')
-M3D8R = SymbolicConstant('M3D8R')
-MACAULEY = SymbolicConstant('MACAULEY')
-MAGNITUDE = SymbolicConstant('MAGNITUDE')
-MAGNITUDE_AND_PHASE = SymbolicConstant('MAGNITUDE_AND_PHASE')
-MAINTAIN_CURRENT = SymbolicConstant('MAINTAIN_CURRENT')
-MAIN_REGION = SymbolicConstant('MAIN_REGION')
-MANUAL = SymbolicConstant('MANUAL')
-MAP = SymbolicConstant('MAP')
-MARLOW = SymbolicConstant('MARLOW')
-MASS = SymbolicConstant('MASS')
-MASS_DIFFUSION = SymbolicConstant('MASS_DIFFUSION')
-MASS_FLOW_AREA = SymbolicConstant('MASS_FLOW_AREA')
-MASS_FLOW_AREA_RATE = SymbolicConstant('MASS_FLOW_AREA_RATE')
-MASS_FLOW_RATE = SymbolicConstant('MASS_FLOW_RATE')
-MASS_FLUX = SymbolicConstant('MASS_FLUX')
-MASS_PER_AREA = SymbolicConstant('MASS_PER_AREA')
-MASS_PER_LENGTH = SymbolicConstant('MASS_PER_LENGTH')
-MASS_PER_VOLUME = SymbolicConstant('MASS_PER_VOLUME')
-MASS_PROPORTIONAL = SymbolicConstant('MASS_PROPORTIONAL')
-MASS_RATE_LEAK = SymbolicConstant('MASS_RATE_LEAK')
-MASS_SCALING = SymbolicConstant('MASS_SCALING')
-MASTER = SymbolicConstant('MASTER')
-MATCH = SymbolicConstant('MATCH')
-MATERIAL = SymbolicConstant('MATERIAL')
-MATERIAL_FLOW_FIELD = SymbolicConstant('MATERIAL_FLOW_FIELD')
-MATERIAL_INSTABILITY = SymbolicConstant('MATERIAL_INSTABILITY')
-MATERIAL_MAP = SymbolicConstant('MATERIAL_MAP')
-MATERIAL_MAP_COLORS = SymbolicConstant('MATERIAL_MAP_COLORS')
-MATERIAL_POINT_CALCULATIONS = SymbolicConstant('MATERIAL_POINT_CALCULATIONS')
-MATRIX = SymbolicConstant('MATRIX')
-MAX = SymbolicConstant('MAX')
-MAX1 = SymbolicConstant('MAX1')
-MAX2 = SymbolicConstant('MAX2')
-MAXIMIZE = SymbolicConstant('MAXIMIZE')
-MAXIMIZED = SymbolicConstant('MAXIMIZED')
-MAXIMUM = SymbolicConstant('MAXIMUM')
-MAXIMUM_NUMBER_OF_CONTACT_STRESS_AUGMENTATIONS = SymbolicConstant('MAXIMUM_NUMBER_OF_CONTACT_STRESS_AUGMENTATIONS')
-MAXIMUM_NUMBER_OF_EQUILIBRIUM_ITERATIONS = SymbolicConstant('MAXIMUM_NUMBER_OF_EQUILIBRIUM_ITERATIONS')
-MAXIMUM_NUMBER_OF_SEVERE_DISCONTINUITY_ITERATIONS = SymbolicConstant(
-    'MAXIMUM_NUMBER_OF_SEVERE_DISCONTINUITY_ITERATIONS')
-MAXIMUM_SLIDE_DISTANCE_EXCEEDED = SymbolicConstant('MAXIMUM_SLIDE_DISTANCE_EXCEEDED')
-MAX_ABS_VALUE = SymbolicConstant('MAX_ABS_VALUE')
-MAX_CORRECTION = SymbolicConstant('MAX_CORRECTION')
-MAX_EDGE = SymbolicConstant('MAX_EDGE')
-MAX_ERROR = SymbolicConstant('MAX_ERROR')
-MAX_ELASTOPLASTIC_STRAIN = SymbolicConstant('MAX_ELASTOPLASTIC_STRAIN')
-MAX_FREQUENCY = SymbolicConstant('MAX_FREQUENCY')
-MAX_INCREMENT = SymbolicConstant('MAX_INCREMENT')
-MAX_INPLANE_PRINCIPAL = SymbolicConstant('MAX_INPLANE_PRINCIPAL')
-MAX_PRINCIPAL = SymbolicConstant('MAX_PRINCIPAL')
-MAX_RESIDUAL = SymbolicConstant('MAX_RESIDUAL')
-MAX_SEPARATION = SymbolicConstant('MAX_SEPARATION')
-MAX_SHEAR_STRAIN = SymbolicConstant('MAX_SHEAR_STRAIN')
-MAX_STEP_SIZE = SymbolicConstant('MAX_STEP_SIZE')
-MAX_STRESS = SymbolicConstant('MAX_STRESS')
-MAX_VALUE = SymbolicConstant('MAX_VALUE')
-MCL6 = SymbolicConstant('MCL6')
-MCL9 = SymbolicConstant('MCL9')
-MECHANICAL = SymbolicConstant('MECHANICAL')
-MECHANICAL_CONTACT = SymbolicConstant('MECHANICAL_CONTACT')
-MEDIAL_AXIS = SymbolicConstant('MEDIAL_AXIS')
-MEDIUM = SymbolicConstant('MEDIUM')
-MEGA_BYTES = SymbolicConstant('MEGA_BYTES')
-MEMBRANE = SymbolicConstant('MEMBRANE')
-MEMORY = SymbolicConstant('MEMORY')
-MEMORY_ESTIMATE = SymbolicConstant('MEMORY_ESTIMATE')
-MERGE = SymbolicConstant('MERGE')
-MERR = SymbolicConstant('MERR')
-MESH = SymbolicConstant('MESH')
-MESHED_BEAM_SECTION = SymbolicConstant('MESHED_BEAM_SECTION')
-MESH_MAP = SymbolicConstant('MESH_MAP')
-MESH_MAP_COLORS = SymbolicConstant('MESH_MAP_COLORS')
-MESH_TIE = SymbolicConstant('MESH_TIE')
-MGAX1 = SymbolicConstant('MGAX1')
-MGAX2 = SymbolicConstant('MGAX2')
-MIDDLE = SymbolicConstant('MIDDLE')
-MIDDLE_SURFACE = SymbolicConstant('MIDDLE_SURFACE')
-MIDSIDE_ONLY = SymbolicConstant('MIDSIDE_ONLY')
-MID_PRINCIPAL = SymbolicConstant('MID_PRINCIPAL')
-MILLING_REGION = SymbolicConstant('MILLING_REGION')
-MIN = SymbolicConstant('MIN')
-MINIMIZE = SymbolicConstant('MINIMIZE')
-MINIMIZED = SymbolicConstant('MINIMIZED')
-MINIMIZE_MAXIMUM = SymbolicConstant('MINIMIZE_MAXIMUM')
-MINIMUM = SymbolicConstant('MINIMUM')
-MINIMUM_MAXIMUM = SymbolicConstant('MINIMUM_MAXIMUM')
-MINIMUM_MOVE = SymbolicConstant('MINIMUM_MOVE')
-MIN_EDGE = SymbolicConstant('MIN_EDGE')
-MIN_INPLANE_PRINCIPAL = SymbolicConstant('MIN_INPLANE_PRINCIPAL')
-MIN_MAX_EDGE = SymbolicConstant('MIN_MAX_EDGE')
-MIN_MAX_LABEL = SymbolicConstant('MIN_MAX_LABEL')
-MIN_PRINCIPAL = SymbolicConstant('MIN_PRINCIPAL')
-MIN_PRINCIPAL_STRAIN = SymbolicConstant('MIN_PRINCIPAL_STRAIN')
-MIN_SIZE_FACTOR = SymbolicConstant('MIN_SIZE_FACTOR')
-MIN_STEP_SIZE = SymbolicConstant('MIN_STEP_SIZE')
-MIN_TRANSITION = SymbolicConstant('MIN_TRANSITION')
-MIN_VALUE = SymbolicConstant('MIN_VALUE')
-MIRROR = SymbolicConstant('MIRROR')
-MIRROR_CIRC_RECT = SymbolicConstant('MIRROR_CIRC_RECT')
-MIRROR_RECT_CIRC = SymbolicConstant('MIRROR_RECT_CIRC')
-MISES = SymbolicConstant('MISES')
-MIXED = SymbolicConstant('MIXED')
-MM = SymbolicConstant('MM')
-MODAL = SymbolicConstant('MODAL')
-MODAL_ALL = SymbolicConstant('MODAL_ALL')
-MODAL_DYNAMICS = SymbolicConstant('MODAL_DYNAMICS')
-MODEL = SymbolicConstant('MODEL')
-MODEL_CHANGE = SymbolicConstant('MODEL_CHANGE')
-MODEL_SIZE = SymbolicConstant('MODEL_SIZE')
-MODERATE = SymbolicConstant('MODERATE')
-MODERATE_DISSIPATION = SymbolicConstant('MODERATE_DISSIPATION')
-MODES = SymbolicConstant('MODES')
-MODE_BASED_DYNAMIC = SymbolicConstant('MODE_BASED_DYNAMIC')
-MODE_BASED_STEADY_STATE_DYNAMIC = SymbolicConstant('MODE_BASED_STEADY_STATE_DYNAMIC')
-MODE_INDEPENDENT = SymbolicConstant('MODE_INDEPENDENT')
-MODE_NUMBER = SymbolicConstant('MODE_NUMBER')
-MODE_RANGE = SymbolicConstant('MODE_RANGE')
-MODIFIED = SymbolicConstant('MODIFIED')
-MODIFIED_FROM_BASE_STATE = SymbolicConstant('MODIFIED_FROM_BASE_STATE')
-MOMENT = SymbolicConstant('MOMENT')
-MONITOR_DATA = SymbolicConstant('MONITOR_DATA')
-MOONEY_RIVLIN = SymbolicConstant('MOONEY_RIVLIN')
-MOTION = SymbolicConstant('MOTION')
-MOTION_TYPE = SymbolicConstant('MOTION_TYPE')
-MOVEMENT = SymbolicConstant('MOVEMENT')
-MOVING_NOISE = SymbolicConstant('MOVING_NOISE')
-MPC = SymbolicConstant('MPC')
-MPI = SymbolicConstant('MPI')
-MSBO = SymbolicConstant('MSBO')
-MSFLD = SymbolicConstant('MSFLD')
-MSPEI_XPL = SymbolicConstant('MSPEI_XPL')
-MT = SymbolicConstant('MT')
-MTS = SymbolicConstant('MTS')
-MULTIPLE_DIRECTION_ABSOLUTE_SUM = SymbolicConstant('MULTIPLE_DIRECTION_ABSOLUTE_SUM')
-MULTIPLE_DIRECTION_FORTY_PERCENT_RULE = SymbolicConstant('MULTIPLE_DIRECTION_FORTY_PERCENT_RULE')
-MULTIPLE_DIRECTION_SRSS_SUM = SymbolicConstant('MULTIPLE_DIRECTION_SRSS_SUM')
-MULTIPLE_DIRECTION_THIRTY_PERCENT_RULE = SymbolicConstant('MULTIPLE_DIRECTION_THIRTY_PERCENT_RULE')
-MULTIPLE_SURFACE = SymbolicConstant('MULTIPLE_SURFACE')
-MULTIPLICATIVE = SymbolicConstant('MULTIPLICATIVE')
-MULTIPLY = SymbolicConstant('MULTIPLY')
-N1 = SymbolicConstant('N1')
-N1_COSINES = SymbolicConstant('N1_COSINES')
-N2 = SymbolicConstant('N2')
-NATURAL_FREQUENCY_EXTRACTION = SymbolicConstant('NATURAL_FREQUENCY_EXTRACTION')
-NATURAL_LOG = SymbolicConstant('NATURAL_LOG')
-NEAREST_INTEGER = SymbolicConstant('NEAREST_INTEGER')
-NEGATE = SymbolicConstant('NEGATE')
-NEGATIVE = SymbolicConstant('NEGATIVE')
-NEO_HOOKE = SymbolicConstant('NEO_HOOKE')
-NEVER = SymbolicConstant('NEVER')
-NEWTONIAN = SymbolicConstant('NEWTONIAN')
-NEW_CONTACT_PATCH = SymbolicConstant('NEW_CONTACT_PATCH')
-NMORI = SymbolicConstant('NMORI')
-NO = SymbolicConstant('NO')
-NODAL = SymbolicConstant('NODAL')
-NODAL_ANALYTICAL_FIELD = SymbolicConstant('NODAL_ANALYTICAL_FIELD')
-NODAL_AVERAGE = SymbolicConstant('NODAL_AVERAGE')
-NODAL_DISCRETE_FIELD = SymbolicConstant('NODAL_DISCRETE_FIELD')
-NODAL_LINE = SymbolicConstant('NODAL_LINE')
-NODE = SymbolicConstant('NODE')
-NODES = SymbolicConstant('NODES')
-NODE_ALL = SymbolicConstant('NODE_ALL')
-NODE_CENTERED = SymbolicConstant('NODE_CENTERED')
-NODE_LIST = SymbolicConstant('NODE_LIST')
-NODE_MODE = SymbolicConstant('NODE_MODE')
-NODE_MODE_MPC = SymbolicConstant('NODE_MODE_MPC')
-NODE_PRESELECT = SymbolicConstant('NODE_PRESELECT')
-NODE_TO_SURFACE = SymbolicConstant('NODE_TO_SURFACE')
-NONACCUMULATEDENERGY = SymbolicConstant('NONACCUMULATEDENERGY')
-NONE = SymbolicConstant('NONE')
-NONLINEAR = SymbolicConstant('NONLINEAR')
-NONREFLECTING = SymbolicConstant('NONREFLECTING')
-NONUNIFORM = SymbolicConstant('NONUNIFORM')
-NON_DEFAULT = SymbolicConstant('NON_DEFAULT')
-NON_REFLECTING = SymbolicConstant('NON_REFLECTING')
-NORM = SymbolicConstant('NORM')
-NORMAL = SymbolicConstant('NORMAL')
-NORMALIZED_CONCENTRATION_FIELD = SymbolicConstant('NORMALIZED_CONCENTRATION_FIELD')
-NORMALS = SymbolicConstant('NORMALS')
-NORMAL_ANNOTATED = SymbolicConstant('NORMAL_ANNOTATED')
-NORMAL_TANGENTIAL = SymbolicConstant('NORMAL_TANGENTIAL')
-NORMAL_VECTOR = SymbolicConstant('NORMAL_VECTOR')
-NORM_DISTANCE = SymbolicConstant('NORM_DISTANCE')
-NORM_FIRST = SymbolicConstant('NORM_FIRST')
-NOT_ALLOWED = SymbolicConstant('NOT_ALLOWED')
-NOT_APPLICABLE = SymbolicConstant('NOT_APPLICABLE')
-NOT_SET = SymbolicConstant('NOT_SET')
-NOT_YET_ACTIVE = SymbolicConstant('NOT_YET_ACTIVE')
-NO_BLOCKING = SymbolicConstant('NO_BLOCKING')
-NO_EXTRAPOLATION = SymbolicConstant('NO_EXTRAPOLATION')
-NO_HEAD = SymbolicConstant('NO_HEAD')
-NO_IDEALIZATION = SymbolicConstant('NO_IDEALIZATION')
-NO_INDEPENDENT_COMPONENTS = SymbolicConstant('NO_INDEPENDENT_COMPONENTS')
-NO_INITIAL_INTERSECTION = SymbolicConstant('NO_INITIAL_INTERSECTION')
-NO_LIMIT = SymbolicConstant('NO_LIMIT')
-NO_LINE = SymbolicConstant('NO_LINE')
-NO_LONGER_ACTIVE = SymbolicConstant('NO_LONGER_ACTIVE')
-NO_OUTPUT = SymbolicConstant('NO_OUTPUT')
-NO_OUTPUT_VARIABLES = SymbolicConstant('NO_OUTPUT_VARIABLES')
-NO_REFINEMENT = SymbolicConstant('NO_REFINEMENT')
-NO_SIMPLIFICATION = SymbolicConstant('NO_SIMPLIFICATION')
-NO_SLIP = SymbolicConstant('NO_SLIP')
-NRL = SymbolicConstant('NRL')
-NSET_MAP = SymbolicConstant('NSET_MAP')
-NT = SymbolicConstant('NT')
-NTH_POWER = SymbolicConstant('NTH_POWER')
-NTH_ROOT = SymbolicConstant('NTH_ROOT')
-NUMBER = SymbolicConstant('NUMBER')
-NUMBERS = SymbolicConstant('NUMBERS')
-NUMBER_INTERVALS = SymbolicConstant('NUMBER_INTERVALS')
-NUMBER_OF_LAYERS = SymbolicConstant('NUMBER_OF_LAYERS')
-NUMBER_OF_VALUES = SymbolicConstant('NUMBER_OF_VALUES')
-NUMERICAL_PROBLEM = SymbolicConstant('NUMERICAL_PROBLEM')
-NUM_ATTEMPTS = SymbolicConstant('NUM_ATTEMPTS')
-NUM_DATA_TYPE = SymbolicConstant('NUM_DATA_TYPE')
-NUM_ELEMENTS_EXCEEDING = SymbolicConstant('NUM_ELEMENTS_EXCEEDING')
-NUM_EQI = SymbolicConstant('NUM_EQI')
-NUM_ITERS = SymbolicConstant('NUM_ITERS')
-NUM_PTS_ALONG_DIR = SymbolicConstant('NUM_PTS_ALONG_DIR')
-NUM_PTS_BETWEEN_PTS = SymbolicConstant('NUM_PTS_BETWEEN_PTS')
-NUM_SDI = SymbolicConstant('NUM_SDI')
-OBLIQUE_DOWN = SymbolicConstant('OBLIQUE_DOWN')
-OBLIQUE_UP = SymbolicConstant('OBLIQUE_UP')
-ODB = SymbolicConstant('ODB')
-ODB_FILE = SymbolicConstant('ODB_FILE')
-ODB_FRAME = SymbolicConstant('ODB_FRAME')
-ODB_REGIONS = SymbolicConstant('ODB_REGIONS')
-ODB_VALUES = SymbolicConstant('ODB_VALUES')
-OFFSET_FIELD = SymbolicConstant('OFFSET_FIELD')
-OGDEN = SymbolicConstant('OGDEN')
-OGDEN_N1 = SymbolicConstant('OGDEN_N1')
-OGDEN_N2 = SymbolicConstant('OGDEN_N2')
-OGDEN_N3 = SymbolicConstant('OGDEN_N3')
-OGDEN_N4 = SymbolicConstant('OGDEN_N4')
-OGDEN_N5 = SymbolicConstant('OGDEN_N5')
-OGDEN_N6 = SymbolicConstant('OGDEN_N6')
-OMIT = SymbolicConstant('OMIT')
-ONE_CONFIG = SymbolicConstant('ONE_CONFIG')
-ONLY = SymbolicConstant('ONLY')
-OPENINGS = SymbolicConstant('OPENINGS')
-OPEN_GL = SymbolicConstant('OPEN_GL')
-OPTIMIZATION_DISPLACEMENT = SymbolicConstant('OPTIMIZATION_DISPLACEMENT')
-OPT_DATASAVE_EVERY_CYCLE = SymbolicConstant('OPT_DATASAVE_EVERY_CYCLE')
-OPT_DATASAVE_FIRST_AND_LAST_CYCLE = SymbolicConstant('OPT_DATASAVE_FIRST_AND_LAST_CYCLE')
-OPT_DATASAVE_SPECIFY_CYCLE = SymbolicConstant('OPT_DATASAVE_SPECIFY_CYCLE')
-OPT_EXTRACT_SMOOTH_ABAQUS_INPUT_FILE = SymbolicConstant('OPT_EXTRACT_SMOOTH_ABAQUS_INPUT_FILE')
-OPT_EXTRACT_SMOOTH_NONE = SymbolicConstant('OPT_EXTRACT_SMOOTH_NONE')
-OPT_EXTRACT_SMOOTH_STL = SymbolicConstant('OPT_EXTRACT_SMOOTH_STL')
-ORDINATE = SymbolicConstant('ORDINATE')
-ORIENTATION = SymbolicConstant('ORIENTATION')
-ORIENT_FIELD = SymbolicConstant('ORIENT_FIELD')
-ORIENT_ON_DEF = SymbolicConstant('ORIENT_ON_DEF')
-ORIENT_ON_UNDEF = SymbolicConstant('ORIENT_ON_UNDEF')
-ORIGINAL = SymbolicConstant('ORIGINAL')
-ORIGINAL_MODEL = SymbolicConstant('ORIGINAL_MODEL')
-ORIGIN_AXIS = SymbolicConstant('ORIGIN_AXIS')
-ORTHOGONAL = SymbolicConstant('ORTHOGONAL')
-ORTHOTROPIC = SymbolicConstant('ORTHOTROPIC')
-OTHER = SymbolicConstant('OTHER')
-OTHER_BC = SymbolicConstant('OTHER_BC')
-OUTFLOW = SymbolicConstant('OUTFLOW')
-OUTOFPLANE_PRINCIPAL = SymbolicConstant('OUTOFPLANE_PRINCIPAL')
-OUTPUT = SymbolicConstant('OUTPUT')
-OUTSIDE = SymbolicConstant('OUTSIDE')
-OUTWARD = SymbolicConstant('OUTWARD')
-OUT_OF_PLANE_EXTENSION_RATIO_NOT_FOUND = SymbolicConstant('OUT_OF_PLANE_EXTENSION_RATIO_NOT_FOUND')
-OVERCLOSED = SymbolicConstant('OVERCLOSED')
-OVERCLOSURES = SymbolicConstant('OVERCLOSURES')
-OVERCONSTRAINT = SymbolicConstant('OVERCONSTRAINT')
-OVERHANG_REGION = SymbolicConstant('OVERHANG_REGION')
-OVERLAY = SymbolicConstant('OVERLAY')
-OVERWRITE = SymbolicConstant('OVERWRITE')
-PACKAGER_PHASE = SymbolicConstant('PACKAGER_PHASE')
-PARABOLA = SymbolicConstant('PARABOLA')
-PARABOLIC = SymbolicConstant('PARABOLIC')
-PARABOLIC_EXTRAPOLATION = SymbolicConstant('PARABOLIC_EXTRAPOLATION')
-PARALLEL = SymbolicConstant('PARALLEL')
-PARAMETERS = SymbolicConstant('PARAMETERS')
-PARAMETRIC_DATA = SymbolicConstant('PARAMETRIC_DATA')
-PART = SymbolicConstant('PART')
-PARTIAL_BLOCKING = SymbolicConstant('PARTIAL_BLOCKING')
-PARTIAL_FIELD = SymbolicConstant('PARTIAL_FIELD')
-PART_ASSEMBLY = SymbolicConstant('PART_ASSEMBLY')
-PART_GEOM_MAP = SymbolicConstant('PART_GEOM_MAP')
-PART_GEOM_MAP_COLORS = SymbolicConstant('PART_GEOM_MAP_COLORS')
-PART_MAP = SymbolicConstant('PART_MAP')
-PART_MAP_COLORS = SymbolicConstant('PART_MAP_COLORS')
-PATH = SymbolicConstant('PATH')
-PATH_POINTS = SymbolicConstant('PATH_POINTS')
-PATH_X = SymbolicConstant('PATH_X')
-PATH_Y = SymbolicConstant('PATH_Y')
-PATH_Z = SymbolicConstant('PATH_Z')
-PATTERN_ALONG_DIRECTION = SymbolicConstant('PATTERN_ALONG_DIRECTION')
-PATTERN_INVALID = SymbolicConstant('PATTERN_INVALID')
-PATTERN_ORTHOGONALLY = SymbolicConstant('PATTERN_ORTHOGONALLY')
-PENALTY = SymbolicConstant('PENALTY')
-PENETRATION_TOLERANCE_EXCEEDED = SymbolicConstant('PENETRATION_TOLERANCE_EXCEEDED')
-PERCENTAGE = SymbolicConstant('PERCENTAGE')
-PERIMETER = SymbolicConstant('PERIMETER')
-PERIOD = SymbolicConstant('PERIOD')
-PERP = SymbolicConstant('PERP')
-PERPENDICULAR = SymbolicConstant('PERPENDICULAR')
-PERSPECTIVE = SymbolicConstant('PERSPECTIVE')
-PERTURBATION_AND_BUCKLING = SymbolicConstant('PERTURBATION_AND_BUCKLING')
-PHASE = SymbolicConstant('PHASE')
-PHONG = SymbolicConstant('PHONG')
-PICKED = SymbolicConstant('PICKED')
-PICKEDPOINTS = SymbolicConstant('PICKEDPOINTS')
-PIEZOELECTRIC = SymbolicConstant('PIEZOELECTRIC')
-PIEZO_ELECTRICAL_POTENTIAL_FIELD = SymbolicConstant('PIEZO_ELECTRICAL_POTENTIAL_FIELD')
-PINNED = SymbolicConstant('PINNED')
-PIN_MPC = SymbolicConstant('PIN_MPC')
-PIPE21 = SymbolicConstant('PIPE21')
-PIPE21H = SymbolicConstant('PIPE21H')
-PIPE22 = SymbolicConstant('PIPE22')
-PIPE22H = SymbolicConstant('PIPE22H')
-PIPE31 = SymbolicConstant('PIPE31')
-PIPE31H = SymbolicConstant('PIPE31H')
-PIPE32 = SymbolicConstant('PIPE32')
-PIPE32H = SymbolicConstant('PIPE32H')
-PLANAR = SymbolicConstant('PLANAR')
-PLANE = SymbolicConstant('PLANE')
-PLANE12 = SymbolicConstant('PLANE12')
-PLANE13 = SymbolicConstant('PLANE13')
-PLANE21 = SymbolicConstant('PLANE21')
-PLANE23 = SymbolicConstant('PLANE23')
-PLANE31 = SymbolicConstant('PLANE31')
-PLANE32 = SymbolicConstant('PLANE32')
-PLASTIC_MOTION = SymbolicConstant('PLASTIC_MOTION')
-PLAY = SymbolicConstant('PLAY')
-PLAY_ONCE = SymbolicConstant('PLAY_ONCE')
-PLOT_MAP = SymbolicConstant('PLOT_MAP')
-PLOT_MAP_COLORS = SymbolicConstant('PLOT_MAP_COLORS')
-PLOT_OPTIONS = SymbolicConstant('PLOT_OPTIONS')
-PLOT_STATE = SymbolicConstant('PLOT_STATE')
-PLY = SymbolicConstant('PLY')
-PLY_BASED = SymbolicConstant('PLY_BASED')
-PLY_MAP = SymbolicConstant('PLY_MAP')
-PLY_MAP_COLORS = SymbolicConstant('PLY_MAP_COLORS')
-PNEUMATIC = SymbolicConstant('PNEUMATIC')
-PNG = SymbolicConstant('PNG')
-POINT = SymbolicConstant('POINT')
-POINTLINEDIST = SymbolicConstant('POINTLINEDIST')
-POINTPOINTDIST = SymbolicConstant('POINTPOINTDIST')
-POINTS = SymbolicConstant('POINTS')
-POINTS_NOW_SLIPPING = SymbolicConstant('POINTS_NOW_SLIPPING')
-POINTS_NOW_STICKING = SymbolicConstant('POINTS_NOW_STICKING')
-POINTS_THROUGH_SECTION = SymbolicConstant('POINTS_THROUGH_SECTION')
-POINTWISE = SymbolicConstant('POINTWISE')
-POINT_ARC = SymbolicConstant('POINT_ARC')
-POINT_LIST = SymbolicConstant('POINT_LIST')
-POISSON = SymbolicConstant('POISSON')
-POISSON_RATIO = SymbolicConstant('POISSON_RATIO')
-POLAR = SymbolicConstant('POLAR')
-POLYNOMIAL = SymbolicConstant('POLYNOMIAL')
-POLY_N1 = SymbolicConstant('POLY_N1')
-POLY_N2 = SymbolicConstant('POLY_N2')
-POLY_N3 = SymbolicConstant('POLY_N3')
-POLY_N4 = SymbolicConstant('POLY_N4')
-POLY_N5 = SymbolicConstant('POLY_N5')
-POLY_N6 = SymbolicConstant('POLY_N6')
-PORE_FLUID_CONTACT = SymbolicConstant('PORE_FLUID_CONTACT')
-PORE_FLUID_DIFFUSION = SymbolicConstant('PORE_FLUID_DIFFUSION')
-PORE_LIQUID_PRESSURE_FIELD = SymbolicConstant('PORE_LIQUID_PRESSURE_FIELD')
-PORTRAIT = SymbolicConstant('PORTRAIT')
-POSITION = SymbolicConstant('POSITION')
-POSITIONS = SymbolicConstant('POSITIONS')
-POSITIVE = SymbolicConstant('POSITIVE')
-POWER = SymbolicConstant('POWER')
-POWER_LAW = SymbolicConstant('POWER_LAW')
-PREDEFINED = SymbolicConstant('PREDEFINED')
-PREDEFINED_FIELD = SymbolicConstant('PREDEFINED_FIELD')
-PREDEFINED_PATH = SymbolicConstant('PREDEFINED_PATH')
-PRESCRIBEDCONDITION_DOF = SymbolicConstant('PRESCRIBEDCONDITION_DOF')
-PRESELECT = SymbolicConstant('PRESELECT')
-PRESERVE_SECTION = SymbolicConstant('PRESERVE_SECTION')
-PRESS = SymbolicConstant('PRESS')
-PRESSURE = SymbolicConstant('PRESSURE')
-PRESSURE_GRADIENT = SymbolicConstant('PRESSURE_GRADIENT')
-PRESSURE_PENETRATION = SymbolicConstant('PRESSURE_PENETRATION')
-PRESSURE_STRESS_CONSTRAINT = SymbolicConstant('PRESSURE_STRESS_CONSTRAINT')
-PREVIOUS = SymbolicConstant('PREVIOUS')
-PREVIOUS_STEP = SymbolicConstant('PREVIOUS_STEP')
-PRIMARY_VECTOR = SymbolicConstant('PRIMARY_VECTOR')
-PRINCIPAL = SymbolicConstant('PRINCIPAL')
-PRINCIPAL_COMPONENT = SymbolicConstant('PRINCIPAL_COMPONENT')
-PRINTER = SymbolicConstant('PRINTER')
-PROJECTION_CARTESIAN = SymbolicConstant('PROJECTION_CARTESIAN')
-PROJECTION_FLEXION_TORSION = SymbolicConstant('PROJECTION_FLEXION_TORSION')
-PROJECT_BY_DIRECTION = SymbolicConstant('PROJECT_BY_DIRECTION')
-PROJECT_BY_DISTANCE = SymbolicConstant('PROJECT_BY_DISTANCE')
-PROJECT_BY_NUMBER = SymbolicConstant('PROJECT_BY_NUMBER')
-PROJECT_BY_PROXIMITY = SymbolicConstant('PROJECT_BY_PROXIMITY')
-PROLATE = SymbolicConstant('PROLATE')
-PRONY = SymbolicConstant('PRONY')
-PROPAGATED = SymbolicConstant('PROPAGATED')
-PROPAGATED_FROM_BASE_STATE = SymbolicConstant('PROPAGATED_FROM_BASE_STATE')
-PROPAGATED_FROM_COMPUTED = SymbolicConstant('PROPAGATED_FROM_COMPUTED')
-PROPAGATED_FROM_FREQUENCY = SymbolicConstant('PROPAGATED_FROM_FREQUENCY')
-PROPERTY_CHANGE = SymbolicConstant('PROPERTY_CHANGE')
-PROPERTY_MAP = SymbolicConstant('PROPERTY_MAP')
-PROPERTY_MAP_COLORS = SymbolicConstant('PROPERTY_MAP_COLORS')
-PROPERTY_REF = SymbolicConstant('PROPERTY_REF')
-PS = SymbolicConstant('PS')
-PSI24 = SymbolicConstant('PSI24')
-PSI26 = SymbolicConstant('PSI26')
-PSI34 = SymbolicConstant('PSI34')
-PSI36 = SymbolicConstant('PSI36')
-PS_ALWAYS = SymbolicConstant('PS_ALWAYS')
-PS_IF_AVAILABLE = SymbolicConstant('PS_IF_AVAILABLE')
-PYR5 = SymbolicConstant('PYR5')
-Q3D10M = SymbolicConstant('Q3D10M')
-Q3D10MH = SymbolicConstant('Q3D10MH')
-Q3D20 = SymbolicConstant('Q3D20')
-Q3D20H = SymbolicConstant('Q3D20H')
-Q3D20R = SymbolicConstant('Q3D20R')
-Q3D20RH = SymbolicConstant('Q3D20RH')
-Q3D4 = SymbolicConstant('Q3D4')
-Q3D6 = SymbolicConstant('Q3D6')
-Q3D8 = SymbolicConstant('Q3D8')
-Q3D8H = SymbolicConstant('Q3D8H')
-Q3D8R = SymbolicConstant('Q3D8R')
-Q3D8RH = SymbolicConstant('Q3D8RH')
-QUAD = SymbolicConstant('QUAD')
-QUAD4 = SymbolicConstant('QUAD4')
-QUAD8 = SymbolicConstant('QUAD8')
-QUADRATIC = SymbolicConstant('QUADRATIC')
-QUADS = SymbolicConstant('QUADS')
-QUAD_DOMINATED = SymbolicConstant('QUAD_DOMINATED')
-QUAD_SEPARATION = SymbolicConstant('QUAD_SEPARATION')
-QUAD_STRIP = SymbolicConstant('QUAD_STRIP')
-QUAD_TRACTION = SymbolicConstant('QUAD_TRACTION')
-QUASI_NEWTON = SymbolicConstant('QUASI_NEWTON')
-QUASI_NEWTON_METHOD = SymbolicConstant('QUASI_NEWTON_METHOD')
-QUASI_STATIC = SymbolicConstant('QUASI_STATIC')
-QUATERNION_2D = SymbolicConstant('QUATERNION_2D')
-QUATERNION_3D = SymbolicConstant('QUATERNION_3D')
-QUICKTIME = SymbolicConstant('QUICKTIME')
-QUILT = SymbolicConstant('QUILT')
-QUINTIC = SymbolicConstant('QUINTIC')
-Q_VECTORS = SymbolicConstant('Q_VECTORS')
-R2D2 = SymbolicConstant('R2D2')
-R3D3 = SymbolicConstant('R3D3')
-R3D4 = SymbolicConstant('R3D4')
-RADIAL = SymbolicConstant('RADIAL')
-RADIAL_THRUST = SymbolicConstant('RADIAL_THRUST')
-RADIATION_ALL = SymbolicConstant('RADIATION_ALL')
-RADIUS = SymbolicConstant('RADIUS')
-RAINBOW = SymbolicConstant('RAINBOW')
-RAMP = SymbolicConstant('RAMP')
-RANDOM_RESPONSE = SymbolicConstant('RANDOM_RESPONSE')
-RANGE = SymbolicConstant('RANGE')
-RASTER = SymbolicConstant('RASTER')
-RATE = SymbolicConstant('RATE')
-RATE_OF_CONVERGENCE_IS_SLOW = SymbolicConstant('RATE_OF_CONVERGENCE_IS_SLOW')
-RAW24 = SymbolicConstant('RAW24')
-RAW32 = SymbolicConstant('RAW32')
-RAW8 = SymbolicConstant('RAW8')
-RAW_DATA = SymbolicConstant('RAW_DATA')
-RAX2 = SymbolicConstant('RAX2')
-RB2D2 = SymbolicConstant('RB2D2')
-RB3D2 = SymbolicConstant('RB3D2')
-REAL = SymbolicConstant('REAL')
-REAL_AND_IMAGINARY = SymbolicConstant('REAL_AND_IMAGINARY')
-REAL_ONLY = SymbolicConstant('REAL_ONLY')
-REBAR = SymbolicConstant('REBAR')
-RECIEVE_PREDICTION = SymbolicConstant('RECIEVE_PREDICTION')
-RECOMPUTE_EACH_FRAME = SymbolicConstant('RECOMPUTE_EACH_FRAME')
-RECOMPUTE_GEOMETRY = SymbolicConstant('RECOMPUTE_GEOMETRY')
-RECOVER = SymbolicConstant('RECOVER')
-RECT_CIRC_MIRROR = SymbolicConstant('RECT_CIRC_MIRROR')
-RECT_MIRROR_CIRC = SymbolicConstant('RECT_MIRROR_CIRC')
-RECURSIVE = SymbolicConstant('RECURSIVE')
-REDUCED_POLYNOMIAL = SymbolicConstant('REDUCED_POLYNOMIAL')
-REDUCED_POLYNOMIAL_ALL = SymbolicConstant('REDUCED_POLYNOMIAL_ALL')
-REDUCED_POLYNOMIAL_N1 = SymbolicConstant('REDUCED_POLYNOMIAL_N1')
-REDUCED_POLYNOMIAL_N2 = SymbolicConstant('REDUCED_POLYNOMIAL_N2')
-REDUCED_POLYNOMIAL_N3 = SymbolicConstant('REDUCED_POLYNOMIAL_N3')
-REDUCED_POLYNOMIAL_N4 = SymbolicConstant('REDUCED_POLYNOMIAL_N4')
-REDUCED_POLYNOMIAL_N5 = SymbolicConstant('REDUCED_POLYNOMIAL_N5')
-REDUCED_POLYNOMIAL_N6 = SymbolicConstant('REDUCED_POLYNOMIAL_N6')
-RED_TO_BLUE = SymbolicConstant('RED_TO_BLUE')
-REEDER = SymbolicConstant('REEDER')
-REFERENCE = SymbolicConstant('REFERENCE')
-REGION = SymbolicConstant('REGION')
-REGULAR = SymbolicConstant('REGULAR')
-REGULAR_BEAM = SymbolicConstant('REGULAR_BEAM')
-REGULAR_SHELL = SymbolicConstant('REGULAR_SHELL')
-REINFORCEMENT = SymbolicConstant('REINFORCEMENT')
-REINITIALIZE = SymbolicConstant('REINITIALIZE')
-RELATIVE = SymbolicConstant('RELATIVE')
-RELATIVE_EQUAL = SymbolicConstant('RELATIVE_EQUAL')
-RELATIVE_GREATER_THAN_EQUAL = SymbolicConstant('RELATIVE_GREATER_THAN_EQUAL')
-RELATIVE_LESS_THAN_EQUAL = SymbolicConstant('RELATIVE_LESS_THAN_EQUAL')
-RELATIVE_SLOPE_DROP = SymbolicConstant('RELATIVE_SLOPE_DROP')
-RELATIVE_VALUE = SymbolicConstant('RELATIVE_VALUE')
-RELAXATION = SymbolicConstant('RELAXATION')
-RELAXATION_TEST_DATA = SymbolicConstant('RELAXATION_TEST_DATA')
-RELAX_STIFFNESS = SymbolicConstant('RELAX_STIFFNESS')
-REMOVE = SymbolicConstant('REMOVE')
-REPETITIVE_SDI_PATTERN = SymbolicConstant('REPETITIVE_SDI_PATTERN')
-REPLACE = SymbolicConstant('REPLACE')
-RESET_TO_INITIAL = SymbolicConstant('RESET_TO_INITIAL')
-RESIDUAL_ACCEPTED = SymbolicConstant('RESIDUAL_ACCEPTED')
-RESIDUAL_NOT_ACCEPTED = SymbolicConstant('RESIDUAL_NOT_ACCEPTED')
-RESPONSE_SPECTRUM = SymbolicConstant('RESPONSE_SPECTRUM')
-RESTART = SymbolicConstant('RESTART')
-RESTRICTED_TASK_REGION_EQUIV_STRESS = SymbolicConstant('RESTRICTED_TASK_REGION_EQUIV_STRESS')
-RESULTANT = SymbolicConstant('RESULTANT')
-RETENTION_FACTOR = SymbolicConstant('RETENTION_FACTOR')
-RETRACTOR = SymbolicConstant('RETRACTOR')
-REVERSE = SymbolicConstant('REVERSE')
-REVERSED_RAINBOW = SymbolicConstant('REVERSED_RAINBOW')
-REVERSE_MIRROR = SymbolicConstant('REVERSE_MIRROR')
-REVOLUTE = SymbolicConstant('REVOLUTE')
-REVOLUTION = SymbolicConstant('REVOLUTION')
-RIGHT = SymbolicConstant('RIGHT')
-RIGID = SymbolicConstant('RIGID')
-RIGID_BODY = SymbolicConstant('RIGID_BODY')
-RIGID_SPRING_RIGID = SymbolicConstant('RIGID_SPRING_RIGID')
-RIKS = SymbolicConstant('RIKS')
-RLE24 = SymbolicConstant('RLE24')
-RLE8 = SymbolicConstant('RLE8')
-ROLLING = SymbolicConstant('ROLLING')
-ROTARYI = SymbolicConstant('ROTARYI')
-ROTARY_INERTIA = SymbolicConstant('ROTARY_INERTIA')
-ROTATE = SymbolicConstant('ROTATE')
-ROTATION = SymbolicConstant('ROTATION')
-ROTATIONAL_ACCELERATION = SymbolicConstant('ROTATIONAL_ACCELERATION')
-ROTATIONAL_VELOCITY = SymbolicConstant('ROTATIONAL_VELOCITY')
-ROTATION_ACCELEROMETER = SymbolicConstant('ROTATION_ACCELEROMETER')
-ROTATION_ANGLE = SymbolicConstant('ROTATION_ANGLE')
-ROTATION_FIELD = SymbolicConstant('ROTATION_FIELD')
-ROTATION_NONE = SymbolicConstant('ROTATION_NONE')
-ROUGH = SymbolicConstant('ROUGH')
-RSH = SymbolicConstant('RSH')
-RSS = SymbolicConstant('RSS')
-RUNNING = SymbolicConstant('RUNNING')
-S1 = SymbolicConstant('S1')
-S2 = SymbolicConstant('S2')
-S3 = SymbolicConstant('S3')
-S3R = SymbolicConstant('S3R')
-S3RS = SymbolicConstant('S3RS')
-S3RT = SymbolicConstant('S3RT')
-S3T = SymbolicConstant('S3T')
-S4 = SymbolicConstant('S4')
-S4R = SymbolicConstant('S4R')
-S4R5 = SymbolicConstant('S4R5')
-S4RS = SymbolicConstant('S4RS')
-S4RSW = SymbolicConstant('S4RSW')
-S4RT = SymbolicConstant('S4RT')
-S4T = SymbolicConstant('S4T')
-S5 = SymbolicConstant('S5')
-S6 = SymbolicConstant('S6')
-S8R = SymbolicConstant('S8R')
-S8R5 = SymbolicConstant('S8R5')
-S8RT = SymbolicConstant('S8RT')
-SAX1 = SymbolicConstant('SAX1')
-SAX2 = SymbolicConstant('SAX2')
-SAX2T = SymbolicConstant('SAX2T')
-SAXA11 = SymbolicConstant('SAXA11')
-SAXA12 = SymbolicConstant('SAXA12')
-SAXA13 = SymbolicConstant('SAXA13')
-SAXA14 = SymbolicConstant('SAXA14')
-SAXA21 = SymbolicConstant('SAXA21')
-SAXA22 = SymbolicConstant('SAXA22')
-SAXA23 = SymbolicConstant('SAXA23')
-SAXA24 = SymbolicConstant('SAXA24')
-SC6R = SymbolicConstant('SC6R')
-SC6RT = SymbolicConstant('SC6RT')
-SC8R = SymbolicConstant('SC8R')
-SC8RT = SymbolicConstant('SC8RT')
-SCALAR = SymbolicConstant('SCALAR')
-SCALE = SymbolicConstant('SCALE')
-SCALE_FACTOR = SymbolicConstant('SCALE_FACTOR')
-SCATTERED = SymbolicConstant('SCATTERED')
-SCIENTIFIC = SymbolicConstant('SCIENTIFIC')
-SCREEN = SymbolicConstant('SCREEN')
-SCREEN_SIZE = SymbolicConstant('SCREEN_SIZE')
-SECOND = SymbolicConstant('SECOND')
-SECOND_ORDER_ADVECTION = SymbolicConstant('SECOND_ORDER_ADVECTION')
-SECTION = SymbolicConstant('SECTION')
-SECTION_MAP = SymbolicConstant('SECTION_MAP')
-SECTION_MAP_COLORS = SymbolicConstant('SECTION_MAP_COLORS')
-SECTION_PTS = SymbolicConstant('SECTION_PTS')
-SEGMENTS = SymbolicConstant('SEGMENTS')
-SELECTED = SymbolicConstant('SELECTED')
-SELECTION_GRP_MAP = SymbolicConstant('SELECTION_GRP_MAP')
-SELECTION_GRP_MAP_COLORS = SymbolicConstant('SELECTION_GRP_MAP_COLORS')
-SELECTIVE = SymbolicConstant('SELECTIVE')
-SELECT_ALL = SymbolicConstant('SELECT_ALL')
-SELECT_BY_ANGLE = SymbolicConstant('SELECT_BY_ANGLE')
-SELECT_BY_NUMBER = SymbolicConstant('SELECT_BY_NUMBER')
-SELF = SymbolicConstant('SELF')
-SEMI_AUTOMATIC = SymbolicConstant('SEMI_AUTOMATIC')
-SEND_PREDICTION = SymbolicConstant('SEND_PREDICTION')
-SEPARATE = SymbolicConstant('SEPARATE')
-SEPARATED = SymbolicConstant('SEPARATED')
-SEPARATED_SOLUTION = SymbolicConstant('SEPARATED_SOLUTION')
-SEPARATE_TABLES = SymbolicConstant('SEPARATE_TABLES')
-SEQUENTIAL_THERMAL_STRESS = SymbolicConstant('SEQUENTIAL_THERMAL_STRESS')
-SEQ_ID = SymbolicConstant('SEQ_ID')
-SET = SymbolicConstant('SET')
-SET_EQUAL_DT = SymbolicConstant('SET_EQUAL_DT')
-SET_MAP = SymbolicConstant('SET_MAP')
-SET_MAP_COLORS = SymbolicConstant('SET_MAP_COLORS')
-SEVERE_CONTACT_OVERCLOSURES = SymbolicConstant('SEVERE_CONTACT_OVERCLOSURES')
-SEVERE_OVERCLOSURES = SymbolicConstant('SEVERE_OVERCLOSURES')
-SFM3D3 = SymbolicConstant('SFM3D3')
-SFM3D4 = SymbolicConstant('SFM3D4')
-SFM3D4R = SymbolicConstant('SFM3D4R')
-SFM3D6 = SymbolicConstant('SFM3D6')
-SFM3D8 = SymbolicConstant('SFM3D8')
-SFM3D8R = SymbolicConstant('SFM3D8R')
-SFMAX1 = SymbolicConstant('SFMAX1')
-SFMAX2 = SymbolicConstant('SFMAX2')
-SFMCL6 = SymbolicConstant('SFMCL6')
-SFMCL9 = SymbolicConstant('SFMCL9')
-SFMGAX1 = SymbolicConstant('SFMGAX1')
-SFMGAX2 = SymbolicConstant('SFMGAX2')
-SHADED = SymbolicConstant('SHADED')
-SHAPE_FACTOR = SymbolicConstant('SHAPE_FACTOR')
-SHARED_LM_PRESSURE_FIELD = SymbolicConstant('SHARED_LM_PRESSURE_FIELD')
-SHARED_LM_VOLUME_FIELD = SymbolicConstant('SHARED_LM_VOLUME_FIELD')
-SHEAR = SymbolicConstant('SHEAR')
-SHEARCREEP = SymbolicConstant('SHEARCREEP')
-SHEARRELAXATION = SymbolicConstant('SHEARRELAXATION')
-SHELL = SymbolicConstant('SHELL')
-SHELL_TO_SOLID_COUPLING = SymbolicConstant('SHELL_TO_SOLID_COUPLING')
-SHORT = SymbolicConstant('SHORT')
-SHORTEST_EDGE = SymbolicConstant('SHORTEST_EDGE')
-SHORTEST_PATH = SymbolicConstant('SHORTEST_PATH')
-SHORT_FIBER = SymbolicConstant('SHORT_FIBER')
-SHRINK_FIT = SymbolicConstant('SHRINK_FIT')
-SHRINK_MOVEMENT = SymbolicConstant('SHRINK_MOVEMENT')
-SIDE1 = SymbolicConstant('SIDE1')
-SIDE2 = SymbolicConstant('SIDE2')
-SIGCONT = SymbolicConstant('SIGCONT')
-SIGINT = SymbolicConstant('SIGINT')
-SIGN = SymbolicConstant('SIGN')
-SIGTERM = SymbolicConstant('SIGTERM')
-SIGTSTP = SymbolicConstant('SIGTSTP')
-SIGUSR1 = SymbolicConstant('SIGUSR1')
-SIGUSR2 = SymbolicConstant('SIGUSR2')
-SIM = SymbolicConstant('SIM')
-SIMP = SymbolicConstant('SIMP')
-SIMPLE = SymbolicConstant('SIMPLE')
-SIMPLESHEAR = SymbolicConstant('SIMPLESHEAR')
-SIMPSON = SymbolicConstant('SIMPSON')
-SIMULATION_ABORTED = SymbolicConstant('SIMULATION_ABORTED')
-SIMULATION_COMPLETED = SymbolicConstant('SIMULATION_COMPLETED')
-SIMULATION_INTERRUPTED = SymbolicConstant('SIMULATION_INTERRUPTED')
-SIMULATION_STARTED = SymbolicConstant('SIMULATION_STARTED')
-SINE = SymbolicConstant('SINE')
-SINGHM = SymbolicConstant('SINGHM')
-SINGLE = SymbolicConstant('SINGLE')
-SINGLE_DIRECTION = SymbolicConstant('SINGLE_DIRECTION')
-SINGLE_NODE = SymbolicConstant('SINGLE_NODE')
-SINGLE_PRECISION = SymbolicConstant('SINGLE_PRECISION')
-SINGLE_TABLE = SymbolicConstant('SINGLE_TABLE')
-SINGLE_VALUE = SymbolicConstant('SINGLE_VALUE')
-SIZE = SymbolicConstant('SIZE')
-SIZE_ON_SCREEN = SymbolicConstant('SIZE_ON_SCREEN')
-SKINS = SymbolicConstant('SKINS')
-SKIN_MAP = SymbolicConstant('SKIN_MAP')
-SKIN_MAP_COLORS = SymbolicConstant('SKIN_MAP_COLORS')
-SLASH = SymbolicConstant('SLASH')
-SLAVE = SymbolicConstant('SLAVE')
-SLIDE_DISTANCE_EXCEEDED = SymbolicConstant('SLIDE_DISTANCE_EXCEEDED')
-SLIDE_PLANE = SymbolicConstant('SLIDE_PLANE')
-SLIDING = SymbolicConstant('SLIDING')
-SLIPPED_OFF_PATCH = SymbolicConstant('SLIPPED_OFF_PATCH')
-SLIPRING = SymbolicConstant('SLIPRING')
-SLOT = SymbolicConstant('SLOT')
-SMALL = SymbolicConstant('SMALL')
-SMALLEST_ELEM_AT_CENTER = SymbolicConstant('SMALLEST_ELEM_AT_CENTER')
-SMALLEST_ELEM_AT_ENDS = SymbolicConstant('SMALLEST_ELEM_AT_ENDS')
-SMALLEST_ELEM_LOCATION = SymbolicConstant('SMALLEST_ELEM_LOCATION')
-SMALL_ANGLE = SymbolicConstant('SMALL_ANGLE')
-SMALL_ANGLE_QUAD_FACE = SymbolicConstant('SMALL_ANGLE_QUAD_FACE')
-SMALL_ANGLE_TRI_FACE = SymbolicConstant('SMALL_ANGLE_TRI_FACE')
-SMEAR_ABOUT_CORE = SymbolicConstant('SMEAR_ABOUT_CORE')
-SMEAR_ALL_LAYERS = SymbolicConstant('SMEAR_ALL_LAYERS')
-SMOOTHING_AS_IS = SymbolicConstant('SMOOTHING_AS_IS')
-SMOOTHING_OFF = SymbolicConstant('SMOOTHING_OFF')
-SMOOTHING_ON = SymbolicConstant('SMOOTHING_ON')
-SNEG = SymbolicConstant('SNEG')
-SOFTWARE_OVERLAY = SymbolicConstant('SOFTWARE_OVERLAY')
-SOFT_CONTACT_INCOMPATIBILITIES = SymbolicConstant('SOFT_CONTACT_INCOMPATIBILITIES')
-SOILS = SymbolicConstant('SOILS')
-SOLID = SymbolicConstant('SOLID')
-SOLIDWORKS = SymbolicConstant('SOLIDWORKS')
-SOLUTION_APPEARS_TO_BE_DIVERGING = SymbolicConstant('SOLUTION_APPEARS_TO_BE_DIVERGING')
-SOLVER_DEFAULT = SymbolicConstant('SOLVER_DEFAULT')
-SPALART = SymbolicConstant('SPALART')
-SPECIFIED = SymbolicConstant('SPECIFIED')
-SPECIFIED_LIMIT = SymbolicConstant('SPECIFIED_LIMIT')
-SPECIFIED_MODES = SymbolicConstant('SPECIFIED_MODES')
-SPECIFIED_NODAL_DIAMETER = SymbolicConstant('SPECIFIED_NODAL_DIAMETER')
-SPECIFY = SymbolicConstant('SPECIFY')
-SPECIFY_NUM_PTS = SymbolicConstant('SPECIFY_NUM_PTS')
-SPECIFY_ORIENT = SymbolicConstant('SPECIFY_ORIENT')
-SPECIFY_PATH = SymbolicConstant('SPECIFY_PATH')
-SPECIFY_STEP_SIZE = SymbolicConstant('SPECIFY_STEP_SIZE')
-SPECIFY_THICKNESS = SymbolicConstant('SPECIFY_THICKNESS')
-SPECIFY_TOLERANCE = SymbolicConstant('SPECIFY_TOLERANCE')
-SPECTRUM = SymbolicConstant('SPECTRUM')
-SPHERE = SymbolicConstant('SPHERE')
-SPHERICAL = SymbolicConstant('SPHERICAL')
-SPIN = SymbolicConstant('SPIN')
-SPLINE = SymbolicConstant('SPLINE')
-SPLINE_APPROXIMATION = SymbolicConstant('SPLINE_APPROXIMATION')
-SPLINE_INTERPOLATION = SymbolicConstant('SPLINE_INTERPOLATION')
-SPOS = SymbolicConstant('SPOS')
-SPOT_WELD_CONTACT = SymbolicConstant('SPOT_WELD_CONTACT')
-SPRING1 = SymbolicConstant('SPRING1')
-SPRING2 = SymbolicConstant('SPRING2')
-SPRINGA = SymbolicConstant('SPRINGA')
-SPRING_RIGID_SPRING = SymbolicConstant('SPRING_RIGID_SPRING')
-SQUARE_ROOT = SymbolicConstant('SQUARE_ROOT')
-SRSS = SymbolicConstant('SRSS')
-SSH = SymbolicConstant('SSH')
-SSOR = SymbolicConstant('SSOR')
-STABILIZATION = SymbolicConstant('STABILIZATION')
-STABILIZED = SymbolicConstant('STABILIZED')
-STABLE_INC_XPL = SymbolicConstant('STABLE_INC_XPL')
-STABLE_TIME_INCREMENT = SymbolicConstant('STABLE_TIME_INCREMENT')
-STACK_1 = SymbolicConstant('STACK_1')
-STACK_2 = SymbolicConstant('STACK_2')
-STACK_3 = SymbolicConstant('STACK_3')
-STACK_ORIENTATION = SymbolicConstant('STACK_ORIENTATION')
-STAGNATION = SymbolicConstant('STAGNATION')
-STAMP = SymbolicConstant('STAMP')
-STANDALONE = SymbolicConstant('STANDALONE')
-STANDALONENOSHOW = SymbolicConstant('STANDALONENOSHOW')
-STANDARD = SymbolicConstant('STANDARD')
-STANDARD_ANALYSIS = SymbolicConstant('STANDARD_ANALYSIS')
-STANDARD_EXPLICIT = SymbolicConstant('STANDARD_EXPLICIT')
-STANDARD_PHASE = SymbolicConstant('STANDARD_PHASE')
-START = SymbolicConstant('START')
-STARTED = SymbolicConstant('STARTED')
-STATE_FRAME = SymbolicConstant('STATE_FRAME')
-STATIC = SymbolicConstant('STATIC')
-STATIC_GENERAL = SymbolicConstant('STATIC_GENERAL')
-STATIC_LINEAR_PERTURBATION = SymbolicConstant('STATIC_LINEAR_PERTURBATION')
-STATIC_PERTURBATION = SymbolicConstant('STATIC_PERTURBATION')
-STATIC_RIKS = SymbolicConstant('STATIC_RIKS')
-STATUS = SymbolicConstant('STATUS')
-STEADY_STATE = SymbolicConstant('STEADY_STATE')
-STEADY_STATE_DIRECT = SymbolicConstant('STEADY_STATE_DIRECT')
-STEADY_STATE_MODAL = SymbolicConstant('STEADY_STATE_MODAL')
-STEADY_STATE_SUBSPACE = SymbolicConstant('STEADY_STATE_SUBSPACE')
-STEADY_STATE_TRANSPORT = SymbolicConstant('STEADY_STATE_TRANSPORT')
-STEP = SymbolicConstant('STEP')
-STEP_END = SymbolicConstant('STEP_END')
-STEP_START = SymbolicConstant('STEP_START')
-STEP_TIME = SymbolicConstant('STEP_TIME')
-STEP_TIME_XPL = SymbolicConstant('STEP_TIME_XPL')
-STIFFNESS = SymbolicConstant('STIFFNESS')
-STIFFNESS_OPTIMIZATION = SymbolicConstant('STIFFNESS_OPTIMIZATION')
-STIPPLED = SymbolicConstant('STIPPLED')
-STOP = SymbolicConstant('STOP')
-STRAIN = SymbolicConstant('STRAIN')
-STRAIN_FREE_CORRECTIONS = SymbolicConstant('STRAIN_FREE_CORRECTIONS')
-STRAIN_RATE = SymbolicConstant('STRAIN_RATE')
-STRESS = SymbolicConstant('STRESS')
-STRESS_INTENS_FACTOR = SymbolicConstant('STRESS_INTENS_FACTOR')
-STRESS_PERTURBATION = SymbolicConstant('STRESS_PERTURBATION')
-STRI3 = SymbolicConstant('STRI3')
-STRI65 = SymbolicConstant('STRI65')
-STRINGERS = SymbolicConstant('STRINGERS')
-STRINGER_MAP = SymbolicConstant('STRINGER_MAP')
-STRINGER_MAP_COLORS = SymbolicConstant('STRINGER_MAP_COLORS')
-STRUCTURAL = SymbolicConstant('STRUCTURAL')
-STRUCTURED = SymbolicConstant('STRUCTURED')
-SUBMISSION_ABORTED = SymbolicConstant('SUBMISSION_ABORTED')
-SUBMITTED = SymbolicConstant('SUBMITTED')
-SUBMODELING = SymbolicConstant('SUBMODELING')
-SUBSPACE = SymbolicConstant('SUBSPACE')
-SUBSPACE_DYNAMIC = SymbolicConstant('SUBSPACE_DYNAMIC')
-SUBSPACE_EIGENSOLVER = SymbolicConstant('SUBSPACE_EIGENSOLVER')
-SUBSPACE_STEADY_STATE_DYNAMIC = SymbolicConstant('SUBSPACE_STEADY_STATE_DYNAMIC')
-SUBSTANCE = SymbolicConstant('SUBSTANCE')
-SUBSTRUCTURE_GENERATE = SymbolicConstant('SUBSTRUCTURE_GENERATE')
-SUBSTRUCTURING = SymbolicConstant('SUBSTRUCTURING')
-SUBTRACT = SymbolicConstant('SUBTRACT')
-SUM = SymbolicConstant('SUM')
-SUPERIMPOSE = SymbolicConstant('SUPERIMPOSE')
-SUPPRESS = SymbolicConstant('SUPPRESS')
-SURFACE = SymbolicConstant('SURFACE')
-SURFACE_BLAST = SymbolicConstant('SURFACE_BLAST')
-SURFACE_INTEGRATION_POINT = SymbolicConstant('SURFACE_INTEGRATION_POINT')
-SURFACE_MAP = SymbolicConstant('SURFACE_MAP')
-SURFACE_MAP_COLORS = SymbolicConstant('SURFACE_MAP_COLORS')
-SURFACE_NODAL = SymbolicConstant('SURFACE_NODAL')
-SURFACE_POINT_EQUIV_STRESS = SymbolicConstant('SURFACE_POINT_EQUIV_STRESS')
-SURFACE_TO_SURFACE = SymbolicConstant('SURFACE_TO_SURFACE')
-SVG = SymbolicConstant('SVG')
-SWEEP = SymbolicConstant('SWEEP')
-SWING = SymbolicConstant('SWING')
-SYMBOL = SymbolicConstant('SYMBOL')
-SYMBOLS_ON_DEF = SymbolicConstant('SYMBOLS_ON_DEF')
-SYMBOLS_ON_UNDEF = SymbolicConstant('SYMBOLS_ON_UNDEF')
-SYMMETRIC = SymbolicConstant('SYMMETRIC')
-SYMMETRIC_MODEL_GENERATION = SymbolicConstant('SYMMETRIC_MODEL_GENERATION')
-SYNTAXCHECK = SymbolicConstant('SYNTAXCHECK')
-SYSTEM = SymbolicConstant('SYSTEM')
-SYSTEM_ASSIGN = SymbolicConstant('SYSTEM_ASSIGN')
-SYSTEM_DEFINED = SymbolicConstant('SYSTEM_DEFINED')
-T2D2 = SymbolicConstant('T2D2')
-T2D2E = SymbolicConstant('T2D2E')
-T2D2H = SymbolicConstant('T2D2H')
-T2D2T = SymbolicConstant('T2D2T')
-T2D3 = SymbolicConstant('T2D3')
-T2D3E = SymbolicConstant('T2D3E')
-T2D3H = SymbolicConstant('T2D3H')
-T2D3T = SymbolicConstant('T2D3T')
-T3D2 = SymbolicConstant('T3D2')
-T3D2E = SymbolicConstant('T3D2E')
-T3D2H = SymbolicConstant('T3D2H')
-T3D2T = SymbolicConstant('T3D2T')
-T3D3 = SymbolicConstant('T3D3')
-T3D3E = SymbolicConstant('T3D3E')
-T3D3H = SymbolicConstant('T3D3H')
-T3D3T = SymbolicConstant('T3D3T')
-TABULAR = SymbolicConstant('TABULAR')
-TANGENT = SymbolicConstant('TANGENT')
-TANGENTIAL = SymbolicConstant('TANGENTIAL')
-TAPERED = SymbolicConstant('TAPERED')
-TASK_REGION_EQUIV_STRESS = SymbolicConstant('TASK_REGION_EQUIV_STRESS')
-TASK_REGION_LAYERS = SymbolicConstant('TASK_REGION_LAYERS')
-TECHNIQUE = SymbolicConstant('TECHNIQUE')
-TEMPERATURE = SymbolicConstant('TEMPERATURE')
-TEMPERATURE_FALLEN_BELOW_ABSOLUTE_ZERO = SymbolicConstant('TEMPERATURE_FALLEN_BELOW_ABSOLUTE_ZERO')
-TEMPERATURE_FIELD = SymbolicConstant('TEMPERATURE_FIELD')
-TENP = SymbolicConstant('TENP')
-TENSION = SymbolicConstant('TENSION')
-TENSOR = SymbolicConstant('TENSOR')
-TENSOR_2D_PLANAR = SymbolicConstant('TENSOR_2D_PLANAR')
-TENSOR_2D_SURFACE = SymbolicConstant('TENSOR_2D_SURFACE')
-TENSOR_3D_FULL = SymbolicConstant('TENSOR_3D_FULL')
-TENSOR_3D_PLANAR = SymbolicConstant('TENSOR_3D_PLANAR')
-TENSOR_3D_SURFACE = SymbolicConstant('TENSOR_3D_SURFACE')
-TERMINATED = SymbolicConstant('TERMINATED')
-TESSELLATED = SymbolicConstant('TESSELLATED')
-TEST_DATA = SymbolicConstant('TEST_DATA')
-TET = SymbolicConstant('TET')
-TET10 = SymbolicConstant('TET10')
-TET4 = SymbolicConstant('TET4')
-TEXTURE_MAPPED = SymbolicConstant('TEXTURE_MAPPED')
-THERMAL = SymbolicConstant('THERMAL')
-THERMAL_CONTACT = SymbolicConstant('THERMAL_CONTACT')
-THERMOMECHANICAL = SymbolicConstant('THERMOMECHANICAL')
-THICK = SymbolicConstant('THICK')
-THICKNESS = SymbolicConstant('THICKNESS')
-THICKNESS_DISCRETE_FIELD = SymbolicConstant('THICKNESS_DISCRETE_FIELD')
-THICKNESS_MAGNITUDE = SymbolicConstant('THICKNESS_MAGNITUDE')
-THICK_WALL = SymbolicConstant('THICK_WALL')
-THIN = SymbolicConstant('THIN')
-THINNING = SymbolicConstant('THINNING')
-THIN_WALL = SymbolicConstant('THIN_WALL')
-THREADS = SymbolicConstant('THREADS')
-THREED_DATA = SymbolicConstant('THREED_DATA')
-THREE_D = SymbolicConstant('THREE_D')
-THROUGHOUT_STEP = SymbolicConstant('THROUGHOUT_STEP')
-TIE = SymbolicConstant('TIE')
-TIE_MPC = SymbolicConstant('TIE_MPC')
-TIFF = SymbolicConstant('TIFF')
-TIGHTEN_GAPS = SymbolicConstant('TIGHTEN_GAPS')
-TIME = SymbolicConstant('TIME')
-TIME_AVERAGE = SymbolicConstant('TIME_AVERAGE')
-TIME_BASED = SymbolicConstant('TIME_BASED')
-TIME_HEAT_FLUX = SymbolicConstant('TIME_HEAT_FLUX')
-TIME_HEAT_FLUX_AREA = SymbolicConstant('TIME_HEAT_FLUX_AREA')
-TIME_HISTORY = SymbolicConstant('TIME_HISTORY')
-TIME_INCREMENT = SymbolicConstant('TIME_INCREMENT')
-TIME_INTEGRATION = SymbolicConstant('TIME_INTEGRATION')
-TIME_INTEGRATION_ACCURACY_LIMIT_EXCEEDED = SymbolicConstant('TIME_INTEGRATION_ACCURACY_LIMIT_EXCEEDED')
-TIME_INTEGRATION_STABILITY_LIMIT_EXCEEDED = SymbolicConstant('TIME_INTEGRATION_STABILITY_LIMIT_EXCEEDED')
-TIME_INTERVAL = SymbolicConstant('TIME_INTERVAL')
-TIME_INTERVAL_VALUE = SymbolicConstant('TIME_INTERVAL_VALUE')
-TIME_POINT = SymbolicConstant('TIME_POINT')
-TIME_VOLUME = SymbolicConstant('TIME_VOLUME')
-TIME_VOLUME_FLUX = SymbolicConstant('TIME_VOLUME_FLUX')
-TMORI = SymbolicConstant('TMORI')
-TOLERANCE = SymbolicConstant('TOLERANCE')
-TOP = SymbolicConstant('TOP')
-TOP_AND_BOTTOM = SymbolicConstant('TOP_AND_BOTTOM')
-TOP_CENTER = SymbolicConstant('TOP_CENTER')
-TOP_LEFT = SymbolicConstant('TOP_LEFT')
-TOP_RIGHT = SymbolicConstant('TOP_RIGHT')
-TOP_SURFACE = SymbolicConstant('TOP_SURFACE')
-TOROIDAL = SymbolicConstant('TOROIDAL')
-TOTAL = SymbolicConstant('TOTAL')
-TOTAL_ABSOLUTE_MOVEMENT = SymbolicConstant('TOTAL_ABSOLUTE_MOVEMENT')
-TOTAL_FORCE = SymbolicConstant('TOTAL_FORCE')
-TOTAL_MASS = SymbolicConstant('TOTAL_MASS')
-TOTAL_MASS_XPL = SymbolicConstant('TOTAL_MASS_XPL')
-TOTAL_NUM = SymbolicConstant('TOTAL_NUM')
-TOTAL_NUMBER = SymbolicConstant('TOTAL_NUMBER')
-TOTAL_TIME_XPL = SymbolicConstant('TOTAL_TIME_XPL')
-TO_ENVIRONMENT = SymbolicConstant('TO_ENVIRONMENT')
-TRACTION = SymbolicConstant('TRACTION')
-TRACTION_SEPARATION = SymbolicConstant('TRACTION_SEPARATION')
-TRANSFORMATION = SymbolicConstant('TRANSFORMATION')
-TRANSIENT = SymbolicConstant('TRANSIENT')
-TRANSIENT_FIDELITY = SymbolicConstant('TRANSIENT_FIDELITY')
-TRANSLATE = SymbolicConstant('TRANSLATE')
-TRANSLATOR = SymbolicConstant('TRANSLATOR')
-TRANSPARENT = SymbolicConstant('TRANSPARENT')
-TRANSVERSE = SymbolicConstant('TRANSVERSE')
-TRANSVERSE_SHEAR_FORCE_CONSTRAINT = SymbolicConstant('TRANSVERSE_SHEAR_FORCE_CONSTRAINT')
-TRAPEZOID = SymbolicConstant('TRAPEZOID')
-TRESCA = SymbolicConstant('TRESCA')
-TRI = SymbolicConstant('TRI')
-TRIGGER = SymbolicConstant('TRIGGER')
-TRI3 = SymbolicConstant('TRI3')
-TRI6 = SymbolicConstant('TRI6')
-TRIANGLES = SymbolicConstant('TRIANGLES')
-TRIANGLE_FAN = SymbolicConstant('TRIANGLE_FAN')
-TRIANGLE_STRIP = SymbolicConstant('TRIANGLE_STRIP')
-TRIDIRECTIONAL = SymbolicConstant('TRIDIRECTIONAL')
-TRUE_DISTANCE = SymbolicConstant('TRUE_DISTANCE')
-TRUE_DISTANCE_X = SymbolicConstant('TRUE_DISTANCE_X')
-TRUE_DISTANCE_Y = SymbolicConstant('TRUE_DISTANCE_Y')
-TRUE_DISTANCE_Z = SymbolicConstant('TRUE_DISTANCE_Z')
-TRUSS = SymbolicConstant('TRUSS')
-TURB_NONE = SymbolicConstant('TURB_NONE')
-TURN = SymbolicConstant('TURN')
-TWIST = SymbolicConstant('TWIST')
-TWO_CONFIG = SymbolicConstant('TWO_CONFIG')
-TWO_D_PLANAR = SymbolicConstant('TWO_D_PLANAR')
-TYPED_IN = SymbolicConstant('TYPED_IN')
-TYPE_NOT_APPLICABLE = SymbolicConstant('TYPE_NOT_APPLICABLE')
-T_STRESS = SymbolicConstant('T_STRESS')
-U1 = SymbolicConstant('U1')
-U2 = SymbolicConstant('U2')
-U3 = SymbolicConstant('U3')
-UJOINT = SymbolicConstant('UJOINT')
-UNCHANGED = SymbolicConstant('UNCHANGED')
-UNCONVERGED_CAP_PLASTICITY = SymbolicConstant('UNCONVERGED_CAP_PLASTICITY')
-UNCONVERGED_CLAY_PLASTICITY = SymbolicConstant('UNCONVERGED_CLAY_PLASTICITY')
-UNCONVERGED_CONCRETE_PLASTICITY = SymbolicConstant('UNCONVERGED_CONCRETE_PLASTICITY')
-UNCONVERGED_CREEP_PLASTICITY = SymbolicConstant('UNCONVERGED_CREEP_PLASTICITY')
-UNCONVERGED_DRUCKER_PRAGER_PLASTICITY = SymbolicConstant('UNCONVERGED_DRUCKER_PRAGER_PLASTICITY')
-UNCONVERGED_FOAM_PLASTICITY = SymbolicConstant('UNCONVERGED_FOAM_PLASTICITY')
-UNCONVERGED_HYPERELASTICITY = SymbolicConstant('UNCONVERGED_HYPERELASTICITY')
-UNCONVERGED_METAL_PLASTICITY = SymbolicConstant('UNCONVERGED_METAL_PLASTICITY')
-UNCONVERGED_MOHR_COULOMB_PLASTICITY = SymbolicConstant('UNCONVERGED_MOHR_COULOMB_PLASTICITY')
-UNCORRELATED = SymbolicConstant('UNCORRELATED')
-UNCOUPLED = SymbolicConstant('UNCOUPLED')
-UNDEFINED_ANALYSIS = SymbolicConstant('UNDEFINED_ANALYSIS')
-UNDEFINED_INVARIANT = SymbolicConstant('UNDEFINED_INVARIANT')
-UNDEFINED_POSITION = SymbolicConstant('UNDEFINED_POSITION')
-UNDEFORMED = SymbolicConstant('UNDEFORMED')
-UNDEX = SymbolicConstant('UNDEX')
-UNDEX_CHARGE = SymbolicConstant('UNDEX_CHARGE')
-UNIAXIAL = SymbolicConstant('UNIAXIAL')
-UNIAXIAL_VOLUMETRIC = SymbolicConstant('UNIAXIAL_VOLUMETRIC')
-UNIDIRECTIONAL = SymbolicConstant('UNIDIRECTIONAL')
-UNIFORM = SymbolicConstant('UNIFORM')
-UNIFORM_BY_NUMBER = SymbolicConstant('UNIFORM_BY_NUMBER')
-UNIFORM_BY_SIZE = SymbolicConstant('UNIFORM_BY_SIZE')
-UNIFORM_ERROR = SymbolicConstant('UNIFORM_ERROR')
-UNIFORM_SPACING = SymbolicConstant('UNIFORM_SPACING')
-UNION = SymbolicConstant('UNION')
-UNIVERSAL = SymbolicConstant('UNIVERSAL')
-UNIX = SymbolicConstant('UNIX')
-UNKNOWN = SymbolicConstant('UNKNOWN')
-UNKNOWNAXIS = SymbolicConstant('UNKNOWNAXIS')
-UNKNOWNPLANE = SymbolicConstant('UNKNOWNPLANE')
-UNKNOWN_ANALYSIS_CODE = SymbolicConstant('UNKNOWN_ANALYSIS_CODE')
-UNKNOWN_DIMENSION = SymbolicConstant('UNKNOWN_DIMENSION')
-UNKNOWN_HEX = SymbolicConstant('UNKNOWN_HEX')
-UNKNOWN_HOURGLASS_CONTROL = SymbolicConstant('UNKNOWN_HOURGLASS_CONTROL')
-UNKNOWN_KINEMATIC_SPLIT = SymbolicConstant('UNKNOWN_KINEMATIC_SPLIT')
-UNKNOWN_PHASE = SymbolicConstant('UNKNOWN_PHASE')
-UNKNOWN_QUAD = SymbolicConstant('UNKNOWN_QUAD')
-UNKNOWN_SHAPE = SymbolicConstant('UNKNOWN_SHAPE')
-UNKNOWN_STRESS_RATE = SymbolicConstant('UNKNOWN_STRESS_RATE')
-UNKNOWN_TET = SymbolicConstant('UNKNOWN_TET')
-UNKNOWN_TRI = SymbolicConstant('UNKNOWN_TRI')
-UNKNOWN_WEDGE = SymbolicConstant('UNKNOWN_WEDGE')
-UNLIMITED = SymbolicConstant('UNLIMITED')
-UNMESHABLE = SymbolicConstant('UNMESHABLE')
-UNRESOLVED_INITIAL_OVERCLOSURES = SymbolicConstant('UNRESOLVED_INITIAL_OVERCLOSURES')
-UNSET = SymbolicConstant('UNSET')
-UNSPECIFIED = SymbolicConstant('UNSPECIFIED')
-UNSYMMETRIC = SymbolicConstant('UNSYMMETRIC')
-UR1 = SymbolicConstant('UR1')
-UR2 = SymbolicConstant('UR2')
-UR3 = SymbolicConstant('UR3')
-USA_ADDED_MASS_GENERATION = SymbolicConstant('USA_ADDED_MASS_GENERATION')
-USER = SymbolicConstant('USER')
-USER_CUSTOMIZED = SymbolicConstant('USER_CUSTOMIZED')
-USER_DEFINED = SymbolicConstant('USER_DEFINED')
-USER_MPC = SymbolicConstant('USER_MPC')
-USER_SPECIFIED = SymbolicConstant('USER_SPECIFIED')
-USER_SUB = SymbolicConstant('USER_SUB')
-USER_SUBROUTINE = SymbolicConstant('USER_SUBROUTINE')
-USER_SUBROUTINE_REQUEST = SymbolicConstant('USER_SUBROUTINE_REQUEST')
-USE_BOTTOM = SymbolicConstant('USE_BOTTOM')
-USE_BOTTOM_AND_TOP = SymbolicConstant('USE_BOTTOM_AND_TOP')
-USE_ENVELOPE = SymbolicConstant('USE_ENVELOPE')
-USE_GEOMETRY = SymbolicConstant('USE_GEOMETRY')
-USE_MESH = SymbolicConstant('USE_MESH')
-USE_TOP = SymbolicConstant('USE_TOP')
-USUP = SymbolicConstant('USUP')
-VALUE = SymbolicConstant('VALUE')
-VALUES = SymbolicConstant('VALUES')
-VALUES_AND_HISTORY = SymbolicConstant('VALUES_AND_HISTORY')
-VAN_DER_WAALS = SymbolicConstant('VAN_DER_WAALS')
-VAN_DER_WALLS_STRETCHES_LOCKING = SymbolicConstant('VAN_DER_WALLS_STRETCHES_LOCKING')
-VARIABLE_RATIO = SymbolicConstant('VARIABLE_RATIO')
-VCCT = SymbolicConstant('VCCT')
-VECTOR = SymbolicConstant('VECTOR')
-VECTOR_COMPONENT = SymbolicConstant('VECTOR_COMPONENT')
-VELOCITY = SymbolicConstant('VELOCITY')
-VELOCITY_PARABOLIC = SymbolicConstant('VELOCITY_PARABOLIC')
-VELOCITY_SQUARED = SymbolicConstant('VELOCITY_SQUARED')
-VERTEX_ADJ_TO_SMALLEST_ELEM = SymbolicConstant('VERTEX_ADJ_TO_SMALLEST_ELEM')
-VERTICAL = SymbolicConstant('VERTICAL')
-VERY_SMALL = SymbolicConstant('VERY_SMALL')
-VERY_THIN = SymbolicConstant('VERY_THIN')
-VIEW_MANIP = SymbolicConstant('VIEW_MANIP')
-VISCO = SymbolicConstant('VISCO')
-VISCOUS = SymbolicConstant('VISCOUS')
-VMS = SymbolicConstant('VMS')
-VOID = SymbolicConstant('VOID')
-VOLUME = SymbolicConstant('VOLUME')
-VOLUMETRIC = SymbolicConstant('VOLUMETRIC')
-VOLUMETRICCREEP = SymbolicConstant('VOLUMETRICCREEP')
-VOLUMETRICRELAXATION = SymbolicConstant('VOLUMETRICRELAXATION')
-VOLUMETRIC_DATA = SymbolicConstant('VOLUMETRIC_DATA')
-VOLUME_COMPRESSION = SymbolicConstant('VOLUME_COMPRESSION')
-VOLUME_FLUX = SymbolicConstant('VOLUME_FLUX')
-VOLUME_FLUX_AREA = SymbolicConstant('VOLUME_FLUX_AREA')
-VOLUME_FRACTION = SymbolicConstant('VOLUME_FRACTION')
-VOLUME_PROPORTIONAL = SymbolicConstant('VOLUME_PROPORTIONAL')
-VOL_FLUX = SymbolicConstant('VOL_FLUX')
-VOL_RATE_LEAK = SymbolicConstant('VOL_RATE_LEAK')
-VRML = SymbolicConstant('VRML')
-WARNING = SymbolicConstant('WARNING')
-WARP2D3 = SymbolicConstant('WARP2D3')
-WARP2D4 = SymbolicConstant('WARP2D4')
-WEDGE = SymbolicConstant('WEDGE')
-WEDGE15 = SymbolicConstant('WEDGE15')
-WEDGE6 = SymbolicConstant('WEDGE6')
-WEIGHTED = SymbolicConstant('WEIGHTED')
-WEIGHTED_ADD = SymbolicConstant('WEIGHTED_ADD')
-WELD = SymbolicConstant('WELD')
-WHITE_TO_BLACK = SymbolicConstant('WHITE_TO_BLACK')
-WHOLE_ELEMENT = SymbolicConstant('WHOLE_ELEMENT')
-WHOLE_MODEL = SymbolicConstant('WHOLE_MODEL')
-WHOLE_PART_INSTANCE = SymbolicConstant('WHOLE_PART_INSTANCE')
-WHOLE_REGION = SymbolicConstant('WHOLE_REGION')
-WHOLE_SURFACE = SymbolicConstant('WHOLE_SURFACE')
-WIDTH = SymbolicConstant('WIDTH')
-WINDOWS = SymbolicConstant('WINDOWS')
-WIRE = SymbolicConstant('WIRE')
-WIREFRAME = SymbolicConstant('WIREFRAME')
-WLF = SymbolicConstant('WLF')
-WRAP_AROUND = SymbolicConstant('WRAP_AROUND')
-X11 = SymbolicConstant('X11')
-XASYMM = SymbolicConstant('XASYMM')
-XAXIS = SymbolicConstant('XAXIS')
-XMARKER = SymbolicConstant('XMARKER')
-XOR = SymbolicConstant('XOR')
-XSYMM = SymbolicConstant('XSYMM')
-XYPLANE = SymbolicConstant('XYPLANE')
-XYZ = SymbolicConstant('XYZ')
-XZPLANE = SymbolicConstant('XZPLANE')
-YASYMM = SymbolicConstant('YASYMM')
-YAXIS = SymbolicConstant('YAXIS')
-YEOH = SymbolicConstant('YEOH')
-YIELD_RATIO = SymbolicConstant('YIELD_RATIO')
-YSYMM = SymbolicConstant('YSYMM')
-YZPLANE = SymbolicConstant('YZPLANE')
-ZASYMM = SymbolicConstant('ZASYMM')
-ZAXIS = SymbolicConstant('ZAXIS')
-ZERO = SymbolicConstant('ZERO')
-ZERO_PRESSURE = SymbolicConstant('ZERO_PRESSURE')
-ZSYMM = SymbolicConstant('ZSYMM')
-# okay decompiling abaqusConstants.pyc
-
-
-# encoding: utf-8
-# module abaqusConstantsSupplement
-# from D:\SIMULIA\Abaqus\6.14-4\tools\SMApy\python2.7\lib\site-packages\abaqusConstantsSupplement.pyc
-# by generator 1.147
 """
-abaqusConstantsSupplement.py
-
-This module is included by abaqusConstants and contains SymbolicConstants
-required by ABAQUS that are not defined in C++
-"""
-
-# imports
-import re as re  # D:\SIMULIA\Abaqus\6.14-4\tools\SMApy\python2.7\lib\re.pyc
-import sys as sys  # <module 'sys' (built-in)>
-import os as os  # D:\SIMULIA\Abaqus\6.14-4\tools\SMApy\python2.7\lib\os.pyc
-
-# Variables with simple values
+import os
+import re
+import sys
+import typing as _typing
+
+from abaqus.UtilityAndView.AbaqusBoolean import AbaqusBoolean
+from abaqus.UtilityAndView.SymbolicConstant import SymbolicConstant
+
+_define = SymbolicConstant._define
+
+A0 = _define('A0', 2)
+A1 = _define('A1', 3)
+A2 = _define('A2', 4)
+A3 = _define('A3', 5)
+A4 = _define('A4', 6)
+A5 = _define('A5', 7)
+ABAQUS = _define('ABAQUS', 8)
+ABAQUS_AQUA = _define('ABAQUS_AQUA', 9)
+ABAQUS_BIORID = _define('ABAQUS_BIORID', 10)
+ABAQUS_CEL = _define('ABAQUS_CEL', 11)
+ABAQUS_CFD = _define('ABAQUS_CFD', 12)
+ABAQUS_DESIGN = _define('ABAQUS_DESIGN', 13)
+ABAQUS_EXPLICIT = _define('ABAQUS_EXPLICIT', 14)
+ABAQUS_STANDARD = _define('ABAQUS_STANDARD', 15)
+ABORTED = _define('ABORTED', 16)
+ABS = _define('ABS', 17)
+ABSCISSA = _define('ABSCISSA', 18)
+ABSOLUTE = _define('ABSOLUTE', 19)
+ABSOLUTE_DIFFERENCE = _define('ABSOLUTE_DIFFERENCE', 20)
+ABSOLUTE_DISTANCE = _define('ABSOLUTE_DISTANCE', 21)
+ABSOLUTE_EQUAL = _define('ABSOLUTE_EQUAL', 22)
+ABSOLUTE_GREATER_THAN_EQUAL = _define('ABSOLUTE_GREATER_THAN_EQUAL', 23)
+ABSOLUTE_GROWTH_MOVEMENT = _define('ABSOLUTE_GROWTH_MOVEMENT', 24)
+ABSOLUTE_LESS_THAN_EQUAL = _define('ABSOLUTE_LESS_THAN_EQUAL', 25)
+ABSOLUTE_SHRINK_MOVEMENT = _define('ABSOLUTE_SHRINK_MOVEMENT', 26)
+ABSOLUTE_VALUE = _define('ABSOLUTE_VALUE', 27)
+ABS_DEFAULT = _define('ABS_DEFAULT', 28)
+AC1D2 = _define('AC1D2', 29)
+AC1D3 = _define('AC1D3', 30)
+AC2D3 = _define('AC2D3', 31)
+AC2D4 = _define('AC2D4', 32)
+AC2D4R = _define('AC2D4R', 33)
+AC2D6 = _define('AC2D6', 34)
+AC2D8 = _define('AC2D8', 35)
+AC3D10 = _define('AC3D10', 36)
+AC3D15 = _define('AC3D15', 37)
+AC3D20 = _define('AC3D20', 38)
+AC3D4 = _define('AC3D4', 39)
+AC3D6 = _define('AC3D6', 40)
+AC3D8 = _define('AC3D8', 41)
+AC3D8R = _define('AC3D8R', 42)
+ACAX3 = _define('ACAX3', 43)
+ACAX4 = _define('ACAX4', 44)
+ACAX4R = _define('ACAX4R', 45)
+ACAX6 = _define('ACAX6', 46)
+ACAX8 = _define('ACAX8', 47)
+ACCELERATION = _define('ACCELERATION', 48)
+ACCELEROMETER = _define('ACCELEROMETER', 49)
+ACIN2D2 = _define('ACIN2D2', 50)
+ACIN2D3 = _define('ACIN2D3', 51)
+ACIN3D3 = _define('ACIN3D3', 52)
+ACIN3D4 = _define('ACIN3D4', 53)
+ACIN3D6 = _define('ACIN3D6', 54)
+ACIN3D8 = _define('ACIN3D8', 55)
+ACINAX2 = _define('ACINAX2', 56)
+ACINAX3 = _define('ACINAX3', 57)
+ACOUSTIC = _define('ACOUSTIC', 58)
+ACOUSTICS = _define('ACOUSTICS', 59)
+ACOUSTIC_INTENSITY = _define('ACOUSTIC_INTENSITY', 60)
+ACROSS = _define('ACROSS', 61)
+ACTIVE_CUT_RANGE = _define('ACTIVE_CUT_RANGE', 62)
+AC_OFF = _define('AC_OFF', 63)
+AC_ON = _define('AC_ON', 64)
+AC_PROJECTION = _define('AC_PROJECTION', 65)
+ADAPTIVE_MESHING = _define('ADAPTIVE_MESHING', 66)
+ADAPTIVE_MESH_SMOOTHING_FAILED = _define('ADAPTIVE_MESH_SMOOTHING_FAILED', 67)
+ADD = _define('ADD', 68)
+ADJUST = _define('ADJUST', 69)
+ADJUST_LENGTH = _define('ADJUST_LENGTH', 70)
+ADMITTANCE = _define('ADMITTANCE', 71)
+ADVANCING_FRONT = _define('ADVANCING_FRONT', 72)
+AFTER = _define('AFTER', 73)
+AGGRESSIVE = _define('AGGRESSIVE', 74)
+AIR_BLAST = _define('AIR_BLAST', 75)
+ALGORITHM = _define('ALGORITHM', 76)
+ALIGN = _define('ALIGN', 77)
+ALL = _define('ALL', 78)
+ALLISO = _define('ALLISO', 79)
+ALLOW_SUBCYCLING = _define('ALLOW_SUBCYCLING', 80)
+ALLSTAR = _define('ALLSTAR', 81)
+ALL_DAMAGE_STEPS = _define('ALL_DAMAGE_STEPS', 82)
+ALL_DATUMS = _define('ALL_DATUMS', 83)
+ALL_DIRECT = _define('ALL_DIRECT', 84)
+ALL_DIRECT_COMPONENTS = _define('ALL_DIRECT_COMPONENTS', 85)
+ALL_DISTRIB_CONTINUUM_COUPLING = _define('ALL_DISTRIB_CONTINUUM_COUPLING', 86)
+ALL_DISTRIB_COUPLING = _define('ALL_DISTRIB_COUPLING', 87)
+ALL_DISTRIB_STRUCTURAL_COUPLING = _define('ALL_DISTRIB_STRUCTURAL_COUPLING', 88)
+ALL_EDGES = _define('ALL_EDGES', 89)
+ALL_ELEMENTS = _define('ALL_ELEMENTS', 90)
+ALL_FRAMES = _define('ALL_FRAMES', 91)
+ALL_FREQUENCIES = _define('ALL_FREQUENCIES', 92)
+ALL_GEOMETRY = _define('ALL_GEOMETRY', 93)
+ALL_INCREMENTS = _define('ALL_INCREMENTS', 94)
+ALL_KINEM_COUPLING = _define('ALL_KINEM_COUPLING', 95)
+ALL_LOCATIONS = _define('ALL_LOCATIONS', 96)
+ALL_MODAL_STEPS = _define('ALL_MODAL_STEPS', 97)
+ALL_MPCS = _define('ALL_MPCS', 98)
+ALL_NODAL_DIAMETER = _define('ALL_NODAL_DIAMETER', 99)
+ALL_NODES = _define('ALL_NODES', 100)
+ALL_NONLINEAR_STEPS = _define('ALL_NONLINEAR_STEPS', 101)
+ALL_PRINCIPALS = _define('ALL_PRINCIPALS', 102)
+ALL_PRINCIPAL_COMPONENTS = _define('ALL_PRINCIPAL_COMPONENTS', 103)
+ALL_RIGID_BODY = _define('ALL_RIGID_BODY', 104)
+ALL_SHELL_SOLID_COUPLING = _define('ALL_SHELL_SOLID_COUPLING', 105)
+ALL_STATIC_STEPS = _define('ALL_STATIC_STEPS', 106)
+ALL_SURFACES = _define('ALL_SURFACES', 107)
+ALL_TIES = _define('ALL_TIES', 108)
+ALWAYS = _define('ALWAYS', 109)
+AMBIENT = _define('AMBIENT', 110)
+AMG = _define('AMG', 111)
+AMPLITUDE = _define('AMPLITUDE', 112)
+AMS = _define('AMS', 113)
+ANALYSIS = _define('ANALYSIS', 114)
+ANALYSIS_CHECKS = _define('ANALYSIS_CHECKS', 115)
+ANALYSIS_DEFAULT = _define('ANALYSIS_DEFAULT', 116)
+ANALYSIS_PRODUCT_DEFAULT = _define('ANALYSIS_PRODUCT_DEFAULT', 117)
+ANALYTICAL_FIELD = _define('ANALYTICAL_FIELD', 118)
+ANALYTIC_RIGID_SURFACE = _define('ANALYTIC_RIGID_SURFACE', 119)
+ANGLE = _define('ANGLE', 120)
+ANGLE_0 = _define('ANGLE_0', 121)
+ANGLE_45 = _define('ANGLE_45', 122)
+ANGLE_90 = _define('ANGLE_90', 123)
+ANGLE_NEG45 = _define('ANGLE_NEG45', 124)
+ANGULAR = _define('ANGULAR', 125)
+ANGULAR_DEVIATION = _define('ANGULAR_DEVIATION', 126)
+ANGULAR_MOMENTUM = _define('ANGULAR_MOMENTUM', 127)
+ANIMATION = _define('ANIMATION', 128)
+ANISOTROPIC = _define('ANISOTROPIC', 129)
+ANNEAL = _define('ANNEAL', 130)
+ANNEALING = _define('ANNEALING', 131)
+ANTIALIASING = _define('ANTIALIASING', 132)
+ANY_JOB = _define('ANY_JOB', 133)
+ANY_MESSAGE_TYPE = _define('ANY_MESSAGE_TYPE', 134)
+APPLY_FORCE = _define('APPLY_FORCE', 135)
+AQUA = _define('AQUA', 136)
+ARC = _define('ARC', 137)
+ARC_LENGTH = _define('ARC_LENGTH', 138)
+AREA = _define('AREA', 139)
+AREA_VELOCITY_SQUARED = _define('AREA_VELOCITY_SQUARED', 140)
+ARRAY = _define('ARRAY', 141)
+ARRAY_1D = _define('ARRAY_1D', 142)
+ARRHENIUS = _define('ARRHENIUS', 143)
+ARROW = _define('ARROW', 144)
+ARRUDA_BOYCE = _define('ARRUDA_BOYCE', 145)
+ASCENDING = _define('ASCENDING', 146)
+ASI2D2 = _define('ASI2D2', 147)
+ASI2D3 = _define('ASI2D3', 148)
+ASI3D3 = _define('ASI3D3', 149)
+ASI3D4 = _define('ASI3D4', 150)
+ASI3D6 = _define('ASI3D6', 151)
+ASI3D8 = _define('ASI3D8', 152)
+ASIAX2 = _define('ASIAX2', 153)
+ASIAX3 = _define('ASIAX3', 154)
+ASPECT_RATIO = _define('ASPECT_RATIO', 155)
+ASSEMBLY = _define('ASSEMBLY', 156)
+ASSEMBLY_LOAD = _define('ASSEMBLY_LOAD', 157)
+ASSEMBLY_MAP = _define('ASSEMBLY_MAP', 158)
+ASSEMBLY_MAP_COLORS = _define('ASSEMBLY_MAP_COLORS', 159)
+ASSEMBLY_SET = _define('ASSEMBLY_SET', 160)
+AS_DISPLAYED = _define('AS_DISPLAYED', 161)
+AS_IS = _define('AS_IS', 162)
+ATTACH_TO_POINT = _define('ATTACH_TO_POINT', 163)
+ATTACH_TO_REGION = _define('ATTACH_TO_REGION', 164)
+AT_BEGINNING = _define('AT_BEGINNING', 165)
+AUGMENTED_LAGRANGE = _define('AUGMENTED_LAGRANGE', 166)
+AUGMENTED_LAGRANGE_INCOMPATIBILITIES = _define('AUGMENTED_LAGRANGE_INCOMPATIBILITIES', 167)
+AUTO = _define('AUTO', 168)
+AUTOCAD = _define('AUTOCAD', 169)
+AUTOCOMPUTE = _define('AUTOCOMPUTE', 170)
+AUTOMATIC = _define('AUTOMATIC', 171)
+AUTOMATIC_EBE = _define('AUTOMATIC_EBE', 172)
+AUTOMATIC_GLOBAL = _define('AUTOMATIC_GLOBAL', 173)
+AUTO_ALIGN = _define('AUTO_ALIGN', 174)
+AUTO_FIT = _define('AUTO_FIT', 175)
+AUTO_FIT_PTS = _define('AUTO_FIT_PTS', 176)
+AUTO_INCREMENTATION = _define('AUTO_INCREMENTATION', 177)
+AUTO_TIGHT = _define('AUTO_TIGHT', 178)
+AVERAGE = _define('AVERAGE', 179)
+AVERAGE_EDGE_LENGTH = _define('AVERAGE_EDGE_LENGTH', 180)
+AVERAGE_SIZE = _define('AVERAGE_SIZE', 181)
+AVERAGE_STRAIN = _define('AVERAGE_STRAIN', 182)
+AVERAGE_TRANSLATION = _define('AVERAGE_TRANSLATION', 183)
+AVERAGING_REGION_MAP = _define('AVERAGING_REGION_MAP', 184)
+AVERAGING_REGION_MAP_COLORS = _define('AVERAGING_REGION_MAP_COLORS', 185)
+AVI = _define('AVI', 186)
+AXIAL = _define('AXIAL', 187)
+AXIAL_FORCE_CONSTRAINT = _define('AXIAL_FORCE_CONSTRAINT', 188)
+AXISYM = _define('AXISYM', 189)
+AXISYMMETRIC = _define('AXISYMMETRIC', 190)
+AXIS_1 = _define('AXIS_1', 191)
+AXIS_2 = _define('AXIS_2', 192)
+AXIS_3 = _define('AXIS_3', 193)
+B21 = _define('B21', 194)
+B21H = _define('B21H', 195)
+B22 = _define('B22', 196)
+B22H = _define('B22H', 197)
+B23 = _define('B23', 198)
+B23H = _define('B23H', 199)
+B31 = _define('B31', 200)
+B31H = _define('B31H', 201)
+B31OS = _define('B31OS', 202)
+B31OSH = _define('B31OSH', 203)
+B32 = _define('B32', 204)
+B32H = _define('B32H', 205)
+B32OS = _define('B32OS', 206)
+B32OSH = _define('B32OSH', 207)
+B33 = _define('B33', 208)
+B33H = _define('B33H', 209)
+BACKWARD_EULER = _define('BACKWARD_EULER', 210)
+BALANCED = _define('BALANCED', 211)
+BANDED = _define('BANDED', 212)
+BAR = _define('BAR', 213)
+BASE = _define('BASE', 214)
+BATCHPRE_PHASE = _define('BATCHPRE_PHASE', 215)
+BCGS = _define('BCGS', 216)
+BC_MAP = _define('BC_MAP', 217)
+BC_MAP_COLORS = _define('BC_MAP_COLORS', 218)
+BEAM = _define('BEAM', 219)
+BEAM_MPC = _define('BEAM_MPC', 220)
+BEFORE = _define('BEFORE', 221)
+BEFORE_ANALYSIS = _define('BEFORE_ANALYSIS', 222)
+BELOW_MIN = _define('BELOW_MIN', 223)
+BENDING = _define('BENDING', 224)
+BEST_FIT = _define('BEST_FIT', 225)
+BETWEEN_CAVITIES = _define('BETWEEN_CAVITIES', 226)
+BIASED = _define('BIASED', 227)
+BIAS_MAX_SIZE = _define('BIAS_MAX_SIZE', 228)
+BIAS_METHOD = _define('BIAS_METHOD', 229)
+BIAS_MIN_SIZE = _define('BIAS_MIN_SIZE', 230)
+BIAS_RATIO = _define('BIAS_RATIO', 231)
+BIAXIAL = _define('BIAXIAL', 232)
+BIDIRECTIONAL = _define('BIDIRECTIONAL', 233)
+BILINEAR = _define('BILINEAR', 234)
+BIMOMENT = _define('BIMOMENT', 235)
+BK = _define('BK', 236)
+BLACK_AND_WHITE = _define('BLACK_AND_WHITE', 237)
+BLACK_TO_WHITE = _define('BLACK_TO_WHITE', 238)
+BLEND = _define('BLEND', 239)
+BLOCKING_ALL = _define('BLOCKING_ALL', 240)
+BLUE_TO_RED = _define('BLUE_TO_RED', 241)
+BOLT = _define('BOLT', 242)
+BOOLEAN = _define('BOOLEAN', 243)
+BOTH = _define('BOTH', 244)
+BOTHSIDES = _define('BOTHSIDES', 245)
+BOTH_SIDES = _define('BOTH_SIDES', 246)
+BOTH_SURFACES = _define('BOTH_SURFACES', 247)
+BOTTOM = _define('BOTTOM', 248)
+BOTTOM_CENTER = _define('BOTTOM_CENTER', 249)
+BOTTOM_LEFT = _define('BOTTOM_LEFT', 250)
+BOTTOM_RIGHT = _define('BOTTOM_RIGHT', 251)
+BOTTOM_SURFACE = _define('BOTTOM_SURFACE', 252)
+BOTTOM_UP = _define('BOTTOM_UP', 253)
+BOUNDARY_CONDITION = _define('BOUNDARY_CONDITION', 254)
+BOUNDARY_ONLY = _define('BOUNDARY_ONLY', 255)
+BOX_OFF = _define('BOX_OFF', 256)
+BOX_ON = _define('BOX_ON', 257)
+BUCKLE = _define('BUCKLE', 258)
+BUCKLING_MODES = _define('BUCKLING_MODES', 259)
+BUILT_INTO_BASE_STATE = _define('BUILT_INTO_BASE_STATE', 260)
+BUILT_INTO_MODES = _define('BUILT_INTO_MODES', 261)
+BULK_VISCOSITY = _define('BULK_VISCOSITY', 262)
+BUSHING = _define('BUSHING', 263)
+BY_NUMBER = _define('BY_NUMBER', 264)
+BY_SPACING = _define('BY_SPACING', 265)
+C3D10 = _define('C3D10', 266)
+C3D10E = _define('C3D10E', 267)
+C3D10H = _define('C3D10H', 268)
+C3D10I = _define('C3D10I', 269)
+C3D10M = _define('C3D10M', 270)
+C3D10MH = _define('C3D10MH', 271)
+C3D10MHT = _define('C3D10MHT', 272)
+C3D10MP = _define('C3D10MP', 273)
+C3D10MPH = _define('C3D10MPH', 274)
+C3D10MPT = _define('C3D10MPT', 275)
+C3D10MT = _define('C3D10MT', 276)
+C3D15 = _define('C3D15', 277)
+C3D15E = _define('C3D15E', 278)
+C3D15H = _define('C3D15H', 279)
+C3D20 = _define('C3D20', 280)
+C3D20E = _define('C3D20E', 281)
+C3D20H = _define('C3D20H', 282)
+C3D20HT = _define('C3D20HT', 283)
+C3D20P = _define('C3D20P', 284)
+C3D20PH = _define('C3D20PH', 285)
+C3D20R = _define('C3D20R', 286)
+C3D20RE = _define('C3D20RE', 287)
+C3D20RH = _define('C3D20RH', 288)
+C3D20RHT = _define('C3D20RHT', 289)
+C3D20RP = _define('C3D20RP', 290)
+C3D20RPH = _define('C3D20RPH', 291)
+C3D20RT = _define('C3D20RT', 292)
+C3D20T = _define('C3D20T', 293)
+C3D4 = _define('C3D4', 294)
+C3D4E = _define('C3D4E', 295)
+C3D4H = _define('C3D4H', 296)
+C3D4P = _define('C3D4P', 297)
+C3D4T = _define('C3D4T', 298)
+C3D6 = _define('C3D6', 299)
+C3D6E = _define('C3D6E', 300)
+C3D6H = _define('C3D6H', 301)
+C3D6P = _define('C3D6P', 302)
+C3D6T = _define('C3D6T', 303)
+C3D8 = _define('C3D8', 304)
+C3D8E = _define('C3D8E', 305)
+C3D8H = _define('C3D8H', 306)
+C3D8HT = _define('C3D8HT', 307)
+C3D8I = _define('C3D8I', 308)
+C3D8IH = _define('C3D8IH', 309)
+C3D8P = _define('C3D8P', 310)
+C3D8PH = _define('C3D8PH', 311)
+C3D8PHT = _define('C3D8PHT', 312)
+C3D8PT = _define('C3D8PT', 313)
+C3D8R = _define('C3D8R', 314)
+C3D8RH = _define('C3D8RH', 315)
+C3D8RHT = _define('C3D8RHT', 316)
+C3D8RP = _define('C3D8RP', 317)
+C3D8RPH = _define('C3D8RPH', 318)
+C3D8RPHT = _define('C3D8RPHT', 319)
+C3D8RPT = _define('C3D8RPT', 320)
+C3D8RT = _define('C3D8RT', 321)
+C3D8T = _define('C3D8T', 322)
+CALCULATE = _define('CALCULATE', 323)
+CALCULATOR_PHASE = _define('CALCULATOR_PHASE', 324)
+CAMERA = _define('CAMERA', 325)
+CARDAN = _define('CARDAN', 326)
+CARMAN_KOZENY = _define('CARMAN_KOZENY', 327)
+CARTESIAN = _define('CARTESIAN', 328)
+CATEGORY_BASED = _define('CATEGORY_BASED', 329)
+CAVITY = _define('CAVITY', 330)
+CAVITY_RADIATION = _define('CAVITY_RADIATION', 331)
+CAVITY_RADIATION_EMMISIVITY_TOO_LARGE = _define('CAVITY_RADIATION_EMMISIVITY_TOO_LARGE', 332)
+CAVITY_RADIATION_PARALLEL_DECOMPOSITION = _define('CAVITY_RADIATION_PARALLEL_DECOMPOSITION', 333)
+CAX3 = _define('CAX3', 334)
+CAX3E = _define('CAX3E', 335)
+CAX3H = _define('CAX3H', 336)
+CAX3T = _define('CAX3T', 337)
+CAX4 = _define('CAX4', 338)
+CAX4E = _define('CAX4E', 339)
+CAX4H = _define('CAX4H', 340)
+CAX4HT = _define('CAX4HT', 341)
+CAX4I = _define('CAX4I', 342)
+CAX4IH = _define('CAX4IH', 343)
+CAX4P = _define('CAX4P', 344)
+CAX4PH = _define('CAX4PH', 345)
+CAX4R = _define('CAX4R', 346)
+CAX4RH = _define('CAX4RH', 347)
+CAX4RHT = _define('CAX4RHT', 348)
+CAX4RP = _define('CAX4RP', 349)
+CAX4RPH = _define('CAX4RPH', 350)
+CAX4RT = _define('CAX4RT', 351)
+CAX4T = _define('CAX4T', 352)
+CAX6 = _define('CAX6', 353)
+CAX6E = _define('CAX6E', 354)
+CAX6H = _define('CAX6H', 355)
+CAX6M = _define('CAX6M', 356)
+CAX6MH = _define('CAX6MH', 357)
+CAX6MHT = _define('CAX6MHT', 358)
+CAX6MP = _define('CAX6MP', 359)
+CAX6MPH = _define('CAX6MPH', 360)
+CAX6MT = _define('CAX6MT', 361)
+CAX8 = _define('CAX8', 362)
+CAX8E = _define('CAX8E', 363)
+CAX8H = _define('CAX8H', 364)
+CAX8HT = _define('CAX8HT', 365)
+CAX8P = _define('CAX8P', 366)
+CAX8PH = _define('CAX8PH', 367)
+CAX8R = _define('CAX8R', 368)
+CAX8RE = _define('CAX8RE', 369)
+CAX8RH = _define('CAX8RH', 370)
+CAX8RHT = _define('CAX8RHT', 371)
+CAX8RP = _define('CAX8RP', 372)
+CAX8RPH = _define('CAX8RPH', 373)
+CAX8RT = _define('CAX8RT', 374)
+CAX8T = _define('CAX8T', 375)
+CAXA41 = _define('CAXA41', 376)
+CAXA42 = _define('CAXA42', 377)
+CAXA43 = _define('CAXA43', 378)
+CAXA44 = _define('CAXA44', 379)
+CAXA4H1 = _define('CAXA4H1', 380)
+CAXA4H2 = _define('CAXA4H2', 381)
+CAXA4H3 = _define('CAXA4H3', 382)
+CAXA4H4 = _define('CAXA4H4', 383)
+CAXA4R1 = _define('CAXA4R1', 384)
+CAXA4R2 = _define('CAXA4R2', 385)
+CAXA4R3 = _define('CAXA4R3', 386)
+CAXA4R4 = _define('CAXA4R4', 387)
+CAXA4RH1 = _define('CAXA4RH1', 388)
+CAXA4RH2 = _define('CAXA4RH2', 389)
+CAXA4RH3 = _define('CAXA4RH3', 390)
+CAXA4RH4 = _define('CAXA4RH4', 391)
+CAXA81 = _define('CAXA81', 392)
+CAXA82 = _define('CAXA82', 393)
+CAXA83 = _define('CAXA83', 394)
+CAXA84 = _define('CAXA84', 395)
+CAXA8H1 = _define('CAXA8H1', 396)
+CAXA8H2 = _define('CAXA8H2', 397)
+CAXA8H3 = _define('CAXA8H3', 398)
+CAXA8H4 = _define('CAXA8H4', 399)
+CAXA8P1 = _define('CAXA8P1', 400)
+CAXA8P2 = _define('CAXA8P2', 401)
+CAXA8P3 = _define('CAXA8P3', 402)
+CAXA8P4 = _define('CAXA8P4', 403)
+CAXA8R1 = _define('CAXA8R1', 404)
+CAXA8R2 = _define('CAXA8R2', 405)
+CAXA8R3 = _define('CAXA8R3', 406)
+CAXA8R4 = _define('CAXA8R4', 407)
+CAXA8RH1 = _define('CAXA8RH1', 408)
+CAXA8RH2 = _define('CAXA8RH2', 409)
+CAXA8RH3 = _define('CAXA8RH3', 410)
+CAXA8RH4 = _define('CAXA8RH4', 411)
+CAXA8RP1 = _define('CAXA8RP1', 412)
+CAXA8RP2 = _define('CAXA8RP2', 413)
+CAXA8RP3 = _define('CAXA8RP3', 414)
+CAXA8RP4 = _define('CAXA8RP4', 415)
+CCL12 = _define('CCL12', 416)
+CCL12H = _define('CCL12H', 417)
+CCL18 = _define('CCL18', 418)
+CCL18H = _define('CCL18H', 419)
+CCL24 = _define('CCL24', 420)
+CCL24H = _define('CCL24H', 421)
+CCL24R = _define('CCL24R', 422)
+CCL24RH = _define('CCL24RH', 423)
+CCL9 = _define('CCL9', 424)
+CCL9H = _define('CCL9H', 425)
+CCW = _define('CCW', 426)
+CENTER = _define('CENTER', 427)
+CENTER_LEFT = _define('CENTER_LEFT', 428)
+CENTER_OF_MASS = _define('CENTER_OF_MASS', 429)
+CENTER_RIGHT = _define('CENTER_RIGHT', 430)
+CENTROID = _define('CENTROID', 431)
+CFD = _define('CFD', 432)
+CFD_ANALYSIS = _define('CFD_ANALYSIS', 433)
+CFD_PHASE = _define('CFD_PHASE', 434)
+CG = _define('CG', 435)
+CGAX3 = _define('CGAX3', 436)
+CGAX3H = _define('CGAX3H', 437)
+CGAX3HT = _define('CGAX3HT', 438)
+CGAX3T = _define('CGAX3T', 439)
+CGAX4 = _define('CGAX4', 440)
+CGAX4H = _define('CGAX4H', 441)
+CGAX4HT = _define('CGAX4HT', 442)
+CGAX4R = _define('CGAX4R', 443)
+CGAX4RH = _define('CGAX4RH', 444)
+CGAX4RHT = _define('CGAX4RHT', 445)
+CGAX4RT = _define('CGAX4RT', 446)
+CGAX4T = _define('CGAX4T', 447)
+CGAX6 = _define('CGAX6', 448)
+CGAX6H = _define('CGAX6H', 449)
+CGAX6M = _define('CGAX6M', 450)
+CGAX6MH = _define('CGAX6MH', 451)
+CGAX6MHT = _define('CGAX6MHT', 452)
+CGAX6MT = _define('CGAX6MT', 453)
+CGAX8 = _define('CGAX8', 454)
+CGAX8H = _define('CGAX8H', 455)
+CGAX8HT = _define('CGAX8HT', 456)
+CGAX8R = _define('CGAX8R', 457)
+CGAX8RH = _define('CGAX8RH', 458)
+CGAX8RHT = _define('CGAX8RHT', 459)
+CGAX8RT = _define('CGAX8RT', 460)
+CGAX8T = _define('CGAX8T', 461)
+CGPE10 = _define('CGPE10', 462)
+CGPE10H = _define('CGPE10H', 463)
+CGPE10R = _define('CGPE10R', 464)
+CGPE10RH = _define('CGPE10RH', 465)
+CGPE5 = _define('CGPE5', 466)
+CGPE5H = _define('CGPE5H', 467)
+CGPE6 = _define('CGPE6', 468)
+CGPE6H = _define('CGPE6H', 469)
+CGPE6I = _define('CGPE6I', 470)
+CGPE6IH = _define('CGPE6IH', 471)
+CGPE6MH = _define('CGPE6MH', 472)
+CGPE6R = _define('CGPE6R', 473)
+CGPE6RH = _define('CGPE6RH', 474)
+CGPE8 = _define('CGPE8', 475)
+CGPE8H = _define('CGPE8H', 476)
+CHEBYCHEV = _define('CHEBYCHEV', 477)
+CHECKER = _define('CHECKER', 478)
+CHECK_COMPLETED = _define('CHECK_COMPLETED', 479)
+CHECK_RUNNING = _define('CHECK_RUNNING', 480)
+CHECK_SUBMITTED = _define('CHECK_SUBMITTED', 481)
+CINAX4 = _define('CINAX4', 482)
+CINAX5R = _define('CINAX5R', 483)
+CINPE4 = _define('CINPE4', 484)
+CINPE5R = _define('CINPE5R', 485)
+CINPS4 = _define('CINPS4', 486)
+CINPS5R = _define('CINPS5R', 487)
+CIRCLE = _define('CIRCLE', 488)
+CIRCLE_RADIUS = _define('CIRCLE_RADIUS', 489)
+CIRCULAR = _define('CIRCULAR', 490)
+CIRCUM = _define('CIRCUM', 491)
+CIRCUMF = _define('CIRCUMF', 492)
+CIRCUMFERENTIAL = _define('CIRCUMFERENTIAL', 493)
+CIRC_MIRROR_RECT = _define('CIRC_MIRROR_RECT', 494)
+CIRC_RECT_MIRROR = _define('CIRC_RECT_MIRROR', 495)
+CLEARANCE = _define('CLEARANCE', 496)
+CLOCKWISE = _define('CLOCKWISE', 497)
+CLOSEST = _define('CLOSEST', 498)
+CLOSEST_POINT_FRACTION = _define('CLOSEST_POINT_FRACTION', 499)
+CLOSURE_VALUE = _define('CLOSURE_VALUE', 500)
+COARSE = _define('COARSE', 501)
+COD = _define('COD', 502)
+CODEC = _define('CODEC', 503)
+COEFFICIENT = _define('COEFFICIENT', 504)
+COEFFICIENTS = _define('COEFFICIENTS', 505)
+COH2D4 = _define('COH2D4', 506)
+COH2D4P = _define('COH2D4P', 507)
+COH3D6 = _define('COH3D6', 508)
+COH3D6P = _define('COH3D6P', 509)
+COH3D8 = _define('COH3D8', 510)
+COH3D8P = _define('COH3D8P', 511)
+COHAX4 = _define('COHAX4', 512)
+COHAX4P = _define('COHAX4P', 513)
+COLOR = _define('COLOR', 514)
+COMBINED = _define('COMBINED', 515)
+COMMA_SEPARATED_VALUES = _define('COMMA_SEPARATED_VALUES', 516)
+COMPLETED = _define('COMPLETED', 517)
+COMPLEX = _define('COMPLEX', 518)
+COMPLEX_EIGENSOLVER = _define('COMPLEX_EIGENSOLVER', 519)
+COMPLEX_FREQUENCY = _define('COMPLEX_FREQUENCY', 520)
+COMPLEX_MAGNITUDE = _define('COMPLEX_MAGNITUDE', 521)
+COMPLEX_PHASE = _define('COMPLEX_PHASE', 522)
+COMPLEX_VAL_AT_ANGLE = _define('COMPLEX_VAL_AT_ANGLE', 523)
+COMPONENT = _define('COMPONENT', 524)
+COMPONENT_NUMBER = _define('COMPONENT_NUMBER', 525)
+COMPRESSEDINDEX = _define('COMPRESSEDINDEX', 526)
+COMPRESSED_VRML = _define('COMPRESSED_VRML', 527)
+COMPRESSIBLE = _define('COMPRESSIBLE', 528)
+COMPRESSION = _define('COMPRESSION', 529)
+COMPUTE = _define('COMPUTE', 530)
+COMPUTED = _define('COMPUTED', 531)
+COMPUTED_TOLERANCE = _define('COMPUTED_TOLERANCE', 532)
+COMP_DEFAULT = _define('COMP_DEFAULT', 533)
+CONCENTRIC = _define('CONCENTRIC', 534)
+CONDITION_BASED_OPTIMIZATION = _define('CONDITION_BASED_OPTIMIZATION', 535)
+CONN2D2 = _define('CONN2D2', 536)
+CONN3D2 = _define('CONN3D2', 537)
+CONNECTOR = _define('CONNECTOR', 538)
+CONNECTOR_MAP = _define('CONNECTOR_MAP', 539)
+CONNECTOR_MAP_COLORS = _define('CONNECTOR_MAP_COLORS', 540)
+CONNECTOR_PROP_MAP = _define('CONNECTOR_PROP_MAP', 541)
+CONNECTOR_PROP_MAP_COLORS = _define('CONNECTOR_PROP_MAP_COLORS', 542)
+CONNECTOR_TYPE_MAP = _define('CONNECTOR_TYPE_MAP', 543)
+CONNECTOR_TYPE_MAP_COLORS = _define('CONNECTOR_TYPE_MAP_COLORS', 544)
+CONSERVATIVE = _define('CONSERVATIVE', 545)
+CONSOLIDATION = _define('CONSOLIDATION', 546)
+CONSTANT = _define('CONSTANT', 547)
+CONSTANTPRESSURE = _define('CONSTANTPRESSURE', 548)
+CONSTANTS = _define('CONSTANTS', 549)
+CONSTANTVOLUME = _define('CONSTANTVOLUME', 550)
+CONSTANT_RATIO = _define('CONSTANT_RATIO', 551)
+CONSTANT_THROUGH_THICKNESS = _define('CONSTANT_THROUGH_THICKNESS', 552)
+CONSTANT_VELOCITY = _define('CONSTANT_VELOCITY', 553)
+CONSTRAINED_LAPLACIAN = _define('CONSTRAINED_LAPLACIAN', 554)
+CONSTRAINT = _define('CONSTRAINT', 555)
+CONSTRAINT_MAP = _define('CONSTRAINT_MAP', 556)
+CONSTRAINT_MAP_COLORS = _define('CONSTRAINT_MAP_COLORS', 557)
+CONSTRAINT_TYPE_MAP = _define('CONSTRAINT_TYPE_MAP', 558)
+CONSTRAINT_TYPE_MAP_COLORS = _define('CONSTRAINT_TYPE_MAP_COLORS', 559)
+CONSTRUCTION = _define('CONSTRUCTION', 560)
+CONTACT = _define('CONTACT', 561)
+CONTACT_ALL = _define('CONTACT_ALL', 562)
+CONTACT_EXPLICIT = _define('CONTACT_EXPLICIT', 563)
+CONTACT_PRESELECT = _define('CONTACT_PRESELECT', 564)
+CONTACT_STANDARD = _define('CONTACT_STANDARD', 565)
+CONTINUE = _define('CONTINUE', 566)
+CONTINUOUS = _define('CONTINUOUS', 567)
+CONTINUUM = _define('CONTINUUM', 568)
+CONTINUUM_SHELL = _define('CONTINUUM_SHELL', 569)
+CONTOURS_ON_DEF = _define('CONTOURS_ON_DEF', 570)
+CONTOURS_ON_UNDEF = _define('CONTOURS_ON_UNDEF', 571)
+CONTROL_POINTS = _define('CONTROL_POINTS', 572)
+CONVERGENCE = _define('CONVERGENCE', 573)
+CONVERT_SDI_OFF = _define('CONVERT_SDI_OFF', 574)
+CONVERT_SDI_ON = _define('CONVERT_SDI_ON', 575)
+CONWEP = _define('CONWEP', 576)
+COORDINATE = _define('COORDINATE', 577)
+COPLANAR_EDGES = _define('COPLANAR_EDGES', 578)
+CORIOLIS_LOAD = _define('CORIOLIS_LOAD', 579)
+CORRECTION_ACCEPTED = _define('CORRECTION_ACCEPTED', 580)
+CORRECTION_ACCEPTED_ESTIMATED_CORRECTION = _define('CORRECTION_ACCEPTED_ESTIMATED_CORRECTION', 581)
+CORRECTION_ACCEPTED_SMALL_INCREMENT = _define('CORRECTION_ACCEPTED_SMALL_INCREMENT', 582)
+CORRECTION_NOT_ACCEPTED = _define('CORRECTION_NOT_ACCEPTED', 583)
+CORRELATED = _define('CORRELATED', 584)
+COSINE = _define('COSINE', 585)
+COUNT = _define('COUNT', 586)
+COUNTERCLOCKWISE = _define('COUNTERCLOCKWISE', 587)
+COUPLED = _define('COUPLED', 588)
+COUPLED_MOTION = _define('COUPLED_MOTION', 589)
+COUPLED_POSITION = _define('COUPLED_POSITION', 590)
+COUPLED_TEMP_DISPLACEMENT = _define('COUPLED_TEMP_DISPLACEMENT', 591)
+COUPLED_THERMAL_ELECTRIC = _define('COUPLED_THERMAL_ELECTRIC', 592)
+COUPLED_THERMAL_ELECTRICAL = _define('COUPLED_THERMAL_ELECTRICAL', 593)
+COUPLED_THERMAL_ELECTRICAL_STRUCTURAL = _define('COUPLED_THERMAL_ELECTRICAL_STRUCTURAL', 594)
+COUPLED_THERMAL_STRESS = _define('COUPLED_THERMAL_STRESS', 595)
+COUPLED_TRACTION = _define('COUPLED_TRACTION', 596)
+COUPLING_FORCE_CONSTRAINT = _define('COUPLING_FORCE_CONSTRAINT', 597)
+COUPLING_MOMENT_CONSTRAINT = _define('COUPLING_MOMENT_CONSTRAINT', 598)
+CPE3 = _define('CPE3', 599)
+CPE3E = _define('CPE3E', 600)
+CPE3H = _define('CPE3H', 601)
+CPE3T = _define('CPE3T', 602)
+CPE4 = _define('CPE4', 603)
+CPE4E = _define('CPE4E', 604)
+CPE4H = _define('CPE4H', 605)
+CPE4HT = _define('CPE4HT', 606)
+CPE4I = _define('CPE4I', 607)
+CPE4IH = _define('CPE4IH', 608)
+CPE4P = _define('CPE4P', 609)
+CPE4PH = _define('CPE4PH', 610)
+CPE4R = _define('CPE4R', 611)
+CPE4RH = _define('CPE4RH', 612)
+CPE4RHT = _define('CPE4RHT', 613)
+CPE4RP = _define('CPE4RP', 614)
+CPE4RPH = _define('CPE4RPH', 615)
+CPE4RT = _define('CPE4RT', 616)
+CPE4T = _define('CPE4T', 617)
+CPE6 = _define('CPE6', 618)
+CPE6E = _define('CPE6E', 619)
+CPE6H = _define('CPE6H', 620)
+CPE6M = _define('CPE6M', 621)
+CPE6MH = _define('CPE6MH', 622)
+CPE6MHT = _define('CPE6MHT', 623)
+CPE6MP = _define('CPE6MP', 624)
+CPE6MPH = _define('CPE6MPH', 625)
+CPE6MT = _define('CPE6MT', 626)
+CPE8 = _define('CPE8', 627)
+CPE8E = _define('CPE8E', 628)
+CPE8H = _define('CPE8H', 629)
+CPE8HT = _define('CPE8HT', 630)
+CPE8P = _define('CPE8P', 631)
+CPE8PH = _define('CPE8PH', 632)
+CPE8R = _define('CPE8R', 633)
+CPE8RE = _define('CPE8RE', 634)
+CPE8RH = _define('CPE8RH', 635)
+CPE8RHT = _define('CPE8RHT', 636)
+CPE8RP = _define('CPE8RP', 637)
+CPE8RPH = _define('CPE8RPH', 638)
+CPE8RT = _define('CPE8RT', 639)
+CPE8T = _define('CPE8T', 640)
+CPEG3 = _define('CPEG3', 641)
+CPEG3H = _define('CPEG3H', 642)
+CPEG3HT = _define('CPEG3HT', 643)
+CPEG3T = _define('CPEG3T', 644)
+CPEG4 = _define('CPEG4', 645)
+CPEG4H = _define('CPEG4H', 646)
+CPEG4HT = _define('CPEG4HT', 647)
+CPEG4I = _define('CPEG4I', 648)
+CPEG4IH = _define('CPEG4IH', 649)
+CPEG4R = _define('CPEG4R', 650)
+CPEG4RH = _define('CPEG4RH', 651)
+CPEG4RT = _define('CPEG4RT', 652)
+CPEG4RHT = _define('CPEG4RHT', 653)
+CPEG4T = _define('CPEG4T', 654)
+CPEG6 = _define('CPEG6', 655)
+CPEG6H = _define('CPEG6H', 656)
+CPEG6M = _define('CPEG6M', 657)
+CPEG6MH = _define('CPEG6MH', 658)
+CPEG6MHT = _define('CPEG6MHT', 659)
+CPEG6MT = _define('CPEG6MT', 660)
+CPEG8 = _define('CPEG8', 661)
+CPEG8H = _define('CPEG8H', 662)
+CPEG8HT = _define('CPEG8HT', 663)
+CPEG8R = _define('CPEG8R', 664)
+CPEG8RH = _define('CPEG8RH', 665)
+CPEG8RT = _define('CPEG8RT', 666)
+CPEG8RHT = _define('CPEG8RHT', 667)
+CPEG8T = _define('CPEG8T', 668)
+CPS3 = _define('CPS3', 669)
+CPS3E = _define('CPS3E', 670)
+CPS3T = _define('CPS3T', 671)
+CPS4 = _define('CPS4', 672)
+CPS4E = _define('CPS4E', 673)
+CPS4I = _define('CPS4I', 674)
+CPS4R = _define('CPS4R', 675)
+CPS4RT = _define('CPS4RT', 676)
+CPS4T = _define('CPS4T', 677)
+CPS6 = _define('CPS6', 678)
+CPS6E = _define('CPS6E', 679)
+CPS6M = _define('CPS6M', 680)
+CPS6MT = _define('CPS6MT', 681)
+CPS8 = _define('CPS8', 682)
+CPS8E = _define('CPS8E', 683)
+CPS8R = _define('CPS8R', 684)
+CPS8RE = _define('CPS8RE', 685)
+CPS8RT = _define('CPS8RT', 686)
+CPS8T = _define('CPS8T', 687)
+CPU_TIME_XPL = _define('CPU_TIME_XPL', 688)
+CQC = _define('CQC', 689)
+CRACKTIP = _define('CRACKTIP', 690)
+CRACK_GROWTH = _define('CRACK_GROWTH', 691)
+CRACK_LENGTH = _define('CRACK_LENGTH', 692)
+CRACK_NORMAL = _define('CRACK_NORMAL', 693)
+CREATED = _define('CREATED', 694)
+CREEP = _define('CREEP', 695)
+CREEP_OFF = _define('CREEP_OFF', 696)
+CREEP_TEST_DATA = _define('CREEP_TEST_DATA', 697)
+CRITICAL_DAMPING_FRACTION = _define('CRITICAL_DAMPING_FRACTION', 698)
+CRITICAL_STRESS = _define('CRITICAL_STRESS', 699)
+CROSS = _define('CROSS', 700)
+CROSSED_SURFACES = _define('CROSSED_SURFACES', 701)
+CROSSING_VALUE = _define('CROSSING_VALUE', 702)
+CRUSHABLE_FOAM = _define('CRUSHABLE_FOAM', 703)
+CSYS = _define('CSYS', 704)
+CUBIC = _define('CUBIC', 705)
+CUBIC_SPLINE = _define('CUBIC_SPLINE', 706)
+CURRENT = _define('CURRENT', 707)
+CURRENT_DISPLAY_GROUP = _define('CURRENT_DISPLAY_GROUP', 708)
+CURRENT_FRAME = _define('CURRENT_FRAME', 709)
+CURVATURE = _define('CURVATURE', 710)
+CURVATURE_BASED_BY_SIZE = _define('CURVATURE_BASED_BY_SIZE', 711)
+CURVE_LEGEND = _define('CURVE_LEGEND', 712)
+CURVE_NAME = _define('CURVE_NAME', 713)
+CURVE_NAME_LEGEND = _define('CURVE_NAME_LEGEND', 714)
+CUSTOM = _define('CUSTOM', 715)
+CUT = _define('CUT', 716)
+CUT_OFF = _define('CUT_OFF', 717)
+CVJOINT = _define('CVJOINT', 718)
+CW = _define('CW', 719)
+CYCLIC_SYMMETRY = _define('CYCLIC_SYMMETRY', 720)
+CYLINDER = _define('CYLINDER', 721)
+CYLINDRICAL = _define('CYLINDRICAL', 722)
+C_INTEGRAL = _define('C_INTEGRAL', 723)
+DAMAGE = _define('DAMAGE', 724)
+DAMAGE_CRITERION = _define('DAMAGE_CRITERION', 725)
+DAMPING_COEFFICIENT = _define('DAMPING_COEFFICIENT', 726)
+DAMPING_FACTOR = _define('DAMPING_FACTOR', 727)
+DASHED = _define('DASHED', 728)
+DASHPOT1 = _define('DASHPOT1', 729)
+DASHPOT2 = _define('DASHPOT2', 730)
+DASHPOTA = _define('DASHPOTA', 731)
+DATACHECK = _define('DATACHECK', 732)
+DATUM = _define('DATUM', 733)
+DB = _define('DB', 734)
+DB2 = _define('DB2', 735)
+DC1D2 = _define('DC1D2', 736)
+DC1D2E = _define('DC1D2E', 737)
+DC1D3 = _define('DC1D3', 738)
+DC1D3E = _define('DC1D3E', 739)
+DC2D3 = _define('DC2D3', 740)
+DC2D3E = _define('DC2D3E', 741)
+DC2D4 = _define('DC2D4', 742)
+DC2D4E = _define('DC2D4E', 743)
+DC2D6 = _define('DC2D6', 744)
+DC2D6E = _define('DC2D6E', 745)
+DC2D8 = _define('DC2D8', 746)
+DC2D8E = _define('DC2D8E', 747)
+DC3D10 = _define('DC3D10', 748)
+DC3D10E = _define('DC3D10E', 749)
+DC3D15 = _define('DC3D15', 750)
+DC3D15E = _define('DC3D15E', 751)
+DC3D20 = _define('DC3D20', 752)
+DC3D20E = _define('DC3D20E', 753)
+DC3D4 = _define('DC3D4', 754)
+DC3D4E = _define('DC3D4E', 755)
+DC3D6 = _define('DC3D6', 756)
+DC3D6E = _define('DC3D6E', 757)
+DC3D8 = _define('DC3D8', 758)
+DC3D8E = _define('DC3D8E', 759)
+DCAX3 = _define('DCAX3', 760)
+DCAX3E = _define('DCAX3E', 761)
+DCAX4 = _define('DCAX4', 762)
+DCAX4E = _define('DCAX4E', 763)
+DCAX6 = _define('DCAX6', 764)
+DCAX6E = _define('DCAX6E', 765)
+DCAX8 = _define('DCAX8', 766)
+DCAX8E = _define('DCAX8E', 767)
+DCC1D2 = _define('DCC1D2', 768)
+DCC1D2D = _define('DCC1D2D', 769)
+DCC2D4 = _define('DCC2D4', 770)
+DCC2D4D = _define('DCC2D4D', 771)
+DCC3D8 = _define('DCC3D8', 772)
+DCC3D8D = _define('DCC3D8D', 773)
+DCCAX2 = _define('DCCAX2', 774)
+DCCAX2D = _define('DCCAX2D', 775)
+DCCAX4 = _define('DCCAX4', 776)
+DCCAX4D = _define('DCCAX4D', 777)
+DCOUP2D = _define('DCOUP2D', 778)
+DCOUP3D = _define('DCOUP3D', 779)
+DDM_ITERATIVE = _define('DDM_ITERATIVE', 780)
+DEACTIVATED = _define('DEACTIVATED', 781)
+DEACTIVATED_FROM_BASE_STATE = _define('DEACTIVATED_FROM_BASE_STATE', 782)
+DEBONDING = _define('DEBONDING', 783)
+DECIMAL = _define('DECIMAL', 784)
+DEFAULT = _define('DEFAULT', 785)
+DEFAULTFORMAT = _define('DEFAULTFORMAT', 786)
+DEFAULT_COLORS = _define('DEFAULT_COLORS', 787)
+DEFAULT_LIMIT = _define('DEFAULT_LIMIT', 788)
+DEFAULT_MODEL = _define('DEFAULT_MODEL', 789)
+DEFAULT_SIZE = _define('DEFAULT_SIZE', 790)
+DEFINE = _define('DEFINE', 791)
+DEFORMABLE_BODY = _define('DEFORMABLE_BODY', 792)
+DEFORMED = _define('DEFORMED', 793)
+DELAYED = _define('DELAYED', 794)
+DELETE = _define('DELETE', 795)
+DELTA_OVER_1_ITERATION = _define('DELTA_OVER_1_ITERATION', 796)
+DELTA_OVER_2_ITERATIONS = _define('DELTA_OVER_2_ITERATIONS', 797)
+DELTA_OVER_3_ITERATIONS = _define('DELTA_OVER_3_ITERATIONS', 798)
+DELTA_OVER_4_ITERATIONS = _define('DELTA_OVER_4_ITERATIONS', 799)
+DELTA_OVER_5_ITERATIONS = _define('DELTA_OVER_5_ITERATIONS', 800)
+DELTA_OVER_6_ITERATIONS = _define('DELTA_OVER_6_ITERATIONS', 801)
+DEMOLD_REGION = _define('DEMOLD_REGION', 802)
+DENSITY = _define('DENSITY', 803)
+DENSITY_ROTATIONAL_ACCELERATION = _define('DENSITY_ROTATIONAL_ACCELERATION', 804)
+DERIVED_COMPONENT = _define('DERIVED_COMPONENT', 805)
+DESCENDING = _define('DESCENDING', 806)
+DESIGN_SENSITIVITY = _define('DESIGN_SENSITIVITY', 807)
+DEVIATION_FACTOR = _define('DEVIATION_FACTOR', 808)
+DGAP = _define('DGAP', 809)
+DIFFERENCE = _define('DIFFERENCE', 810)
+DIFFUSE = _define('DIFFUSE', 811)
+DIRECT = _define('DIRECT', 812)
+DIRECTION = _define('DIRECTION', 813)
+DIRECTIONAL = _define('DIRECTIONAL', 814)
+DIRECTION_COSINE = _define('DIRECTION_COSINE', 815)
+DIRECT_COMPONENT = _define('DIRECT_COMPONENT', 816)
+DIRECT_CYCLIC = _define('DIRECT_CYCLIC', 817)
+DIRECT_INCREMENTATION = _define('DIRECT_INCREMENTATION', 818)
+DIRECT_NO_STOP_INCREMENTATION = _define('DIRECT_NO_STOP_INCREMENTATION', 819)
+DIRECT_SOLVER = _define('DIRECT_SOLVER', 820)
+DIRECT_STEADY_STATE_DYNAMIC = _define('DIRECT_STEADY_STATE_DYNAMIC', 821)
+DIRECT_SYMMETRIC = _define('DIRECT_SYMMETRIC', 822)
+DIRECT_UNSYMMETRIC = _define('DIRECT_UNSYMMETRIC', 823)
+DISABLED_BY_SYSTEM = _define('DISABLED_BY_SYSTEM', 824)
+DISABLED_BY_USER = _define('DISABLED_BY_USER', 825)
+DISABLE_THROUGHOUT_STEP = _define('DISABLE_THROUGHOUT_STEP', 826)
+DISCONTINUITIES = _define('DISCONTINUITIES', 827)
+DISCRETE = _define('DISCRETE', 828)
+DISCRETE_FIELD = _define('DISCRETE_FIELD', 829)
+DISCRETE_RIGID_SURFACE = _define('DISCRETE_RIGID_SURFACE', 830)
+DISK = _define('DISK', 831)
+DISPLACEMENT = _define('DISPLACEMENT', 832)
+DISPLACEMENT_FIELD = _define('DISPLACEMENT_FIELD', 833)
+DISPLAY_GROUPS = _define('DISPLAY_GROUPS', 834)
+DISPLAY_GRP_MAP = _define('DISPLAY_GRP_MAP', 835)
+DISPLAY_GRP_MAP_COLORS = _define('DISPLAY_GRP_MAP_COLORS', 836)
+DISSIPATED_ENERGY_FRACTION = _define('DISSIPATED_ENERGY_FRACTION', 837)
+DISTRIBUTING = _define('DISTRIBUTING', 838)
+DISTRIBUTING_COUPLING = _define('DISTRIBUTING_COUPLING', 839)
+DIVIDE = _define('DIVIDE', 840)
+DMASS_XPL = _define('DMASS_XPL', 841)
+DOF_MODE = _define('DOF_MODE', 842)
+DOF_MODE_MPC = _define('DOF_MODE_MPC', 843)
+DOMAIN = _define('DOMAIN', 844)
+DOTTED = _define('DOTTED', 845)
+DOT_DASH = _define('DOT_DASH', 846)
+DOUBLE = _define('DOUBLE', 847)
+DOUBLE_CONSTRAINT_ONLY = _define('DOUBLE_CONSTRAINT_ONLY', 848)
+DOUBLE_PLUS_PACK = _define('DOUBLE_PLUS_PACK', 849)
+DOUBLE_PRECISION = _define('DOUBLE_PRECISION', 850)
+DOUBLE_SIDED = _define('DOUBLE_SIDED', 851)
+DPI_1200 = _define('DPI_1200', 852)
+DPI_150 = _define('DPI_150', 853)
+DPI_300 = _define('DPI_300', 854)
+DPI_450 = _define('DPI_450', 855)
+DPI_600 = _define('DPI_600', 856)
+DPI_75 = _define('DPI_75', 857)
+DRAG2D = _define('DRAG2D', 858)
+DRAG3D = _define('DRAG3D', 859)
+DS3 = _define('DS3', 860)
+DS4 = _define('DS4', 861)
+DS6 = _define('DS6', 862)
+DS8 = _define('DS8', 863)
+DSAX1 = _define('DSAX1', 864)
+DSAX2 = _define('DSAX2', 865)
+DSC = _define('DSC', 866)
+DUPLICATE_NODES = _define('DUPLICATE_NODES', 867)
+DURING_ANALYSIS = _define('DURING_ANALYSIS', 868)
+DYNAMIC = _define('DYNAMIC', 869)
+DYNAMIC_EXPLICIT = _define('DYNAMIC_EXPLICIT', 870)
+DYNAMIC_IMPLICIT = _define('DYNAMIC_IMPLICIT', 871)
+DYNAMIC_SUBSPACE = _define('DYNAMIC_SUBSPACE', 872)
+DYNAMIC_TEMP_DISPLACEMENT = _define('DYNAMIC_TEMP_DISPLACEMENT', 873)
+EC3D8R = _define('EC3D8R', 874)
+EC3D8RT = _define('EC3D8RT', 875)
+ECURRENT_AREA_TIME = _define('ECURRENT_AREA_TIME', 876)
+EDGE = _define('EDGE', 877)
+EDGE1 = _define('EDGE1', 878)
+EDGE2 = _define('EDGE2', 879)
+EDGE3 = _define('EDGE3', 880)
+EDGE4 = _define('EDGE4', 881)
+EDGES = _define('EDGES', 882)
+EDGETOEDGE = _define('EDGETOEDGE', 883)
+EDGETOFACE = _define('EDGETOFACE', 884)
+EDGE_LIST = _define('EDGE_LIST', 885)
+EDGE_SEEDING_METHOD = _define('EDGE_SEEDING_METHOD', 886)
+EIGENFREQUENCY = _define('EIGENFREQUENCY', 887)
+EIGENVALUE_BUCKLING = _define('EIGENVALUE_BUCKLING', 888)
+EITHER = _define('EITHER', 889)
+ELASTIC = _define('ELASTIC', 890)
+ELASTIC_PLASTIC = _define('ELASTIC_PLASTIC', 891)
+ELBOW31 = _define('ELBOW31', 892)
+ELBOW31B = _define('ELBOW31B', 893)
+ELBOW31C = _define('ELBOW31C', 894)
+ELBOW32 = _define('ELBOW32', 895)
+ELBOW_MPC = _define('ELBOW_MPC', 896)
+ELECTRICAL = _define('ELECTRICAL', 897)
+ELECTRICAL_CONTACT = _define('ELECTRICAL_CONTACT', 898)
+ELECTRICAL_POTENTIAL_FIELD = _define('ELECTRICAL_POTENTIAL_FIELD', 899)
+ELECTRIC_CHARGE = _define('ELECTRIC_CHARGE', 900)
+ELECTRIC_CURRENT = _define('ELECTRIC_CURRENT', 901)
+ELECTRIC_CURRENT_AREA = _define('ELECTRIC_CURRENT_AREA', 902)
+ELECTRIC_POTENTIAL = _define('ELECTRIC_POTENTIAL', 903)
+ELECTROMAGNETIC_TIME_HARMONIC = _define('ELECTROMAGNETIC_TIME_HARMONIC', 904)
+ELEMENT = _define('ELEMENT', 905)
+ELEMENTS = _define('ELEMENTS', 906)
+ELEMENT_ALL = _define('ELEMENT_ALL', 907)
+ELEMENT_BY_ELEMENT_INCREMENTATION = _define('ELEMENT_BY_ELEMENT_INCREMENTATION', 908)
+ELEMENT_CENTER_PROJECTION = _define('ELEMENT_CENTER_PROJECTION', 909)
+ELEMENT_CENTROID = _define('ELEMENT_CENTROID', 910)
+ELEMENT_FACE = _define('ELEMENT_FACE', 911)
+ELEMENT_FACE_INTEGRATION_POINT = _define('ELEMENT_FACE_INTEGRATION_POINT', 912)
+ELEMENT_NODAL = _define('ELEMENT_NODAL', 913)
+ELEMENT_NODES = _define('ELEMENT_NODES', 914)
+ELEMENT_PRESELECT = _define('ELEMENT_PRESELECT', 915)
+ELEMENT_SET = _define('ELEMENT_SET', 916)
+ELEM_SHAPE = _define('ELEM_SHAPE', 917)
+ELLIPSE = _define('ELLIPSE', 918)
+ELLIPTICAL = _define('ELLIPTICAL', 919)
+ELSET_MAP = _define('ELSET_MAP', 920)
+ELSET_MAP_COLORS = _define('ELSET_MAP_COLORS', 921)
+ELTYPE_MAP = _define('ELTYPE_MAP', 922)
+ELTYPE_MAP_COLORS = _define('ELTYPE_MAP_COLORS', 923)
+EMAG = _define('EMAG', 924)
+EMBEDDED_COEFF = _define('EMBEDDED_COEFF', 925)
+EMBEDDED_ELEMENT = _define('EMBEDDED_ELEMENT', 926)
+EMC2D3 = _define('EMC2D3', 927)
+EMC2D4 = _define('EMC2D4', 928)
+EMC3D4 = _define('EMC3D4', 929)
+EMC3D6 = _define('EMC3D6', 930)
+EMC3D8 = _define('EMC3D8', 931)
+EMF = _define('EMF', 932)
+EMPTY_FIELD = _define('EMPTY_FIELD', 933)
+EMPTY_LEAF = _define('EMPTY_LEAF', 934)
+ENABLED = _define('ENABLED', 935)
+ENCASTRE = _define('ENCASTRE', 936)
+END = _define('END', 937)
+END1 = _define('END1', 938)
+END2 = _define('END2', 939)
+END3 = _define('END3', 940)
+END_FRAME_TIME = _define('END_FRAME_TIME', 941)
+END_RELEASE = _define('END_RELEASE', 942)
+END_STEP = _define('END_STEP', 943)
+ENERGY = _define('ENERGY', 944)
+ENERGY_ALL = _define('ENERGY_ALL', 945)
+ENERGY_DENSITY = _define('ENERGY_DENSITY', 946)
+ENERGY_NONE = _define('ENERGY_NONE', 947)
+ENERGY_PRESELECT = _define('ENERGY_PRESELECT', 948)
+ENERGY_RELEASE_RATE = _define('ENERGY_RELEASE_RATE', 949)
+ENERGY_TYPE = _define('ENERGY_TYPE', 950)
+ENFORCEMENT_OFF = _define('ENFORCEMENT_OFF', 951)
+ENFORCEMENT_ON = _define('ENFORCEMENT_ON', 952)
+ENGINEERING = _define('ENGINEERING', 953)
+ENGINEERING_CONSTANTS = _define('ENGINEERING_CONSTANTS', 954)
+ENHANCED = _define('ENHANCED', 955)
+ENHANCED_VCCT = _define('ENHANCED_VCCT', 956)
+ENTEREDCOORD = _define('ENTEREDCOORD', 957)
+ENUMERATION = _define('ENUMERATION', 958)
+ENVELOPE = _define('ENVELOPE', 959)
+EPOTENTIAL_GRADIENT = _define('EPOTENTIAL_GRADIENT', 960)
+EPS = _define('EPS', 961)
+EQUAL = _define('EQUAL', 962)
+EQUALRADIUS = _define('EQUALRADIUS', 963)
+EQUATION = _define('EQUATION', 964)
+EQUILIBRIUM = _define('EQUILIBRIUM', 965)
+EQUIV_STRESS = _define('EQUIV_STRESS', 966)
+ERROR = _define('ERROR', 967)
+ETOTAL_XPL = _define('ETOTAL_XPL', 968)
+EULER = _define('EULER', 969)
+EULERIAN = _define('EULERIAN', 970)
+EVENT_ACCELERATION = _define('EVENT_ACCELERATION', 971)
+EVENT_DISPLACEMENT = _define('EVENT_DISPLACEMENT', 972)
+EVENT_GRAVITY = _define('EVENT_GRAVITY', 973)
+EVENT_VELOCITY = _define('EVENT_VELOCITY', 974)
+EVERY_CYCLE = _define('EVERY_CYCLE', 975)
+EVERY_NCYCLES = _define('EVERY_NCYCLES', 976)
+EVERY_TIME_INCREMENT = _define('EVERY_TIME_INCREMENT', 977)
+EXACT = _define('EXACT', 978)
+EXACT_TARGETS = _define('EXACT_TARGETS', 979)
+EXCESSIVE_DISTORTION = _define('EXCESSIVE_DISTORTION', 980)
+EXCESSIVE_ELEMENT_DISTORTION = _define('EXCESSIVE_ELEMENT_DISTORTION', 981)
+EXCESSIVE_STRAIN_INCREMENT = _define('EXCESSIVE_STRAIN_INCREMENT', 982)
+EXCLUDE = _define('EXCLUDE', 983)
+EXPLICIT = _define('EXPLICIT', 984)
+EXPLICIT_ANALYSIS = _define('EXPLICIT_ANALYSIS', 985)
+EXPLICIT_DYNAMIC = _define('EXPLICIT_DYNAMIC', 986)
+EXPLICIT_ONLY = _define('EXPLICIT_ONLY', 987)
+EXPLICIT_PHASE = _define('EXPLICIT_PHASE', 988)
+EXPONENTIAL = _define('EXPONENTIAL', 989)
+EXPONENTIAL_DECAY = _define('EXPONENTIAL_DECAY', 990)
+EXPONENTIAL_LAW = _define('EXPONENTIAL_LAW', 991)
+EXPORT_STEP_SIZE = _define('EXPORT_STEP_SIZE', 992)
+EXTERIOR = _define('EXTERIOR', 993)
+EXTERNAL = _define('EXTERNAL', 994)
+EXTRAPOLATE_AVERAGE_COMPUTE = _define('EXTRAPOLATE_AVERAGE_COMPUTE', 995)
+EXTRAPOLATE_COMPUTE = _define('EXTRAPOLATE_COMPUTE', 996)
+EXTRAPOLATE_COMPUTE_AVERAGE = _define('EXTRAPOLATE_COMPUTE_AVERAGE', 997)
+EXTRAPOLATE_COMPUTE_DISCONTINUITIES = _define('EXTRAPOLATE_COMPUTE_DISCONTINUITIES', 998)
+EXTRA_COARSE = _define('EXTRA_COARSE', 999)
+EXTRA_FINE = _define('EXTRA_FINE', 1000)
+F2D2 = _define('F2D2', 1001)
+F3D3 = _define('F3D3', 1002)
+F3D4 = _define('F3D4', 1003)
+FACE1 = _define('FACE1', 1004)
+FACE2 = _define('FACE2', 1005)
+FACE3 = _define('FACE3', 1006)
+FACE4 = _define('FACE4', 1007)
+FACE5 = _define('FACE5', 1008)
+FACE6 = _define('FACE6', 1009)
+FACETOEDGE = _define('FACETOEDGE', 1010)
+FACETOFACE = _define('FACETOFACE', 1011)
+FACETS = _define('FACETS', 1012)
+FACE_CENTERED = _define('FACE_CENTERED', 1013)
+FACE_UNKNOWN = _define('FACE_UNKNOWN', 1014)
+FACTOR = _define('FACTOR', 1015)
+FARTHEST_POINT_FRACTION = _define('FARTHEST_POINT_FRACTION', 1016)
+FAST = _define('FAST', 1017)
+FASTENER = _define('FASTENER', 1018)
+FATIGUE = _define('FATIGUE', 1019)
+FAX2 = _define('FAX2', 1020)
+FC3D4 = _define('FC3D4', 1021)
+FC3D5 = _define('FC3D5', 1022)
+FC3D6 = _define('FC3D6', 1023)
+FC3D8 = _define('FC3D8', 1024)
+FEATURE = _define('FEATURE', 1025)
+FE_SAFE = _define('FE_SAFE', 1026)
+FGMRES = _define('FGMRES', 1027)
+FICK = _define('FICK', 1028)
+FIELD = _define('FIELD', 1029)
+FIELDREPORTFORMAT = _define('FIELDREPORTFORMAT', 1030)
+FIELD_OUTPUT = _define('FIELD_OUTPUT', 1031)
+FIELD_THICKNESS = _define('FIELD_THICKNESS', 1032)
+FILE = _define('FILE', 1033)
+FILL = _define('FILL', 1034)
+FILLED = _define('FILLED', 1035)
+FILLED_ARROW = _define('FILLED_ARROW', 1036)
+FILLED_CIRCLE = _define('FILLED_CIRCLE', 1037)
+FILLED_DIAMOND = _define('FILLED_DIAMOND', 1038)
+FILLED_SQUARE = _define('FILLED_SQUARE', 1039)
+FILLED_TRI = _define('FILLED_TRI', 1040)
+FILTER = _define('FILTER', 1041)
+FINE = _define('FINE', 1042)
+FINER = _define('FINER', 1043)
+FINITE = _define('FINITE', 1044)
+FIRST = _define('FIRST', 1045)
+FIRST_AND_LAST = _define('FIRST_AND_LAST', 1046)
+FIRST_CYCLE = _define('FIRST_CYCLE', 1047)
+FIRST_FRAME = _define('FIRST_FRAME', 1048)
+FIRST_ORDER_ADVECTION = _define('FIRST_ORDER_ADVECTION', 1049)
+FIRST_STEP = _define('FIRST_STEP', 1050)
+FITTED_VALUE = _define('FITTED_VALUE', 1051)
+FIT_HEIGHT = _define('FIT_HEIGHT', 1052)
+FIT_TO_PAGE = _define('FIT_TO_PAGE', 1053)
+FIT_TO_VIEWPORT = _define('FIT_TO_VIEWPORT', 1054)
+FIT_WIDTH = _define('FIT_WIDTH', 1055)
+FIXED = _define('FIXED', 1056)
+FIXED_CFL = _define('FIXED_CFL', 1057)
+FIXED_DOF = _define('FIXED_DOF', 1058)
+FIXED_EBE = _define('FIXED_EBE', 1059)
+FIXED_INCREMENTATION = _define('FIXED_INCREMENTATION', 1060)
+FIXED_TIME = _define('FIXED_TIME', 1061)
+FIXED_USER_DEFINED_INC = _define('FIXED_USER_DEFINED_INC', 1062)
+FIX_LENGTH = _define('FIX_LENGTH', 1063)
+FIX_NONE = _define('FIX_NONE', 1064)
+FLD = _define('FLD', 1065)
+FLEXIBLE = _define('FLEXIBLE', 1066)
+FLEXION_TORSION = _define('FLEXION_TORSION', 1067)
+FLINK = _define('FLINK', 1068)
+FLOAT = _define('FLOAT', 1069)
+FLOW = _define('FLOW', 1070)
+FLOW_CONVERTER = _define('FLOW_CONVERTER', 1071)
+FLUID = _define('FLUID', 1072)
+FLUID_PRESSURE_FIELD = _define('FLUID_PRESSURE_FIELD', 1073)
+FOLLOW = _define('FOLLOW', 1074)
+FONT = _define('FONT', 1075)
+FORCE = _define('FORCE', 1076)
+FORCE_SINGLE = _define('FORCE_SINGLE', 1077)
+FORCE_VOLUME = _define('FORCE_VOLUME', 1078)
+FORMULA = _define('FORMULA', 1079)
+FORWARD = _define('FORWARD', 1080)
+FRACTION = _define('FRACTION', 1081)
+FRACTIONAL = _define('FRACTIONAL', 1082)
+FRACTURE_MECHANICS = _define('FRACTURE_MECHANICS', 1083)
+FRAME2D = _define('FRAME2D', 1084)
+FRAME3D = _define('FRAME3D', 1085)
+FRAME_BASED = _define('FRAME_BASED', 1086)
+FRAME_VALUE = _define('FRAME_VALUE', 1087)
+FREE = _define('FREE', 1088)
+FREED = _define('FREED', 1089)
+FREE_FORM = _define('FREE_FORM', 1090)
+FREE_TASK_REGION_EQUIV_STRESS = _define('FREE_TASK_REGION_EQUIV_STRESS', 1091)
+FREQUENCY = _define('FREQUENCY', 1092)
+FREQUENCY_DATA = _define('FREQUENCY_DATA', 1093)
+FREQUENCY_RANGE = _define('FREQUENCY_RANGE', 1094)
+FRICTIONLESS = _define('FRICTIONLESS', 1095)
+FROM_ASCII_FILE = _define('FROM_ASCII_FILE', 1096)
+FROM_FILE = _define('FROM_FILE', 1097)
+FROM_FILE_AND_USER_DEFINED = _define('FROM_FILE_AND_USER_DEFINED', 1098)
+FROM_GEOMETRY = _define('FROM_GEOMETRY', 1099)
+FROM_KEYBOARD = _define('FROM_KEYBOARD', 1100)
+FROM_ODB = _define('FROM_ODB', 1101)
+FROM_OPERATION = _define('FROM_OPERATION', 1102)
+FROM_SECTION = _define('FROM_SECTION', 1103)
+FROM_USER_DEFINED = _define('FROM_USER_DEFINED', 1104)
+FULL = _define('FULL', 1105)
+FULLY = _define('FULLY', 1106)
+FULL_CYCLE = _define('FULL_CYCLE', 1107)
+FULL_FIELD = _define('FULL_FIELD', 1108)
+FULL_NEWTON = _define('FULL_NEWTON', 1109)
+FUNG_ANISOTROPIC = _define('FUNG_ANISOTROPIC', 1110)
+FUNG_ORTHOTROPIC = _define('FUNG_ORTHOTROPIC', 1111)
+G = _define('G', 1112)
+GALERKIN = _define('GALERKIN', 1113)
+GAPCYL = _define('GAPCYL', 1114)
+GAPSPHER = _define('GAPSPHER', 1115)
+GAPUNI = _define('GAPUNI', 1116)
+GAPUNIT = _define('GAPUNIT', 1117)
+GASKET = _define('GASKET', 1118)
+GAUSS = _define('GAUSS', 1119)
+GAUSS_COUPLING = _define('GAUSS_COUPLING', 1120)
+GENERAL = _define('GENERAL', 1121)
+GENERALIZED = _define('GENERALIZED', 1122)
+GENERALIZED_BEAM = _define('GENERALIZED_BEAM', 1123)
+GENERALIZED_DECAY = _define('GENERALIZED_DECAY', 1124)
+GENERALIZED_SHELL = _define('GENERALIZED_SHELL', 1125)
+GENERAL_OPTIMIZATION = _define('GENERAL_OPTIMIZATION', 1126)
+GENERAL_PARTICLE = _define('GENERAL_PARTICLE', 1127)
+GEOMETRY = _define('GEOMETRY', 1128)
+GEOMETRYFORMAT = _define('GEOMETRYFORMAT', 1129)
+GEOMETRY_ENHANCED = _define('GEOMETRY_ENHANCED', 1130)
+GEOM_DEVIATION_FACTOR = _define('GEOM_DEVIATION_FACTOR', 1131)
+GEOSTATIC = _define('GEOSTATIC', 1132)
+GFI = _define('GFI', 1133)
+GIGA_BYTES = _define('GIGA_BYTES', 1134)
+GK2D2 = _define('GK2D2', 1135)
+GK2D2N = _define('GK2D2N', 1136)
+GK3D12M = _define('GK3D12M', 1137)
+GK3D12MN = _define('GK3D12MN', 1138)
+GK3D18 = _define('GK3D18', 1139)
+GK3D18N = _define('GK3D18N', 1140)
+GK3D2 = _define('GK3D2', 1141)
+GK3D2N = _define('GK3D2N', 1142)
+GK3D4L = _define('GK3D4L', 1143)
+GK3D4LN = _define('GK3D4LN', 1144)
+GK3D6 = _define('GK3D6', 1145)
+GK3D6L = _define('GK3D6L', 1146)
+GK3D6LN = _define('GK3D6LN', 1147)
+GK3D6N = _define('GK3D6N', 1148)
+GK3D8 = _define('GK3D8', 1149)
+GK3D8N = _define('GK3D8N', 1150)
+GKAX2 = _define('GKAX2', 1151)
+GKAX2N = _define('GKAX2N', 1152)
+GKAX4 = _define('GKAX4', 1153)
+GKAX4N = _define('GKAX4N', 1154)
+GKAX6 = _define('GKAX6', 1155)
+GKAX6N = _define('GKAX6N', 1156)
+GKPE4 = _define('GKPE4', 1157)
+GKPE6 = _define('GKPE6', 1158)
+GKPS4 = _define('GKPS4', 1159)
+GKPS4N = _define('GKPS4N', 1160)
+GKPS6 = _define('GKPS6', 1161)
+GKPS6N = _define('GKPS6N', 1162)
+GLOBAL = _define('GLOBAL', 1163)
+GLOBAL_NONE = _define('GLOBAL_NONE', 1164)
+GLOBAL_X = _define('GLOBAL_X', 1165)
+GLOBAL_Y = _define('GLOBAL_Y', 1166)
+GLOBAL_Z = _define('GLOBAL_Z', 1167)
+GOURAUD = _define('GOURAUD', 1168)
+GRADED = _define('GRADED', 1169)
+GRADIENT = _define('GRADIENT', 1170)
+GRADIENTS = _define('GRADIENTS', 1171)
+GRADIENTS_THROUGH_BEAM_CS = _define('GRADIENTS_THROUGH_BEAM_CS', 1172)
+GRADIENTS_THROUGH_SHELL_CS = _define('GRADIENTS_THROUGH_SHELL_CS', 1173)
+GRAVITY = _define('GRAVITY', 1174)
+GREATER_THAN = _define('GREATER_THAN', 1175)
+GREATER_THAN_EQUAL = _define('GREATER_THAN_EQUAL', 1176)
+GREYSCALE = _define('GREYSCALE', 1177)
+GRID = _define('GRID', 1178)
+GROUND = _define('GROUND', 1179)
+GROUP_BY_MATERIAL = _define('GROUP_BY_MATERIAL', 1180)
+GROWTH_MOVEMENT = _define('GROWTH_MOVEMENT', 1181)
+GRP = _define('GRP', 1182)
+HALF = _define('HALF', 1183)
+HALF_CYCLE = _define('HALF_CYCLE', 1184)
+HALF_INDEX_SHIFT = _define('HALF_INDEX_SHIFT', 1185)
+HALF_OF_AVERAGE = _define('HALF_OF_AVERAGE', 1186)
+HARD = _define('HARD', 1187)
+HARDWARE_OVERLAY = _define('HARDWARE_OVERLAY', 1188)
+HARMONIC = _define('HARMONIC', 1189)
+HEADING = _define('HEADING', 1190)
+HEALER_TYPE = _define('HEALER_TYPE', 1191)
+HEATCAP = _define('HEATCAP', 1192)
+HEAT_FLUX = _define('HEAT_FLUX', 1193)
+HEAT_FLUX_AREA = _define('HEAT_FLUX_AREA', 1194)
+HEAT_FLUX_RATE = _define('HEAT_FLUX_RATE', 1195)
+HEAT_FLUX_VOLUME = _define('HEAT_FLUX_VOLUME', 1196)
+HEAT_TRANSFER = _define('HEAT_TRANSFER', 1197)
+HEIGHT = _define('HEIGHT', 1198)
+HEX = _define('HEX', 1199)
+HEX20 = _define('HEX20', 1200)
+HEX8 = _define('HEX8', 1201)
+HEX_DOMINATED = _define('HEX_DOMINATED', 1202)
+HIDDEN = _define('HIDDEN', 1203)
+HIGH = _define('HIGH', 1204)
+HINGE = _define('HINGE', 1205)
+HISTORY = _define('HISTORY', 1206)
+HOLLOW_CIRCLE = _define('HOLLOW_CIRCLE', 1207)
+HOLLOW_DIAMOND = _define('HOLLOW_DIAMOND', 1208)
+HOLLOW_SQUARE = _define('HOLLOW_SQUARE', 1209)
+HOLLOW_TRI = _define('HOLLOW_TRI', 1210)
+HOLZAPFEL = _define('HOLZAPFEL', 1211)
+HOME = _define('HOME', 1212)
+HORIZONTAL = _define('HORIZONTAL', 1213)
+HYBRID = _define('HYBRID', 1214)
+HYDRAULIC = _define('HYDRAULIC', 1215)
+HYDROSTATIC = _define('HYDROSTATIC', 1216)
+HYDROSTATIC_FLUID_MODELING = _define('HYDROSTATIC_FLUID_MODELING', 1217)
+HYPERBOLIC = _define('HYPERBOLIC', 1218)
+HYPERBOLIC_SINE = _define('HYPERBOLIC_SINE', 1219)
+HYSTERESIS_INITIAL_GUESSES_EXHAUSTED = _define('HYSTERESIS_INITIAL_GUESSES_EXHAUSTED', 1220)
+HYSTERESIS_JACOBIAN_CANNOT_BE_INVERTED = _define('HYSTERESIS_JACOBIAN_CANNOT_BE_INVERTED', 1221)
+ICC = _define('ICC', 1222)
+IDEALGAS = _define('IDEALGAS', 1223)
+IDENTICAL = _define('IDENTICAL', 1224)
+IDENTITY = _define('IDENTITY', 1225)
+IGNITIONANDGROWTH = _define('IGNITIONANDGROWTH', 1226)
+IMAGINARY = _define('IMAGINARY', 1227)
+IMMEDIATE = _define('IMMEDIATE', 1228)
+IMPEDANCE = _define('IMPEDANCE', 1229)
+IMPERFECTION = _define('IMPERFECTION', 1230)
+IMPLICIT = _define('IMPLICIT', 1231)
+IMPLICIT_DYNAMIC = _define('IMPLICIT_DYNAMIC', 1232)
+IMPLICIT_EXPLICIT = _define('IMPLICIT_EXPLICIT', 1233)
+IMPORT = _define('IMPORT', 1234)
+IMPORT_STEP_SIZE = _define('IMPORT_STEP_SIZE', 1235)
+IMPRINT = _define('IMPRINT', 1236)
+IMPROVED = _define('IMPROVED', 1237)
+INCHES = _define('INCHES', 1238)
+INCLUDE = _define('INCLUDE', 1239)
+INCOMPRESSIBLE = _define('INCOMPRESSIBLE', 1240)
+INCREMENT = _define('INCREMENT', 1241)
+INCREMENTAL = _define('INCREMENTAL', 1242)
+INCREMENTATION = _define('INCREMENTATION', 1243)
+INCREMENTATION_ALL = _define('INCREMENTATION_ALL', 1244)
+INCREMENTATION_PRESELECT = _define('INCREMENTATION_PRESELECT', 1245)
+INC_SIZE = _define('INC_SIZE', 1246)
+INDEPENDENT = _define('INDEPENDENT', 1247)
+INDEX = _define('INDEX', 1248)
+INERTIA_RELIEF = _define('INERTIA_RELIEF', 1249)
+INFILTRATION = _define('INFILTRATION', 1250)
+INFINITE = _define('INFINITE', 1251)
+INFLOW = _define('INFLOW', 1252)
+INITIAL = _define('INITIAL', 1253)
+INITIAL_AND_LAST = _define('INITIAL_AND_LAST', 1254)
+INITIAL_CONDITION = _define('INITIAL_CONDITION', 1255)
+INITIAL_NODES = _define('INITIAL_NODES', 1256)
+INITIAL_OPENINGS = _define('INITIAL_OPENINGS', 1257)
+INITIAL_OVERCLOSURES = _define('INITIAL_OVERCLOSURES', 1258)
+INITIAL_OVERCLOSURES_EXPLICIT = _define('INITIAL_OVERCLOSURES_EXPLICIT', 1259)
+INPUT = _define('INPUT', 1260)
+INPUT_FILE = _define('INPUT_FILE', 1261)
+INSIDE = _define('INSIDE', 1262)
+INSTANCE = _define('INSTANCE', 1263)
+INSTANCE_FROM_INSTANCE = _define('INSTANCE_FROM_INSTANCE', 1264)
+INSTANCE_FROM_PART = _define('INSTANCE_FROM_PART', 1265)
+INSTANCE_MAP = _define('INSTANCE_MAP', 1266)
+INSTANCE_MAP_COLORS = _define('INSTANCE_MAP_COLORS', 1267)
+INSTANCE_NOT_APPLICABLE = _define('INSTANCE_NOT_APPLICABLE', 1268)
+INSTANCE_TYPE_MAP = _define('INSTANCE_TYPE_MAP', 1269)
+INSTANCE_TYPE_MAP_COLORS = _define('INSTANCE_TYPE_MAP_COLORS', 1270)
+INSTANTANEOUS = _define('INSTANTANEOUS', 1271)
+INTEGER = _define('INTEGER', 1272)
+INTEGRATED_ALL = _define('INTEGRATED_ALL', 1273)
+INTEGRATED_PRESELECT = _define('INTEGRATED_PRESELECT', 1274)
+INTEGRATION_POINT = _define('INTEGRATION_POINT', 1275)
+INTEGRATION_POINTS = _define('INTEGRATION_POINTS', 1276)
+INTERACTION_MAP = _define('INTERACTION_MAP', 1277)
+INTERACTION_MAP_COLORS = _define('INTERACTION_MAP_COLORS', 1278)
+INTERACTION_PROP_MAP = _define('INTERACTION_PROP_MAP', 1279)
+INTERACTION_PROP_MAP_COLORS = _define('INTERACTION_PROP_MAP_COLORS', 1280)
+INTERACTION_TYPE_MAP = _define('INTERACTION_TYPE_MAP', 1281)
+INTERACTION_TYPE_MAP_COLORS = _define('INTERACTION_TYPE_MAP_COLORS', 1282)
+INTERFERENCE = _define('INTERFERENCE', 1283)
+INTERNAL = _define('INTERNAL', 1284)
+INTERNAL_SET_MAP = _define('INTERNAL_SET_MAP', 1285)
+INTERNAL_SET_MAP_COLORS = _define('INTERNAL_SET_MAP_COLORS', 1286)
+INTERNAL_SURFACE_MAP = _define('INTERNAL_SURFACE_MAP', 1287)
+INTERNAL_SURFACE_MAP_COLORS = _define('INTERNAL_SURFACE_MAP_COLORS', 1288)
+INTERPOLATED = _define('INTERPOLATED', 1289)
+INTERPOLATE_OFF = _define('INTERPOLATE_OFF', 1290)
+INTERPOLATE_ON = _define('INTERPOLATE_ON', 1291)
+INTERRUPTED = _define('INTERRUPTED', 1292)
+INTERSECTION = _define('INTERSECTION', 1293)
+INTERSECTIONS = _define('INTERSECTIONS', 1294)
+INV3 = _define('INV3', 1295)
+INVALID = _define('INVALID', 1296)
+INVALID_SURF = _define('INVALID_SURF', 1297)
+INVARIANT = _define('INVARIANT', 1298)
+INWARD = _define('INWARD', 1299)
+ISL21A = _define('ISL21A', 1300)
+ISL22A = _define('ISL22A', 1301)
+ISOLINES = _define('ISOLINES', 1302)
+ISOSURFACE = _define('ISOSURFACE', 1303)
+ISOTROPIC = _define('ISOTROPIC', 1304)
+ISOTROPIC_CFD = _define('ISOTROPIC_CFD', 1305)
+ITERATION = _define('ITERATION', 1306)
+ITERATIVE = _define('ITERATIVE', 1307)
+ITERATIVE_SOLVER = _define('ITERATIVE_SOLVER', 1308)
+ITSCYL = _define('ITSCYL', 1309)
+ITSUNI = _define('ITSUNI', 1310)
+ITT21 = _define('ITT21', 1311)
+ITT31 = _define('ITT31', 1312)
+JACOBI_COUPLING = _define('JACOBI_COUPLING', 1313)
+JAMA = _define('JAMA', 1314)
+JOB_ABORTED = _define('JOB_ABORTED', 1315)
+JOB_COMPLETED = _define('JOB_COMPLETED', 1316)
+JOB_INTERRUPTED = _define('JOB_INTERRUPTED', 1317)
+JOB_STATUS_COMPLETED_SUCCESSFULLY = _define('JOB_STATUS_COMPLETED_SUCCESSFULLY', 1318)
+JOB_STATUS_EXITED_WITH_ERROR = _define('JOB_STATUS_EXITED_WITH_ERROR', 1319)
+JOB_STATUS_TERMINATED_BY_EXTERNAL_REQUEST = _define('JOB_STATUS_TERMINATED_BY_EXTERNAL_REQUEST', 1320)
+JOB_STATUS_UNKNOWN = _define('JOB_STATUS_UNKNOWN', 1321)
+JOB_SUBMITTED = _define('JOB_SUBMITTED', 1322)
+JOHNSON_COOK = _define('JOHNSON_COOK', 1323)
+JOIN = _define('JOIN', 1324)
+JOINT2D = _define('JOINT2D', 1325)
+JOINT3D = _define('JOINT3D', 1326)
+JOINTC = _define('JOINTC', 1327)
+JUSTIFY_LEFT = _define('JUSTIFY_LEFT', 1328)
+JWL = _define('JWL', 1329)
+J_INTEGRAL = _define('J_INTEGRAL', 1330)
+KEPS_RNG = _define('KEPS_RNG', 1331)
+KII0 = _define('KII0', 1332)
+KINEMATIC = _define('KINEMATIC', 1333)
+KINEMATIC_COUPLING = _define('KINEMATIC_COUPLING', 1334)
+KINEMATIC_HARDENING = _define('KINEMATIC_HARDENING', 1335)
+KINEMATIC_VIOLATIONS = _define('KINEMATIC_VIOLATIONS', 1336)
+KINETIC_ENERGY_XPL = _define('KINETIC_ENERGY_XPL', 1337)
+K_FACTORS = _define('K_FACTORS', 1338)
+LAGRANGE = _define('LAGRANGE', 1339)
+LAGRANGIAN = _define('LAGRANGIAN', 1340)
+LAG_ANALYSIS = _define('LAG_ANALYSIS', 1341)
+LAMINA = _define('LAMINA', 1342)
+LANCZOS = _define('LANCZOS', 1343)
+LANCZOS_EIGENSOLVER = _define('LANCZOS_EIGENSOLVER', 1344)
+LANDSCAPE = _define('LANDSCAPE', 1345)
+LARGE = _define('LARGE', 1346)
+LARGE_ANGLE = _define('LARGE_ANGLE', 1347)
+LARGE_ANGLE_QUAD_FACE = _define('LARGE_ANGLE_QUAD_FACE', 1348)
+LARGE_ANGLE_TRI_FACE = _define('LARGE_ANGLE_TRI_FACE', 1349)
+LARGE_STRAIN_INCREMENT = _define('LARGE_STRAIN_INCREMENT', 1350)
+LAST = _define('LAST', 1351)
+LAST_FRAME = _define('LAST_FRAME', 1352)
+LAST_INCREMENT = _define('LAST_INCREMENT', 1353)
+LAST_STEP = _define('LAST_STEP', 1354)
+LATERAL_EXTENSION_RATIO_NOT_FOUND = _define('LATERAL_EXTENSION_RATIO_NOT_FOUND', 1355)
+LATERAL_NOMINAL_STRAIN = _define('LATERAL_NOMINAL_STRAIN', 1356)
+LAYUP = _define('LAYUP', 1357)
+LAYUP_MAP = _define('LAYUP_MAP', 1358)
+LAYUP_MAP_COLORS = _define('LAYUP_MAP_COLORS', 1359)
+LAYUP_ORIENTATION = _define('LAYUP_ORIENTATION', 1360)
+LEAD_ANALYSIS = _define('LEAD_ANALYSIS', 1361)
+LEAF_COLORS = _define('LEAF_COLORS', 1362)
+LEDGER = _define('LEDGER', 1363)
+LEFT = _define('LEFT', 1364)
+LEGAL = _define('LEGAL', 1365)
+LENGTH = _define('LENGTH', 1366)
+LESS_THAN = _define('LESS_THAN', 1367)
+LESS_THAN_EQUAL = _define('LESS_THAN_EQUAL', 1368)
+LETTER = _define('LETTER', 1369)
+LETTERS = _define('LETTERS', 1370)
+LICENSING = _define('LICENSING', 1371)
+LIFT_EQUATION = _define('LIFT_EQUATION', 1372)
+LINE = _define('LINE', 1373)
+LINE2 = _define('LINE2', 1374)
+LINE3 = _define('LINE3', 1375)
+LINEAR = _define('LINEAR', 1376)
+LINEAR_EXTRAPOLATION = _define('LINEAR_EXTRAPOLATION', 1377)
+LINEAR_LEAST_SQUARES = _define('LINEAR_LEAST_SQUARES', 1378)
+LINEAR_PRESSURE = _define('LINEAR_PRESSURE', 1379)
+LINELINEDIST = _define('LINELINEDIST', 1380)
+LINES = _define('LINES', 1381)
+LINE_LOOP = _define('LINE_LOOP', 1382)
+LINE_SEARCH = _define('LINE_SEARCH', 1383)
+LINE_STRIP = _define('LINE_STRIP', 1384)
+LINK = _define('LINK', 1385)
+LINK_MPC = _define('LINK_MPC', 1386)
+LINUX = _define('LINUX', 1387)
+LIST_OF_MODES = _define('LIST_OF_MODES', 1388)
+LOAD = _define('LOAD', 1389)
+LOAD_CASE = _define('LOAD_CASE', 1390)
+LOAD_MAP = _define('LOAD_MAP', 1391)
+LOAD_MAP_COLORS = _define('LOAD_MAP_COLORS', 1392)
+LOCAL = _define('LOCAL', 1393)
+LOCAL_GRADIENT = _define('LOCAL_GRADIENT', 1394)
+LOCKSTEP = _define('LOCKSTEP', 1395)
+LOG = _define('LOG', 1396)
+LOGARITHMIC = _define('LOGARITHMIC', 1397)
+LONG = _define('LONG', 1398)
+LONGEST_EDGE = _define('LONGEST_EDGE', 1399)
+LONG_TERM = _define('LONG_TERM', 1400)
+LOOP = _define('LOOP', 1401)
+LOOP_BACKWARD = _define('LOOP_BACKWARD', 1402)
+LOOSE_COUPLING = _define('LOOSE_COUPLING', 1403)
+LOW = _define('LOW', 1404)
+LS3S = _define('LS3S', 1405)
+LS6 = _define('LS6', 1406)
+LUMIN = _define('LUMIN', 1407)
+M3D3 = _define('M3D3', 1408)
+M3D4 = _define('M3D4', 1409)
+M3D4R = _define('M3D4R', 1410)
+M3D6 = _define('M3D6', 1411)
+M3D8 = _define('M3D8', 1412)
+M3D8R = _define('M3D8R', 1413)
+MACAULEY = _define('MACAULEY', 1414)
+MAGNITUDE = _define('MAGNITUDE', 1415)
+MAGNITUDE_AND_PHASE = _define('MAGNITUDE_AND_PHASE', 1416)
+MAINTAIN_CURRENT = _define('MAINTAIN_CURRENT', 1417)
+MAIN_REGION = _define('MAIN_REGION', 1418)
+MANUAL = _define('MANUAL', 1419)
+MAP = _define('MAP', 1420)
+MARLOW = _define('MARLOW', 1421)
+MASS = _define('MASS', 1422)
+MASS_DIFFUSION = _define('MASS_DIFFUSION', 1423)
+MASS_FLOW_AREA = _define('MASS_FLOW_AREA', 1424)
+MASS_FLOW_AREA_RATE = _define('MASS_FLOW_AREA_RATE', 1425)
+MASS_FLOW_RATE = _define('MASS_FLOW_RATE', 1426)
+MASS_FLUX = _define('MASS_FLUX', 1427)
+MASS_PER_AREA = _define('MASS_PER_AREA', 1428)
+MASS_PER_LENGTH = _define('MASS_PER_LENGTH', 1429)
+MASS_PER_VOLUME = _define('MASS_PER_VOLUME', 1430)
+MASS_PROPORTIONAL = _define('MASS_PROPORTIONAL', 1431)
+MASS_RATE_LEAK = _define('MASS_RATE_LEAK', 1432)
+MASS_SCALING = _define('MASS_SCALING', 1433)
+MASTER = _define('MASTER', 1434)
+MATCH = _define('MATCH', 1435)
+MATERIAL = _define('MATERIAL', 1436)
+MATERIAL_FLOW_FIELD = _define('MATERIAL_FLOW_FIELD', 1437)
+MATERIAL_INSTABILITY = _define('MATERIAL_INSTABILITY', 1438)
+MATERIAL_MAP = _define('MATERIAL_MAP', 1439)
+MATERIAL_MAP_COLORS = _define('MATERIAL_MAP_COLORS', 1440)
+MATERIAL_POINT_CALCULATIONS = _define('MATERIAL_POINT_CALCULATIONS', 1441)
+MATRIX = _define('MATRIX', 1442)
+MAX = _define('MAX', 1443)
+MAX1 = _define('MAX1', 1444)
+MAX2 = _define('MAX2', 1445)
+MAXIMIZE = _define('MAXIMIZE', 1446)
+MAXIMIZED = _define('MAXIMIZED', 1447)
+MAXIMUM = _define('MAXIMUM', 1448)
+MAXIMUM_NUMBER_OF_CONTACT_STRESS_AUGMENTATIONS = _define('MAXIMUM_NUMBER_OF_CONTACT_STRESS_AUGMENTATIONS', 1449)
+MAXIMUM_NUMBER_OF_EQUILIBRIUM_ITERATIONS = _define('MAXIMUM_NUMBER_OF_EQUILIBRIUM_ITERATIONS', 1450)
+MAXIMUM_SLIDE_DISTANCE_EXCEEDED = _define('MAXIMUM_SLIDE_DISTANCE_EXCEEDED', 1451)
+MAX_ABS_VALUE = _define('MAX_ABS_VALUE', 1452)
+MAX_CORRECTION = _define('MAX_CORRECTION', 1453)
+MAX_EDGE = _define('MAX_EDGE', 1454)
+MAX_ERROR = _define('MAX_ERROR', 1455)
+MAX_ELASTOPLASTIC_STRAIN = _define('MAX_ELASTOPLASTIC_STRAIN', 1456)
+MAX_FREQUENCY = _define('MAX_FREQUENCY', 1457)
+MAX_INCREMENT = _define('MAX_INCREMENT', 1458)
+MAX_INPLANE_PRINCIPAL = _define('MAX_INPLANE_PRINCIPAL', 1459)
+MAX_PRINCIPAL = _define('MAX_PRINCIPAL', 1460)
+MAX_RESIDUAL = _define('MAX_RESIDUAL', 1461)
+MAX_SEPARATION = _define('MAX_SEPARATION', 1462)
+MAX_SHEAR_STRAIN = _define('MAX_SHEAR_STRAIN', 1463)
+MAX_STEP_SIZE = _define('MAX_STEP_SIZE', 1464)
+MAX_STRESS = _define('MAX_STRESS', 1465)
+MAX_VALUE = _define('MAX_VALUE', 1466)
+MCL6 = _define('MCL6', 1467)
+MCL9 = _define('MCL9', 1468)
+MECHANICAL = _define('MECHANICAL', 1469)
+MECHANICAL_CONTACT = _define('MECHANICAL_CONTACT', 1470)
+MEDIAL_AXIS = _define('MEDIAL_AXIS', 1471)
+MEDIUM = _define('MEDIUM', 1472)
+MEGA_BYTES = _define('MEGA_BYTES', 1473)
+MEMBRANE = _define('MEMBRANE', 1474)
+MEMORY = _define('MEMORY', 1475)
+MEMORY_ESTIMATE = _define('MEMORY_ESTIMATE', 1476)
+MERGE = _define('MERGE', 1477)
+MERR = _define('MERR', 1478)
+MESH = _define('MESH', 1479)
+MESHED_BEAM_SECTION = _define('MESHED_BEAM_SECTION', 1480)
+MESH_MAP = _define('MESH_MAP', 1481)
+MESH_MAP_COLORS = _define('MESH_MAP_COLORS', 1482)
+MESH_TIE = _define('MESH_TIE', 1483)
+MGAX1 = _define('MGAX1', 1484)
+MGAX2 = _define('MGAX2', 1485)
+MIDDLE = _define('MIDDLE', 1486)
+MIDDLE_SURFACE = _define('MIDDLE_SURFACE', 1487)
+MIDSIDE_ONLY = _define('MIDSIDE_ONLY', 1488)
+MID_PRINCIPAL = _define('MID_PRINCIPAL', 1489)
+MILLING_REGION = _define('MILLING_REGION', 1490)
+MIN = _define('MIN', 1491)
+MINIMIZE = _define('MINIMIZE', 1492)
+MINIMIZED = _define('MINIMIZED', 1493)
+MINIMIZE_MAXIMUM = _define('MINIMIZE_MAXIMUM', 1494)
+MINIMUM = _define('MINIMUM', 1495)
+MINIMUM_MAXIMUM = _define('MINIMUM_MAXIMUM', 1496)
+MINIMUM_MOVE = _define('MINIMUM_MOVE', 1497)
+MIN_EDGE = _define('MIN_EDGE', 1498)
+MIN_INPLANE_PRINCIPAL = _define('MIN_INPLANE_PRINCIPAL', 1499)
+MIN_MAX_EDGE = _define('MIN_MAX_EDGE', 1500)
+MIN_MAX_LABEL = _define('MIN_MAX_LABEL', 1501)
+MIN_PRINCIPAL = _define('MIN_PRINCIPAL', 1502)
+MIN_PRINCIPAL_STRAIN = _define('MIN_PRINCIPAL_STRAIN', 1503)
+MIN_SIZE_FACTOR = _define('MIN_SIZE_FACTOR', 1504)
+MIN_STEP_SIZE = _define('MIN_STEP_SIZE', 1505)
+MIN_TRANSITION = _define('MIN_TRANSITION', 1506)
+MIN_VALUE = _define('MIN_VALUE', 1507)
+MIRROR = _define('MIRROR', 1508)
+MIRROR_CIRC_RECT = _define('MIRROR_CIRC_RECT', 1509)
+MIRROR_RECT_CIRC = _define('MIRROR_RECT_CIRC', 1510)
+MISES = _define('MISES', 1511)
+MIXED = _define('MIXED', 1512)
+MM = _define('MM', 1513)
+MODAL = _define('MODAL', 1514)
+MODAL_ALL = _define('MODAL_ALL', 1515)
+MODAL_DYNAMICS = _define('MODAL_DYNAMICS', 1516)
+MODEL = _define('MODEL', 1517)
+MODEL_CHANGE = _define('MODEL_CHANGE', 1518)
+MODEL_SIZE = _define('MODEL_SIZE', 1519)
+MODERATE = _define('MODERATE', 1520)
+MODERATE_DISSIPATION = _define('MODERATE_DISSIPATION', 1521)
+MODES = _define('MODES', 1522)
+MODE_BASED_DYNAMIC = _define('MODE_BASED_DYNAMIC', 1523)
+MODE_BASED_STEADY_STATE_DYNAMIC = _define('MODE_BASED_STEADY_STATE_DYNAMIC', 1524)
+MODE_INDEPENDENT = _define('MODE_INDEPENDENT', 1525)
+MODE_NUMBER = _define('MODE_NUMBER', 1526)
+MODE_RANGE = _define('MODE_RANGE', 1527)
+MODIFIED = _define('MODIFIED', 1528)
+MODIFIED_FROM_BASE_STATE = _define('MODIFIED_FROM_BASE_STATE', 1529)
+MOMENT = _define('MOMENT', 1530)
+MONITOR_DATA = _define('MONITOR_DATA', 1531)
+MOONEY_RIVLIN = _define('MOONEY_RIVLIN', 1532)
+MOTION = _define('MOTION', 1533)
+MOTION_TYPE = _define('MOTION_TYPE', 1534)
+MOVEMENT = _define('MOVEMENT', 1535)
+MOVING_NOISE = _define('MOVING_NOISE', 1536)
+MPC = _define('MPC', 1537)
+MPI = _define('MPI', 1538)
+MSBO = _define('MSBO', 1539)
+MSFLD = _define('MSFLD', 1540)
+MSPEI_XPL = _define('MSPEI_XPL', 1541)
+MT = _define('MT', 1542)
+MTS = _define('MTS', 1543)
+MULTIPLE_DIRECTION_ABSOLUTE_SUM = _define('MULTIPLE_DIRECTION_ABSOLUTE_SUM', 1544)
+MULTIPLE_DIRECTION_FORTY_PERCENT_RULE = _define('MULTIPLE_DIRECTION_FORTY_PERCENT_RULE', 1545)
+MULTIPLE_DIRECTION_SRSS_SUM = _define('MULTIPLE_DIRECTION_SRSS_SUM', 1546)
+MULTIPLE_DIRECTION_THIRTY_PERCENT_RULE = _define('MULTIPLE_DIRECTION_THIRTY_PERCENT_RULE', 1547)
+MULTIPLE_SURFACE = _define('MULTIPLE_SURFACE', 1548)
+MULTIPLICATIVE = _define('MULTIPLICATIVE', 1549)
+MULTIPLY = _define('MULTIPLY', 1550)
+N1 = _define('N1', 1551)
+N1_COSINES = _define('N1_COSINES', 1552)
+N2 = _define('N2', 1553)
+NATURAL_FREQUENCY_EXTRACTION = _define('NATURAL_FREQUENCY_EXTRACTION', 1554)
+NATURAL_LOG = _define('NATURAL_LOG', 1555)
+NEAREST_INTEGER = _define('NEAREST_INTEGER', 1556)
+NEGATE = _define('NEGATE', 1557)
+NEGATIVE = _define('NEGATIVE', 1558)
+NEO_HOOKE = _define('NEO_HOOKE', 1559)
+NEVER = _define('NEVER', 1560)
+NEWTONIAN = _define('NEWTONIAN', 1561)
+NEW_CONTACT_PATCH = _define('NEW_CONTACT_PATCH', 1562)
+NMORI = _define('NMORI', 1563)
+NO = _define('NO', 1564)
+NODAL = _define('NODAL', 1565)
+NODAL_ANALYTICAL_FIELD = _define('NODAL_ANALYTICAL_FIELD', 1566)
+NODAL_AVERAGE = _define('NODAL_AVERAGE', 1567)
+NODAL_DISCRETE_FIELD = _define('NODAL_DISCRETE_FIELD', 1568)
+NODAL_LINE = _define('NODAL_LINE', 1569)
+NODE = _define('NODE', 1570)
+NODES = _define('NODES', 1571)
+NODE_ALL = _define('NODE_ALL', 1572)
+NODE_CENTERED = _define('NODE_CENTERED', 1573)
+NODE_LIST = _define('NODE_LIST', 1574)
+NODE_MODE = _define('NODE_MODE', 1575)
+NODE_MODE_MPC = _define('NODE_MODE_MPC', 1576)
+NODE_PRESELECT = _define('NODE_PRESELECT', 1577)
+NODE_TO_SURFACE = _define('NODE_TO_SURFACE', 1578)
+NONACCUMULATEDENERGY = _define('NONACCUMULATEDENERGY', 1579)
+NONE = _define('NONE', 1580)
+NONLINEAR = _define('NONLINEAR', 1581)
+NONREFLECTING = _define('NONREFLECTING', 1582)
+NONUNIFORM = _define('NONUNIFORM', 1583)
+NON_DEFAULT = _define('NON_DEFAULT', 1584)
+NON_REFLECTING = _define('NON_REFLECTING', 1585)
+NORM = _define('NORM', 1586)
+NORMAL = _define('NORMAL', 1587)
+NORMALIZED_CONCENTRATION_FIELD = _define('NORMALIZED_CONCENTRATION_FIELD', 1588)
+NORMALS = _define('NORMALS', 1589)
+NORMAL_ANNOTATED = _define('NORMAL_ANNOTATED', 1590)
+NORMAL_TANGENTIAL = _define('NORMAL_TANGENTIAL', 1591)
+NORMAL_VECTOR = _define('NORMAL_VECTOR', 1592)
+NORM_DISTANCE = _define('NORM_DISTANCE', 1593)
+NORM_FIRST = _define('NORM_FIRST', 1594)
+NOT_ALLOWED = _define('NOT_ALLOWED', 1595)
+NOT_APPLICABLE = _define('NOT_APPLICABLE', 1596)
+NOT_SET = _define('NOT_SET', 1597)
+NOT_YET_ACTIVE = _define('NOT_YET_ACTIVE', 1598)
+NO_BLOCKING = _define('NO_BLOCKING', 1599)
+NO_EXTRAPOLATION = _define('NO_EXTRAPOLATION', 1600)
+NO_HEAD = _define('NO_HEAD', 1601)
+NO_IDEALIZATION = _define('NO_IDEALIZATION', 1602)
+NO_INDEPENDENT_COMPONENTS = _define('NO_INDEPENDENT_COMPONENTS', 1603)
+NO_INITIAL_INTERSECTION = _define('NO_INITIAL_INTERSECTION', 1604)
+NO_LIMIT = _define('NO_LIMIT', 1605)
+NO_LINE = _define('NO_LINE', 1606)
+NO_LONGER_ACTIVE = _define('NO_LONGER_ACTIVE', 1607)
+NO_OUTPUT = _define('NO_OUTPUT', 1608)
+NO_OUTPUT_VARIABLES = _define('NO_OUTPUT_VARIABLES', 1609)
+NO_REFINEMENT = _define('NO_REFINEMENT', 1610)
+NO_SIMPLIFICATION = _define('NO_SIMPLIFICATION', 1611)
+NO_SLIP = _define('NO_SLIP', 1612)
+NRL = _define('NRL', 1613)
+NSET_MAP = _define('NSET_MAP', 1614)
+NT = _define('NT', 1615)
+NTH_POWER = _define('NTH_POWER', 1616)
+NTH_ROOT = _define('NTH_ROOT', 1617)
+NUMBER = _define('NUMBER', 1618)
+NUMBERS = _define('NUMBERS', 1619)
+NUMBER_INTERVALS = _define('NUMBER_INTERVALS', 1620)
+NUMBER_OF_LAYERS = _define('NUMBER_OF_LAYERS', 1621)
+NUMBER_OF_VALUES = _define('NUMBER_OF_VALUES', 1622)
+NUMERICAL_PROBLEM = _define('NUMERICAL_PROBLEM', 1623)
+NUM_ATTEMPTS = _define('NUM_ATTEMPTS', 1624)
+NUM_DATA_TYPE = _define('NUM_DATA_TYPE', 1625)
+NUM_ELEMENTS_EXCEEDING = _define('NUM_ELEMENTS_EXCEEDING', 1626)
+NUM_EQI = _define('NUM_EQI', 1627)
+NUM_ITERS = _define('NUM_ITERS', 1628)
+NUM_PTS_ALONG_DIR = _define('NUM_PTS_ALONG_DIR', 1629)
+NUM_PTS_BETWEEN_PTS = _define('NUM_PTS_BETWEEN_PTS', 1630)
+NUM_SDI = _define('NUM_SDI', 1631)
+OBLIQUE_DOWN = _define('OBLIQUE_DOWN', 1632)
+OBLIQUE_UP = _define('OBLIQUE_UP', 1633)
+ODB = _define('ODB', 1634)
+ODB_FILE = _define('ODB_FILE', 1635)
+ODB_FRAME = _define('ODB_FRAME', 1636)
+ODB_REGIONS = _define('ODB_REGIONS', 1637)
+ODB_VALUES = _define('ODB_VALUES', 1638)
+OFFSET_FIELD = _define('OFFSET_FIELD', 1639)
+OGDEN = _define('OGDEN', 1640)
+OGDEN_N1 = _define('OGDEN_N1', 1641)
+OGDEN_N2 = _define('OGDEN_N2', 1642)
+OGDEN_N3 = _define('OGDEN_N3', 1643)
+OGDEN_N4 = _define('OGDEN_N4', 1644)
+OGDEN_N5 = _define('OGDEN_N5', 1645)
+OGDEN_N6 = _define('OGDEN_N6', 1646)
+OMIT = _define('OMIT', 1647)
+ONE_CONFIG = _define('ONE_CONFIG', 1648)
+ONLY = _define('ONLY', 1649)
+OPENINGS = _define('OPENINGS', 1650)
+OPEN_GL = _define('OPEN_GL', 1651)
+OPTIMIZATION_DISPLACEMENT = _define('OPTIMIZATION_DISPLACEMENT', 1652)
+OPT_DATASAVE_EVERY_CYCLE = _define('OPT_DATASAVE_EVERY_CYCLE', 1653)
+OPT_DATASAVE_FIRST_AND_LAST_CYCLE = _define('OPT_DATASAVE_FIRST_AND_LAST_CYCLE', 1654)
+OPT_DATASAVE_SPECIFY_CYCLE = _define('OPT_DATASAVE_SPECIFY_CYCLE', 1655)
+OPT_EXTRACT_SMOOTH_ABAQUS_INPUT_FILE = _define('OPT_EXTRACT_SMOOTH_ABAQUS_INPUT_FILE', 1656)
+OPT_EXTRACT_SMOOTH_NONE = _define('OPT_EXTRACT_SMOOTH_NONE', 1657)
+OPT_EXTRACT_SMOOTH_STL = _define('OPT_EXTRACT_SMOOTH_STL', 1658)
+ORDINATE = _define('ORDINATE', 1659)
+ORIENTATION = _define('ORIENTATION', 1660)
+ORIENT_FIELD = _define('ORIENT_FIELD', 1661)
+ORIENT_ON_DEF = _define('ORIENT_ON_DEF', 1662)
+ORIENT_ON_UNDEF = _define('ORIENT_ON_UNDEF', 1663)
+ORIGINAL = _define('ORIGINAL', 1664)
+ORIGINAL_MODEL = _define('ORIGINAL_MODEL', 1665)
+ORIGIN_AXIS = _define('ORIGIN_AXIS', 1666)
+ORTHOGONAL = _define('ORTHOGONAL', 1667)
+ORTHOTROPIC = _define('ORTHOTROPIC', 1668)
+OTHER = _define('OTHER', 1669)
+OTHER_BC = _define('OTHER_BC', 1670)
+OUTFLOW = _define('OUTFLOW', 1671)
+OUTOFPLANE_PRINCIPAL = _define('OUTOFPLANE_PRINCIPAL', 1672)
+OUTPUT = _define('OUTPUT', 1673)
+OUTSIDE = _define('OUTSIDE', 1674)
+OUTWARD = _define('OUTWARD', 1675)
+OUT_OF_PLANE_EXTENSION_RATIO_NOT_FOUND = _define('OUT_OF_PLANE_EXTENSION_RATIO_NOT_FOUND', 1676)
+OVERCLOSED = _define('OVERCLOSED', 1677)
+OVERCLOSURES = _define('OVERCLOSURES', 1678)
+OVERCONSTRAINT = _define('OVERCONSTRAINT', 1679)
+OVERHANG_REGION = _define('OVERHANG_REGION', 1680)
+OVERLAY = _define('OVERLAY', 1681)
+OVERWRITE = _define('OVERWRITE', 1682)
+PACKAGER_PHASE = _define('PACKAGER_PHASE', 1683)
+PARABOLA = _define('PARABOLA', 1684)
+PARABOLIC = _define('PARABOLIC', 1685)
+PARABOLIC_EXTRAPOLATION = _define('PARABOLIC_EXTRAPOLATION', 1686)
+PARALLEL = _define('PARALLEL', 1687)
+PARAMETERS = _define('PARAMETERS', 1688)
+PARAMETRIC_DATA = _define('PARAMETRIC_DATA', 1689)
+PART = _define('PART', 1690)
+PARTIAL_BLOCKING = _define('PARTIAL_BLOCKING', 1691)
+PARTIAL_FIELD = _define('PARTIAL_FIELD', 1692)
+PART_ASSEMBLY = _define('PART_ASSEMBLY', 1693)
+PART_GEOM_MAP = _define('PART_GEOM_MAP', 1694)
+PART_GEOM_MAP_COLORS = _define('PART_GEOM_MAP_COLORS', 1695)
+PART_MAP = _define('PART_MAP', 1696)
+PART_MAP_COLORS = _define('PART_MAP_COLORS', 1697)
+PATH = _define('PATH', 1698)
+PATH_POINTS = _define('PATH_POINTS', 1699)
+PATH_X = _define('PATH_X', 1700)
+PATH_Y = _define('PATH_Y', 1701)
+PATH_Z = _define('PATH_Z', 1702)
+PATTERN_ALONG_DIRECTION = _define('PATTERN_ALONG_DIRECTION', 1703)
+PATTERN_INVALID = _define('PATTERN_INVALID', 1704)
+PATTERN_ORTHOGONALLY = _define('PATTERN_ORTHOGONALLY', 1705)
+PENALTY = _define('PENALTY', 1706)
+PENETRATION_TOLERANCE_EXCEEDED = _define('PENETRATION_TOLERANCE_EXCEEDED', 1707)
+PERCENTAGE = _define('PERCENTAGE', 1708)
+PERIMETER = _define('PERIMETER', 1709)
+PERIOD = _define('PERIOD', 1710)
+PERP = _define('PERP', 1711)
+PERPENDICULAR = _define('PERPENDICULAR', 1712)
+PERSPECTIVE = _define('PERSPECTIVE', 1713)
+PERTURBATION_AND_BUCKLING = _define('PERTURBATION_AND_BUCKLING', 1714)
+PHASE = _define('PHASE', 1715)
+PHONG = _define('PHONG', 1716)
+PICKED = _define('PICKED', 1717)
+PICKEDPOINTS = _define('PICKEDPOINTS', 1718)
+PIEZOELECTRIC = _define('PIEZOELECTRIC', 1719)
+PIEZO_ELECTRICAL_POTENTIAL_FIELD = _define('PIEZO_ELECTRICAL_POTENTIAL_FIELD', 1720)
+PINNED = _define('PINNED', 1721)
+PIN_MPC = _define('PIN_MPC', 1722)
+PIPE21 = _define('PIPE21', 1723)
+PIPE21H = _define('PIPE21H', 1724)
+PIPE22 = _define('PIPE22', 1725)
+PIPE22H = _define('PIPE22H', 1726)
+PIPE31 = _define('PIPE31', 1727)
+PIPE31H = _define('PIPE31H', 1728)
+PIPE32 = _define('PIPE32', 1729)
+PIPE32H = _define('PIPE32H', 1730)
+PLANAR = _define('PLANAR', 1731)
+PLANE = _define('PLANE', 1732)
+PLANE12 = _define('PLANE12', 1733)
+PLANE13 = _define('PLANE13', 1734)
+PLANE21 = _define('PLANE21', 1735)
+PLANE23 = _define('PLANE23', 1736)
+PLANE31 = _define('PLANE31', 1737)
+PLANE32 = _define('PLANE32', 1738)
+PLASTIC_MOTION = _define('PLASTIC_MOTION', 1739)
+PLAY = _define('PLAY', 1740)
+PLAY_ONCE = _define('PLAY_ONCE', 1741)
+PLOT_MAP = _define('PLOT_MAP', 1742)
+PLOT_MAP_COLORS = _define('PLOT_MAP_COLORS', 1743)
+PLOT_OPTIONS = _define('PLOT_OPTIONS', 1744)
+PLOT_STATE = _define('PLOT_STATE', 1745)
+PLY = _define('PLY', 1746)
+PLY_BASED = _define('PLY_BASED', 1747)
+PLY_MAP = _define('PLY_MAP', 1748)
+PLY_MAP_COLORS = _define('PLY_MAP_COLORS', 1749)
+PNEUMATIC = _define('PNEUMATIC', 1750)
+PNG = _define('PNG', 1751)
+POINT = _define('POINT', 1752)
+POINTLINEDIST = _define('POINTLINEDIST', 1753)
+POINTPOINTDIST = _define('POINTPOINTDIST', 1754)
+POINTS = _define('POINTS', 1755)
+POINTS_NOW_SLIPPING = _define('POINTS_NOW_SLIPPING', 1756)
+POINTS_NOW_STICKING = _define('POINTS_NOW_STICKING', 1757)
+POINTS_THROUGH_SECTION = _define('POINTS_THROUGH_SECTION', 1758)
+POINTWISE = _define('POINTWISE', 1759)
+POINT_ARC = _define('POINT_ARC', 1760)
+POINT_LIST = _define('POINT_LIST', 1761)
+POISSON = _define('POISSON', 1762)
+POISSON_RATIO = _define('POISSON_RATIO', 1763)
+POLAR = _define('POLAR', 1764)
+POLYNOMIAL = _define('POLYNOMIAL', 1765)
+POLY_N1 = _define('POLY_N1', 1766)
+POLY_N2 = _define('POLY_N2', 1767)
+POLY_N3 = _define('POLY_N3', 1768)
+POLY_N4 = _define('POLY_N4', 1769)
+POLY_N5 = _define('POLY_N5', 1770)
+POLY_N6 = _define('POLY_N6', 1771)
+PORE_FLUID_CONTACT = _define('PORE_FLUID_CONTACT', 1772)
+PORE_FLUID_DIFFUSION = _define('PORE_FLUID_DIFFUSION', 1773)
+PORE_LIQUID_PRESSURE_FIELD = _define('PORE_LIQUID_PRESSURE_FIELD', 1774)
+PORTRAIT = _define('PORTRAIT', 1775)
+POSITION = _define('POSITION', 1776)
+POSITIONS = _define('POSITIONS', 1777)
+POSITIVE = _define('POSITIVE', 1778)
+POWER = _define('POWER', 1779)
+POWER_LAW = _define('POWER_LAW', 1780)
+PREDEFINED = _define('PREDEFINED', 1781)
+PREDEFINED_FIELD = _define('PREDEFINED_FIELD', 1782)
+PREDEFINED_PATH = _define('PREDEFINED_PATH', 1783)
+PRESCRIBEDCONDITION_DOF = _define('PRESCRIBEDCONDITION_DOF', 1784)
+PRESELECT = _define('PRESELECT', 1785)
+PRESERVE_SECTION = _define('PRESERVE_SECTION', 1786)
+PRESS = _define('PRESS', 1787)
+PRESSURE = _define('PRESSURE', 1788)
+PRESSURE_GRADIENT = _define('PRESSURE_GRADIENT', 1789)
+PRESSURE_PENETRATION = _define('PRESSURE_PENETRATION', 1790)
+PRESSURE_STRESS_CONSTRAINT = _define('PRESSURE_STRESS_CONSTRAINT', 1791)
+PREVIOUS = _define('PREVIOUS', 1792)
+PREVIOUS_STEP = _define('PREVIOUS_STEP', 1793)
+PRIMARY_VECTOR = _define('PRIMARY_VECTOR', 1794)
+PRINCIPAL = _define('PRINCIPAL', 1795)
+PRINCIPAL_COMPONENT = _define('PRINCIPAL_COMPONENT', 1796)
+PRINTER = _define('PRINTER', 1797)
+PROJECTION_CARTESIAN = _define('PROJECTION_CARTESIAN', 1798)
+PROJECTION_FLEXION_TORSION = _define('PROJECTION_FLEXION_TORSION', 1799)
+PROJECT_BY_DIRECTION = _define('PROJECT_BY_DIRECTION', 1800)
+PROJECT_BY_DISTANCE = _define('PROJECT_BY_DISTANCE', 1801)
+PROJECT_BY_NUMBER = _define('PROJECT_BY_NUMBER', 1802)
+PROJECT_BY_PROXIMITY = _define('PROJECT_BY_PROXIMITY', 1803)
+PROLATE = _define('PROLATE', 1804)
+PRONY = _define('PRONY', 1805)
+PROPAGATED = _define('PROPAGATED', 1806)
+PROPAGATED_FROM_BASE_STATE = _define('PROPAGATED_FROM_BASE_STATE', 1807)
+PROPAGATED_FROM_COMPUTED = _define('PROPAGATED_FROM_COMPUTED', 1808)
+PROPAGATED_FROM_FREQUENCY = _define('PROPAGATED_FROM_FREQUENCY', 1809)
+PROPERTY_CHANGE = _define('PROPERTY_CHANGE', 1810)
+PROPERTY_MAP = _define('PROPERTY_MAP', 1811)
+PROPERTY_MAP_COLORS = _define('PROPERTY_MAP_COLORS', 1812)
+PROPERTY_REF = _define('PROPERTY_REF', 1813)
+PS = _define('PS', 1814)
+PSI24 = _define('PSI24', 1815)
+PSI26 = _define('PSI26', 1816)
+PSI34 = _define('PSI34', 1817)
+PSI36 = _define('PSI36', 1818)
+PS_ALWAYS = _define('PS_ALWAYS', 1819)
+PS_IF_AVAILABLE = _define('PS_IF_AVAILABLE', 1820)
+PYR5 = _define('PYR5', 1821)
+Q3D10M = _define('Q3D10M', 1822)
+Q3D10MH = _define('Q3D10MH', 1823)
+Q3D20 = _define('Q3D20', 1824)
+Q3D20H = _define('Q3D20H', 1825)
+Q3D20R = _define('Q3D20R', 1826)
+Q3D20RH = _define('Q3D20RH', 1827)
+Q3D4 = _define('Q3D4', 1828)
+Q3D6 = _define('Q3D6', 1829)
+Q3D8 = _define('Q3D8', 1830)
+Q3D8H = _define('Q3D8H', 1831)
+Q3D8R = _define('Q3D8R', 1832)
+Q3D8RH = _define('Q3D8RH', 1833)
+QUAD = _define('QUAD', 1834)
+QUAD4 = _define('QUAD4', 1835)
+QUAD8 = _define('QUAD8', 1836)
+QUADRATIC = _define('QUADRATIC', 1837)
+QUADS = _define('QUADS', 1838)
+QUAD_DOMINATED = _define('QUAD_DOMINATED', 1839)
+QUAD_SEPARATION = _define('QUAD_SEPARATION', 1840)
+QUAD_STRIP = _define('QUAD_STRIP', 1841)
+QUAD_TRACTION = _define('QUAD_TRACTION', 1842)
+QUASI_NEWTON = _define('QUASI_NEWTON', 1843)
+QUASI_NEWTON_METHOD = _define('QUASI_NEWTON_METHOD', 1844)
+QUASI_STATIC = _define('QUASI_STATIC', 1845)
+QUATERNION_2D = _define('QUATERNION_2D', 1846)
+QUATERNION_3D = _define('QUATERNION_3D', 1847)
+QUICKTIME = _define('QUICKTIME', 1848)
+QUILT = _define('QUILT', 1849)
+QUINTIC = _define('QUINTIC', 1850)
+Q_VECTORS = _define('Q_VECTORS', 1851)
+R2D2 = _define('R2D2', 1852)
+R3D3 = _define('R3D3', 1853)
+R3D4 = _define('R3D4', 1854)
+RADIAL = _define('RADIAL', 1855)
+RADIAL_THRUST = _define('RADIAL_THRUST', 1856)
+RADIATION_ALL = _define('RADIATION_ALL', 1857)
+RADIUS = _define('RADIUS', 1858)
+RAINBOW = _define('RAINBOW', 1859)
+RAMP = _define('RAMP', 1860)
+RANDOM_RESPONSE = _define('RANDOM_RESPONSE', 1861)
+RANGE = _define('RANGE', 1862)
+RASTER = _define('RASTER', 1863)
+RATE = _define('RATE', 1864)
+RATE_OF_CONVERGENCE_IS_SLOW = _define('RATE_OF_CONVERGENCE_IS_SLOW', 1865)
+RAW24 = _define('RAW24', 1866)
+RAW32 = _define('RAW32', 1867)
+RAW8 = _define('RAW8', 1868)
+RAW_DATA = _define('RAW_DATA', 1869)
+RAX2 = _define('RAX2', 1870)
+RB2D2 = _define('RB2D2', 1871)
+RB3D2 = _define('RB3D2', 1872)
+REAL = _define('REAL', 1873)
+REAL_AND_IMAGINARY = _define('REAL_AND_IMAGINARY', 1874)
+REAL_ONLY = _define('REAL_ONLY', 1875)
+REBAR = _define('REBAR', 1876)
+RECIEVE_PREDICTION = _define('RECIEVE_PREDICTION', 1877)
+RECOMPUTE_EACH_FRAME = _define('RECOMPUTE_EACH_FRAME', 1878)
+RECOMPUTE_GEOMETRY = _define('RECOMPUTE_GEOMETRY', 1879)
+RECOVER = _define('RECOVER', 1880)
+RECT_CIRC_MIRROR = _define('RECT_CIRC_MIRROR', 1881)
+RECT_MIRROR_CIRC = _define('RECT_MIRROR_CIRC', 1882)
+RECURSIVE = _define('RECURSIVE', 1883)
+REDUCED_POLYNOMIAL = _define('REDUCED_POLYNOMIAL', 1884)
+REDUCED_POLYNOMIAL_ALL = _define('REDUCED_POLYNOMIAL_ALL', 1885)
+REDUCED_POLYNOMIAL_N1 = _define('REDUCED_POLYNOMIAL_N1', 1886)
+REDUCED_POLYNOMIAL_N2 = _define('REDUCED_POLYNOMIAL_N2', 1887)
+REDUCED_POLYNOMIAL_N3 = _define('REDUCED_POLYNOMIAL_N3', 1888)
+REDUCED_POLYNOMIAL_N4 = _define('REDUCED_POLYNOMIAL_N4', 1889)
+REDUCED_POLYNOMIAL_N5 = _define('REDUCED_POLYNOMIAL_N5', 1890)
+REDUCED_POLYNOMIAL_N6 = _define('REDUCED_POLYNOMIAL_N6', 1891)
+RED_TO_BLUE = _define('RED_TO_BLUE', 1892)
+REEDER = _define('REEDER', 1893)
+REFERENCE = _define('REFERENCE', 1894)
+REGION = _define('REGION', 1895)
+REGULAR = _define('REGULAR', 1896)
+REGULAR_BEAM = _define('REGULAR_BEAM', 1897)
+REGULAR_SHELL = _define('REGULAR_SHELL', 1898)
+REINFORCEMENT = _define('REINFORCEMENT', 1899)
+REINITIALIZE = _define('REINITIALIZE', 1900)
+RELATIVE = _define('RELATIVE', 1901)
+RELATIVE_EQUAL = _define('RELATIVE_EQUAL', 1902)
+RELATIVE_GREATER_THAN_EQUAL = _define('RELATIVE_GREATER_THAN_EQUAL', 1903)
+RELATIVE_LESS_THAN_EQUAL = _define('RELATIVE_LESS_THAN_EQUAL', 1904)
+RELATIVE_SLOPE_DROP = _define('RELATIVE_SLOPE_DROP', 1905)
+RELATIVE_VALUE = _define('RELATIVE_VALUE', 1906)
+RELAXATION = _define('RELAXATION', 1907)
+RELAXATION_TEST_DATA = _define('RELAXATION_TEST_DATA', 1908)
+RELAX_STIFFNESS = _define('RELAX_STIFFNESS', 1909)
+REMOVE = _define('REMOVE', 1910)
+REPETITIVE_SDI_PATTERN = _define('REPETITIVE_SDI_PATTERN', 1911)
+REPLACE = _define('REPLACE', 1912)
+RESET_TO_INITIAL = _define('RESET_TO_INITIAL', 1913)
+RESIDUAL_ACCEPTED = _define('RESIDUAL_ACCEPTED', 1914)
+RESIDUAL_NOT_ACCEPTED = _define('RESIDUAL_NOT_ACCEPTED', 1915)
+RESPONSE_SPECTRUM = _define('RESPONSE_SPECTRUM', 1916)
+RESTART = _define('RESTART', 1917)
+RESTRICTED_TASK_REGION_EQUIV_STRESS = _define('RESTRICTED_TASK_REGION_EQUIV_STRESS', 1918)
+RESULTANT = _define('RESULTANT', 1919)
+RETENTION_FACTOR = _define('RETENTION_FACTOR', 1920)
+RETRACTOR = _define('RETRACTOR', 1921)
+REVERSE = _define('REVERSE', 1922)
+REVERSED_RAINBOW = _define('REVERSED_RAINBOW', 1923)
+REVERSE_MIRROR = _define('REVERSE_MIRROR', 1924)
+REVOLUTE = _define('REVOLUTE', 1925)
+REVOLUTION = _define('REVOLUTION', 1926)
+RIGHT = _define('RIGHT', 1927)
+RIGID = _define('RIGID', 1928)
+RIGID_BODY = _define('RIGID_BODY', 1929)
+RIGID_SPRING_RIGID = _define('RIGID_SPRING_RIGID', 1930)
+RIKS = _define('RIKS', 1931)
+RLE24 = _define('RLE24', 1932)
+RLE8 = _define('RLE8', 1933)
+ROLLING = _define('ROLLING', 1934)
+ROTARYI = _define('ROTARYI', 1935)
+ROTARY_INERTIA = _define('ROTARY_INERTIA', 1936)
+ROTATE = _define('ROTATE', 1937)
+ROTATION = _define('ROTATION', 1938)
+ROTATIONAL_ACCELERATION = _define('ROTATIONAL_ACCELERATION', 1939)
+ROTATIONAL_VELOCITY = _define('ROTATIONAL_VELOCITY', 1940)
+ROTATION_ACCELEROMETER = _define('ROTATION_ACCELEROMETER', 1941)
+ROTATION_ANGLE = _define('ROTATION_ANGLE', 1942)
+ROTATION_FIELD = _define('ROTATION_FIELD', 1943)
+ROTATION_NONE = _define('ROTATION_NONE', 1944)
+ROUGH = _define('ROUGH', 1945)
+RSH = _define('RSH', 1946)
+RSS = _define('RSS', 1947)
+RUNNING = _define('RUNNING', 1948)
+S1 = _define('S1', 1949)
+S2 = _define('S2', 1950)
+S3 = _define('S3', 1951)
+S3R = _define('S3R', 1952)
+S3RS = _define('S3RS', 1953)
+S3RT = _define('S3RT', 1954)
+S3T = _define('S3T', 1955)
+S4 = _define('S4', 1956)
+S4R = _define('S4R', 1957)
+S4R5 = _define('S4R5', 1958)
+S4RS = _define('S4RS', 1959)
+S4RSW = _define('S4RSW', 1960)
+S4RT = _define('S4RT', 1961)
+S4T = _define('S4T', 1962)
+S5 = _define('S5', 1963)
+S6 = _define('S6', 1964)
+S8R = _define('S8R', 1965)
+S8R5 = _define('S8R5', 1966)
+S8RT = _define('S8RT', 1967)
+SAX1 = _define('SAX1', 1968)
+SAX2 = _define('SAX2', 1969)
+SAX2T = _define('SAX2T', 1970)
+SAXA11 = _define('SAXA11', 1971)
+SAXA12 = _define('SAXA12', 1972)
+SAXA13 = _define('SAXA13', 1973)
+SAXA14 = _define('SAXA14', 1974)
+SAXA21 = _define('SAXA21', 1975)
+SAXA22 = _define('SAXA22', 1976)
+SAXA23 = _define('SAXA23', 1977)
+SAXA24 = _define('SAXA24', 1978)
+SC6R = _define('SC6R', 1979)
+SC6RT = _define('SC6RT', 1980)
+SC8R = _define('SC8R', 1981)
+SC8RT = _define('SC8RT', 1982)
+SCALAR = _define('SCALAR', 1983)
+SCALE = _define('SCALE', 1984)
+SCALE_FACTOR = _define('SCALE_FACTOR', 1985)
+SCATTERED = _define('SCATTERED', 1986)
+SCIENTIFIC = _define('SCIENTIFIC', 1987)
+SCREEN = _define('SCREEN', 1988)
+SCREEN_SIZE = _define('SCREEN_SIZE', 1989)
+SECOND = _define('SECOND', 1990)
+SECOND_ORDER_ADVECTION = _define('SECOND_ORDER_ADVECTION', 1991)
+SECTION = _define('SECTION', 1992)
+SECTION_MAP = _define('SECTION_MAP', 1993)
+SECTION_MAP_COLORS = _define('SECTION_MAP_COLORS', 1994)
+SECTION_PTS = _define('SECTION_PTS', 1995)
+SEGMENTS = _define('SEGMENTS', 1996)
+SELECTED = _define('SELECTED', 1997)
+SELECTION_GRP_MAP = _define('SELECTION_GRP_MAP', 1998)
+SELECTION_GRP_MAP_COLORS = _define('SELECTION_GRP_MAP_COLORS', 1999)
+SELECTIVE = _define('SELECTIVE', 2000)
+SELECT_ALL = _define('SELECT_ALL', 2001)
+SELECT_BY_ANGLE = _define('SELECT_BY_ANGLE', 2002)
+SELECT_BY_NUMBER = _define('SELECT_BY_NUMBER', 2003)
+SELF = _define('SELF', 2004)
+SEMI_AUTOMATIC = _define('SEMI_AUTOMATIC', 2005)
+SEND_PREDICTION = _define('SEND_PREDICTION', 2006)
+SEPARATE = _define('SEPARATE', 2007)
+SEPARATED = _define('SEPARATED', 2008)
+SEPARATED_SOLUTION = _define('SEPARATED_SOLUTION', 2009)
+SEPARATE_TABLES = _define('SEPARATE_TABLES', 2010)
+SEQUENTIAL_THERMAL_STRESS = _define('SEQUENTIAL_THERMAL_STRESS', 2011)
+SEQ_ID = _define('SEQ_ID', 2012)
+SET = _define('SET', 2013)
+SET_EQUAL_DT = _define('SET_EQUAL_DT', 2014)
+SET_MAP = _define('SET_MAP', 2015)
+SET_MAP_COLORS = _define('SET_MAP_COLORS', 2016)
+SEVERE_CONTACT_OVERCLOSURES = _define('SEVERE_CONTACT_OVERCLOSURES', 2017)
+SEVERE_OVERCLOSURES = _define('SEVERE_OVERCLOSURES', 2018)
+SFM3D3 = _define('SFM3D3', 2019)
+SFM3D4 = _define('SFM3D4', 2020)
+SFM3D4R = _define('SFM3D4R', 2021)
+SFM3D6 = _define('SFM3D6', 2022)
+SFM3D8 = _define('SFM3D8', 2023)
+SFM3D8R = _define('SFM3D8R', 2024)
+SFMAX1 = _define('SFMAX1', 2025)
+SFMAX2 = _define('SFMAX2', 2026)
+SFMCL6 = _define('SFMCL6', 2027)
+SFMCL9 = _define('SFMCL9', 2028)
+SFMGAX1 = _define('SFMGAX1', 2029)
+SFMGAX2 = _define('SFMGAX2', 2030)
+SHADED = _define('SHADED', 2031)
+SHAPE_FACTOR = _define('SHAPE_FACTOR', 2032)
+SHARED_LM_PRESSURE_FIELD = _define('SHARED_LM_PRESSURE_FIELD', 2033)
+SHARED_LM_VOLUME_FIELD = _define('SHARED_LM_VOLUME_FIELD', 2034)
+SHEAR = _define('SHEAR', 2035)
+SHEARCREEP = _define('SHEARCREEP', 2036)
+SHEARRELAXATION = _define('SHEARRELAXATION', 2037)
+SHELL = _define('SHELL', 2038)
+SHELL_TO_SOLID_COUPLING = _define('SHELL_TO_SOLID_COUPLING', 2039)
+SHORT = _define('SHORT', 2040)
+SHORTEST_EDGE = _define('SHORTEST_EDGE', 2041)
+SHORTEST_PATH = _define('SHORTEST_PATH', 2042)
+SHORT_FIBER = _define('SHORT_FIBER', 2043)
+SHRINK_FIT = _define('SHRINK_FIT', 2044)
+SHRINK_MOVEMENT = _define('SHRINK_MOVEMENT', 2045)
+SIDE1 = _define('SIDE1', 2046)
+SIDE2 = _define('SIDE2', 2047)
+SIGCONT = _define('SIGCONT', 2048)
+SIGINT = _define('SIGINT', 2049)
+SIGN = _define('SIGN', 2050)
+SIGTERM = _define('SIGTERM', 2051)
+SIGTSTP = _define('SIGTSTP', 2052)
+SIGUSR1 = _define('SIGUSR1', 2053)
+SIGUSR2 = _define('SIGUSR2', 2054)
+SIM = _define('SIM', 2055)
+SIMP = _define('SIMP', 2056)
+SIMPLE = _define('SIMPLE', 2057)
+SIMPLESHEAR = _define('SIMPLESHEAR', 2058)
+SIMPSON = _define('SIMPSON', 2059)
+SIMULATION_ABORTED = _define('SIMULATION_ABORTED', 2060)
+SIMULATION_COMPLETED = _define('SIMULATION_COMPLETED', 2061)
+SIMULATION_INTERRUPTED = _define('SIMULATION_INTERRUPTED', 2062)
+SIMULATION_STARTED = _define('SIMULATION_STARTED', 2063)
+SINE = _define('SINE', 2064)
+SINGHM = _define('SINGHM', 2065)
+SINGLE = _define('SINGLE', 2066)
+SINGLE_DIRECTION = _define('SINGLE_DIRECTION', 2067)
+SINGLE_NODE = _define('SINGLE_NODE', 2068)
+SINGLE_PRECISION = _define('SINGLE_PRECISION', 2069)
+SINGLE_TABLE = _define('SINGLE_TABLE', 2070)
+SINGLE_VALUE = _define('SINGLE_VALUE', 2071)
+SIZE = _define('SIZE', 2072)
+SIZE_ON_SCREEN = _define('SIZE_ON_SCREEN', 2073)
+SKINS = _define('SKINS', 2074)
+SKIN_MAP = _define('SKIN_MAP', 2075)
+SKIN_MAP_COLORS = _define('SKIN_MAP_COLORS', 2076)
+SLASH = _define('SLASH', 2077)
+SLAVE = _define('SLAVE', 2078)
+SLIDE_DISTANCE_EXCEEDED = _define('SLIDE_DISTANCE_EXCEEDED', 2079)
+SLIDE_PLANE = _define('SLIDE_PLANE', 2080)
+SLIDING = _define('SLIDING', 2081)
+SLIPPED_OFF_PATCH = _define('SLIPPED_OFF_PATCH', 2082)
+SLIPRING = _define('SLIPRING', 2083)
+SLOT = _define('SLOT', 2084)
+SMALL = _define('SMALL', 2085)
+SMALLEST_ELEM_AT_CENTER = _define('SMALLEST_ELEM_AT_CENTER', 2086)
+SMALLEST_ELEM_AT_ENDS = _define('SMALLEST_ELEM_AT_ENDS', 2087)
+SMALLEST_ELEM_LOCATION = _define('SMALLEST_ELEM_LOCATION', 2088)
+SMALL_ANGLE = _define('SMALL_ANGLE', 2089)
+SMALL_ANGLE_QUAD_FACE = _define('SMALL_ANGLE_QUAD_FACE', 2090)
+SMALL_ANGLE_TRI_FACE = _define('SMALL_ANGLE_TRI_FACE', 2091)
+SMEAR_ABOUT_CORE = _define('SMEAR_ABOUT_CORE', 2092)
+SMEAR_ALL_LAYERS = _define('SMEAR_ALL_LAYERS', 2093)
+SMOOTHING_AS_IS = _define('SMOOTHING_AS_IS', 2094)
+SMOOTHING_OFF = _define('SMOOTHING_OFF', 2095)
+SMOOTHING_ON = _define('SMOOTHING_ON', 2096)
+SNEG = _define('SNEG', 2097)
+SOFTWARE_OVERLAY = _define('SOFTWARE_OVERLAY', 2098)
+SOFT_CONTACT_INCOMPATIBILITIES = _define('SOFT_CONTACT_INCOMPATIBILITIES', 2099)
+SOILS = _define('SOILS', 2100)
+SOLID = _define('SOLID', 2101)
+SOLIDWORKS = _define('SOLIDWORKS', 2102)
+SOLUTION_APPEARS_TO_BE_DIVERGING = _define('SOLUTION_APPEARS_TO_BE_DIVERGING', 2103)
+SOLVER_DEFAULT = _define('SOLVER_DEFAULT', 2104)
+SPALART = _define('SPALART', 2105)
+SPECIFIED = _define('SPECIFIED', 2106)
+SPECIFIED_LIMIT = _define('SPECIFIED_LIMIT', 2107)
+SPECIFIED_MODES = _define('SPECIFIED_MODES', 2108)
+SPECIFIED_NODAL_DIAMETER = _define('SPECIFIED_NODAL_DIAMETER', 2109)
+SPECIFY = _define('SPECIFY', 2110)
+SPECIFY_NUM_PTS = _define('SPECIFY_NUM_PTS', 2111)
+SPECIFY_ORIENT = _define('SPECIFY_ORIENT', 2112)
+SPECIFY_PATH = _define('SPECIFY_PATH', 2113)
+SPECIFY_STEP_SIZE = _define('SPECIFY_STEP_SIZE', 2114)
+SPECIFY_THICKNESS = _define('SPECIFY_THICKNESS', 2115)
+SPECIFY_TOLERANCE = _define('SPECIFY_TOLERANCE', 2116)
+SPECTRUM = _define('SPECTRUM', 2117)
+SPHERE = _define('SPHERE', 2118)
+SPHERICAL = _define('SPHERICAL', 2119)
+SPIN = _define('SPIN', 2120)
+SPLINE = _define('SPLINE', 2121)
+SPLINE_APPROXIMATION = _define('SPLINE_APPROXIMATION', 2122)
+SPLINE_INTERPOLATION = _define('SPLINE_INTERPOLATION', 2123)
+SPOS = _define('SPOS', 2124)
+SPOT_WELD_CONTACT = _define('SPOT_WELD_CONTACT', 2125)
+SPRING1 = _define('SPRING1', 2126)
+SPRING2 = _define('SPRING2', 2127)
+SPRINGA = _define('SPRINGA', 2128)
+SPRING_RIGID_SPRING = _define('SPRING_RIGID_SPRING', 2129)
+SQUARE_ROOT = _define('SQUARE_ROOT', 2130)
+SRSS = _define('SRSS', 2131)
+SSH = _define('SSH', 2132)
+SSOR = _define('SSOR', 2133)
+STABILIZATION = _define('STABILIZATION', 2134)
+STABILIZED = _define('STABILIZED', 2135)
+STABLE_INC_XPL = _define('STABLE_INC_XPL', 2136)
+STABLE_TIME_INCREMENT = _define('STABLE_TIME_INCREMENT', 2137)
+STACK_1 = _define('STACK_1', 2138)
+STACK_2 = _define('STACK_2', 2139)
+STACK_3 = _define('STACK_3', 2140)
+STACK_ORIENTATION = _define('STACK_ORIENTATION', 2141)
+STAGNATION = _define('STAGNATION', 2142)
+STAMP = _define('STAMP', 2143)
+STANDALONE = _define('STANDALONE', 2144)
+STANDALONENOSHOW = _define('STANDALONENOSHOW', 2145)
+STANDARD = _define('STANDARD', 2146)
+STANDARD_ANALYSIS = _define('STANDARD_ANALYSIS', 2147)
+STANDARD_EXPLICIT = _define('STANDARD_EXPLICIT', 2148)
+STANDARD_PHASE = _define('STANDARD_PHASE', 2149)
+START = _define('START', 2150)
+STARTED = _define('STARTED', 2151)
+STATE_FRAME = _define('STATE_FRAME', 2152)
+STATIC = _define('STATIC', 2153)
+STATIC_GENERAL = _define('STATIC_GENERAL', 2154)
+STATIC_LINEAR_PERTURBATION = _define('STATIC_LINEAR_PERTURBATION', 2155)
+STATIC_PERTURBATION = _define('STATIC_PERTURBATION', 2156)
+STATIC_RIKS = _define('STATIC_RIKS', 2157)
+STATUS = _define('STATUS', 2158)
+STEADY_STATE = _define('STEADY_STATE', 2159)
+STEADY_STATE_DIRECT = _define('STEADY_STATE_DIRECT', 2160)
+STEADY_STATE_MODAL = _define('STEADY_STATE_MODAL', 2161)
+STEADY_STATE_SUBSPACE = _define('STEADY_STATE_SUBSPACE', 2162)
+STEADY_STATE_TRANSPORT = _define('STEADY_STATE_TRANSPORT', 2163)
+STEP = _define('STEP', 2164)
+STEP_END = _define('STEP_END', 2165)
+STEP_START = _define('STEP_START', 2166)
+STEP_TIME = _define('STEP_TIME', 2167)
+STEP_TIME_XPL = _define('STEP_TIME_XPL', 2168)
+STIFFNESS = _define('STIFFNESS', 2169)
+STIFFNESS_OPTIMIZATION = _define('STIFFNESS_OPTIMIZATION', 2170)
+STIPPLED = _define('STIPPLED', 2171)
+STOP = _define('STOP', 2172)
+STRAIN = _define('STRAIN', 2173)
+STRAIN_FREE_CORRECTIONS = _define('STRAIN_FREE_CORRECTIONS', 2174)
+STRAIN_RATE = _define('STRAIN_RATE', 2175)
+STRESS = _define('STRESS', 2176)
+STRESS_INTENS_FACTOR = _define('STRESS_INTENS_FACTOR', 2177)
+STRESS_PERTURBATION = _define('STRESS_PERTURBATION', 2178)
+STRI3 = _define('STRI3', 2179)
+STRI65 = _define('STRI65', 2180)
+STRINGERS = _define('STRINGERS', 2181)
+STRINGER_MAP = _define('STRINGER_MAP', 2182)
+STRINGER_MAP_COLORS = _define('STRINGER_MAP_COLORS', 2183)
+STRUCTURAL = _define('STRUCTURAL', 2184)
+STRUCTURED = _define('STRUCTURED', 2185)
+SUBMISSION_ABORTED = _define('SUBMISSION_ABORTED', 2186)
+SUBMITTED = _define('SUBMITTED', 2187)
+SUBMODELING = _define('SUBMODELING', 2188)
+SUBSPACE = _define('SUBSPACE', 2189)
+SUBSPACE_DYNAMIC = _define('SUBSPACE_DYNAMIC', 2190)
+SUBSPACE_EIGENSOLVER = _define('SUBSPACE_EIGENSOLVER', 2191)
+SUBSPACE_STEADY_STATE_DYNAMIC = _define('SUBSPACE_STEADY_STATE_DYNAMIC', 2192)
+SUBSTANCE = _define('SUBSTANCE', 2193)
+SUBSTRUCTURE_GENERATE = _define('SUBSTRUCTURE_GENERATE', 2194)
+SUBSTRUCTURING = _define('SUBSTRUCTURING', 2195)
+SUBTRACT = _define('SUBTRACT', 2196)
+SUM = _define('SUM', 2197)
+SUPERIMPOSE = _define('SUPERIMPOSE', 2198)
+SUPPRESS = _define('SUPPRESS', 2199)
+SURFACE = _define('SURFACE', 2200)
+SURFACE_BLAST = _define('SURFACE_BLAST', 2201)
+SURFACE_INTEGRATION_POINT = _define('SURFACE_INTEGRATION_POINT', 2202)
+SURFACE_MAP = _define('SURFACE_MAP', 2203)
+SURFACE_MAP_COLORS = _define('SURFACE_MAP_COLORS', 2204)
+SURFACE_NODAL = _define('SURFACE_NODAL', 2205)
+SURFACE_POINT_EQUIV_STRESS = _define('SURFACE_POINT_EQUIV_STRESS', 2206)
+SURFACE_TO_SURFACE = _define('SURFACE_TO_SURFACE', 2207)
+SVG = _define('SVG', 2208)
+SWEEP = _define('SWEEP', 2209)
+SWING = _define('SWING', 2210)
+SYMBOL = _define('SYMBOL', 2211)
+SYMBOLS_ON_DEF = _define('SYMBOLS_ON_DEF', 2212)
+SYMBOLS_ON_UNDEF = _define('SYMBOLS_ON_UNDEF', 2213)
+SYMMETRIC = _define('SYMMETRIC', 2214)
+SYMMETRIC_MODEL_GENERATION = _define('SYMMETRIC_MODEL_GENERATION', 2215)
+SYNTAXCHECK = _define('SYNTAXCHECK', 2216)
+SYSTEM = _define('SYSTEM', 2217)
+SYSTEM_ASSIGN = _define('SYSTEM_ASSIGN', 2218)
+SYSTEM_DEFINED = _define('SYSTEM_DEFINED', 2219)
+T2D2 = _define('T2D2', 2220)
+T2D2E = _define('T2D2E', 2221)
+T2D2H = _define('T2D2H', 2222)
+T2D2T = _define('T2D2T', 2223)
+T2D3 = _define('T2D3', 2224)
+T2D3E = _define('T2D3E', 2225)
+T2D3H = _define('T2D3H', 2226)
+T2D3T = _define('T2D3T', 2227)
+T3D2 = _define('T3D2', 2228)
+T3D2E = _define('T3D2E', 2229)
+T3D2H = _define('T3D2H', 2230)
+T3D2T = _define('T3D2T', 2231)
+T3D3 = _define('T3D3', 2232)
+T3D3E = _define('T3D3E', 2233)
+T3D3H = _define('T3D3H', 2234)
+T3D3T = _define('T3D3T', 2235)
+TABULAR = _define('TABULAR', 2236)
+TANGENT = _define('TANGENT', 2237)
+TANGENTIAL = _define('TANGENTIAL', 2238)
+TAPERED = _define('TAPERED', 2239)
+TASK_REGION_EQUIV_STRESS = _define('TASK_REGION_EQUIV_STRESS', 2240)
+TASK_REGION_LAYERS = _define('TASK_REGION_LAYERS', 2241)
+TECHNIQUE = _define('TECHNIQUE', 2242)
+TEMPERATURE = _define('TEMPERATURE', 2243)
+TEMPERATURE_FALLEN_BELOW_ABSOLUTE_ZERO = _define('TEMPERATURE_FALLEN_BELOW_ABSOLUTE_ZERO', 2244)
+TEMPERATURE_FIELD = _define('TEMPERATURE_FIELD', 2245)
+TENP = _define('TENP', 2246)
+TENSION = _define('TENSION', 2247)
+TENSOR = _define('TENSOR', 2248)
+TENSOR_2D_PLANAR = _define('TENSOR_2D_PLANAR', 2249)
+TENSOR_2D_SURFACE = _define('TENSOR_2D_SURFACE', 2250)
+TENSOR_3D_FULL = _define('TENSOR_3D_FULL', 2251)
+TENSOR_3D_PLANAR = _define('TENSOR_3D_PLANAR', 2252)
+TENSOR_3D_SURFACE = _define('TENSOR_3D_SURFACE', 2253)
+TERMINATED = _define('TERMINATED', 2254)
+TESSELLATED = _define('TESSELLATED', 2255)
+TEST_DATA = _define('TEST_DATA', 2256)
+TET = _define('TET', 2257)
+TET10 = _define('TET10', 2258)
+TET4 = _define('TET4', 2259)
+TEXTURE_MAPPED = _define('TEXTURE_MAPPED', 2260)
+THERMAL = _define('THERMAL', 2261)
+THERMAL_CONTACT = _define('THERMAL_CONTACT', 2262)
+THERMOMECHANICAL = _define('THERMOMECHANICAL', 2263)
+THICK = _define('THICK', 2264)
+THICKNESS = _define('THICKNESS', 2265)
+THICKNESS_DISCRETE_FIELD = _define('THICKNESS_DISCRETE_FIELD', 2266)
+THICKNESS_MAGNITUDE = _define('THICKNESS_MAGNITUDE', 2267)
+THICK_WALL = _define('THICK_WALL', 2268)
+THIN = _define('THIN', 2269)
+THINNING = _define('THINNING', 2270)
+THIN_WALL = _define('THIN_WALL', 2271)
+THREADS = _define('THREADS', 2272)
+THREED_DATA = _define('THREED_DATA', 2273)
+THREE_D = _define('THREE_D', 2274)
+THROUGHOUT_STEP = _define('THROUGHOUT_STEP', 2275)
+TIE = _define('TIE', 2276)
+TIE_MPC = _define('TIE_MPC', 2277)
+TIFF = _define('TIFF', 2278)
+TIGHTEN_GAPS = _define('TIGHTEN_GAPS', 2279)
+TIME = _define('TIME', 2280)
+TIME_AVERAGE = _define('TIME_AVERAGE', 2281)
+TIME_BASED = _define('TIME_BASED', 2282)
+TIME_HEAT_FLUX = _define('TIME_HEAT_FLUX', 2283)
+TIME_HEAT_FLUX_AREA = _define('TIME_HEAT_FLUX_AREA', 2284)
+TIME_HISTORY = _define('TIME_HISTORY', 2285)
+TIME_INCREMENT = _define('TIME_INCREMENT', 2286)
+TIME_INTEGRATION = _define('TIME_INTEGRATION', 2287)
+TIME_INTEGRATION_ACCURACY_LIMIT_EXCEEDED = _define('TIME_INTEGRATION_ACCURACY_LIMIT_EXCEEDED', 2288)
+TIME_INTEGRATION_STABILITY_LIMIT_EXCEEDED = _define('TIME_INTEGRATION_STABILITY_LIMIT_EXCEEDED', 2289)
+TIME_INTERVAL = _define('TIME_INTERVAL', 2290)
+TIME_INTERVAL_VALUE = _define('TIME_INTERVAL_VALUE', 2291)
+TIME_POINT = _define('TIME_POINT', 2292)
+TIME_VOLUME = _define('TIME_VOLUME', 2293)
+TIME_VOLUME_FLUX = _define('TIME_VOLUME_FLUX', 2294)
+TMORI = _define('TMORI', 2295)
+TOLERANCE = _define('TOLERANCE', 2296)
+TOP = _define('TOP', 2297)
+TOP_AND_BOTTOM = _define('TOP_AND_BOTTOM', 2298)
+TOP_CENTER = _define('TOP_CENTER', 2299)
+TOP_LEFT = _define('TOP_LEFT', 2300)
+TOP_RIGHT = _define('TOP_RIGHT', 2301)
+TOP_SURFACE = _define('TOP_SURFACE', 2302)
+TOROIDAL = _define('TOROIDAL', 2303)
+TOTAL = _define('TOTAL', 2304)
+TOTAL_ABSOLUTE_MOVEMENT = _define('TOTAL_ABSOLUTE_MOVEMENT', 2305)
+TOTAL_FORCE = _define('TOTAL_FORCE', 2306)
+TOTAL_MASS = _define('TOTAL_MASS', 2307)
+TOTAL_MASS_XPL = _define('TOTAL_MASS_XPL', 2308)
+TOTAL_NUM = _define('TOTAL_NUM', 2309)
+TOTAL_NUMBER = _define('TOTAL_NUMBER', 2310)
+TOTAL_TIME_XPL = _define('TOTAL_TIME_XPL', 2311)
+TO_ENVIRONMENT = _define('TO_ENVIRONMENT', 2312)
+TRACTION = _define('TRACTION', 2313)
+TRACTION_SEPARATION = _define('TRACTION_SEPARATION', 2314)
+TRANSFORMATION = _define('TRANSFORMATION', 2315)
+TRANSIENT = _define('TRANSIENT', 2316)
+TRANSIENT_FIDELITY = _define('TRANSIENT_FIDELITY', 2317)
+TRANSLATE = _define('TRANSLATE', 2318)
+TRANSLATOR = _define('TRANSLATOR', 2319)
+TRANSPARENT = _define('TRANSPARENT', 2320)
+TRANSVERSE = _define('TRANSVERSE', 2321)
+TRANSVERSE_SHEAR_FORCE_CONSTRAINT = _define('TRANSVERSE_SHEAR_FORCE_CONSTRAINT', 2322)
+TRAPEZOID = _define('TRAPEZOID', 2323)
+TRESCA = _define('TRESCA', 2324)
+TRI = _define('TRI', 2325)
+TRIGGER = _define('TRIGGER', 2326)
+TRI3 = _define('TRI3', 2327)
+TRI6 = _define('TRI6', 2328)
+TRIANGLES = _define('TRIANGLES', 2329)
+TRIANGLE_FAN = _define('TRIANGLE_FAN', 2330)
+TRIANGLE_STRIP = _define('TRIANGLE_STRIP', 2331)
+TRIDIRECTIONAL = _define('TRIDIRECTIONAL', 2332)
+TRUE_DISTANCE = _define('TRUE_DISTANCE', 2333)
+TRUE_DISTANCE_X = _define('TRUE_DISTANCE_X', 2334)
+TRUE_DISTANCE_Y = _define('TRUE_DISTANCE_Y', 2335)
+TRUE_DISTANCE_Z = _define('TRUE_DISTANCE_Z', 2336)
+TRUSS = _define('TRUSS', 2337)
+TURB_NONE = _define('TURB_NONE', 2338)
+TURN = _define('TURN', 2339)
+TWIST = _define('TWIST', 2340)
+TWO_CONFIG = _define('TWO_CONFIG', 2341)
+TWO_D_PLANAR = _define('TWO_D_PLANAR', 2342)
+TYPED_IN = _define('TYPED_IN', 2343)
+TYPE_NOT_APPLICABLE = _define('TYPE_NOT_APPLICABLE', 2344)
+T_STRESS = _define('T_STRESS', 2345)
+U1 = _define('U1', 2346)
+U2 = _define('U2', 2347)
+U3 = _define('U3', 2348)
+UJOINT = _define('UJOINT', 2349)
+UNCHANGED = _define('UNCHANGED', 2350)
+UNCONVERGED_CAP_PLASTICITY = _define('UNCONVERGED_CAP_PLASTICITY', 2351)
+UNCONVERGED_CLAY_PLASTICITY = _define('UNCONVERGED_CLAY_PLASTICITY', 2352)
+UNCONVERGED_CONCRETE_PLASTICITY = _define('UNCONVERGED_CONCRETE_PLASTICITY', 2353)
+UNCONVERGED_CREEP_PLASTICITY = _define('UNCONVERGED_CREEP_PLASTICITY', 2354)
+UNCONVERGED_DRUCKER_PRAGER_PLASTICITY = _define('UNCONVERGED_DRUCKER_PRAGER_PLASTICITY', 2355)
+UNCONVERGED_FOAM_PLASTICITY = _define('UNCONVERGED_FOAM_PLASTICITY', 2356)
+UNCONVERGED_HYPERELASTICITY = _define('UNCONVERGED_HYPERELASTICITY', 2357)
+UNCONVERGED_METAL_PLASTICITY = _define('UNCONVERGED_METAL_PLASTICITY', 2358)
+UNCONVERGED_MOHR_COULOMB_PLASTICITY = _define('UNCONVERGED_MOHR_COULOMB_PLASTICITY', 2359)
+UNCORRELATED = _define('UNCORRELATED', 2360)
+UNCOUPLED = _define('UNCOUPLED', 2361)
+UNDEFINED_ANALYSIS = _define('UNDEFINED_ANALYSIS', 2362)
+UNDEFINED_INVARIANT = _define('UNDEFINED_INVARIANT', 2363)
+UNDEFINED_POSITION = _define('UNDEFINED_POSITION', 2364)
+UNDEFORMED = _define('UNDEFORMED', 2365)
+UNDEX = _define('UNDEX', 2366)
+UNDEX_CHARGE = _define('UNDEX_CHARGE', 2367)
+UNIAXIAL = _define('UNIAXIAL', 2368)
+UNIAXIAL_VOLUMETRIC = _define('UNIAXIAL_VOLUMETRIC', 2369)
+UNIDIRECTIONAL = _define('UNIDIRECTIONAL', 2370)
+UNIFORM = _define('UNIFORM', 2371)
+UNIFORM_BY_NUMBER = _define('UNIFORM_BY_NUMBER', 2372)
+UNIFORM_BY_SIZE = _define('UNIFORM_BY_SIZE', 2373)
+UNIFORM_ERROR = _define('UNIFORM_ERROR', 2374)
+UNIFORM_SPACING = _define('UNIFORM_SPACING', 2375)
+UNION = _define('UNION', 2376)
+UNIVERSAL = _define('UNIVERSAL', 2377)
+UNIX = _define('UNIX', 2378)
+UNKNOWN = _define('UNKNOWN', 2379)
+UNKNOWNAXIS = _define('UNKNOWNAXIS', 2380)
+UNKNOWNPLANE = _define('UNKNOWNPLANE', 2381)
+UNKNOWN_ANALYSIS_CODE = _define('UNKNOWN_ANALYSIS_CODE', 2382)
+UNKNOWN_DIMENSION = _define('UNKNOWN_DIMENSION', 2383)
+UNKNOWN_HEX = _define('UNKNOWN_HEX', 2384)
+UNKNOWN_HOURGLASS_CONTROL = _define('UNKNOWN_HOURGLASS_CONTROL', 2385)
+UNKNOWN_KINEMATIC_SPLIT = _define('UNKNOWN_KINEMATIC_SPLIT', 2386)
+UNKNOWN_PHASE = _define('UNKNOWN_PHASE', 2387)
+UNKNOWN_QUAD = _define('UNKNOWN_QUAD', 2388)
+UNKNOWN_SHAPE = _define('UNKNOWN_SHAPE', 2389)
+UNKNOWN_STRESS_RATE = _define('UNKNOWN_STRESS_RATE', 2390)
+UNKNOWN_TET = _define('UNKNOWN_TET', 2391)
+UNKNOWN_TRI = _define('UNKNOWN_TRI', 2392)
+UNKNOWN_WEDGE = _define('UNKNOWN_WEDGE', 2393)
+UNLIMITED = _define('UNLIMITED', 2394)
+UNMESHABLE = _define('UNMESHABLE', 2395)
+UNRESOLVED_INITIAL_OVERCLOSURES = _define('UNRESOLVED_INITIAL_OVERCLOSURES', 2396)
+UNSET = _define('UNSET', 2397)
+UNSPECIFIED = _define('UNSPECIFIED', 2398)
+UNSYMMETRIC = _define('UNSYMMETRIC', 2399)
+UR1 = _define('UR1', 2400)
+UR2 = _define('UR2', 2401)
+UR3 = _define('UR3', 2402)
+USA_ADDED_MASS_GENERATION = _define('USA_ADDED_MASS_GENERATION', 2403)
+USER = _define('USER', 2404)
+USER_CUSTOMIZED = _define('USER_CUSTOMIZED', 2405)
+USER_DEFINED = _define('USER_DEFINED', 2406)
+USER_MPC = _define('USER_MPC', 2407)
+USER_SPECIFIED = _define('USER_SPECIFIED', 2408)
+USER_SUB = _define('USER_SUB', 2409)
+USER_SUBROUTINE = _define('USER_SUBROUTINE', 2410)
+USER_SUBROUTINE_REQUEST = _define('USER_SUBROUTINE_REQUEST', 2411)
+USE_BOTTOM = _define('USE_BOTTOM', 2412)
+USE_BOTTOM_AND_TOP = _define('USE_BOTTOM_AND_TOP', 2413)
+USE_ENVELOPE = _define('USE_ENVELOPE', 2414)
+USE_GEOMETRY = _define('USE_GEOMETRY', 2415)
+USE_MESH = _define('USE_MESH', 2416)
+USE_TOP = _define('USE_TOP', 2417)
+USUP = _define('USUP', 2418)
+VALUE = _define('VALUE', 2419)
+VALUES = _define('VALUES', 2420)
+VALUES_AND_HISTORY = _define('VALUES_AND_HISTORY', 2421)
+VAN_DER_WAALS = _define('VAN_DER_WAALS', 2422)
+VAN_DER_WALLS_STRETCHES_LOCKING = _define('VAN_DER_WALLS_STRETCHES_LOCKING', 2423)
+VARIABLE_RATIO = _define('VARIABLE_RATIO', 2424)
+VCCT = _define('VCCT', 2425)
+VECTOR = _define('VECTOR', 2426)
+VECTOR_COMPONENT = _define('VECTOR_COMPONENT', 2427)
+VELOCITY = _define('VELOCITY', 2428)
+VELOCITY_PARABOLIC = _define('VELOCITY_PARABOLIC', 2429)
+VELOCITY_SQUARED = _define('VELOCITY_SQUARED', 2430)
+VERTEX_ADJ_TO_SMALLEST_ELEM = _define('VERTEX_ADJ_TO_SMALLEST_ELEM', 2431)
+VERTICAL = _define('VERTICAL', 2432)
+VERY_SMALL = _define('VERY_SMALL', 2433)
+VERY_THIN = _define('VERY_THIN', 2434)
+VIEW_MANIP = _define('VIEW_MANIP', 2435)
+VISCO = _define('VISCO', 2436)
+VISCOUS = _define('VISCOUS', 2437)
+VMS = _define('VMS', 2438)
+VOID = _define('VOID', 2439)
+VOLUME = _define('VOLUME', 2440)
+VOLUMETRIC = _define('VOLUMETRIC', 2441)
+VOLUMETRICCREEP = _define('VOLUMETRICCREEP', 2442)
+VOLUMETRICRELAXATION = _define('VOLUMETRICRELAXATION', 2443)
+VOLUMETRIC_DATA = _define('VOLUMETRIC_DATA', 2444)
+VOLUME_COMPRESSION = _define('VOLUME_COMPRESSION', 2445)
+VOLUME_FLUX = _define('VOLUME_FLUX', 2446)
+VOLUME_FLUX_AREA = _define('VOLUME_FLUX_AREA', 2447)
+VOLUME_FRACTION = _define('VOLUME_FRACTION', 2448)
+VOLUME_PROPORTIONAL = _define('VOLUME_PROPORTIONAL', 2449)
+VOL_FLUX = _define('VOL_FLUX', 2450)
+VOL_RATE_LEAK = _define('VOL_RATE_LEAK', 2451)
+VRML = _define('VRML', 2452)
+WARNING = _define('WARNING', 2453)
+WARP2D3 = _define('WARP2D3', 2454)
+WARP2D4 = _define('WARP2D4', 2455)
+WEDGE = _define('WEDGE', 2456)
+WEDGE15 = _define('WEDGE15', 2457)
+WEDGE6 = _define('WEDGE6', 2458)
+WEIGHTED = _define('WEIGHTED', 2459)
+WEIGHTED_ADD = _define('WEIGHTED_ADD', 2460)
+WELD = _define('WELD', 2461)
+WHITE_TO_BLACK = _define('WHITE_TO_BLACK', 2462)
+WHOLE_ELEMENT = _define('WHOLE_ELEMENT', 2463)
+WHOLE_MODEL = _define('WHOLE_MODEL', 2464)
+WHOLE_PART_INSTANCE = _define('WHOLE_PART_INSTANCE', 2465)
+WHOLE_REGION = _define('WHOLE_REGION', 2466)
+WHOLE_SURFACE = _define('WHOLE_SURFACE', 2467)
+WIDTH = _define('WIDTH', 2468)
+WINDOWS = _define('WINDOWS', 2469)
+WIRE = _define('WIRE', 2470)
+WIREFRAME = _define('WIREFRAME', 2471)
+WLF = _define('WLF', 2472)
+WRAP_AROUND = _define('WRAP_AROUND', 2473)
+X11 = _define('X11', 2474)
+XASYMM = _define('XASYMM', 2475)
+XAXIS = _define('XAXIS', 2476)
+XMARKER = _define('XMARKER', 2477)
+XOR = _define('XOR', 2478)
+XSYMM = _define('XSYMM', 2479)
+XYPLANE = _define('XYPLANE', 2480)
+XYZ = _define('XYZ', 2481)
+XZPLANE = _define('XZPLANE', 2482)
+YASYMM = _define('YASYMM', 2483)
+YAXIS = _define('YAXIS', 2484)
+YEOH = _define('YEOH', 2485)
+YIELD_RATIO = _define('YIELD_RATIO', 2486)
+YSYMM = _define('YSYMM', 2487)
+YZPLANE = _define('YZPLANE', 2488)
+ZASYMM = _define('ZASYMM', 2489)
+ZAXIS = _define('ZAXIS', 2490)
+ZERO = _define('ZERO', 2491)
+ZERO_PRESSURE = _define('ZERO_PRESSURE', 2492)
+ZSYMM = _define('ZSYMM', 2493)
+
+# Constants of abaqusConstantsSupplement, they are not defined in C++
+ALL_METHODS = _define('ALL_METHODS', 2494)
+ALL_TYPES = _define('ALL_TYPES', 2495)
+EARLIEST = _define('EARLIEST', 2496)
+GUI = _define('GUI', 2497)
+KERNEL = _define('KERNEL', 2498)
+LATEST = _define('LATEST', 2499)
+
+MAXIMUM_NUMBER_OF_SEVERE_DISCONTINUITY_ITERATIONS = _define('MAXIMUM_NUMBER_OF_SEVERE_DISCONTINUITY_ITERATIONS', 2500)
 
 FALSE = False
-
-OFF = 0
-
-ON = 1
-
+OFF = AbaqusBoolean(0)
+ON = AbaqusBoolean(1)
 TRUE = True
 
+# A Boolean argument accepts ON, OFF, True and False
+Boolean = _typing.Union[AbaqusBoolean, bool]
 
-# no functions
-# classes
-
-class AbaqusBooleanType(int):
-    """
-    AbaqusBoolean is derived from int, and prints as ON or OFF.
-        A call to SymbolicConstant("ON/OFF") will return an AbaqusBoolean instance.
-    """
-
-    def getId(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def getText(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def isTrue(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __copy__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __getstate__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __hash__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __init__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    @staticmethod  # known case of __new__
-    def __new__(cls, *args, **kargs):  # reliably restored by inspect
-        # no doc
-        pass
-
-    def __reduce__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __repr__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __setstate__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __str__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    __weakref__ = property(lambda self: object(), lambda self, v: None, lambda self: None)  # default
-    """list of weak references to the object (if defined)"""
-
-    _abaqusBooleanOFF = 0
-    _abaqusBooleanON = 1
-    __dict__ = None  # (!) real value is 'dict_proxy({\'__module__\': \'symbolicConstants\', \'isTrue\': <function isTrue at 0x00000000031652E8>, \'__setstate__\': <function __setstate__ at 0x00000000031653C8>, \'__str__\': <function getText at 0x0000000003165208>, \'__reduce__\': <function __reduce__ at 0x00000000031654A8>, \'getText\': <function getText at 0x0000000003165208>, \'__dict__\': <attribute \'__dict__\' of \'AbaqusBoolean\' objects>, \'_abaqusBooleanON\': ON, \'__weakref__\': <attribute \'__weakref__\' of \'AbaqusBoolean\' objects>, \'_abaqusBooleanOFF\': OFF, \'__copy__\': <function __copy__ at 0x0000000003165438>, \'__new__\': <staticmethod object at 0x000000000314E6A8>, \'getId\': <function getId at 0x0000000003165278>, \'__init__\': <function __init__ at 0x0000000003165128>, \'__hash__\': <function __hash__ at 0x0000000003165198>, \'__getstate__\': <function __getstate__ at 0x0000000003165358>, \'__doc__\': \'\\n    AbaqusBoolean is derived from int, and prints as ON or OFF.\\n    A call to SymbolicConstant("ON/OFF") will return an AbaqusBoolean instance.\\n    \', \'__repr__\': <function getText at 0x0000000003165208>})'
-
-
-AbaqusBoolean = AbaqusBooleanType
-
-
-class BooleanType(int):
-    """
-    bool(x) -> bool
-
-    Returns True when the argument x is true, False otherwise.
-    The builtins True and False are the only two instances of the class bool.
-    The class bool is a subclass of the class int, and cannot be subclassed.
-    """
-
-    def __and__(self, y):  # real signature unknown; restored from __doc__
-        """ x.__and__(y) <==> x&y """
-        pass
-
-    def __init__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    @staticmethod  # known case of __new__
-    def __new__(S, *more):  # real signature unknown; restored from __doc__
-        """ T.__new__(S, ...) -> a new object with type S, a subtype of T """
-        pass
-
-    def __or__(self, y):  # real signature unknown; restored from __doc__
-        """ x.__or__(y) <==> x|y """
-        pass
-
-    def __rand__(self, y):  # real signature unknown; restored from __doc__
-        """ x.__rand__(y) <==> y&x """
-        pass
-
-    def __repr__(self):  # real signature unknown; restored from __doc__
-        """ x.__repr__() <==> repr(x) """
-        pass
-
-    def __ror__(self, y):  # real signature unknown; restored from __doc__
-        """ x.__ror__(y) <==> y|x """
-        pass
-
-    def __rxor__(self, y):  # real signature unknown; restored from __doc__
-        """ x.__rxor__(y) <==> y^x """
-        pass
-
-    def __str__(self):  # real signature unknown; restored from __doc__
-        """ x.__str__() <==> str(x) """
-        pass
-
-    def __xor__(self, y):  # real signature unknown; restored from __doc__
-        """ x.__xor__(y) <==> x^y """
-        pass
-
-
-Boolean = BooleanType
-
-
-class SymbolicConstantType(object):
-    """
-    SymbolicConstant(name <,scdId=-1>)
-        Abaqus/CAE SymbolicConstant implemented in Python.
-        SymbolicConstant('ON'|'OFF') will return an AbaqusBoolean instance.
-    """
-
-    def getId(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def getText(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    @classmethod
-    def _addToCache(cls, *args, **kwargs):  # real signature unknown
-        """
-        Helper method for __new__
-                Also used by AbaqusBoolean.__new__
-        """
-        pass
-
-    def __copy__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __getstate__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __hash__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __init__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __lt__(self, *args, **kwargs):  # real signature unknown
-        """ Sorting method; True if self is < other """
-        pass
-
-    @staticmethod  # known case of __new__
-    def __new__(cls, *args, **kargs):  # reliably restored by inspect
-        # no doc
-        pass
-
-    def __reduce__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __repr__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __setstate__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    def __str__(self, *args, **kwargs):  # real signature unknown
-        pass
-
-    __weakref__ = property(lambda self: object(), lambda self, v: None, lambda self: None)  # default
-    """list of weak references to the object (if defined)"""
-
-    # _cache = {
-    #     'ALL_METHODS': ALL_METHODS,  # (!) forward: ALL_METHODS, real value is 'ALL_METHODS'
-    #     'ALL_TYPES': ALL_TYPES,  # (!) forward: ALL_TYPES, real value is 'ALL_TYPES'
-    #     'BOTH': BOTH,  # (!) forward: BOTH, real value is 'BOTH'
-    #     'EARLIEST': EARLIEST,  # (!) forward: EARLIEST, real value is 'EARLIEST'
-    #     'GUI': GUI,  # (!) forward: GUI, real value is 'GUI'
-    #     'KERNEL': KERNEL,  # (!) forward: KERNEL, real value is 'KERNEL'
-    #     'LATEST': LATEST,  # (!) forward: LATEST, real value is 'LATEST'
-    #     'OFF': 0,
-    #     'ON': 1,
-    #     '_UNSPECIFIED': _UNSPECIFIED,
-    # }
-    _counter = 10
-    _p = None  # (!) real value is '<_sre.SRE_Pattern object at 0x0000000003106D40>'
-    __dict__ = None  # (!) real value is 'dict_proxy({\'__module__\': \'symbolicConstants\', \'__setstate__\': <function __setstate__ at 0x000000000314FDD8>, \'__str__\': <function getText at 0x000000000314FF28>, \'__reduce__\': <function __reduce__ at 0x000000000314FEB8>, \'getText\': <function getText at 0x000000000314FF28>, \'__dict__\': <attribute \'__dict__\' of \'SymbolicConstant\' objects>, \'_cache\': {\'_UNSPECIFIED\': _UNSPECIFIED, \'ON\': ON, \'OFF\': OFF, \'ALL_TYPES\': ALL_TYPES, \'BOTH\': BOTH, \'GUI\': GUI, \'ALL_METHODS\': ALL_METHODS, \'EARLIEST\': EARLIEST, \'KERNEL\': KERNEL, \'LATEST\': LATEST}, \'__lt__\': <function __lt__ at 0x000000000314FC88>, \'__weakref__\': <attribute \'__weakref__\' of \'SymbolicConstant\' objects>, \'__init__\': <function __init__ at 0x000000000314FC18>, \'_counter\': 10, \'__getstate__\': <function __getstate__ at 0x000000000314FD68>, \'__new__\': <staticmethod object at 0x000000000314E678>, \'getId\': <function getId at 0x000000000314FF98>, \'_p\': <_sre.SRE_Pattern object at 0x0000000003106D40>, \'__repr__\': <function getText at 0x000000000314FF28>, \'__hash__\': <function __hash__ at 0x000000000314FCF8>, \'__copy__\': <function __copy__ at 0x000000000314FE48>, \'_addToCache\': <classmethod object at 0x000000000314E5E8>, \'__doc__\': "\\n    SymbolicConstant(name <,scdId=-1>)\\n    Abaqus/CAE SymbolicConstant implemented in Python.\\n    SymbolicConstant(\'ON\'|\'OFF\') will return an AbaqusBoolean instance.\\n    "})'
-
-
-SymbolicConstant = SymbolicConstantType
-
-# variables with complex values
-
-ALL_METHODS = None  # (!) real value is 'ALL_METHODS'
-
-ALL_TYPES = None  # (!) real value is 'ALL_TYPES'
-
-BOTH = None  # (!) real value is 'BOTH'
-
-EARLIEST = None  # (!) real value is 'EARLIEST'
-
-GUI = None  # (!) real value is 'GUI'
-
-KERNEL = None  # (!) real value is 'KERNEL'
-
-LATEST = None  # (!) real value is 'LATEST'
+# The names of the types in the Abaqus modules
+AbaqusBooleanType = AbaqusBoolean
+BooleanType = Boolean
+SymbolicConstantType = SymbolicConstant
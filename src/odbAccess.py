@@ -1,25 +1,54 @@
 from abaqus.Odb.OdbCommands import *
-from abaqus.Odb.Odb import Odb
+from abaqus.KernelServer.KernelServer import getKernelServer, isKernelServerEnabled
+from abaqus.Notebook.NotebookScript import currentScript
 
 
 def openOdb(name: str, *args, **kwargs):
+    from abaqus.Odb.Odb import Odb
+    from abaqus.Odb.ResultsStore import isResultsStore, openResultsStore
+
+    # A results store is read in this process, Abaqus is not launched
+    if isResultsStore(name):
+        return openResultsStore(name)
+
     abaqus = 'abaqus'
     if 'ABAQUS_BAT_PATH' in os.environ.keys():
         abaqus = os.environ['ABAQUS_BAT_PATH']
 
-    filePath = os.path.abspath(sys.argv[0])
-    fileDir = os.path.dirname(filePath)
-    fileName = os.path.basename(filePath)
+    fileDir, fileName = currentScript()
     odbName = os.path.basename(os.path.abspath(name))
 
-    os.system(f'cd {fileDir}')
-    try:  # If it is a jupyter notebook
-        import ipynbname
-        fileName = os.path.basename(ipynbname.path())
-        os.system(f'jupyter nbconvert --to python {fileName}')
-        fileName = fileName.replace('.ipynb', '.py')
-    except:
-        pass
+    if isKernelServerEnabled():
+        getKernelServer().runScript(os.path.join(fileDir, fileName), cwd=fileDir, database=os.path.abspath(name))
+        return Odb(name)
     os.system(f'{abaqus} cae database={odbName} script={fileName}')
     os.system('exit')
     return Odb(name)
+
+
+def writeResultsStore(name: str, fileName: str = None) -> str:
+    """Export an output database to a results store file with the Python interpreter of Abaqus,
+    the results store file is then opened by :py:func:`openOdb` without Abaqus, see
+    :py:func:`~abaqus.Odb.ResultsStore.writeResultsStore`
+    """
+    from abaqus.Odb.ResultsStore import writeResultsStore
+
+    return writeResultsStore(name, fileName)
+
+
+def parallelMap(odb, function, steps=None, frames=None, workers: int = None) -> list:
+    """Call a function on the frames of an output database opened from a results store file in
+    worker processes and return the results in order, see
+    :py:func:`~abaqus.Odb.ParallelMap.parallelMap`
+    """
+    from abaqus.Odb.ParallelMap import parallelMap
+
+    return parallelMap(odb, function, steps, frames, workers)
+
+
+def __getattr__(name: str):
+    # The Odb class imports most of the Odb object model, it is only imported when it is used
+    if name == 'Odb':
+        from abaqus.Odb.Odb import Odb
+        return Odb
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,5 @@
+from abaqus.UtilityAndView.AbaqusBoolean import AbaqusBoolean
+from abaqus.UtilityAndView.SymbolicConstant import SymbolicConstant
+
+OFF = AbaqusBoolean(0)
+ON = AbaqusBoolean(1)
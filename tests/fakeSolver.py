@@ -0,0 +1,58 @@
+"""A fake Abaqus command for the job tests.
+
+It is called as `fakeSolver.py job=<name> input=<file> cpus=<n> ... interactive` and writes the
+*.sta* and *.odb* files of the job in the working directory instead of running an analysis. The
+data line of the *\\*Heading* keyword of the input file sets its behaviour, e.g. `exit=3 sleep=0.5`:
+
+- `exit` is the exit status of the command, the analysis completes if it is 0,
+- `sleep` is the time in seconds the command runs.
+
+If the *FAKE_SOLVER_LOG* environment variable is set, a line `<job> <number of running jobs>`
+is appended to the file it names when the job starts, the running jobs are counted with marker
+files in the directory of the log.
+"""
+
+import os
+import sys
+import time
+
+
+def main():
+    args = dict(arg.split("=", 1) for arg in sys.argv[1:] if "=" in arg)
+    jobName, inputFile = args["job"], args["input"]
+    options = {}
+    with open(inputFile) as file:
+        lines = [line.strip() for line in file]
+    for line, data in zip(lines, lines[1:]):
+        if line.lower().startswith("*heading"):
+            options = dict(item.split("=", 1) for item in data.split() if "=" in item)
+    exitStatus = int(options.get("exit", 0))
+
+    log = os.environ.get("FAKE_SOLVER_LOG")
+    marker = None
+    if log:
+        running = os.path.join(os.path.dirname(log), "running")
+        os.makedirs(running, exist_ok=True)
+        marker = os.path.join(running, "{}-{}".format(jobName, os.getpid()))
+        open(marker, "w").close()
+        with open(log, "a") as file:
+            file.write("{} {}\n".format(jobName, len(os.listdir(running))))
+    try:
+        time.sleep(float(options.get("sleep", 0)))
+        with open(jobName + ".odb", "w") as file:
+            file.write("odb of {}\n".format(inputFile))
+        with open(jobName + ".sta", "w") as file:
+            file.write(" STEP  INC ATT SEVERE EQUIL TOTAL  TOTAL      STEP       INC OF       DOF    IF\n")
+            file.write("    1     1   1     0     1     1  1.00       1.00       1.000\n")
+            if exitStatus == 0:
+                file.write(" THE ANALYSIS HAS COMPLETED SUCCESSFULLY\n")
+            else:
+                file.write(" THE ANALYSIS HAS NOT BEEN COMPLETED\n")
+    finally:
+        if marker is not None:
+            os.remove(marker)
+    return exitStatus
+
+
+if __name__ == "__main__":
+    sys.exit(main())
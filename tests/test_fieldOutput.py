@@ -0,0 +1,71 @@
+import pytest
+
+from abaqusConstants import *
+from abaqus.Odb.Odb import Odb
+from abaqus.Odb.OdbMeshNode import OdbMeshNode
+
+
+@pytest.fixture
+def odb(tmp_path):
+    odb = Odb("test", path=str(tmp_path / "test.odb"))
+    part = odb.Part("Part-1", embeddedSpace=THREE_D, type=DEFORMABLE_BODY)
+    odb.rootAssembly.Instance("Part-1-1", part)
+    odb.rootAssembly.Instance("Part-1-2", part)
+    odb.Step("Step-1", "", domain=TIME, timePeriod=1.0).Frame(incrementNumber=1, frameValue=1.0)
+    return odb
+
+
+def test_getSubsetNode(odb):
+    instances = odb.rootAssembly.instances
+    fieldOutput = odb.steps["Step-1"].frames[0].FieldOutput(name="U", description="", type=VECTOR)
+    for number, name in enumerate(("Part-1-1", "Part-1-2")):
+        data = ((10.0 * number + 1, 0.0, 0.0), (10.0 * number + 2, 0.0, 0.0))
+        fieldOutput.addData(position=NODAL, instance=instances[name], labels=(1, 2), data=data)
+
+    # The same label in another instance is not selected
+    node = OdbMeshNode()
+    node.label, node.instanceName = 1, "Part-1-2"
+    subset = fieldOutput.getSubset(region=node)
+    assert len(subset.bulkDataBlocks) == 1
+    assert subset.bulkDataBlocks[0].instance is instances["Part-1-2"]
+    assert subset.bulkDataBlocks[0].nodeLabels.tolist() == [1]
+    assert subset.bulkDataBlocks[0].data.tolist() == [[11.0, 0.0, 0.0]]
+
+
+def test_addDataPrecision(odb):
+    import numpy
+
+    instance = odb.rootAssembly.instances["Part-1-1"]
+    frame = odb.steps["Step-1"].frames[0]
+    single = frame.FieldOutput(name="U", description="", type=VECTOR)
+    single.addData(position=NODAL, instance=instance, labels=(1,), data=((1.0, 0, 0),))
+    assert single.bulkDataBlocks[0].precision == SINGLE_PRECISION
+    assert single.values[0].data == pytest.approx((1.0, 0.0, 0.0)) and single.values[0].dataDouble == ()
+
+    double = frame.FieldOutput(name="V", description="", type=VECTOR)
+    double.addData(position=NODAL, instance=instance, labels=(1,), data=numpy.array([[1.0, 0, 0]]))
+    assert double.bulkDataBlocks[0].precision == DOUBLE_PRECISION
+    assert double.values[0].dataDouble == (1.0, 0.0, 0.0)
+
+
+def test_bulkWriterFlush(odb):
+    instance = odb.rootAssembly.instances["Part-1-1"]
+    frame = odb.steps["Step-1"].frames[0]
+    valid = frame.FieldOutput(name="U", description="", type=VECTOR)
+    invalid = frame.FieldOutput(name="V", description="", type=VECTOR)
+    writer = odb.bulkWriter()
+    writer.addData(valid, NODAL, instance, [1, 2], [[1.0, 0, 0], [2.0, 0, 0]])
+    writer.addData(invalid, NODAL, instance, [1], [[1.0, 0, 0]])
+    writer.addData(invalid, NODAL, instance, [1], [[2.0, 0, 0]])
+
+    # A label added twice: nothing is added and the valid block is still pending
+    with pytest.raises(ValueError):
+        writer.flush()
+    assert len(valid.bulkDataBlocks) == 0 and len(invalid.bulkDataBlocks) == 0
+    assert writer.blockCount == 0 and repr(writer).startswith("<BulkWriter 2 blocks")
+
+    writer.discard()
+    writer.addData(valid, NODAL, instance, [2, 1], [[2.0, 0, 0], [1.0, 0, 0]])
+    writer.flush()
+    assert len(valid.bulkDataBlocks) == 1 and writer.rowCount == 2
+    assert valid.bulkDataBlocks[0].nodeLabels.tolist() == [1, 2]
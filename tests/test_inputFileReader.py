@@ -0,0 +1,38 @@
+import numpy
+import pytest
+
+from abaqus.InputFileParser.InputFileReader import InputFileReader
+
+DECK = """*Heading
+*Node
+1, 0., 0., 0.
+*Nset, nset=Explicit
+1, 4, 7,
+10, 11
+*Nset, nset=Generated, generate
+1, 7, 3
+10, 11
+*Elset, elset=Single, generate
+2, 2
+*Elset, elset=Sets
+Explicit, 12
+"""
+
+
+@pytest.mark.parametrize("usePyArray", [False, True])
+def test_setLabels(tmp_path, usePyArray):
+    path = tmp_path / "sets.inp"
+    path.write_text(DECK)
+    keywords = InputFileReader(str(path), usePyArray=usePyArray).read()
+    explicit, generated, single, sets = keywords[2:]
+    # The explicit and generated sets are the same flat sequence of labels
+    assert type(explicit.data) is type(generated.data)
+    assert list(explicit.data) == list(generated.data) == [1, 4, 7, 10, 11]
+    assert list(single.data) == [2]
+    assert explicit.labels().tolist() == generated.labels().tolist()
+    if usePyArray:
+        assert isinstance(generated.data, numpy.ndarray) and generated.data.ndim == 1
+    # The names of a set of sets are kept
+    assert tuple(sets.data) == ("Explicit", 12)
+    with pytest.raises(ValueError):
+        sets.labels()
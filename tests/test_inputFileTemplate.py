@@ -0,0 +1,44 @@
+import os
+
+import inpParser
+
+DECK = """*Heading
+*Part, name=Block
+*Include, input=mesh/mesh.inp
+*End Part
+*Material, name=Steel
+*Elastic
+210000., 0.3
+"""
+
+MESH = """*Node
+1, 0., 0., 0.
+2, 1., 0., 0.
+*Include, input=elements.inp
+"""
+
+
+def test_variantsInOneDirectory(tmp_path):
+    base = tmp_path / "base"
+    (base / "mesh").mkdir(parents=True)
+    (base / "job.inp").write_text(DECK)
+    (base / "mesh" / "mesh.inp").write_text(MESH)
+    (base / "mesh" / "elements.inp").write_text("*Element, type=T3D2\n1, 1, 2\n")
+    template = inpParser.InputFile("job.inp", str(base)).template()
+    variants = tmp_path / "variants"
+    for number in (1, 2):
+        template.write(
+            str(variants / "v{}.inp".format(number)),
+            {"*Part, name=Block/*Node[1][1]": 10.0 * number, "*Material, name=Steel/*Elastic[0][0]": 1000.0 * number},
+        )
+
+    # The patched included files are named after their variant, the other files are shared
+    assert sorted(os.listdir(str(variants / "mesh"))) == ["elements.inp", "v1_mesh.inp", "v2_mesh.inp"]
+    assert os.path.samefile(str(variants / "mesh" / "elements.inp"), str(base / "mesh" / "elements.inp"))
+    assert (base / "mesh" / "mesh.inp").read_text() == MESH
+    for number in (1, 2):
+        keywords = inpParser.InputFile("v{}.inp".format(number), str(variants)).parse(organize=True)
+        node, element = keywords[1].suboptions[:2]
+        assert node.data[1] == (2, 10.0 * number, 0.0, 0.0)
+        assert element.data == ((1, 1, 2),)
+        assert keywords[2].suboptions[0].data == ((1000.0 * number, 0.3),)
@@ -0,0 +1,34 @@
+import os
+
+from abaqus.Job.JobCache import JobCache
+
+
+def test_keyFollowsInputFiles(tmp_path):
+    cache = JobCache(str(tmp_path / "cache"))
+    (tmp_path / "mesh").mkdir()
+    (tmp_path / "mesh" / "nodes.inp").write_text("1, 0., 0., 0.\n")
+    (tmp_path / "mesh" / "mesh.inp").write_text("*Node, input=nodes.inp\n")
+    (tmp_path / "job.inp").write_text("*Heading\n*Include, input=mesh/mesh.inp\n")
+    inputFile = str(tmp_path / "job.inp")
+    key = cache.key(inputFile)
+    assert cache.key(inputFile) == key
+
+    # The data file is resolved relative to the file including it
+    (tmp_path / "mesh" / "nodes.inp").write_text("1, 1., 0., 0.\n")
+    assert cache.key(inputFile) != key
+
+
+def test_keyDependsOnSolver(tmp_path):
+    cache = JobCache(str(tmp_path / "cache"))
+    (tmp_path / "job.inp").write_text("*Heading\n*Node\n1, 0., 0., 0.\n")
+    inputFile = str(tmp_path / "job.inp")
+    solver = tmp_path / "abaqus"
+    solver.write_text("#!/bin/sh\n")
+    solver.chmod(0o755)
+    key = cache.key(inputFile, solver=str(solver))
+    assert cache.key(inputFile, solver="abq2024") != key
+
+    # An upgraded executable at the same path
+    stat = solver.stat()
+    os.utime(str(solver), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.key(inputFile, solver=str(solver)) != key
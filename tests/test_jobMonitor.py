@@ -0,0 +1,79 @@
+import asyncio
+
+from abaqusConstants import ABORTED, COMPLETED, SUBMITTED
+from abaqus.Job.JobMonitor import CompletedEvent, IncrementEvent, JobMonitor, _Watcher
+from abaqus.Job.ModelJob import ModelJob
+from abaqus.Messaging.MonitorMgr import MonitorMgr
+
+HEADER = " STEP  INC ATT SEVERE EQUIL TOTAL  TOTAL      STEP       INC OF       DOF    IF\n"
+INCREMENT = "    1     {0}   1     0     1     1  {0:.2f}       {0:.2f}       1.000\n"
+
+
+async def runJob(path, increments, completed=True):
+    with open(path, "w") as file:
+        file.write(HEADER)
+    for increment in range(1, increments + 1):
+        await asyncio.sleep(0.05)
+        with open(path, "a") as file:
+            file.write(INCREMENT.format(increment))
+    with open(path, "a") as file:
+        file.write(" THE ANALYSIS HAS {}\n".format("COMPLETED SUCCESSFULLY" if completed else "NOT BEEN COMPLETED"))
+
+
+def test_monitorEvents(tmp_path):
+    async def main():
+        monitor = JobMonitor("Job-1", str(tmp_path), MonitorMgr())
+        writer = asyncio.ensure_future(runJob(str(tmp_path / "Job-1.sta"), 3))
+        events = [event async for event in monitor]
+        await writer
+        # Iterating a finished monitor returns immediately
+        assert [event async for event in monitor] == []
+        return events, monitor, asyncio.get_running_loop()
+
+    events, monitor, loop = asyncio.run(main())
+    assert [type(event) for event in events] == [IncrementEvent] * 3 + [CompletedEvent]
+    assert [event.increment for event in events[:3]] == [1, 2, 3]
+    assert monitor.finished and monitor.status.completed
+    # The watch of the directory and the inotify descriptor are released with the last monitor
+    watcher = monitor._watcher
+    assert not watcher.monitors and not watcher.directories and not watcher.watched
+    assert watcher.fd is None and loop not in _Watcher._watchers
+
+
+def test_jobWait(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    job = ModelJob("Job-2", "Model-1")
+
+    async def main():
+        writer = asyncio.ensure_future(runJob("Job-2.sta", 2, completed=False))
+        status = await job.wait()
+        await writer
+        return status
+
+    status = asyncio.run(main())
+    assert status.finished and not status.completed
+    assert job.status == ABORTED
+
+    # The analysis has already finished, waitForCompletion returns once the files are read
+    asyncio.run(runJob("Job-2.sta", 1))
+    job.status = SUBMITTED
+    job.waitForCompletion()
+    assert job.status == COMPLETED
+    # A finished job returns immediately
+    job.waitForCompletion()
+    # As does a job that is not submitted
+    ModelJob("Job-3", "Model-1").waitForCompletion()
+
+
+def test_waitForCompletionInRunningLoop(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    asyncio.run(runJob("Job-4.sta", 1))
+    job = ModelJob("Job-4", "Model-1")
+    job.status = SUBMITTED
+
+    async def main():
+        # As in Jupyter, the script runs while an event loop is running
+        job.waitForCompletion()
+
+    asyncio.run(main())
+    assert job.status == COMPLETED
@@ -0,0 +1,81 @@
+import os
+import stat
+import sys
+
+import pytest
+
+from abaqus.Job.JobCache import JobCache
+from abaqus.Job.JobPool import JobPool
+
+FAKE_SOLVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fakeSolver.py")
+
+
+@pytest.fixture
+def abaqus(tmp_path, monkeypatch):
+    """Returns the path of an Abaqus command running the fake solver"""
+    command = tmp_path / "abaqus"
+    command.write_text('#!/bin/sh\nexec "{}" "{}" "$@"\n'.format(sys.executable, FAKE_SOLVER))
+    command.chmod(command.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("FAKE_SOLVER_LOG", str(tmp_path / "log" / "jobs.log"))
+    os.makedirs(tmp_path / "log")
+    return str(command)
+
+
+def writeDeck(directory, name, heading):
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(str(directory), name + ".inp")
+    with open(path, "w") as file:
+        file.write("*Heading\n{}\n*Node\n1, 0., 0., 0.\n".format(heading))
+    return path
+
+
+def startedJobs(tmp_path):
+    path = tmp_path / "log" / "jobs.log"
+    if not path.exists():
+        return []
+    return [line.split() for line in path.read_text().splitlines()]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="The fake Abaqus command is a shell script")
+def test_orderConcurrencyAndCache(tmp_path, abaqus):
+    cache = JobCache(str(tmp_path / "cache"))
+    decks = [writeDeck(tmp_path / "run", "Job-{}".format(i), "sleep=0.3 deck={}".format(i)) for i in range(4)]
+    failing = writeDeck(tmp_path / "run", "Job-fail", "exit=3")
+
+    # A single CPU: the jobs start one at a time in submission order
+    with JobPool(cpus=1, abaqus=abaqus, cache=cache) as pool:
+        futures = pool.map(decks + [failing])
+        results = [future.result(timeout=60) for future in futures]
+    started = startedJobs(tmp_path)
+    assert [name for name, _ in started] == ["Job-0", "Job-1", "Job-2", "Job-3", "Job-fail"]
+    assert all(int(running) == 1 for _, running in started)
+    assert [result.succeeded for result in results] == [True, True, True, True, False]
+    assert results[-1].exitStatus == 3 and results[-1].status.finished
+    assert not any(result.cached for result in results)
+
+    # The completed jobs are restored from the cache, the failed one runs again
+    with JobPool(cpus=2, abaqus=abaqus, cache=cache) as pool:
+        futures = pool.map(decks + [failing], workDirectory=str(tmp_path / "rerun"))
+        results = [future.result(timeout=60) for future in futures]
+    assert [result.cached for result in results] == [True, True, True, True, False]
+    assert [name for name, _ in startedJobs(tmp_path)[len(started) :]] == ["Job-fail"]
+    with open(tmp_path / "rerun" / "Job-2.odb") as file:
+        assert file.read() == "odb of {}\n".format(decks[2])
+    assert results[2].succeeded and results[2].status.completed
+
+
+@pytest.mark.skipif(os.name == "nt", reason="The fake Abaqus command is a shell script")
+def test_concurrencyCap(tmp_path, abaqus):
+    decks = [writeDeck(tmp_path / "run", "Job-{}".format(i), "sleep=0.5") for i in range(6)]
+    with JobPool(cpus=2, abaqus=abaqus) as pool:
+        futures = pool.map(decks[:3])
+        # A job requiring every CPU of the pool runs alone
+        futures.append(pool.submit(writeDeck(tmp_path / "wide", "Job-wide", "sleep=0.5"), cpus=2))
+        futures += pool.map(decks[3:])
+        with pytest.raises(ValueError):
+            pool.submit(decks[0], cpus=3)
+        results = [future.result(timeout=60) for future in futures]
+    assert all(result.succeeded for result in results)
+    running = {name: int(count) for name, count in startedJobs(tmp_path)}
+    assert max(running.values()) == 2
+    assert running["Job-wide"] == 1
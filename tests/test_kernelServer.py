@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+import odbAccess
+from abaqus import session
+from abaqus.KernelServer import KernelServer
+
+
+class RecordingServer:
+    """Records the requests sent to the kernel instead of running them"""
+
+    def __init__(self):
+        self.requests = []
+
+    def runScript(self, scriptPath="", **kwargs):
+        self.requests.append(dict(kwargs, scriptPath=scriptPath))
+        return 0
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = RecordingServer()
+    monkeypatch.setattr(KernelServer, "_kernelServer", server)
+    return server
+
+
+def test_openOdbDatabase(tmp_path, monkeypatch, server):
+    monkeypatch.chdir(tmp_path)
+    odbAccess.openOdb("Job-1.odb")
+    session.openOdb("Job-2.odb")
+    assert [request["database"] for request in server.requests] == [
+        os.path.join(str(tmp_path), "Job-1.odb"),
+        os.path.join(str(tmp_path), "Job-2.odb"),
+    ]
+
+
+def test_kernelEnvironment(monkeypatch):
+    from abaqus.KernelServer.KernelBackend import FakeKernelBackend
+
+    monkeypatch.setenv("ABAQUS_KERNEL_SERVER", "fake")
+    assert "ABAQUS_KERNEL_SERVER" not in FakeKernelBackend().environment()
+    # In the kernel process, the scripts do not start another kernel
+    monkeypatch.setenv("PYABAQUS_KERNEL_PORT", "1234")
+    assert not KernelServer.isKernelServerEnabled()
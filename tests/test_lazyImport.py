@@ -0,0 +1,69 @@
+import json
+import os
+import subprocess
+import sys
+
+import abaqus
+
+
+def test_starExport():
+    namespace = {}
+    exec("from abaqus import *", namespace)
+    names = set(namespace) - {"__builtins__"}
+    assert names == set(abaqus.__all__)
+    assert {"mdb", "session", "highlight", "submitJobByInputFile"} <= names
+    assert not any(name.startswith("_") for name in names)
+    assert "os" not in names and "warnings" not in names
+
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# The objects of abaqus classes alive after importing the whole package are the default values
+# of function arguments and the `mdb` and `session` objects, see benchmarks/importObjects.py
+OBJECT_BUDGET = 200
+
+_PROBE = """
+import gc, json, sys
+
+def abaqusModules():
+    return sorted(name for name in sys.modules if name == 'abaqus' or name.startswith('abaqus.'))
+
+def isAbaqusObject(value):
+    module = getattr(type(value), '__module__', '') or ''
+    return (
+        type(type(value)) is type
+        and (module == 'abaqus' or module.startswith('abaqus.'))
+        and type(value).__name__ not in ('LazyDefault', 'SymbolicConstant', 'AbaqusBoolean')
+    )
+
+import abaqus
+result = {'abaqus': abaqusModules()}
+import odbAccess
+result['odbAccess'] = abaqusModules()
+from abaqus import *
+import caeModules, visualization
+result['objects'] = sum(1 for value in gc.get_objects() if isAbaqusObject(value))
+result['attributes'] = [
+    name + '.' + cls.__qualname__ + '.' + attribute
+    for name, module in list(sys.modules.items())
+    if name == 'abaqus' or name.startswith('abaqus.')
+    for cls in list(vars(module).values())
+    if isinstance(cls, type) and cls.__module__ == name
+    for attribute, value in vars(cls).items()
+    if isAbaqusObject(value) or (type(value) in (list, dict) and not attribute.startswith('_'))
+]
+print(json.dumps(result))
+"""
+
+
+def test_importBudget():
+    # A fresh interpreter, the modules imported by the other tests must not be counted
+    env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = json.loads(subprocess.check_output([sys.executable, "-c", _PROBE], env=env, cwd=SRC, text=True))
+    # The model database is imported on first access of a name of the abaqus module, not by
+    # odbAccess (320 modules before they were imported lazily)
+    assert result["abaqus"] == ["abaqus"]
+    assert len(result["odbAccess"]) <= 20, result["odbAccess"]
+    # Class-level defaults are created per instance on first access
+    assert result["attributes"] == []
+    assert result["objects"] <= OBJECT_BUDGET
@@ -0,0 +1,46 @@
+import json
+
+from abaqus.Notebook.NotebookScript import notebookToScript
+
+
+def writeNotebook(path, *sources):
+    cells = [{"cell_type": "code", "metadata": {}, "source": source} for source in sources]
+    with open(path, "w") as file:
+        json.dump({"cells": cells, "nbformat": 4, "nbformat_minor": 5}, file)
+    return str(path)
+
+
+def test_magicsOutsideStrings(tmp_path):
+    cell = "\n".join(
+        [
+            "%matplotlib inline",
+            "!ls -la",
+            "text = '''",
+            "Word?",
+            "!x",
+            "  %not a magic",
+            "'''",
+            'other = "a \\" \'\'\' quote"  # a comment with \'\'\'',
+            "len?",
+            'doc = """Help? """; name = "\\',
+            '!y"',
+        ]
+    )
+    script = notebookToScript(writeNotebook(tmp_path / "test.ipynb", cell, "%%bash\necho 1"))
+    assert script.splitlines() == [
+        "# %matplotlib inline",
+        "# !ls -la",
+        "text = '''",
+        "Word?",
+        "!x",
+        "  %not a magic",
+        "'''",
+        'other = "a \\" \'\'\' quote"  # a comment with \'\'\'',
+        "# len?",
+        'doc = """Help? """; name = "\\',
+        '!y"',
+        "",
+        "",
+        "# %%bash",
+        "# echo 1",
+    ]
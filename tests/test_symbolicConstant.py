@@ -0,0 +1,27 @@
+import os
+
+import abaqusConstants
+from abaqus.UtilityAndView.SymbolicConstant import SymbolicConstant
+
+# The module-level names of the abaqusConstants module before the table of constants was frozen
+NAMES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "abaqusConstantsNames.txt")
+
+
+def test_baselineNames():
+    namespace = {}
+    exec("from abaqusConstants import *", namespace)
+    with open(NAMES) as file:
+        names = file.read().split()
+    assert [name for name in names if name not in namespace] == []
+    assert "typing" not in namespace
+    assert abaqusConstants.MAXIMUM_NUMBER_OF_SEVERE_DISCONTINUITY_ITERATIONS.getText() == (
+        "MAXIMUM_NUMBER_OF_SEVERE_DISCONTINUITY_ITERATIONS"
+    )
+
+
+def test_runtimeIds():
+    ids = [constant.getId() for constant in SymbolicConstant._ids.values()]
+    constant = SymbolicConstant("TEST_RUNTIME_CONSTANT")
+    assert constant.getId() > max(ids)
+    assert SymbolicConstant.fromId(abaqusConstants.A0.getId()) is abaqusConstants.A0
+    assert SymbolicConstant("TEST_RUNTIME_CONSTANT") is constant
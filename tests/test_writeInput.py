@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from abaqusConstants import *
+from abaqus import mdb
+from abaqus.Job.InputFileWriter import InputFileWriter
+
+COMPRESSION = os.path.join(os.path.dirname(os.path.abspath(__file__)), "compression", "compression.py")
+
+
+def test_compressionExample(tmp_path, monkeypatch):
+    # The geometric part of the example cannot be written, the input file is left to Abaqus/CAE
+    monkeypatch.chdir(tmp_path)
+    with open(COMPRESSION) as file:
+        source = file.read().split("# Submit the job")[0]
+    with pytest.warns(UserWarning, match="The input file of the job Job-1 is not written"):
+        exec(compile(source, COMPRESSION, "exec"), {"__name__": "__main__"})
+    assert not os.path.exists("Job-1.inp")
+
+
+def pressureModel(mdb):
+    """Creates the model Model-Pressure, a brick with a pressure on its top face"""
+    model = mdb.Model(name="Model-Pressure")
+    coordinates = [(x, y, z) for z in (0.0, 1.0) for y in (0.0, 1.0) for x in (0.0, 1.0)]
+    part = model.PartFromNodesAndElements(
+        "Brick", THREE_D, DEFORMABLE_BODY, (range(1, 9), coordinates), (("C3D8R", [1], [(1, 2, 4, 3, 5, 6, 8, 7)]),)
+    )
+    part.SetFromElementLabels("All", [1])
+    part.SetFromNodeLabels("Bottom", [1, 2, 3, 4])
+    part.SurfaceFromElsets("Top", ((part.sets["All"], S2),))
+    model.Material("Steel").Elastic(table=((210000.0, 0.3),))
+    model.HomogeneousSolidSection("Solid", "Steel")
+    part.SectionAssignment(part.sets["All"], "Solid")
+    instance = model.rootAssembly.Instance("Brick-1", part, dependent=ON)
+    model.StaticStep("Step-1", "Initial")
+    model.DisplacementBC("Fixed", "Initial", instance.sets["Bottom"], u1=SET, u2=SET, u3=SET)
+    model.Pressure("Load", "Step-1", instance.surfaces["Top"], magnitude=2.5)
+    return model, instance
+
+
+def test_pressure(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    model, instance = pressureModel(mdb)
+    mdb.Job("Job-Pressure", "Model-Pressure").writeInput()
+    with open("Job-Pressure.inp") as file:
+        text = file.read()
+    assert "*Surface, type=ELEMENT, name=Top\nAll, S2\n" in text
+    assert "*Dsload\nBrick-1.Top, P, 2.5\n" in text
+
+    # A pressure with an amplitude cannot be written
+    model.Pressure("Ramp", "Step-1", instance.surfaces["Top"], magnitude=1.0, amplitude="Ramp")
+    with pytest.warns(UserWarning, match="The amplitude and the distribution of the load Ramp"):
+        mdb.Job("Job-Ramp", "Model-Pressure").writeInput()
+    assert not os.path.exists("Job-Ramp.inp")
+    with pytest.raises(ValueError, match="The amplitude and the distribution of the load Ramp"):
+        with InputFileWriter("Job-Ramp.inp") as writer:
+            writer.writeModel(model)
+    assert os.listdir(".") == ["Job-Pressure.inp"]
+
+
+_JOURNAL_PROBE = """
+from abaqus import mdb
+from abaqus.Journal.Journal import getJournal
+from test_writeInput import pressureModel
+
+pressureModel(mdb)
+mdb.Job("Job-Pressure", "Model-Pressure").writeInput()
+print(getJournal().script())
+"""
+
+
+def test_journal(tmp_path):
+    # The objects of the model are inspected, but only the calls of the script are recorded
+    tests = os.path.dirname(os.path.abspath(__file__))
+    path = os.pathsep.join([os.path.join(os.path.dirname(tests), "src"), tests])
+    env = dict(os.environ, ABAQUS_JOURNAL="1", PYTHONPATH=path)
+    script = subprocess.check_output([sys.executable, "-c", _JOURNAL_PROBE], env=env, cwd=str(tmp_path), text=True)
+    assert "*Dsload\nBrick-1.Top, P, 2.5\n" in (tmp_path / "Job-Pressure.inp").read_text()
+    assert ".writeInput()" in script
+    assert "__dict__" not in script and ".items()" not in script